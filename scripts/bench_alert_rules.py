@@ -0,0 +1,114 @@
+################################################################################
+# File Name: bench_alert_rules.py
+# Purpose/Description: Per-frame cost of the compiled alert rule set against
+#                      the linear threshold scan it replaced, as the rule count
+#                      grows.
+# Author: Rex
+# Creation Date: 2026-10-17
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-17    | Rex          | Initial
+# ================================================================================
+################################################################################
+
+"""
+Benchmark alert evaluation of one polling cycle as the rule set grows.
+
+Every frame carries the same realtime parameters; the added rules watch
+other parameters (more PIDs, more alert types), which is how the rule set
+grows in practice::
+
+    python scripts/bench_alert_rules.py --frames 20000 --rules 2 20 200 2000
+
+Output is one line per rule count with microseconds per frame for the
+linear scan and the compiled dispatch table.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+from src.pi.alert.rule_engine import CompiledRuleSet  # noqa: E402
+from src.pi.alert.types import AlertDirection, AlertThreshold  # noqa: E402
+
+#: The 23-parameter realtime set, roughly.
+FRAME_PARAMETERS = [f"PID_{i:02d}" for i in range(23)]
+
+
+def buildRules(count: int) -> list[AlertThreshold]:
+    """Two rules on frame parameters, the rest on parameters not in the frame."""
+    rules = [
+        AlertThreshold('PID_00', 'rpm_redline', 7000.0, AlertDirection.ABOVE),
+        AlertThreshold('PID_01', 'coolant_temp_critical', 220.0, AlertDirection.ABOVE),
+    ]
+    for i in range(count - len(rules)):
+        rules.append(AlertThreshold(
+            f"EXTRA_{i}", f"extra_{i}", 100.0, AlertDirection.ABOVE,
+        ))
+    return rules
+
+
+def buildFrames(frames: int) -> list[dict[str, float]]:
+    rng = random.Random(23)
+    return [
+        {name: rng.uniform(0.0, 200.0) for name in FRAME_PARAMETERS}
+        for _ in range(frames)
+    ]
+
+
+def linearScan(rules: list[AlertThreshold], frames: list[dict[str, float]]) -> None:
+    """The pre-compiled shape: scan every threshold for every reading."""
+    for frame in frames:
+        for name, value in frame.items():
+            for rule in rules:
+                if rule.parameterName != name:
+                    continue
+                if rule.checkValue(value):
+                    break
+
+
+def compiled(ruleSet: CompiledRuleSet, frames: list[dict[str, float]]) -> None:
+    for frame in frames:
+        ruleSet.evaluateFrame(frame, 30.0)
+
+
+def timed(fn, *args) -> float:
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--frames', type=int, default=20_000, help='cycles evaluated')
+    parser.add_argument(
+        '--rules', type=int, nargs='+', default=[2, 20, 200, 2000],
+        help='rule-set sizes (minimum 2)',
+    )
+    args = parser.parse_args(argv)
+
+    frames = buildFrames(args.frames)
+    for count in args.rules:
+        rules = buildRules(max(count, 2))
+        ruleSet = CompiledRuleSet(rules)
+        linearUs = timed(linearScan, rules, frames) / args.frames * 1e6
+        compiledUs = timed(compiled, ruleSet, frames) / args.frames * 1e6
+        print(f"rules={len(rules):<5} linear={linearUs:9.1f}us/frame "
+              f"compiled={compiledUs:6.1f}us/frame")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
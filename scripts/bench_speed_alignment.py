@@ -0,0 +1,131 @@
+################################################################################
+# File Name: bench_speed_alignment.py
+# Purpose/Description: Speed-calibration alignment cost on long synthetic
+#                      tracks -- per-lag Pearson over datetime grids (the old
+#                      aligner) against the signal_core array path.
+# Author: Rex
+# Creation Date: 2026-10-17
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-17    | Rex          | Initial
+# ================================================================================
+################################################################################
+
+"""
+Benchmark SPEED-PID alignment as the track gets longer.
+
+A synthetic drive (1 Hz OBD, 1 Hz GPS with a clock offset) is aligned with
+the old per-lag scan and with :func:`estimateCalibration`::
+
+    python scripts/bench_speed_alignment.py --hours 0.5 1 3 --backend python
+
+Output is one line per track length with milliseconds per alignment.  The
+old scan is skipped above ``--legacy-max-hours`` (it is O(n x lags) in pure
+Python).
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import sys
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+from src.calibration.signal_core import NUMPY_AVAILABLE  # noqa: E402
+from src.calibration.speed_aligner import (  # noqa: E402
+    MAX_LAG_SEARCH_S,
+    estimateCalibration,
+)
+
+
+def buildDrive(hours: float, offsetS: float = 2.5):
+    t0 = datetime(2026, 1, 1, tzinfo=UTC)
+    seconds = int(hours * 3600)
+
+    def trueKmh(s: float) -> float:
+        return max(0.0, 55.0 + 35.0 * math.sin(s / 90.0) + 8.0 * math.sin(s / 7.0))
+
+    obd = [(t0 + timedelta(seconds=s), trueKmh(s - offsetS)) for s in range(seconds)]
+    gps = [(t0 + timedelta(seconds=s), trueKmh(s) / 3.6) for s in range(seconds)]
+    return obd, gps
+
+
+def legacyAlign(obd, gps) -> int:
+    """The pre-core shape: datetime-stepped resampling, full Pearson per lag."""
+
+    def resample(samples, t0, t1):
+        times = [s[0] for s in samples]
+        vals = [s[1] for s in samples]
+        grid, j = [], 0
+        for k in range(int((t1 - t0).total_seconds()) + 1):
+            gt = t0 + timedelta(seconds=k)
+            while j + 1 < len(times) and times[j + 1] <= gt:
+                j += 1
+            if gt <= times[0] or gt >= times[-1]:
+                grid.append(vals[0] if gt <= times[0] else vals[-1])
+            else:
+                frac = (gt - times[j]).total_seconds() / (times[j + 1] - times[j]).total_seconds()
+                grid.append(vals[j] + (vals[j + 1] - vals[j]) * frac)
+        return grid
+
+    def pearson(xs, ys):
+        n = len(xs)
+        mx, my = sum(xs) / n, sum(ys) / n
+        num = sum((x - mx) * (y - my) for x, y in zip(xs, ys, strict=True))
+        dx = sum((x - mx) ** 2 for x in xs) ** 0.5
+        dy = sum((y - my) ** 2 for y in ys) ** 0.5
+        return num / (dx * dy) if dx and dy else 0.0
+
+    t0 = max(obd[0][0], gps[0][0])
+    t1 = min(obd[-1][0], gps[-1][0])
+    obdGrid = resample(obd, t0, t1)
+    gpsGrid = resample([(ts, v * 3.6) for ts, v in gps], t0, t1)
+    n, bestLag, bestCorr = len(obdGrid), 0, -2.0
+    for lag in range(-MAX_LAG_SEARCH_S, MAX_LAG_SEARCH_S + 1):
+        pairs = [(obdGrid[i], gpsGrid[i - lag]) for i in range(n) if 0 <= i - lag < n]
+        corr = pearson([p[0] for p in pairs], [p[1] for p in pairs])
+        if corr > bestCorr:
+            bestCorr, bestLag = corr, lag
+    return bestLag
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return (time.perf_counter() - start) * 1000.0, result
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--hours', type=float, nargs='+', default=[0.5, 1.0, 3.0])
+    parser.add_argument('--legacy-max-hours', type=float, default=1.0)
+    parser.add_argument('--backend', choices=['python', 'numpy'], default=None)
+    args = parser.parse_args(argv)
+
+    backend = args.backend or ('numpy' if NUMPY_AVAILABLE else 'python')
+    for hours in args.hours:
+        obd, gps = buildDrive(hours)
+        coreMs, est = timed(
+            lambda o, g: estimateCalibration(o, g, 1.0, backend=backend), obd, gps,
+        )
+        line = (f"hours={hours:<4} samples={len(obd):<6} core[{backend}]={coreMs:8.1f}ms "
+                f"lag={est.lagSeconds:+.2f}s")
+        if hours <= args.legacy_max_hours:
+            legacyMs, legacyLag = timed(legacyAlign, obd, gps)
+            line += f"  legacy={legacyMs:9.1f}ms lag={legacyLag:+d}s"
+        print(line)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,99 @@
+################################################################################
+# File Name: bench_stats_kernel.py
+# Purpose/Description: Throughput benchmark of the shared statistics kernel
+#                      (pure-Python vs NumPy backend) against the per-parameter
+#                      stdlib loop it replaced.
+# Author: Rex
+# Creation Date: 2026-10-16
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-16    | Rex          | Initial
+# ================================================================================
+################################################################################
+
+"""
+Benchmark ``summarizeColumns`` on a synthetic drive's worth of readings.
+
+Every path summarizes the same parameters (min / max / mean / sample std /
+mode)::
+
+    python scripts/bench_stats_kernel.py --parameters 20 --rows 50000
+
+Output is one line per path with elapsed seconds and values/sec.  The NumPy
+line is skipped when numpy is not installed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from array import array
+from collections import Counter
+from pathlib import Path
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+from src.common.analysis.kernel import (  # noqa: E402
+    BACKEND_NUMPY,
+    BACKEND_PYTHON,
+    NUMPY_AVAILABLE,
+    summarizeColumns,
+)
+
+
+def buildColumns(parameters: int, rows: int) -> dict[str, array]:
+    """Sensor-shaped readings: gaussian around a per-parameter level."""
+    rng = random.Random(15)
+    return {
+        f"PARAM_{i}": array('d', (round(rng.gauss(100.0 * (i + 1), 10.0), 2)
+                                  for _ in range(rows)))
+        for i in range(parameters)
+    }
+
+
+def stdlibLoop(columns: dict[str, array]) -> None:
+    """The pre-kernel shape: one stdlib pass per statistic per parameter."""
+    for values in columns.values():
+        min(values), max(values), statistics.fmean(values), statistics.stdev(values)
+        Counter(round(v, 2) for v in values).most_common(1)
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--parameters', type=int, default=20, help='columns')
+    parser.add_argument('--rows', type=int, default=50_000, help='values per column')
+    args = parser.parse_args(argv)
+
+    columns = buildColumns(args.parameters, args.rows)
+    total = args.parameters * args.rows
+    paths = [
+        ("stdlib", lambda: stdlibLoop(columns)),
+        ("python", lambda: summarizeColumns(columns, backend=BACKEND_PYTHON)),
+    ]
+    if NUMPY_AVAILABLE:
+        paths.append(("numpy", lambda: summarizeColumns(columns, backend=BACKEND_NUMPY)))
+
+    for label, fn in paths:
+        elapsed = timed(fn)
+        print(f"{label:<6} values={total} elapsed={elapsed:.2f}s "
+              f"values/s={total / elapsed:,.0f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,122 @@
+################################################################################
+# File Name: bench_sync_ingest.py
+# Purpose/Description: Rows/sec benchmark of the server sync ingest paths for
+#                      realtime_data (generic upsert vs append-only fast path).
+# Author: Rex
+# Creation Date: 2026-10-16
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-16    | Rex          | Initial
+# ================================================================================
+################################################################################
+
+"""
+Benchmark ``runSyncUpsert`` on a synthetic realtime_data backlog.
+
+Each path ingests the same batches into its own fresh schema, then ingests
+them again (the re-sent-batch case)::
+
+    # Throwaway SQLite file (default)
+    python scripts/bench_sync_ingest.py --rows 50000 --batch 5000
+
+    # A scratch MariaDB schema -- tables are created, then dropped
+    python scripts/bench_sync_ingest.py \\
+        --database-url mysql+pymysql://obd:***@<server>/obd2db_bench
+
+Output is one line per path and phase with rows/sec.  Never point
+``--database-url`` at the live database: the schema is dropped at the end.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+from src.server.api.sync import runSyncUpsert  # noqa: E402
+from src.server.db.models import Base  # noqa: E402
+
+_PARAMETERS = ("RPM", "SPEED", "COOLANT_TEMP", "INTAKE_TEMP", "MAF", "THROTTLE_POS")
+
+
+def buildBatches(rowCount: int, batchSize: int) -> list[list[dict]]:
+    """Pi-shaped realtime rows: one timestamp per polling cycle."""
+    rows = [
+        {
+            "id": i + 1,
+            "timestamp": time.strftime(
+                "%Y-%m-%dT%H:%M:%SZ", time.gmtime(1_760_000_000 + i // len(_PARAMETERS)),
+            ),
+            "parameter_name": _PARAMETERS[i % len(_PARAMETERS)],
+            "value": float(i % 7000),
+            "unit": "rpm",
+            "profile_id": "daily",
+            "data_source": "real",
+            "drive_id": 1 + i // 20_000,
+        }
+        for i in range(rowCount)
+    ]
+    return [rows[i:i + batchSize] for i in range(0, rowCount, batchSize)]
+
+
+def runPath(engine, batches: list[list[dict]], appendFastPath: bool) -> float:
+    """Ingest every batch (one commit each); return elapsed seconds."""
+    start = time.perf_counter()
+    for index, rows in enumerate(batches, start=1):
+        with Session(engine) as session:
+            runSyncUpsert(
+                session=session,
+                deviceId="bench-pi",
+                batchId=f"bench-{index}",
+                tables={"realtime_data": {"lastSyncedId": 0, "rows": rows}},
+                syncHistoryId=index,
+                appendFastPath=appendFastPath,
+            )
+            session.commit()
+    return time.perf_counter() - start
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=50_000, help='rows to ingest')
+    parser.add_argument('--batch', type=int, default=5_000, help='rows per sync request')
+    parser.add_argument(
+        '--database-url', default=None,
+        help='scratch SQLAlchemy URL (default: temporary SQLite file)',
+    )
+    args = parser.parse_args(argv)
+
+    batches = buildBatches(args.rows, args.batch)
+    for label, appendFastPath in (("upsert", False), ("append", True)):
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = create_engine(args.database_url or f"sqlite:///{tmp}/bench.db")
+            Base.metadata.drop_all(engine)
+            Base.metadata.create_all(engine)
+            try:
+                for phase in ("fresh", "resend"):
+                    elapsed = runPath(engine, batches, appendFastPath)
+                    print(
+                        f"{label:<6} {phase:<6} rows={args.rows} "
+                        f"elapsed={elapsed:.2f}s rows/s={args.rows / elapsed:,.0f}"
+                    )
+            finally:
+                Base.metadata.drop_all(engine)
+                engine.dispose()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
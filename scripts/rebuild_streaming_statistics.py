@@ -0,0 +1,131 @@
+################################################################################
+# File Name: rebuild_streaming_statistics.py
+# Purpose/Description: Recompute the Pi streaming-statistics baseline
+#                      (statistics_accumulators) from raw realtime samples.
+# Author: Rex
+# Creation Date: 2026-10-16
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-16    | Rex          | Initial
+# ================================================================================
+################################################################################
+
+"""Rebuild the streaming-statistics baseline from raw rows.
+
+Post-drive analysis merges each drive's live accumulators into the
+per-profile baseline in ``statistics_accumulators``.  The baseline drifts
+from the raw rows when samples never reach the live path (collector crash
+mid-drive, rows imported or deleted by hand, retention purges).  This
+script recomputes it with one streaming pass over ``realtime_samples``::
+
+    # Rebuild every profile in the canonical Pi DB
+    python scripts/rebuild_streaming_statistics.py --db data/obd.db
+
+    # One profile only
+    python scripts/rebuild_streaming_statistics.py --profile daily
+
+    # Drop the baseline instead; the next drive end rebuilds it in-process
+    python scripts/rebuild_streaming_statistics.py --reset
+
+Run ``--reset`` rather than a rebuild while the collector is live: a rebuild
+folds in rows whose live samples the collector will merge again at drive
+end.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sqlite3
+import sys
+from pathlib import Path
+
+# Pi modules use bare ``pi.*`` / ``common.*`` imports, so both ``<root>``
+# (for ``src.*``) and ``<root>/src`` must resolve.  Matches
+# scripts/schema_diff.py.
+_projectRoot = Path(__file__).resolve().parents[1]
+for _path in (str(_projectRoot), str(_projectRoot / 'src')):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+from src.pi.analysis.streaming import deleteAccumulators, rebuildAccumulators  # noqa: E402
+from src.pi.obdii.database_schema import SCHEMA_STATISTICS_ACCUMULATORS  # noqa: E402
+
+__all__ = ['DEFAULT_DB_PATH', 'main', 'runRebuild']
+
+DEFAULT_DB_PATH: str = 'data/obd.db'
+
+logger = logging.getLogger('rebuild_streaming_statistics')
+
+
+def runRebuild(
+    conn: sqlite3.Connection,
+    profileId: str | None = None,
+    reset: bool = False,
+) -> int:
+    """Rebuild (or reset) the baseline on an open connection.
+
+    Args:
+        conn: SQLite connection; caller owns commit.
+        profileId: Profile to rebuild (None: every profile).
+        reset: Delete the baseline rows instead of rebuilding them.
+
+    Returns:
+        Accumulators written, or rows deleted when ``reset``.
+    """
+    conn.execute(SCHEMA_STATISTICS_ACCUMULATORS)
+    if reset:
+        return deleteAccumulators(conn, profileId)
+    rebuilt = rebuildAccumulators(conn, profileId)
+    return sum(len(accumulators) for accumulators in rebuilt.values())
+
+
+def _buildParser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description='Rebuild the streaming-statistics baseline from raw rows.',
+    )
+    parser.add_argument(
+        '--db', default=DEFAULT_DB_PATH,
+        help=f'Path to the Pi SQLite database (default: {DEFAULT_DB_PATH})',
+    )
+    parser.add_argument(
+        '--profile', default=None,
+        help='Profile id to rebuild (default: every profile)',
+    )
+    parser.add_argument(
+        '--reset', action='store_true',
+        help='Delete the baseline so the next drive end rebuilds it',
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """CLI entry point.  Returns process exit code."""
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s %(message)s')
+    args = _buildParser().parse_args(argv)
+
+    dbPath = Path(args.db)
+    if not dbPath.exists():
+        print(f'rebuild_streaming_statistics.py: error: DB not found: {dbPath}',
+              file=sys.stderr)
+        return 2
+
+    with sqlite3.connect(dbPath) as conn:
+        count = runRebuild(conn, args.profile, reset=args.reset)
+
+    scope = args.profile or 'all profiles'
+    if args.reset:
+        line = f'[RESET] profile={scope} rowsDeleted={count}'
+    else:
+        line = f'[REBUILD] profile={scope} accumulators={count}'
+    logger.info(line)
+    print(line)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -18,6 +18,10 @@
 # ================================================================================
 # 2026-04-18    | Rex          | Initial implementation for US-183 (Sprint 12)
 # 2026-04-19    | Rex          | US-192: --from-db flag for live SQLite polling
+# 2026-10-17    | Rex          | --from-snapshot: read the collector's
+#               |              | shared-memory live snapshot (no SQL per frame)
+# 2026-10-17    | Rex          | Dirty-rect rendering via PrimaryScreenRenderer
+#               |              | + display.update; frame-time / CPU stats logged
 # ================================================================================
 ################################################################################
 """
@@ -34,6 +38,11 @@ Heartbeat (so the CIO can tell the render loop is alive):
   * Other gauges hold steady so the sweep is the obvious animation.
   * The timestamp embedded in log output advances on every frame.
 
+Only the regions that changed since the previous frame are repainted and
+pushed with ``pygame.display.update``; frame time, render CPU per frame and
+the dirty fraction are logged every ``STATS_LOG_INTERVAL_SECONDS`` and at
+exit.
+
 Exit behaviour:
   * SIGTERM / SIGINT / Ctrl+C -> flag the loop, blank the display, quit.
   * --duration seconds elapsed -> blank the display, quit.
@@ -50,6 +59,10 @@ Usage (on the Pi)::
     # Windowed (non-kiosk) for desktop debugging
     ~/obd2-venv/bin/python scripts/render_primary_screen_live.py --windowed
 
+    # Live values from the orchestrator's shared-memory snapshot
+    ~/obd2-venv/bin/python scripts/render_primary_screen_live.py \\
+        --from-snapshot /dev/shm/eclipse-obd-live.snap
+
     # Optional: save the final frame as a PNG snapshot
     ~/obd2-venv/bin/python scripts/render_primary_screen_live.py \\
         --duration 30 --snapshot /tmp/hdmi_render.png
@@ -69,11 +82,15 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
 
 import pygame  # noqa: E402
 
-from pi.display.live_readings import buildReadingsFromDb  # noqa: E402
+from pi.display.live_readings import (  # noqa: E402
+    buildReadingsFromDb,
+    buildReadingsFromSnapshot,
+)
+from pi.display.live_snapshot import LiveSnapshotReader  # noqa: E402
 from pi.display.screens.primary_renderer import (  # noqa: E402
     DEFAULT_BACKGROUND,
     PYGAME_AVAILABLE,
-    renderPrimaryScreen,
+    PrimaryScreenRenderer,
 )
 from pi.display.screens.primary_screen import (  # noqa: E402
     BASIC_TIER_DISPLAY_ORDER,
@@ -84,6 +101,7 @@ SCREEN_WIDTH = 480
 SCREEN_HEIGHT = 320
 DEFAULT_DURATION_SECONDS = 30
 TARGET_FPS = 10
+STATS_LOG_INTERVAL_SECONDS = 10.0
 
 _RPM_SWEEP_MIN = 800.0
 _RPM_SWEEP_MAX = 6500.0
@@ -166,11 +184,15 @@ def _buildReadingsFromLiveDb(dbPath: Path) -> dict[str, float]:
 
 
 def _renderOneFrame(
+    renderer: PrimaryScreenRenderer,
     surface: pygame.Surface,
     elapsedSeconds: float,
     liveDbPath: Path | None = None,
-) -> None:
-    if liveDbPath is not None:
+    snapshotReader: LiveSnapshotReader | None = None,
+) -> list[tuple[int, int, int, int]]:
+    if snapshotReader is not None:
+        readings = buildReadingsFromSnapshot(snapshotReader, BASIC_TIER_DISPLAY_ORDER)
+    elif liveDbPath is not None:
         readings = _buildReadingsFromLiveDb(liveDbPath)
     else:
         readings = _buildReadings(elapsedSeconds)
@@ -178,7 +200,19 @@ def _renderOneFrame(
         readings=readings,
         thresholdConfigs=_THRESHOLDS,
     )
-    renderPrimaryScreen(state, surface)
+    return renderer.render(state, surface)
+
+
+def _logFrameStats(renderer: PrimaryScreenRenderer) -> None:
+    stats = renderer.getStats()
+    logger.info(
+        "Frames=%d (full=%d unchanged=%d) | frameMs avg=%.2f max=%.2f | "
+        "cpuMs avg=%.2f | lastDirty=%.0f%% | textCache hits=%d misses=%d",
+        stats.frameCount, stats.fullFrames, stats.skippedFrames,
+        stats.averageFrameMs, stats.maxFrameMs, stats.averageCpuMs,
+        stats.lastDirtyFraction * 100.0,
+        stats.textCacheHits, stats.textCacheMisses,
+    )
 
 
 def _blankDisplay(surface: pygame.Surface) -> None:
@@ -193,11 +227,14 @@ def runRenderLoop(
     windowed: bool = False,
     snapshotPath: Path | None = None,
     liveDbPath: Path | None = None,
+    liveSnapshotPath: Path | None = None,
 ) -> int:
     """Run the live render loop for ``durationSeconds``.
 
-    When ``liveDbPath`` is set, each frame polls the Pi's ``data/obd.db``
-    realtime_data table for the latest value per gauge (US-192 live-path).
+    When ``liveSnapshotPath`` is set, each frame copies the latest value per
+    gauge out of the orchestrator's shared-memory snapshot (stale values
+    render as ``---``).  When ``liveDbPath`` is set, each frame polls the
+    Pi's ``data/obd.db`` realtime_data table instead (US-192 live-path).
     Otherwise, falls back to the hardcoded ``_STATIC_READINGS`` + RPM sweep
     heartbeat (US-183 kiosk demo mode).
 
@@ -209,6 +246,9 @@ def runRenderLoop(
         return 1
 
     exitFlag = _installSignalHandlers()
+    snapshotReader = (
+        LiveSnapshotReader(liveSnapshotPath) if liveSnapshotPath is not None else None
+    )
 
     pygame.init()
     pygame.font.init()
@@ -223,6 +263,8 @@ def runRenderLoop(
         startTime = time.monotonic()
         frameInterval = 1.0 / TARGET_FPS
         lastSnapshotSurface: pygame.Surface | None = None
+        renderer = PrimaryScreenRenderer()
+        lastStatsLog = startTime
 
         while True:
             elapsed = time.monotonic() - startTime
@@ -241,9 +283,16 @@ def runRenderLoop(
                 if event.type == pygame.QUIT:
                     exitFlag["exitRequested"] = True
 
-            _renderOneFrame(screen, elapsed, liveDbPath=liveDbPath)
-            pygame.display.flip()
+            dirtyRects = _renderOneFrame(
+                renderer, screen, elapsed,
+                liveDbPath=liveDbPath, snapshotReader=snapshotReader,
+            )
+            if dirtyRects:
+                pygame.display.update(dirtyRects)
             lastSnapshotSurface = screen
+            if time.monotonic() - lastStatsLog >= STATS_LOG_INTERVAL_SECONDS:
+                _logFrameStats(renderer)
+                lastStatsLog = time.monotonic()
 
             # Frame pacing: sleep the remainder of the target interval.
             frameTime = time.monotonic() - startTime - elapsed
@@ -256,8 +305,11 @@ def runRenderLoop(
             pygame.image.save(lastSnapshotSurface, str(snapshotPath))
             logger.info("Saved final-frame snapshot to %s", snapshotPath)
 
+        _logFrameStats(renderer)
         _blankDisplay(screen)
     finally:
+        if snapshotReader is not None:
+            snapshotReader.close()
         pygame.display.quit()
         pygame.quit()
 
@@ -299,6 +351,17 @@ def parseArguments(argv: list[str] | None = None) -> argparse.Namespace:
             "Eclipse-01/data/obd.db.  Missing keys render as '---'."
         ),
     )
+    parser.add_argument(
+        "--from-snapshot",
+        type=Path,
+        default=None,
+        dest="fromSnapshot",
+        help=(
+            "Read live values from the orchestrator's shared-memory snapshot "
+            "each frame (pi.display.liveSnapshot.path, e.g. "
+            "/dev/shm/eclipse-obd-live.snap).  Takes precedence over --from-db."
+        ),
+    )
     return parser.parse_args(argv)
 
 
@@ -317,6 +380,7 @@ def main(argv: list[str] | None = None) -> int:
             windowed=args.windowed,
             snapshotPath=args.snapshot,
             liveDbPath=args.fromDb,
+            liveSnapshotPath=args.fromSnapshot,
         )
     except _ExitRequested:
         return 0
@@ -15,6 +15,8 @@
 # Date          | Author       | Description
 # ================================================================================
 # 2026-04-18    | Rex          | Initial implementation for US-154 (Sprint 11)
+# 2026-10-16    | Rex          | Print the sweep's bytes-on-wire, wire format
+#                               + rows/sec.
 # ================================================================================
 ################################################################################
 
@@ -248,6 +250,15 @@ def _summaryLines(results: list[PushResult], elapsedSeconds: float) -> str:
     )
 
 
+def _sweepLine(sweep: Any) -> str:
+    """One line of transfer totals from :class:`SweepStats`."""
+    return (
+        f"Transfer: {sweep.requests} request(s), {sweep.bytesOnWire} bytes on "
+        f"wire ({sweep.bytesRaw} raw, {sweep.wireFormat}, {sweep.encoding}), "
+        f"{sweep.rowsPerSecond:.0f} rows/s ({sweep.mode})"
+    )
+
+
 def _renderDryRunReport(syncClient: Any) -> str:
     """Render a dry-run delta-count report without making any HTTP calls.
 
@@ -357,6 +368,9 @@ def main(
         print(_formatResultLine(result))
     print()
     print(_summaryLines(results, elapsed))
+    sweep = getattr(client, "lastSweep", None)
+    if sweep is not None and sweep.requests:
+        print(_sweepLine(sweep))
 
     return 1 if _overallStatus(results) == "FAILED" else 0
 
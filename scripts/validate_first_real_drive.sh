@@ -211,7 +211,7 @@ Planned steps:
      INCONCLUSIVE.
   8  sync_now.py -- push Pi delta rows to $SERVER_HOSTNAME (skipped: $SKIP_SYNC).
   9  report.py --drive <id> -- human-readable summary (skipped: $SKIP_REPORT).
- 10  Spool AI: POST /api/v1/analyze with {drive_id:N, parameters:{}} --
+ 10  Spool AI: POST /api/v1/analyze?wait=true with {drive_id:N, parameters:{}} --
      (skipped: $SKIP_SPOOL).  'insufficient data' return is valid.
 
 No commands will be executed.
@@ -409,7 +409,9 @@ banner "Step 10 -- Spool AI /analyze smoke"
 if [ "$SKIP_SPOOL" = "1" ]; then
     record_na "Spool step skipped (--skip-spool or fixture mode)"
 else
-    ANALYZE_URL="${SERVER_BASE_URL}/api/v1/analyze"
+    # ?wait=true: block until the queued job finishes and answer 200 with
+    # the analysis (the bare endpoint answers 202 with a job id).
+    ANALYZE_URL="${SERVER_BASE_URL}/api/v1/analyze?wait=true"
     PAYLOAD='{"drive_id":'"$DRIVE_ID"',"parameters":{}}'
     HTTP_STATUS=$(curl -s -o /tmp/us208_spool.out -w '%{http_code}' \
         -X POST -H 'Content-Type: application/json' \
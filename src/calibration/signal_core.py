@@ -0,0 +1,353 @@
+################################################################################
+# File Name: signal_core.py
+# Purpose/Description: Numeric core for the SPEED-PID calibration aligners --
+#                      interpolation onto epoch-second grids, normalized
+#                      cross-correlation over a lag window (FFT with NumPy,
+#                      prefix sums + C-level dot products without), sub-sample
+#                      peak refinement, trapezoidal integration.
+# Author: Rex
+# Creation Date: 2026-10-17
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-17    | Rex          | Initial
+# 2026-10-17    | Rex          | mypy clean: float list from the NumPy
+#               |              | correlation, no reuse of the query name.
+# ================================================================================
+################################################################################
+
+"""Array-based numeric core shared by the calibration aligners.
+
+Series are ``(times, values)`` float sequences with times in epoch seconds,
+ascending.  Converting each ``datetime`` once (:func:`epochSeries`) and
+working on floats afterwards is what lets a multi-hour FIT track align in
+milliseconds; the aligners used to step a ``datetime`` per grid point and
+rebuild a full Pearson correlation for every candidate lag.
+
+* :func:`interpolate` -- linear (``numpy.interp`` semantics: clamped at the
+  ends) or nearest-hold (last sample at or before each query).
+* :func:`crossCorrelation` -- Pearson correlation of ``x[i]`` with
+  ``y[i - lag]`` over the overlapping window, for every lag in
+  ``[-maxLag, maxLag]``.  With NumPy the cross sums for all lags come from
+  one FFT; window means and variances come from prefix sums either way, so
+  no lag rescans its window.
+* :func:`bestLag` -- the peak, refined to a fraction of a sample by fitting
+  a parabola through it and its two neighbours.
+
+NumPy is optional (the calibration tooling must run without it, as the Pi
+image does).  Both backends agree to floating-point rounding, not bit for
+bit: the FFT accumulates the cross sums in a different order.  Pass
+``backend='python'`` or ``'numpy'`` to force one.
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_right
+from collections.abc import Iterable, Sequence
+from datetime import datetime
+from itertools import accumulate
+from operator import mul
+from typing import Any
+
+try:  # Optional: vectorized backend when NumPy is installed.
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the deployment
+    np = None  # type: ignore[assignment, unused-ignore]
+
+#: True when the NumPy backend is importable.
+NUMPY_AVAILABLE: bool = np is not None
+
+BACKEND_NUMPY = "numpy"
+BACKEND_PYTHON = "python"
+
+INTERP_LINEAR = "linear"
+INTERP_HOLD = "hold"
+
+# A window whose variance is below this fraction of its raw sum of squares is
+# treated as constant (prefix-sum cancellation leaves ~1e-16 relative noise).
+_DEGENERATE_VARIANCE = 1e-9
+
+
+def _resolveBackend(backend: str | None) -> str:
+    if backend is None:
+        return BACKEND_NUMPY if NUMPY_AVAILABLE else BACKEND_PYTHON
+    if backend == BACKEND_NUMPY and not NUMPY_AVAILABLE:
+        raise ValueError("NumPy backend requested but numpy is not installed")
+    if backend not in (BACKEND_NUMPY, BACKEND_PYTHON):
+        raise ValueError(f"unknown backend: {backend!r}")
+    return backend
+
+
+def epochSeries(samples: Iterable[tuple[datetime, float]]) -> tuple[list[float], list[float]]:
+    """Split ``(aware datetime, value)`` samples into epoch-second and value lists."""
+    times: list[float] = []
+    values: list[float] = []
+    for ts, value in samples:
+        times.append(ts.timestamp())
+        values.append(float(value))
+    return times, values
+
+
+def uniformGrid(start: float, step: float, count: int, *, backend: str | None = None) -> Any:
+    """``count`` evenly spaced times ``start, start + step, ...``."""
+    if _resolveBackend(backend) == BACKEND_NUMPY:
+        return start + step * np.arange(max(count, 0), dtype=np.float64)
+    return [start + k * step for k in range(max(count, 0))]
+
+
+# ================================================================================
+# Interpolation
+# ================================================================================
+
+
+def interpolate(
+    times: Sequence[float],
+    values: Sequence[float],
+    queries: Sequence[float],
+    *,
+    method: str = INTERP_LINEAR,
+    backend: str | None = None,
+) -> Any:
+    """Sample ``(times, values)`` at ``queries``.
+
+    Args:
+        times: Ascending sample times (epoch seconds).
+        values: Sample values, same length as ``times`` (non-empty).
+        queries: Times to evaluate at (any order).
+        method: ``'linear'`` (clamped to the end values outside the series)
+            or ``'hold'`` (last sample at or before the query; the first
+            sample before the series starts).
+        backend: ``'numpy'``, ``'python'`` or None (NumPy if available).
+
+    Returns:
+        A float64 array (NumPy backend) or a list of floats.
+    """
+    if not len(times) or len(times) != len(values):
+        raise ValueError("interpolate needs equal-length, non-empty times and values")
+    if method not in (INTERP_LINEAR, INTERP_HOLD):
+        raise ValueError(f"unknown interpolation method: {method!r}")
+
+    if _resolveBackend(backend) == BACKEND_NUMPY:
+        t = np.asarray(times, dtype=np.float64)
+        v = np.asarray(values, dtype=np.float64)
+        q = np.asarray(queries, dtype=np.float64)
+        if method == INTERP_LINEAR:
+            return np.interp(q, t, v)
+        index = np.searchsorted(t, q, side="right") - 1
+        return v[np.clip(index, 0, len(v) - 1)]
+
+    last = len(times) - 1
+    out: list[float] = []
+    for query in queries:
+        j = bisect_right(times, query) - 1
+        if j < 0:
+            out.append(values[0])
+        elif j >= last or method == INTERP_HOLD:
+            out.append(values[j])
+        else:
+            tA, tB = times[j], times[j + 1]
+            out.append(values[j] + (values[j + 1] - values[j]) * ((query - tA) / (tB - tA)))
+    return out
+
+
+def trapezoidIntegral(
+    times: Sequence[float], values: Sequence[float], *, backend: str | None = None,
+) -> float:
+    """Trapezoidal integral of ``values`` over ``times`` (value x seconds)."""
+    if len(times) < 2:
+        return 0.0
+    if _resolveBackend(backend) == BACKEND_NUMPY:
+        t = np.asarray(times, dtype=np.float64)
+        v = np.asarray(values, dtype=np.float64)
+        return float(np.sum((v[1:] + v[:-1]) * np.diff(t)) / 2.0)
+    return math.fsum(
+        (v0 + v1) * (t1 - t0)
+        for t0, t1, v0, v1 in zip(times, times[1:], values, values[1:], strict=False)
+    ) / 2.0
+
+
+# ================================================================================
+# Cross-correlation
+# ================================================================================
+
+
+def _pearsonFromSums(
+    m: int, sx: float, sy: float, sxx: float, syy: float, sxy: float,
+) -> float:
+    varX = sxx - sx * sx / m
+    varY = syy - sy * sy / m
+    if varX <= _DEGENERATE_VARIANCE * sxx or varY <= _DEGENERATE_VARIANCE * syy:
+        return 0.0
+    return (sxy - sx * sy / m) / math.sqrt(varX * varY)
+
+
+def crossCorrelation(
+    x: Sequence[float],
+    y: Sequence[float],
+    maxLag: int,
+    *,
+    minOverlap: int = 3,
+    backend: str | None = None,
+) -> list[float]:
+    """Pearson correlation of ``x[i]`` with ``y[i - lag]`` for each lag.
+
+    Args:
+        x: First series (e.g. the OBD grid).
+        y: Second series on the same grid, same length.
+        maxLag: Lags ``-maxLag .. maxLag`` (in samples) are evaluated.
+        minOverlap: Lags whose overlapping window is shorter than this are
+            reported as NaN.
+        backend: ``'numpy'``, ``'python'`` or None (NumPy if available).
+
+    Returns:
+        ``2 * maxLag + 1`` correlations, index ``maxLag + lag``; a constant
+        window correlates as 0.0.
+    """
+    n = len(x)
+    if len(y) != n:
+        raise ValueError(f"crossCorrelation needs equal lengths: {n} != {len(y)}")
+    if maxLag < 0:
+        raise ValueError(f"maxLag must be non-negative: {maxLag}")
+    if n == 0:
+        return [math.nan] * (2 * maxLag + 1)
+    if _resolveBackend(backend) == BACKEND_NUMPY:
+        return _crossCorrelationNumpy(x, y, maxLag, max(minOverlap, 1))
+    return _crossCorrelationPython(x, y, maxLag, max(minOverlap, 1))
+
+
+def _crossCorrelationPython(
+    x: Sequence[float], y: Sequence[float], maxLag: int, minOverlap: int,
+) -> list[float]:
+    n = len(x)
+    # Centre on the global means first: keeps the prefix-sum variances
+    # well conditioned for speed traces sitting far from zero.
+    meanX, meanY = math.fsum(x) / n, math.fsum(y) / n
+    xc = [v - meanX for v in x]
+    yc = [v - meanY for v in y]
+    px = list(accumulate(xc, initial=0.0))
+    py = list(accumulate(yc, initial=0.0))
+    pxx = list(accumulate((v * v for v in xc), initial=0.0))
+    pyy = list(accumulate((v * v for v in yc), initial=0.0))
+
+    out: list[float] = []
+    for lag in range(-maxLag, maxLag + 1):
+        lo, hi = max(0, lag), min(n, n + lag)
+        m = hi - lo
+        if m < minOverlap:
+            out.append(math.nan)
+            continue
+        sxy = sum(map(mul, xc[lo:hi], yc[lo - lag:hi - lag]))
+        out.append(_pearsonFromSums(
+            m,
+            px[hi] - px[lo], py[hi - lag] - py[lo - lag],
+            pxx[hi] - pxx[lo], pyy[hi - lag] - pyy[lo - lag],
+            sxy,
+        ))
+    return out
+
+
+def _crossCorrelationNumpy(
+    x: Sequence[float], y: Sequence[float], maxLag: int, minOverlap: int,
+) -> list[float]:
+    xa = np.asarray(x, dtype=np.float64)
+    ya = np.asarray(y, dtype=np.float64)
+    n = xa.size
+    xc = xa - xa.mean()
+    yc = ya - ya.mean()
+
+    # sum_i x[i] * y[i - lag] for every lag from one zero-padded FFT product.
+    size = 1 << (2 * n - 1).bit_length()
+    cross = np.fft.irfft(np.fft.rfft(xc, size) * np.conj(np.fft.rfft(yc, size)), size)
+    lags = np.arange(-maxLag, maxLag + 1)
+    sxy = cross[lags % size]
+
+    zero = np.zeros(1)
+    px = np.concatenate((zero, np.cumsum(xc)))
+    py = np.concatenate((zero, np.cumsum(yc)))
+    pxx = np.concatenate((zero, np.cumsum(xc * xc)))
+    pyy = np.concatenate((zero, np.cumsum(yc * yc)))
+
+    lo = np.maximum(0, lags)
+    hi = np.minimum(n, n + lags)
+    m = hi - lo
+    valid = m >= minOverlap
+    loV, hiV, mV, lagV = lo[valid], hi[valid], m[valid], lags[valid]
+    sx = px[hiV] - px[loV]
+    sy = py[hiV - lagV] - py[loV - lagV]
+    sxx = pxx[hiV] - pxx[loV]
+    syy = pyy[hiV - lagV] - pyy[loV - lagV]
+    varX = sxx - sx * sx / mV
+    varY = syy - sy * sy / mV
+    degenerate = (varX <= _DEGENERATE_VARIANCE * sxx) | (varY <= _DEGENERATE_VARIANCE * syy)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        corr = (sxy[valid] - sx * sy / mV) / np.sqrt(varX * varY)
+    corr[degenerate] = 0.0
+
+    out = np.full(lags.size, np.nan)
+    out[valid] = corr
+    return [float(v) for v in out]
+
+
+def refinePeak(correlations: Sequence[float], index: int) -> float:
+    """Sub-sample offset of the peak at ``index`` (parabola through 3 points).
+
+    Returns 0.0 at the window edges, next to a NaN, or when the three
+    points are not a strict local maximum.
+    """
+    if index <= 0 or index >= len(correlations) - 1:
+        return 0.0
+    left, mid, right = correlations[index - 1], correlations[index], correlations[index + 1]
+    if math.isnan(left) or math.isnan(right):
+        return 0.0
+    curvature = left - 2.0 * mid + right
+    if curvature >= 0.0:
+        return 0.0
+    return max(-0.5, min(0.5, 0.5 * (left - right) / curvature))
+
+
+def bestLag(
+    x: Sequence[float],
+    y: Sequence[float],
+    maxLag: int,
+    *,
+    minOverlap: int = 3,
+    refine: bool = True,
+    backend: str | None = None,
+) -> tuple[float, float]:
+    """Lag (in samples) maximizing :func:`crossCorrelation`, and the peak value.
+
+    The first maximum wins ties.  With ``refine`` the lag is a fraction of a
+    sample (:func:`refinePeak`); otherwise it is integral.  Returns
+    ``(0.0, nan)`` when no lag has enough overlap.
+    """
+    correlations = crossCorrelation(
+        x, y, maxLag, minOverlap=minOverlap, backend=backend,
+    )
+    bestIndex, bestValue = -1, -math.inf
+    for index, value in enumerate(correlations):
+        if value > bestValue:  # NaN never compares greater
+            bestIndex, bestValue = index, value
+    if bestIndex < 0:
+        return 0.0, math.nan
+    offset = refinePeak(correlations, bestIndex) if refine else 0.0
+    return float(bestIndex - maxLag) + offset, bestValue
+
+
+__all__ = [
+    "BACKEND_NUMPY",
+    "BACKEND_PYTHON",
+    "INTERP_HOLD",
+    "INTERP_LINEAR",
+    "NUMPY_AVAILABLE",
+    "bestLag",
+    "crossCorrelation",
+    "epochSeries",
+    "interpolate",
+    "refinePeak",
+    "trapezoidIntegral",
+    "uniformGrid",
+]
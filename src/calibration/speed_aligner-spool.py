@@ -20,6 +20,11 @@
 # 2026-06-05    | Spool        | Initial -- operationalizes Atlas's GPS-cal
 #               |              | procedure as an independent cross-check aligner.
 #               |              | Promoted from offices/tuner/scripts/ per CIO.
+# 2026-10-17    | Rex          | Resampling + lag search delegated to
+#               |              | signal_core (nearest-hold interpolation and
+#               |              | integer-lag normalized cross-correlation, so
+#               |              | the method and the ratified numbers are
+#               |              | unchanged); drops the duplicated loops.
 # ================================================================================
 ################################################################################
 """Spool cross-check SPEED-PID aligner (nearest-hold resampling, no numpy).
@@ -41,6 +46,13 @@ from statistics import median
 
 sys.path.insert(0, os.path.dirname(__file__))
 from fit_reader import FitTrack, readFit  # type: ignore[import-not-found]  # noqa: E402
+from signal_core import (  # type: ignore[import-not-found]  # noqa: E402
+    INTERP_HOLD,
+    bestLag,
+    epochSeries,
+    interpolate,
+    uniformGrid,
+)
 
 MS_TO_KMH = 3.6
 DEFAULT_LOW_SPEED_FLOOR_KMH = 20.0   # GPS instantaneous speed is noisy at crawl
@@ -104,25 +116,9 @@ def integrateDistanceMeters(series: ObdSeries) -> float:
 
 def _resample1Hz(series: ObdSeries, t0: datetime, n: int) -> list[float]:
     """Nearest-hold resample to an n-sample 1 Hz grid starting at t0."""
-    grid: list[float] = []
-    j = 0
-    for k in range(n):
-        target = t0.timestamp() + k
-        while j + 1 < len(series) and series[j + 1][0].timestamp() <= target:
-            j += 1
-        grid.append(series[j][1])
-    return grid
-
-
-def _pearson(a: list[float], b: list[float]) -> float:
-    n = len(a)
-    if n < 3:
-        return -2.0
-    meanA, meanB = sum(a) / n, sum(b) / n
-    num = sum((x - meanA) * (y - meanB) for x, y in zip(a, b))
-    denomA = sum((x - meanA) ** 2 for x in a) ** 0.5
-    denomB = sum((y - meanB) ** 2 for y in b) ** 0.5
-    return num / (denomA * denomB) if denomA and denomB else -2.0
+    times, values = epochSeries(series)
+    return list(interpolate(times, values, uniformGrid(t0.timestamp(), 1.0, n),
+                            method=INTERP_HOLD))
 
 
 def estimateCorrectionFactor(
@@ -150,14 +146,9 @@ def estimateCorrectionFactor(
         if span > 10:
             gGrid = _resample1Hz(gps, t0, span)
             oGrid = _resample1Hz(obd, t0, span)
-            for trialLag in range(-MAX_LAG_SECONDS, MAX_LAG_SECONDS + 1):
-                if trialLag >= 0:
-                    a, b = oGrid[trialLag:], gGrid[:span - trialLag]
-                else:
-                    a, b = oGrid[:span + trialLag], gGrid[-trialLag:]
-                r = _pearson(a, b)
-                if r > corr:
-                    corr, lag = r, trialLag
+            # Whole-second lag: the cross-check keeps its own coarser method.
+            lagFloat, corr = bestLag(oGrid, gGrid, MAX_LAG_SECONDS, refine=False)
+            lag = int(lagFloat)
             ratios: list[tuple[float, float]] = []
             for k in range(span):
                 ko = k + lag
@@ -8,10 +8,23 @@
 #                      median GPS/OBD over a cross-correlation-aligned, speed-
 #                      filtered grid -- the diagnostic that also drives the
 #                      scalar-vs-curve gate (is one constant factor even valid?).
-#                      true_speed = OBD_speed x factor. Pure stdlib (no numpy).
+#                      true_speed = OBD_speed x factor. NumPy optional (via
+#                      signal_core).
 # Author: Atlas (Architect)
 # Creation Date: 2026-06-05
 # Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-06-05    | Atlas        | Initial
+# 2026-10-17    | Rex          | Numerics moved to signal_core on epoch-second
+#               |              | arrays: vectorized interpolation, normalized
+#               |              | cross-correlation from prefix sums / one FFT,
+#               |              | sub-second lag.  estimateDriveCalibrations
+#               |              | aligns several drives against one track.
+# ================================================================================
 ################################################################################
 
 """Align OBD SPEED with GPS truth and estimate the SPEED-PID correction factor.
@@ -27,23 +40,41 @@ estimators are computed and cross-checked:
   exceed a floor (low speed is noisy).  Binned by speed, it answers the
   scalar-vs-curve question: if the ratio drifts with speed, a single factor is
   the wrong model and the single-scalar schema is a B-076 finding.
+
+Series are converted once to epoch-second arrays and the numerics
+(interpolation, normalized cross-correlation, integration) run in
+:mod:`src.calibration.signal_core`.  The lag is resolved below the grid
+step by refining the correlation peak, and Estimator B re-interpolates the
+GPS trace at the shifted times, so a fractional lag needs no finer grid.
 """
 
 from __future__ import annotations
 
 import csv
+import math
 import os
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, datetime
 from statistics import median, pstdev
 
 from src.calibration.fit_reader import FitTrack
+from src.calibration.signal_core import (
+    BACKEND_PYTHON,
+    bestLag,
+    epochSeries,
+    interpolate,
+    trapezoidIntegral,
+    uniformGrid,
+)
 
 KMH_PER_MPS = 3.6
 MIN_SPEED_KMH_FOR_RATIO = 10.0  # below this, GPS+OBD instantaneous ratio is noise
 RESAMPLE_STEP_S = 1.0
 MAX_LAG_SEARCH_S = 60
 SCALAR_CONSTANT_TOL = 0.15  # max (bin spread / overall median) to call it constant
+_LAG_EPS = 1e-9  # an integral lag must not lose a grid index to float noise
 
 ObdSample = tuple[datetime, float]  # (utc timestamp, km/h)
 GpsSample = tuple[datetime, float]  # (utc timestamp, m/s)
@@ -56,7 +87,8 @@ class CalibrationEstimate:
     Attributes:
         distanceRatioScale: Estimator A -- GPS dist / OBD-integrated dist (primary).
         speedRatioScale: Estimator B -- median GPS/OBD over aligned moving samples.
-        lagSeconds: Clock offset (s) found by cross-correlation (GPS vs OBD).
+        lagSeconds: Clock offset (s) found by cross-correlation (GPS vs OBD),
+            resolved below the grid step.
         obdDistanceM: OBD-integrated distance over the drive (m).
         gpsDistanceM: GPS cumulative distance (m).
         pairedSampleCount: Number of speed-filtered aligned samples used for B.
@@ -98,105 +130,88 @@ def gpsSpeedSeries(track: FitTrack) -> list[GpsSample]:
 
 def integrateDistanceKm(samples: list[ObdSample]) -> float:
     """Trapezoidal integral of a km/h series over time -> kilometres."""
-    total = 0.0
-    for (t0, v0), (t1, v1) in zip(samples, samples[1:], strict=False):
-        dtHours = (t1 - t0).total_seconds() / 3600.0
-        total += (v0 + v1) / 2.0 * dtHours
-    return total
-
-
-def _resampleToGrid(
-    samples: list[tuple[datetime, float]], t0: datetime, t1: datetime, step: float
-) -> list[float]:
-    """Linear-interpolate a (ts, value) series onto a uniform grid [t0, t1]."""
-    times = [s[0] for s in samples]
-    vals = [s[1] for s in samples]
-    grid: list[float] = []
-    j = 0
-    steps = int((t1 - t0).total_seconds() // step)
-    for k in range(steps + 1):
-        gt = t0 + timedelta(seconds=k * step)
-        while j + 1 < len(times) and times[j + 1] <= gt:
-            j += 1
-        if gt <= times[0]:
-            grid.append(vals[0])
-        elif gt >= times[-1]:
-            grid.append(vals[-1])
-        else:
-            tA, tB = times[j], times[j + 1]
-            frac = (gt - tA).total_seconds() / (tB - tA).total_seconds()
-            grid.append(vals[j] + (vals[j + 1] - vals[j]) * frac)
-    return grid
-
-
-def _pearson(xs: list[float], ys: list[float]) -> float:
-    """Pearson correlation of two equal-length series (0 if degenerate)."""
-    n = len(xs)
-    if n == 0:
-        return 0.0
-    mx, my = sum(xs) / n, sum(ys) / n
-    num = sum((x - mx) * (y - my) for x, y in zip(xs, ys, strict=True))
-    dx = sum((x - mx) ** 2 for x in xs) ** 0.5
-    dy = sum((y - my) ** 2 for y in ys) ** 0.5
-    if dx == 0 or dy == 0:
-        return 0.0
-    return num / (dx * dy)
-
-
-def _bestLagSeconds(obdGrid: list[float], gpsGrid: list[float], maxLag: int) -> int:
-    """Discrete cross-correlation: the GPS-vs-OBD lag (s) maximizing correlation."""
-    bestLag, bestCorr = 0, -2.0
-    n = len(obdGrid)
-    for lag in range(-maxLag, maxLag + 1):
-        xs, ys = [], []
-        for i in range(n):
-            j = i - lag
-            if 0 <= j < n:
-                xs.append(obdGrid[i])
-                ys.append(gpsGrid[j])
-        if len(xs) < n // 2:
-            continue
-        corr = _pearson(xs, ys)
-        if corr > bestCorr:
-            bestCorr, bestLag = corr, lag
-    return bestLag
+    times, kmh = epochSeries(samples)
+    return trapezoidIntegral(times, kmh) / 3600.0
 
 
-def estimateCalibration(
-    obdSamples: list[ObdSample], gpsSamples: list[GpsSample], gpsDistanceM: float
-) -> CalibrationEstimate:
-    """Pair an OBD SPEED series with GPS truth and estimate the correction factor.
+def _lagWindow(lagSteps: float, count: int) -> tuple[int, int]:
+    """Grid indices ``i`` whose partner time ``t_i - lag`` stays inside the grid."""
+    lo = max(0, math.ceil(lagSteps - _LAG_EPS))
+    hi = min(count, count + math.floor(lagSteps + _LAG_EPS))
+    return lo, max(lo, hi)
 
-    Args:
-        obdSamples: (utc, km/h) OBD SPEED series for the drive.
-        gpsSamples: (utc, m/s) GPS speed series (e.g. from ``gpsSpeedSeries``).
-        gpsDistanceM: GPS cumulative distance for the drive (m).
 
-    Returns:
-        A :class:`CalibrationEstimate` with both estimators + the curve gate.
+def _bestLagSeconds(
+    obdGrid: Sequence[float], gpsGrid: Sequence[float], maxLag: int, stepS: float,
+    backend: str | None = None,
+) -> float:
+    """Normalized cross-correlation peak: the GPS-vs-OBD lag (s), sub-step resolved.
+
+    Lags whose overlap is under half the grid are ignored, as before.
+    """
+    lagSteps, _peak = bestLag(
+        obdGrid, gpsGrid, maxLag, minOverlap=max(len(obdGrid) // 2, 1), backend=backend,
+    )
+    return lagSteps * stepS
+
+
+def _estimateFromEpochs(
+    obdTimes: Sequence[float],
+    obdKmh: Sequence[float],
+    gpsTimes: Sequence[float],
+    gpsKmh: Sequence[float],
+    gpsDistanceM: float | Callable[[float], float],
+    stepS: float,
+    backend: str | None,
+) -> CalibrationEstimate:
+    """Both estimators on epoch-second series.
+
+    ``gpsDistanceM`` is either the drive's GPS distance or a function of the
+    found lag (multi-drive runs cut each drive's distance out of one track).
     """
+    obdDistanceM = trapezoidIntegral(obdTimes, obdKmh, backend=backend) / 3.6
+
+    # Resample both onto a uniform grid over the overlap window (GPS in km/h).
+    t0 = max(obdTimes[0], gpsTimes[0])
+    t1 = min(obdTimes[-1], gpsTimes[-1])
+    count = int((t1 - t0) // stepS) + 1 if t1 >= t0 else 0
+    grid = uniformGrid(t0, stepS, count, backend=backend)
+    obdGrid = interpolate(obdTimes, obdKmh, grid, backend=backend)
+    gpsGrid = interpolate(gpsTimes, gpsKmh, grid, backend=backend)
+    maxLag = int(round(MAX_LAG_SEARCH_S / stepS))
+    lag = _bestLagSeconds(obdGrid, gpsGrid, maxLag, stepS, backend)
+
     # Estimator A -- distance-ratio (clock-skew immune).
-    obdDistanceM = integrateDistanceKm(obdSamples) * 1000.0
+    if callable(gpsDistanceM):
+        gpsDistanceM = gpsDistanceM(lag)
     distanceRatioScale = gpsDistanceM / obdDistanceM if obdDistanceM else float("nan")
 
-    # Resample both onto a 1 Hz grid over the overlap window (GPS in km/h).
-    t0 = max(obdSamples[0][0], gpsSamples[0][0])
-    t1 = min(obdSamples[-1][0], gpsSamples[-1][0])
-    gpsKmh = [(ts, v * KMH_PER_MPS) for ts, v in gpsSamples]
-    obdGrid = _resampleToGrid(obdSamples, t0, t1, RESAMPLE_STEP_S)
-    gpsGrid = _resampleToGrid(gpsKmh, t0, t1, RESAMPLE_STEP_S)
-    lag = _bestLagSeconds(obdGrid, gpsGrid, MAX_LAG_SEARCH_S)
-
-    # Estimator B -- speed-ratio on the lag-aligned, speed-filtered grid.
+    # Estimator B -- speed-ratio: OBD at grid time t against GPS at t - lag
+    # (re-interpolated, so a fractional lag needs no finer grid).
+    lo, hi = _lagWindow(lag / stepS, count)
+    gpsAligned = interpolate(
+        gpsTimes, gpsKmh, uniformGrid(grid[lo] - lag if hi > lo else t0, stepS, hi - lo,
+                                      backend=backend),
+        backend=backend,
+    )
     ratios, speeds = [], []
-    n = len(obdGrid)
-    for i in range(n):
-        j = i - lag
-        if 0 <= j < n:
-            obd, gps = obdGrid[i], gpsGrid[j]
-            if obd >= MIN_SPEED_KMH_FOR_RATIO and gps >= MIN_SPEED_KMH_FOR_RATIO:
-                ratios.append(gps / obd)
-                speeds.append(obd)
+    for obd, gps in zip(list(obdGrid[lo:hi]), list(gpsAligned), strict=True):
+        if obd >= MIN_SPEED_KMH_FOR_RATIO and gps >= MIN_SPEED_KMH_FOR_RATIO:
+            ratios.append(float(gps / obd))
+            speeds.append(float(obd))
+    return _summarize(
+        distanceRatioScale, lag, obdDistanceM, float(gpsDistanceM), ratios, speeds,
+    )
+
+
+def _summarize(
+    distanceRatioScale: float,
+    lag: float,
+    obdDistanceM: float,
+    gpsDistanceM: float,
+    ratios: list[float],
+    speeds: list[float],
+) -> CalibrationEstimate:
     speedRatioScale = median(ratios) if ratios else float("nan")
     ratioSpread = pstdev(ratios) if len(ratios) > 1 else 0.0
 
@@ -227,3 +242,97 @@ def estimateCalibration(
         scalarIsConstant=scalarIsConstant,
         ratioBySpeedBin=ratioBySpeedBin,
     )
+
+
+def estimateCalibration(
+    obdSamples: list[ObdSample],
+    gpsSamples: list[GpsSample],
+    gpsDistanceM: float,
+    *,
+    stepS: float = RESAMPLE_STEP_S,
+    backend: str | None = None,
+) -> CalibrationEstimate:
+    """Pair an OBD SPEED series with GPS truth and estimate the correction factor.
+
+    Args:
+        obdSamples: (utc, km/h) OBD SPEED series for the drive.
+        gpsSamples: (utc, m/s) GPS speed series (e.g. from ``gpsSpeedSeries``).
+        gpsDistanceM: GPS cumulative distance for the drive (m).
+        stepS: Resampling grid step (s); the lag is resolved below it.
+        backend: Numeric backend for :mod:`src.calibration.signal_core`.
+
+    Returns:
+        A :class:`CalibrationEstimate` with both estimators + the curve gate.
+    """
+    obdTimes, obdKmh = epochSeries(obdSamples)
+    gpsTimes, gpsMps = epochSeries(gpsSamples)
+    gpsKmh = [v * KMH_PER_MPS for v in gpsMps]
+    return _estimateFromEpochs(
+        obdTimes, obdKmh, gpsTimes, gpsKmh, gpsDistanceM, stepS, backend,
+    )
+
+
+def estimateDriveCalibrations(
+    obdDrives: Sequence[list[ObdSample]],
+    track: FitTrack,
+    *,
+    stepS: float = RESAMPLE_STEP_S,
+    backend: str | None = None,
+) -> list[CalibrationEstimate | None]:
+    """Estimate every OBD drive recorded inside one GPS track.
+
+    A long FIT recording (a day of errands, a multi-hour trip) usually spans
+    several OBD drives.  The track is converted to epoch arrays once; each
+    drive then aligns against the slice of the track around it, and its GPS
+    distance is the track's cumulative distance across the drive's window
+    shifted by the lag found for that drive (integrated GPS speed when the
+    track carries no distance records).
+
+    Args:
+        obdDrives: (utc, km/h) OBD SPEED series, one per drive.
+        track: The GPS track covering the drives.
+        stepS: Resampling grid step (s).
+        backend: Numeric backend for :mod:`src.calibration.signal_core`.
+
+    Returns:
+        One estimate per drive, in input order; None for a drive with fewer
+        than two samples or no GPS overlap.
+    """
+    gpsTimes, gpsMps = epochSeries(gpsSpeedSeries(track))
+    gpsKmh = [v * KMH_PER_MPS for v in gpsMps]
+    distTimes, distM = epochSeries(
+        (p.timestamp, p.distanceM)
+        for p in track.points
+        if p.timestamp is not None and p.distanceM is not None
+    )
+
+    estimates: list[CalibrationEstimate | None] = []
+    for drive in obdDrives:
+        obdTimes, obdKmh = epochSeries(drive)
+        if len(obdTimes) < 2:
+            estimates.append(None)
+            continue
+        lo = bisect_left(gpsTimes, obdTimes[0] - MAX_LAG_SEARCH_S)
+        hi = bisect_right(gpsTimes, obdTimes[-1] + MAX_LAG_SEARCH_S)
+        if hi - lo < 2 or gpsTimes[lo] > obdTimes[-1] or gpsTimes[hi - 1] < obdTimes[0]:
+            estimates.append(None)
+            continue
+        windowTimes, windowKmh = gpsTimes[lo:hi], gpsKmh[lo:hi]
+        start, end = obdTimes[0], obdTimes[-1]
+
+        def gpsDistance(lag: float, start: float = start, end: float = end,
+                        windowTimes: list[float] = windowTimes,
+                        windowKmh: list[float] = windowKmh) -> float:
+            if len(distTimes) >= 2:
+                atStart, atEnd = interpolate(
+                    distTimes, distM, [start - lag, end - lag], backend=BACKEND_PYTHON,
+                )
+                return atEnd - atStart
+            a = bisect_left(windowTimes, start - lag)
+            b = bisect_right(windowTimes, end - lag)
+            return trapezoidIntegral(windowTimes[a:b], windowKmh[a:b]) / 3.6
+
+        estimates.append(_estimateFromEpochs(
+            obdTimes, obdKmh, windowTimes, windowKmh, gpsDistance, stepS, backend,
+        ))
+    return estimates
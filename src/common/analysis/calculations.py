@@ -10,6 +10,10 @@
 # Date          | Author       | Description
 # ================================================================================
 # 2026-01-22    | Ralph Agent  | Initial creation for US-010 refactoring
+# 2026-10-16    | Rex          | Route the statistics through the shared
+#               |              | kernel (one pass, NumPy when installed).
+# 2026-10-17    | Rex          | calculateStandardDeviation keeps its float
+#               |              | return (0.0 when the kernel reports None).
 # ================================================================================
 ################################################################################
 
@@ -23,14 +27,15 @@ Provides:
 - calculateOutlierBounds: Calculate outlier bounds based on mean and std dev
 - calculateParameterStatistics: Calculate all statistics for a parameter
 
-These are pure functions with no side effects.
+These are pure functions with no side effects.  The math lives in
+:mod:`.kernel`, shared with the server analytics.
 """
 
 import math
-from collections import Counter
 from datetime import datetime
 
 from .exceptions import InsufficientDataError
+from .kernel import DEFAULT_MODE_PRECISION, summarize, sumOfSquaredDeviations
 from .types import ParameterStatistics
 
 # ================================================================================
@@ -52,10 +57,12 @@ def calculateMean(values: list[float]) -> float:
     """
     if not values:
         raise InsufficientDataError("Cannot calculate mean of empty list")
-    return sum(values) / len(values)
+    return math.fsum(values) / len(values)
 
 
-def calculateMode(values: list[float], precision: int = 2) -> float | None:
+def calculateMode(
+    values: list[float], precision: int = DEFAULT_MODE_PRECISION
+) -> float | None:
     """
     Calculate mode (most common value) of values.
 
@@ -69,19 +76,8 @@ def calculateMode(values: list[float], precision: int = 2) -> float | None:
     if not values:
         return None
 
-    # Round values for mode calculation to group similar values
-    roundedValues = [round(v, precision) for v in values]
-    counter = Counter(roundedValues)
-
-    if not counter:
-        return None
-
-    # Get most common value
-    mostCommon = counter.most_common(1)
-    if mostCommon:
-        return mostCommon[0][0]
-
-    return None
+    # Values are grouped by round(v, precision); ties go to the first seen.
+    return summarize(values, modePrecision=precision).mode
 
 
 def calculateStandardDeviation(values: list[float], mean: float | None = None) -> float:
@@ -104,13 +100,12 @@ def calculateStandardDeviation(values: list[float], mean: float | None = None) -
         )
 
     if mean is None:
-        mean = calculateMean(values)
-
-    # Calculate sum of squared differences from mean
-    squaredDiffs = [(v - mean) ** 2 for v in values]
+        # summarize() reports None below 2 samples; keep the 0.0 fallback.
+        stdDev = summarize(values, modePrecision=None).stdDev
+        return stdDev if stdDev is not None else 0.0
 
     # Use sample standard deviation (n-1)
-    variance = sum(squaredDiffs) / (len(values) - 1)
+    variance = sumOfSquaredDeviations(values, mean) / (len(values) - 1)
     return math.sqrt(variance)
 
 
@@ -167,36 +162,30 @@ def calculateParameterStatistics(
             details={'parameter': parameterName, 'profileId': profileId}
         )
 
-    # Basic statistics
-    maxValue = max(values)
-    minValue = min(values)
-    avgValue = calculateMean(values)
-    modeValue = calculateMode(values)
-    sampleCount = len(values)
+    # One kernel pass: min/max/mean/mode + sample std dev
+    stats = summarize(values)
+    sampleCount = stats.count
 
-    # Standard deviation and outliers (requires at least minSamples points)
+    # Standard deviation and outliers (requires at least minSamples points;
+    # the kernel leaves stdDev None below 2)
     std1 = None
     std2 = None
     outlierMin = None
     outlierMax = None
 
-    if sampleCount >= minSamples:
-        try:
-            std1 = calculateStandardDeviation(values, avgValue)
-            std2 = std1 * 2
-            outlierMin, outlierMax = calculateOutlierBounds(avgValue, std1)
-        except (InsufficientDataError, ZeroDivisionError):
-            # Keep as None if calculation fails
-            pass
+    if sampleCount >= minSamples and stats.stdDev is not None:
+        std1 = stats.stdDev
+        std2 = std1 * 2
+        outlierMin, outlierMax = calculateOutlierBounds(stats.mean, std1)
 
     return ParameterStatistics(
         parameterName=parameterName,
         analysisDate=analysisDate,
         profileId=profileId,
-        maxValue=maxValue,
-        minValue=minValue,
-        avgValue=avgValue,
-        modeValue=modeValue,
+        maxValue=stats.maximum,
+        minValue=stats.minimum,
+        avgValue=stats.mean,
+        modeValue=stats.mode,
         std1=std1,
         std2=std2,
         outlierMin=outlierMin,
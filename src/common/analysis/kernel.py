@@ -0,0 +1,354 @@
+################################################################################
+# File Name: kernel.py
+# Purpose/Description: Array-backed descriptive statistics kernel shared by the
+#                      server analytics and the Pi analysis tier.  Vectorized
+#                      NumPy path, pure-Python fallback, identical results.
+# Author: Rex
+# Creation Date: 2026-10-16
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-16    | Rex          | Initial
+# ================================================================================
+################################################################################
+
+"""
+Descriptive statistics kernel.
+
+One implementation of count / min / max / mean / standard deviation / mode /
+percentiles behind :func:`src.server.analytics.helpers.computeBasicStats`,
+:func:`calculateParameterStatistics` and the calibration comparator.
+
+Inputs are float buffers: ``list``, ``array('d')``, ``memoryview`` or a
+NumPy array.  :func:`summarizeColumns` takes many parameters at once and,
+with NumPy, packs them into one contiguous float64 buffer so min / max,
+deviations, sorting and mode bucketing run as single vectorized passes.
+
+Both backends return bit-identical results:
+
+- sums are exactly rounded (``math.fsum``) -- the mean is ``fsum(x) / n``,
+  the same value ``statistics.fmean`` gives -- so summation order cannot
+  differ between backends;
+- the variance is the two-pass ``fsum((x - mean)**2) / (n - ddof)``; the
+  elementwise IEEE operations are the same in NumPy and Python;
+- the mode buckets by ``round(value, precision)`` with the first-seen
+  tie-break of ``Counter.most_common`` (NumPy rounding that could differ
+  from Python's correctly rounded ``round`` near a tie is redone in Python);
+- percentiles interpolate linearly between order statistics (NumPy's
+  default ``linear`` method) with one shared formula.
+
+Buffers are expected to hold finite values; NaN propagates differently
+through Python's ``min`` / ``max`` / ``sorted`` than through NumPy.
+
+NumPy is optional: without it (the Pi image does not ship it) the pure
+Python backend runs.  Pass ``backend='python'`` or ``'numpy'`` to force one.
+
+Usage:
+    stats = summarize(values, percentiles=(50, 95))
+    byParam = summarizeColumns({'RPM': rpmBuffer, 'SPEED': speedBuffer})
+"""
+
+import math
+from collections import Counter
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from .exceptions import InsufficientDataError
+
+try:  # Optional: vectorized backend when NumPy is installed.
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the deployment
+    np = None
+
+# ================================================================================
+# Constants
+# ================================================================================
+
+#: True when the NumPy backend is importable.
+NUMPY_AVAILABLE: bool = np is not None
+
+BACKEND_NUMPY: str = 'numpy'
+BACKEND_PYTHON: str = 'python'
+
+#: Mode grouping precision; matches calculateMode's default.
+DEFAULT_MODE_PRECISION: int = 2
+
+# Scaled values closer than this (relative) to a .5 rounding boundary are
+# re-rounded with Python's round() on the NumPy path.
+_TIE_TOLERANCE: float = 1e-12
+
+# ================================================================================
+# Result type
+# ================================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class SummaryStats:
+    """Descriptive statistics of one float buffer."""
+
+    count: int
+    minimum: float
+    maximum: float
+    mean: float
+    stdDev: float | None
+    """``None`` when ``count <= ddof``."""
+    mode: float | None = None
+    """``None`` when mode was not requested."""
+    percentiles: dict[float, float] = field(default_factory=dict)
+
+    def outlierBounds(self, multiplier: float = 2.0) -> tuple[float, float] | None:
+        """``(mean - k*std, mean + k*std)``, or ``None`` without a std dev."""
+        if self.stdDev is None:
+            return None
+        return (
+            self.mean - multiplier * self.stdDev,
+            self.mean + multiplier * self.stdDev,
+        )
+
+
+# ================================================================================
+# Public API
+# ================================================================================
+
+
+def summarize(
+    values: Any,
+    *,
+    ddof: int = 1,
+    modePrecision: int | None = DEFAULT_MODE_PRECISION,
+    percentiles: Sequence[float] = (),
+    backend: str | None = None,
+) -> SummaryStats:
+    """
+    Summarize one float buffer.
+
+    Args:
+        values: Float buffer (list, ``array('d')``, memoryview, ndarray).
+        ddof: Delta degrees of freedom -- 1 for the sample std dev, 0 for
+            the population std dev.
+        modePrecision: Decimal places for mode bucketing; ``None`` skips
+            the mode.
+        percentiles: Percentiles (0-100) to compute.
+        backend: ``'numpy'``, ``'python'`` or ``None`` (NumPy if available).
+
+    Returns:
+        SummaryStats of the buffer.
+
+    Raises:
+        InsufficientDataError: If ``values`` is empty.
+        ValueError: On an unknown or unavailable backend, or a percentile
+            outside 0-100.
+    """
+    result = summarizeColumns(
+        {None: values},
+        ddof=ddof,
+        modePrecision=modePrecision,
+        percentiles=percentiles,
+        backend=backend,
+    )
+    if None not in result:
+        raise InsufficientDataError("Cannot summarize an empty buffer")
+    return result[None]
+
+
+def summarizeColumns(
+    columns: Mapping[Any, Any],
+    *,
+    ddof: int = 1,
+    modePrecision: int | None = DEFAULT_MODE_PRECISION,
+    percentiles: Sequence[float] = (),
+    backend: str | None = None,
+) -> dict[Any, SummaryStats]:
+    """
+    Summarize many float buffers (one per parameter) in one batch.
+
+    Args:
+        columns: Key (e.g. parameter name) -> float buffer.  Empty buffers
+            are left out of the result.
+        ddof: See :func:`summarize`.
+        modePrecision: See :func:`summarize`.
+        percentiles: See :func:`summarize`.
+        backend: See :func:`summarize`.
+
+    Returns:
+        Key -> SummaryStats, in ``columns`` order.
+    """
+    for q in percentiles:
+        if not 0.0 <= q <= 100.0:
+            raise ValueError(f"Percentile must be within 0-100, got {q!r}")
+    if _resolveBackend(backend) == BACKEND_NUMPY:
+        return _summarizeNumpy(columns, ddof, modePrecision, percentiles)
+    return {
+        key: _summarizePython(list(values), ddof, modePrecision, percentiles)
+        for key, values in columns.items()
+        if len(values)
+    }
+
+
+def sumOfSquaredDeviations(
+    values: Any, center: float, *, backend: str | None = None,
+) -> float:
+    """Exactly rounded ``sum((x - center)**2)`` over a float buffer."""
+    if _resolveBackend(backend) == BACKEND_NUMPY:
+        deviations = np.asarray(values, dtype=np.float64) - center
+        return math.fsum((deviations * deviations).tolist())
+    return math.fsum([(v - center) * (v - center) for v in values])
+
+
+# ================================================================================
+# Pure-Python backend
+# ================================================================================
+
+
+def _summarizePython(
+    values: list[float],
+    ddof: int,
+    modePrecision: int | None,
+    percentiles: Sequence[float],
+) -> SummaryStats:
+    count = len(values)
+    mean = math.fsum(values) / count
+    mode = None
+    if modePrecision is not None:
+        mode = Counter(round(v, modePrecision) for v in values).most_common(1)[0][0]
+    ordered = sorted(values) if percentiles else []
+    return SummaryStats(
+        count=count,
+        minimum=min(values),
+        maximum=max(values),
+        mean=mean,
+        stdDev=_stdDev(sumOfSquaredDeviations(values, mean, backend=BACKEND_PYTHON),
+                       count, ddof),
+        mode=mode,
+        percentiles={q: _interpolate(ordered, q) for q in percentiles},
+    )
+
+
+# ================================================================================
+# NumPy backend
+# ================================================================================
+
+
+def _summarizeNumpy(
+    columns: Mapping[Any, Any],
+    ddof: int,
+    modePrecision: int | None,
+    percentiles: Sequence[float],
+) -> dict[Any, SummaryStats]:
+    keys: list[Any] = []
+    arrays = []
+    for key, values in columns.items():
+        array = np.asarray(values, dtype=np.float64).ravel()
+        if array.size:
+            keys.append(key)
+            arrays.append(array)
+    if not arrays:
+        return {}
+
+    # One contiguous buffer; column i is buffer[starts[i]:ends[i]].
+    counts = np.fromiter((a.size for a in arrays), dtype=np.intp, count=len(arrays))
+    buffer = np.concatenate(arrays)
+    ends = np.cumsum(counts)
+    starts = ends - counts
+
+    minima = np.minimum.reduceat(buffer, starts).tolist()
+    maxima = np.maximum.reduceat(buffer, starts).tolist()
+    bounds = list(zip(starts.tolist(), ends.tolist(), strict=True))
+    means = [math.fsum(buffer[s:e].tolist()) / (e - s) for s, e in bounds]
+    deviations = buffer - np.repeat(np.asarray(means), counts)
+    squares = deviations * deviations
+    sumsOfSquares = [math.fsum(squares[s:e].tolist()) for s, e in bounds]
+
+    modes: list[float | None] = [None] * len(keys)
+    if modePrecision is not None:
+        rounded = _roundLikePython(buffer, modePrecision)
+        modes = [_modeOfSegment(rounded[s:e]) for s, e in bounds]
+
+    ordered = None
+    if percentiles:
+        segmentIds = np.repeat(np.arange(len(keys)), counts)
+        ordered = buffer[np.lexsort((buffer, segmentIds))]
+
+    return {
+        key: SummaryStats(
+            count=e - s,
+            minimum=minima[i],
+            maximum=maxima[i],
+            mean=means[i],
+            stdDev=_stdDev(sumsOfSquares[i], e - s, ddof),
+            mode=modes[i],
+            percentiles=(
+                {q: _interpolate(ordered[s:e], q) for q in percentiles}
+                if ordered is not None else {}
+            ),
+        )
+        for i, (key, (s, e)) in enumerate(zip(keys, bounds, strict=True))
+    }
+
+
+def _roundLikePython(values: Any, precision: int) -> Any:
+    """Vectorized ``round(v, precision)``, bit-identical to Python's."""
+    if precision >= 0:
+        scale = 10.0 ** precision
+        scaled = values * scale
+        result = np.rint(scaled) / scale
+    else:
+        scale = 10.0 ** -precision
+        scaled = values / scale
+        result = np.rint(scaled) * scale
+    # rint(fl(x * scale)) only differs from Python's correctly rounded
+    # decimal rounding when the product landed next to a .5 boundary.
+    with np.errstate(invalid='ignore'):
+        distance = np.abs(scaled - np.floor(scaled) - 0.5)
+        suspect = ~(distance > _TIE_TOLERANCE * (1.0 + np.abs(scaled)))
+    if suspect.any():
+        result[suspect] = [round(v, precision) for v in values[suspect].tolist()]
+    return result
+
+
+def _modeOfSegment(rounded: Any) -> float:
+    """Most common key; ties go to the key seen first (Counter semantics)."""
+    _, firstIndex, counts = np.unique(rounded, return_index=True, return_counts=True)
+    candidates = np.flatnonzero(counts == counts.max())
+    first = int(firstIndex[candidates].min())
+    return float(rounded[first])
+
+
+# ================================================================================
+# Shared helpers
+# ================================================================================
+
+
+def _resolveBackend(backend: str | None) -> str:
+    if backend is None:
+        return BACKEND_NUMPY if NUMPY_AVAILABLE else BACKEND_PYTHON
+    if backend == BACKEND_PYTHON:
+        return backend
+    if backend == BACKEND_NUMPY:
+        if not NUMPY_AVAILABLE:
+            raise ValueError("NumPy backend requested but numpy is not installed")
+        return backend
+    raise ValueError(
+        f"Unknown backend {backend!r}; expected {BACKEND_NUMPY!r} or {BACKEND_PYTHON!r}"
+    )
+
+
+def _stdDev(sumOfSquares: float, count: int, ddof: int) -> float | None:
+    if count <= ddof:
+        return None
+    return math.sqrt(sumOfSquares / (count - ddof))
+
+
+def _interpolate(ordered: Sequence[float], q: float) -> float:
+    """Linear interpolation between the order statistics around ``q``."""
+    count = len(ordered)
+    position = (count - 1) * (q / 100.0)
+    lower = math.floor(position)
+    upper = min(lower + 1, count - 1)
+    low = float(ordered[lower])
+    high = float(ordered[upper])
+    return low + (high - low) * (position - lower)
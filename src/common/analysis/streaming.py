@@ -0,0 +1,242 @@
+################################################################################
+# File Name: streaming.py
+# Purpose/Description: Online (single-pass, mergeable) statistics accumulator
+# Author: Rex
+# Creation Date: 2026-10-16
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-16    | Rex          | Initial -- Welford mean/variance, min/max and
+#                               a bucketed mode histogram.
+# ================================================================================
+################################################################################
+
+"""
+Online statistics accumulator.
+
+:class:`OnlineStatistics` produces the same :class:`ParameterStatistics` as
+:func:`calculateParameterStatistics` without holding the sample list:
+
+- mean / sample variance via Welford's update, merged with Chan et al.'s
+  parallel formula,
+- exact min / max,
+- mode from a histogram keyed by ``round(value, precision)`` -- the same
+  grouping :func:`calculateMode` uses, including its first-seen tie-break.
+  When the histogram grows past ``maxBuckets`` distinct keys the precision
+  drops one decimal place (``round`` accepts negative precision), so memory
+  stays bounded and the mode degrades to a coarser bucket instead of
+  failing.
+
+Accumulators serialize to a small JSON-friendly dict (:meth:`toState`) so a
+caller can persist a running baseline and merge new samples into it.
+
+Usage:
+    acc = OnlineStatistics()
+    for value in values:
+        acc.add(value)
+    stats = acc.toParameterStatistics('RPM', 'daily', analysisDate)
+"""
+
+import math
+from datetime import datetime
+from typing import Any
+
+from .calculations import calculateOutlierBounds
+from .exceptions import InsufficientDataError
+from .types import ParameterStatistics
+
+# ================================================================================
+# Constants
+# ================================================================================
+
+#: Mode grouping precision; matches calculateMode's default.
+DEFAULT_MODE_PRECISION: int = 2
+
+#: Distinct histogram keys kept before the mode precision is coarsened.
+DEFAULT_MAX_MODE_BUCKETS: int = 2048
+
+
+class OnlineStatistics:
+    """
+    Single-pass, mergeable statistics for one parameter.
+
+    Attributes:
+        count: Samples added
+        mean: Running mean
+        m2: Sum of squared deviations from the mean
+        minValue: Smallest sample (None when empty)
+        maxValue: Largest sample (None when empty)
+        precision: Current mode grouping precision (decimal places)
+        maxBuckets: Histogram size that triggers coarsening
+    """
+
+    def __init__(
+        self,
+        precision: int = DEFAULT_MODE_PRECISION,
+        maxBuckets: int = DEFAULT_MAX_MODE_BUCKETS,
+    ):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minValue: float | None = None
+        self.maxValue: float | None = None
+        self.precision = precision
+        self.maxBuckets = max(1, int(maxBuckets))
+        self._histogram: dict[float, int] = {}
+
+    def add(self, value: float) -> None:
+        """Add one sample."""
+        value = float(value)
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if self.minValue is None or value < self.minValue:
+            self.minValue = value
+        if self.maxValue is None or value > self.maxValue:
+            self.maxValue = value
+        key = round(value, self.precision)
+        self._histogram[key] = self._histogram.get(key, 0) + 1
+        if len(self._histogram) > self.maxBuckets:
+            self._coarsen()
+
+    def merge(self, other: 'OnlineStatistics') -> None:
+        """
+        Fold ``other`` into this accumulator.
+
+        ``other``'s samples are treated as arriving after this one's, so the
+        mode tie-break stays first-seen.
+        """
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.mean = other.mean
+            self.m2 = other.m2
+        else:
+            total = self.count + other.count
+            delta = other.mean - self.mean
+            self.mean += delta * other.count / total
+            self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count += other.count
+        if self.minValue is None or (other.minValue is not None and other.minValue < self.minValue):
+            self.minValue = other.minValue
+        if self.maxValue is None or (other.maxValue is not None and other.maxValue > self.maxValue):
+            self.maxValue = other.maxValue
+
+        precision = min(self.precision, other.precision)
+        while self.precision > precision:
+            self._coarsen()
+        for key, count in other._histogram.items():
+            if other.precision != precision:
+                key = round(key, precision)
+            self._histogram[key] = self._histogram.get(key, 0) + count
+        while len(self._histogram) > self.maxBuckets:
+            self._coarsen()
+
+    @property
+    def modeValue(self) -> float | None:
+        """Most common bucket (first seen wins ties), or None when empty."""
+        if not self._histogram:
+            return None
+        return max(self._histogram.items(), key=lambda item: item[1])[0]
+
+    def standardDeviation(self) -> float:
+        """
+        Sample standard deviation (n-1).
+
+        Raises:
+            InsufficientDataError: If fewer than 2 samples were added
+        """
+        if self.count < 2:
+            raise InsufficientDataError(
+                "Cannot calculate standard deviation with fewer than 2 values"
+            )
+        return math.sqrt(max(0.0, self.m2) / (self.count - 1))
+
+    def toParameterStatistics(
+        self,
+        parameterName: str,
+        profileId: str,
+        analysisDate: datetime,
+        minSamples: int = 2,
+    ) -> ParameterStatistics:
+        """
+        Finalize into the same shape :func:`calculateParameterStatistics` returns.
+
+        Raises:
+            InsufficientDataError: If no samples were added
+        """
+        if self.count == 0:
+            raise InsufficientDataError(
+                f"No data for parameter '{parameterName}'",
+                details={'parameter': parameterName, 'profileId': profileId}
+            )
+
+        std1 = None
+        std2 = None
+        outlierMin = None
+        outlierMax = None
+        if self.count >= minSamples:
+            try:
+                std1 = self.standardDeviation()
+                std2 = std1 * 2
+                outlierMin, outlierMax = calculateOutlierBounds(self.mean, std1)
+            except InsufficientDataError:
+                pass
+
+        return ParameterStatistics(
+            parameterName=parameterName,
+            analysisDate=analysisDate,
+            profileId=profileId,
+            maxValue=self.maxValue,
+            minValue=self.minValue,
+            avgValue=self.mean,
+            modeValue=self.modeValue,
+            std1=std1,
+            std2=std2,
+            outlierMin=outlierMin,
+            outlierMax=outlierMax,
+            sampleCount=self.count
+        )
+
+    def toState(self) -> dict[str, Any]:
+        """Serialize to a JSON-friendly dict (histogram in first-seen order)."""
+        return {
+            'count': self.count,
+            'mean': self.mean,
+            'm2': self.m2,
+            'min': self.minValue,
+            'max': self.maxValue,
+            'precision': self.precision,
+            'histogram': [[key, count] for key, count in self._histogram.items()],
+        }
+
+    @classmethod
+    def fromState(
+        cls,
+        state: dict[str, Any],
+        maxBuckets: int = DEFAULT_MAX_MODE_BUCKETS,
+    ) -> 'OnlineStatistics':
+        """Rebuild an accumulator from :meth:`toState` output."""
+        acc = cls(precision=int(state.get('precision', DEFAULT_MODE_PRECISION)),
+                  maxBuckets=maxBuckets)
+        acc.count = int(state.get('count', 0))
+        acc.mean = float(state.get('mean', 0.0))
+        acc.m2 = float(state.get('m2', 0.0))
+        acc.minValue = state.get('min')
+        acc.maxValue = state.get('max')
+        for key, count in state.get('histogram', []):
+            acc._histogram[float(key)] = int(count)
+        return acc
+
+    def _coarsen(self) -> None:
+        """Drop one decimal of mode precision, merging buckets in first-seen order."""
+        self.precision -= 1
+        merged: dict[float, int] = {}
+        for key, count in self._histogram.items():
+            newKey = round(key, self.precision)
+            merged[newKey] = merged.get(newKey, 0) + count
+        self._histogram = merged
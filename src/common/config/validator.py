@@ -73,6 +73,26 @@
 #                                + _validatePowerWatch (the stated alias death
 #                                date now that __main__/controller consume the
 #                                canonical smoothing* names).
+# 2026-10-16    | Rex          | Add pi.realtimeData.batchWriter.* DEFAULTS
+#                                (write-behind realtime_data batching).
+# 2026-10-16    | Rex          | Add pi.realtimeData.schedulerMode DEFAULT.
+# 2026-10-16    | Rex          | Add pi.realtimeData.multiPidQueries DEFAULT.
+# 2026-10-16    | Rex          | Add pi.obdii.orchestrator.readingBus.*
+#                                DEFAULTS (reading fan-out bus).
+# 2026-10-16    | Rex          | Add pi.realtimeData.storageFormat DEFAULT.
+# 2026-10-16    | Rex          | Add pi.analysis.streamingStatistics DEFAULT.
+# 2026-10-16    | Rex          | Add pi.companionService.bulkPush.* DEFAULTS +
+#                                compression / byte-budget validation.
+# 2026-10-16    | Rex          | Add pi.companionService.bulkPush.wireFormat
+#                                ('json' | 'columnar') DEFAULT + validation.
+# 2026-10-17    | Rex          | Add server.ai.responseCache.* DEFAULTS (LLM
+#                                response cache).
+# 2026-10-17    | Rex          | Add pi.display.liveSnapshot.* DEFAULTS
+#                                (shared-memory latest-value block).
+# 2026-10-17    | Rex          | Add pi.database.eventLog.* DEFAULTS (shared
+#                                alert / connection / power event writer).
+# 2026-10-17    | Rex          | pi.realtimeData.schedulerMode defaults to
+#                                'flat' (tiered is opt-in).
 # ================================================================================
 ################################################################################
 
@@ -218,6 +238,15 @@ DEFAULTS: dict[str, Any] = {
     'pi.companionService.batchSize': 500,
     'pi.companionService.retryMaxAttempts': 3,
     'pi.companionService.retryBackoffSeconds': [1, 2, 4, 8, 16],
+    # Bulk push: pack several tables' deltas into one compressed request up
+    # to maxBatchBytes of JSON (keep below the server's MAX_SYNC_PAYLOAD_MB).
+    # compression is 'gzip', 'zstd' (needs the zstandard package on both
+    # ends; falls back to gzip on the Pi when missing) or 'none'.
+    'pi.companionService.bulkPush.enabled': True,
+    'pi.companionService.bulkPush.compression': 'gzip',
+    'pi.companionService.bulkPush.maxBatchBytes': 4194304,
+    'pi.companionService.bulkPush.maxRequestsPerSweep': 50,
+    'pi.companionService.bulkPush.wireFormat': 'json',
     # Pi-tier home-network detection (US-188, B-043 component 1).  Consumed
     # by src.pi.network.HomeNetworkDetector to decide at shutdown time
     # whether the Pi should attempt a sync push before powering off.
@@ -232,6 +261,42 @@ DEFAULTS: dict[str, Any] = {
     'pi.sync.enabled': True,
     'pi.sync.intervalSeconds': 60,
     'pi.sync.triggerOn': ['interval', 'drive_end'],
+    # Auxiliary event rows (alert_log, connection_log, power_log) share one
+    # low-priority write-behind queue attached to the database; flushed on
+    # maxBatchRows / maxBatchAgeMs, before every shutdown-stage row, and at
+    # shutdown.  Disabled -> each row opens its own connection.
+    'pi.database.eventLog.enabled': True,
+    'pi.database.eventLog.maxBatchRows': 100,
+    'pi.database.eventLog.maxBatchAgeMs': 5000,
+    'pi.database.eventLog.maxQueueRows': 2000,
+    # Realtime capture write-behind batching.  The polling thread queues
+    # stamped realtime_data rows; one long-lived connection commits them
+    # in a single executemany transaction when maxBatchRows are queued or
+    # the oldest row is maxBatchAgeMs old (also at drive_end + shutdown).
+    # maxQueueRows bounds memory if the SD card stalls -- overflow rows
+    # are dropped and counted, never blocking the capture loop.
+    'pi.realtimeData.batchWriter.enabled': True,
+    'pi.realtimeData.batchWriter.maxBatchRows': 50,
+    'pi.realtimeData.batchWriter.maxBatchAgeMs': 2000,
+    'pi.realtimeData.batchWriter.maxQueueRows': 5000,
+    # Realtime scheduler: 'flat' polls every logged PID every cycle.
+    # 'tiered' polls per pi.pollingTiers and is opt-in: a logged PID that no
+    # tier lists is polled at the slowest tier's rate, so turn it on only
+    # with every logged parameter placed in a tier.
+    'pi.realtimeData.schedulerMode': 'flat',
+    # Multi-PID Mode 01 requests (up to 6 PIDs per round-trip); the
+    # connection falls back to single-PID queries if the ECU rejects them.
+    'pi.realtimeData.multiPidQueries': True,
+    # realtime_data storage: 'rows' (one row per sample) or 'frames' (one
+    # realtime_frames row per poll cycle, read through realtime_samples).
+    'pi.realtimeData.storageFormat': 'rows',
+    # Post-drive statistics from live accumulators merged into a persisted
+    # per-profile baseline (statistics_accumulators) instead of rescanning
+    # every realtime_data row.  False == legacy full-history rescan.
+    # Retention cleanup that deletes rows drops the baseline (rebuilt at the
+    # next analysis), at most once per pi.dataRetention.baselineResetIntervalDays;
+    # a collector crash mid-drive leaves that drive out of the baseline until then.
+    'pi.analysis.streamingStatistics': True,
     # Pi-tier orchestrator engine-on escalation (US-242 / B-049).  When the
     # adapter-level BATTERY_V sample exceeds engineOnVoltageThreshold for
     # engineOnSampleCount consecutive samples, the orchestrator transitions
@@ -253,6 +318,16 @@ DEFAULTS: dict[str, Any] = {
     # runLoop tolerates a not-yet-connected state, US-226 interval sync
     # fires regardless, and the existing US-211 reconnect path takes over.
     'pi.obdii.orchestrator.initialConnectTimeoutSec': 30,
+    # Reading fan-out bus.  Display / drive detector / alert delivery runs
+    # on per-subscriber dispatch threads instead of the polling thread.
+    # The display buffer keeps only the newest value per parameter
+    # (latestCapacity keys); drive detector and alerts are lossless FIFOs
+    # (losslessCapacity readings) -- when one is full the publisher waits
+    # up to publishTimeoutMs, then drops and counts the reading.
+    'pi.obdii.orchestrator.readingBus.enabled': True,
+    'pi.obdii.orchestrator.readingBus.latestCapacity': 64,
+    'pi.obdii.orchestrator.readingBus.losslessCapacity': 1024,
+    'pi.obdii.orchestrator.readingBus.publishTimeoutMs': 50,
     # Pi self-update (B-047 US-C / US-247).  Update-check policy lives here;
     # the transport (server URL + API key) is reused from
     # pi.companionService.  intervalMinutes is the runLoop-side cadence;
@@ -289,6 +364,12 @@ DEFAULTS: dict[str, Any] = {
     'pi.display.displayCanvas.width': 1920,
     'pi.display.displayCanvas.height': 1080,
     'pi.display.displayCanvas.mode': 'auto',
+    # Shared-memory latest-value block the orchestrator publishes for peer
+    # display processes (render_primary_screen_live.py --from-snapshot);
+    # lives on tmpfs so frame-rate reads never touch SQLite or the SD card.
+    'pi.display.liveSnapshot.enabled': True,
+    'pi.display.liveSnapshot.path': '/dev/shm/eclipse-obd-live.snap',
+    'pi.display.liveSnapshot.capacity': 64,
     # US-290 / TD-007: generateTimeoutSeconds closes the lone holdout from
     # US-OLL-002 (which made apiTimeoutSeconds + healthTimeoutSeconds
     # configurable but left the 120 s model-inference timeout hardcoded in
@@ -298,6 +379,12 @@ DEFAULTS: dict[str, Any] = {
     # OLLAMA_GENERATE_TIMEOUT in types.py remains the back-compat fallback
     # when this key is absent.
     'server.ai.generateTimeoutSeconds': 120,
+    # Ollama replies cached by hash of (model, prompt); an identical
+    # re-analysis is replayed instead of regenerated.
+    'server.ai.responseCache.enabled': True,
+    'server.ai.responseCache.path': './data/llm_response_cache.db',
+    'server.ai.responseCache.ttlHours': 168,
+    'server.ai.responseCache.maxEntries': 500,
     'hardware.telemetry.logInterval': 10,
     'hardware.telemetry.logPath': '/var/log/carpi/telemetry.log',
     'hardware.telemetry.maxBytes': 104857600,
@@ -461,6 +548,35 @@ class ConfigValidator:
                 missingFields=['pi.companionService.retryBackoffSeconds'],
             )
 
+        bulkPush = section.get('bulkPush')
+        if isinstance(bulkPush, dict):
+            compression = bulkPush.get('compression')
+            if compression is not None and compression not in ('gzip', 'zstd', 'none'):
+                raise ConfigValidationError(
+                    f"pi.companionService.bulkPush.compression must be one of "
+                    f"'gzip', 'zstd', 'none' (got {compression!r})",
+                    missingFields=['pi.companionService.bulkPush.compression'],
+                )
+            wireFormat = bulkPush.get('wireFormat')
+            if wireFormat is not None and wireFormat not in ('json', 'columnar'):
+                raise ConfigValidationError(
+                    f"pi.companionService.bulkPush.wireFormat must be 'json' or "
+                    f"'columnar' (got {wireFormat!r})",
+                    missingFields=['pi.companionService.bulkPush.wireFormat'],
+                )
+            for key in ('maxBatchBytes', 'maxRequestsPerSweep'):
+                value = bulkPush.get(key)
+                if value is not None and (
+                    isinstance(value, bool)
+                    or not isinstance(value, int)
+                    or value < 1
+                ):
+                    raise ConfigValidationError(
+                        f"pi.companionService.bulkPush.{key} must be an "
+                        f"integer >= 1 (got {value!r})",
+                        missingFields=[f'pi.companionService.bulkPush.{key}'],
+                    )
+
     def _validateHomeNetwork(self, config: dict[str, Any]) -> None:
         """Validate pi.homeNetwork shape + CIDR + numeric ranges (US-188).
 
@@ -9,4 +9,8 @@ types will be defined in a dedicated post-reorg task, once the Pi has actually
 connected to the OBD-II Bluetooth dongle and we have real data to design against.
 Defining contract types against hypothetical data shapes would bake in
 assumptions that reality will contradict.
+
+``realtime_columnar`` is the exception: the columnar binary encoding of
+``realtime_data`` sync payloads, encoded by the Pi sync client and decoded
+by the server sync route.
 """
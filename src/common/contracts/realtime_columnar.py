@@ -0,0 +1,397 @@
+################################################################################
+# File Name: realtime_columnar.py
+# Purpose/Description: Columnar binary encoding of realtime_data rows for the
+#                      POST /api/v1/sync wire (shared Pi encoder / server
+#                      decoder).
+# Author: Rex
+# Creation Date: 2026-10-16
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-16    | Rex          | Initial -- format version 1.
+# 2026-10-17    | Rex          | Epoch column built by _epochColumn (typed
+#               |              | list, None on a non-canonical timestamp).
+# ================================================================================
+################################################################################
+
+"""
+Columnar sync body for ``realtime_data``.
+
+A JSON sync body repeats ``parameter_name``, ``unit``, ``profile_id``,
+``data_source`` and a full ISO timestamp on every ``realtime_data`` row, and
+the server then builds (and pydantic-validates) one dict per row.  This
+format sends the realtime table as columns instead; every other table stays
+JSON inside the same request.  It is negotiated by ``Content-Type``
+(:data:`CONTENT_TYPE`) and may additionally carry a ``Content-Encoding``.
+
+Layout (all integers little-endian)::
+
+    b"OBDC"  u8 version  u32 headerLength  header(JSON, UTF-8)  column blocks
+
+``header`` is the ordinary sync envelope (``deviceId``, ``batchId``,
+``tables`` for JSON tables, optional ``driveCounter``) plus::
+
+    "columnar": {"realtime_data": {
+        "lastSyncedId": 3965, "rowCount": N,
+        "timestampMode": "epoch" | "strings",
+        "timestamps": [...],                      # "strings" mode only
+        "dictionaries": {"parameter_name": [...], "unit": [...],
+                         "profile_id": [...], "data_source": [...]}}}
+
+followed, per columnar table in header order, by these blocks of N items:
+
+=============== ========== ==============================================
+``id``          int64      delta-encoded (first value absolute)
+``timestamp``   int64      delta-encoded epoch seconds ("epoch" mode only)
+``value``       float64    packed
+string columns  int32 x 4  dictionary indices, ``-1`` = NULL
+``drive_id``    int64      :data:`NULL_INT64` = NULL
+=============== ========== ==============================================
+
+``"epoch"`` mode requires every timestamp in the canonical
+``YYYY-MM-DDTHH:MM:SSZ`` form (:mod:`src.common.time.helper`); otherwise
+the encoder falls back to ``"strings"`` and the timestamps ride in the
+header unchanged.  Decoding yields :class:`ColumnarTable` -- plain column
+lists, no per-row dicts.
+
+Stdlib only (:mod:`array`, :mod:`struct`) so the Pi needs no new packages.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import struct
+import sys
+from array import array
+from calendar import timegm
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from itertools import accumulate
+from typing import Any
+
+from src.common.time.helper import CANONICAL_ISO_FORMAT, CANONICAL_ISO_REGEX
+
+__all__ = [
+    'COLUMNAR_TABLES',
+    'CONTENT_TYPE',
+    'ROW_BYTES',
+    'ColumnarDecodeError',
+    'ColumnarTable',
+    'decodeSyncBody',
+    'encodeColumnar',
+    'encodeSyncBody',
+    'isColumnarRow',
+    'packSyncBody',
+    'rowBytes',
+]
+
+# ================================================================================
+# Constants
+# ================================================================================
+
+#: Content-Type of a columnar sync body.
+CONTENT_TYPE: str = 'application/vnd.eclipse-obd.sync-columnar'
+
+#: Tables that may be sent in columnar form.
+COLUMNAR_TABLES: frozenset[str] = frozenset({'realtime_data'})
+
+FORMAT_VERSION: int = 1
+MAGIC: bytes = b'OBDC'
+
+#: Columns of a realtime_data row, in Pi schema order.
+REALTIME_COLUMNS: tuple[str, ...] = (
+    'id', 'timestamp', 'parameter_name', 'value', 'unit',
+    'profile_id', 'data_source', 'drive_id',
+)
+
+#: Dictionary-encoded string columns, in block order.
+STRING_COLUMNS: tuple[str, ...] = ('parameter_name', 'unit', 'profile_id', 'data_source')
+
+#: Fixed-width bytes per row in "epoch" mode (id, timestamp, value, four
+#: dictionary indices, drive_id).  Used by the Pi for byte budgeting.
+ROW_BYTES: int = 8 + 8 + 8 + 4 * len(STRING_COLUMNS) + 8
+
+#: NULL sentinel for ``drive_id``.
+NULL_INT64: int = -(2 ** 63)
+
+_PREAMBLE = struct.Struct('<4sBI')
+_CANONICAL_RE = re.compile(CANONICAL_ISO_REGEX)
+_ALLOWED_KEYS = frozenset(REALTIME_COLUMNS)
+
+
+class ColumnarDecodeError(ValueError):
+    """Raised when a columnar body is malformed."""
+
+
+@dataclass(slots=True)
+class ColumnarTable:
+    """One decoded columnar table.
+
+    Attributes:
+        lastSyncedId: Pi cursor the rows were read after (informational).
+        columns: Column name -> list of values, every list ``rowCount`` long.
+            ``timestamp`` holds tz-aware UTC datetimes ("epoch" mode) or the
+            Pi's original strings ("strings" mode).
+    """
+
+    lastSyncedId: int
+    columns: dict[str, list[Any]]
+
+    @property
+    def rowCount(self) -> int:
+        return len(self.columns['id'])
+
+    @property
+    def rows(self) -> list[dict[str, Any]]:
+        """Materialize per-row dicts (diagnostics / tests; not the hot path)."""
+        names = list(self.columns)
+        return [
+            dict(zip(names, values, strict=True))
+            for values in zip(*self.columns.values(), strict=True)
+        ]
+
+
+# ================================================================================
+# Encoding (Pi)
+# ================================================================================
+
+def isColumnarRow(row: dict[str, Any]) -> bool:
+    """True when ``row`` can travel in the columnar block unchanged."""
+    if not _ALLOWED_KEYS.issuperset(row):
+        return False
+    pk = row.get('id')
+    value = row.get('value')
+    driveId = row.get('drive_id')
+    return (
+        isinstance(pk, int) and not isinstance(pk, bool)
+        and isinstance(value, (int, float)) and not isinstance(value, bool)
+        and (driveId is None or (isinstance(driveId, int) and not isinstance(driveId, bool)))
+        and isinstance(row.get('timestamp'), str)
+        and all(row.get(name) is None or isinstance(row[name], str) for name in STRING_COLUMNS)
+    )
+
+
+def _littleEndian(values: array) -> bytes:
+    if sys.byteorder != 'little':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _deltas(values: list[int]) -> array:
+    out = array('q', values)
+    for index in range(len(out) - 1, 0, -1):
+        out[index] -= out[index - 1]
+    return out
+
+
+def _epochColumn(rows: list[dict[str, Any]]) -> list[int] | None:
+    """Epoch seconds per row, or None if any timestamp is not canonical."""
+    epochByTimestamp: dict[str, int] = {}
+    epochs: list[int] = []
+    for row in rows:
+        timestamp = row['timestamp']
+        epoch = epochByTimestamp.get(timestamp)
+        if epoch is None:
+            if not _CANONICAL_RE.match(timestamp):
+                return None
+            epoch = epochByTimestamp[timestamp] = timegm(
+                datetime.strptime(timestamp, CANONICAL_ISO_FORMAT).timetuple()
+            )
+        epochs.append(epoch)
+    return epochs
+
+
+def _encodeTable(rows: list[dict[str, Any]]) -> tuple[dict[str, Any], bytes]:
+    epochs = _epochColumn(rows)
+    meta: dict[str, Any] = {'rowCount': len(rows), 'dictionaries': {}}
+    blocks = [_littleEndian(_deltas([row['id'] for row in rows]))]
+    if epochs is None:
+        meta['timestampMode'] = 'strings'
+        meta['timestamps'] = [row['timestamp'] for row in rows]
+    else:
+        meta['timestampMode'] = 'epoch'
+        blocks.append(_littleEndian(_deltas(epochs)))
+    blocks.append(_littleEndian(array('d', [float(row['value']) for row in rows])))
+    for name in STRING_COLUMNS:
+        dictionary: dict[str, int] = {}
+        indices = array('i', [
+            -1 if (text := row.get(name)) is None
+            else dictionary.setdefault(text, len(dictionary))
+            for row in rows
+        ])
+        meta['dictionaries'][name] = list(dictionary)
+        blocks.append(_littleEndian(indices))
+    blocks.append(_littleEndian(array('q', [
+        NULL_INT64 if row.get('drive_id') is None else row['drive_id']
+        for row in rows
+    ])))
+    return meta, b''.join(blocks)
+
+
+def rowBytes(row: dict[str, Any]) -> int:
+    """Approximate encoded size of one row, for byte budgeting."""
+    timestamp = row.get('timestamp')
+    if isinstance(timestamp, str) and _CANONICAL_RE.match(timestamp):
+        return ROW_BYTES
+    return ROW_BYTES - 8 + len(str(timestamp)) + 3  # JSON string in the header
+
+
+def encodeColumnar(
+    columnar: dict[str, tuple[int, list[dict[str, Any]]]],
+) -> tuple[dict[str, Any], bytes]:
+    """Encode tables to (header ``columnar`` section, concatenated blocks).
+
+    Args:
+        columnar: ``{tableName: (lastSyncedId, rows)}``; every row must pass
+            :func:`isColumnarRow`.
+
+    Raises:
+        ValueError: If a table is not in :data:`COLUMNAR_TABLES`.
+    """
+    section: dict[str, Any] = {}
+    blocks: list[bytes] = []
+    for tableName, (lastSyncedId, rows) in columnar.items():
+        if tableName not in COLUMNAR_TABLES:
+            raise ValueError(f"{tableName} has no columnar encoding")
+        meta, block = _encodeTable(rows)
+        meta['lastSyncedId'] = int(lastSyncedId)
+        section[tableName] = meta
+        blocks.append(block)
+    return section, b''.join(blocks)
+
+
+def packSyncBody(header: bytes, blocks: bytes) -> bytes:
+    """Frame an already-serialized JSON header (including ``columnar``)."""
+    return _PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(header)) + header + blocks
+
+
+def encodeSyncBody(
+    envelope: dict[str, Any],
+    columnar: dict[str, tuple[int, list[dict[str, Any]]]],
+) -> bytes:
+    """Build a columnar sync body.
+
+    Args:
+        envelope: The JSON part -- ``deviceId``, ``batchId``, ``tables``
+            (non-columnar tables, already in wire shape) and optionally
+            ``driveCounter``.
+        columnar: See :func:`encodeColumnar`.
+    """
+    section, blocks = encodeColumnar(columnar)
+    header = {**envelope, 'columnar': section}
+    return packSyncBody(
+        json.dumps(header, default=str, separators=(',', ':')).encode(), blocks,
+    )
+
+
+# ================================================================================
+# Decoding (server)
+# ================================================================================
+
+class _Reader:
+    def __init__(self, body: bytes, offset: int):
+        self._view = memoryview(body)
+        self._offset = offset
+
+    def take(self, typecode: str, count: int) -> array:
+        values = array(typecode)
+        size = values.itemsize * count
+        if self._offset + size > len(self._view):
+            raise ColumnarDecodeError("columnar body truncated")
+        values.frombytes(self._view[self._offset:self._offset + size])
+        self._offset += size
+        if sys.byteorder != 'little':
+            values.byteswap()
+        return values
+
+    @property
+    def exhausted(self) -> bool:
+        return self._offset == len(self._view)
+
+
+def _decodeTable(meta: dict[str, Any], reader: _Reader) -> ColumnarTable:
+    try:
+        rowCount = int(meta['rowCount'])
+        mode = meta['timestampMode']
+        dictionaries = meta['dictionaries']
+        lastSyncedId = int(meta.get('lastSyncedId', 0))
+    except (KeyError, TypeError, ValueError) as exc:
+        raise ColumnarDecodeError(f"invalid columnar table header: {exc}") from exc
+    if rowCount < 0 or mode not in ('epoch', 'strings'):
+        raise ColumnarDecodeError("invalid columnar table header")
+
+    columns: dict[str, list[Any]] = {'id': list(accumulate(reader.take('q', rowCount)))}
+    if mode == 'epoch':
+        columns['timestamp'] = [
+            datetime.fromtimestamp(epoch, UTC)
+            for epoch in accumulate(reader.take('q', rowCount))
+        ]
+    else:
+        timestamps = meta.get('timestamps')
+        if not isinstance(timestamps, list) or len(timestamps) != rowCount:
+            raise ColumnarDecodeError("timestamps list does not match rowCount")
+        columns['timestamp'] = timestamps
+    columns['value'] = reader.take('d', rowCount).tolist()
+    for name in STRING_COLUMNS:
+        dictionary = dictionaries.get(name) if isinstance(dictionaries, dict) else None
+        if not isinstance(dictionary, list):
+            raise ColumnarDecodeError(f"missing dictionary for {name}")
+        indices = reader.take('i', rowCount)
+        if indices and (min(indices) < -1 or max(indices) >= len(dictionary)):
+            raise ColumnarDecodeError(f"dictionary index out of range for {name}")
+        lookup = [*dictionary, None]  # index -1 -> None
+        columns[name] = [lookup[index] for index in indices]
+    columns['drive_id'] = [
+        None if driveId == NULL_INT64 else driveId
+        for driveId in reader.take('q', rowCount)
+    ]
+    return ColumnarTable(lastSyncedId=lastSyncedId, columns=columns)
+
+
+def decodeSyncBody(body: bytes) -> tuple[dict[str, Any], dict[str, ColumnarTable]]:
+    """Split a columnar body into its JSON envelope and decoded tables.
+
+    Returns:
+        ``(envelope, tables)`` -- ``envelope`` is the header without the
+        ``columnar`` key (validate it like a JSON body); ``tables`` maps
+        table name to :class:`ColumnarTable`.
+
+    Raises:
+        ColumnarDecodeError: Bad magic / version, truncated or trailing
+            bytes, malformed header, or out-of-range dictionary indices.
+    """
+    if len(body) < _PREAMBLE.size:
+        raise ColumnarDecodeError("columnar body truncated")
+    magic, version, headerLength = _PREAMBLE.unpack_from(body)
+    if magic != MAGIC:
+        raise ColumnarDecodeError("not a columnar sync body")
+    if version != FORMAT_VERSION:
+        raise ColumnarDecodeError(f"unsupported columnar format version {version}")
+    headerEnd = _PREAMBLE.size + headerLength
+    try:
+        header = json.loads(body[_PREAMBLE.size:headerEnd])
+    except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise ColumnarDecodeError(f"invalid columnar header: {exc}") from exc
+    if not isinstance(header, dict):
+        raise ColumnarDecodeError("columnar header must be an object")
+
+    columnarMeta = header.pop('columnar', {})
+    if not isinstance(columnarMeta, dict):
+        raise ColumnarDecodeError("columnar section must be an object")
+    unknown = set(columnarMeta) - COLUMNAR_TABLES
+    if unknown:
+        raise ColumnarDecodeError(f"no columnar encoding for {sorted(unknown)}")
+
+    reader = _Reader(body, headerEnd)
+    tables = {
+        tableName: _decodeTable(meta, reader)
+        for tableName, meta in columnarMeta.items()
+    }
+    if not reader.exhausted:
+        raise ColumnarDecodeError("trailing bytes after columnar blocks")
+    return header, tables
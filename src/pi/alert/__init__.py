@@ -11,6 +11,7 @@
 # ================================================================================
 # 2026-01-22    | Ralph Agent  | Initial subpackage creation (US-001)
 # 2026-01-22    | Ralph Agent  | Added all exports (US-011)
+# 2026-10-17    | Rex          | Export AlertCondition, CompiledRuleSet, RuleHit
 # ================================================================================
 ################################################################################
 """
@@ -60,6 +61,9 @@ from .iat_thresholds import (
 # Manager class
 from .manager import AlertManager
 
+# Compiled rule set (parameter dispatch, hysteresis, multi-parameter conditions)
+from .rule_engine import CompiledRuleSet, RuleHit
+
 # Tiered threshold evaluation
 from .tiered_thresholds import (
     AlertSeverity,
@@ -91,6 +95,7 @@ from .types import (
     DEFAULT_COOLDOWN_SECONDS,
     MIN_COOLDOWN_SECONDS,
     PARAMETER_ALERT_TYPES,
+    AlertCondition,
     AlertDirection,
     AlertEvent,
     AlertState,
@@ -103,6 +108,7 @@ __all__ = [
     'AlertDirection',
     'AlertState',
     # Types - dataclasses
+    'AlertCondition',
     'AlertThreshold',
     'AlertEvent',
     'AlertStats',
@@ -121,6 +127,9 @@ __all__ = [
     'AlertDatabaseError',
     # Manager class
     'AlertManager',
+    # Compiled rules
+    'CompiledRuleSet',
+    'RuleHit',
     # Helper functions
     'createAlertManagerFromConfig',
     'isAlertingEnabled',
@@ -16,6 +16,16 @@
 #                               alert_log timestamp through utcIsoNow so stored
 #                               rows are canonical ISO-8601 UTC irrespective of
 #                               AlertEvent.timestamp's tz-awareness.
+# 2026-10-17    | Rex          | Thresholds compiled into a per-profile
+#                               CompiledRuleSet (parameter dispatch, flat
+#                               cooldown state); checkFrame evaluates a whole
+#                               cycle under one lock acquisition and alert
+#                               side effects run outside the lock.
+# 2026-10-17    | Rex          | alert_log rows go through writeEventRow (the
+#                               shared event log writer when running).
+# 2026-10-17    | Rex          | Cooldowns are global again: one alert type ->
+#                               last-fired dict shared by every profile's
+#                               rule set, so a profile switch keeps them.
 # ================================================================================
 ################################################################################
 """
@@ -32,6 +42,11 @@ Features:
 - Alert cooldown to prevent spam
 - Visual alert integration with DisplayManager
 - Database logging of all alert events
+
+Thresholds are compiled per profile into a
+:class:`~pi.alert.rule_engine.CompiledRuleSet`, so a reading only touches
+the rules for its own parameter; a whole polling cycle can be checked with
+one :meth:`AlertManager.checkFrame` call.
 """
 
 import logging
@@ -43,6 +58,7 @@ from typing import Any
 from src.common.time.helper import utcIsoNow
 
 from .exceptions import AlertConfigurationError
+from .rule_engine import CompiledRuleSet, RuleHit
 from .types import (
     ALERT_PRIORITIES,
     ALERT_TYPE_COOLANT_TEMP_CRITICAL,
@@ -114,15 +130,17 @@ class AlertManager:
         self._visualAlerts = visualAlerts
         self._logAlerts = logAlerts
 
-        # Thresholds by profile
+        # Thresholds by profile, and their compiled dispatch form
         self._profileThresholds: dict[str, list[AlertThreshold]] = {}
+        self._ruleSets: dict[str, CompiledRuleSet] = {}
+
+        # Cooldown tracking (alertType -> monotonic last-fired time), shared
+        # by every profile's rule set
+        self._lastAlertTimes: dict[str, float] = {}
 
         # Active profile
         self._activeProfileId: str | None = None
 
-        # Cooldown tracking: {alert_type: last_alert_timestamp}
-        self._lastAlertTimes: dict[str, datetime] = {}
-
         # State
         self._state = AlertState.STOPPED
         self._stats = AlertStats()
@@ -259,6 +277,9 @@ class AlertManager:
 
         for profileId in profileIds:
             self._profileThresholds[profileId] = list(thresholds)
+            self._ruleSets[profileId] = CompiledRuleSet(
+                thresholds, cooldowns=self._lastAlertTimes,
+            )
 
         logger.info(
             "setThresholdsFromConfig: built %d thresholds for %d profile(s) from tiered config",
@@ -346,31 +367,8 @@ class AlertManager:
         Returns:
             AlertEvent if alert was triggered, None otherwise
         """
-        with self._lock:
-            self._stats.totalChecks += 1
-
-            if not self._enabled or self._state != AlertState.RUNNING:
-                return None
-
-            # Use specified profile or fall back to active profile
-            effectiveProfileId = profileId or self._activeProfileId
-            if not effectiveProfileId:
-                return None
-
-            # Get thresholds for this profile
-            thresholds = self._profileThresholds.get(effectiveProfileId, [])
-
-            # Check each threshold that matches this parameter
-            for threshold in thresholds:
-                if threshold.parameterName != parameterName:
-                    continue
-
-                if threshold.checkValue(value):
-                    return self._handleThresholdExceeded(
-                        threshold, value, effectiveProfileId
-                    )
-
-            return None
+        events = self.checkFrame({parameterName: value}, profileId)
+        return events[0] if events else None
 
     def checkValues(
         self,
@@ -387,68 +385,105 @@ class AlertManager:
         Returns:
             List of AlertEvent objects for triggered alerts
         """
-        alerts = []
-        for parameterName, value in values.items():
-            alert = self.checkValue(parameterName, value, profileId)
-            if alert:
-                alerts.append(alert)
-        return alerts
+        return self.checkFrame(values, profileId)
 
-    def _handleThresholdExceeded(
+    def checkFrame(
         self,
-        threshold: AlertThreshold,
-        value: float,
-        profileId: str
-    ) -> AlertEvent | None:
+        values: dict[str, float],
+        profileId: str | None = None
+    ) -> list[AlertEvent]:
         """
-        Handle a threshold being exceeded.
+        Check one polling cycle's values in a single evaluation.
+
+        Multi-parameter conditions see every value in the frame.  Display,
+        database and callback side effects run after the lock is released.
 
         Args:
-            threshold: The exceeded threshold
-            value: The value that exceeded it
+            values: Dictionary of parameter names to values
+            profileId: Profile ID (uses active profile if not specified)
+
+        Returns:
+            List of AlertEvent objects for triggered alerts
+        """
+        with self._lock:
+            self._stats.totalChecks += len(values)
+
+            if not self._enabled or self._state != AlertState.RUNNING:
+                return []
+
+            # Use specified profile or fall back to active profile
+            effectiveProfileId = profileId or self._activeProfileId
+            if not effectiveProfileId:
+                return []
+
+            ruleSet = self._ruleSets.get(effectiveProfileId)
+            if ruleSet is None:
+                return []
+
+            hits = ruleSet.evaluateFrame(values, self._cooldownSeconds)
+            events = [
+                self._recordHit(hit, effectiveProfileId)
+                for hit in hits
+            ]
+
+        triggered = []
+        for hit, event in zip(hits, events, strict=True):
+            if event is not None:
+                self._dispatchAlert(hit.threshold, event)
+                triggered.append(event)
+        return triggered
+
+    def _recordHit(self, hit: RuleHit, profileId: str) -> AlertEvent | None:
+        """
+        Update stats for an exceeded threshold.  Caller holds ``_lock``.
+
+        Args:
+            hit: Exceeded threshold from the compiled rule set
             profileId: Active profile ID
 
         Returns:
             AlertEvent if alert was triggered (not in cooldown)
         """
-        # Check cooldown
-        now = datetime.now()
-        lastAlertTime = self._lastAlertTimes.get(threshold.alertType)
-
-        if lastAlertTime:
-            elapsed = (now - lastAlertTime).total_seconds()
-            if elapsed < self._cooldownSeconds:
-                self._stats.alertsSuppressed += 1
-                logger.debug(
-                    f"Alert suppressed (cooldown): {threshold.alertType}, "
-                    f"elapsed={elapsed:.1f}s, cooldown={self._cooldownSeconds}s"
-                )
-                return None
+        threshold = hit.threshold
+        if hit.suppressed:
+            self._stats.alertsSuppressed += 1
+            logger.debug(
+                f"Alert suppressed (cooldown): {threshold.alertType}, "
+                f"elapsed={hit.cooldownElapsed:.1f}s, cooldown={self._cooldownSeconds}s"
+            )
+            return None
 
-        # Create alert event
+        now = datetime.now()
         event = AlertEvent(
             alertType=threshold.alertType,
             parameterName=threshold.parameterName,
-            value=value,
+            value=hit.value,
             threshold=threshold.threshold,
             profileId=profileId,
             timestamp=now,
         )
 
-        # Update tracking
-        self._lastAlertTimes[threshold.alertType] = now
         self._stats.alertsTriggered += 1
         self._stats.alertsByType[threshold.alertType] = \
             self._stats.alertsByType.get(threshold.alertType, 0) + 1
         self._stats.lastAlertTime = now
+        return event
 
+    def _dispatchAlert(self, threshold: AlertThreshold, event: AlertEvent) -> None:
+        """
+        Log, display, persist and broadcast a triggered alert.
+
+        Args:
+            threshold: The exceeded threshold
+            event: The alert event
+        """
         logger.warning(
-            f"ALERT: {threshold.message} - actual value: {value}"
+            f"ALERT: {threshold.message} - actual value: {event.value}"
         )
 
         # Show visual alert
         if self._visualAlerts and self._displayManager:
-            self._showVisualAlert(threshold, value)
+            self._showVisualAlert(threshold, event.value)
 
         # Log to database
         if self._logAlerts and self._database:
@@ -457,8 +492,6 @@ class AlertManager:
         # Trigger callbacks
         self._triggerCallbacks(event)
 
-        return event
-
     def _showVisualAlert(
         self,
         threshold: AlertThreshold,
@@ -491,32 +524,33 @@ class AlertManager:
             # US-200: lazy import to dodge the pi.obdii <-> pi.alert package
             # cycle that trips when obdii/__init__.py imports the alert
             # package during its own module initialization.
+            from src.pi.obdii.data.event_log_writer import writeEventRow
             from src.pi.obdii.drive_id import getCurrentDriveId
 
-            with self._database.connect() as conn:
-                cursor = conn.cursor()
-                # TD-027 / US-203: canonical ISO-8601 UTC via the shared helper.
-                # event.timestamp comes from AlertEvent.__post_init__ which
-                # uses naive datetime.now() -- capture rows must be UTC
-                # canonical so they match the schema DEFAULT format.
-                cursor.execute(
-                    """
-                    INSERT INTO alert_log
-                    (timestamp, alert_type, parameter_name, value, threshold,
-                     profile_id, drive_id)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        utcIsoNow(),
-                        event.alertType,
-                        event.parameterName,
-                        event.value,
-                        event.threshold,
-                        event.profileId,
-                        getCurrentDriveId(),
-                    )
-                )
-                logger.debug(f"Alert logged to database: {event.alertType}")
+            # TD-027 / US-203: canonical ISO-8601 UTC via the shared helper.
+            # event.timestamp comes from AlertEvent.__post_init__ which
+            # uses naive datetime.now() -- capture rows must be UTC
+            # canonical so they match the schema DEFAULT format.  Stamped
+            # here, not at flush, when the event log writer queues the row.
+            writeEventRow(
+                self._database,
+                """
+                INSERT INTO alert_log
+                (timestamp, alert_type, parameter_name, value, threshold,
+                 profile_id, drive_id)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    utcIsoNow(),
+                    event.alertType,
+                    event.parameterName,
+                    event.value,
+                    event.threshold,
+                    event.profileId,
+                    getCurrentDriveId(),
+                ),
+            )
+            logger.debug(f"Alert logged to database: {event.alertType}")
         except Exception as e:
             logger.error(f"Failed to log alert to database: {e}")
 
@@ -0,0 +1,250 @@
+################################################################################
+# File Name: rule_engine.py
+# Purpose/Description: Compiled alert rules -- parameter -> rule dispatch table,
+#                      flat latch / cooldown state, whole-frame evaluation with
+#                      multi-parameter predicates and hysteresis.
+# Author: Rex
+# Creation Date: 2026-10-17
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-17    | Rex          | Initial
+# 2026-10-17    | Rex          | Cooldowns keyed by alert type in a dict the
+#               |              | owner can share across rule sets, so they
+#               |              | survive a profile switch as before.
+# ================================================================================
+################################################################################
+"""
+Compiled alert rule set.
+
+``AlertManager`` used to scan the active profile's whole threshold list for
+every reading.  :class:`CompiledRuleSet` is built once when thresholds load
+and turns that list into:
+
+- a parameter -> slot index and a slot -> rule-indices dispatch table, so a
+  reading only touches the rules whose primary parameter it is;
+- flat per-rule lists (threshold, clear point, direction, condition slots,
+  hysteresis latch), so evaluation is list indexing rather than attribute
+  lookups and dict scans;
+- a latest-value list per slot, which is what multi-parameter conditions
+  (:class:`~pi.alert.types.AlertCondition`) read.
+
+A frame (``{parameter: value}`` for one polling cycle, or a single reading)
+is evaluated in one call.  Per-frame cost is proportional to the rules
+attached to the parameters in the frame, not to the size of the rule set.
+
+Semantics match the linear scan it replaces: per primary parameter, the
+first exceeded rule (in threshold-list order) is the one reported, and it
+fires unless its alert type is in cooldown.  Cooldown times live in an
+alert type -> last-fired dict that ``AlertManager`` shares between every
+profile's rule set, so switching profiles does not reset them.  Rules are triggered by their
+primary parameter only; conditions are read from the latest values, and a
+condition on a parameter never seen is false.  With ``clearThreshold`` set,
+an exceeded rule stays exceeded until the value crosses back past the clear
+point.
+
+This module holds no lock; the owner serializes calls.
+"""
+
+import math
+import time
+from collections.abc import Callable, Mapping, Sequence
+from typing import NamedTuple
+
+from .exceptions import AlertConfigurationError
+from .types import AlertDirection, AlertThreshold
+
+# ================================================================================
+# Types
+# ================================================================================
+
+
+class RuleHit(NamedTuple):
+    """One exceeded rule from :meth:`CompiledRuleSet.evaluateFrame`."""
+
+    threshold: AlertThreshold
+    value: float
+    suppressed: bool  # alert type still in cooldown
+    cooldownElapsed: float | None  # seconds since that type last fired
+
+
+# ================================================================================
+# Compiled rule set
+# ================================================================================
+
+
+class CompiledRuleSet:
+    """
+    Dispatch-table form of one profile's thresholds.
+
+    Args:
+        thresholds: Thresholds in priority (evaluation) order.
+        clock: Monotonic seconds for cooldowns (tests).
+        cooldowns: Alert type -> last-fired clock time.  Pass the same dict
+            to several rule sets to share cooldowns; a private one by
+            default.
+
+    Raises:
+        AlertConfigurationError: If a clearThreshold sits on the wrong side
+            of its threshold.
+    """
+
+    def __init__(
+        self,
+        thresholds: Sequence[AlertThreshold],
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        cooldowns: dict[str, float] | None = None,
+    ) -> None:
+        self._clock = clock
+        self._lastFiredAt: dict[str, float] = {} if cooldowns is None else cooldowns
+        self.rules: tuple[AlertThreshold, ...] = tuple(thresholds)
+
+        self._slotOf: dict[str, int] = {}
+        self._dispatch: list[list[int]] = []
+
+        # Flat per-rule state, indexed by rule position.
+        self._primarySlot: list[int] = []
+        self._threshold: list[float] = []
+        self._clear: list[float] = []
+        self._above: list[bool] = []
+        self._conditions: list[tuple[tuple[int, float, bool], ...]] = []
+        self._alertType: list[str] = []
+        self._latched: list[bool] = []
+
+        for index, rule in enumerate(self.rules):
+            above = rule.direction == AlertDirection.ABOVE
+            clear = rule.threshold if rule.clearThreshold is None else rule.clearThreshold
+            if (above and clear > rule.threshold) or (not above and clear < rule.threshold):
+                raise AlertConfigurationError(
+                    f"clearThreshold {clear} is on the wrong side of "
+                    f"{rule.direction.value} threshold {rule.threshold}",
+                    details={'alertType': rule.alertType},
+                )
+            slot = self._slot(rule.parameterName)
+            self._dispatch[slot].append(index)
+            self._primarySlot.append(slot)
+            self._threshold.append(float(rule.threshold))
+            self._clear.append(float(clear))
+            self._above.append(above)
+            self._conditions.append(tuple(
+                (
+                    self._slot(c.parameterName),
+                    float(c.threshold),
+                    c.direction == AlertDirection.ABOVE,
+                )
+                for c in rule.conditions
+            ))
+            self._alertType.append(rule.alertType)
+            self._latched.append(False)
+
+        self._values: list[float] = [math.nan] * len(self._slotOf)
+        self.ruleEvaluations = 0
+
+    def _slot(self, parameterName: str) -> int:
+        slot = self._slotOf.get(parameterName)
+        if slot is None:
+            slot = len(self._slotOf)
+            self._slotOf[parameterName] = slot
+            self._dispatch.append([])
+        return slot
+
+    # ================================================================================
+    # Evaluation
+    # ================================================================================
+
+    def evaluateFrame(
+        self,
+        values: Mapping[str, float],
+        cooldownSeconds: float,
+    ) -> list[RuleHit]:
+        """
+        Evaluate every rule triggered by the parameters in ``values``.
+
+        All values are stored before any rule runs, so conditions see the
+        whole frame.  A rule that is reported (not suppressed) starts its
+        alert type's cooldown.
+
+        Args:
+            values: Parameter name -> value for one cycle (or one reading).
+            cooldownSeconds: Minimum seconds between alerts of one type.
+
+        Returns:
+            At most one hit per primary parameter in the frame.
+        """
+        slotOf = self._slotOf
+        latest = self._values
+        triggered: list[tuple[int, float]] = []
+        for name, value in values.items():
+            slot = slotOf.get(name)
+            if slot is None or value is None:
+                continue
+            value = float(value)
+            latest[slot] = value
+            if self._dispatch[slot]:
+                triggered.append((slot, value))
+
+        hits: list[RuleHit] = []
+        if not triggered:
+            return hits
+        now = self._clock()
+        threshold, clear, above = self._threshold, self._clear, self._above
+        conditions, latched = self._conditions, self._latched
+        for slot, value in triggered:
+            matched = -1
+            for index in self._dispatch[slot]:
+                self.ruleEvaluations += 1
+                limit = clear[index] if latched[index] else threshold[index]
+                exceeded = value > limit if above[index] else value < limit
+                latched[index] = exceeded
+                if not exceeded or matched >= 0:
+                    continue
+                for condSlot, condLimit, condAbove in conditions[index]:
+                    other = latest[condSlot]
+                    # NaN (never seen) fails both comparisons.
+                    if not (other > condLimit if condAbove else other < condLimit):
+                        break
+                else:
+                    matched = index
+            if matched < 0:
+                continue
+
+            alertType = self._alertType[matched]
+            lastFired = self._lastFiredAt.get(alertType)
+            elapsed = None if lastFired is None else now - lastFired
+            suppressed = elapsed is not None and elapsed < cooldownSeconds
+            if not suppressed:
+                self._lastFiredAt[alertType] = now
+            hits.append(RuleHit(self.rules[matched], value, suppressed, elapsed))
+        return hits
+
+    # ================================================================================
+    # State
+    # ================================================================================
+
+    def clearCooldowns(self) -> None:
+        """Forget when each alert type last fired (in every sharing set)."""
+        self._lastFiredAt.clear()
+
+    def reset(self) -> None:
+        """Clear cooldowns, hysteresis latches and latest values."""
+        self.clearCooldowns()
+        self._latched = [False] * len(self._latched)
+        self._values = [math.nan] * len(self._values)
+
+    @property
+    def parameterNames(self) -> tuple[str, ...]:
+        """Parameters referenced by any rule, primary or condition."""
+        return tuple(self._slotOf)
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+
+__all__ = [
+    'CompiledRuleSet',
+    'RuleHit',
+]
@@ -11,6 +11,9 @@
 # ================================================================================
 # 2026-01-22    | Ralph Agent  | Initial implementation for US-011
 # 2026-04-14    | Ralph Agent  | Sweep 2b — delete THRESHOLD_KEY_TO_PARAMETER constant
+# 2026-10-17    | Rex          | AlertCondition; AlertThreshold gains
+#               |              | clearThreshold (hysteresis) and conditions
+#               |              | (multi-parameter predicates) for rule_engine
 # ================================================================================
 ################################################################################
 """
@@ -82,6 +85,39 @@ class AlertState(Enum):
 # Data Classes
 # ================================================================================
 
+@dataclass(frozen=True)
+class AlertCondition:
+    """
+    Extra predicate on another parameter that must also hold for a threshold.
+
+    Evaluated against the latest value seen for ``parameterName`` (e.g. an
+    RPM threshold that only applies while ENGINE_LOAD is above 60%).
+
+    Attributes:
+        parameterName: OBD-II parameter name (e.g., 'ENGINE_LOAD')
+        threshold: Threshold value
+        direction: Direction of comparison (ABOVE or BELOW)
+    """
+
+    parameterName: str
+    threshold: float
+    direction: AlertDirection
+
+    def checkValue(self, value: float) -> bool:
+        """True when ``value`` satisfies the condition."""
+        if self.direction == AlertDirection.ABOVE:
+            return value > self.threshold
+        return value < self.threshold
+
+    def toDict(self) -> dict[str, Any]:
+        """Convert to dictionary for logging/serialization."""
+        return {
+            'parameterName': self.parameterName,
+            'threshold': self.threshold,
+            'direction': self.direction.value,
+        }
+
+
 @dataclass
 class AlertThreshold:
     """
@@ -94,6 +130,10 @@ class AlertThreshold:
         direction: Direction of comparison (ABOVE or BELOW)
         priority: Alert priority (1-5, 1 is highest)
         message: Alert message template
+        clearThreshold: Hysteresis -- once exceeded, the threshold stays
+            exceeded until the value crosses back past this point (None:
+            no hysteresis)
+        conditions: Predicates on other parameters that must also hold
     """
 
     parameterName: str
@@ -102,6 +142,8 @@ class AlertThreshold:
     direction: AlertDirection
     priority: int = 3
     message: str = ""
+    clearThreshold: float | None = None
+    conditions: tuple[AlertCondition, ...] = ()
 
     def __post_init__(self) -> None:
         """Set default message if not provided."""
@@ -135,6 +177,8 @@ class AlertThreshold:
             'direction': self.direction.value,
             'priority': self.priority,
             'message': self.message,
+            'clearThreshold': self.clearThreshold,
+            'conditions': [c.toDict() for c in self.conditions],
         }
 
 
@@ -14,6 +14,15 @@
 #                               the statistics INSERT writes canonical ISO-8601
 #                               UTC via toCanonicalIso.  All stats rows in one
 #                               analysis run share the same canonical date.
+# 2026-10-16    | Rex          | _fetchParameterData reads realtime_samples
+#                               (legacy rows + cycle frames) when present.
+# 2026-10-16    | Rex          | Streaming statistics: recordSample() feeds live
+#                               accumulators; whole-history analysis merges
+#                               them into the persisted baseline instead of
+#                               rescanning realtime_data.
+# 2026-10-17    | Rex          | stop() persists pending live samples; rebuild
+#                               drops live samples already in the raw rows;
+#                               baseline drift documented.
 # ================================================================================
 ################################################################################
 
@@ -53,9 +62,12 @@ from common.analysis.exceptions import (
     StatisticsCalculationError,
     StatisticsStorageError,
 )
+from common.analysis.streaming import OnlineStatistics
 from common.analysis.types import AnalysisResult, AnalysisState, EngineStats, ParameterStatistics
 from src.common.time.helper import toCanonicalIso
 
+from .streaming import StreamingStatistics, deleteAccumulators, rebuildAccumulators
+
 logger = logging.getLogger(__name__)
 
 
@@ -78,6 +90,18 @@ class StatisticsEngine:
     - Callback support for analysis events
     - Minimum sample requirements
 
+    With ``pi.analysis.streamingStatistics`` on, whole-history statistics
+    come from a persisted per-profile baseline plus the live samples fed
+    through :meth:`recordSample`.  The baseline is kept in step with
+    ``realtime_data`` as follows:
+
+    - retention cleanup that deletes rows drops the baseline, and the next
+      analysis rebuilds it from the kept rows;
+    - :meth:`stop` (orchestrator shutdown) merges pending live samples;
+    - a crash before drive end loses that drive's live samples from the
+      baseline (the rows themselves are stored) until the next rebuild --
+      the next deleting cleanup or :meth:`rebuildStreamingStatistics`.
+
     Attributes:
         database: ObdDatabase instance for data access
         config: Configuration dictionary with 'analysis' section
@@ -123,6 +147,12 @@ class StatisticsEngine:
             ['max', 'min', 'avg', 'mode', 'std_1', 'std_2', 'outlier_min', 'outlier_max']
         )
 
+        # Streaming statistics: live accumulators + persisted baseline.
+        # None == every analysis rescans the profile's raw rows.
+        self._streaming: StreamingStatistics | None = None
+        if analysisConfig.get('streamingStatistics', False):
+            self._streaming = StreamingStatistics(database)
+
         # State management
         self._state = AnalysisState.IDLE
         self._lock = threading.Lock()
@@ -252,6 +282,82 @@ class StatisticsEngine:
                 return True
             return False
 
+    @property
+    def isStreaming(self) -> bool:
+        """Check if whole-history analysis uses streaming accumulators."""
+        return self._streaming is not None
+
+    def recordSample(
+        self,
+        profileId: str | None,
+        parameterName: str,
+        value: float
+    ) -> None:
+        """
+        Fold one live reading into the streaming accumulators.
+
+        No-op when streaming statistics are disabled.
+
+        Args:
+            profileId: Profile the reading is logged under (None: active profile)
+            parameterName: Parameter name
+            value: Reading value
+        """
+        if self._streaming is None:
+            return
+        if profileId is None:
+            profileId = self._getActiveProfileId()
+        self._streaming.recordSample(profileId, parameterName, value)
+
+    def rebuildStreamingStatistics(self, profileId: str | None = None) -> int:
+        """
+        Recompute the streaming baseline from raw rows.
+
+        Live samples of the rebuilt profiles are dropped: the raw rows
+        already contain them.
+
+        Args:
+            profileId: Profile to rebuild (None: every profile)
+
+        Returns:
+            Number of (profile, parameter) accumulators written
+        """
+        with self.database.connect() as conn:
+            rebuilt = rebuildAccumulators(conn, profileId)
+        if self._streaming is not None:
+            self._streaming.discardLive(profileId)
+        return sum(len(accumulators) for accumulators in rebuilt.values())
+
+    def resetStreamingStatistics(self, profileId: str | None = None) -> int:
+        """
+        Drop the streaming baseline so the next analysis rebuilds it.
+
+        Args:
+            profileId: Profile to reset (None: every profile)
+
+        Returns:
+            Number of baseline rows deleted
+        """
+        with self.database.connect() as conn:
+            return deleteAccumulators(conn, profileId)
+
+    def stop(self) -> None:
+        """
+        Persist pending streaming samples; called at orchestrator shutdown.
+
+        Without this, the live samples of a drive still in progress would
+        be lost from the baseline with the process.
+        """
+        if self._streaming is None:
+            return
+        try:
+            flushed = self._streaming.flushPending()
+        except Exception as e:
+            logger.warning(f"Could not persist pending streaming statistics: {e}")
+            return
+        if flushed:
+            logger.info(f"Persisted pending streaming statistics | profiles={flushed}")
+
     def calculateStatistics(
         self,
         profileId: str | None = None,
@@ -265,6 +371,10 @@ class StatisticsEngine:
         This is a synchronous method that blocks until analysis is complete.
         For background execution, use scheduleAnalysis().
 
+        With streaming statistics enabled and no analysisWindow, the result
+        comes from the live accumulators merged into the persisted baseline
+        rather than a rescan of every raw row.
+
         Args:
             profileId: Profile to analyze (default: active profile from config)
             analysisWindow: Time window of data to analyze (default: all available)
@@ -306,8 +416,13 @@ class StatisticsEngine:
 
             logger.info(f"Starting statistics analysis | profile={profileId}")
 
-            # Get parameter data from database
-            parameterData = self._fetchParameterData(profileId, analysisWindow)
+            # Whole-history analysis: merge the live accumulators into the
+            # persisted baseline (O(parameters)).  Windowed analysis still
+            # needs the raw rows.
+            if self._streaming is not None and analysisWindow is None:
+                parameterData = self._streaming.finalize(profileId)
+            else:
+                parameterData = self._fetchParameterData(profileId, analysisWindow)
 
             if not parameterData:
                 logger.warning(f"No data found for profile '{profileId}'")
@@ -317,13 +432,21 @@ class StatisticsEngine:
                 # Calculate statistics for each parameter
                 for paramName, values in parameterData.items():
                     try:
-                        stats = calculateParameterStatistics(
-                            values=values,
-                            parameterName=paramName,
-                            profileId=profileId,
-                            analysisDate=analysisDate,
-                            minSamples=self.minSamples
-                        )
+                        if isinstance(values, OnlineStatistics):
+                            stats = values.toParameterStatistics(
+                                parameterName=paramName,
+                                profileId=profileId,
+                                analysisDate=analysisDate,
+                                minSamples=self.minSamples
+                            )
+                        else:
+                            stats = calculateParameterStatistics(
+                                values=values,
+                                parameterName=paramName,
+                                profileId=profileId,
+                                analysisDate=analysisDate,
+                                minSamples=self.minSamples
+                            )
                         result.parameterStats[paramName] = stats
                         result.totalSamples += stats.sampleCount
 
@@ -649,26 +772,30 @@ class StatisticsEngine:
         try:
             with self.database.connect() as conn:
                 cursor = conn.cursor()
+                # realtime_samples unions legacy rows with unpacked cycle
+                # frames; hand-built test schemas only have realtime_data.
+                from src.pi.obdii.realtime_frames import realtimeSamplesSource
+                source = realtimeSamplesSource(conn)
 
                 if analysisWindow:
                     startTime = datetime.now() - analysisWindow
                     cursor.execute(
-                        """
+                        f"""
                         SELECT parameter_name, value
-                        FROM realtime_data
+                        FROM {source}
                         WHERE profile_id = ? AND timestamp >= ?
                         ORDER BY parameter_name, timestamp
-                        """,
+                        """,  # noqa: S608 -- source is a fixed identifier
                         (profileId, startTime)
                     )
                 else:
                     cursor.execute(
-                        """
+                        f"""
                         SELECT parameter_name, value
-                        FROM realtime_data
+                        FROM {source}
                         WHERE profile_id = ?
                         ORDER BY parameter_name, timestamp
-                        """,
+                        """,  # noqa: S608 -- source is a fixed identifier
                         (profileId,)
                     )
 
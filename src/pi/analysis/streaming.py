@@ -0,0 +1,299 @@
+################################################################################
+# File Name: streaming.py
+# Purpose/Description: Live per-profile statistics accumulators and their
+#                      persisted baseline (statistics_accumulators)
+# Author: Rex
+# Creation Date: 2026-10-16
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-16    | Rex          | Initial -- O(parameters) post-drive statistics.
+# 2026-10-17    | Rex          | flushPending() for shutdown; discardLive() for
+#                               rebuilds that already counted the live rows.
+# 2026-10-17    | Rex          | Document the retention-reset rescan cost.
+# ================================================================================
+################################################################################
+
+"""
+Streaming statistics for the post-drive analysis.
+
+The ``statistics`` table holds profile-wide statistics over every logged
+sample.  Recomputing them by rescanning ``realtime_data`` makes post-drive
+analysis time and memory grow with history.  Instead:
+
+- :meth:`StreamingStatistics.recordSample` folds each live reading into an
+  in-memory :class:`OnlineStatistics` per (profile, parameter) as the drive
+  runs (fed by ``DriveDetector.processValue``).
+- :meth:`StreamingStatistics.finalize` merges those live accumulators into
+  the persisted per-profile baseline in ``statistics_accumulators`` and
+  returns the merged accumulators -- O(parameters), independent of history.
+- When a profile has no baseline yet (first run, after ``--reset``, or after
+  a retention cleanup deleted rows) the baseline is rebuilt once from raw
+  rows and the live accumulators for that profile are dropped, since the
+  raw rows already contain them.  That rebuild rescans the profile's whole
+  kept history, so retention resets at most once per
+  ``baselineResetIntervalDays`` (see ``DataRetentionManager``).
+
+Live accumulators only reach the baseline at ``finalize`` (drive end) or
+``flushPending`` (orchestrator shutdown).  If the collector dies in between,
+that drive's samples are in ``realtime_data`` but missing from the baseline
+until the next rebuild -- the next retention cleanup that deletes rows, or
+``scripts/rebuild_streaming_statistics.py``.
+
+:func:`rebuildAccumulators` is the offline recompute used by
+``scripts/rebuild_streaming_statistics.py``.
+
+Usage:
+    streaming = StreamingStatistics(database)
+    streaming.recordSample('daily', 'RPM', 2150.0)
+    accumulators = streaming.finalize('daily')
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from typing import Any
+
+from common.analysis.streaming import DEFAULT_MAX_MODE_BUCKETS, OnlineStatistics
+
+logger = logging.getLogger(__name__)
+
+
+# ================================================================================
+# Baseline persistence
+# ================================================================================
+
+def loadAccumulators(
+    conn: sqlite3.Connection,
+    profileId: str,
+    maxBuckets: int = DEFAULT_MAX_MODE_BUCKETS,
+) -> dict[str, OnlineStatistics]:
+    """
+    Load the persisted baseline for a profile.
+
+    Args:
+        conn: Open database connection
+        profileId: Profile to load
+        maxBuckets: Histogram bound applied to the loaded accumulators
+
+    Returns:
+        Parameter name -> accumulator (empty when no baseline exists)
+    """
+    rows = conn.execute(
+        "SELECT parameter_name, state FROM statistics_accumulators "
+        "WHERE profile_id = ?",
+        (profileId,)
+    ).fetchall()
+    return {
+        row[0]: OnlineStatistics.fromState(json.loads(row[1]), maxBuckets=maxBuckets)
+        for row in rows
+    }
+
+
+def saveAccumulators(
+    conn: sqlite3.Connection,
+    profileId: str,
+    accumulators: dict[str, OnlineStatistics],
+) -> None:
+    """Upsert one baseline row per parameter for a profile."""
+    conn.executemany(
+        """
+        INSERT INTO statistics_accumulators
+            (profile_id, parameter_name, state, sample_count, updated_at)
+        VALUES (?, ?, ?, ?, strftime('%Y-%m-%dT%H:%M:%SZ', 'now'))
+        ON CONFLICT (profile_id, parameter_name) DO UPDATE SET
+            state = excluded.state,
+            sample_count = excluded.sample_count,
+            updated_at = excluded.updated_at
+        """,
+        [
+            (profileId, name, json.dumps(acc.toState()), acc.count)
+            for name, acc in accumulators.items()
+        ]
+    )
+
+
+def deleteAccumulators(conn: sqlite3.Connection, profileId: str | None = None) -> int:
+    """
+    Delete baseline rows so the next analysis rebuilds from raw rows.
+
+    Args:
+        conn: Open database connection
+        profileId: Profile to reset (None resets every profile)
+
+    Returns:
+        Number of rows deleted
+    """
+    if profileId is None:
+        cursor = conn.execute("DELETE FROM statistics_accumulators")
+    else:
+        cursor = conn.execute(
+            "DELETE FROM statistics_accumulators WHERE profile_id = ?",
+            (profileId,)
+        )
+    return cursor.rowcount
+
+
+def rebuildAccumulators(
+    conn: sqlite3.Connection,
+    profileId: str | None = None,
+    maxBuckets: int = DEFAULT_MAX_MODE_BUCKETS,
+) -> dict[str, dict[str, OnlineStatistics]]:
+    """
+    Recompute and persist baselines from raw samples.
+
+    Rows stream through the cursor in the same (parameter, timestamp) order
+    the rescan path used, so the mode tie-break matches it.  Existing
+    baseline rows for the rebuilt profiles are replaced.
+
+    Args:
+        conn: Open database connection
+        profileId: Profile to rebuild (None rebuilds every profile with data)
+        maxBuckets: Histogram bound for the rebuilt accumulators
+
+    Returns:
+        Profile id -> parameter name -> accumulator
+    """
+    # Lazy import: pi.obdii's package init pulls in pi.analysis.
+    from src.pi.obdii.realtime_frames import realtimeSamplesSource
+    source = realtimeSamplesSource(conn)
+
+    sql = (
+        f"SELECT profile_id, parameter_name, value FROM {source} "  # noqa: S608 -- fixed identifier
+        "WHERE value IS NOT NULL AND profile_id IS NOT NULL"
+    )
+    params: tuple[Any, ...] = ()
+    if profileId is not None:
+        sql += " AND profile_id = ?"
+        params = (profileId,)
+    sql += " ORDER BY profile_id, parameter_name, timestamp, id"
+
+    rebuilt: dict[str, dict[str, OnlineStatistics]] = {}
+    for rowProfile, name, value in conn.execute(sql, params):
+        accumulators = rebuilt.setdefault(rowProfile, {})
+        acc = accumulators.get(name)
+        if acc is None:
+            acc = accumulators[name] = OnlineStatistics(maxBuckets=maxBuckets)
+        acc.add(value)
+
+    deleteAccumulators(conn, profileId)
+    for rowProfile, accumulators in rebuilt.items():
+        saveAccumulators(conn, rowProfile, accumulators)
+    return rebuilt
+
+
+# ================================================================================
+# Live accumulators
+# ================================================================================
+
+class StreamingStatistics:
+    """
+    Live accumulators merged into a persisted per-profile baseline.
+
+    ``recordSample`` is called from the reading path and only touches memory;
+    ``finalize`` runs on the analysis thread and does the database work.
+    """
+
+    def __init__(self, database: Any, maxBuckets: int = DEFAULT_MAX_MODE_BUCKETS):
+        """
+        Args:
+            database: ObdDatabase instance (``connect()`` context manager)
+            maxBuckets: Distinct mode buckets kept per parameter
+        """
+        self.database = database
+        self.maxBuckets = maxBuckets
+        self._lock = threading.Lock()
+        self._live: dict[str, dict[str, OnlineStatistics]] = {}
+
+    def recordSample(self, profileId: str, parameterName: str, value: float) -> None:
+        """Fold one live reading into the profile's in-memory accumulators."""
+        if value is None:
+            return
+        with self._lock:
+            accumulators = self._live.setdefault(profileId, {})
+            acc = accumulators.get(parameterName)
+            if acc is None:
+                acc = accumulators[parameterName] = OnlineStatistics(
+                    maxBuckets=self.maxBuckets
+                )
+            acc.add(value)
+
+    def discardLive(self, profileId: str | None = None) -> None:
+        """Drop live accumulators (None: every profile) without merging them."""
+        with self._lock:
+            if profileId is None:
+                self._live.clear()
+            else:
+                self._live.pop(profileId, None)
+
+    def flushPending(self) -> int:
+        """
+        Merge every profile's live accumulators into its baseline.
+
+        Returns:
+            Number of profiles flushed
+        """
+        with self._lock:
+            profiles = [profileId for profileId, live in self._live.items() if live]
+        for profileId in profiles:
+            self.finalize(profileId)
+        return len(profiles)
+
+    def pendingSampleCount(self, profileId: str) -> int:
+        """Live samples not yet merged into the baseline."""
+        with self._lock:
+            return sum(acc.count for acc in self._live.get(profileId, {}).values())
+
+    def finalize(self, profileId: str) -> dict[str, OnlineStatistics]:
+        """
+        Merge live accumulators into the baseline, persist, and return it.
+
+        On failure the live accumulators are restored so the next drive's
+        analysis folds them in.
+
+        Args:
+            profileId: Profile being analyzed
+
+        Returns:
+            Parameter name -> accumulator over every sample of the profile
+        """
+        with self._lock:
+            live = self._live.pop(profileId, {})
+
+        try:
+            with self.database.connect() as conn:
+                baseline = loadAccumulators(conn, profileId, self.maxBuckets)
+                if not baseline:
+                    # Raw rows already include this drive's samples.
+                    logger.info(
+                        f"No streaming baseline for profile '{profileId}'; "
+                        "rebuilding from raw samples"
+                    )
+                    return rebuildAccumulators(
+                        conn, profileId, self.maxBuckets
+                    ).get(profileId, {})
+
+                for name, acc in live.items():
+                    if name in baseline:
+                        baseline[name].merge(acc)
+                    else:
+                        baseline[name] = acc
+                if live:
+                    saveAccumulators(conn, profileId, {
+                        name: baseline[name] for name in live
+                    })
+                return baseline
+        except Exception:
+            with self._lock:
+                current = self._live.setdefault(profileId, {})
+                for name, acc in current.items():
+                    if name in live:
+                        live[name].merge(acc)
+                    else:
+                        live[name] = acc
+                self._live[profileId] = live
+            raise
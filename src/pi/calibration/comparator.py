@@ -10,6 +10,9 @@
 # Date          | Author       | Description
 # ================================================================================
 # 2026-01-22    | Ralph Agent  | Refactored from calibration_comparator.py for US-014
+# 2026-10-16    | Rex          | Session std devs from one query + one batched
+#               |              | call into common.analysis.kernel instead of a
+#               |              | connection and query per parameter.
 # ================================================================================
 ################################################################################
 """
@@ -49,13 +52,15 @@ Usage:
 import csv
 import json
 import logging
-import math
 import os
 import time
+from array import array
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from common.analysis.kernel import summarizeColumns
+
 from .exceptions import CalibrationComparisonError
 from .types import (
     SIGNIFICANCE_THRESHOLD,
@@ -254,6 +259,7 @@ class CalibrationComparator:
                 )
 
                 rows = cursor.fetchall()
+                stdDevs = self._calculateStdDevs(conn, sessionId)
 
                 for row in rows:
                     paramName = row['parameter_name'] if hasattr(row, '__getitem__') else row[0]
@@ -262,8 +268,7 @@ class CalibrationComparator:
                     maxVal = row['max_val'] if hasattr(row, '__getitem__') else row[3]
                     avgVal = row['avg_val'] if hasattr(row, '__getitem__') else row[4]
 
-                    # Calculate standard deviation separately
-                    stdDev = self._calculateStdDev(sessionId, paramName, avgVal)
+                    stdDev = stdDevs.get(paramName) if avgVal is not None else None
 
                     stats[paramName] = ParameterSessionStats(
                         parameterName=paramName,
@@ -401,51 +406,38 @@ class CalibrationComparator:
                 details={'sessionIds': sessionIds, 'error': str(e)}
             ) from e
 
-    def _calculateStdDev(
-        self,
-        sessionId: int,
-        parameterName: str,
-        avg: float | None
-    ) -> float | None:
+    def _calculateStdDevs(self, conn: Any, sessionId: int) -> dict[str, float]:
         """
-        Calculate standard deviation for a parameter in a session.
+        Calculate the population standard deviation of every parameter in a session.
 
         Args:
+            conn: Open database connection
             sessionId: Session ID
-            parameterName: Parameter name
-            avg: Pre-calculated average value
 
         Returns:
-            Standard deviation or None if cannot be calculated
+            Parameter name -> standard deviation (0.0 for a single value);
+            empty if the values cannot be read
         """
-        if avg is None:
-            return None
-
         try:
-            with self.database.connect() as conn:
-                cursor = conn.cursor()
-
-                # Get all values for variance calculation
-                cursor.execute(
-                    """
-                    SELECT value FROM calibration_data
-                    WHERE session_id = ? AND parameter_name = ? AND value IS NOT NULL
-                    """,
-                    (sessionId, parameterName)
-                )
-
-                values = [row[0] for row in cursor.fetchall()]
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT parameter_name, value FROM calibration_data
+                WHERE session_id = ? AND value IS NOT NULL
+                """,
+                (sessionId,)
+            )
 
-                if len(values) < 2:
-                    return 0.0
+            valuesByParam: dict[str, array] = {}
+            for paramName, value in cursor.fetchall():
+                valuesByParam.setdefault(paramName, array('d')).append(value)
 
-                # Calculate variance
-                variance = sum((v - avg) ** 2 for v in values) / len(values)
-                return math.sqrt(variance)
+            stats = summarizeColumns(valuesByParam, ddof=0, modePrecision=None)
+            return {name: s.stdDev for name, s in stats.items()}
 
         except Exception as e:
-            logger.warning(f"Failed to calculate stddev for {parameterName}: {e}")
-            return None
+            logger.warning(f"Failed to calculate stddevs for session {sessionId}: {e}")
+            return {}
 
     def _calculateMaxVariance(self, values: list[float]) -> float:
         """
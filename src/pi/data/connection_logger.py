@@ -20,6 +20,8 @@
 #               |              | to one row.  State-change events ALWAYS log.
 #               |              | Eliminates ~99% of row volume during sustained
 #               |              | adapter outages (was ~2000 rows/day).
+# 2026-10-17    | Rex          | logConnectionEvent goes through writeEventRow
+#               |              | (shared event log writer when running).
 # ================================================================================
 ################################################################################
 
@@ -217,6 +219,9 @@ def logConnectionEvent(
     :mod:`src.pi.obdii.drive.detector`, shutdown manager, data_retention)
     keep their own SQL and are not forced through this path.
 
+    The row is queued on the database's event log writer when one is
+    running (see :mod:`src.pi.obdii.data.event_log_writer`).
+
     Args:
         database: ``ObdDatabase``-shaped object with a ``.connect()``
             context manager yielding a connection whose cursor supports
@@ -243,25 +248,26 @@ def logConnectionEvent(
     if shouldSuppressAsRepeat(macAddress, eventType):
         return
     try:
-        with database.connect() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                INSERT INTO connection_log
-                (timestamp, event_type, mac_address, success,
-                 error_message, retry_count, drive_id)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    utcIsoNow(),
-                    eventType,
-                    macAddress,
-                    1 if success else 0,
-                    errorMessage,
-                    retryCount,
-                    driveId,
-                ),
-            )
+        from src.pi.obdii.data.event_log_writer import writeEventRow
+
+        writeEventRow(
+            database,
+            """
+            INSERT INTO connection_log
+            (timestamp, event_type, mac_address, success,
+             error_message, retry_count, drive_id)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                utcIsoNow(),
+                eventType,
+                macAddress,
+                1 if success else 0,
+                errorMessage,
+                retryCount,
+                driveId,
+            ),
+        )
     except Exception as exc:  # noqa: BLE001 -- observability must not crash capture
         logger.warning(
             "Failed to write connection_log event | event_type=%s error=%s",
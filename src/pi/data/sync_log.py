@@ -34,6 +34,11 @@
 #                               ensureSyncModifiedAtSchema migration helper.
 #                               INSERT-side semantics unchanged for non-opt-in
 #                               tables (back-compat preserved).
+# 2026-10-16    | Rex          | realtime_data delta also returns cycle-frame
+#                               samples (realtime_frames) in legacy row
+#                               shape, merged by sample id.
+# 2026-10-16    | Rex          | advanceHighWaterMarks: move several tables'
+#                               cursors in one transaction (bulk push).
 # ================================================================================
 ################################################################################
 
@@ -299,6 +304,14 @@ def _hasModifiedAtColumn(
     return SYNC_MODIFIED_AT_COLUMN in cols
 
 
+def _tableExists(conn: sqlite3.Connection, tableName: str) -> bool:
+    row = conn.execute(
+        "SELECT name FROM sqlite_master WHERE type='table' AND name = ?",
+        (tableName,),
+    ).fetchone()
+    return row is not None
+
+
 # ================================================================================
 # Public API
 # ================================================================================
@@ -412,6 +425,15 @@ def getDeltaRows(
     # SQLAlchemy bulk insert with an unknown-column error.
     for row in rows:
         row.pop(SYNC_MODIFIED_AT_COLUMN, None)
+    if tableName == 'realtime_data' and _tableExists(conn, 'realtime_frames'):
+        # Cycle-frame samples share realtime_data's id space (see
+        # realtime_frames), so one merged, id-ordered page keeps the
+        # single pk cursor valid for both storage formats.  Imported here
+        # so this module stays decoupled from the OBD package at import.
+        from src.pi.obdii.realtime_frames import getSamplesAfter
+        frameRows = getSamplesAfter(conn, int(lastId), int(limit))
+        if frameRows:
+            rows = sorted(rows + frameRows, key=lambda r: r[pkColumn])[:int(limit)]
     return rows
 
 
@@ -454,7 +476,19 @@ def updateHighWaterMark(
     """
     _validateTable(tableName)
     _validateStatus(status)
+    _upsertHighWaterMark(conn, tableName, lastId, batchId, status, lastModifiedAt)
+    conn.commit()
+
 
+def _upsertHighWaterMark(
+    conn: sqlite3.Connection,
+    tableName: str,
+    lastId: int,
+    batchId: str,
+    status: str,
+    lastModifiedAt: str | None,
+) -> None:
+    """Write one sync_log row without committing (validation is the caller's)."""
     now = _utcIsoTimestamp()
     if lastModifiedAt is None:
         # COALESCE preserves the existing modified_at cursor when the caller
@@ -490,6 +524,43 @@ def updateHighWaterMark(
             """,
             (tableName, int(lastId), now, batchId, status, lastModifiedAt),
         )
+
+
+def advanceHighWaterMarks(
+    conn: sqlite3.Connection,
+    marks: dict[str, tuple[int, str | None]],
+    batchId: str,
+    status: str = 'ok',
+) -> None:
+    """Advance several tables' high-water marks in ONE transaction.
+
+    Used by the SyncClient bulk push: one request carries rows from several
+    tables, so the server's acknowledgement covers all of them and the
+    cursors must move together -- either every table's mark advances or
+    none does.  Same per-row semantics as :func:`updateHighWaterMark`.
+
+    Args:
+        conn: Open sqlite3 connection.
+        marks: ``{tableName: (lastId, lastModifiedAt)}``; ``lastModifiedAt``
+            ``None`` preserves the existing modified_at cursor.
+        batchId: Batch identifier recorded on every row.
+        status: One of :data:`VALID_STATUSES`.  Defaults to ``'ok'``.
+
+    Raises:
+        ValueError: If any table name or ``status`` is invalid (nothing is
+            written in that case).
+    """
+    _validateStatus(status)
+    for tableName in marks:
+        _validateTable(tableName)
+    try:
+        for tableName, (lastId, lastModifiedAt) in marks.items():
+            _upsertHighWaterMark(
+                conn, tableName, lastId, batchId, status, lastModifiedAt,
+            )
+    except BaseException:
+        conn.rollback()
+        raise
     conn.commit()
 
 
@@ -15,6 +15,12 @@
 # Date          | Author       | Description
 # ================================================================================
 # 2026-04-19    | Rex          | Initial implementation for US-192 (Sprint 14)
+# 2026-10-16    | Rex          | Also read cycle-frame samples; pick the
+#                               newest sample per alias family by id instead
+#                               of re-querying each family.
+# 2026-10-17    | Rex          | buildReadingsFromSnapshot: same mapping read
+#                               from the shared-memory live snapshot, stale
+#                               values dropped by embedded timestamp.
 # ================================================================================
 ################################################################################
 """
@@ -35,15 +41,24 @@ Data-source filtering: only ``real`` rows surface (plus ``NULL`` for
 pre-US-195 BC).  Replay / physics_sim rows are intentionally excluded -- the
 HDMI display is a live-cockpit read and showing simulated values would
 undermine the signal.
+
+:func:`buildReadingsFromSnapshot` is the frame-rate path: it reads the
+collector's shared-memory snapshot (:mod:`pi.display.live_snapshot`) with
+no SQL at all, applying the same alias mapping.  The snapshot carries
+whatever the collector is currently polling (there is no replay traffic on
+it), and a value older than ``maxAgeSeconds`` counts as absent.
 """
 
 from __future__ import annotations
 
 import logging
 import sqlite3
+import time
 from collections.abc import Iterable
 from pathlib import Path
 
+from pi.display.live_snapshot import LiveSnapshotReader
+
 logger = logging.getLogger(__name__)
 
 
@@ -51,6 +66,10 @@ PARAMETER_ALIASES: dict[str, str] = {
     "BATTERY_V": "BATTERY_VOLTAGE",
 }
 
+#: Snapshot values older than this render as ``---`` (collector stalled or
+#: stopped, or the parameter dropped out of the polling set).
+DEFAULT_SNAPSHOT_MAX_AGE_SECONDS = 5.0
+
 
 def resolveGaugeName(parameterName: str) -> str:
     """Return the display-side gauge name for a collector-side parameter.
@@ -110,7 +129,7 @@ def buildReadingsFromDb(
 
     placeholders = ",".join("?" for _ in queryNames)
     query = (
-        "SELECT parameter_name, value FROM realtime_data "
+        "SELECT parameter_name, id, value FROM realtime_data "
         f"WHERE parameter_name IN ({placeholders}) "
         "AND (data_source = 'real' OR data_source IS NULL) "
         "AND id = (SELECT MAX(id) FROM realtime_data r2 "
@@ -118,55 +137,79 @@ def buildReadingsFromDb(
         "          AND (r2.data_source = 'real' OR r2.data_source IS NULL))"
     )
 
+    # Newest (id, value) per parameter_name.  Cycle-frame samples share
+    # realtime_data's monotonic id space, so the higher id is the newer
+    # sample whichever storage format wrote it.
+    latest: dict[str, tuple[int, float]] = {}
     try:
         with sqlite3.connect(f"file:{Path(dbPath).as_posix()}?mode=ro", uri=True) as conn:
-            cursor = conn.execute(query, queryNames)
-            rawRows = cursor.fetchall()
+            for paramName, rowId, value in conn.execute(query, queryNames).fetchall():
+                latest[paramName] = (int(rowId), float(value))
+            hasFrames = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name='realtime_frames'"
+            ).fetchone() is not None
+            if hasFrames:
+                from src.pi.obdii.realtime_frames import getLatestSamples
+                for paramName, sample in getLatestSamples(conn, queryNames).items():
+                    if paramName not in latest or sample[0] > latest[paramName][0]:
+                        latest[paramName] = sample
     except sqlite3.OperationalError as e:
         # Missing realtime_data table, bad schema, locked db -- degrade gracefully
         logger.debug("live_readings: sqlite error on %s: %s", dbPath, e)
         return {}
 
-    # Collapse rows to (gaugeName, value, rowId-like ordering).  Since we
-    # filtered to MAX(id) per parameter_name above, each parameter_name
-    # contributes at most one row, but BATTERY_V and BATTERY_VOLTAGE can
-    # both produce a row -- pick the higher-id one by re-querying.
+    # Collapse each alias family (e.g. BATTERY_V + BATTERY_VOLTAGE) to its
+    # single newest sample.
     readings: dict[str, float] = {}
-
-    # For gauges with aliases, we need a tiebreak between direct-name row and
-    # aliased-name row.  Re-issue a targeted "most recent row for this gauge
-    # across its alias family" query.
     for gaugeName, aliasFamily in reverseAliases.items():
-        if len(aliasFamily) == 1:
-            # No alias family; use whatever the bulk query returned
-            for paramName, value in rawRows:
-                if paramName == gaugeName:
-                    readings[gaugeName] = float(value)
-                    break
-        else:
-            # Alias family -- find the single newest row across all family members
-            familyPlaceholders = ",".join("?" for _ in aliasFamily)
-            familyQuery = (
-                "SELECT value FROM realtime_data "
-                f"WHERE parameter_name IN ({familyPlaceholders}) "
-                "AND (data_source = 'real' OR data_source IS NULL) "
-                "ORDER BY id DESC LIMIT 1"
-            )
-            try:
-                with sqlite3.connect(
-                    f"file:{Path(dbPath).as_posix()}?mode=ro", uri=True
-                ) as conn:
-                    row = conn.execute(familyQuery, aliasFamily).fetchone()
-                    if row is not None:
-                        readings[gaugeName] = float(row[0])
-            except sqlite3.OperationalError as e:
-                logger.debug("live_readings: alias query failed: %s", e)
+        samples = [latest[name] for name in aliasFamily if name in latest]
+        if samples:
+            readings[gaugeName] = max(samples)[1]
 
     return readings
 
 
+def buildReadingsFromSnapshot(
+    reader: LiveSnapshotReader,
+    parameterNames: Iterable[str],
+    maxAgeSeconds: float = DEFAULT_SNAPSHOT_MAX_AGE_SECONDS,
+    now: float | None = None,
+) -> dict[str, float]:
+    """Return latest-value-per-gauge from the shared-memory live snapshot.
+
+    Mirrors :func:`buildReadingsFromDb`: aliased collector names surface
+    under their gauge name and the newest sample of an alias family wins
+    (by embedded timestamp).  Values older than ``maxAgeSeconds`` are left
+    out so the gauge shows ``---`` rather than a frozen number.
+
+    Args:
+        reader: Open :class:`LiveSnapshotReader` (reused across frames).
+        parameterNames: Display-side gauge names.
+        maxAgeSeconds: Staleness cut-off.
+        now: Epoch seconds to judge age against (tests); defaults to now.
+
+    Returns:
+        Dict of gauge name -> latest fresh value.
+    """
+    requestedGauges = set(parameterNames)
+    if not requestedGauges:
+        return {}
+    cutoff = (time.time() if now is None else now) - maxAgeSeconds
+
+    newest: dict[str, tuple[float, float]] = {}
+    for paramName, live in reader.read().items():
+        gaugeName = resolveGaugeName(paramName)
+        if gaugeName not in requestedGauges or live.timestamp < cutoff:
+            continue
+        if gaugeName not in newest or live.timestamp > newest[gaugeName][0]:
+            newest[gaugeName] = (live.timestamp, live.value)
+    return {gaugeName: value for gaugeName, (_stamp, value) in newest.items()}
+
+
 __all__ = [
+    "DEFAULT_SNAPSHOT_MAX_AGE_SECONDS",
     "PARAMETER_ALIASES",
     "buildReadingsFromDb",
+    "buildReadingsFromSnapshot",
     "resolveGaugeName",
 ]
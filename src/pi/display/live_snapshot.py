@@ -0,0 +1,362 @@
+################################################################################
+# File Name: live_snapshot.py
+# Purpose/Description: Fixed-layout, seqlock-protected latest-value block in a
+#                      memory-mapped file (/dev/shm).  The collector publishes
+#                      value / timestamp / severity per parameter; display
+#                      processes read it at frame rate with zero SQL.
+# Author: Rex
+# Creation Date: 2026-10-17
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-17    | Rex          | Initial
+# ================================================================================
+################################################################################
+"""
+Shared-memory live-value snapshot.
+
+Peer display processes (``scripts/render_primary_screen_live.py``) used to
+poll ``data/obd.db`` every frame for the newest value per gauge, reopening a
+read-only connection and competing with the capture writer for WAL and SD
+I/O.  The orchestrator now publishes each reading into a small
+memory-mapped file instead (:class:`LiveSnapshotWriter`, fed by the
+``liveSnapshot`` reading-bus subscriber) and readers copy it out
+(:class:`LiveSnapshotReader`) -- no SQL, no file-system writes on the SD
+card when the file lives on ``/dev/shm`` (tmpfs).
+
+File layout (little-endian, fixed for a given capacity)::
+
+    header  32 B   magic 'OBDLIVE1' | version u32 | capacity u32 | seq u64 | pad
+    slot    56 B   name 32 B (utf-8, NUL padded) | value f64 | timestamp f64
+                   | severity u8 | pad 7
+    ... capacity slots
+
+Slots are claimed by parameter name in first-seen order and never move, so
+the file needs no index.  ``timestamp`` is epoch seconds at publish time;
+readers judge staleness from it (a collector that stopped publishing leaves
+its last values behind with ageing timestamps).  ``severity`` is the
+:class:`pi.alert.tiered_thresholds.AlertSeverity` the collector evaluated
+for the value, or none.
+
+Consistency is a seqlock: the writer makes ``seq`` odd, writes the slot,
+then makes it even again; a reader copies the slot area between two reads
+of ``seq`` and retries if they differ or are odd.  There is a single
+writer process, so writers never contend.
+
+Usage:
+    writer = LiveSnapshotWriter('/dev/shm/eclipse-obd-live.snap')
+    writer.publish('RPM', 2450.0, severity=AlertSeverity.NORMAL)
+
+    reader = LiveSnapshotReader('/dev/shm/eclipse-obd-live.snap')
+    values = reader.read()          # {'RPM': LiveValue(2450.0, ts, 'normal')}
+"""
+
+from __future__ import annotations
+
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from pi.alert.tiered_thresholds import AlertSeverity
+
+logger = logging.getLogger(__name__)
+
+# ================================================================================
+# Layout
+# ================================================================================
+
+SNAPSHOT_MAGIC = b'OBDLIVE1'
+SNAPSHOT_VERSION = 1
+
+#: Default shared-memory location (tmpfs on Raspberry Pi OS).
+DEFAULT_SNAPSHOT_PATH = '/dev/shm/eclipse-obd-live.snap'
+
+#: Default slot count; comfortably above the 23-parameter realtime set.
+DEFAULT_CAPACITY = 64
+
+#: Longest parameter name a slot holds (utf-8 bytes).
+MAX_NAME_BYTES = 32
+
+_HEADER = struct.Struct('<8sIIQ')
+_HEADER_SIZE = 32
+_SEQ_OFFSET = 16
+_SEQ = struct.Struct('<Q')
+_SLOT = struct.Struct(f'<{MAX_NAME_BYTES}sddB7x')
+
+_SEVERITY_CODES: dict[AlertSeverity | None, int] = {
+    None: 0,
+    AlertSeverity.INFO: 1,
+    AlertSeverity.NORMAL: 2,
+    AlertSeverity.CAUTION: 3,
+    AlertSeverity.DANGER: 4,
+}
+_SEVERITY_NAMES: dict[int, str | None] = {
+    code: (severity.value if severity is not None else None)
+    for severity, code in _SEVERITY_CODES.items()
+}
+
+# A reader retries this many times when it races a write before returning
+# its previous consistent copy.
+_READ_RETRIES = 100
+
+
+def snapshotSize(capacity: int) -> int:
+    """Total file size in bytes for ``capacity`` slots."""
+    return _HEADER_SIZE + capacity * _SLOT.size
+
+
+@dataclass(frozen=True)
+class LiveValue:
+    """One parameter's latest published value."""
+
+    value: float
+    timestamp: float
+    severity: str | None = None
+
+    def ageSeconds(self, now: float | None = None) -> float:
+        """Seconds since the collector published this value."""
+        return (time.time() if now is None else now) - self.timestamp
+
+
+# ================================================================================
+# Writer
+# ================================================================================
+
+
+class LiveSnapshotWriter:
+    """
+    Single-process publisher of the latest value per parameter.
+
+    Reuses an existing snapshot file of the same layout (readers keep their
+    mapping across a collector restart); otherwise atomically replaces it
+    with a fresh, empty one.  Thread-safe within the process.
+
+    Args:
+        path: Snapshot file (``/dev/shm/...``).
+        capacity: Slot count; parameters beyond it are not published.
+        clock: Epoch-seconds source for the embedded timestamps (tests).
+    """
+
+    def __init__(
+        self,
+        path: str | Path = DEFAULT_SNAPSHOT_PATH,
+        capacity: int = DEFAULT_CAPACITY,
+        *,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError(f"live snapshot capacity must be positive: {capacity}")
+        self.path = Path(path)
+        self.capacity = capacity
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._slots: dict[str, int] = {}
+        self._overflowWarned = False
+        self._mmap = self._openOrCreate()
+        self._seq = _SEQ.unpack_from(self._mmap, _SEQ_OFFSET)[0]
+        if self._seq % 2:  # previous writer died mid-update
+            self._seq += 1
+            _SEQ.pack_into(self._mmap, _SEQ_OFFSET, self._seq)
+        self._loadSlotNames()
+
+    def _openOrCreate(self) -> mmap.mmap:
+        size = snapshotSize(self.capacity)
+        try:
+            with open(self.path, 'r+b') as f:
+                if os.fstat(f.fileno()).st_size == size:
+                    mm = mmap.mmap(f.fileno(), size)
+                    magic, version, capacity, _seq = _HEADER.unpack_from(mm, 0)
+                    if (magic, version, capacity) == (
+                        SNAPSHOT_MAGIC, SNAPSHOT_VERSION, self.capacity,
+                    ):
+                        return mm
+                    mm.close()
+        except FileNotFoundError:
+            pass
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmpPath = self.path.with_name(f'.{self.path.name}.{os.getpid()}.tmp')
+        with open(tmpPath, 'wb') as f:
+            header = _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, self.capacity, 0)
+            f.write(header.ljust(size, b'\0'))
+        os.replace(tmpPath, self.path)
+        with open(self.path, 'r+b') as f:
+            return mmap.mmap(f.fileno(), size)
+
+    def _loadSlotNames(self) -> None:
+        for index in range(self.capacity):
+            rawName = _SLOT.unpack_from(self._mmap, _HEADER_SIZE + index * _SLOT.size)[0]
+            name = rawName.rstrip(b'\0').decode('utf-8', 'replace')
+            if name:
+                self._slots[name] = index
+
+    def publish(
+        self,
+        parameterName: str,
+        value: float,
+        timestamp: float | None = None,
+        severity: AlertSeverity | None = None,
+    ) -> bool:
+        """
+        Publish the latest value for one parameter.
+
+        Args:
+            parameterName: Collector-side parameter name.
+            value: Latest value.
+            timestamp: Epoch seconds; defaults to now.
+            severity: Evaluated severity, if any.
+
+        Returns:
+            False when the parameter did not fit (name too long or every
+            slot taken), True otherwise.
+        """
+        encodedName = parameterName.encode('utf-8')
+        if len(encodedName) > MAX_NAME_BYTES:
+            return False
+        stamp = self._clock() if timestamp is None else timestamp
+        with self._lock:
+            index = self._slots.get(parameterName)
+            if index is None:
+                if len(self._slots) >= self.capacity:
+                    if not self._overflowWarned:
+                        logger.warning(
+                            "Live snapshot full -- %s not published | capacity=%d",
+                            parameterName, self.capacity,
+                        )
+                        self._overflowWarned = True
+                    return False
+                index = len(self._slots)
+                self._slots[parameterName] = index
+            self._seq += 1
+            _SEQ.pack_into(self._mmap, _SEQ_OFFSET, self._seq)
+            _SLOT.pack_into(
+                self._mmap,
+                _HEADER_SIZE + index * _SLOT.size,
+                encodedName,
+                float(value),
+                float(stamp),
+                _SEVERITY_CODES.get(severity, 0),
+            )
+            self._seq += 1
+            _SEQ.pack_into(self._mmap, _SEQ_OFFSET, self._seq)
+        return True
+
+    def close(self) -> None:
+        """Unmap the file (it stays in place for readers)."""
+        with self._lock:
+            if not self._mmap.closed:
+                self._mmap.close()
+
+
+# ================================================================================
+# Reader
+# ================================================================================
+
+
+class LiveSnapshotReader:
+    """
+    Lock-free reader of a :class:`LiveSnapshotWriter` file.
+
+    Opens lazily and remaps when the file is replaced (a collector restart
+    with a different capacity), so a display process can start before the
+    collector.  A missing or foreign file reads as empty.
+
+    Args:
+        path: Snapshot file written by the collector.
+    """
+
+    def __init__(self, path: str | Path = DEFAULT_SNAPSHOT_PATH) -> None:
+        self.path = Path(path)
+        self._mmap: mmap.mmap | None = None
+        self._inode: int | None = None
+        self._capacity = 0
+        self._last: dict[str, LiveValue] = {}
+
+    def _ensureMapped(self) -> bool:
+        try:
+            inode = os.stat(self.path).st_ino
+        except OSError:
+            self._unmap()
+            return False
+        if self._mmap is not None and inode == self._inode:
+            return True
+        self._unmap()
+        try:
+            with open(self.path, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size < _HEADER_SIZE:
+                    return False
+                mm = mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ)
+        except OSError as e:
+            logger.debug("live_snapshot: cannot map %s: %s", self.path, e)
+            return False
+        magic, version, capacity, _seq = _HEADER.unpack_from(mm, 0)
+        if (
+            magic != SNAPSHOT_MAGIC
+            or version != SNAPSHOT_VERSION
+            or len(mm) != snapshotSize(capacity)
+        ):
+            mm.close()
+            return False
+        self._mmap, self._inode, self._capacity = mm, inode, capacity
+        return True
+
+    def _unmap(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+        self._mmap, self._inode, self._last = None, None, {}
+
+    def read(self) -> dict[str, LiveValue]:
+        """
+        Consistent copy of every published parameter.
+
+        Returns:
+            Parameter name -> :class:`LiveValue`; empty when no snapshot
+            exists yet.
+        """
+        if not self._ensureMapped():
+            return {}
+        mm = self._mmap
+        assert mm is not None
+        end = snapshotSize(self._capacity)
+        for _ in range(_READ_RETRIES):
+            before = _SEQ.unpack_from(mm, _SEQ_OFFSET)[0]
+            if before % 2:
+                continue
+            data = mm[_HEADER_SIZE:end]
+            if _SEQ.unpack_from(mm, _SEQ_OFFSET)[0] == before:
+                break
+        else:
+            return dict(self._last)
+
+        values: dict[str, LiveValue] = {}
+        for rawName, value, stamp, severity in _SLOT.iter_unpack(data):
+            name = rawName.rstrip(b'\0')
+            if name:
+                values[name.decode('utf-8', 'replace')] = LiveValue(
+                    value, stamp, _SEVERITY_NAMES.get(severity),
+                )
+        self._last = values
+        return dict(values)
+
+    def close(self) -> None:
+        self._unmap()
+
+
+__all__ = [
+    'DEFAULT_CAPACITY',
+    'DEFAULT_SNAPSHOT_PATH',
+    'LiveSnapshotReader',
+    'LiveSnapshotWriter',
+    'LiveValue',
+    'snapshotSize',
+]
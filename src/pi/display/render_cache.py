@@ -0,0 +1,281 @@
+################################################################################
+# File Name: render_cache.py
+# Purpose/Description: Retained-mode helpers shared by the pygame dashboards --
+#                      an LRU cache of rasterized text surfaces, dirty-rect
+#                      merging, and a frame-time / CPU-per-frame counter.
+# Author: Rex
+# Creation Date: 2026-10-17
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-17    | Rex          | Initial
+# 2026-10-17    | Rex          | mergeRects builds a fixed 4-tuple per rect.
+# ================================================================================
+################################################################################
+"""
+Retained-mode render helpers.
+
+The Pi has no GPU; every ``font.render`` is a FreeType rasterization and
+every ``display.flip`` pushes the whole framebuffer through the CPU.  Both
+dashboards (``primary_renderer.PrimaryScreenRenderer`` and
+``pi.hardware.status_display.StatusDisplay``) redraw only what changed
+between frames and hand the changed rectangles to
+``pygame.display.update``.  This module holds the pieces they share:
+
+* :class:`TextSurfaceCache` -- LRU of rendered text surfaces keyed by
+  ``(text, fontKey, color)``, plus the fonts themselves, so an unchanged
+  label or value is rasterized once.
+* :func:`mergeRects` -- collapse overlapping dirty rectangles.
+* :class:`FrameTimer` / :class:`FrameStats` -- wall-clock and render-thread
+  CPU time per frame, and how much of the screen each frame touched.
+
+Nothing here imports pygame; surfaces and fonts are whatever the caller's
+``fontLoader`` returns, so the cache works with the fake pygame modules the
+hardware tests install.  Fonts and surfaces are only valid for the current
+``pygame.init`` session -- owners call :meth:`TextSurfaceCache.clear` when
+pygame shuts down.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+# ================================================================================
+# Constants
+# ================================================================================
+
+#: Rendered text surfaces kept.  The primary screen shows ~20 strings and the
+#: status display ~12; the headroom covers a few thousand distinct values of
+#: fast-changing gauges before the least recently used are dropped.
+DEFAULT_TEXT_CACHE_ENTRIES: int = 256
+
+RectTuple = tuple[int, int, int, int]
+
+
+# ================================================================================
+# Text surface cache
+# ================================================================================
+
+
+class TextSurfaceCache:
+    """
+    LRU cache of antialiased text surfaces and the fonts that render them.
+
+    Args:
+        fontLoader: ``fontKey -> font`` (anything with ``render(text, aa,
+            color)``).  Called once per key until :meth:`clear`.
+        maxEntries: Rendered surfaces kept; least recently used are evicted.
+
+    Raises:
+        ValueError: If maxEntries is not positive.
+    """
+
+    def __init__(
+        self,
+        fontLoader: Callable[[Hashable], Any],
+        maxEntries: int = DEFAULT_TEXT_CACHE_ENTRIES,
+    ) -> None:
+        if maxEntries < 1:
+            raise ValueError(f"text cache maxEntries must be positive: {maxEntries}")
+        self._fontLoader = fontLoader
+        self.maxEntries = maxEntries
+        self._fonts: dict[Hashable, Any] = {}
+        self._surfaces: OrderedDict[tuple[str, Hashable, tuple[int, ...]], Any] = (
+            OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def font(self, fontKey: Hashable) -> Any:
+        """Font for ``fontKey``, loaded on first use."""
+        font = self._fonts.get(fontKey)
+        if font is None:
+            font = self._fontLoader(fontKey)
+            self._fonts[fontKey] = font
+        return font
+
+    def render(self, text: str, fontKey: Hashable, color: tuple[int, ...]) -> Any:
+        """Rendered surface for ``text`` in ``fontKey`` / ``color``."""
+        key = (text, fontKey, tuple(color))
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        self.misses += 1
+        surface = self.font(fontKey).render(text, True, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.maxEntries:
+            self._surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def clear(self) -> None:
+        """Drop every font and surface (pygame was shut down)."""
+        self._fonts.clear()
+        self._surfaces.clear()
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+
+# ================================================================================
+# Dirty rectangles
+# ================================================================================
+
+
+def _overlaps(a: RectTuple, b: RectTuple) -> bool:
+    return (
+        a[0] < b[0] + b[2] and b[0] < a[0] + a[2]
+        and a[1] < b[1] + b[3] and b[1] < a[1] + a[3]
+    )
+
+
+def _union(a: RectTuple, b: RectTuple) -> RectTuple:
+    left, top = min(a[0], b[0]), min(a[1], b[1])
+    right = max(a[0] + a[2], b[0] + b[2])
+    bottom = max(a[1] + a[3], b[1] + b[3])
+    return (left, top, right - left, bottom - top)
+
+
+def mergeRects(rects: Iterable[RectTuple]) -> list[RectTuple]:
+    """
+    Union overlapping rectangles until none overlap.
+
+    A changed value usually dirties both its old and new text extents at
+    the same position; merging keeps the update list (and the per-rect
+    redraw passes) short.  Empty rectangles are dropped.
+    """
+    merged: list[RectTuple] = []
+    for rect in rects:
+        x, y, w, h = rect
+        current: RectTuple = (int(x), int(y), int(w), int(h))
+        if current[2] <= 0 or current[3] <= 0:
+            continue
+        changed = True
+        while changed:
+            changed = False
+            for i, other in enumerate(merged):
+                if _overlaps(current, other):
+                    current = _union(current, merged.pop(i))
+                    changed = True
+                    break
+        merged.append(current)
+    return merged
+
+
+# ================================================================================
+# Frame timing
+# ================================================================================
+
+
+@dataclass
+class FrameStats:
+    """Counters for a renderer's frames (times in milliseconds)."""
+
+    frameCount: int = 0
+    fullFrames: int = 0
+    skippedFrames: int = 0
+    lastFrameMs: float = 0.0
+    averageFrameMs: float = 0.0
+    maxFrameMs: float = 0.0
+    lastCpuMs: float = 0.0
+    averageCpuMs: float = 0.0
+    lastDirtyRects: int = 0
+    lastDirtyFraction: float = 0.0
+    textCacheHits: int = 0
+    textCacheMisses: int = 0
+
+
+class FrameTimer:
+    """
+    Per-frame wall-clock and render-thread CPU accounting.
+
+    Call :meth:`begin` before drawing and :meth:`end` after the display
+    update.  CPU time is ``time.thread_time`` -- the render thread's own
+    cost, not the capture threads sharing the process.
+
+    Args:
+        wallClock: Monotonic seconds (tests).
+        cpuClock: Thread CPU seconds (tests).
+    """
+
+    def __init__(
+        self,
+        *,
+        wallClock: Callable[[], float] = time.perf_counter,
+        cpuClock: Callable[[], float] = time.thread_time,
+    ) -> None:
+        self._wallClock = wallClock
+        self._cpuClock = cpuClock
+        self._wallStart = 0.0
+        self._cpuStart = 0.0
+        self._totalFrameMs = 0.0
+        self._totalCpuMs = 0.0
+        self._stats = FrameStats()
+
+    def begin(self) -> None:
+        self._wallStart = self._wallClock()
+        self._cpuStart = self._cpuClock()
+
+    def end(
+        self,
+        dirtyRects: Iterable[RectTuple],
+        canvasSize: tuple[int, int],
+        *,
+        full: bool = False,
+    ) -> None:
+        """
+        Close the frame opened by :meth:`begin`.
+
+        Args:
+            dirtyRects: Rectangles pushed to the display this frame.
+            canvasSize: (width, height) of the surface, for the dirty fraction.
+            full: True when the whole surface was redrawn.
+        """
+        frameMs = (self._wallClock() - self._wallStart) * 1000.0
+        cpuMs = (self._cpuClock() - self._cpuStart) * 1000.0
+        rects = list(dirtyRects)
+        area = canvasSize[0] * canvasSize[1]
+        dirtyArea = sum(r[2] * r[3] for r in rects)
+
+        stats = self._stats
+        stats.frameCount += 1
+        if full:
+            stats.fullFrames += 1
+        elif not rects:
+            stats.skippedFrames += 1
+        self._totalFrameMs += frameMs
+        self._totalCpuMs += cpuMs
+        stats.lastFrameMs = frameMs
+        stats.lastCpuMs = cpuMs
+        stats.averageFrameMs = self._totalFrameMs / stats.frameCount
+        stats.averageCpuMs = self._totalCpuMs / stats.frameCount
+        stats.maxFrameMs = max(stats.maxFrameMs, frameMs)
+        stats.lastDirtyRects = len(rects)
+        stats.lastDirtyFraction = min(dirtyArea / area, 1.0) if area else 0.0
+
+    def getStats(self, textCache: TextSurfaceCache | None = None) -> FrameStats:
+        """Copy of the counters, with text-cache hit/miss counts if given."""
+        stats = FrameStats(**vars(self._stats))
+        if textCache is not None:
+            stats.textCacheHits = textCache.hits
+            stats.textCacheMisses = textCache.misses
+        return stats
+
+
+__all__ = [
+    'DEFAULT_TEXT_CACHE_ENTRIES',
+    'FrameStats',
+    'FrameTimer',
+    'TextSurfaceCache',
+    'mergeRects',
+]
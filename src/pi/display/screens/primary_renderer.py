@@ -10,6 +10,10 @@
 # Date          | Author       | Description
 # ================================================================================
 # 2026-04-17    | Ralph Agent  | Initial implementation for US-164
+# 2026-10-17    | Rex          | Text surfaces + fonts served from an LRU
+#               |              | cache; PrimaryScreenRenderer diffs the layout
+#               |              | against the previous frame and redraws only
+#               |              | the dirty rectangles
 # ================================================================================
 ################################################################################
 """
@@ -27,6 +31,17 @@ it via ``pygame.font.SysFont("dejavusans", size)`` on Windows/Linux. We fall
 back to ``pygame.font.Font(None, size)`` (pygame's built-in bitmap font) when
 DejaVu is not available — this keeps unit tests running on bare CI boxes.
 
+Retained mode
+-------------
+``renderPrimaryScreen`` repaints the whole surface (PNG snapshots, tests).
+The live loop uses :class:`PrimaryScreenRenderer` instead: it keeps the
+previous frame's ``LayoutElement`` list, repaints only the rectangles of
+elements that appeared or disappeared, and returns them for
+``pygame.display.update(dirtyRects)``.  Both paths rasterize text through
+one :class:`~pi.display.render_cache.TextSurfaceCache`, so a value that did
+not change is never re-rendered and fonts are loaded once per pygame
+session.
+
 See offices/ralph/agent.md §Pygame Display for the cross-platform pygame
 availability pattern used here.
 """
@@ -34,6 +49,7 @@ availability pattern used here.
 from __future__ import annotations
 
 import logging
+from dataclasses import astuple
 from typing import Any
 
 try:
@@ -43,6 +59,7 @@ except (ImportError, RuntimeError):
     pygame = None  # type: ignore
     PYGAME_AVAILABLE = False
 
+from ..render_cache import FrameStats, FrameTimer, TextSurfaceCache, mergeRects
 from .primary_screen import BasicTierScreenState, LayoutElement, computeBasicTierLayout
 
 logger = logging.getLogger(__name__)
@@ -114,6 +131,24 @@ def _color(name: str) -> tuple[int, int, int]:
     return _COLOR_MAP.get(name, _COLOR_MAP["white"])
 
 
+_textCache = TextSurfaceCache(_loadFont)
+
+
+def _sessionTextCache() -> TextSurfaceCache:
+    """The shared text cache, emptied whenever pygame shuts down.
+
+    Fonts from a previous ``pygame.init`` session are dangling once
+    ``pygame.quit`` runs, so the cache registers a quit hook when it starts
+    filling (pygame forgets hooks after each quit) and also drops its
+    contents if the font module is found uninitialised.
+    """
+    if not pygame.font.get_init():
+        _textCache.clear()
+    elif len(_textCache) == 0:
+        pygame.register_quit(_textCache.clear)
+    return _textCache
+
+
 # ================================================================================
 # Renderer
 # ================================================================================
@@ -164,11 +199,13 @@ def _drawElement(element: LayoutElement, surface: Any) -> None:
         logger.debug("Unknown LayoutElement kind: %s", element.kind)
 
 
-def _drawText(element: LayoutElement, surface: Any) -> None:
+def _renderText(element: LayoutElement) -> Any:
     size = FONT_SIZES.get(element.fontSize, FONT_SIZES["normal"])
-    font = _loadFont(size)
-    textSurface = font.render(element.text, True, _color(element.color))
-    surface.blit(textSurface, (element.x, element.y))
+    return _sessionTextCache().render(element.text, size, _color(element.color))
+
+
+def _drawText(element: LayoutElement, surface: Any) -> None:
+    surface.blit(_renderText(element), (element.x, element.y))
 
 
 def _drawCircle(element: LayoutElement, surface: Any) -> None:
@@ -188,9 +225,118 @@ def _drawRect(element: LayoutElement, surface: Any) -> None:
     )
 
 
+def elementBounds(element: LayoutElement) -> tuple[int, int, int, int]:
+    """Screen rectangle ``(x, y, width, height)`` the element paints."""
+    if element.kind == "text":
+        width, height = _renderText(element).get_size()
+        return (element.x, element.y, width, height)
+    if element.kind == "circle":
+        radius = element.radius if element.radius > 0 else 8
+        return (element.x - radius, element.y - radius, 2 * radius + 1, 2 * radius + 1)
+    if element.kind == "rect":
+        return (element.x, element.y, max(element.width, 1), max(element.height, 1))
+    return (element.x, element.y, 0, 0)
+
+
+# ================================================================================
+# Retained-mode renderer
+# ================================================================================
+
+
+class PrimaryScreenRenderer:
+    """
+    Dirty-region renderer for the basic-tier primary screen.
+
+    Each :meth:`render` computes the layout, diffs it against the previous
+    frame's, and repaints (background + every overlapping element, clipped)
+    only the rectangles where an element appeared or disappeared.  The
+    result is pixel-identical to :func:`renderPrimaryScreen`.  The first
+    frame, a new surface, or :meth:`invalidate` repaints everything.
+
+    Args:
+        background: RGB background color; defaults to black.
+
+    Example:
+        renderer = PrimaryScreenRenderer()
+        dirty = renderer.render(state, screen)
+        if dirty:
+            pygame.display.update(dirty)
+    """
+
+    def __init__(self, background: tuple[int, int, int] = DEFAULT_BACKGROUND) -> None:
+        self.background = background
+        self._surface: Any = None
+        self._surfaceSize: tuple[int, int] | None = None
+        self._previous: dict[tuple[Any, ...], tuple[int, int, int, int]] = {}
+        self._timer = FrameTimer()
+
+    def invalidate(self) -> None:
+        """Force the next frame to repaint the whole surface."""
+        self._surface = None
+
+    def render(
+        self, state: BasicTierScreenState, surface: Any,
+    ) -> list[tuple[int, int, int, int]]:
+        """
+        Bring ``surface`` up to date with ``state``.
+
+        Args:
+            state: Basic-tier screen state from ``buildBasicTierScreenState``.
+            surface: Pygame Surface to draw on (the display surface in the
+                live loop).
+
+        Returns:
+            Rectangles that changed -- pass to ``pygame.display.update``.
+            Empty when the frame is identical to the previous one.
+
+        Raises:
+            RuntimeError: If pygame is not available.
+        """
+        if not PYGAME_AVAILABLE:
+            raise RuntimeError(
+                "pygame is required for rendering but is not importable"
+            )
+
+        self._timer.begin()
+        width, height = surface.get_size()
+        layout = computeBasicTierLayout(state, width=width, height=height)
+        current = {astuple(element): elementBounds(element) for element in layout}
+
+        full = surface is not self._surface or self._surfaceSize != (width, height)
+        if full:
+            surface.fill(self.background)
+            for element in layout:
+                _drawElement(element, surface)
+            dirty = [(0, 0, width, height)]
+        else:
+            dirty = mergeRects(
+                [rect for key, rect in self._previous.items() if key not in current]
+                + [rect for key, rect in current.items() if key not in self._previous]
+            )
+            for rect in dirty:
+                surface.set_clip(rect)
+                surface.fill(self.background, rect)
+                for element in layout:
+                    if pygame.Rect(current[astuple(element)]).colliderect(rect):
+                        _drawElement(element, surface)
+            surface.set_clip(None)
+
+        self._surface = surface
+        self._surfaceSize = (width, height)
+        self._previous = current
+        self._timer.end(dirty, (width, height), full=full)
+        return dirty
+
+    def getStats(self) -> FrameStats:
+        """Frame time, CPU per frame, dirty area and text-cache counters."""
+        return self._timer.getStats(_textCache)
+
+
 __all__ = [
     "DEFAULT_BACKGROUND",
     "FONT_SIZES",
     "PYGAME_AVAILABLE",
+    "PrimaryScreenRenderer",
+    "elementBounds",
     "renderPrimaryScreen",
 ]
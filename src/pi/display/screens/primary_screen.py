@@ -11,6 +11,8 @@
 # ================================================================================
 # 2026-04-12    | Ralph Agent  | Initial implementation for US-121
 # 2026-04-17    | Ralph Agent  | US-164: basic-tier 6-param state + layout helpers
+# 2026-10-17    | Rex          | evaluateBasicTierSeverity for the live snapshot
+#               |              | publisher
 # ================================================================================
 ################################################################################
 """
@@ -425,6 +427,21 @@ def _evaluateBasicTierParameter(
     return None
 
 
+def evaluateBasicTierSeverity(
+    name: str,
+    value: float,
+    thresholdConfigs: dict[str, Any],
+) -> AlertSeverity | None:
+    """Basic-tier severity for one gauge, or None when it has no threshold.
+
+    Same evaluation ``buildBasicTierScreenState`` colours the gauge with;
+    the collector stamps it into the live snapshot so display processes
+    need not re-evaluate.
+    """
+    result = _evaluateBasicTierParameter(name, value, thresholdConfigs)
+    return result.severity if result is not None else None
+
+
 def buildBasicTierScreenState(
     readings: dict[str, float],
     thresholdConfigs: dict[str, Any],
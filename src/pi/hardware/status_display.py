@@ -25,6 +25,11 @@
 #               |              | orange / TRIGGER=red). Backwards-compat: the
 #               |              | constructor still accepts width=480 height=320
 #               |              | for legacy dev/testing.
+# 2026-10-17    | Rex          | Retained-mode render: only quadrants whose
+#               |              | displayed values changed are repainted and
+#               |              | pushed via display.update(rects); text
+#               |              | surfaces come from an LRU TextSurfaceCache;
+#               |              | renderStats exposes frame time / CPU.
 # ================================================================================
 ################################################################################
 
@@ -38,7 +43,11 @@ This module provides a canvas-aware status display showing:
 - SE quadrant: warning and error counts
 - footer: uptime and IP address
 
-The display is rendered using pygame. Geometry comes from
+The display is rendered using pygame. Each frame compares what every
+quadrant would show with the previous frame and repaints only the quadrants
+that changed, pushing just those rectangles with
+``pygame.display.update``; rendered text is cached by (text, font, color).
+Geometry comes from
 ``pi.hardware.dashboard_layout.computeLayout(width, height)`` so the same
 codepath drives the legacy 480x320 OSOYOO touchscreen and a 1920x1080 HDMI
 screen plugged into the Eclipse.
@@ -67,6 +76,8 @@ import time
 from collections.abc import Callable
 from enum import Enum
 
+from pi.display.render_cache import FrameStats, FrameTimer, TextSurfaceCache
+
 from .dashboard_layout import (
     COLOR_BLACK,
     COLOR_BLUE,
@@ -215,6 +226,11 @@ class StatusDisplay:
         self._isRunning = False
         self._screen = None
         self._fonts: dict[str, object] = {}
+        self._textCache = TextSurfaceCache(lambda role: self._fonts[role])
+        self._frameTimer = FrameTimer()
+        # Per-quadrant content of the last frame on screen; None forces a
+        # full repaint (first frame after pygame init).
+        self._lastSignatures: dict[str, tuple] | None = None
 
         # Threading
         self._refreshThread: threading.Thread | None = None
@@ -300,6 +316,8 @@ class StatusDisplay:
                 'label': pygame.font.SysFont('arial', scale.label),
                 'detail': pygame.font.SysFont('arial', scale.detail),
             }
+            self._textCache.clear()
+            self._lastSignatures = None
 
             logger.info(
                 f"Pygame display initialized: {self._width}x{self._height}; "
@@ -319,6 +337,8 @@ class StatusDisplay:
             pygame.quit()
             self._screen = None
             self._fonts = {}
+            self._textCache.clear()
+            self._lastSignatures = None
             logger.debug("Pygame shutdown complete")
         except Exception as e:
             logger.warning(f"Error during pygame shutdown: {e}")
@@ -424,34 +444,70 @@ class StatusDisplay:
     # Rendering -- 4-quadrant dashboard
     # ================================================================================
 
+    def _quadrantSignatures(self) -> dict[str, tuple]:
+        """What each region would show this frame (compared across frames)."""
+        with self._dataLock:
+            signatures = {
+                'engine': (self._batteryPercentage, self._batteryVoltage),
+                'power': (self._powerSource, self._shutdownStage),
+                'drive': (self._obdStatus,),
+                'alerts': (self._warningCount, self._errorCount),
+            }
+        # Uptime ticks every second, so the footer (and its IP lookup) is
+        # repainted on every frame at the default refresh rate.
+        signatures['footer'] = (int(time.time() - self._startTime),)
+        return signatures
+
     def _render(self) -> None:
-        """Render one frame of the dashboard."""
+        """Render one frame, repainting only the quadrants that changed."""
         if self._screen is None:
             return
 
         import pygame
 
-        self._screen.fill(COLOR_BLACK)
-
-        self._renderEngineQuadrant(self._layout.engine)
-        self._renderPowerQuadrant(self._layout.power)
-        self._renderDriveQuadrant(self._layout.drive)
-        self._renderAlertsQuadrant(self._layout.alerts)
-        self._renderFooter(self._layout.footer)
-
-        pygame.display.flip()
+        self._frameTimer.begin()
+        signatures = self._quadrantSignatures()
+        previous = self._lastSignatures
+        full = previous is None
+        if full:
+            self._screen.fill(COLOR_BLACK)
+
+        regions = (
+            ('engine', self._layout.engine, self._renderEngineQuadrant),
+            ('power', self._layout.power, self._renderPowerQuadrant),
+            ('drive', self._layout.drive, self._renderDriveQuadrant),
+            ('alerts', self._layout.alerts, self._renderAlertsQuadrant),
+            ('footer', self._layout.footer, self._renderFooter),
+        )
+        dirtyRects: list[tuple[int, int, int, int]] = []
+        for name, rect, renderRegion in regions:
+            if not full and signatures[name] == previous.get(name):
+                continue
+            area = (rect.x, rect.y, rect.width, rect.height)
+            if not full:
+                self._screen.fill(COLOR_BLACK, area)
+            renderRegion(rect)
+            dirtyRects.append(area)
+        self._lastSignatures = signatures
+
+        if full:
+            pygame.display.flip()
+            dirtyRects = [(0, 0, self._width, self._height)]
+        elif dirtyRects:
+            pygame.display.update(dirtyRects)
+        self._frameTimer.end(dirtyRects, (self._width, self._height), full=full)
 
     def _drawText(
         self,
         text: str,
         rect: Rect,
-        font: object,
+        fontRole: str,
         color: tuple[int, int, int],
         offsetX: int = 0,
         offsetY: int = 0,
     ) -> None:
         """Blit ``text`` inside ``rect`` at (rect.x+offsetX, rect.y+offsetY)."""
-        rendered = font.render(text, True, color)
+        rendered = self._textCache.render(text, fontRole, color)
         self._screen.blit(rendered, (rect.x + offsetX, rect.y + offsetY))
 
     def _renderEngineQuadrant(self, rect: Rect) -> None:
@@ -464,7 +520,7 @@ class StatusDisplay:
         labelFont = self._fonts['label']
         titleFont = self._fonts['title']
 
-        self._drawText("Eclipse OBD-II", rect, labelFont, COLOR_BLUE,
+        self._drawText("Eclipse OBD-II", rect, 'label', COLOR_BLUE,
                        offsetX=padding, offsetY=padding)
 
         if percentage is not None and voltage is not None:
@@ -482,13 +538,12 @@ class StatusDisplay:
             detailStr = ""
 
         valueY = rect.y + padding + labelFont.get_height() + padding
-        self._drawText(valueStr, rect, titleFont, color,
+        self._drawText(valueStr, rect, 'title', color,
                        offsetX=padding, offsetY=valueY - rect.y)
 
         if detailStr:
-            detailFont = self._fonts['detail']
             detailY = valueY + titleFont.get_height() + padding // 2
-            self._drawText(detailStr, rect, detailFont, COLOR_WHITE,
+            self._drawText(detailStr, rect, 'detail', COLOR_WHITE,
                            offsetX=padding, offsetY=detailY - rect.y)
 
     def _renderPowerQuadrant(self, rect: Rect) -> None:
@@ -502,7 +557,6 @@ class StatusDisplay:
         padding = self._layout.padding
         labelFont = self._fonts['label']
         titleFont = self._fonts['title']
-        detailFont = self._fonts['detail']
 
         # Stage color tints the entire power quadrant background so an operator
         # 6 feet from the screen can see WARNING/IMMINENT/TRIGGER at a glance.
@@ -520,7 +574,7 @@ class StatusDisplay:
             pygame.draw.rect(self._screen, tint,
                              (rect.x, rect.y, rect.width, rect.height))
 
-        self._drawText("Power", rect, labelFont, COLOR_WHITE,
+        self._drawText("Power", rect, 'label', COLOR_WHITE,
                        offsetX=padding, offsetY=padding)
 
         if source == PowerSourceDisplay.CAR:
@@ -531,12 +585,12 @@ class StatusDisplay:
             sourceColor = COLOR_GRAY
 
         valueY = rect.y + padding + labelFont.get_height() + padding
-        self._drawText(source.value, rect, titleFont, sourceColor,
+        self._drawText(source.value, rect, 'title', sourceColor,
                        offsetX=padding, offsetY=valueY - rect.y)
 
         stageY = valueY + titleFont.get_height() + padding
         stageStr = f"Stage: {stage.value.upper()}"
-        self._drawText(stageStr, rect, detailFont, stageColor,
+        self._drawText(stageStr, rect, 'detail', stageColor,
                        offsetX=padding, offsetY=stageY - rect.y)
 
     def _renderDriveQuadrant(self, rect: Rect) -> None:
@@ -546,9 +600,8 @@ class StatusDisplay:
 
         padding = self._layout.padding
         labelFont = self._fonts['label']
-        titleFont = self._fonts['title']
 
-        self._drawText("OBD2", rect, labelFont, COLOR_WHITE,
+        self._drawText("OBD2", rect, 'label', COLOR_WHITE,
                        offsetX=padding, offsetY=padding)
 
         if status == ConnectionStatus.CONNECTED:
@@ -559,7 +612,7 @@ class StatusDisplay:
             color = COLOR_RED
 
         valueY = rect.y + padding + labelFont.get_height() + padding
-        self._drawText(status.value, rect, titleFont, color,
+        self._drawText(status.value, rect, 'title', color,
                        offsetX=padding, offsetY=valueY - rect.y)
 
     def _renderAlertsQuadrant(self, rect: Rect) -> None:
@@ -570,9 +623,8 @@ class StatusDisplay:
 
         padding = self._layout.padding
         labelFont = self._fonts['label']
-        titleFont = self._fonts['title']
 
-        self._drawText("Issues", rect, labelFont, COLOR_WHITE,
+        self._drawText("Issues", rect, 'label', COLOR_WHITE,
                        offsetX=padding, offsetY=padding)
 
         if errors > 0:
@@ -586,24 +638,23 @@ class StatusDisplay:
             valueStr = "None"
 
         valueY = rect.y + padding + labelFont.get_height() + padding
-        self._drawText(valueStr, rect, titleFont, color,
+        self._drawText(valueStr, rect, 'title', color,
                        offsetX=padding, offsetY=valueY - rect.y)
 
     def _renderFooter(self, rect: Rect) -> None:
         """Bottom strip: uptime + IP."""
         padding = self._layout.padding
-        detailFont = self._fonts['detail']
 
         uptime = time.time() - self._startTime
         hours, remainder = divmod(int(uptime), 3600)
         minutes, seconds = divmod(remainder, 60)
         uptimeStr = f"Uptime {hours:02d}:{minutes:02d}:{seconds:02d}"
 
-        self._drawText(uptimeStr, rect, detailFont, COLOR_GRAY,
+        self._drawText(uptimeStr, rect, 'detail', COLOR_GRAY,
                        offsetX=padding, offsetY=padding // 2)
 
         ipStr = f"IP {self._getIpAddress()}"
-        ipText = detailFont.render(ipStr, True, COLOR_GRAY)
+        ipText = self._textCache.render(ipStr, 'detail', COLOR_GRAY)
         ipWidth = ipText.get_width()
         self._screen.blit(
             ipText,
@@ -787,6 +838,11 @@ class StatusDisplay:
         with self._dataLock:
             return self._shutdownStage
 
+    @property
+    def renderStats(self) -> FrameStats:
+        """Frame time, render CPU per frame, dirty area and text-cache counters."""
+        return self._frameTimer.getStats(self._textCache)
+
     @property
     def uptime(self) -> float:
         """Get the display uptime in seconds."""
@@ -11,6 +11,7 @@
 # ================================================================================
 # 2026-01-22    | Ralph Agent  | Initial implementation (US-003)
 # 2026-04-14    | Ralph Agent  | Sweep 2b — delete legacy _validateAlertThresholds and injection dict
+# 2026-10-16    | Rex          | Chunked, sync-aware retention DEFAULTS
 # ================================================================================
 ################################################################################
 
@@ -147,6 +148,10 @@ OBD_DEFAULTS: dict[str, Any] = {
     'pi.dataRetention.statisticsRetentionDays': -1,
     'pi.dataRetention.vacuumAfterCleanup': True,
     'pi.dataRetention.cleanupTimeHour': 3,
+    'pi.dataRetention.deleteBatchRows': 5000,
+    'pi.dataRetention.batchPauseMs': 50,
+    'pi.dataRetention.requireSynced': True,
+    'pi.dataRetention.reclaimMode': 'incremental',
 
     # Logging (shared top-level)
     'logging.level': 'INFO',
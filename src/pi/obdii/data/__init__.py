@@ -11,6 +11,10 @@
 # ================================================================================
 # 2026-01-22    | Ralph Agent  | Initial subpackage creation (US-001)
 # 2026-01-22    | Ralph Agent  | Added exports for US-007 (data module refactor)
+# 2026-10-16    | Rex          | Export RealtimeBatchWriter + BatchWriterStats
+# 2026-10-16    | Rex          | Export ParameterSampleRate
+# 2026-10-16    | Rex          | Export RealtimeFrameWriter
+# 2026-10-17    | Rex          | Export EventLogWriter + helpers
 # ================================================================================
 ################################################################################
 """
@@ -19,6 +23,8 @@ Data Subpackage.
 This subpackage contains data logging components:
 - OBD data logger
 - Realtime data logger
+- Write-behind batch writer for realtime_data
+- Write-behind writer for auxiliary event rows (alert / connection / power)
 - Logging state and statistics
 - Helper functions for data operations
 
@@ -28,6 +34,8 @@ Usage:
         LoggingState,
         LoggedReading,
         LoggingStats,
+        BatchWriterStats,
+        ParameterSampleRate,
         # Exceptions
         DataLoggerError,
         ParameterNotSupportedError,
@@ -35,6 +43,9 @@ Usage:
         # Classes
         ObdDataLogger,
         RealtimeDataLogger,
+        RealtimeBatchWriter,
+        RealtimeFrameWriter,
+        EventLogWriter,
         # Helper functions
         queryParameter,
         logReading,
@@ -46,6 +57,17 @@ Usage:
 
 # Types
 # Exceptions
+from .batch_writer import (
+    RealtimeBatchWriter,
+    RealtimeFrameWriter,
+    createBatchWriterFromConfig,
+)
+from .event_log_writer import (
+    EventLogWriter,
+    createEventLogWriterFromConfig,
+    flushEventLog,
+    writeEventRow,
+)
 from .exceptions import (
     DataLoggerError,
     ParameterNotSupportedError,
@@ -65,9 +87,11 @@ from .helpers import (
 from .logger import ObdDataLogger
 from .realtime import RealtimeDataLogger
 from .types import (
+    BatchWriterStats,
     LoggedReading,
     LoggingState,
     LoggingStats,
+    ParameterSampleRate,
 )
 
 __all__: list[str] = [
@@ -75,6 +99,8 @@ __all__: list[str] = [
     'LoggingState',
     'LoggedReading',
     'LoggingStats',
+    'BatchWriterStats',
+    'ParameterSampleRate',
     # Exceptions
     'DataLoggerError',
     'ParameterNotSupportedError',
@@ -82,10 +108,17 @@ __all__: list[str] = [
     # Classes
     'ObdDataLogger',
     'RealtimeDataLogger',
+    'RealtimeBatchWriter',
+    'RealtimeFrameWriter',
+    'EventLogWriter',
     # Helper functions
     'queryParameter',
     'logReading',
     'verifyDataPersistence',
     'createDataLoggerFromConfig',
     'createRealtimeLoggerFromConfig',
+    'createBatchWriterFromConfig',
+    'createEventLogWriterFromConfig',
+    'flushEventLog',
+    'writeEventRow',
 ]
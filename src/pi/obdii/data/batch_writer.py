@@ -0,0 +1,502 @@
+################################################################################
+# File Name: batch_writer.py
+# Purpose/Description: Write-behind batch writer for realtime_data rows
+# Author: Rex
+# Creation Date: 2026-10-16
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-16    | Rex          | Initial -- bounded queue drained by one
+#                               long-lived connection; flush on size, age,
+#                               drive end and stop.
+# 2026-10-16    | Rex          | Split the INSERT into _writeBatch; add
+#                               RealtimeFrameWriter (cycle-frame storage)
+#                               selected by pi.realtimeData.storageFormat.
+# 2026-10-17    | Rex          | Thread name / log label as class attributes
+#                               so EventLogWriter can reuse the queue.
+# ================================================================================
+################################################################################
+"""
+Write-behind batch writer for ``realtime_data``.
+
+The legacy :meth:`ObdDataLogger.logReading` path opens a fresh connection,
+re-runs the connection PRAGMAs, inserts one row and commits -- once per PID
+per cycle.  On the Pi's SD card that fsync-per-row pattern dominated the
+capture loop and showed up as cycle jitter.
+
+:class:`RealtimeBatchWriter` replaces it with:
+
+- a bounded in-memory queue (rows beyond ``maxQueueRows`` are dropped and
+  counted, never blocking the polling thread),
+- one long-lived connection from :meth:`ObdDatabase.openPersistentConnection`,
+- one ``executemany`` transaction per flush.
+
+Flush triggers:
+
+- ``size``: queue reached ``maxBatchRows``
+- ``age``: oldest queued row is older than ``maxBatchAgeMs``
+- ``drive_end``: DriveDetector hook, so post-drive analysis and the
+  drive-end sync see every row of the drive
+- ``stop``: :meth:`stop` (orchestrator shutdown + the power-down ladder's
+  ``pausePolling``) always drains the queue synchronously
+
+Rows are fully stamped (canonical UTC timestamp, drive_id, data_source) at
+enqueue time, so a late flush can never re-attribute a row to the next
+drive.
+
+With ``pi.realtimeData.storageFormat = 'frames'`` the factory returns
+:class:`RealtimeFrameWriter`, which packs each flushed batch into
+``realtime_frames`` cycle rows (see :mod:`src.pi.obdii.realtime_frames`)
+instead of one ``realtime_data`` row per sample.
+
+Usage:
+    from src.pi.obdii.data.batch_writer import RealtimeBatchWriter
+
+    writer = RealtimeBatchWriter(database, maxBatchRows=50, maxBatchAgeMs=2000)
+    writer.start()
+    writer.enqueue(row)          # from the polling thread
+    writer.flush('drive_end')    # synchronous
+    writer.stop()                # final flush + close
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+from ..realtime_frames import FramePacker
+from .types import BatchWriterStats
+
+logger = logging.getLogger(__name__)
+
+# ================================================================================
+# Constants
+# ================================================================================
+
+#: Flush once this many rows are queued.  ~2 polling cycles of the full
+#: 23-parameter set at the 1 Hz default cadence.
+DEFAULT_MAX_BATCH_ROWS: int = 50
+
+#: Flush once the oldest queued row is this old, so a slow cadence still
+#: lands rows on disk within a bounded window (crash-loss budget).
+DEFAULT_MAX_BATCH_AGE_MS: int = 2000
+
+#: Hard cap on queued rows.  At the default cadence this is several minutes
+#: of capture -- only reachable when the SD card stops accepting writes.
+DEFAULT_MAX_QUEUE_ROWS: int = 5000
+
+#: Accepted pi.realtimeData.storageFormat values.
+STORAGE_FORMAT_ROWS: str = 'rows'
+STORAGE_FORMAT_FRAMES: str = 'frames'
+
+#: Column order of every queued row tuple.
+REALTIME_ROW_COLUMNS: tuple[str, ...] = (
+    'timestamp',
+    'parameter_name',
+    'value',
+    'unit',
+    'profile_id',
+    'drive_id',
+    'data_source',
+)
+
+_INSERT_SQL = (
+    "INSERT INTO realtime_data "
+    "(timestamp, parameter_name, value, unit, profile_id, drive_id, data_source) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+class RealtimeBatchWriter:
+    """
+    Bounded write-behind queue for ``realtime_data`` rows.
+
+    Thread model: :meth:`enqueue` is called from the polling thread and only
+    touches the in-memory queue.  A dedicated daemon thread flushes on size
+    or age; :meth:`flush` may also be called synchronously from any thread
+    (drive end, shutdown).  All database access is serialized by
+    ``_flushLock``, which is what makes the shared connection safe.
+
+    Attributes:
+        database: ObdDatabase providing the persistent connection
+        maxBatchRows: Size flush trigger
+        maxBatchAgeMs: Age flush trigger
+        maxQueueRows: Queue capacity; overflow rows are dropped
+
+    Example:
+        writer = RealtimeBatchWriter(db)
+        writer.start()
+        writer.enqueue((utcIsoNow(), 'RPM', 850.0, 'rpm', 'daily', 7, 'real'))
+        writer.stop()
+    """
+
+    #: Flush thread name and log-line prefix (overridden by subclasses that
+    #: write other tables).
+    threadName: str = 'RealtimeBatchWriter'
+    logLabel: str = 'Realtime batch writer'
+
+    def __init__(
+        self,
+        database: Any,
+        maxBatchRows: int = DEFAULT_MAX_BATCH_ROWS,
+        maxBatchAgeMs: int = DEFAULT_MAX_BATCH_AGE_MS,
+        maxQueueRows: int = DEFAULT_MAX_QUEUE_ROWS,
+        *,
+        monotonicFn: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the batch writer.
+
+        Args:
+            database: ObdDatabase instance exposing
+                ``openPersistentConnection()``.
+            maxBatchRows: Queue length that triggers a flush (minimum 1).
+            maxBatchAgeMs: Age of the oldest queued row that triggers a
+                flush (minimum 1).
+            maxQueueRows: Queue capacity (at least ``maxBatchRows``).
+            monotonicFn: Clock seam for tests.
+
+        Raises:
+            ValueError: If any bound is not positive.
+        """
+        if maxBatchRows < 1 or maxBatchAgeMs < 1 or maxQueueRows < 1:
+            raise ValueError(
+                "batch writer bounds must be positive: "
+                f"maxBatchRows={maxBatchRows} maxBatchAgeMs={maxBatchAgeMs} "
+                f"maxQueueRows={maxQueueRows}"
+            )
+        self.database = database
+        self.maxBatchRows = int(maxBatchRows)
+        self.maxBatchAgeMs = int(maxBatchAgeMs)
+        self.maxQueueRows = max(int(maxQueueRows), self.maxBatchRows)
+        self._monotonicFn = monotonicFn
+
+        self._queue: deque[tuple[Any, ...]] = deque()
+        self._oldestEnqueuedAt: float | None = None
+        self._cond = threading.Condition()
+        self._flushLock = threading.Lock()
+        self._stopEvent = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._conn: sqlite3.Connection | None = None
+
+        self._stats = BatchWriterStats()
+        self._totalFlushLatencyMs = 0.0
+
+    # ================================================================================
+    # Lifecycle
+    # ================================================================================
+
+    @property
+    def isRunning(self) -> bool:
+        """True while the background flush thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> bool:
+        """
+        Start the background flush thread.
+
+        Returns:
+            True if started, False if already running
+        """
+        if self.isRunning:
+            return False
+        self._stopEvent.clear()
+        self._thread = threading.Thread(
+            target=self._flushLoop,
+            name=self.threadName,
+            daemon=True,
+        )
+        self._thread.start()
+        logger.info(
+            "%s started | maxBatchRows=%d | maxBatchAgeMs=%d | maxQueueRows=%d",
+            self.logLabel, self.maxBatchRows, self.maxBatchAgeMs, self.maxQueueRows,
+        )
+        return True
+
+    def stop(self, timeout: float = 5.0) -> bool:
+        """
+        Stop the flush thread, drain the queue and close the connection.
+
+        Safe to call when never started.  The final flush runs on the
+        caller's thread so shutdown does not depend on the flush thread
+        exiting in time.
+
+        Args:
+            timeout: Seconds to wait for the flush thread to exit
+
+        Returns:
+            True if the queue is empty after the final flush
+        """
+        self._stopEvent.set()
+        with self._cond:
+            self._cond.notify_all()
+        if self._thread is not None and self._thread.is_alive():
+            self._thread.join(timeout=timeout)
+            if self._thread.is_alive():
+                logger.warning("%s thread did not stop within timeout", self.logLabel)
+        self._thread = None
+
+        self.flush('stop')
+        with self._flushLock:
+            self._closeConnection()
+
+        drained = self.queueDepth == 0
+        logger.info(
+            "%s stopped | flushed=%d | dropped=%d | flushErrors=%d | pending=%d",
+            self.logLabel, self._stats.rowsFlushed, self._stats.rowsDropped,
+            self._stats.flushErrors, self.queueDepth,
+        )
+        return drained
+
+    # ================================================================================
+    # Producer side
+    # ================================================================================
+
+    @property
+    def queueDepth(self) -> int:
+        """Rows currently waiting for the next flush."""
+        with self._cond:
+            return len(self._queue)
+
+    def enqueue(self, row: tuple[Any, ...]) -> bool:
+        """
+        Queue one fully stamped row (see :data:`REALTIME_ROW_COLUMNS`).
+
+        Never blocks on I/O.  When the queue is at capacity the row is
+        dropped and counted in :attr:`BatchWriterStats.rowsDropped`.
+
+        Args:
+            row: Tuple in :data:`REALTIME_ROW_COLUMNS` order
+
+        Returns:
+            True if queued, False if dropped on overflow
+        """
+        with self._cond:
+            if len(self._queue) >= self.maxQueueRows:
+                self._stats.rowsDropped += 1
+                if self._stats.rowsDropped == 1 or self._stats.rowsDropped % 1000 == 0:
+                    logger.warning(
+                        "%s queue full -- dropping rows | capacity=%d | dropped=%d",
+                        self.logLabel, self.maxQueueRows, self._stats.rowsDropped,
+                    )
+                return False
+            if not self._queue:
+                self._oldestEnqueuedAt = self._monotonicFn()
+            self._queue.append(row)
+            self._stats.rowsEnqueued += 1
+            depth = len(self._queue)
+            if depth > self._stats.peakQueueDepth:
+                self._stats.peakQueueDepth = depth
+            if depth >= self.maxBatchRows:
+                self._cond.notify_all()
+        return True
+
+    # ================================================================================
+    # Flush side
+    # ================================================================================
+
+    def flush(self, reason: str = 'forced') -> int:
+        """
+        Write every queued row in one transaction.
+
+        On failure the batch is put back at the head of the queue (rows
+        that no longer fit are counted as dropped) and the connection is
+        discarded so the next flush reopens it.
+
+        Args:
+            reason: Trigger label recorded in ``flushesByReason``
+
+        Returns:
+            Number of rows committed (0 on an empty queue or failure)
+        """
+        with self._flushLock:
+            with self._cond:
+                if not self._queue:
+                    return 0
+                batch = list(self._queue)
+                self._queue.clear()
+                self._oldestEnqueuedAt = None
+
+            startTime = time.perf_counter()
+            try:
+                conn = self._ensureConnection()
+                with conn:
+                    self._writeBatch(conn, batch)
+            except Exception as e:  # noqa: BLE001 -- requeue, never crash the writer
+                self._requeueFailedBatch(batch)
+                self._stats.flushErrors += 1
+                self._closeConnection()
+                logger.warning(
+                    "%s flush failed | reason=%s | rows=%d | error=%s",
+                    self.logLabel, reason, len(batch), e,
+                )
+                return 0
+
+            latencyMs = (time.perf_counter() - startTime) * 1000.0
+            self._recordFlush(reason, len(batch), latencyMs)
+            logger.debug(
+                "%s flushed | reason=%s | rows=%d | latencyMs=%.1f",
+                self.logLabel, reason, len(batch), latencyMs,
+            )
+            return len(batch)
+
+    def getStats(self) -> BatchWriterStats:
+        """
+        Get a snapshot of the writer counters.
+
+        Returns:
+            BatchWriterStats copy with the current queue depth filled in
+        """
+        with self._cond:
+            depth = len(self._queue)
+        with self._flushLock:
+            return BatchWriterStats(
+                queueDepth=depth,
+                peakQueueDepth=self._stats.peakQueueDepth,
+                rowsEnqueued=self._stats.rowsEnqueued,
+                rowsFlushed=self._stats.rowsFlushed,
+                rowsDropped=self._stats.rowsDropped,
+                flushCount=self._stats.flushCount,
+                flushErrors=self._stats.flushErrors,
+                flushesByReason=dict(self._stats.flushesByReason),
+                lastFlushLatencyMs=self._stats.lastFlushLatencyMs,
+                maxFlushLatencyMs=self._stats.maxFlushLatencyMs,
+                averageFlushLatencyMs=self._stats.averageFlushLatencyMs,
+            )
+
+    def _writeBatch(self, conn: sqlite3.Connection, batch: list[tuple[Any, ...]]) -> None:
+        """Write one batch inside the flush transaction.  Caller holds _flushLock."""
+        conn.executemany(_INSERT_SQL, batch)
+
+    def _flushLoop(self) -> None:
+        """Background loop: sleep until a size/age trigger is due, then flush."""
+        while not self._stopEvent.is_set():
+            with self._cond:
+                reason = self._dueReason()
+                if reason is None:
+                    self._cond.wait(timeout=self._secondsUntilAgeDue())
+                    reason = self._dueReason()
+            if reason is not None and not self._stopEvent.is_set():
+                self.flush(reason)
+
+    def _dueReason(self) -> str | None:
+        """Return the flush trigger that is due, if any.  Caller holds _cond."""
+        if len(self._queue) >= self.maxBatchRows:
+            return 'size'
+        if self._oldestEnqueuedAt is not None:
+            ageMs = (self._monotonicFn() - self._oldestEnqueuedAt) * 1000.0
+            if ageMs >= self.maxBatchAgeMs:
+                return 'age'
+        return None
+
+    def _secondsUntilAgeDue(self) -> float:
+        """Seconds until the oldest row ages out.  Caller holds _cond."""
+        if self._oldestEnqueuedAt is None:
+            return self.maxBatchAgeMs / 1000.0
+        elapsed = self._monotonicFn() - self._oldestEnqueuedAt
+        return max(0.01, self.maxBatchAgeMs / 1000.0 - elapsed)
+
+    def _ensureConnection(self) -> sqlite3.Connection:
+        """Open the persistent connection on first use.  Caller holds _flushLock."""
+        if self._conn is None:
+            self._conn = self.database.openPersistentConnection()
+        return self._conn
+
+    def _closeConnection(self) -> None:
+        """Close and forget the persistent connection.  Caller holds _flushLock."""
+        if self._conn is None:
+            return
+        try:
+            self._conn.close()
+        except Exception as e:  # noqa: BLE001 -- already failing, just log
+            logger.debug("%s close failed: %s", self.logLabel, e)
+        self._conn = None
+
+    def _requeueFailedBatch(self, batch: list[tuple[Any, ...]]) -> None:
+        """Put a failed batch back at the head of the queue, oldest first."""
+        with self._cond:
+            room = self.maxQueueRows - len(self._queue)
+            keep = batch[:max(0, room)]
+            self._stats.rowsDropped += len(batch) - len(keep)
+            self._queue.extendleft(reversed(keep))
+            if self._queue:
+                self._oldestEnqueuedAt = self._monotonicFn()
+
+    def _recordFlush(self, reason: str, rowCount: int, latencyMs: float) -> None:
+        """Update flush counters.  Caller holds _flushLock."""
+        self._stats.rowsFlushed += rowCount
+        self._stats.flushCount += 1
+        self._stats.flushesByReason[reason] = self._stats.flushesByReason.get(reason, 0) + 1
+        self._stats.lastFlushLatencyMs = latencyMs
+        if latencyMs > self._stats.maxFlushLatencyMs:
+            self._stats.maxFlushLatencyMs = latencyMs
+        self._totalFlushLatencyMs += latencyMs
+        self._stats.averageFlushLatencyMs = self._totalFlushLatencyMs / self._stats.flushCount
+
+
+class RealtimeFrameWriter(RealtimeBatchWriter):
+    """
+    Batch writer that stores each flush as ``realtime_frames`` cycle rows.
+
+    Same queue, triggers, stats and drop semantics as
+    :class:`RealtimeBatchWriter`; only the write step differs.  The PID
+    dictionary / layout id caches live in a :class:`FramePacker` and are
+    dropped whenever a flush fails, because the rolled-back transaction
+    may have taken freshly minted ids with it.
+    """
+
+    def __init__(self, database: Any, *args: Any, **kwargs: Any):
+        super().__init__(database, *args, **kwargs)
+        self._packer = FramePacker()
+
+    def _writeBatch(self, conn: sqlite3.Connection, batch: list[tuple[Any, ...]]) -> None:
+        """Pack the batch into frames.  Caller holds _flushLock."""
+        try:
+            self._packer.writeRows(conn, batch)
+        except Exception:
+            self._packer.reset()
+            raise
+
+
+def createBatchWriterFromConfig(config: dict[str, Any], database: Any) -> RealtimeBatchWriter | None:
+    """
+    Create a RealtimeBatchWriter from ``pi.realtimeData.batchWriter``.
+
+    ``pi.realtimeData.storageFormat = 'frames'`` selects
+    :class:`RealtimeFrameWriter`; frame storage always goes through the
+    batch writer, so it forces the writer on even when
+    ``batchWriter.enabled`` is false.
+
+    Args:
+        config: Configuration dictionary
+        database: ObdDatabase instance
+
+    Returns:
+        Configured writer, or None when the section is absent or
+        ``enabled`` is false in row storage (legacy row-at-a-time path)
+    """
+    realtimeSection = config.get('pi', {}).get('realtimeData', {})
+    section = realtimeSection.get('batchWriter', {})
+    storageFormat = realtimeSection.get('storageFormat', STORAGE_FORMAT_ROWS)
+    if storageFormat not in (STORAGE_FORMAT_ROWS, STORAGE_FORMAT_FRAMES):
+        logger.warning(
+            "Unknown pi.realtimeData.storageFormat=%r -- using %r",
+            storageFormat, STORAGE_FORMAT_ROWS,
+        )
+        storageFormat = STORAGE_FORMAT_ROWS
+    useFrames = storageFormat == STORAGE_FORMAT_FRAMES
+    if database is None or not (section.get('enabled', False) or useFrames):
+        return None
+    writerClass = RealtimeFrameWriter if useFrames else RealtimeBatchWriter
+    return writerClass(
+        database,
+        maxBatchRows=section.get('maxBatchRows', DEFAULT_MAX_BATCH_ROWS),
+        maxBatchAgeMs=section.get('maxBatchAgeMs', DEFAULT_MAX_BATCH_AGE_MS),
+        maxQueueRows=section.get('maxQueueRows', DEFAULT_MAX_QUEUE_ROWS),
+    )
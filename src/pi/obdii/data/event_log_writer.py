@@ -0,0 +1,272 @@
+################################################################################
+# File Name: event_log_writer.py
+# Purpose/Description: Shared write-behind writer for the auxiliary event
+#                      tables (alert_log, connection_log, power_log)
+# Author: Rex
+# Creation Date: 2026-10-17
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-17    | Rex          | Initial -- one low-priority queue for every
+#                               auxiliary event row; flush on size, age,
+#                               shutdown stage and stop.
+# ================================================================================
+################################################################################
+"""
+Write-behind writer for the auxiliary event tables.
+
+``AlertManager``, ``power_db`` and the connection event writers used to open
+a fresh connection, insert one row and commit.  An overheating episode or a
+flapping Bluetooth adapter turns that into a burst of fsyncs on the SD card
+the capture path is writing to.
+
+:class:`EventLogWriter` is a :class:`RealtimeBatchWriter` whose queued rows
+are ``(sql, params)`` pairs, so one queue and one long-lived connection
+serve ``alert_log``, ``connection_log`` and ``power_log``.  Consecutive
+rows with the same statement are written with one ``executemany``; order
+across tables is preserved.
+
+Flush triggers:
+
+- ``size`` / ``age``: as the realtime writer, with a larger batch and a
+  longer age window -- these rows are diagnostics, not capture
+- ``shutdown_stage``: :func:`flushEventLog` from ``logShutdownStage`` before
+  the stage row itself is written synchronously, so the forensic timeline
+  reaches disk ahead of the power-down ladder
+- ``stop``: orchestrator shutdown drains the queue on the caller's thread
+
+The flush thread lowers its own scheduling priority where the OS allows it;
+synchronous flushes run at the caller's priority.
+
+The writer is attached to the database (``ObdDatabase.eventLogWriter``) so
+producers that only hold the database handle reach it through
+:func:`writeEventRow`, which falls back to the one-row-per-connection path
+when no writer is running.
+
+Usage:
+    from src.pi.obdii.data.event_log_writer import writeEventRow
+
+    writeEventRow(
+        database,
+        "INSERT INTO alert_log (timestamp, alert_type) VALUES (?, ?)",
+        (utcIsoNow(), 'rpm_redline'),
+    )
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from collections.abc import Sequence
+from itertools import groupby
+from typing import Any
+
+from .batch_writer import RealtimeBatchWriter
+
+logger = logging.getLogger(__name__)
+
+# ================================================================================
+# Constants
+# ================================================================================
+
+#: Flush once this many event rows are queued.  Only reached during bursts
+#: (alert storms, adapter flaps); normal traffic flushes on age.
+DEFAULT_EVENT_MAX_BATCH_ROWS: int = 100
+
+#: Flush once the oldest queued event row is this old.
+DEFAULT_EVENT_MAX_BATCH_AGE_MS: int = 5000
+
+#: Hard cap on queued event rows; overflow is dropped and counted.
+DEFAULT_EVENT_MAX_QUEUE_ROWS: int = 2000
+
+#: Niceness added to the background flush thread (Linux applies
+#: ``setpriority`` per thread).
+FLUSH_THREAD_NICENESS: int = 10
+
+
+class EventLogWriter(RealtimeBatchWriter):
+    """
+    Bounded write-behind queue for auxiliary event rows.
+
+    Same queue, triggers, stats and drop semantics as
+    :class:`RealtimeBatchWriter`; each queued row is an ``(sql, params)``
+    pair instead of a ``realtime_data`` tuple.
+
+    Example:
+        writer = EventLogWriter(db)
+        db.eventLogWriter = writer
+        writer.start()
+        writer.enqueueEvent("INSERT INTO power_log ...", params)
+        writer.stop()
+    """
+
+    threadName = 'EventLogWriter'
+    logLabel = 'Event log writer'
+
+    def __init__(
+        self,
+        database: Any,
+        maxBatchRows: int = DEFAULT_EVENT_MAX_BATCH_ROWS,
+        maxBatchAgeMs: int = DEFAULT_EVENT_MAX_BATCH_AGE_MS,
+        maxQueueRows: int = DEFAULT_EVENT_MAX_QUEUE_ROWS,
+        **kwargs: Any,
+    ):
+        super().__init__(database, maxBatchRows, maxBatchAgeMs, maxQueueRows, **kwargs)
+
+    def enqueueEvent(self, sql: str, params: Sequence[Any]) -> bool:
+        """
+        Queue one INSERT for the next flush.
+
+        Args:
+            sql: Parameterized statement
+            params: Fully stamped parameters (timestamps taken now, not at
+                flush time)
+
+        Returns:
+            True if queued, False if dropped on overflow
+        """
+        return self.enqueue((sql, tuple(params)))
+
+    def _writeBatch(self, conn: sqlite3.Connection, batch: list[tuple[Any, ...]]) -> None:
+        """
+        One executemany per run of identical statements.  Caller holds _flushLock.
+
+        A row the schema rejects (say an alert for a profile id that is not
+        in ``profiles``) would otherwise fail and requeue the whole mixed
+        batch forever.  The failing run is rolled back to its savepoint and
+        retried row by row; rejected rows are dropped and counted, as the
+        one-row-per-connection path effectively did.
+        """
+        if not conn.in_transaction:
+            conn.execute("BEGIN")
+        for sql, group in groupby(batch, key=lambda row: row[0]):
+            rows = [params for _sql, params in group]
+            conn.execute("SAVEPOINT event_log_run")
+            try:
+                conn.executemany(sql, rows)
+            except sqlite3.IntegrityError:
+                conn.execute("ROLLBACK TO event_log_run")
+                self._writeRowsSkippingRejects(conn, sql, rows)
+            conn.execute("RELEASE event_log_run")
+
+    def _writeRowsSkippingRejects(
+        self,
+        conn: sqlite3.Connection,
+        sql: str,
+        rows: list[tuple[Any, ...]],
+    ) -> None:
+        """Insert rows one at a time, dropping those that violate a constraint."""
+        rejected = 0
+        for params in rows:
+            try:
+                conn.execute(sql, params)
+            except sqlite3.IntegrityError as e:
+                rejected += 1
+                logger.warning(
+                    "Event log row rejected | statement=%s | error=%s",
+                    sql.split('(')[0].strip(), e,
+                )
+        with self._cond:
+            self._stats.rowsDropped += rejected
+
+    def _flushLoop(self) -> None:
+        """Lower this thread's priority, then run the size/age loop."""
+        try:
+            os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), FLUSH_THREAD_NICENESS)
+        except (AttributeError, OSError) as e:
+            logger.debug("Event log writer priority unchanged: %s", e)
+        super()._flushLoop()
+
+
+# ================================================================================
+# Producer helpers
+# ================================================================================
+
+
+def _runningWriter(database: Any) -> EventLogWriter | None:
+    """Writer attached to ``database`` if its flush thread is running."""
+    writer = getattr(database, 'eventLogWriter', None)
+    # ``is True``: a mocked database hands back a mock writer whose
+    # isRunning is truthy but not True; those keep the direct path.
+    if writer is not None and getattr(writer, 'isRunning', False) is True:
+        return writer
+    return None
+
+
+def writeEventRow(database: Any, sql: str, params: Sequence[Any]) -> None:
+    """
+    Queue an event row on the database's writer, or write it now.
+
+    Without a running writer (writer disabled, not started yet, already
+    stopped, or a test double) the row is written with a fresh
+    ``database.connect()`` exactly as before.
+
+    Args:
+        database: ObdDatabase instance
+        sql: Parameterized INSERT
+        params: Parameters, stamped by the caller
+
+    Raises:
+        Exception: Errors from the direct write propagate; callers keep
+            their own handling.
+    """
+    writer = _runningWriter(database)
+    if writer is not None:
+        writer.enqueueEvent(sql, params)
+        return
+    with database.connect() as conn:
+        conn.execute(sql, tuple(params))
+
+
+def flushEventLog(database: Any, reason: str = 'forced') -> int:
+    """
+    Synchronously flush the database's event log writer, if running.
+
+    A stopped writer has already drained, and rows written while no
+    writer runs go straight to disk, so there is nothing else to flush.
+
+    Args:
+        database: ObdDatabase instance (or None)
+        reason: Trigger label recorded in ``flushesByReason``
+
+    Returns:
+        Rows committed (0 when there is no writer or nothing queued)
+    """
+    writer = _runningWriter(database)
+    return 0 if writer is None else writer.flush(reason)
+
+
+def createEventLogWriterFromConfig(config: dict[str, Any], database: Any) -> EventLogWriter | None:
+    """
+    Create an EventLogWriter from ``pi.database.eventLog``.
+
+    Args:
+        config: Configuration dictionary
+        database: ObdDatabase instance
+
+    Returns:
+        Configured (not started) writer, or None when disabled
+    """
+    section = config.get('pi', {}).get('database', {}).get('eventLog', {})
+    if database is None or not section.get('enabled', False):
+        return None
+    return EventLogWriter(
+        database,
+        maxBatchRows=section.get('maxBatchRows', DEFAULT_EVENT_MAX_BATCH_ROWS),
+        maxBatchAgeMs=section.get('maxBatchAgeMs', DEFAULT_EVENT_MAX_BATCH_AGE_MS),
+        maxQueueRows=section.get('maxQueueRows', DEFAULT_EVENT_MAX_QUEUE_ROWS),
+    )
+
+
+__all__ = [
+    'DEFAULT_EVENT_MAX_BATCH_AGE_MS',
+    'DEFAULT_EVENT_MAX_BATCH_ROWS',
+    'DEFAULT_EVENT_MAX_QUEUE_ROWS',
+    'EventLogWriter',
+    'createEventLogWriterFromConfig',
+    'flushEventLog',
+    'writeEventRow',
+]
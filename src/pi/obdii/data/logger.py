@@ -29,6 +29,16 @@
 #                               realtime_data INSERTs instead of relying
 #                               on the schema DEFAULT.  Closes the
 #                               simulator-tags-as-real hygiene bug.
+# 2026-10-16    | Rex          | Optional batchWriter: logReading stamps the
+#                               row and hands it to the write-behind queue
+#                               instead of opening a connection per row.
+# 2026-10-16    | Rex          | queryParameterBatch(): one cycle's PIDs via
+#                               connection.queryBatch (multi-PID Mode 01);
+#                               response -> LoggedReading shared through
+#                               _buildReading with the single-PID paths.
+# 2026-10-17    | Rex          | Batched reads keep the v2 pid debug record
+#                               and are stamped when python-obd parsed
+#                               their demultiplexed response.
 # ================================================================================
 ################################################################################
 """
@@ -100,6 +110,23 @@ def _resolveDataSource(
     return DATA_SOURCE_DEFAULT
 
 
+def _commandKey(cmd: Any) -> str:
+    """Key used by ``connection.queryBatch`` results (command name)."""
+    return cmd if isinstance(cmd, str) else getattr(cmd, 'name', str(cmd))
+
+
+def _parsedAt(response: Any) -> datetime:
+    """When python-obd built ``response`` (``OBDResponse.time``), else now.
+
+    A multi-PID reply is split into one response per PID as it is parsed,
+    so this is the read time of that PID rather than of the whole batch.
+    """
+    parsedTime = getattr(response, 'time', None)
+    if isinstance(parsedTime, (int, float)) and not isinstance(parsedTime, bool):
+        return datetime.fromtimestamp(parsedTime)
+    return datetime.now()
+
+
 class ObdDataLogger:
     """
     Manages OBD-II data logging operations.
@@ -135,6 +162,7 @@ class ObdDataLogger:
         database: Any,
         profileId: str | None = None,
         dataSource: str | None = None,
+        batchWriter: Any | None = None,
     ):
         """
         Initialize the data logger.
@@ -151,6 +179,11 @@ class ObdDataLogger:
                 otherwise :data:`DATA_SOURCE_DEFAULT` (``'real'``).
                 US-212: this override is the call-site fix for the
                 simulator-feeds-live-writer hygiene bug.
+            batchWriter: Optional
+                :class:`~src.pi.obdii.data.batch_writer.RealtimeBatchWriter`.
+                When set, :meth:`logReading` queues the stamped row instead
+                of inserting it on a fresh connection.  The owner (usually
+                :class:`RealtimeDataLogger`) starts/stops the writer.
 
         Raises:
             ValueError: If ``dataSource`` is not in
@@ -160,6 +193,7 @@ class ObdDataLogger:
         self.database = database
         self.profileId = profileId
         self.dataSource = _resolveDataSource(connection, dataSource)
+        self.batchWriter = batchWriter
 
         # Statistics tracking
         self._totalReadings = 0
@@ -226,30 +260,7 @@ class ObdDataLogger:
                     details={'parameter': parameterName}
                 )
 
-            # Extract value and unit
-            value = self._extractValue(response)
-            unit = self._extractUnit(response)
-
-            # Create reading
-            timestamp = datetime.now()
-            reading = LoggedReading(
-                parameterName=parameterName,
-                value=value,
-                unit=unit,
-                timestamp=timestamp,
-                profileId=self.profileId
-            )
-
-            # Update stats
-            self._totalReadings += 1
-            self._lastReadingTime = timestamp
-            self._recordLatest(parameterName, value)
-
-            logger.debug(
-                f"Read parameter | name={parameterName} | value={value} | unit={unit}"
-            )
-
-            return reading
+            return self._buildReading(parameterName, response, None)
 
         except (ParameterReadError, ParameterNotSupportedError):
             raise
@@ -295,25 +306,7 @@ class ObdDataLogger:
                     details={'parameter': parameterName, 'pid': entry.pidCode},
                 )
 
-            decoded: DecodedReading = entry.decoder(response)
-            timestamp = datetime.now()
-            unit = decoded.textLabel if decoded.textLabel is not None else decoded.unit
-            reading = LoggedReading(
-                parameterName=parameterName,
-                value=decoded.valueNumeric,
-                unit=unit,
-                timestamp=timestamp,
-                profileId=self.profileId,
-            )
-
-            self._totalReadings += 1
-            self._lastReadingTime = timestamp
-            self._recordLatest(parameterName, decoded.valueNumeric)
-            logger.debug(
-                "Read v2 parameter | name=%s | pid=%s | value=%s | unit=%s",
-                parameterName, entry.pidCode, decoded.valueNumeric, unit,
-            )
-            return reading
+            return self._buildReading(parameterName, response, entry)
         except (ParameterReadError, ParameterNotSupportedError):
             raise
         except Exception as e:
@@ -323,15 +316,119 @@ class ObdDataLogger:
                 details={'parameter': parameterName, 'pid': entry.pidCode, 'error': str(e)},
             ) from e
 
+    def _buildReading(
+        self,
+        parameterName: str,
+        response: Any,
+        entry: ParameterDecoderEntry | None,
+        timestamp: datetime | None = None,
+    ) -> LoggedReading:
+        """Turn a non-null response into a LoggedReading and update stats.
+
+        Spool v2 parameters run their registry decoder (enum textLabel
+        replaces the unit); legacy parameters take the response value and
+        unit as-is.  ``timestamp`` defaults to now.
+        """
+        if entry is not None:
+            decoded: DecodedReading = entry.decoder(response)
+            value = decoded.valueNumeric
+            unit = decoded.textLabel if decoded.textLabel is not None else decoded.unit
+        else:
+            value = self._extractValue(response)
+            unit = self._extractUnit(response)
+
+        if timestamp is None:
+            timestamp = datetime.now()
+        reading = LoggedReading(
+            parameterName=parameterName,
+            value=value,
+            unit=unit,
+            timestamp=timestamp,
+            profileId=self.profileId,
+        )
+
+        self._totalReadings += 1
+        self._lastReadingTime = timestamp
+        self._recordLatest(parameterName, value)
+        if entry is not None:
+            logger.debug(
+                "Read v2 parameter | name=%s | pid=%s | value=%s | unit=%s",
+                parameterName, entry.pidCode, value, unit,
+            )
+        else:
+            logger.debug(
+                f"Read parameter | name={parameterName} | value={value} | unit={unit}"
+            )
+        return reading
+
+    def queryParameterBatch(self, parameterNames: list[str]) -> dict[str, LoggedReading]:
+        """
+        Read several parameters through the connection's multi-PID path.
+
+        Best effort: only parameters the connection served in a batch are
+        returned.  Everything else -- adapter-level commands, PIDs the
+        probe marks unsupported, ECU rejections, null values -- is left
+        for the caller to read with :meth:`queryParameter`, which keeps
+        the per-parameter error semantics intact.
+
+        Args:
+            parameterNames: Parameters due this cycle
+
+        Returns:
+            ``{parameter_name: LoggedReading}`` for every batched read,
+            each stamped when its response was parsed
+        """
+        queryBatch = getattr(self.connection, 'queryBatch', None)
+        if not callable(queryBatch) or not self.connection.isConnected():
+            return {}
+
+        commands: dict[str, Any] = {}
+        entries: dict[str, ParameterDecoderEntry | None] = {}
+        for name in parameterNames:
+            entry = PARAMETER_DECODERS.get(name)
+            if entry is not None:
+                if entry.pidCode is None:
+                    continue  # Adapter command -- not a Mode 01 PID
+                try:
+                    self._assertPidSupported(entry)
+                except ParameterNotSupportedError:
+                    continue  # Single path raises + logs it properly
+                commands[name] = self._getObdCommand(entry.obdCommand)
+            else:
+                commands[name] = self._getObdCommand(name)
+            entries[name] = entry
+        if len(commands) < 2:
+            return {}
+
+        unique = {_commandKey(cmd): cmd for cmd in commands.values()}
+        responses = queryBatch(list(unique.values()))
+
+        readings: dict[str, LoggedReading] = {}
+        for name, cmd in commands.items():
+            response = responses.get(_commandKey(cmd))
+            if response is None or (hasattr(response, 'is_null') and response.is_null()):
+                continue
+            try:
+                readings[name] = self._buildReading(
+                    name, response, entries[name], timestamp=_parsedAt(response),
+                )
+            except Exception as e:  # noqa: BLE001 -- fall back to single read
+                logger.debug(f"Batched decode failed | name={name} | error={e}")
+        return readings
+
     def logReading(self, reading: LoggedReading) -> bool:
         """
         Log a reading to the database.
 
+        With a :attr:`batchWriter` attached the row is stamped here and
+        queued; it reaches ``realtime_data`` on the writer's next flush.
+
         Args:
             reading: LoggedReading to store
 
         Returns:
-            True if logged successfully
+            True if logged (or queued) successfully, False if the batch
+            writer dropped the row because its queue was full
 
         Raises:
             DataLoggerError: If database operation fails
@@ -340,33 +437,40 @@ class ObdDataLogger:
             # Use profile from reading or fall back to logger's profile
             profileId = reading.profileId or self.profileId
 
-            with self.database.connect() as conn:
-                cursor = conn.cursor()
-                # TD-027 / US-203: canonical ISO-8601 UTC via the shared helper.
-                # reading.timestamp may be naive local-time (upstream creates
-                # it via naive datetime.now() in realtime.py:399 and in
-                # queryParameter above); capture rows must be UTC canonical.
-                # US-200: stamp the active drive_id (or NULL if no drive).
-                # US-212: pass self.dataSource explicitly so simulator runs
-                # land as 'physics_sim' instead of inheriting the live-path
-                # DEFAULT 'real'.
-                cursor.execute(
-                    """
-                    INSERT INTO realtime_data
-                    (timestamp, parameter_name, value, unit, profile_id,
-                     drive_id, data_source)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        utcIsoNow(),
-                        reading.parameterName,
-                        reading.value,
-                        reading.unit,
-                        profileId,
-                        getCurrentDriveId(),
-                        self.dataSource,
+            # TD-027 / US-203: canonical ISO-8601 UTC via the shared helper.
+            # reading.timestamp may be naive local-time (upstream creates
+            # it via naive datetime.now() in realtime.py:399 and in
+            # queryParameter above); capture rows must be UTC canonical.
+            # US-200: stamp the active drive_id (or NULL if no drive).
+            # US-212: pass self.dataSource explicitly so simulator runs
+            # land as 'physics_sim' instead of inheriting the live-path
+            # DEFAULT 'real'.  The row is stamped NOW even when batched so
+            # a later flush cannot attribute it to the next drive.
+            row = (
+                utcIsoNow(),
+                reading.parameterName,
+                reading.value,
+                reading.unit,
+                profileId,
+                getCurrentDriveId(),
+                self.dataSource,
+            )
+
+            if self.batchWriter is not None:
+                if not self.batchWriter.enqueue(row):
+                    return False
+            else:
+                with self.database.connect() as conn:
+                    cursor = conn.cursor()
+                    cursor.execute(
+                        """
+                        INSERT INTO realtime_data
+                        (timestamp, parameter_name, value, unit, profile_id,
+                         drive_id, data_source)
+                        VALUES (?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        row,
                     )
-                )
 
             self._totalLogged += 1
 
@@ -10,6 +10,9 @@
 # Date          | Author       | Description
 # ================================================================================
 # 2026-04-12    | Ralph Agent  | Initial implementation for US-136
+# 2026-10-16    | Rex          | TierSchedule + buildTierSchedule(): precomputed
+#                               cycle -> parameter table (O(1) per cycle) that
+#                               drives RealtimeDataLogger's tiered mode.
 # ================================================================================
 ################################################################################
 """
@@ -22,9 +25,15 @@ Implements Spool's tuning-driven 4-tier polling structure:
   Tier 4 (every 30 cycles, ~0.03 Hz): Background monitoring PIDs
 
 Thresholds are loaded from obd_config.json under the pollingTiers key.
+
+:func:`buildTierSchedule` turns a loaded config into a :class:`TierSchedule`:
+the per-cycle parameter sets are precomputed once over one schedule period
+(the LCM of the tier intervals), so the realtime loop does a single tuple
+index per cycle instead of scanning every tier for every parameter.
 """
 
 import logging
+import math
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -197,3 +206,145 @@ def getParametersForCycle(
         if cycleNumber % tier.cycleInterval == 0:
             parameters.extend(p.name for p in tier.parameters)
     return parameters
+
+
+# ================================================================================
+# Precomputed Schedule
+# ================================================================================
+
+
+@dataclass(frozen=True)
+class TierSchedule:
+    """Precomputed cycle -> parameter table for a polling tier config.
+
+    ``cycleTable[i]`` holds the parameters due on every cycle number ``n``
+    with ``n % period == i``; ``period`` is the LCM of all cycle intervals,
+    so the table covers every distinct cycle exactly once.  Cycle 0 polls
+    every parameter (``0 % interval == 0``), which gives the slow tiers a
+    value on the first sweep.
+
+    Attributes:
+        period: Number of cycles after which the schedule repeats
+        cycleTable: Parameters to poll for each cycle index, tier 1 first
+        parameterTiers: Parameter name -> tier number
+        parameterIntervals: Parameter name -> cycle interval
+    """
+
+    period: int
+    cycleTable: tuple[tuple[str, ...], ...]
+    parameterTiers: dict[str, int]
+    parameterIntervals: dict[str, int]
+
+    def parametersForCycle(self, cycleNumber: int) -> tuple[str, ...]:
+        """Get the parameters due on a cycle in O(1).
+
+        Args:
+            cycleNumber: Cycle counter (0-based in the realtime loop)
+
+        Returns:
+            Tuple of parameter names to poll this cycle
+        """
+        return self.cycleTable[cycleNumber % self.period]
+
+    def allParameters(self) -> list[str]:
+        """Get every scheduled parameter in tier order."""
+        return list(self.parameterTiers)
+
+    def tierOf(self, parameterName: str) -> int | None:
+        """Get a parameter's tier number in O(1), or None if unscheduled."""
+        return self.parameterTiers.get(parameterName)
+
+    def targetRateHz(self, parameterName: str, pollingIntervalMs: int) -> float:
+        """Get the sample rate a parameter should reach at a base interval.
+
+        Args:
+            parameterName: Scheduled parameter name
+            pollingIntervalMs: Base cycle interval in milliseconds
+
+        Returns:
+            Target samples per second (0.0 for unscheduled parameters)
+        """
+        interval = self.parameterIntervals.get(parameterName)
+        if interval is None or pollingIntervalMs <= 0:
+            return 0.0
+        return 1000.0 / (pollingIntervalMs * interval)
+
+
+def buildTierSchedule(
+    config: PollingTierConfig,
+    loggedParameters: list[str] | None = None,
+    untieredCycleInterval: int | None = None,
+) -> TierSchedule:
+    """Build the precomputed cycle table for a tier config.
+
+    When ``loggedParameters`` is given, tier entries not in it are left
+    out (the ``logData`` gate still wins) and logged parameters that no
+    tier mentions are scheduled at ``untieredCycleInterval`` -- by default
+    the slowest tier's interval, so an untiered PID never costs more
+    round-trips than a background one.
+
+    Args:
+        config: Loaded polling tier config
+        loggedParameters: Optional parameter names allowed to be polled
+        untieredCycleInterval: Cycle interval for logged-but-untiered names
+
+    Returns:
+        TierSchedule ready for per-cycle lookup
+
+    Raises:
+        ValueError: If a tier interval is not a positive integer or the
+            schedule would be empty
+    """
+    allowed = set(loggedParameters) if loggedParameters is not None else None
+
+    parameterTiers: dict[str, int] = {}
+    parameterIntervals: dict[str, int] = {}
+    for tier in sorted(config.tiers, key=lambda t: t.tier):
+        if tier.cycleInterval < 1:
+            raise ValueError(
+                f"tier{tier.tier} cycleInterval must be >= 1 (got {tier.cycleInterval})"
+            )
+        for param in tier.parameters:
+            if param.name in parameterTiers:
+                continue  # First (fastest-numbered) tier wins
+            if allowed is not None and param.name not in allowed:
+                continue
+            parameterTiers[param.name] = tier.tier
+            parameterIntervals[param.name] = tier.cycleInterval
+
+    if loggedParameters is not None:
+        slowest = max((t.cycleInterval for t in config.tiers), default=1)
+        fallbackInterval = max(1, untieredCycleInterval or slowest)
+        fallbackTier = max((t.tier for t in config.tiers), default=0) + 1
+        for name in loggedParameters:
+            if name not in parameterTiers:
+                parameterTiers[name] = fallbackTier
+                parameterIntervals[name] = fallbackInterval
+
+    if not parameterTiers:
+        raise ValueError("polling tier schedule has no parameters")
+
+    period = 1
+    for interval in set(parameterIntervals.values()):
+        period = math.lcm(period, interval)
+
+    cycleTable = tuple(
+        tuple(
+            name for name, interval in parameterIntervals.items()
+            if index % interval == 0
+        )
+        for index in range(period)
+    )
+
+    logger.info(
+        "Built polling tier schedule | parameters=%d | period=%d cycles | "
+        "everyCycle=%d",
+        len(parameterTiers), period, len(cycleTable[1 % period]),
+    )
+
+    return TierSchedule(
+        period=period,
+        cycleTable=cycleTable,
+        parameterTiers=parameterTiers,
+        parameterIntervals=parameterIntervals,
+    )
@@ -26,6 +26,23 @@
 #                               first successful row.  Lets the health
 #                               check catch a stuck logger in 60s instead
 #                               of 11h.  _monotonicFn is the test seam.
+# 2026-10-16    | Rex          | Optional write-behind batch writer
+#                               (pi.realtimeData.batchWriter): started with
+#                               the polling thread, drained by stop() so the
+#                               shutdown + power-down ladder never strand
+#                               queued rows; flushPendingWrites() for the
+#                               drive-end hook; getWriterStats() counters.
+# 2026-10-16    | Rex          | Tiered scheduler mode
+#                               (pi.realtimeData.schedulerMode='tiered'):
+#                               per-cycle PID set from the precomputed
+#                               pollingTiers TierSchedule; getSampleRates()
+#                               reports achieved vs target per-PID rates.
+# 2026-10-16    | Rex          | Multi-PID prefetch per cycle
+#                               (pi.realtimeData.multiPidQueries): batched
+#                               Mode 01 reads first, single-PID fallback for
+#                               anything the batch did not serve.
+# 2026-10-17    | Rex          | Batched readings keep their parse-time
+#                               stamp instead of the poll loop's clock.
 # ================================================================================
 ################################################################################
 """
@@ -37,6 +54,8 @@ interval and logs readings to the database.
 Features:
 - Configurable polling interval (default: 1000ms)
 - Only logs parameters with logData=True
+- Optional tiered scheduling from pi.pollingTiers (fast tiers every
+  cycle, slow tiers every Nth cycle)
 - Millisecond timestamp precision
 - Graceful handling of unavailable parameters
 - Profile-associated data logging
@@ -69,9 +88,17 @@ from datetime import datetime
 from typing import Any
 
 from ..error_classification import CaptureErrorClass, classifyCaptureError
+from .batch_writer import RealtimeBatchWriter, createBatchWriterFromConfig
 from .exceptions import DataLoggerError, ParameterNotSupportedError, ParameterReadError
 from .logger import ObdDataLogger
-from .types import LoggedReading, LoggingState, LoggingStats
+from .polling_tiers import TierSchedule, buildTierSchedule, loadPollingTiers
+from .types import (
+    BatchWriterStats,
+    LoggedReading,
+    LoggingState,
+    LoggingStats,
+    ParameterSampleRate,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -83,6 +110,11 @@ logger = logging.getLogger(__name__)
 #: the engine comes back. Exposed via the constructor for tests.
 DEFAULT_ECU_SILENT_MULTIPLIER: int = 5
 
+#: ``pi.realtimeData.schedulerMode`` values.  ``flat`` polls every logged
+#: parameter on every cycle (legacy); ``tiered`` polls per pi.pollingTiers.
+SCHEDULER_MODE_FLAT: str = 'flat'
+SCHEDULER_MODE_TIERED: str = 'tiered'
+
 
 class RealtimeDataLogger:
     """
@@ -134,6 +166,7 @@ class RealtimeDataLogger:
         captureErrorHandler: Callable[[BaseException], CaptureErrorClass] | None = None,
         onFatalError: Callable[[BaseException], None] | None = None,
         ecuSilentMultiplier: int = DEFAULT_ECU_SILENT_MULTIPLIER,
+        batchWriter: RealtimeBatchWriter | None = None,
     ):
         """
         Initialize the realtime data logger.
@@ -167,6 +200,10 @@ class RealtimeDataLogger:
                 reported ECU_SILENT.  Cleared on the first successful
                 query so the loop snaps back to normal cadence when
                 the ECU wakes up.
+            batchWriter: Write-behind writer for ``realtime_data`` rows.
+                When omitted, one is built from
+                ``pi.realtimeData.batchWriter`` (``None`` when that
+                section is absent or disabled -- legacy per-row commits).
         """
         self.config = config
         self.connection = connection
@@ -183,6 +220,17 @@ class RealtimeDataLogger:
         self._pollingIntervalMs = self._getPollingInterval()
         self._parameters = self._getLoggedParameterNames()
 
+        # Tiered scheduling: the per-cycle parameter set comes from a
+        # precomputed table instead of the flat list.  None = flat mode.
+        self._tierSchedule = self._buildTierSchedule()
+        if self._tierSchedule is not None:
+            self._parameters = self._tierSchedule.allParameters()
+        self._scheduleCycle = 0
+        self._rateWindowStart: float | None = None
+        self._multiPidQueries = bool(
+            config.get('pi', {}).get('realtimeData', {}).get('multiPidQueries', False)
+        )
+
         # Thread control
         self._state = LoggingState.STOPPED
         self._stopEvent = threading.Event()
@@ -193,10 +241,18 @@ class RealtimeDataLogger:
         self._stats = LoggingStats()
         self._cycleTimes: list[float] = []
 
+        # Write-behind batching: rows are queued by the inner logger and
+        # committed in one transaction per flush instead of one
+        # connection + fsync per row.
+        if batchWriter is None:
+            batchWriter = createBatchWriterFromConfig(config, database)
+        self._batchWriter = batchWriter
+
         # Internal data logger for actual queries
         self._dataLogger = ObdDataLogger(
             connection, database,
             profileId=self.profileId, dataSource=dataSource,
+            batchWriter=self._batchWriter,
         )
 
         # Callbacks
@@ -321,6 +377,39 @@ class RealtimeDataLogger:
 
         return loggedParams
 
+    def _buildTierSchedule(self) -> TierSchedule | None:
+        """
+        Build the tier schedule when ``schedulerMode`` is ``tiered``.
+
+        Falls back to flat mode (with a warning) when the pollingTiers
+        section is missing or unusable, so a config typo never stops
+        capture.
+
+        Returns:
+            TierSchedule for tiered mode, None for flat mode
+        """
+        realtimeConfig = self.config.get('pi', {}).get('realtimeData', {})
+        mode = realtimeConfig.get('schedulerMode', SCHEDULER_MODE_FLAT)
+        if mode != SCHEDULER_MODE_TIERED:
+            if mode != SCHEDULER_MODE_FLAT:
+                logger.warning(f"Unknown schedulerMode {mode!r}, polling flat")
+            return None
+        if not self._parameters:
+            return None
+        try:
+            tierConfig = loadPollingTiers(self.config)
+            return buildTierSchedule(tierConfig, loggedParameters=self._parameters)
+        except (KeyError, ValueError, TypeError) as e:
+            logger.warning(f"Tiered scheduler unavailable, polling flat: {e}")
+            return None
+
+    @property
+    def schedulerMode(self) -> str:
+        """Active scheduler mode ('flat' or 'tiered')."""
+        if self._tierSchedule is not None:
+            return SCHEDULER_MODE_TIERED
+        return SCHEDULER_MODE_FLAT
+
     def setPollingInterval(self, intervalMs: int) -> None:
         """
         Update the polling interval.
@@ -391,6 +480,11 @@ class RealtimeDataLogger:
             self._stats = LoggingStats()
             self._stats.startTime = datetime.now()
             self._cycleTimes = []
+            self._scheduleCycle = 0
+            self._rateWindowStart = self._monotonicFn()
+
+            if self._batchWriter is not None:
+                self._batchWriter.start()
 
             # Start background thread
             self._thread = threading.Thread(
@@ -404,6 +498,7 @@ class RealtimeDataLogger:
                 f"Realtime logging started | "
                 f"parameters={len(self._parameters)} | "
                 f"interval={self._pollingIntervalMs}ms | "
+                f"scheduler={self.schedulerMode} | "
                 f"profile={self.profileId}"
             )
 
@@ -420,10 +515,15 @@ class RealtimeDataLogger:
             True if stopped successfully, False if timeout
         """
         with self._lock:
-            if self._state == LoggingState.STOPPED:
-                return True
-
-            self._state = LoggingState.STOPPING
+            alreadyStopped = self._state == LoggingState.STOPPED
+            if not alreadyStopped:
+                self._state = LoggingState.STOPPING
+
+        if alreadyStopped:
+            # Still drain: rows may have been queued by a direct
+            # logReading call while the polling loop was not running.
+            self._drainBatchWriter()
+            return True
 
         # Signal thread to stop
         self._stopEvent.set()
@@ -434,8 +534,13 @@ class RealtimeDataLogger:
 
             if self._thread.is_alive():
                 logger.warning("Realtime logging thread did not stop within timeout")
+                self._drainBatchWriter()
                 return False
 
+        # Polling thread has exited -- no more producers, so the final
+        # flush captures every row of the session.
+        self._drainBatchWriter()
+
         with self._lock:
             self._state = LoggingState.STOPPED
             self._stats.endTime = datetime.now()
@@ -446,6 +551,7 @@ class RealtimeDataLogger:
             f"logged={self._stats.totalLogged} | "
             f"errors={self._stats.totalErrors}"
         )
+        self._logSampleRates()
 
         return True
 
@@ -511,20 +617,28 @@ class RealtimeDataLogger:
         (BT drop, ECU silent, fatal) are routed through
         :attr:`_captureErrorHandler` so the collector recovers in-process
         instead of polling a dead connection until systemd bounces it.
+        In tiered mode only the parameters due this cycle are read; with
+        multi-PID queries enabled they are first fetched in batches and
+        only the leftovers are read one at a time.
         """
-        for paramName in self._parameters:
+        cycleParameters = self._nextCycleParameters()
+        batched = self._prefetchBatch(cycleParameters)
+
+        for paramName in cycleParameters:
             if self._stopEvent.is_set():
                 break
 
             try:
-                # Query the parameter - use high-precision timestamp
-                timestamp = datetime.now()  # Includes microseconds
-
-                reading = self._queryParameterSafe(paramName)
+                # Batched readings carry the time their response was
+                # parsed; a single query is stamped just before it is sent.
+                reading = batched.get(paramName)
+                if reading is None:
+                    timestamp = datetime.now()  # Includes microseconds
+                    reading = self._queryParameterSafe(paramName)
+                    if reading is not None:
+                        reading.timestamp = timestamp
 
                 if reading is not None:
-                    # Override timestamp for millisecond precision
-                    reading.timestamp = timestamp
 
                     # Log to database
                     self._logReadingSafe(reading)
@@ -555,6 +669,37 @@ class RealtimeDataLogger:
                     break  # Handler consumed; restart cycle next tick.
                 self._handleParameterError(paramName, e)
 
+    def _nextCycleParameters(self) -> tuple[str, ...] | list[str]:
+        """
+        Get the parameters to read this cycle and advance the cycle counter.
+
+        Returns:
+            Scheduled subset in tiered mode, every logged parameter in flat
+        """
+        if self._tierSchedule is None:
+            return self._parameters
+        cycleNumber = self._scheduleCycle
+        self._scheduleCycle += 1
+        return self._tierSchedule.parametersForCycle(cycleNumber)
+
+    def _prefetchBatch(self, parameterNames: tuple[str, ...] | list[str]) -> dict[str, LoggedReading]:
+        """
+        Read this cycle's parameters through the multi-PID path.
+
+        Never raises: a failed batch just means every parameter takes the
+        single-PID path, which owns error classification.
+
+        Returns:
+            ``{parameter_name: LoggedReading}`` for batched reads
+        """
+        if not self._multiPidQueries or len(parameterNames) < 2:
+            return {}
+        try:
+            return self._dataLogger.queryParameterBatch(list(parameterNames))
+        except Exception as e:  # noqa: BLE001 -- single-PID path takes over
+            logger.debug(f"Multi-PID batch failed, reading singly: {e}")
+            return {}
+
     def _queryParameterSafe(self, parameterName: str) -> LoggedReading | None:
         """
         Query a parameter safely, catching and handling errors.
@@ -683,7 +828,10 @@ class RealtimeDataLogger:
             True if logged successfully
         """
         try:
-            self._dataLogger.logReading(reading)
+            if not self._dataLogger.logReading(reading):
+                # Batch writer queue full -- counted in its rowsDropped.
+                self._stats.totalErrors += 1
+                return False
             self._stats.totalLogged += 1
             # US-302: bump the freshness timestamp ONLY on successful
             # writes -- a logging failure must NOT reset the clock or
@@ -742,3 +890,93 @@ class RealtimeDataLogger:
             Polling interval in milliseconds
         """
         return self._pollingIntervalMs
+
+    def getSampleRates(self) -> list[ParameterSampleRate]:
+        """
+        Get achieved vs target sample rate for every polled parameter.
+
+        Achieved rate is successful readings divided by seconds since
+        :meth:`start`; target is what the schedule would deliver at the
+        configured polling interval if every cycle fit inside it.
+
+        Returns:
+            One ParameterSampleRate per parameter, in polling order
+            (empty before the first start)
+        """
+        if self._rateWindowStart is None:
+            return []
+        elapsed = self._monotonicFn() - self._rateWindowStart
+        rates: list[ParameterSampleRate] = []
+        for name in self._parameters:
+            samples = self._stats.parametersLogged.get(name, 0)
+            if self._tierSchedule is not None:
+                tier = self._tierSchedule.tierOf(name)
+                targetHz = self._tierSchedule.targetRateHz(name, self._pollingIntervalMs)
+            else:
+                tier = None
+                targetHz = 1000.0 / self._pollingIntervalMs if self._pollingIntervalMs > 0 else 0.0
+            rates.append(ParameterSampleRate(
+                parameterName=name,
+                tier=tier,
+                targetHz=targetHz,
+                achievedHz=samples / elapsed if elapsed > 0 else 0.0,
+                samples=samples,
+            ))
+        return rates
+
+    def _logSampleRates(self) -> None:
+        """Log achieved/target Hz per tier (mean over the tier's PIDs)."""
+        byTier: dict[int | None, list[ParameterSampleRate]] = {}
+        for rate in self.getSampleRates():
+            byTier.setdefault(rate.tier, []).append(rate)
+        if not byTier:
+            return
+        parts = []
+        for tier, rates in sorted(byTier.items(), key=lambda kv: (kv[0] is None, kv[0] or 0)):
+            achieved = sum(r.achievedHz for r in rates) / len(rates)
+            target = sum(r.targetHz for r in rates) / len(rates)
+            label = 'all' if tier is None else f"tier{tier}"
+            parts.append(f"{label}={achieved:.2f}/{target:.2f}Hz")
+        logger.info(f"Sample rates (achieved/target) | {' | '.join(parts)}")
+
+    # ================================================================================
+    # Write-behind batch writer
+    # ================================================================================
+
+    def flushPendingWrites(self, reason: str = 'forced') -> int:
+        """
+        Synchronously commit every queued ``realtime_data`` row.
+
+        Wired as the DriveDetector drive-end hook so post-drive analysis
+        and the drive-end sync see the whole drive.  No-op without a
+        batch writer.
+
+        Args:
+            reason: Trigger label recorded in the writer stats
+
+        Returns:
+            Number of rows committed
+        """
+        if self._batchWriter is None:
+            return 0
+        return self._batchWriter.flush(reason)
+
+    def getWriterStats(self) -> BatchWriterStats | None:
+        """
+        Get batch writer counters (queue depth, flush latency, drops).
+
+        Returns:
+            BatchWriterStats snapshot, or None when batching is disabled
+        """
+        if self._batchWriter is None:
+            return None
+        return self._batchWriter.getStats()
+
+    def _drainBatchWriter(self) -> None:
+        """Stop the batch writer with a final flush.  Never raises."""
+        if self._batchWriter is None:
+            return
+        try:
+            self._batchWriter.stop()
+        except Exception as e:  # noqa: BLE001 -- shutdown must keep going
+            logger.warning(f"Batch writer drain failed: {e}")
@@ -10,6 +10,10 @@
 # Date          | Author       | Description
 # ================================================================================
 # 2026-01-22    | Ralph Agent  | Initial creation for US-007 (data module refactor)
+# 2026-10-16    | Rex          | Add BatchWriterStats for the realtime_data
+#                               write-behind batch writer.
+# 2026-10-16    | Rex          | Add ParameterSampleRate (achieved vs target
+#                               per-PID rate for the tiered scheduler).
 # ================================================================================
 ################################################################################
 """
@@ -19,6 +23,8 @@ This module contains type definitions with no external dependencies:
 - LoggingState: Enum for logging states
 - LoggedReading: Dataclass for logged OBD-II readings
 - LoggingStats: Dataclass for logging session statistics
+- BatchWriterStats: Dataclass for realtime_data batch writer counters
+- ParameterSampleRate: Dataclass for achieved vs target per-PID sample rate
 
 Usage:
     from src.obd.data.types import LoggingState, LoggedReading, LoggingStats
@@ -168,3 +174,90 @@ class LoggingStats:
             'lastCycleTimeMs': self.lastCycleTimeMs,
             'averageCycleTimeMs': self.averageCycleTimeMs
         }
+
+
+@dataclass
+class BatchWriterStats:
+    """
+    Counters for the realtime_data write-behind batch writer.
+
+    Attributes:
+        queueDepth: Rows currently waiting for the next flush
+        peakQueueDepth: Highest queue depth seen since start
+        rowsEnqueued: Rows accepted into the queue
+        rowsFlushed: Rows committed to realtime_data
+        rowsDropped: Rows rejected because the queue was full
+        flushCount: Successful flush transactions
+        flushErrors: Flushes that failed and were requeued
+        flushesByReason: Successful flushes keyed by trigger
+            ('size', 'age', 'drive_end', 'stop', ...)
+        lastFlushLatencyMs: Duration of the most recent flush
+        maxFlushLatencyMs: Slowest flush since start
+        averageFlushLatencyMs: Mean flush duration since start
+    """
+    queueDepth: int = 0
+    peakQueueDepth: int = 0
+    rowsEnqueued: int = 0
+    rowsFlushed: int = 0
+    rowsDropped: int = 0
+    flushCount: int = 0
+    flushErrors: int = 0
+    flushesByReason: dict[str, int] = field(default_factory=dict)
+    lastFlushLatencyMs: float = 0.0
+    maxFlushLatencyMs: float = 0.0
+    averageFlushLatencyMs: float = 0.0
+
+    def toDict(self) -> dict[str, Any]:
+        """
+        Convert stats to dictionary for serialization.
+
+        Returns:
+            Dictionary with all counter fields
+        """
+        return {
+            'queueDepth': self.queueDepth,
+            'peakQueueDepth': self.peakQueueDepth,
+            'rowsEnqueued': self.rowsEnqueued,
+            'rowsFlushed': self.rowsFlushed,
+            'rowsDropped': self.rowsDropped,
+            'flushCount': self.flushCount,
+            'flushErrors': self.flushErrors,
+            'flushesByReason': dict(self.flushesByReason),
+            'lastFlushLatencyMs': self.lastFlushLatencyMs,
+            'maxFlushLatencyMs': self.maxFlushLatencyMs,
+            'averageFlushLatencyMs': self.averageFlushLatencyMs,
+        }
+
+
+@dataclass
+class ParameterSampleRate:
+    """
+    Achieved vs target sample rate for one polled parameter.
+
+    Attributes:
+        parameterName: Parameter name (e.g., 'RPM')
+        tier: Polling tier number, or None in flat (every-cycle) mode
+        targetHz: Rate the schedule aims for at the base polling interval
+        achievedHz: Successful readings per second since logging started
+        samples: Successful readings since logging started
+    """
+    parameterName: str
+    tier: int | None
+    targetHz: float
+    achievedHz: float
+    samples: int
+
+    def toDict(self) -> dict[str, Any]:
+        """
+        Convert to dictionary for serialization.
+
+        Returns:
+            Dictionary with all fields
+        """
+        return {
+            'parameterName': self.parameterName,
+            'tier': self.tier,
+            'targetHz': self.targetHz,
+            'achievedHz': self.achievedHz,
+            'samples': self.samples,
+        }
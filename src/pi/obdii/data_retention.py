@@ -12,6 +12,22 @@
 # 2026-01-22    | M. Cornelison | Initial implementation for US-016
 # 2026-04-19    | Rex (US-202) | Route cleanup-event connection_log INSERT
 #                               timestamp through utcIsoNow (TD-027 fix)
+# 2026-10-16    | Rex          | Cleanup also deletes expired realtime_frames
+#                               (cycle-frame storage); rowsDeleted counts
+#                               their samples.
+# 2026-10-16    | Rex          | Chunked, sync-aware deletes: bounded rowid
+#                               batches with a pause between them, only rows
+#                               at or below the sync_log high-water mark;
+#                               incremental vacuum / WAL checkpoint instead
+#                               of a full VACUUM; result reports reclaimed
+#                               bytes and the longest write-lock hold.
+# 2026-10-17    | Rex          | A cleanup that deletes rows drops the
+#                               streaming statistics baselines so the next
+#                               analysis rebuilds them from the kept rows.
+# 2026-10-17    | Rex          | Baseline resets are rate-limited to one per
+#                               baselineResetIntervalDays; deletions in
+#                               between are recorded as owed in
+#                               connection_log and settled by a later run.
 # ================================================================================
 ################################################################################
 
@@ -22,7 +38,12 @@ Provides:
 - Scheduled automatic deletion of old realtime data
 - Configurable retention periods from config
 - Statistics table preservation (kept indefinitely)
-- Database vacuum after cleanup to reclaim space
+- Deletion in bounded rowid batches so the capture thread's inserts are
+  never locked out for long
+- Only rows the server already holds (at or below the sync_log high-water
+  mark) are reclaimed
+- Space reclaim after cleanup (incremental vacuum / WAL checkpoint, or a
+  full VACUUM in 'vacuum' mode)
 - Comprehensive deletion logging
 
 Usage:
@@ -43,18 +64,46 @@ Usage:
 """
 
 import logging
+import os
+import sqlite3
 import threading
+import time
 from collections.abc import Callable
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from enum import Enum
 from typing import Any
 
-from src.common.time.helper import utcIsoNow
+from src.common.time.helper import toCanonicalIso, utcIsoNow
 
 logger = logging.getLogger(__name__)
 
 
+# ================================================================================
+# Constants
+# ================================================================================
+
+#: Rows (or frames) deleted per write transaction.
+DEFAULT_DELETE_BATCH_ROWS: int = 5000
+
+#: Pause between delete batches so queued capture inserts get the lock.
+DEFAULT_BATCH_PAUSE_MS: int = 50
+
+#: Reclaim modes run after rows are deleted.
+RECLAIM_MODE_INCREMENTAL: str = 'incremental'
+RECLAIM_MODE_VACUUM: str = 'vacuum'
+
+#: Minimum days between streaming statistics baseline resets.  Each reset
+#: makes the next post-drive analysis of every profile rescan all of its
+#: kept raw rows (O(history) time and I/O on the Pi), so a deleting cleanup
+#: inside the window only records the reset as owed.  0 resets every time.
+DEFAULT_BASELINE_RESET_INTERVAL_DAYS: int = 7
+
+#: connection_log event types tracking baseline resets across restarts.
+EVENT_BASELINE_RESET: str = 'statistics_baseline_reset'
+EVENT_BASELINE_RESET_OWED: str = 'statistics_baseline_reset_owed'
+
+
 # ================================================================================
 # Custom Exceptions
 # ================================================================================
@@ -104,8 +153,19 @@ class CleanupResult:
         retentionDays: Retention period used
         cutoffTimestamp: Timestamp cutoff for deletion
         executionTimeMs: Time taken to execute cleanup
-        vacuumPerformed: Whether database vacuum was performed
-        spaceReclaimedBytes: Estimated space reclaimed (if vacuum performed)
+        vacuumPerformed: Whether a space reclaim step was performed
+        spaceReclaimedBytes: Database + WAL bytes released by the cleanup
+        reclaimMethod: Reclaim step that ran ('incremental_vacuum',
+            'wal_checkpoint', 'vacuum'), None when none ran
+        batchCount: Delete transactions committed
+        maxLockHoldMs: Longest single write-lock hold during deletion
+        syncedThroughId: sync_log high-water mark bounding the deletion
+            (None when deletion is not sync-gated)
+        rowsAwaitingSync: Expired rows kept because the server lacks them
+        baselinesReset: statistics_accumulators rows dropped so the next
+            analysis rebuilds them without the deleted samples
+        baselineResetDeferred: Rows were deleted but the reset is owed
+            until ``baselineResetIntervalDays`` has passed since the last one
         errorMessage: Error message if cleanup failed
     """
     success: bool
@@ -117,6 +177,13 @@ class CleanupResult:
     executionTimeMs: int = 0
     vacuumPerformed: bool = False
     spaceReclaimedBytes: int = 0
+    reclaimMethod: str | None = None
+    batchCount: int = 0
+    maxLockHoldMs: float = 0.0
+    syncedThroughId: int | None = None
+    rowsAwaitingSync: int = 0
+    baselinesReset: int = 0
+    baselineResetDeferred: bool = False
     errorMessage: str | None = None
 
     def toDict(self) -> dict[str, Any]:
@@ -131,6 +198,13 @@ class CleanupResult:
             'executionTimeMs': self.executionTimeMs,
             'vacuumPerformed': self.vacuumPerformed,
             'spaceReclaimedBytes': self.spaceReclaimedBytes,
+            'reclaimMethod': self.reclaimMethod,
+            'batchCount': self.batchCount,
+            'maxLockHoldMs': self.maxLockHoldMs,
+            'syncedThroughId': self.syncedThroughId,
+            'rowsAwaitingSync': self.rowsAwaitingSync,
+            'baselinesReset': self.baselinesReset,
+            'baselineResetDeferred': self.baselineResetDeferred,
             'errorMessage': self.errorMessage
         }
 
@@ -169,6 +243,16 @@ class RetentionStats:
         }
 
 
+@dataclass
+class _DeletionResult:
+    """Outcome of the batched delete phase of one cleanup."""
+    rowsDeleted: int = 0
+    batchCount: int = 0
+    maxLockHoldMs: float = 0.0
+    syncedThroughId: int | None = None
+    rowsAwaitingSync: int = 0
+
+
 # ================================================================================
 # Data Retention Manager
 # ================================================================================
@@ -178,14 +262,21 @@ class DataRetentionManager:
     Manages data retention policy for OBD-II database.
 
     Automatically deletes old realtime data based on configured retention period
-    while preserving statistics data indefinitely.
+    while preserving statistics data indefinitely.  Deletion runs in bounded
+    rowid batches and, by default, never passes the sync_log high-water
+    mark, so rows the server has not received survive until they sync.
 
     Attributes:
         database: ObdDatabase instance for data access
         config: Configuration dictionary with dataRetention settings
         retentionDays: Number of days to retain realtime data
-        vacuumAfterCleanup: Whether to vacuum database after deletion
+        vacuumAfterCleanup: Whether to reclaim space after deletion
         cleanupHour: Hour of day (0-23) to run scheduled cleanup
+        deleteBatchRows: Rows deleted per write transaction
+        batchPauseMs: Pause between delete batches
+        requireSynced: Only delete rows at or below the sync high-water mark
+        reclaimMode: 'incremental' (incremental vacuum / WAL checkpoint) or
+            'vacuum' (full VACUUM, blocks writers for its duration)
 
     Example:
         manager = DataRetentionManager(db, config)
@@ -220,6 +311,17 @@ class DataRetentionManager:
         self._statisticsRetentionDays = retentionConfig.get('statisticsRetentionDays', -1)
         self._vacuumAfterCleanup = retentionConfig.get('vacuumAfterCleanup', True)
         self._cleanupHour = retentionConfig.get('cleanupTimeHour', 3)
+        self._deleteBatchRows = max(
+            1, int(retentionConfig.get('deleteBatchRows', DEFAULT_DELETE_BATCH_ROWS))
+        )
+        self._batchPauseMs = max(
+            0, int(retentionConfig.get('batchPauseMs', DEFAULT_BATCH_PAUSE_MS))
+        )
+        self._requireSynced = retentionConfig.get('requireSynced', True)
+        self._reclaimMode = retentionConfig.get('reclaimMode', RECLAIM_MODE_INCREMENTAL)
+        self._baselineResetIntervalDays = max(0, int(retentionConfig.get(
+            'baselineResetIntervalDays', DEFAULT_BASELINE_RESET_INTERVAL_DAYS
+        )))
 
         # State tracking
         self._state = CleanupState.IDLE
@@ -234,7 +336,9 @@ class DataRetentionManager:
             f"DataRetentionManager initialized: "
             f"retentionDays={self._retentionDays}, "
             f"vacuumAfterCleanup={self._vacuumAfterCleanup}, "
-            f"cleanupHour={self._cleanupHour}"
+            f"cleanupHour={self._cleanupHour}, "
+            f"deleteBatchRows={self._deleteBatchRows}, "
+            f"requireSynced={self._requireSynced}"
         )
 
     @property
@@ -262,8 +366,9 @@ class DataRetentionManager:
         """
         Run data cleanup immediately.
 
-        Deletes realtime_data rows older than the retention period and
-        optionally vacuums the database to reclaim space.
+        Deletes realtime_data rows older than the retention period (and, by
+        default, already synced) in bounded batches, then optionally
+        reclaims the freed space.
 
         Args:
             retentionDays: Override retention period (uses config value if None)
@@ -296,23 +401,37 @@ class DataRetentionManager:
             sizeBefore = self._getDatabaseSize()
 
             # Delete old data
-            rowsDeleted = self._deleteOldData(cutoffTimestamp)
+            deletion = self._deleteOldData(cutoffTimestamp)
+            rowsDeleted = deletion.rowsDeleted
 
             # Log deletion to connection_log
             self._logCleanupEvent(rowsDeleted, retentionDays, cutoffTimestamp)
 
-            # Vacuum database if configured and rows were deleted
-            vacuumPerformed = False
-            spaceReclaimed = 0
+            # Whole-history streaming baselines still count the deleted
+            # samples; dropping them makes the next analysis rescan every
+            # kept row, so at most one reset per baselineResetIntervalDays.
+            baselinesReset = 0
+            baselineResetDeferred = False
+            try:
+                baselinesReset, baselineResetDeferred = self._settleStatisticsBaselines(
+                    rowsDeleted
+                )
+            except Exception as e:
+                logger.warning(f"Statistics baseline reset failed (non-critical): {e}")
+
+            # Reclaim space if configured and rows were deleted
+            reclaimMethod = None
             if self._vacuumAfterCleanup and rowsDeleted > 0:
                 try:
-                    self._database.vacuum()
-                    vacuumPerformed = True
-                    sizeAfter = self._getDatabaseSize()
-                    spaceReclaimed = max(0, sizeBefore - sizeAfter)
-                    logger.info(f"Database vacuumed, reclaimed {spaceReclaimed} bytes")
+                    reclaimMethod = self._reclaimSpace()
                 except Exception as e:
-                    logger.warning(f"Vacuum failed (non-critical): {e}")
+                    logger.warning(f"Space reclaim failed (non-critical): {e}")
+            vacuumPerformed = reclaimMethod is not None
+            spaceReclaimed = max(0, sizeBefore - self._getDatabaseSize())
+            if vacuumPerformed:
+                logger.info(
+                    f"Space reclaim ({reclaimMethod}) released {spaceReclaimed} bytes"
+                )
 
             # Calculate execution time
             executionTimeMs = int((datetime.now() - startTime).total_seconds() * 1000)
@@ -326,11 +445,21 @@ class DataRetentionManager:
                 cutoffTimestamp=cutoffTimestamp,
                 executionTimeMs=executionTimeMs,
                 vacuumPerformed=vacuumPerformed,
-                spaceReclaimedBytes=spaceReclaimed
+                spaceReclaimedBytes=spaceReclaimed,
+                reclaimMethod=reclaimMethod,
+                batchCount=deletion.batchCount,
+                maxLockHoldMs=deletion.maxLockHoldMs,
+                syncedThroughId=deletion.syncedThroughId,
+                rowsAwaitingSync=deletion.rowsAwaitingSync,
+                baselinesReset=baselinesReset,
+                baselineResetDeferred=baselineResetDeferred
             )
 
             logger.info(
-                f"Data cleanup completed: deleted {rowsDeleted} rows, "
+                f"Data cleanup completed: deleted {rowsDeleted} rows in "
+                f"{deletion.batchCount} batches, "
+                f"max lock hold {deletion.maxLockHoldMs:.1f}ms, "
+                f"{deletion.rowsAwaitingSync} expired rows awaiting sync, "
                 f"execution time {executionTimeMs}ms"
             )
 
@@ -406,39 +535,305 @@ class DataRetentionManager:
 
     def _getDatabaseSize(self) -> int:
         """
-        Get the current database file size in bytes.
+        Get the current database size in bytes (main file + WAL).
 
         Returns:
-            File size in bytes, or 0 if unable to determine
+            Size in bytes, or 0 if unable to determine
         """
-        import os
+        total = 0
         try:
             dbPath = self._database.dbPath
-            if os.path.exists(dbPath):
-                return os.path.getsize(dbPath)
+            for path in (dbPath, f"{dbPath}-wal"):
+                if os.path.exists(path):
+                    total += os.path.getsize(path)
         except Exception:
             pass
-        return 0
+        return total
 
-    def _deleteOldData(self, cutoffTimestamp: datetime) -> int:
+    def _deleteOldData(self, cutoffTimestamp: datetime) -> _DeletionResult:
         """
-        Delete realtime data older than cutoff timestamp.
+        Delete realtime data older than cutoff timestamp in bounded batches.
+
+        Each batch is its own short ``BEGIN IMMEDIATE`` transaction over a
+        contiguous rowid range, followed by a ``batchPauseMs`` pause so the
+        capture writer's queued inserts get the lock in between.  With
+        ``requireSynced`` only rows at or below the realtime_data sync
+        high-water mark are eligible (cycle frames count as synced when
+        their last sample id is).
 
         Args:
             cutoffTimestamp: Delete rows with timestamp before this
 
         Returns:
-            Number of rows deleted
+            _DeletionResult with rows deleted, batch count and lock timing
+        """
+        # Stored timestamps are canonical ISO-8601 UTC strings; compare
+        # against the same form (the naive cutoff is local wall time).
+        cutoff = toCanonicalIso(cutoffTimestamp.astimezone(UTC))
+        result = _DeletionResult()
+
+        conn = self._database.openPersistentConnection()
+        try:
+            # Explicit BEGIN/COMMIT per batch.
+            conn.isolation_level = None
+            if self._requireSynced:
+                result.syncedThroughId = self._getSyncedThroughId(conn)
+
+            rowsFilter = "+timestamp < ?"
+            rowsParams: tuple[Any, ...] = (cutoff,)
+            framesFilter = "+timestamp < ?"
+            if result.syncedThroughId is not None:
+                rowsFilter += " AND id <= ?"
+                rowsParams += (result.syncedThroughId,)
+                framesFilter += (
+                    " AND first_sample_id + json_array_length(frame_values) - 1 <= ?"
+                )
+
+            result.rowsDeleted += self._deleteInBatches(
+                conn, 'realtime_data', '1', rowsFilter, rowsParams, result
+            )
+            logger.debug(f"Deleted {result.rowsDeleted} rows from realtime_data")
+
+            # Cycle-frame storage: one frame row holds a whole poll cycle,
+            # so count its samples to keep rowsDeleted comparable.
+            framesPresent = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name='realtime_frames'"
+            ).fetchone() is not None
+            if framesPresent:
+                frameSamples = self._deleteInBatches(
+                    conn, 'realtime_frames', 'json_array_length(frame_values)',
+                    framesFilter, rowsParams, result
+                )
+                logger.debug(f"Deleted {frameSamples} frame samples from realtime_frames")
+                result.rowsDeleted += frameSamples
+
+            if result.syncedThroughId is not None:
+                result.rowsAwaitingSync = self._countAwaitingSync(
+                    conn, cutoff, framesPresent
+                )
+                if result.rowsAwaitingSync:
+                    logger.info(
+                        f"{result.rowsAwaitingSync} expired rows kept until synced "
+                        f"(high-water mark {result.syncedThroughId})"
+                    )
+        finally:
+            conn.close()
+        return result
+
+    def _deleteInBatches(
+        self,
+        conn: sqlite3.Connection,
+        table: str,
+        sampleCountExpr: str,
+        whereClause: str,
+        params: tuple[Any, ...],
+        result: _DeletionResult,
+    ) -> int:
+        """
+        Delete matching rows of ``table`` in ascending-id batches.
+
+        The id range of each batch is read outside the write lock; the lock
+        is held only for the range DELETE.  ``+timestamp`` keeps the planner
+        on the rowid range scan so every batch resumes where the last one
+        stopped instead of re-sorting the timestamp index.
+
+        Returns:
+            Sum of ``sampleCountExpr`` over the deleted rows
+        """
+        selectSql = (
+            f"SELECT id, {sampleCountExpr} FROM {table} "  # noqa: S608 -- fixed identifiers
+            f"WHERE id > ? AND {whereClause} ORDER BY id LIMIT ?"
+        )
+        deleteSql = (
+            f"DELETE FROM {table} "  # noqa: S608 -- fixed identifiers
+            f"WHERE id >= ? AND id <= ? AND {whereClause}"
+        )
+        lastId = 0
+        samplesDeleted = 0
+        while True:
+            batch = conn.execute(
+                selectSql, (lastId, *params, self._deleteBatchRows)
+            ).fetchall()
+            if not batch:
+                break
+            firstId, lastId = batch[0][0], batch[-1][0]
+
+            lockStart = time.perf_counter()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(deleteSql, (firstId, lastId, *params))
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            holdMs = (time.perf_counter() - lockStart) * 1000
+            result.maxLockHoldMs = max(result.maxLockHoldMs, holdMs)
+            result.batchCount += 1
+            samplesDeleted += sum(int(row[1] or 0) for row in batch)
+
+            if len(batch) < self._deleteBatchRows:
+                break
+            if self._batchPauseMs:
+                time.sleep(self._batchPauseMs / 1000)
+        return samplesDeleted
+
+    def _getSyncedThroughId(self, conn: sqlite3.Connection) -> int:
+        """
+        Return the realtime_data sync high-water mark (0 if never synced).
+
+        Args:
+            conn: Open database connection
+
+        Returns:
+            Highest realtime_data sample id the server has acknowledged
+        """
+        hasSyncLog = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='sync_log'"
+        ).fetchone() is not None
+        if not hasSyncLog:
+            return 0
+        # Lazy import: src.pi.data pulls in the obdii package.
+        from src.pi.data.sync_log import getHighWaterMark
+        return getHighWaterMark(conn, 'realtime_data')[0]
+
+    def _countAwaitingSync(
+        self,
+        conn: sqlite3.Connection,
+        cutoff: str,
+        framesPresent: bool,
+    ) -> int:
+        """Count expired samples kept back because they are not yet synced."""
+        count = conn.execute(
+            "SELECT COUNT(*) FROM realtime_data WHERE timestamp < ?", (cutoff,)
+        ).fetchone()[0]
+        if framesPresent:
+            count += conn.execute(
+                "SELECT COALESCE(SUM(json_array_length(frame_values)), 0) "
+                "FROM realtime_frames WHERE timestamp < ?",
+                (cutoff,)
+            ).fetchone()[0]
+        return int(count)
+
+    def _settleStatisticsBaselines(self, rowsDeleted: int) -> tuple[int, bool]:
+        """
+        Reset the streaming baselines if rows were deleted, rate-limited.
+
+        A reset is due when this run deleted rows or an earlier run left one
+        owed.  It runs only when ``baselineResetIntervalDays`` has passed
+        since the last reset; otherwise an owed marker goes to
+        connection_log so a later cleanup (even one that deletes nothing)
+        settles it.  Until then the baselines still count the deleted
+        samples.
+
+        Args:
+            rowsDeleted: Rows deleted by this cleanup
+
+        Returns:
+            (baseline rows deleted, whether the reset was deferred)
         """
         with self._database.connect() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "DELETE FROM realtime_data WHERE timestamp < ?",
-                (cutoffTimestamp,)
+            lastReset = conn.execute(
+                "SELECT MAX(timestamp) FROM connection_log WHERE event_type = ?",
+                (EVENT_BASELINE_RESET,)
+            ).fetchone()[0]
+            owed = rowsDeleted > 0 or conn.execute(
+                "SELECT 1 FROM connection_log "
+                "WHERE event_type = ? AND timestamp >= COALESCE(?, '') LIMIT 1",
+                (EVENT_BASELINE_RESET_OWED, lastReset)
+            ).fetchone() is not None
+        if not owed:
+            return 0, False
+
+        windowStart = toCanonicalIso(
+            datetime.now(UTC) - timedelta(days=self._baselineResetIntervalDays)
+        )
+        if (
+            self._baselineResetIntervalDays > 0
+            and lastReset is not None
+            and lastReset > windowStart
+        ):
+            if rowsDeleted > 0:
+                self._logBaselineEvent(
+                    EVENT_BASELINE_RESET_OWED,
+                    f"Reset owed for {rowsDeleted} deleted rows (last reset {lastReset})"
+                )
+            logger.info(
+                f"Statistics baseline reset deferred: last reset {lastReset}, "
+                f"interval {self._baselineResetIntervalDays} days"
+            )
+            return 0, True
+
+        reset = self._resetStatisticsBaselines()
+        self._logBaselineEvent(EVENT_BASELINE_RESET, f"Reset {reset} baseline rows")
+        return reset, False
+
+    def _logBaselineEvent(self, eventType: str, message: str) -> None:
+        """Record a baseline reset (or owed reset) in connection_log."""
+        with self._database.connect() as conn:
+            conn.execute(
+                "INSERT INTO connection_log "
+                "(timestamp, event_type, mac_address, success, error_message, retry_count) "
+                "VALUES (?, ?, NULL, 1, ?, 0)",
+                (utcIsoNow(), eventType, message)
             )
-            rowsDeleted = cursor.rowcount
-            logger.debug(f"Deleted {rowsDeleted} rows from realtime_data")
-            return rowsDeleted
+
+    def _resetStatisticsBaselines(self) -> int:
+        """
+        Drop every profile's streaming statistics baseline.
+
+        The next analysis of each profile rebuilds it from the rows that
+        survived the cleanup, so whole-history statistics match a rescan.
+
+        Returns:
+            Number of baseline rows deleted
+        """
+        # Lazy import: pi.obdii's package init pulls in pi.analysis.
+        from pi.analysis.streaming import deleteAccumulators
+
+        with self._database.connect() as conn:
+            baselineTable = conn.execute(
+                "SELECT 1 FROM sqlite_master "
+                "WHERE type='table' AND name='statistics_accumulators'"
+            ).fetchone()
+            if baselineTable is None:
+                return 0
+            reset = deleteAccumulators(conn)
+        if reset:
+            logger.info(f"Reset {reset} streaming statistics baseline rows after cleanup")
+        return reset
+
+    def _reclaimSpace(self) -> str | None:
+        """
+        Hand freed pages back to the filesystem after deletion.
+
+        ``'vacuum'`` mode runs a full VACUUM (rewrites the file and blocks
+        writers throughout).  ``'incremental'`` mode runs
+        ``PRAGMA incremental_vacuum`` when the database was created with
+        ``auto_vacuum=INCREMENTAL``, then truncates the WAL; older databases
+        keep their free pages for reuse by new inserts.
+
+        Returns:
+            Name of the reclaim step that ran, or None when none applied
+        """
+        if self._reclaimMode == RECLAIM_MODE_VACUUM:
+            self._database.vacuum()
+            return 'vacuum'
+
+        method = None
+        conn = self._database.openPersistentConnection()
+        try:
+            conn.isolation_level = None
+            autoVacuum = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+            if autoVacuum == 2:  # INCREMENTAL
+                conn.execute("PRAGMA incremental_vacuum").fetchall()
+                method = 'incremental_vacuum'
+            journalMode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+            if str(journalMode).lower() == 'wal':
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+                method = method or 'wal_checkpoint'
+        finally:
+            conn.close()
+        return method
 
     def _logCleanupEvent(
         self,
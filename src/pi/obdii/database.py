@@ -22,6 +22,19 @@
 #                               pre-US-289 databases gain start_vcell_v +
 #                               end_vcell_v columns on next boot.  Spool
 #                               Sprint 26 Story 6 column rename.
+# 2026-10-16    | Rex          | Add openPersistentConnection() for the
+#                               realtime_data batch writer's single
+#                               long-lived connection (same PRAGMAs as
+#                               connect(), no per-row open/close).
+# 2026-10-16    | Rex          | Wired ensureRealtimeFramesSchema (compact
+#                               cycle-frame storage + realtime_samples
+#                               compatibility view) into initialize().
+# 2026-10-16    | Rex          | New database files are created with
+#                               auto_vacuum=INCREMENTAL so retention cleanup
+#                               can release pages without a full VACUUM.
+# 2026-10-17    | Rex          | eventLogWriter attribute: the shared
+#                               write-behind writer for alert / connection /
+#                               power event rows, attached by the orchestrator.
 # ================================================================================
 ################################################################################
 
@@ -80,6 +93,7 @@ from .drive_summary import ensureDriveSummaryTable
 from .dtc_freeze_frame_schema import ensureDtcFreezeFrameTable
 from .dtc_log_schema import ensureDtcLogTable
 from .pi_state import ensurePiStateTable
+from .realtime_frames import ensureRealtimeFramesSchema
 
 logger = logging.getLogger(__name__)
 
@@ -124,6 +138,9 @@ class ObdDatabase:
     Attributes:
         dbPath: Path to the SQLite database file
         walMode: Whether to use WAL (Write-Ahead Logging) mode
+        eventLogWriter: Shared
+            :class:`~src.pi.obdii.data.event_log_writer.EventLogWriter` for
+            auxiliary event rows, or None (rows written directly)
 
     Example:
         db = ObdDatabase('./data/obd.db', walMode=True)
@@ -146,6 +163,7 @@ class ObdDatabase:
         self.dbPath = dbPath
         self.walMode = walMode
         self._initialized = False
+        self.eventLogWriter: Any | None = None
 
     @contextmanager
     def connect(self) -> Generator[sqlite3.Connection, None, None]:
@@ -182,10 +200,32 @@ class ObdDatabase:
             if conn:
                 conn.close()
 
-    def _getConnection(self) -> sqlite3.Connection:
+    def openPersistentConnection(self) -> sqlite3.Connection:
+        """
+        Open a long-lived connection for a single-owner writer.
+
+        Same PRAGMAs as :meth:`connect` but the caller owns commit and
+        close.  Created with ``check_same_thread=False`` so a writer that
+        serializes its own access (see
+        :class:`~src.pi.obdii.data.batch_writer.RealtimeBatchWriter`) can
+        flush from the shutdown thread as well as its own.
+
+        Returns:
+            sqlite3.Connection: New connection the caller must close
+
+        Raises:
+            DatabaseConnectionError: If connection fails
+        """
+        return self._getConnection(checkSameThread=False)
+
+    def _getConnection(self, checkSameThread: bool = True) -> sqlite3.Connection:
         """
         Get a new database connection.
 
+        Args:
+            checkSameThread: Passed through to ``sqlite3.connect``.  Only
+                :meth:`openPersistentConnection` relaxes it.
+
         Returns:
             sqlite3.Connection: New connection with row factory configured
 
@@ -197,11 +237,15 @@ class ObdDatabase:
             dbDir = os.path.dirname(self.dbPath)
             if dbDir:
                 Path(dbDir).mkdir(parents=True, exist_ok=True)
+            isNewFile = (
+                not os.path.exists(self.dbPath) or os.path.getsize(self.dbPath) == 0
+            )
 
             conn = sqlite3.connect(
                 self.dbPath,
                 detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
-                timeout=30.0
+                timeout=30.0,
+                check_same_thread=checkSameThread,
             )
 
             # Enable row factory for dict-like access
@@ -210,6 +254,12 @@ class ObdDatabase:
             # Enable foreign key support
             conn.execute('PRAGMA foreign_keys = ON')
 
+            # auto_vacuum can only be chosen before the first table (and
+            # before the WAL switch) is written; retention cleanup then
+            # releases freed pages with PRAGMA incremental_vacuum.
+            if isNewFile:
+                conn.execute('PRAGMA auto_vacuum = INCREMENTAL')
+
             # Configure WAL mode if requested
             if self.walMode:
                 conn.execute('PRAGMA journal_mode = WAL')
@@ -341,6 +391,13 @@ class ObdDatabase:
                 # on subsequent boots (DEBUG absence-confirmation only).
                 ensureDriveStatisticsRetired(conn)
 
+                # Cycle-frame storage (pi.realtimeData.storageFormat =
+                # 'frames') + the realtime_samples view that unions legacy
+                # rows and unpacked frames for readers and sync.  Runs
+                # last: the view depends on realtime_data's final shape.
+                if ensureRealtimeFramesSchema(conn):
+                    logger.info("Created realtime_frames tables + realtime_samples view")
+
                 self._initialized = True
                 logger.info("Database initialization complete")
                 return True
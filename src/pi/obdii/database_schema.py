@@ -101,6 +101,9 @@
 #                               story; server-side compute path
 #                               (src/server/analytics/drive_statistics_compute)
 #                               is the sole writer authority.
+# 2026-10-16    | Rex          | Added SCHEMA_STATISTICS_ACCUMULATORS -- Pi-only
+#                               persisted streaming-statistics baseline per
+#                               (profile, parameter).
 # ================================================================================
 ################################################################################
 
@@ -325,6 +328,29 @@ CREATE INDEX IF NOT EXISTS IX_statistics_profile
 """
 
 # AI-generated recommendations with deduplication
+# Streaming statistics baseline (Pi-only, not synced).  One row per
+# (profile, parameter) holding the serialized OnlineStatistics state
+# (count / mean / m2 / min / max / mode histogram) of every sample folded
+# in so far.  Post-drive analysis merges the drive's live accumulators into
+# it instead of rescanning realtime_data; the rebuild script recomputes it
+# from raw rows.
+SCHEMA_STATISTICS_ACCUMULATORS = """
+CREATE TABLE IF NOT EXISTS statistics_accumulators (
+    profile_id TEXT NOT NULL,
+    parameter_name TEXT NOT NULL,
+
+    -- OnlineStatistics.toState() as JSON
+    state TEXT NOT NULL,
+    sample_count INTEGER NOT NULL,
+
+    -- Audit column (TD-027 canonical ISO-8601 UTC)
+    updated_at DATETIME NOT NULL
+        DEFAULT (strftime('%Y-%m-%dT%H:%M:%SZ', 'now')),
+
+    PRIMARY KEY (profile_id, parameter_name)
+)
+"""
+
 SCHEMA_AI_RECOMMENDATIONS = """
 CREATE TABLE IF NOT EXISTS ai_recommendations (
     -- Primary key
@@ -729,6 +755,7 @@ ALL_SCHEMAS = [
     ('static_data', SCHEMA_STATIC_DATA),
     ('realtime_data', SCHEMA_REALTIME_DATA),
     ('statistics', SCHEMA_STATISTICS),
+    ('statistics_accumulators', SCHEMA_STATISTICS_ACCUMULATORS),
     ('ai_recommendations', SCHEMA_AI_RECOMMENDATIONS),
     ('calibration_sessions', SCHEMA_CALIBRATION_SESSIONS),
     ('alert_log', SCHEMA_ALERT_LOG),
@@ -15,6 +15,10 @@
 #                               frozenset + isEcuDependentParameter() helper
 #                               so DriveDetector can distinguish ECU-sourced
 #                               reads from the ELM_VOLTAGE adapter heartbeat.
+# 2026-10-16    | Rex          | Multi-PID Mode 01 framing helpers:
+#                               packMode01Requests / formatMode01Request /
+#                               demultiplexMode01Response (up to 6 PIDs per
+#                               request, response split back per PID).
 # ================================================================================
 ################################################################################
 
@@ -45,12 +49,20 @@ to the python-obd command name, the Mode 01 PID hex code (or ``None``
 for adapter-level commands), the decoder callable, and the DB unit
 field. The realtime logger consults this registry before falling back
 to the legacy getattr(obdlib.commands, name) path.
+
+Multi-PID framing
+    SAE J1979 allows up to six Mode 01 PIDs in one request
+    (``01 0C 0D 05``); the ECU answers with one message carrying
+    ``41`` followed by ``PID data...`` pairs.  :func:`packMode01Requests`
+    chunks a cycle's PIDs, :func:`formatMode01Request` builds the request
+    string, and :func:`demultiplexMode01Response` splits the reply back
+    into per-PID data so each PID still runs through its own decoder.
 """
 
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from typing import Any
 
@@ -298,6 +310,78 @@ PARAMETER_DECODERS: dict[str, ParameterDecoderEntry] = {
 }
 
 
+# ================================================================================
+# Multi-PID Mode 01 framing
+# ================================================================================
+
+
+#: SAE J1979 ceiling on PIDs per Mode 01 request.
+MAX_PIDS_PER_MODE01_REQUEST: int = 6
+
+#: Positive-response service byte for Mode 01 (0x40 + mode).
+MODE01_RESPONSE_SID: int = 0x41
+
+
+def packMode01Requests(
+    pids: list[int], maxPerRequest: int = MAX_PIDS_PER_MODE01_REQUEST
+) -> list[list[int]]:
+    """Chunk Mode 01 PIDs into multi-PID requests, preserving order.
+
+    Duplicates are dropped (MIL_ON and DTC_COUNT share PID 0x01).
+
+    Args:
+        pids: Mode 01 PID numbers in polling order.
+        maxPerRequest: PIDs per request, clamped to 1..6.
+
+    Returns:
+        List of PID chunks, each at most ``maxPerRequest`` long.
+    """
+    size = max(1, min(int(maxPerRequest), MAX_PIDS_PER_MODE01_REQUEST))
+    unique = list(dict.fromkeys(pids))
+    return [unique[i:i + size] for i in range(0, len(unique), size)]
+
+
+def formatMode01Request(pids: list[int]) -> bytes:
+    """Build the ELM327 request string for a PID chunk (``b"010C0D05"``)."""
+    return b"01" + b"".join(f"{pid:02X}".encode() for pid in pids)
+
+
+def demultiplexMode01Response(
+    data: bytes | bytearray, dataLengths: Mapping[int, int]
+) -> dict[int, bytes]:
+    """Split a multi-PID Mode 01 response into per-PID data bytes.
+
+    Walks ``41 PID data PID data ...``.  Parsing stops at the first PID
+    with no known length or whose data is truncated; everything parsed
+    before that point is still returned, so the caller only falls back
+    for the PIDs that are missing.
+
+    Args:
+        data: Message payload starting at the service byte (``0x41``).
+        dataLengths: Data-byte count per PID (excluding service + PID bytes).
+
+    Returns:
+        ``{pid: data_bytes}`` for every PID cleanly parsed.
+    """
+    result: dict[int, bytes] = {}
+    if not data or data[0] != MODE01_RESPONSE_SID:
+        return result
+    index = 1
+    while index < len(data):
+        pid = data[index]
+        length = dataLengths.get(pid)
+        end = index + 1 + (length or 0)
+        if length is None or end > len(data):
+            logger.debug(
+                "demultiplexMode01Response: stopping at pid=0x%02X offset=%d",
+                pid, index,
+            )
+            break
+        result[pid] = bytes(data[index + 1:end])
+        index = end
+    return result
+
+
 # ================================================================================
 # US-229: ECU-dependency lookup for parameters NOT in PARAMETER_DECODERS
 # ================================================================================
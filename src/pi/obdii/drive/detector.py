@@ -77,6 +77,12 @@
 #                               structurally moot: server reads raw
 #                               realtime_data MIN/MAX/COUNT directly,
 #                               needs no marker.
+# 2026-10-16    | Rex          | setCaptureFlushHook(): _endDrive drains the
+#                               realtime_data batch writer BEFORE analysis
+#                               is scheduled and the drive_id closes.
+# 2026-10-16    | Rex          | processValue feeds every reading to the
+#                               statistics engine's streaming accumulators
+#                               so post-drive analysis is O(parameters).
 # ================================================================================
 ################################################################################
 """
@@ -208,6 +214,8 @@ class DriveDetector:
         self._database = database
         self._summaryRecorder = summaryRecorder
         self._readingSnapshotSource = readingSnapshotSource
+        # Drains queued realtime_data rows at drive end (batch writer).
+        self._captureFlushHook: Callable[[str], Any] | None = None
 
         # Load configuration
         self._config = self._loadConfig(config)
@@ -355,6 +363,15 @@ class DriveDetector:
         """Attach an object exposing ``getLatestReadings() -> dict``."""
         self._readingSnapshotSource = source
 
+    def setCaptureFlushHook(self, hook: Callable[[str], Any] | None) -> None:
+        """Attach ``hook(reason)`` that commits queued capture rows.
+
+        Typically :meth:`RealtimeDataLogger.flushPendingWrites`.  Called
+        from :meth:`_endDrive` before post-drive analysis is scheduled so
+        the analysis thread and the drive-end sync see every row.
+        """
+        self._captureFlushHook = hook
+
     def setThresholds(
         self,
         driveStartRpmThreshold: float | None = None,
@@ -537,6 +554,16 @@ class DriveDetector:
             now = datetime.now()
             self._lastValueTime = now
 
+            # Streaming statistics: fold the reading into the engine's live
+            # accumulators.  Never allowed to break drive detection.
+            if self._statisticsEngine is not None:
+                try:
+                    self._statisticsEngine.recordSample(
+                        self._config.profileId, parameterName, value
+                    )
+                except Exception as e:
+                    logger.debug(f"Streaming statistics update failed: {e}")
+
             # US-229: record ECU-sourced reading arrival so the silence
             # check below knows ECU polling is alive.  Adapter-level
             # parameters (BATTERY_V via ELM_VOLTAGE) keep ticking past
@@ -827,6 +854,10 @@ class DriveDetector:
         # connection_log.error_message for traceability.
         self._logDriveEvent('drive_end', endTime, reason=reason)
 
+        # Write-behind batching: commit the drive's queued realtime_data
+        # rows before analysis reads them or the sync trigger ships them.
+        self._flushCaptureRows()
+
         # Trigger post-drive analysis.  drive_id remains set so
         # _storeStatistics stamps the analysis rows with the closing id
         # BEFORE we clear the context.
@@ -881,6 +912,15 @@ class DriveDetector:
 
         self._transitionState(DriveState.STOPPED)
 
+    def _flushCaptureRows(self) -> None:
+        """Run the capture flush hook; a flush fault never blocks drive_end."""
+        if self._captureFlushHook is None:
+            return
+        try:
+            self._captureFlushHook('drive_end')
+        except Exception as e:
+            logger.warning(f"Drive-end capture flush failed: {e}")
+
     def _triggerAnalysis(self) -> None:
         """Trigger post-drive statistical analysis.
 
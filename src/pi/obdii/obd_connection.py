@@ -25,6 +25,13 @@
 #                |              | heartbeat callers so they can log
 #                |              | already_in_flight and skip instead of
 #                |              | stacking concurrent attempts.
+# 2026-10-16    | Rex           | queryBatch(): multi-PID Mode 01 requests (up
+#                |              | to 6 PIDs per round-trip) demultiplexed back
+#                |              | into per-command responses; auto-disables
+#                |              | after repeated ECU rejections.
+# 2026-10-17    | Rex           | _logConnectionEvent goes through
+#                |              | writeEventRow (shared event log writer) and
+#                |              | stamps the row's timestamp at event time.
 # ================================================================================
 ################################################################################
 
@@ -63,6 +70,11 @@ from enum import Enum
 from typing import Any
 
 from . import bluetooth_helper
+from .decoders import (
+    demultiplexMode01Response,
+    formatMode01Request,
+    packMode01Requests,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -99,6 +111,11 @@ EVENT_TYPE_CONNECT_FAILURE = 'connect_failure'
 EVENT_TYPE_DISCONNECT = 'disconnect'
 EVENT_TYPE_RECONNECT = 'reconnect'
 
+# Consecutive rejected multi-PID requests after which queryBatch() stops
+# trying for the rest of the connection (ISO 9141 / KWP ECUs such as the
+# 2G Eclipse answer single-PID requests only).
+MULTI_PID_REJECT_LIMIT = 3
+
 
 # ================================================================================
 # Enums and Data Classes
@@ -265,6 +282,10 @@ class ObdConnection:
         # None until connect() runs the probe. Consumers (ObdDataLogger) use
         # it to silent-skip unsupported PIDs before dispatching a K-line query.
         self.supportedPids: Any | None = None
+        # Multi-PID Mode 01 state.  Reset on every successful connect so a
+        # different vehicle / protocol gets a fresh chance.
+        self.multiPidSupported: bool = True
+        self._multiPidRejects: int = 0
 
     def getStatus(self) -> ConnectionStatus:
         """
@@ -406,6 +427,8 @@ class ObdConnection:
                     # candidates on 2G). Best-effort — probe failure never
                     # fails the connection itself.
                     self._runSupportedPidProbe()
+                    self.multiPidSupported = True
+                    self._multiPidRejects = 0
 
                     self._logConnectionEvent(
                         EVENT_TYPE_CONNECT_SUCCESS,
@@ -625,6 +648,98 @@ class ObdConnection:
         self.disconnect()
         return self.connect()
 
+    # ================================================================================
+    # Multi-PID Mode 01 queries
+    # ================================================================================
+
+    def queryBatch(self, commands: list[Any]) -> dict[str, Any]:
+        """
+        Query several Mode 01 commands with as few round-trips as possible.
+
+        Batchable commands (Mode 01, known response length, supported by
+        the ECU) are packed up to six per request; each reply is split
+        back into per-command python-obd responses via the command's own
+        decoder.  A command missing from the result -- not batchable,
+        rejected, or absent from the reply -- must be queried singly by
+        the caller.
+
+        Args:
+            commands: python-obd OBDCommand objects
+
+        Returns:
+            ``{command.name: OBDResponse}`` for every command served
+        """
+        if not self.multiPidSupported or obdlib is None or not self._isConnected():
+            return {}
+
+        byPid: dict[int, Any] = {}
+        for cmd in commands:
+            pid = getattr(cmd, 'pid', None)
+            if (
+                getattr(cmd, 'mode', None) != 1
+                or pid is None
+                or getattr(cmd, 'bytes', 0) <= 2
+                or not self.obd.supports(cmd)
+            ):
+                continue
+            byPid.setdefault(pid, cmd)
+
+        results: dict[str, Any] = {}
+        for chunk in packMode01Requests(list(byPid)):
+            if len(chunk) < 2:
+                continue  # Nothing to save -- caller's single query is as cheap
+            served = self._queryMode01Chunk([byPid[pid] for pid in chunk])
+            if not served:
+                self._recordMultiPidReject(chunk)
+                if not self.multiPidSupported:
+                    break
+                continue
+            self._multiPidRejects = 0
+            results.update(served)
+        return results
+
+    def _queryMode01Chunk(self, commands: list[Any]) -> dict[str, Any]:
+        """Send one multi-PID request and demultiplex the reply."""
+        pids = [cmd.pid for cmd in commands]
+        multiCmd = obdlib.OBDCommand(
+            'MULTI_' + '_'.join(f"{pid:02X}" for pid in pids),
+            'Multi-PID Mode 01 request',
+            formatMode01Request(pids),
+            0,  # variable length -- do not pad or trim the reply
+            lambda messages: messages,
+            obdlib.ECU.ENGINE,
+            False,
+        )
+        response = self.obd.query(multiCmd, force=True)
+        messages = getattr(response, 'messages', None) or []
+
+        dataLengths = {cmd.pid: cmd.bytes - 2 for cmd in commands}
+        served: dict[str, Any] = {}
+        for message in messages:
+            parts = demultiplexMode01Response(message.data, dataLengths)
+            for cmd in commands:
+                if cmd.name in served or cmd.pid not in parts:
+                    continue
+                single = obdlib.protocols.protocol.Message(message.frames)
+                single.ecu = message.ecu
+                single.data = bytearray([0x41, cmd.pid]) + parts[cmd.pid]
+                served[cmd.name] = cmd([single])
+        return served
+
+    def _recordMultiPidReject(self, pids: list[int]) -> None:
+        """Count a rejected multi-PID request; disable after the limit."""
+        self._multiPidRejects += 1
+        logger.debug(
+            "Multi-PID request rejected | pids=%s | consecutive=%d",
+            [f"0x{pid:02X}" for pid in pids], self._multiPidRejects,
+        )
+        if self._multiPidRejects >= MULTI_PID_REJECT_LIMIT:
+            self.multiPidSupported = False
+            logger.info(
+                "ECU rejected %d multi-PID requests -- using single-PID queries "
+                "for this connection", self._multiPidRejects,
+            )
+
     def _logConnectionEvent(
         self,
         eventType: str,
@@ -651,17 +766,23 @@ class ObdConnection:
         if shouldSuppressAsRepeat(self.macAddress, eventType):
             return
 
+        from src.common.time.helper import utcIsoNow
+        from src.pi.obdii.data.event_log_writer import writeEventRow
+
         try:
-            with self.database.connect() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    INSERT INTO connection_log
-                    (event_type, mac_address, success, error_message, retry_count)
-                    VALUES (?, ?, ?, ?, ?)
-                    """,
-                    (eventType, self.macAddress, 1 if success else 0, errorMessage, retryCount)
-                )
+            # Timestamp stamped now: a queued row may land seconds later.
+            writeEventRow(
+                self.database,
+                """
+                INSERT INTO connection_log
+                (timestamp, event_type, mac_address, success, error_message, retry_count)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    utcIsoNow(), eventType, self.macAddress,
+                    1 if success else 0, errorMessage, retryCount,
+                ),
+            )
         except Exception as e:
             logger.warning(f"Failed to log connection event: {e}")
 
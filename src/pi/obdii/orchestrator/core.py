@@ -53,6 +53,13 @@
 #               |              | adapter+ECU readiness flips the tracker
 #               |              | True on a subsequent pass and fires
 #               |              | _handleConnectionRestored.
+# 2026-10-16    | Rex          | Reading bus state (_readingBus, deferred
+#               |              | _pollingThreadTasks) initialized here;
+#               |              | the bus itself starts in runLoop.
+# 2026-10-17    | Rex          | _liveSnapshot (shared-memory latest-value
+#               |              | block for display processes) initialized.
+# 2026-10-17    | Rex          | _cycleFrame (per-cycle alert frame)
+#               |              | initialized.
 # ================================================================================
 ################################################################################
 
@@ -78,6 +85,7 @@ Usage:
 import logging
 import threading
 import time
+from collections import deque
 from collections.abc import Callable
 from datetime import datetime
 from typing import Any
@@ -292,6 +300,22 @@ class ApplicationOrchestrator(  # type: ignore[misc]
         # Parameters to display on dashboard (extracted from realtimeData config)
         self._dashboardParameters: set[str] = self._extractDashboardParameters(config)
 
+        # Reading fan-out bus.  Built by _setupComponentCallbacks when
+        # pi.obdii.orchestrator.readingBus.enabled; None == inline routing.
+        # Connection-touching work raised on a bus thread (drive-event DTC
+        # queries) is queued here and run on the polling thread.
+        self._readingBus: Any | None = None
+        self._pollingThreadTasks: deque[Callable[[], None]] = deque()
+
+        # Parameter -> value for the polling cycle in progress; handed to
+        # AlertManager.checkFrame when the data logger reports cycle end.
+        self._cycleFrame: dict[str, Any] = {}
+
+        # Shared-memory live snapshot (pi.display.liveSnapshot); opened by
+        # _setupComponentCallbacks, fed by the reading path.
+        self._liveSnapshot: Any | None = None
+        self._liveSnapshotThresholds: dict[str, Any] = {}
+
         # Statistics tracking for health checks
         self._startTime: datetime | None = None
         self._lastHealthCheckTime: datetime | None = None
@@ -28,6 +28,26 @@
 #               |              | pattern.  Closes the 8-second-of-live-OBD-
 #               |              | with-zero-rows window in the 2026-05-08
 #               |              | engine-on test journal.
+# 2026-10-16    | Rex          | Reading fan-out bus: display / drive
+#               |              | detector / alert delivery moves to
+#               |              | ReadingBus dispatch threads when
+#               |              | pi.obdii.orchestrator.readingBus.enabled;
+#               |              | drive-event DTC queries are deferred back
+#               |              | onto the polling thread.
+# 2026-10-17    | Rex          | Shared-memory live snapshot: readings are
+#               |              | published (value / timestamp / severity)
+#               |              | to pi.display.liveSnapshot.path via a
+#               |              | latest-value bus subscriber (inline when
+#               |              | the bus is off).
+# 2026-10-17    | Rex          | Deferred polling-thread tasks also drain
+#               |              | from _handleCycleComplete (data logger
+#               |              | onCycleComplete), so the drive-end Mode 07
+#               |              | query runs while no readings arrive.
+# 2026-10-17    | Rex          | Alerts get one {parameter: value} frame per
+#               |              | polling cycle (AlertManager.checkFrame) from
+#               |              | _handleCycleComplete instead of a checkValue
+#               |              | call per reading; the bus alerts subscriber
+#               |              | is a direct (publishTo) subscriber.
 # ================================================================================
 ################################################################################
 
@@ -35,7 +55,9 @@
 Event router mixin for ApplicationOrchestrator.
 
 Owns the five callback chains:
-    1. Reading:  DataLogger → Orchestrator → DisplayManager + DriveDetector + AlertManager
+    1. Reading:  DataLogger → Orchestrator → DisplayManager + DriveDetector
+                 + live snapshot per reading, AlertManager per cycle frame
+                 (via ReadingBus dispatch threads when the bus is enabled)
     2. Drive:    DriveDetector → Orchestrator → DisplayManager + external
     3. Alert:    AlertManager → Orchestrator → DisplayManager + HardwareManager + external
     4. Analysis: StatisticsEngine → Orchestrator → DisplayManager + external
@@ -43,10 +65,18 @@ Owns the five callback chains:
 """
 
 import logging
+from collections import deque
 from collections.abc import Callable
 from typing import Any
 
-from .types import HealthCheckStats
+from ..drive_id import getCurrentDriveId
+from .reading_bus import (
+    DEFAULT_LATEST_CAPACITY,
+    DEFAULT_LOSSLESS_CAPACITY,
+    DEFAULT_PUBLISH_TIMEOUT_MS,
+    ReadingBus,
+)
+from .types import DeliveryPolicy, HealthCheckStats
 
 # Unified logger name matches the original monolith module so existing tests
 # that filter caplog by logger name continue to work unchanged.
@@ -68,6 +98,9 @@ class EventRouterMixin:
         _onDriveStart, _onDriveEnd, _onAlert, _onAnalysisComplete,
         _onConnectionLost, _onConnectionRestored: Callable | None
         _startReconnection() method (from ConnectionRecoveryMixin)
+        _readingBus: ReadingBus | None
+        _pollingThreadTasks: deque of deferred callables
+        _cycleFrame: parameter -> value for the polling cycle in progress
     """
 
     _driveDetector: Any | None
@@ -91,6 +124,10 @@ class EventRouterMixin:
     _onAnalysisComplete: Callable[[Any], None] | None
     _onConnectionLost: Callable[[], None] | None
     _onConnectionRestored: Callable[[], None] | None
+    _config: dict[str, Any]
+    _readingBus: ReadingBus | None
+    _pollingThreadTasks: deque[Callable[[], None]]
+    _cycleFrame: dict[str, Any]
 
     # US-242 / B-049: provided by core.py -- declared here so type-checkers
     # see the binding when _handleReading routes BATTERY_V samples.
@@ -168,7 +205,8 @@ class EventRouterMixin:
             try:
                 self._dataLogger.registerCallbacks(
                     onReading=self._handleReading,
-                    onError=self._handleLoggingError
+                    onError=self._handleLoggingError,
+                    onCycleComplete=self._handleCycleComplete,
                 )
                 logger.debug("Data logger callbacks registered")
             except Exception as e:
@@ -183,6 +221,151 @@ class EventRouterMixin:
             except Exception as e:
                 logger.warning(f"Could not register profile switcher callbacks: {e}")
 
+        self._startLiveSnapshot()
+        self._startReadingBus()
+
+    # ================================================================================
+    # Reading fan-out bus
+    # ================================================================================
+
+    def _startReadingBus(self) -> None:
+        """
+        Build and start the reading bus from ``pi.obdii.orchestrator.readingBus``.
+
+        Subscribers: ``display`` (latest-value-wins -- only the freshest
+        value per parameter matters on screen), ``driveDetector`` (lossless
+        -- every sample feeds the state machine) and ``alerts`` (lossless,
+        direct: one cycle frame per :meth:`ReadingBus.publishTo`).  Disabled or failing to start leaves
+        ``_readingBus`` None and readings are routed inline.
+        """
+        if getattr(self, '_readingBus', None) is not None:
+            return
+        busConfig = (
+            getattr(self, '_config', {}).get('pi', {}).get('obdii', {})
+            .get('orchestrator', {}).get('readingBus', {})
+        )
+        if not busConfig.get('enabled', False):
+            return
+        try:
+            bus = ReadingBus(
+                publishTimeoutMs=busConfig.get('publishTimeoutMs', DEFAULT_PUBLISH_TIMEOUT_MS),
+            )
+            latestCapacity = busConfig.get('latestCapacity', DEFAULT_LATEST_CAPACITY)
+            losslessCapacity = busConfig.get('losslessCapacity', DEFAULT_LOSSLESS_CAPACITY)
+            if self._displayManager is not None:
+                bus.subscribe(
+                    'display', self._deliverReadingToDisplay,
+                    DeliveryPolicy.LATEST, latestCapacity,
+                )
+            if self._driveDetector is not None:
+                bus.subscribe(
+                    'driveDetector', self._deliverReadingToDriveDetector,
+                    DeliveryPolicy.LOSSLESS, losslessCapacity,
+                )
+            if self._alertManager is not None:
+                bus.subscribe(
+                    'alerts', self._deliverFrameToAlertManager,
+                    DeliveryPolicy.LOSSLESS, losslessCapacity, broadcast=False,
+                )
+            if getattr(self, '_liveSnapshot', None) is not None:
+                bus.subscribe(
+                    'liveSnapshot', self._deliverReadingToLiveSnapshot,
+                    DeliveryPolicy.LATEST, latestCapacity,
+                )
+            bus.start()
+            self._readingBus = bus
+        except Exception as e:  # noqa: BLE001 -- inline routing still works
+            logger.warning(f"Could not start reading bus, routing inline: {e}")
+            self._readingBus = None
+
+    def _startLiveSnapshot(self) -> None:
+        """
+        Open the shared-memory live snapshot from ``pi.display.liveSnapshot``.
+
+        Display processes read the latest value per parameter from it at
+        frame rate instead of polling ``realtime_data``.  Disabled, or a
+        path that cannot be mapped, leaves ``_liveSnapshot`` None.
+        """
+        if getattr(self, '_liveSnapshot', None) is not None:
+            return
+        piConfig = getattr(self, '_config', {}).get('pi', {})
+        snapshotConfig = piConfig.get('display', {}).get('liveSnapshot', {})
+        if not snapshotConfig.get('enabled', False):
+            return
+        try:
+            from pi.display.live_snapshot import (
+                DEFAULT_CAPACITY,
+                DEFAULT_SNAPSHOT_PATH,
+                LiveSnapshotWriter,
+            )
+            self._liveSnapshot = LiveSnapshotWriter(
+                snapshotConfig.get('path', DEFAULT_SNAPSHOT_PATH),
+                snapshotConfig.get('capacity', DEFAULT_CAPACITY),
+            )
+            self._liveSnapshotThresholds = piConfig.get('tieredThresholds', {})
+            logger.info(f"Live snapshot publishing to {self._liveSnapshot.path}")
+        except Exception as e:  # noqa: BLE001 -- display falls back to db polling
+            logger.warning(f"Could not open live snapshot: {e}")
+            self._liveSnapshot = None
+
+    def _closeLiveSnapshot(self) -> None:
+        """Unmap the live snapshot (the file stays for readers to age out)."""
+        snapshot = getattr(self, '_liveSnapshot', None)
+        if snapshot is None:
+            return
+        try:
+            snapshot.close()
+        except Exception as e:  # noqa: BLE001 -- defensive
+            logger.debug(f"Live snapshot close failed: {e}")
+        self._liveSnapshot = None
+
+    def _stopReadingBus(self) -> None:
+        """Drain and stop the reading bus, then run deferred polling-thread work.
+
+        Called after the data logger stops so no new readings arrive; the
+        lossless subscribers finish their backlog before the drive
+        detector and alert manager are torn down.
+        """
+        bus = getattr(self, '_readingBus', None)
+        if bus is None:
+            return
+        try:
+            bus.stop()
+        except Exception as e:  # noqa: BLE001 -- defensive
+            logger.warning(f"Reading bus stop failed: {e}")
+        self._readingBus = None
+        self._runPollingThreadTasks()
+
+    def _runOnPollingThread(self, task: Callable[[], None]) -> None:
+        """Run connection-touching work on the polling thread.
+
+        With the bus running, drive events fire on the ``driveDetector``
+        dispatch thread; an OBD query from there would interleave with the
+        polling thread on the same ELM327 link.  The task is queued and
+        run by the next :meth:`_handleReading` or
+        :meth:`_handleCycleComplete`, whichever comes first -- the cycle
+        tick fires even when the ECU has gone quiet after engine-off.
+        Without the bus it runs inline, as before.
+        """
+        bus = getattr(self, '_readingBus', None)
+        if bus is None or not bus.isRunning:
+            task()
+            return
+        self._pollingThreadTasks.append(task)
+
+    def _runPollingThreadTasks(self) -> None:
+        """Run queued polling-thread tasks (deque pops are thread-safe)."""
+        tasks = getattr(self, '_pollingThreadTasks', None)
+        while tasks:
+            try:
+                task = tasks.popleft()
+            except IndexError:
+                return
+            try:
+                task()
+            except Exception as e:  # noqa: BLE001 -- must not crash poll loop
+                logger.debug(f"Deferred polling-thread task failed: {e}")
+
     def _handleDriveStart(self, session: Any) -> None:
         """Handle drive start event from DriveDetector."""
         logger.info(f"Drive started | session_id={getattr(session, 'id', 'unknown')}")
@@ -212,7 +395,10 @@ class EventRouterMixin:
         # MIL edge detector also resets so a freshly-illuminated MIL on
         # the *next* poll (vs. a sustained on-state) re-triggers the
         # mid-drive refetch path.
-        self._dispatchSessionStartDtcs()
+        # With the reading bus running this fires on the drive detector's
+        # dispatch thread, so the Mode 03/07 query is deferred to the
+        # polling thread (see _runOnPollingThread).
+        self._runOnPollingThread(self._dispatchSessionStartDtcs)
         if self._milEdgeDetector is not None:
             try:
                 self._milEdgeDetector.reset()
@@ -287,8 +473,11 @@ class EventRouterMixin:
         # post-drive review.  Runs BEFORE the external onDriveEnd
         # callback (and BEFORE DriveDetector._closeDriveId clears the
         # process-wide drive_id) so DtcLogger can fall back to
-        # getCurrentDriveId() when stamping the dtc_log row.
-        self._dispatchDriveEndDtcs()
+        # getCurrentDriveId() when stamping the dtc_log row.  When the
+        # query is deferred to the polling thread the drive_id is
+        # captured now, before it closes.
+        driveId = getCurrentDriveId()
+        self._runOnPollingThread(lambda: self._dispatchDriveEndDtcs(driveId))
 
         # Call external callback
         if self._onDriveEnd is not None:
@@ -381,45 +570,33 @@ class EventRouterMixin:
         self._healthCheckStats.totalErrors += 1
 
     def _handleReading(self, reading: Any) -> None:
-        """Handle reading event from RealtimeDataLogger."""
+        """Handle reading event from RealtimeDataLogger.
+
+        Runs on the polling thread.  Display and drive detector delivery go
+        through the reading bus when it is running (inline otherwise); the
+        value is also added to the cycle frame that
+        :meth:`_handleCycleComplete` hands to the alert manager.  MIL edge, DTC cadence and engine-on escalation stay
+        here because they query the OBD connection.
+        """
         self._healthCheckStats.totalReadings += 1
+        self._runPollingThreadTasks()
 
         paramName = getattr(reading, 'parameterName', None)
         value = getattr(reading, 'value', None)
-        unit = getattr(reading, 'unit', None)
 
-        # Update display if parameter is configured for dashboard
-        if (
-            self._displayManager is not None
-            and paramName is not None
-            and paramName in self._dashboardParameters
-            and hasattr(self._displayManager, 'updateValue')
-        ):
-            try:
-                self._displayManager.updateValue(paramName, value, unit)
-            except Exception as e:
-                logger.debug(f"Display update failed: {e}")
-
-        # Pass reading to drive detector for state machine processing
-        if self._driveDetector is not None:
-            try:
-                if paramName is not None and value is not None:
-                    self._driveDetector.processValue(paramName, value)
-            except Exception as e:
-                logger.debug(f"Drive detector process failed: {e}")
+        bus = getattr(self, '_readingBus', None)
+        if bus is not None and bus.isRunning:
+            bus.publish(reading)
+        else:
+            self._deliverReadingToDisplay(reading)
+            self._deliverReadingToDriveDetector(reading)
+            self._deliverReadingToLiveSnapshot(reading)
 
-        # Pass reading to alert manager for threshold checking
-        # Skip during reconnection to avoid false alerts on stale data
-        if (
-            self._alertManager is not None
-            and hasattr(self._alertManager, 'checkValue')
-            and not self._alertsPausedForReconnect
-        ):
-            try:
-                if paramName is not None and value is not None:
-                    self._alertManager.checkValue(paramName, value)
-            except Exception as e:
-                logger.debug(f"Alert check failed: {e}")
+        if self._alertManager is not None and paramName is not None and value is not None:
+            frame = getattr(self, '_cycleFrame', None)
+            if frame is None:
+                frame = self._cycleFrame = {}
+            frame[paramName] = value
 
         # US-204: route MIL_ON observations through the rising-edge
         # detector and dispatch a Mode 03 re-fetch on 0->1 transitions.
@@ -470,6 +647,95 @@ class EventRouterMixin:
             except Exception as e:  # noqa: BLE001 -- escalation must never crash callback
                 logger.debug(f"Engine-on escalation hook failed: {e}")
 
+    def _handleCycleComplete(self, cycleNumber: int) -> None:
+        """Handle the end of one polling cycle from RealtimeDataLogger.
+
+        Runs on the polling thread after every cycle, whether or not it
+        produced a reading.  The cycle's readings go to the alert manager as
+        one frame, and deferred connection work queued by
+        :meth:`_runOnPollingThread` does not wait for the next reading.
+
+        Args:
+            cycleNumber: Cycles completed so far
+        """
+        self._flushCycleFrame()
+        self._runPollingThreadTasks()
+
+    def _flushCycleFrame(self) -> None:
+        """Hand the finished cycle's frame to the alert manager and start a new one."""
+        frame = getattr(self, '_cycleFrame', None)
+        if not frame:
+            return
+        self._cycleFrame = {}
+        bus = getattr(self, '_readingBus', None)
+        if bus is not None and bus.isRunning:
+            try:
+                bus.publishTo('alerts', frame)
+                return
+            except ValueError:  # no alerts subscriber -- check inline
+                pass
+        self._deliverFrameToAlertManager(frame)
+
+    def _deliverReadingToDisplay(self, reading: Any) -> None:
+        """Update the display if the parameter is configured for the dashboard."""
+        paramName = getattr(reading, 'parameterName', None)
+        if (
+            self._displayManager is not None
+            and paramName is not None
+            and paramName in self._dashboardParameters
+            and hasattr(self._displayManager, 'updateValue')
+        ):
+            try:
+                self._displayManager.updateValue(
+                    paramName, getattr(reading, 'value', None), getattr(reading, 'unit', None)
+                )
+            except Exception as e:
+                logger.debug(f"Display update failed: {e}")
+
+    def _deliverReadingToDriveDetector(self, reading: Any) -> None:
+        """Pass a reading to the drive detector state machine."""
+        paramName = getattr(reading, 'parameterName', None)
+        value = getattr(reading, 'value', None)
+        if self._driveDetector is not None:
+            try:
+                if paramName is not None and value is not None:
+                    self._driveDetector.processValue(paramName, value)
+            except Exception as e:
+                logger.debug(f"Drive detector process failed: {e}")
+
+    def _deliverFrameToAlertManager(self, frame: dict[str, Any]) -> None:
+        """Pass one polling cycle's values to the alert manager.
+
+        Skipped during reconnection to avoid false alerts on stale data.
+        """
+        if (
+            self._alertManager is not None
+            and hasattr(self._alertManager, 'checkFrame')
+            and not self._alertsPausedForReconnect
+        ):
+            try:
+                self._alertManager.checkFrame(frame)
+            except Exception as e:
+                logger.debug(f"Alert check failed: {e}")
+
+    def _deliverReadingToLiveSnapshot(self, reading: Any) -> None:
+        """Publish a reading (with its basic-tier severity) to the live snapshot."""
+        snapshot = getattr(self, '_liveSnapshot', None)
+        paramName = getattr(reading, 'parameterName', None)
+        value = getattr(reading, 'value', None)
+        if snapshot is None or paramName is None or value is None:
+            return
+        try:
+            from pi.display.live_readings import resolveGaugeName
+            from pi.display.screens.primary_screen import evaluateBasicTierSeverity
+            severity = evaluateBasicTierSeverity(
+                resolveGaugeName(paramName), value,
+                getattr(self, '_liveSnapshotThresholds', {}),
+            )
+            snapshot.publish(paramName, value, severity=severity)
+        except Exception as e:
+            logger.debug(f"Live snapshot publish failed: {e}")
+
     def _handleLoggingError(self, paramName: str, error: Exception) -> None:
         """Handle logging error event from RealtimeDataLogger."""
         self._healthCheckStats.totalErrors += 1
@@ -720,19 +986,24 @@ class EventRouterMixin:
                 inserted, updated,
             )
 
-    def _dispatchDriveEndDtcs(self) -> None:
+    def _dispatchDriveEndDtcs(self, driveId: int | None = None) -> None:
         """Fire DtcLogger.logDriveEndDtcs from _handleDriveEnd.
 
         US-292 (Spool 2026-05-06).  Mode 07 pending-DTC snapshot before
         the drive_id closes.  Pending codes are the leading indicator
         and fire BEFORE the MIL ladder, so this is the cleanest pre-MIL
         artifact for post-drive review.
+
+        Args:
+            driveId: Drive to stamp; None lets DtcLogger fall back to
+                getCurrentDriveId() (set when the call is deferred past
+                the drive_id close).
         """
         if self._dtcLogger is None or self._connection is None:
             return
         try:
             result = self._dtcLogger.logDriveEndDtcs(
-                driveId=None, connection=self._connection,
+                driveId=driveId, connection=self._connection,
             )
             pending = getattr(result, 'pendingCount', 0)
             probe = getattr(result, 'mode07Probe', None)
@@ -15,6 +15,11 @@
 #               |              | BUG-2 post-mortem signal).  Sentinel is
 #               |              | the literal ``never_written`` -- explicit,
 #               |              | greppable, no NULL or magic numbers.
+# 2026-10-16    | Rex          | Health line appends realtime batch writer
+#               |              | queue depth / dropped / last flush latency
+#               |              | when batching is enabled.
+# 2026-10-16    | Rex          | Health line appends per-subscriber reading
+#               |              | bus lag / drop counters when the bus runs.
 # ================================================================================
 ################################################################################
 
@@ -47,6 +52,7 @@ class HealthMonitorMixin:
         _lastDataRateLogTime: datetime | None
         _lastDataRateReadingCount, _lastDataRateLogCount: int
         _dataLogger, _driveDetector: components
+        _readingBus: ReadingBus | None
         _checkConnectionStatus() method (from ConnectionRecoveryMixin)
     """
 
@@ -60,6 +66,7 @@ class HealthMonitorMixin:
     _lastDataRateLogCount: int
     _dataLogger: Any | None
     _driveDetector: Any | None
+    _readingBus: Any | None
 
     def _performHealthCheck(self) -> None:
         """
@@ -113,6 +120,24 @@ class HealthMonitorMixin:
         lastRowRender = (
             "never_written" if lastRow is None else f"{lastRow:.1f}"
         )
+        # Batch writer counters are filled by _collectComponentStats;
+        # they stay None (and the suffix empty) when batching is off.
+        writerRender = ""
+        if self._healthCheckStats.batchWriterQueueDepth is not None:
+            writerRender = (
+                f" | writer_queue={self._healthCheckStats.batchWriterQueueDepth}"
+                f" | writer_dropped={self._healthCheckStats.batchWriterRowsDropped}"
+                f" | writer_last_flush_ms="
+                f"{self._healthCheckStats.batchWriterLastFlushMs:.1f}"
+            )
+        busRender = ""
+        if self._healthCheckStats.readingBus:
+            busRender = " | bus=" + ",".join(
+                f"{name}:lag_ms={stats['lastLagMs']:.1f}/max_lag_ms="
+                f"{stats['maxLagMs']:.1f}/queue={stats['queueDepth']}"
+                f"/dropped={stats['dropped']}"
+                for name, stats in self._healthCheckStats.readingBus.items()
+            )
 
         # Log health check
         logger.info(
@@ -125,6 +150,8 @@ class HealthMonitorMixin:
             f"alerts={self._healthCheckStats.alertsTriggered} | "
             f"uptime={self._healthCheckStats.uptimeSeconds:.0f}s | "
             f"data_logger_last_row_seconds_ago={lastRowRender}"
+            f"{writerRender}"
+            f"{busRender}"
         )
 
     def _readDataLoggerLastRowSecondsAgo(self) -> float | None:
@@ -165,6 +192,41 @@ class HealthMonitorMixin:
             except Exception as e:
                 logger.debug(f"Could not get data logger stats: {e}")
 
+        # Realtime batch writer counters -- only real numeric values are
+        # accepted (MagicMock-backed loggers and loggers without a writer
+        # leave the fields None and the health line unchanged).
+        self._healthCheckStats.batchWriterQueueDepth = None
+        self._healthCheckStats.batchWriterRowsDropped = None
+        self._healthCheckStats.batchWriterLastFlushMs = None
+        getWriterStats = getattr(self._dataLogger, 'getWriterStats', None)
+        if callable(getWriterStats):
+            try:
+                writerStats = getWriterStats()
+                queueDepth = getattr(writerStats, 'queueDepth', None)
+                dropped = getattr(writerStats, 'rowsDropped', None)
+                lastFlushMs = getattr(writerStats, 'lastFlushLatencyMs', None)
+                if (
+                    isinstance(queueDepth, int)
+                    and isinstance(dropped, int)
+                    and isinstance(lastFlushMs, (int, float))
+                ):
+                    self._healthCheckStats.batchWriterQueueDepth = queueDepth
+                    self._healthCheckStats.batchWriterRowsDropped = dropped
+                    self._healthCheckStats.batchWriterLastFlushMs = float(lastFlushMs)
+            except Exception as e:
+                logger.debug(f"Could not get batch writer stats: {e}")
+
+        # Reading bus per-subscriber lag / drop counters (None == inline).
+        self._healthCheckStats.readingBus = None
+        bus = getattr(self, '_readingBus', None)
+        if bus is not None:
+            try:
+                self._healthCheckStats.readingBus = {
+                    stats.name: stats.toDict() for stats in bus.getStats()
+                }
+            except Exception as e:
+                logger.debug(f"Could not get reading bus stats: {e}")
+
         # Get drive detector stats if available
         if self._driveDetector is not None and hasattr(self._driveDetector, 'getStats'):
             try:
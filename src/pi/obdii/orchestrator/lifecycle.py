@@ -243,6 +243,20 @@
 #               |              | drive-end signal doesn't fire on
 #               |              | sequencer-driven termination) is moot:
 #               |              | server reads raw realtime_data directly.
+# 2026-10-16    | Rex          | _initializeDataLogger wires the realtime
+#               |              | batch writer's flushPendingWrites into
+#               |              | DriveDetector.setCaptureFlushHook so a
+#               |              | drive's queued rows commit at drive_end.
+# 2026-10-16    | Rex          | _shutdownAllComponents drains the reading
+#               |              | bus right after the data logger stops.
+# 2026-10-16    | Rex          | Update-checker sync-caught-up closure
+#               |              | compares the cursor against the max
+#               |              | sample id across rows and cycle frames.
+# 2026-10-17    | Rex          | _shutdownAllComponents closes the live
+#               |              | snapshot after the reading bus drains.
+# 2026-10-17    | Rex          | _initializeDatabase attaches + starts the
+#               |              | shared event log writer; _shutdownDatabase
+#               |              | drains it after every producer has stopped.
 # ================================================================================
 ################################################################################
 
@@ -585,6 +599,7 @@ class LifecycleMixin:
         try:
             self._database = createDatabaseFromConfig(self._config)
             self._database.initialize()
+            self._startEventLogWriter()
             logger.info("Database started successfully")
         except Exception as e:
             logger.error(f"Failed to initialize database: {e}")
@@ -593,6 +608,19 @@ class LifecycleMixin:
                 component='database'
             ) from e
 
+    def _startEventLogWriter(self) -> None:
+        """Attach and start the shared event log writer (pi.database.eventLog).
+
+        alert_log / connection_log / power_log writers find it through
+        ``ObdDatabase.eventLogWriter``; without it they write row-at-a-time.
+        """
+        from ..data.event_log_writer import createEventLogWriterFromConfig
+        writer = createEventLogWriterFromConfig(self._config, self._database)
+        if writer is None:
+            return
+        self._database.eventLogWriter = writer
+        writer.start()
+
     def _initializeProfileManager(self) -> None:
         """Initialize the profile manager component."""
         logger.info("Starting profileManager...")
@@ -1488,6 +1516,7 @@ class LifecycleMixin:
                 captureErrorHandler=self.handleCaptureError,
                 onFatalError=self._onCaptureFatalError,
             )
+            self._wireCaptureFlushHook()
             logger.info("DataLogger started successfully")
         except ImportError:
             logger.warning("DataLogger not available, skipping")
@@ -1498,6 +1527,19 @@ class LifecycleMixin:
                 component='dataLogger'
             ) from e
 
+    def _wireCaptureFlushHook(self) -> None:
+        """Point DriveDetector's drive-end flush at the data logger.
+
+        Only matters when ``pi.realtimeData.batchWriter`` is enabled --
+        without a writer ``flushPendingWrites`` is a cheap no-op.
+        """
+        if self._driveDetector is None or self._dataLogger is None:
+            return
+        flushFn = getattr(self._dataLogger, 'flushPendingWrites', None)
+        setHook = getattr(self._driveDetector, 'setCaptureFlushHook', None)
+        if callable(flushFn) and callable(setHook):
+            setHook(flushFn)
+
     def _onCaptureFatalError(self, exc: BaseException) -> None:
         """Signal orchestrator shutdown when the capture loop reports FATAL.
 
@@ -1874,11 +1916,10 @@ class LifecycleMixin:
                 return True
             try:
                 from src.pi.data import sync_log as _syncLog
+                from src.pi.obdii.realtime_frames import getMaxSampleId
                 with db.connect() as conn:
-                    row = conn.execute(
-                        "SELECT COALESCE(MAX(id), 0) FROM realtime_data"
-                    ).fetchone()
-                    maxRealtimeId = int(row[0]) if row is not None else 0
+                    # Legacy rows and cycle-frame samples share one id space.
+                    maxRealtimeId = getMaxSampleId(conn)
                     lastSyncedId = int(
                         _syncLog.getHighWaterMark(conn, 'realtime_data')[0]
                     )
@@ -2198,6 +2239,9 @@ class LifecycleMixin:
         self._shutdownSyncClient()
         self._shutdownProfileSwitcher()
         self._shutdownDataLogger()
+        # Drain lossless bus subscribers before their consumers go away.
+        self._stopReadingBus()  # type: ignore[attr-defined]
+        self._closeLiveSnapshot()  # type: ignore[attr-defined]
         self._shutdownAlertManager()
         self._shutdownDriveDetector()
         self._shutdownStatisticsEngine()
@@ -2353,6 +2397,12 @@ class LifecycleMixin:
                 # Database uses context managers, no explicit close needed
                 # but we clear the reference
                 logger.info("Database stopped successfully")
+            # Drain queued event rows even on force exit: every component
+            # that writes them has been stopped by now.
+            writer = getattr(self._database, 'eventLogWriter', None)
+            if writer is not None:
+                writer.stop()
+                self._database.eventLogWriter = None
         self._database = None
 
     def _cleanupPartialInitialization(self) -> None:
@@ -0,0 +1,418 @@
+################################################################################
+# File Name: reading_bus.py
+# Purpose/Description: Publish/subscribe fan-out bus between the realtime
+#                      polling thread and reading consumers
+# Author: Rex
+# Creation Date: 2026-10-16
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-16    | Rex          | Initial -- per-subscriber bounded buffers
+#               |              | (latest-value-wins or lossless) drained by
+#               |              | one dispatch thread each.
+# 2026-10-17    | Rex          | Direct subscribers (broadcast=False) fed only
+#               |              | by publishTo -- the alerts subscriber takes
+#               |              | one frame per polling cycle.
+# ================================================================================
+################################################################################
+
+"""
+Reading fan-out bus for the orchestrator.
+
+Before the bus, :meth:`EventRouterMixin._handleReading` called
+``DisplayManager.updateValue``, ``DriveDetector.processValue`` and
+``AlertManager.checkValue`` inline on the polling thread, so a slow pygame
+redraw or an alert_log insert delayed the next OBD query.
+
+:class:`ReadingBus` decouples them.  :meth:`ReadingBus.publish` only
+appends to each subscriber's bounded buffer (one short lock hold per
+subscriber, never I/O); every subscriber has its own daemon dispatch
+thread that calls its handler.
+
+Delivery policies (:class:`DeliveryPolicy`):
+
+- ``LATEST``: buffer keyed by reading key (parameter name).  A newer
+  reading replaces the pending one for the same key -- the display only
+  ever needs the freshest value.  Superseded readings count as dropped.
+- ``LOSSLESS``: FIFO buffer.  Every reading is delivered in publish order.
+  When the buffer is full the publisher waits up to ``publishTimeoutMs``
+  for room, then drops the reading and counts it, so a wedged consumer
+  can slow the polling thread but never stall it.
+
+A subscriber registered with ``broadcast=False`` skips :meth:`publish` and
+only receives items sent to it by name with :meth:`publishTo` (the alert
+manager takes one ``{parameter: value}`` frame per polling cycle, not each
+reading).
+
+Before :meth:`start` (and after :meth:`stop`) :meth:`publish` and
+:meth:`publishTo` deliver inline on the caller's thread, so no reading is lost across the bus
+lifecycle edges.
+
+Usage:
+    bus = ReadingBus()
+    bus.subscribe('display', onDisplay, DeliveryPolicy.LATEST, capacity=64)
+    bus.subscribe('alerts', onAlert, DeliveryPolicy.LOSSLESS, capacity=1024)
+    bus.start()
+    bus.publish(reading)        # from the polling thread
+    bus.stop()                  # drains lossless buffers, joins threads
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable
+from typing import Any
+
+from .types import DeliveryPolicy, SubscriberStats
+
+# Unified logger name matches the original monolith module so existing tests
+# that filter caplog by logger name continue to work unchanged.
+logger = logging.getLogger("pi.obdii.orchestrator")
+
+# ================================================================================
+# Constants
+# ================================================================================
+
+#: Latest-value buffer capacity (distinct keys).  Comfortably above the
+#: 23-parameter realtime set.
+DEFAULT_LATEST_CAPACITY: int = 64
+
+#: Lossless buffer capacity.  ~45 s of the full parameter set at 1 Hz.
+DEFAULT_LOSSLESS_CAPACITY: int = 1024
+
+#: How long a publish may wait for room in a full lossless buffer.
+DEFAULT_PUBLISH_TIMEOUT_MS: int = 50
+
+
+def _readingKey(reading: Any) -> Any:
+    """Default key for latest-value-wins buffers (the parameter name)."""
+    return getattr(reading, 'parameterName', None)
+
+
+class _Subscriber:
+    """One subscriber: bounded buffer, dispatch thread and counters."""
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[[Any], None],
+        policy: DeliveryPolicy,
+        capacity: int,
+        keyFn: Callable[[Any], Any],
+        monotonicFn: Callable[[], float],
+        broadcast: bool = True,
+    ) -> None:
+        self.name = name
+        self.handler = handler
+        self.policy = policy
+        self.capacity = capacity
+        self.keyFn = keyFn
+        self.broadcast = broadcast
+        self._monotonicFn = monotonicFn
+
+        self._cond = threading.Condition()
+        self._fifo: deque[tuple[float, Any]] = deque()
+        self._latest: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+        self._closed = False
+        self._thread: threading.Thread | None = None
+        self.stats = SubscriberStats(name=name, policy=policy.value, capacity=capacity)
+
+    # ------------------------------------------------------------------ producer
+
+    def offer(self, reading: Any, publishTimeout: float) -> bool:
+        """Buffer one reading.  Returns False when it was dropped."""
+        now = self._monotonicFn()
+        with self._cond:
+            self.stats.published += 1
+            if self.policy is DeliveryPolicy.LATEST:
+                key = self.keyFn(reading)
+                if key in self._latest:
+                    del self._latest[key]
+                    self.stats.dropped += 1
+                elif len(self._latest) >= self.capacity:
+                    self._latest.popitem(last=False)
+                    self.stats.dropped += 1
+                self._latest[key] = (now, reading)
+            else:
+                if len(self._fifo) >= self.capacity:
+                    self._cond.wait_for(
+                        lambda: len(self._fifo) < self.capacity or self._closed,
+                        timeout=publishTimeout,
+                    )
+                if len(self._fifo) >= self.capacity:
+                    self.stats.dropped += 1
+                    if self.stats.dropped == 1 or self.stats.dropped % 1000 == 0:
+                        logger.warning(
+                            "Reading bus subscriber full -- dropping | "
+                            "subscriber=%s | capacity=%d | dropped=%d",
+                            self.name, self.capacity, self.stats.dropped,
+                        )
+                    return False
+                self._fifo.append((now, reading))
+            self._cond.notify_all()
+        return True
+
+    def deliverInline(self, reading: Any) -> None:
+        """Call the handler on the caller's thread (bus not running)."""
+        with self._cond:
+            self.stats.published += 1
+        self._invoke(reading, lagMs=0.0)
+
+    # ------------------------------------------------------------------ consumer
+
+    def start(self) -> None:
+        with self._cond:
+            self._closed = False
+        self._thread = threading.Thread(
+            target=self._dispatchLoop,
+            name=f'ReadingBus-{self.name}',
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float) -> None:
+        """Close the buffer; the dispatch thread drains what is queued."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            if self._thread.is_alive():
+                logger.warning(
+                    "Reading bus subscriber %s did not drain within %.1fs",
+                    self.name, timeout,
+                )
+        self._thread = None
+
+    def _take(self) -> tuple[float, Any] | None:
+        """Pop the next buffered reading.  Caller holds _cond."""
+        if self._fifo:
+            return self._fifo.popleft()
+        if self._latest:
+            return self._latest.popitem(last=False)[1]
+        return None
+
+    def _dispatchLoop(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: bool(self._fifo or self._latest) or self._closed
+                )
+                item = self._take()
+                if item is None:
+                    return  # closed and drained
+                self._cond.notify_all()  # room for a waiting publisher
+            enqueuedAt, reading = item
+            self._invoke(reading, (self._monotonicFn() - enqueuedAt) * 1000.0)
+
+    def _invoke(self, reading: Any, lagMs: float) -> None:
+        try:
+            self.handler(reading)
+        except Exception as e:  # noqa: BLE001 -- one bad reading never kills the thread
+            with self._cond:
+                self.stats.handlerErrors += 1
+            logger.debug(f"Reading bus handler failed | subscriber={self.name} | error={e}")
+        with self._cond:
+            self.stats.delivered += 1
+            self.stats.lastLagMs = lagMs
+            if lagMs > self.stats.maxLagMs:
+                self.stats.maxLagMs = lagMs
+
+    def snapshot(self) -> SubscriberStats:
+        with self._cond:
+            return SubscriberStats(
+                name=self.name,
+                policy=self.stats.policy,
+                capacity=self.capacity,
+                queueDepth=len(self._fifo) + len(self._latest),
+                published=self.stats.published,
+                delivered=self.stats.delivered,
+                dropped=self.stats.dropped,
+                handlerErrors=self.stats.handlerErrors,
+                lastLagMs=self.stats.lastLagMs,
+                maxLagMs=self.stats.maxLagMs,
+            )
+
+
+class ReadingBus:
+    """
+    Fan-out bus from the polling thread to reading consumers.
+
+    Thread model: :meth:`publish` runs on the polling thread and only
+    touches the subscriber buffers.  Each subscriber owns one dispatch
+    thread, so a slow consumer only delays itself.  Subscribe before
+    :meth:`start`.
+
+    Attributes:
+        publishTimeoutMs: Max wait for room in a full lossless buffer
+    """
+
+    def __init__(
+        self,
+        publishTimeoutMs: int = DEFAULT_PUBLISH_TIMEOUT_MS,
+        *,
+        monotonicFn: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the bus.
+
+        Args:
+            publishTimeoutMs: Max wait for room in a full lossless buffer
+                (0 drops immediately).
+            monotonicFn: Clock seam for tests.
+        """
+        self.publishTimeoutMs = max(0, int(publishTimeoutMs))
+        self._monotonicFn = monotonicFn
+        self._subscribers: list[_Subscriber] = []
+        self._running = False
+
+    @property
+    def isRunning(self) -> bool:
+        """True between :meth:`start` and :meth:`stop`."""
+        return self._running
+
+    def subscribe(
+        self,
+        name: str,
+        handler: Callable[[Any], None],
+        policy: DeliveryPolicy = DeliveryPolicy.LOSSLESS,
+        capacity: int | None = None,
+        keyFn: Callable[[Any], Any] = _readingKey,
+        broadcast: bool = True,
+    ) -> None:
+        """
+        Register a subscriber.
+
+        Args:
+            name: Unique subscriber name (used in metrics and thread name)
+            handler: Called with each reading on the subscriber's thread
+            policy: LATEST (coalesce per key) or LOSSLESS (FIFO)
+            capacity: Buffer size; defaults per policy
+            keyFn: Coalescing key for LATEST buffers
+            broadcast: Receive :meth:`publish`; False for a subscriber fed
+                only through :meth:`publishTo`
+
+        Raises:
+            ValueError: Duplicate name, non-positive capacity, or bus running
+        """
+        if self._running:
+            raise ValueError(f"cannot subscribe {name!r} while the bus is running")
+        if any(sub.name == name for sub in self._subscribers):
+            raise ValueError(f"duplicate reading bus subscriber: {name!r}")
+        if capacity is None:
+            capacity = (
+                DEFAULT_LATEST_CAPACITY if policy is DeliveryPolicy.LATEST
+                else DEFAULT_LOSSLESS_CAPACITY
+            )
+        if capacity < 1:
+            raise ValueError(f"reading bus capacity must be positive: {capacity}")
+        self._subscribers.append(
+            _Subscriber(
+                name, handler, policy, int(capacity), keyFn, self._monotonicFn, broadcast,
+            )
+        )
+
+    def start(self) -> bool:
+        """
+        Start one dispatch thread per subscriber.
+
+        Returns:
+            True if started, False if already running
+        """
+        if self._running:
+            return False
+        for sub in self._subscribers:
+            sub.start()
+        self._running = True
+        logger.info(
+            "Reading bus started | subscribers=%s",
+            ','.join(f"{sub.name}:{sub.policy.value}" for sub in self._subscribers),
+        )
+        return True
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Stop the dispatch threads after they drain their buffers.
+
+        Args:
+            timeout: Seconds to wait per subscriber
+        """
+        if not self._running:
+            return
+        self._running = False
+        for sub in self._subscribers:
+            sub.stop(timeout)
+        logger.info(
+            "Reading bus stopped | %s",
+            ' | '.join(
+                f"{s.name}: delivered={s.delivered} dropped={s.dropped} "
+                f"maxLagMs={s.maxLagMs:.1f}"
+                for s in self.getStats()
+            ),
+        )
+
+    def publish(self, reading: Any) -> None:
+        """
+        Offer a reading to every broadcast subscriber.
+
+        Inline delivery when the bus is not running.
+
+        Args:
+            reading: LoggedReading (or any object the handlers accept)
+        """
+        if not self._running:
+            for sub in self._subscribers:
+                if sub.broadcast:
+                    sub.deliverInline(reading)
+            return
+        timeout = self.publishTimeoutMs / 1000.0
+        for sub in self._subscribers:
+            if sub.broadcast:
+                sub.offer(reading, timeout)
+
+    def publishTo(self, name: str, item: Any) -> bool:
+        """
+        Offer an item to one subscriber, broadcast or not.
+
+        Inline delivery when the bus is not running.
+
+        Args:
+            name: Subscriber name
+            item: Object that subscriber's handler accepts
+
+        Returns:
+            False if the item was dropped (full lossless buffer)
+
+        Raises:
+            ValueError: No subscriber with that name
+        """
+        for sub in self._subscribers:
+            if sub.name == name:
+                break
+        else:
+            raise ValueError(f"unknown reading bus subscriber: {name!r}")
+        if not self._running:
+            sub.deliverInline(item)
+            return True
+        return sub.offer(item, self.publishTimeoutMs / 1000.0)
+
+    def getStats(self) -> list[SubscriberStats]:
+        """
+        Get per-subscriber counter snapshots.
+
+        Returns:
+            SubscriberStats per subscriber, in subscription order
+        """
+        return [sub.snapshot() for sub in self._subscribers]
+
+
+__all__ = [
+    'ReadingBus',
+    'DEFAULT_LATEST_CAPACITY',
+    'DEFAULT_LOSSLESS_CAPACITY',
+    'DEFAULT_PUBLISH_TIMEOUT_MS',
+]
@@ -17,6 +17,12 @@
 #               |              | post-mortem signal).  None == never written;
 #               |              | health-line render uses the
 #               |              | ``never_written`` sentinel for that case.
+# 2026-10-16    | Rex          | HealthCheckStats gains realtime batch
+#               |              | writer queue depth / dropped / flush
+#               |              | latency counters.
+# 2026-10-16    | Rex          | DeliveryPolicy + SubscriberStats for the
+#               |              | reading fan-out bus; HealthCheckStats gains
+#               |              | per-subscriber bus lag/drop counters.
 # ================================================================================
 ################################################################################
 
@@ -45,6 +51,14 @@ class ShutdownState(Enum):
     FORCE_EXIT = "force_exit"
 
 
+class DeliveryPolicy(Enum):
+    """Reading bus delivery policy, chosen per subscriber."""
+    # Newest value per key (parameter) wins; superseded values are dropped.
+    LATEST = "latest"
+    # Every reading is delivered in order; only dropped on sustained overflow.
+    LOSSLESS = "lossless"
+
+
 # ================================================================================
 # Dataclasses
 # ================================================================================
@@ -67,6 +81,15 @@ class HealthCheckStats:
     # ``never_written`` sentinel by ``_performHealthCheck``).  Otherwise
     # the elapsed seconds since the most recent successful row write.
     dataLoggerLastRowSecondsAgo: float | None = None
+    # Realtime batch writer counters.  None == batching disabled (legacy
+    # per-row commits); the health line then omits the writer fields.
+    batchWriterQueueDepth: int | None = None
+    batchWriterRowsDropped: int | None = None
+    batchWriterLastFlushMs: float | None = None
+    # Reading fan-out bus counters keyed by subscriber name
+    # (SubscriberStats.toDict()).  None == bus disabled (readings are
+    # routed synchronously on the polling thread).
+    readingBus: dict[str, dict[str, Any]] | None = None
 
     def toDict(self) -> dict[str, Any]:
         """Convert to dictionary for logging."""
@@ -87,6 +110,60 @@ class HealthCheckStats:
                 round(self.dataLoggerLastRowSecondsAgo, 1)
                 if self.dataLoggerLastRowSecondsAgo is not None else None
             ),
+            'batchWriterQueueDepth': self.batchWriterQueueDepth,
+            'batchWriterRowsDropped': self.batchWriterRowsDropped,
+            'batchWriterLastFlushMs': (
+                round(self.batchWriterLastFlushMs, 1)
+                if self.batchWriterLastFlushMs is not None else None
+            ),
+            'readingBus': (
+                {name: dict(stats) for name, stats in self.readingBus.items()}
+                if self.readingBus is not None else None
+            ),
+        }
+
+
+@dataclass
+class SubscriberStats:
+    """
+    Per-subscriber counters for the reading fan-out bus.
+
+    Attributes:
+        name: Subscriber name ('display', 'driveDetector', 'alerts')
+        policy: Delivery policy value ('latest' or 'lossless')
+        capacity: Ring buffer capacity
+        queueDepth: Readings waiting for the dispatch thread
+        published: Readings offered to this subscriber
+        delivered: Readings handed to the handler
+        dropped: Readings discarded (superseded or overflow)
+        handlerErrors: Handler calls that raised
+        lastLagMs: Publish-to-dispatch delay of the latest reading
+        maxLagMs: Worst publish-to-dispatch delay since start
+    """
+    name: str
+    policy: str
+    capacity: int
+    queueDepth: int = 0
+    published: int = 0
+    delivered: int = 0
+    dropped: int = 0
+    handlerErrors: int = 0
+    lastLagMs: float = 0.0
+    maxLagMs: float = 0.0
+
+    def toDict(self) -> dict[str, Any]:
+        """Convert to dictionary for logging."""
+        return {
+            'name': self.name,
+            'policy': self.policy,
+            'capacity': self.capacity,
+            'queueDepth': self.queueDepth,
+            'published': self.published,
+            'delivered': self.delivered,
+            'dropped': self.dropped,
+            'handlerErrors': self.handlerErrors,
+            'lastLagMs': round(self.lastLagMs, 1),
+            'maxLagMs': round(self.maxLagMs, 1),
         }
 
 
@@ -150,7 +227,9 @@ class ComponentStopError(OrchestratorError):
 
 __all__ = [
     'ShutdownState',
+    'DeliveryPolicy',
     'HealthCheckStats',
+    'SubscriberStats',
     'DEFAULT_SHUTDOWN_TIMEOUT',
     'DEFAULT_HEALTH_CHECK_INTERVAL',
     'DEFAULT_DATA_RATE_LOG_INTERVAL',
@@ -0,0 +1,478 @@
+################################################################################
+# File Name: realtime_frames.py
+# Purpose/Description: Wide-row "cycle frame" storage for realtime samples --
+#                      PID dictionary, frame layouts, frame table and the
+#                      realtime_samples compatibility view.
+# Author: Rex
+# Creation Date: 2026-10-16
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-16    | Rex          | Initial -- frame schema, FramePacker and the
+#                               legacy-shaped realtime_samples view.
+# ================================================================================
+################################################################################
+
+"""Compact "cycle frame" storage for realtime samples.
+
+``realtime_data`` is narrow EAV: every sample repeats the ISO timestamp,
+parameter name, unit, profile id and data source, and pays for five index
+entries.  With ``pi.realtimeData.storageFormat = 'frames'`` the batch
+writer instead stores one row per poll cycle:
+
+==========================  ==============================================
+Table                       Notes
+==========================  ==============================================
+``realtime_pid_dict``       ``(parameter_name, unit)`` -> small ``pid_id``.
+``realtime_frame_layouts``  Ordered PID-id list (JSON) shared by every
+                            frame polled with the same parameter set.
+``realtime_frames``         ``timestamp``, ``layout_id``, ``frame_values``
+                            (compact JSON array, one slot per layout PID),
+                            ``first_sample_id``, ``profile_id``,
+                            ``data_source``, ``drive_id``.
+==========================  ==============================================
+
+Values are a JSON array rather than a packed float blob so the
+:data:`REALTIME_SAMPLES_VIEW` can unpack them in pure SQL (``json_each``).
+The view exposes the legacy ``realtime_data`` column shape over both the
+legacy rows and the unpacked frames, so existing readers and the sync
+delta see one sample stream.
+
+Sample ids: frame sample ``k`` has id ``first_sample_id + k``.  Ids are
+dense, start at :data:`FRAME_SAMPLE_ID_BASE` (above any realistic legacy
+row id, below the server's 32-bit ``source_id`` ceiling) and always stay
+above both ``realtime_data`` ids and the ``realtime_data`` sync cursor, so
+"highest id wins" and the ``id > lastSyncedId`` cursor keep working when
+the format is switched in either direction.
+
+This module follows the load-time-pure pattern of
+:mod:`src.pi.obdii.dtc_log_schema` -- no side effects on import; the
+``ensure...`` helpers do all the DDL.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+__all__ = [
+    'FRAME_SAMPLE_ID_BASE',
+    'REALTIME_FRAMES_INDEXES',
+    'REALTIME_FRAMES_TABLE',
+    'REALTIME_SAMPLES_VIEW',
+    'SCHEMA_REALTIME_FRAMES',
+    'SCHEMA_REALTIME_FRAME_LAYOUTS',
+    'SCHEMA_REALTIME_PID_DICT',
+    'SCHEMA_REALTIME_SAMPLES_VIEW',
+    'FramePacker',
+    'ensureRealtimeFramesSchema',
+    'getLatestSamples',
+    'getMaxSampleId',
+    'getSamplesAfter',
+    'realtimeSamplesSource',
+]
+
+
+# ================================================================================
+# Constants
+# ================================================================================
+
+
+REALTIME_FRAMES_TABLE: str = 'realtime_frames'
+REALTIME_SAMPLES_VIEW: str = 'realtime_samples'
+
+#: First synthetic sample id.  Legacy realtime_data ids are far below this
+#: (~1M rows/year at the default cadence); the server's source_id column is
+#: a 32-bit INTEGER, which leaves ~1.1 billion frame sample ids of headroom.
+FRAME_SAMPLE_ID_BASE: int = 1_000_000_000
+
+
+# ================================================================================
+# DDL
+# ================================================================================
+
+SCHEMA_REALTIME_PID_DICT: str = """
+CREATE TABLE IF NOT EXISTS realtime_pid_dict (
+    pid_id INTEGER PRIMARY KEY,
+    parameter_name TEXT NOT NULL,
+    -- '' rather than NULL so the UNIQUE pair also dedupes unit-less PIDs.
+    unit TEXT NOT NULL DEFAULT '',
+    UNIQUE (parameter_name, unit)
+)
+"""
+
+SCHEMA_REALTIME_FRAME_LAYOUTS: str = """
+CREATE TABLE IF NOT EXISTS realtime_frame_layouts (
+    layout_id INTEGER PRIMARY KEY,
+    -- JSON array of realtime_pid_dict.pid_id, in frame slot order.
+    pid_ids TEXT NOT NULL UNIQUE
+)
+"""
+
+SCHEMA_REALTIME_FRAMES: str = """
+CREATE TABLE IF NOT EXISTS realtime_frames (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp DATETIME NOT NULL
+        DEFAULT (strftime('%Y-%m-%dT%H:%M:%SZ', 'now')),
+    layout_id INTEGER NOT NULL
+        REFERENCES realtime_frame_layouts(layout_id),
+    -- JSON array of values, one slot per layout PID (null = not sampled).
+    frame_values TEXT NOT NULL,
+    -- Sample id of slot 0; slot k is first_sample_id + k.
+    first_sample_id INTEGER NOT NULL,
+    profile_id TEXT,
+    data_source TEXT NOT NULL DEFAULT 'real'
+        CHECK (data_source IN ('real','replay','physics_sim','fixture')),
+    drive_id INTEGER,
+    CONSTRAINT FK_realtime_frames_profile FOREIGN KEY (profile_id)
+        REFERENCES profiles(id)
+        ON DELETE SET NULL
+)
+"""
+
+REALTIME_FRAMES_INDEXES: tuple[tuple[str, str], ...] = (
+    (
+        'IX_realtime_frames_first_sample_id',
+        "CREATE UNIQUE INDEX IF NOT EXISTS IX_realtime_frames_first_sample_id "
+        "ON realtime_frames(first_sample_id)",
+    ),
+    (
+        'IX_realtime_frames_timestamp',
+        "CREATE INDEX IF NOT EXISTS IX_realtime_frames_timestamp "
+        "ON realtime_frames(timestamp)",
+    ),
+    (
+        'IX_realtime_frames_drive_id',
+        "CREATE INDEX IF NOT EXISTS IX_realtime_frames_drive_id "
+        "ON realtime_frames(drive_id)",
+    ),
+)
+
+# Frame half of the view.  json_each over the values and over the layout's
+# pid_ids are joined on the array index; null slots are skipped so the view
+# keeps realtime_data's value NOT NULL contract.
+_FRAME_SAMPLES_SELECT: str = """
+SELECT f.first_sample_id + v.key AS id,
+       f.timestamp AS timestamp,
+       d.parameter_name AS parameter_name,
+       v.value AS value,
+       NULLIF(d.unit, '') AS unit,
+       f.profile_id AS profile_id,
+       f.data_source AS data_source,
+       f.drive_id AS drive_id
+FROM realtime_frames f
+JOIN realtime_frame_layouts l ON l.layout_id = f.layout_id
+JOIN json_each(f.frame_values) v
+JOIN json_each(l.pid_ids) p ON p.key = v.key
+JOIN realtime_pid_dict d ON d.pid_id = p.value
+WHERE v.type != 'null'
+"""
+
+SCHEMA_REALTIME_SAMPLES_VIEW: str = f"""
+CREATE VIEW IF NOT EXISTS realtime_samples AS
+SELECT id, timestamp, parameter_name, value, unit,
+       profile_id, data_source, drive_id
+FROM realtime_data
+UNION ALL
+{_FRAME_SAMPLES_SELECT}
+"""
+
+
+# ================================================================================
+# Migration
+# ================================================================================
+
+
+def _objectExists(conn: sqlite3.Connection, objectType: str, name: str) -> bool:
+    row = conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = ? AND name = ?",
+        (objectType, name),
+    ).fetchone()
+    return row is not None
+
+
+def ensureRealtimeFramesSchema(conn: sqlite3.Connection) -> bool:
+    """Create the frame tables, indexes and ``realtime_samples`` view.
+
+    Idempotent -- returns ``False`` when ``realtime_frames`` already
+    existed.  Also lifts the ``realtime_data`` AUTOINCREMENT sequence above
+    the highest frame sample id, so a switch back to row storage keeps ids
+    monotonic for the sync cursor.  Must run after ``realtime_data`` exists.
+    Caller owns commit.
+    """
+    created = not _objectExists(conn, 'table', REALTIME_FRAMES_TABLE)
+    conn.execute(SCHEMA_REALTIME_PID_DICT)
+    conn.execute(SCHEMA_REALTIME_FRAME_LAYOUTS)
+    conn.execute(SCHEMA_REALTIME_FRAMES)
+    for _, indexDdl in REALTIME_FRAMES_INDEXES:
+        conn.execute(indexDdl)
+    conn.execute(SCHEMA_REALTIME_SAMPLES_VIEW)
+
+    _liftRealtimeDataSequence(conn, _maxFrameSampleEnd(conn))
+    return created
+
+
+def _liftRealtimeDataSequence(conn: sqlite3.Connection, sampleId: int) -> None:
+    """Make the next ``realtime_data`` AUTOINCREMENT id exceed ``sampleId``."""
+    if sampleId <= 0:
+        return
+    updated = conn.execute(
+        "UPDATE sqlite_sequence SET seq = MAX(seq, ?) WHERE name = 'realtime_data'",
+        (sampleId,),
+    ).rowcount
+    if not updated:
+        conn.execute(
+            "INSERT INTO sqlite_sequence (name, seq) VALUES ('realtime_data', ?)",
+            (sampleId,),
+        )
+
+
+def realtimeSamplesSource(conn: sqlite3.Connection) -> str:
+    """Return the relation readers should select realtime samples from.
+
+    ``realtime_samples`` when the view exists (every database initialized
+    by :meth:`ObdDatabase.initialize`), else ``realtime_data`` for
+    hand-built schemas.
+    """
+    if _objectExists(conn, 'view', REALTIME_SAMPLES_VIEW):
+        return REALTIME_SAMPLES_VIEW
+    return 'realtime_data'
+
+
+# ================================================================================
+# Readers
+# ================================================================================
+
+
+def _maxFrameSampleEnd(conn: sqlite3.Connection) -> int:
+    """Highest frame sample id, or 0 when no frames are stored."""
+    row = conn.execute(
+        "SELECT first_sample_id + json_array_length(frame_values) - 1 "
+        "FROM realtime_frames ORDER BY first_sample_id DESC LIMIT 1"
+    ).fetchone()
+    return int(row[0]) if row is not None else 0
+
+
+def getMaxSampleId(conn: sqlite3.Connection) -> int:
+    """Highest realtime sample id across legacy rows and frames (0 if none)."""
+    row = conn.execute("SELECT COALESCE(MAX(id), 0) FROM realtime_data").fetchone()
+    maxId = int(row[0]) if row is not None else 0
+    if _objectExists(conn, 'table', REALTIME_FRAMES_TABLE):
+        maxId = max(maxId, _maxFrameSampleEnd(conn))
+    return maxId
+
+
+def getSamplesAfter(
+    conn: sqlite3.Connection,
+    lastId: int,
+    limit: int,
+) -> list[dict[str, Any]]:
+    """Return frame samples with ``id > lastId`` in legacy row shape.
+
+    Frames are located through the ``first_sample_id`` index (from the
+    frame containing ``lastId + 1`` up to ``limit`` sample ids past it),
+    so the cost is proportional to ``limit``, not to the table size.  Null
+    slots and id gaps can make a call return fewer than ``limit`` samples;
+    the next call continues from the new cursor.
+
+    Args:
+        conn: Open connection.
+        lastId: Sample-id cursor (e.g. the realtime_data sync high-water mark).
+        limit: Max samples to return.
+
+    Returns:
+        Dicts with the ``realtime_data`` column names, ordered by id ASC.
+    """
+    if limit <= 0:
+        return []
+    floorRow = conn.execute(
+        "SELECT COALESCE("
+        "  (SELECT MAX(first_sample_id) FROM realtime_frames WHERE first_sample_id <= ?),"
+        "  (SELECT MIN(first_sample_id) FROM realtime_frames WHERE first_sample_id > ?))",
+        (int(lastId), int(lastId)),
+    ).fetchone()
+    if floorRow is None or floorRow[0] is None:
+        return []
+    frameFloor = int(floorRow[0])
+    frameCeiling = max(int(lastId) + 1, frameFloor) + int(limit)
+    cursor = conn.execute(
+        "SELECT * FROM ("
+        f"{_FRAME_SAMPLES_SELECT} AND f.first_sample_id >= ? AND f.first_sample_id < ?"
+        ") WHERE id > ? ORDER BY id ASC LIMIT ?",
+        (frameFloor, frameCeiling, int(lastId), int(limit)),
+    )
+    columns = [desc[0] for desc in cursor.description]
+    return [dict(zip(columns, row, strict=True)) for row in cursor.fetchall()]
+
+
+def getLatestSamples(
+    conn: sqlite3.Connection,
+    parameterNames: Iterable[str],
+    dataSources: Sequence[str] = ('real',),
+    maxFrames: int = 256,
+) -> dict[str, tuple[int, float]]:
+    """Return the newest frame sample per parameter.
+
+    Only the ``maxFrames`` most recent frames are unpacked, which covers
+    every tier of the default polling schedule several times over.
+
+    Args:
+        conn: Open connection.
+        parameterNames: Parameter names of interest.
+        dataSources: Accepted ``data_source`` values.
+        maxFrames: How many recent frames to scan.
+
+    Returns:
+        ``{parameter_name: (sample_id, value)}`` for names found.
+    """
+    names = list(parameterNames)
+    if not names or not _objectExists(conn, 'table', REALTIME_FRAMES_TABLE):
+        return {}
+    namePlaceholders = ','.join('?' for _ in names)
+    sourcePlaceholders = ','.join('?' for _ in dataSources)
+    rows = conn.execute(
+        "SELECT s.parameter_name, MAX(s.id), s.value FROM ("
+        f"{_FRAME_SAMPLES_SELECT} AND f.id IN ("
+        "    SELECT id FROM realtime_frames "
+        f"   WHERE data_source IN ({sourcePlaceholders}) "
+        "    ORDER BY id DESC LIMIT ?)"
+        f") s WHERE s.parameter_name IN ({namePlaceholders}) "
+        "GROUP BY s.parameter_name",
+        (*dataSources, int(maxFrames), *names),
+    ).fetchall()
+    return {name: (int(sampleId), float(value)) for name, sampleId, value in rows}
+
+
+# ================================================================================
+# Writer
+# ================================================================================
+
+
+class FramePacker:
+    """
+    Pack stamped realtime rows into frames inside a caller's transaction.
+
+    Consecutive rows sharing ``(timestamp, profile_id, drive_id,
+    data_source)`` form one frame; a repeated parameter inside the same
+    second starts a new frame so no sample is overwritten.  PID dictionary
+    and layout ids are cached per connection lifetime.
+
+    Not thread-safe -- the owning batch writer serializes calls under its
+    flush lock.
+    """
+
+    def __init__(self) -> None:
+        self._pidIds: dict[tuple[str, str], int] = {}
+        self._layoutIds: dict[tuple[int, ...], int] = {}
+
+    def reset(self) -> None:
+        """Forget cached ids (after a failed transaction or reconnect)."""
+        self._pidIds.clear()
+        self._layoutIds.clear()
+
+    def writeRows(self, conn: sqlite3.Connection, rows: Sequence[tuple[Any, ...]]) -> int:
+        """
+        Insert ``rows`` as frames.
+
+        Args:
+            conn: Connection with an open transaction.
+            rows: Tuples in ``REALTIME_ROW_COLUMNS`` order (timestamp,
+                parameter_name, value, unit, profile_id, drive_id,
+                data_source).
+
+        Returns:
+            Number of frames inserted.
+        """
+        frames = self._groupFrames(rows)
+        if not frames:
+            return 0
+        # No-op write first: it opens the transaction and takes SQLite's
+        # write lock, so no other connection can insert a realtime_data
+        # row between reading the id high-water mark and using it.
+        conn.execute("UPDATE sqlite_sequence SET seq = seq WHERE name = 'realtime_frames'")
+        nextSampleId = self._nextSampleId(conn)
+        inserts = []
+        for key, samples in frames:
+            timestamp, profileId, driveId, dataSource = key
+            pidIds = tuple(self._pidId(conn, name, unit) for name, _, unit in samples)
+            layoutId = self._layoutId(conn, pidIds)
+            values = json.dumps([value for _, value, _ in samples], separators=(',', ':'))
+            inserts.append(
+                (timestamp, layoutId, values, nextSampleId, profileId, dataSource, driveId)
+            )
+            nextSampleId += len(samples)
+        conn.executemany(
+            "INSERT INTO realtime_frames "
+            "(timestamp, layout_id, frame_values, first_sample_id, "
+            " profile_id, data_source, drive_id) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            inserts,
+        )
+        # Row-at-a-time writers sharing the database (legacy logReading
+        # callers) must mint ids above these samples.
+        _liftRealtimeDataSequence(conn, nextSampleId - 1)
+        return len(inserts)
+
+    @staticmethod
+    def _groupFrames(
+        rows: Sequence[tuple[Any, ...]],
+    ) -> list[tuple[tuple[Any, ...], list[tuple[str, Any, str]]]]:
+        frames: list[tuple[tuple[Any, ...], list[tuple[str, Any, str]]]] = []
+        seen: set[str] = set()
+        for timestamp, name, value, unit, profileId, driveId, dataSource in rows:
+            key = (timestamp, profileId, driveId, dataSource)
+            if not frames or frames[-1][0] != key or name in seen:
+                frames.append((key, []))
+                seen = set()
+            frames[-1][1].append((name, value, unit or ''))
+            seen.add(name)
+        return frames
+
+    @staticmethod
+    def _nextSampleId(conn: sqlite3.Connection) -> int:
+        """Next dense sample id: above frames, legacy rows and the sync cursor."""
+        candidate = max(FRAME_SAMPLE_ID_BASE, getMaxSampleId(conn) + 1)
+        if _objectExists(conn, 'table', 'sync_log'):
+            row = conn.execute(
+                "SELECT last_synced_id FROM sync_log WHERE table_name = 'realtime_data'"
+            ).fetchone()
+            if row is not None and row[0] is not None:
+                candidate = max(candidate, int(row[0]) + 1)
+        return candidate
+
+    def _pidId(self, conn: sqlite3.Connection, name: str, unit: str) -> int:
+        key = (name, unit)
+        pidId = self._pidIds.get(key)
+        if pidId is None:
+            conn.execute(
+                "INSERT OR IGNORE INTO realtime_pid_dict (parameter_name, unit) "
+                "VALUES (?, ?)",
+                key,
+            )
+            pidId = int(conn.execute(
+                "SELECT pid_id FROM realtime_pid_dict "
+                "WHERE parameter_name = ? AND unit = ?",
+                key,
+            ).fetchone()[0])
+            self._pidIds[key] = pidId
+        return pidId
+
+    def _layoutId(self, conn: sqlite3.Connection, pidIds: tuple[int, ...]) -> int:
+        layoutId = self._layoutIds.get(pidIds)
+        if layoutId is None:
+            encoded = json.dumps(list(pidIds), separators=(',', ':'))
+            conn.execute(
+                "INSERT OR IGNORE INTO realtime_frame_layouts (pid_ids) VALUES (?)",
+                (encoded,),
+            )
+            layoutId = int(conn.execute(
+                "SELECT layout_id FROM realtime_frame_layouts WHERE pid_ids = ?",
+                (encoded,),
+            ).fetchone()[0])
+            self._layoutIds[pidIds] = layoutId
+        return layoutId
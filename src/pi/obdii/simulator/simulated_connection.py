@@ -10,6 +10,9 @@
 # Date          | Author       | Description
 # ================================================================================
 # 2026-01-22    | M. Cornelison | Initial implementation for US-034
+# 2026-10-16    | Rex           | queryBatch(): emulates multi-PID Mode 01
+#                |              | requests (6 PIDs per round-trip, optional
+#                |              | ECU rejection) for off-car testing.
 # ================================================================================
 ################################################################################
 
@@ -19,6 +22,7 @@ Simulated OBD-II connection module for testing without hardware.
 Provides:
 - SimulatedObdConnection class matching ObdConnection interface
 - connect(), disconnect(), isConnected(), query(), getStatus() methods
+- queryBatch() multi-PID emulation matching ObdConnection.queryBatch
 - Simulated sensor values from SensorSimulator
 - Configurable connection delay simulation
 
@@ -47,6 +51,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
+from ..decoders import MAX_PIDS_PER_MODE01_REQUEST
 from ..obd_connection import ConnectionState, ConnectionStatus
 from .sensor_simulator import SensorSimulator
 from .vehicle_profile import VehicleProfile
@@ -270,7 +275,8 @@ class SimulatedObdConnection:
         simulator: SensorSimulator | None = None,
         connectionDelaySeconds: float = DEFAULT_CONNECTION_DELAY_SECONDS,
         config: dict[str, Any] | None = None,
-        database: Any | None = None
+        database: Any | None = None,
+        multiPidSupported: bool = True,
     ) -> None:
         """
         Initialize SimulatedObdConnection.
@@ -281,6 +287,8 @@ class SimulatedObdConnection:
             connectionDelaySeconds: Simulated delay for connect() in seconds
             config: Optional configuration dictionary (for compatibility)
             database: Optional database instance (for compatibility, not used)
+            multiPidSupported: When False, :meth:`queryBatch` behaves like
+                an ISO 9141 ECU that rejects multi-PID requests.
         """
         # Set up simulator
         if simulator is not None:
@@ -297,6 +305,11 @@ class SimulatedObdConnection:
         # Create simulated OBD interface
         self.obd = SimulatedObd(self)
 
+        # Multi-PID emulation.  batchRequestCount counts simulated round-trips
+        # (single queries are not counted -- they go through self.obd).
+        self.multiPidSupported = multiPidSupported
+        self.batchRequestCount = 0
+
         # Connection state tracking
         self._status = ConnectionStatus(
             state=ConnectionState.DISCONNECTED,
@@ -398,6 +411,34 @@ class SimulatedObdConnection:
         self.disconnect()
         return self.connect()
 
+    def queryBatch(self, commands: list[Any]) -> dict[str, Any]:
+        """
+        Emulate multi-PID Mode 01 requests.
+
+        Commands are served six per simulated round-trip.  Parameters the
+        simulator has no value for are omitted (the caller falls back to
+        single queries, exactly as with a real ECU).  With
+        ``multiPidSupported=False`` every request is rejected.
+
+        Args:
+            commands: OBD command objects or parameter name strings
+
+        Returns:
+            ``{command name: SimulatedResponse}`` for every served command
+        """
+        if not self.isConnected() or not self.multiPidSupported:
+            return {}
+        results: dict[str, Any] = {}
+        for start in range(0, len(commands), MAX_PIDS_PER_MODE01_REQUEST):
+            chunk = commands[start:start + MAX_PIDS_PER_MODE01_REQUEST]
+            self.batchRequestCount += 1
+            for cmd in chunk:
+                key = cmd if isinstance(cmd, str) else getattr(cmd, 'name', str(cmd))
+                response = self.obd.query(cmd)
+                if not response.is_null():
+                    results[key] = response
+        return results
+
     def update(self, deltaSeconds: float) -> None:
         """
         Advance the simulation by a time delta.
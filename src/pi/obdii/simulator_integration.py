@@ -11,6 +11,8 @@
 # ================================================================================
 # 2026-01-22    | M. Cornelison | Initial implementation for US-039
 # 2026-04-14    | Sweep 5       | Split types/factories into integration_* modules
+# 2026-10-17    | Rex           | Alerts checked once per update with
+#               |               | AlertManager.checkFrame.
 # ================================================================================
 ################################################################################
 
@@ -527,17 +529,15 @@ class SimulatorIntegration:
                 if newState.value == 'running':
                     self._stats.drivesDetected += 1
 
-        # Feed to AlertManager
+        # Feed to AlertManager (one frame per update)
         if self._alertManager:
-            for paramName, value in values.items():
-                alert = self._alertManager.checkValue(paramName, value)
-                if alert:
-                    self._stats.alertsTriggered += 1
-                    if self._onAlertTriggered:
-                        try:
-                            self._onAlertTriggered(paramName, value)
-                        except Exception as e:
-                            logger.warning(f"onAlertTriggered callback error: {e}")
+            for alert in self._alertManager.checkFrame(values):
+                self._stats.alertsTriggered += 1
+                if self._onAlertTriggered:
+                    try:
+                        self._onAlertTriggered(alert.parameterName, alert.value)
+                    except Exception as e:
+                        logger.warning(f"onAlertTriggered callback error: {e}")
 
         # Update DisplayManager
         if self._displayManager:
@@ -27,6 +27,14 @@
 #                               ERROR + RE-RAISES instead of silently
 #                               swallowing the exception.  Closes Spool's
 #                               Sprint 22 Drain-7 truth-table hypothesis C.
+# 2026-10-17    | Rex          | power_log event rows go through writeEventRow
+#                               (shared event log writer when running);
+#                               logShutdownStage flushes that queue, then
+#                               writes its own row synchronously as before.
+# 2026-10-17    | Rex          | One lazy _writeEventRow accessor replaces the
+#                               three function-local imports.
+# 2026-10-17    | Rex          | logShutdownStage's flush goes through the
+#                               same _eventLogWriter accessor.
 # ================================================================================
 ################################################################################
 
@@ -41,7 +49,9 @@ and delegates row-writing here.
 import logging
 import os
 import sqlite3
+from collections.abc import Sequence
 from datetime import datetime
+from types import ModuleType
 from typing import Any
 
 from src.common.time.helper import utcIsoNow
@@ -50,6 +60,33 @@ from .types import PowerReading, PowerSource
 
 logger = logging.getLogger(__name__)
 
+_POWER_LOG_INSERT_SQL = (
+    "INSERT INTO power_log (timestamp, event_type, power_source, on_ac_power) "
+    "VALUES (?, ?, ?, ?)"
+)
+
+
+def _eventLogWriter() -> ModuleType:
+    """Return :mod:`src.pi.obdii.data.event_log_writer`, imported on first use.
+
+    Imported at call time: ``src.pi.obdii`` loads ``src.pi.obdii.database``,
+    which imports :func:`ensurePowerLogVcellColumn` from this module, so a
+    module-level import would find this module half-initialised.
+    """
+    from src.pi.obdii.data import event_log_writer
+
+    return event_log_writer
+
+
+def _writeEventRow(database: Any, sql: str, params: Sequence[Any]) -> None:
+    """Forward to :func:`~src.pi.obdii.data.event_log_writer.writeEventRow`."""
+    _eventLogWriter().writeEventRow(database, sql, params)
+
+
+def _flushEventLog(database: Any, reason: str) -> None:
+    """Forward to :func:`~src.pi.obdii.data.event_log_writer.flushEventLog`."""
+    _eventLogWriter().flushEventLog(database, reason)
+
 
 def logPowerReading(
     database: Any | None,
@@ -68,26 +105,21 @@ def logPowerReading(
         return
 
     try:
-        with database.connect() as conn:
-            cursor = conn.cursor()
-            # TD-027 / US-203: canonical ISO-8601 UTC at DB-write boundary.
-            # The reading.timestamp field may be naive local-time (upstream
-            # PowerReading default is naive datetime.now()); capture rows must
-            # not inherit that drift.
-            cursor.execute(
-                """
-                INSERT INTO power_log
-                (timestamp, event_type, power_source, on_ac_power)
-                VALUES (?, ?, ?, ?)
-                """,
-                (
-                    utcIsoNow(),
-                    eventType,
-                    reading.powerSource.value,
-                    1 if reading.onAcPower else 0,
-                )
-            )
-            logger.debug(f"Logged power status to database | type={eventType}")
+        # TD-027 / US-203: canonical ISO-8601 UTC at DB-write boundary.
+        # The reading.timestamp field may be naive local-time (upstream
+        # PowerReading default is naive datetime.now()); capture rows must
+        # not inherit that drift.
+        _writeEventRow(
+            database,
+            _POWER_LOG_INSERT_SQL,
+            (
+                utcIsoNow(),
+                eventType,
+                reading.powerSource.value,
+                1 if reading.onAcPower else 0,
+            ),
+        )
+        logger.debug(f"Logged power status to database | type={eventType}")
     except Exception as e:
         logger.error(f"Error logging power status to database: {e}")
 
@@ -112,23 +144,18 @@ def logPowerTransition(
         return
 
     try:
-        with database.connect() as conn:
-            cursor = conn.cursor()
-            # TD-027 / US-203: canonical ISO-8601 UTC at DB-write boundary.
-            cursor.execute(
-                """
-                INSERT INTO power_log
-                (timestamp, event_type, power_source, on_ac_power)
-                VALUES (?, ?, ?, ?)
-                """,
-                (
-                    utcIsoNow(),
-                    eventType,
-                    currentSource.value,
-                    1 if currentSource == PowerSource.AC_POWER else 0,
-                )
-            )
-            logger.debug(f"Logged power transition to database | type={eventType}")
+        # TD-027 / US-203: canonical ISO-8601 UTC at DB-write boundary.
+        _writeEventRow(
+            database,
+            _POWER_LOG_INSERT_SQL,
+            (
+                utcIsoNow(),
+                eventType,
+                currentSource.value,
+                1 if currentSource == PowerSource.AC_POWER else 0,
+            ),
+        )
+        logger.debug(f"Logged power transition to database | type={eventType}")
     except Exception as e:
         logger.error(f"Error logging power transition to database: {e}")
 
@@ -150,25 +177,20 @@ def logPowerSavingEvent(
         return
 
     try:
-        with database.connect() as conn:
-            cursor = conn.cursor()
-            # TD-027 / US-203: canonical ISO-8601 UTC via the shared helper.
-            # Previously used naive datetime.now() -- produced America/Chicago
-            # local-time strings, colliding with the schema DEFAULT's UTC form.
-            cursor.execute(
-                """
-                INSERT INTO power_log
-                (timestamp, event_type, power_source, on_ac_power)
-                VALUES (?, ?, ?, ?)
-                """,
-                (
-                    utcIsoNow(),
-                    eventType,
-                    currentSource.value,
-                    1 if currentSource == PowerSource.AC_POWER else 0,
-                )
-            )
-            logger.debug(f"Logged power saving event to database | type={eventType}")
+        # TD-027 / US-203: canonical ISO-8601 UTC via the shared helper.
+        # Previously used naive datetime.now() -- produced America/Chicago
+        # local-time strings, colliding with the schema DEFAULT's UTC form.
+        _writeEventRow(
+            database,
+            _POWER_LOG_INSERT_SQL,
+            (
+                utcIsoNow(),
+                eventType,
+                currentSource.value,
+                1 if currentSource == PowerSource.AC_POWER else 0,
+            ),
+        )
+        logger.debug(f"Logged power saving event to database | type={eventType}")
     except Exception as e:
         logger.error(f"Error logging power saving event to database: {e}")
 
@@ -201,6 +223,9 @@ def logShutdownStage(
     * Explicit ``conn.commit()`` before the context manager exits --
       removes the dependency on ``ObdDatabase.connect``'s implicit
       commit semantics for the durability sequence.
+    * Rows queued on the shared event log writer are flushed first
+      (reason ``shutdown_stage``); the stage row itself never goes
+      through the queue.
     * ``os.fsync(fd)`` on the database file after commit -- kernel-level
       defense in depth that catches any drift in SQLite's own fsync
       behavior.  Wrapped in its own try/except so an fsync failure
@@ -227,6 +252,9 @@ def logShutdownStage(
     """
     if database is None:
         return
+    # Queued event rows (alerts, power transitions, connection events)
+    # precede this stage in time; land them first.  flush() never raises.
+    _flushEventLog(database, 'shutdown_stage')
     try:
         with database.connect() as conn:
             # US-267: WAL fsync on every commit; otherwise WAL-buffered
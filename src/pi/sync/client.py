@@ -45,6 +45,18 @@
 #                               inner `with conn:` retains the existing
 #                               commit-on-clean-exit / rollback-on-exception
 #                               transaction semantics.
+# 2026-10-16    | Rex          | Bulk push mode (pi.companionService.bulkPush):
+#                               one gzip/zstd-compressed request carries
+#                               several tables' deltas up to a byte budget;
+#                               cursors advance together via
+#                               sync_log.advanceHighWaterMarks only after the
+#                               server acknowledges.  SweepStats reports
+#                               bytes-on-wire and rows/sec per sweep.
+# 2026-10-16    | Rex          | bulkPush.wireFormat='columnar': realtime_data
+#                               rides as a columnar binary block
+#                               (src.common.contracts.realtime_columnar);
+#                               falls back to JSON for the client's lifetime
+#                               if the server answers 415.
 # ================================================================================
 ################################################################################
 
@@ -83,6 +95,26 @@ Uses stdlib :mod:`urllib.request` (no new dependencies on the Pi).  A
       }
     }
 
+Bulk push
+---------
+With ``pi.companionService.bulkPush.enabled`` :meth:`SyncClient.pushAllDeltas`
+drains every delta table over ONE SQLite connection, packing rows from as
+many tables as fit into ``maxBatchBytes`` of JSON per request (same payload
+shape, several keys under ``tables``).  The body is sent with
+``Content-Encoding: gzip`` (or ``zstd`` when the optional ``zstandard``
+package is installed).  The server acknowledges the whole request or none
+of it, so all tables in a request advance their marks in one sync_log
+transaction after the 2xx -- and none do on failure.  Requests repeat until
+every table is drained, a request fails, or ``maxRequestsPerSweep`` is hit.
+
+With ``bulkPush.wireFormat: columnar`` the ``realtime_data`` rows of a bulk
+request travel as per-column arrays (see
+:mod:`src.common.contracts.realtime_columnar`) under the
+``application/vnd.eclipse-obd.sync-columnar`` content type; the other
+tables stay JSON inside the same body.  A server that answers 415 has no
+columnar decoder -- the client then rebuilds the request as JSON and keeps
+using JSON until it is restarted.
+
 Retry classifier
 ----------------
 * ``HTTPError`` with ``code >= 500`` -> retry (server fault, likely transient)
@@ -100,6 +132,7 @@ than needed without changing behavior.
 
 from __future__ import annotations
 
+import gzip
 import json
 import logging
 import socket
@@ -115,14 +148,40 @@ from enum import StrEnum
 from typing import Any
 
 from src.common.config.secrets_loader import getSecret
+from src.common.contracts.realtime_columnar import (
+    COLUMNAR_TABLES,
+    encodeColumnar,
+    isColumnarRow,
+    packSyncBody,
+    rowBytes,
+)
+from src.common.contracts.realtime_columnar import (
+    CONTENT_TYPE as COLUMNAR_CONTENT_TYPE,
+)
 from src.common.errors.handler import ConfigurationError
 from src.pi.data import sync_log
 from src.pi.obdii.drive_id import DRIVE_COUNTER_TABLE
 
-__all__ = ["PushResult", "PushStatus", "PushSummary", "SyncClient"]
+try:  # Optional: zstd bulk-push compression when installed.
+    import zstandard
+except ImportError:  # pragma: no cover - depends on the Pi image
+    zstandard = None
+
+__all__ = ["PushResult", "PushStatus", "PushSummary", "SweepStats", "SyncClient"]
 
 logger = logging.getLogger(__name__)
 
+COMPRESSION_GZIP = "gzip"
+COMPRESSION_ZSTD = "zstd"
+COMPRESSION_NONE = "none"
+
+WIRE_FORMAT_JSON = "json"
+WIRE_FORMAT_COLUMNAR = "columnar"
+JSON_CONTENT_TYPE = "application/json"
+
+DEFAULT_BULK_MAX_BATCH_BYTES = 4 * 1024 * 1024
+DEFAULT_BULK_MAX_REQUESTS_PER_SWEEP = 50
+
 
 # ================================================================================
 # Result types
@@ -144,6 +203,38 @@ class PushStatus(StrEnum):
     SKIPPED = "skipped"
 
 
+@dataclass(slots=True)
+class SweepStats:
+    """Transfer totals for one :meth:`SyncClient.pushAllDeltas` sweep.
+
+    Attributes:
+        mode: ``'bulk'`` or ``'per-table'``.
+        requests: Sync POSTs acknowledged by the server.
+        rowsPushed: Rows in acknowledged requests.
+        bytesRaw: Uncompressed JSON bytes of acknowledged requests.
+        bytesOnWire: Request-body bytes actually sent for them (after
+            compression).
+        elapsed: Wall-clock seconds for the sweep.
+        encoding: Content-Encoding used (``'identity'`` when uncompressed).
+        wireFormat: ``'columnar'`` when any acknowledged request carried a
+            columnar block, else ``'json'``.
+    """
+
+    mode: str
+    requests: int = 0
+    rowsPushed: int = 0
+    bytesRaw: int = 0
+    bytesOnWire: int = 0
+    elapsed: float = 0.0
+    encoding: str = "identity"
+    wireFormat: str = WIRE_FORMAT_JSON
+
+    @property
+    def rowsPerSecond(self) -> float:
+        """Pushed rows per wall-clock second (0.0 for an instant sweep)."""
+        return self.rowsPushed / self.elapsed if self.elapsed > 0 else 0.0
+
+
 @dataclass(slots=True)
 class PushSummary:
     """Aggregate outcome of a :meth:`SyncClient.forcePush` call (US-225).
@@ -168,6 +259,7 @@ class PushSummary:
             push was attempted.
         elapsed: Wall-clock seconds across the entire forcePush call,
             measured by the caller.
+        sweep: Transfer totals of the table sweep (None when disabled).
     """
 
     results: list[PushResult]
@@ -178,6 +270,7 @@ class PushSummary:
     tablesSkipped: int
     disabled: bool
     elapsed: float
+    sweep: SweepStats | None = None
 
 
 @dataclass(slots=True)
@@ -196,6 +289,9 @@ class PushResult:
             including all retries.
         status: See :class:`PushStatus`.
         reason: Human-readable failure reason (empty on OK).
+        bytesOnWire: Request-body bytes of the successful POST.  Always 0
+            in bulk mode, where requests are shared between tables --
+            see :class:`SweepStats`.
     """
 
     tableName: str
@@ -204,6 +300,7 @@ class PushResult:
     elapsed: float
     status: PushStatus
     reason: str = field(default="")
+    bytesOnWire: int = 0
 
 
 # ================================================================================
@@ -252,6 +349,15 @@ def _renamePkToId(
     return renamed
 
 
+def _compressBody(body: bytes, compression: str) -> tuple[bytes, str]:
+    """Compress a request body; return ``(wireBytes, contentEncoding)``."""
+    if compression == COMPRESSION_ZSTD and zstandard is not None:
+        return zstandard.ZstdCompressor(level=3).compress(body), COMPRESSION_ZSTD
+    if compression in (COMPRESSION_GZIP, COMPRESSION_ZSTD):
+        return gzip.compress(body, compresslevel=6, mtime=0), COMPRESSION_GZIP
+    return body, "identity"
+
+
 # Network-level exceptions that always warrant a retry.  ``socket.timeout`` is
 # an alias for ``TimeoutError`` on Python 3.10+, listed explicitly so the
 # classifier stays obvious on older interpreters in tests.
@@ -349,6 +455,19 @@ class SyncClient:
         if self.isEnabled:
             self._apiKey = self._resolveApiKey()
 
+        self._bulk: dict[str, Any] = self._companion.get("bulkPush", {}) or {}
+        if (
+            self.isBulkPush
+            and self._bulk.get("compression") == COMPRESSION_ZSTD
+            and zstandard is None
+        ):
+            logger.warning(
+                "bulkPush.compression=zstd but the zstandard package is not "
+                "installed; falling back to gzip",
+            )
+        self._columnarRejected = False
+        self.lastSweep: SweepStats | None = None
+
     # ---- config surface ----------------------------------------------------
 
     @property
@@ -356,6 +475,24 @@ class SyncClient:
         """True when ``pi.companionService.enabled`` is truthy."""
         return bool(self._companion.get("enabled", False))
 
+    @property
+    def isBulkPush(self) -> bool:
+        """True when ``pi.companionService.bulkPush.enabled`` is truthy."""
+        return bool(self._bulk.get("enabled", False))
+
+    @property
+    def isColumnar(self) -> bool:
+        """True when bulk requests carry ``realtime_data`` as a columnar block.
+
+        Becomes False for the rest of the client's lifetime once the server
+        rejects a columnar body with 415.
+        """
+        return (
+            self.isBulkPush
+            and self._bulk.get("wireFormat", WIRE_FORMAT_JSON) == WIRE_FORMAT_COLUMNAR
+            and not self._columnarRejected
+        )
+
     @property
     def baseUrl(self) -> str:
         """Companion-service base URL, with any trailing slash stripped."""
@@ -564,7 +701,9 @@ class SyncClient:
 
             batchId = _makeBatchId(self._deviceId)
             try:
-                self._postBatchWithRetry(tableName, batchId, payloadRows, lastId)
+                bytesOnWire = self._postBatchWithRetry(
+                    tableName, batchId, payloadRows, lastId,
+                )
             except _PushFailure as failure:
                 # On failure, record status='failed' + last_batch_id +
                 # last_synced_at WITHOUT advancing last_synced_id.  We do
@@ -618,6 +757,7 @@ class SyncClient:
                 batchId=batchId,
                 elapsed=time.monotonic() - start,
                 status=PushStatus.OK,
+                bytesOnWire=bytesOnWire,
             )
 
     @staticmethod
@@ -659,16 +799,236 @@ class SyncClient:
         in the result set so operator output (``scripts/sync_now.py``) keeps
         visibility into all eight in-scope tables.
 
+        With ``bulkPush.enabled`` the delta tables are drained through
+        shared compressed requests (see module docstring); otherwise each
+        table gets its own :meth:`pushDelta` call.  Either way the sweep's
+        transfer totals land in :attr:`lastSweep` and one INFO line.
+
         Returns:
             One :class:`PushResult` per table in
             :data:`sync_log.IN_SCOPE_TABLES`, ordered by table name so
             operator-facing output is stable across runs.
         """
-        results: list[PushResult] = []
-        for tableName in sorted(sync_log.IN_SCOPE_TABLES):
-            results.append(self.pushDelta(tableName))
+        start = time.monotonic()
+        if self.isEnabled and self.isBulkPush:
+            results, sweep = self._pushAllDeltasBulk()
+        else:
+            results = [
+                self.pushDelta(tableName)
+                for tableName in sorted(sync_log.IN_SCOPE_TABLES)
+            ]
+            sweep = SweepStats(mode="per-table")
+            for result in results:
+                if result.status == PushStatus.OK:
+                    sweep.requests += 1
+                    sweep.rowsPushed += result.rowsPushed
+                    sweep.bytesRaw += result.bytesOnWire
+                    sweep.bytesOnWire += result.bytesOnWire
+        sweep.elapsed = time.monotonic() - start
+        self.lastSweep = sweep
+        if self.isEnabled:
+            logger.log(
+                logging.INFO if sweep.requests else logging.DEBUG,
+                "sync sweep | mode=%s | requests=%d | rows=%d | bytes_raw=%d | "
+                "bytes_on_wire=%d | encoding=%s | rows_per_sec=%.1f | "
+                "elapsed=%.2fs",
+                sweep.mode, sweep.requests, sweep.rowsPushed, sweep.bytesRaw,
+                sweep.bytesOnWire, sweep.encoding, sweep.rowsPerSecond,
+                sweep.elapsed,
+            )
         return results
 
+    def _pushAllDeltasBulk(self) -> tuple[list[PushResult], SweepStats]:
+        """Drain every delta table through multi-table compressed requests.
+
+        Uses one SQLite connection for the whole sweep.  Each request's
+        tables advance their marks together after the 2xx; a failed request
+        records ``status='failed'`` for its tables without advancing and
+        ends the sweep (the next sweep re-sends the same rows).
+        """
+        start = time.monotonic()
+        compression = str(self._bulk.get("compression", COMPRESSION_GZIP))
+        maxBatchBytes = int(
+            self._bulk.get("maxBatchBytes", DEFAULT_BULK_MAX_BATCH_BYTES)
+        )
+        maxRequests = int(
+            self._bulk.get("maxRequestsPerSweep", DEFAULT_BULK_MAX_REQUESTS_PER_SWEEP)
+        )
+        sweep = SweepStats(mode="bulk")
+        tableNames = sorted(sync_log.IN_SCOPE_TABLES)
+        pending = [t for t in tableNames if t not in sync_log.SNAPSHOT_TABLES]
+        rowsByTable = dict.fromkeys(pending, 0)
+        batchIdByTable = dict.fromkeys(pending, "")
+        failedTables: set[str] = set()
+        failureReason = ""
+
+        with closing(sqlite3.connect(self._dbPath)) as conn, conn:
+            sync_log.initDb(conn)
+            sync_log.ensureSyncModifiedAtSchema(conn)
+            requestIndex = 0
+            while requestIndex < maxRequests:
+                batch = self._buildBulkBatch(
+                    conn, pending, maxBatchBytes, columnar=self.isColumnar,
+                )
+                if batch is None:
+                    break
+                batchId = f"{_makeBatchId(self._deviceId)}-{requestIndex + 1}"
+                body = batch.encode(self._deviceId, batchId)
+                try:
+                    wireBytes, encoding = self._postBodyWithRetry(
+                        f"bulk[{','.join(batch.tableNames)}]", body, compression,
+                        contentType=(
+                            COLUMNAR_CONTENT_TYPE if batch.columnar
+                            else JSON_CONTENT_TYPE
+                        ),
+                    )
+                except _PushFailure as failure:
+                    if batch.columnar and failure.httpStatus == 415:
+                        # Server predates the columnar decoder: nothing was
+                        # stored, so rebuild the same rows as JSON.
+                        logger.warning(
+                            "sync server rejected the columnar wire format "
+                            "(HTTP 415); using JSON for the rest of this run",
+                        )
+                        self._columnarRejected = True
+                        continue
+                    pending = [t for t in pending if t not in batch.drained]
+                    sync_log.advanceHighWaterMarks(
+                        conn,
+                        {t: (batch.lastSyncedIds[t], None) for t in batch.tableNames},
+                        batchId,
+                        status="failed",
+                    )
+                    failedTables = set(batch.tableNames) | set(pending)
+                    failureReason = str(failure)
+                    break
+
+                requestIndex += 1
+                pending = [t for t in pending if t not in batch.drained]
+                sync_log.advanceHighWaterMarks(conn, batch.marks(), batchId)
+                sweep.requests += 1
+                sweep.rowsPushed += batch.rowCount
+                sweep.bytesRaw += len(body)
+                sweep.bytesOnWire += wireBytes
+                sweep.encoding = encoding
+                if batch.columnar:
+                    sweep.wireFormat = WIRE_FORMAT_COLUMNAR
+                for tableName in batch.tableNames:
+                    rowsByTable[tableName] += batch.tableRowCount(tableName)
+                    batchIdByTable[tableName] = batchId
+                    logger.info(
+                        "FORENSIC sync_push_table_advance | table=%s | "
+                        "old_id=%s | new_id=%s | new_modified_at=%s | rows=%d | "
+                        "batch=%s",
+                        tableName, batch.lastSyncedIds[tableName],
+                        batch.highWater[tableName],
+                        batch.modifiedAt.get(tableName),
+                        batch.tableRowCount(tableName), batchId,
+                    )
+                if not pending:
+                    break
+
+        results: list[PushResult] = []
+        elapsed = time.monotonic() - start
+        for tableName in tableNames:
+            if tableName in sync_log.SNAPSHOT_TABLES:
+                results.append(self.pushDelta(tableName))
+                continue
+            if tableName in failedTables:
+                status = PushStatus.FAILED
+            elif rowsByTable[tableName]:
+                status = PushStatus.OK
+            else:
+                status = PushStatus.EMPTY
+            results.append(PushResult(
+                tableName=tableName,
+                rowsPushed=rowsByTable[tableName],
+                batchId=batchIdByTable[tableName],
+                elapsed=elapsed,
+                status=status,
+                reason=failureReason if status == PushStatus.FAILED else "",
+            ))
+        return results, sweep
+
+    def _buildBulkBatch(
+        self,
+        conn: sqlite3.Connection,
+        tableNames: list[str],
+        maxBatchBytes: int,
+        columnar: bool = False,
+    ) -> _BulkBatch | None:
+        """Fill one request with delta rows, in table order, up to the budget.
+
+        Each row is serialized exactly once, so the budget is measured on
+        the real JSON.  With ``columnar`` the rows of
+        :data:`COLUMNAR_TABLES` are kept as dicts and budgeted at their
+        fixed columnar width instead; a row the columnar block cannot carry
+        (unexpected column or type) ends the request, and if it is the
+        table's first row the table goes as JSON in this request.
+
+        INSERT-only tables page forward from a local cursor until drained
+        or the budget is hit; combined-cursor tables (US-315) contribute a
+        single page per request because their modified_at cursor must
+        advance before the next page is well-defined.  A row larger than
+        the whole budget still goes out alone so one oversize row can
+        never stall the sweep.
+
+        Returns:
+            The batch, or None when no table has rows to send.
+        """
+        batch = _BulkBatch()
+        budget = max(1, maxBatchBytes - _BULK_ENVELOPE_BYTES)
+        pageSize = self._readBatchSize()
+        for tableName in tableNames:
+            if batch.size >= budget:
+                break
+            pkColumn = sync_log.PK_COLUMN[tableName]
+            supportsUpdateSync = tableName in sync_log.SYNC_UPDATE_TABLES_PK
+            lastId = sync_log.getHighWaterMark(conn, tableName)[0]
+            lastModifiedAt: str | None = None
+            modifiedAtByPk: dict[int, str] = {}
+            if supportsUpdateSync:
+                lastModifiedAt = sync_log.getModifiedHighWaterMark(conn, tableName)
+                modifiedAtByPk = self._collectModifiedAt(
+                    conn, tableName, pkColumn, lastId, lastModifiedAt,
+                )
+            cursorId = lastId
+            while True:
+                rows = sync_log.getDeltaRows(
+                    conn, tableName, cursorId, pageSize,
+                    lastModifiedAt=lastModifiedAt,
+                )
+                asColumns = columnar and tableName in COLUMNAR_TABLES
+                for row in rows:
+                    if pkColumn != "id":
+                        row = _renamePkToId([row], pkColumn)[0]
+                    if asColumns and isColumnarRow(row):
+                        if batch.rowCount and batch.size + rowBytes(row) > budget:
+                            return batch
+                        batch.addColumnar(tableName, lastId, row)
+                        continue
+                    if asColumns:
+                        if tableName in batch.columnar:
+                            return batch
+                        asColumns = False
+                    encoded = json.dumps(row, default=str, separators=(",", ":"))
+                    if batch.rowCount and batch.size + len(encoded) + 1 > budget:
+                        return batch
+                    batch.add(tableName, lastId, int(row["id"]), encoded)
+                    if supportsUpdateSync:
+                        batch.noteModifiedAt(
+                            tableName,
+                            modifiedAtByPk.get(int(row["id"])),
+                            lastModifiedAt,
+                        )
+                if len(rows) < pageSize:
+                    batch.drained.add(tableName)
+                    break
+                if supportsUpdateSync:
+                    break
+                cursorId = int(rows[-1][pkColumn])
+        return batch if batch.rowCount else None
+
     def forcePush(self) -> PushSummary:
         """Explicit-intent manual sync flush (US-225 / TD-034).
 
@@ -741,6 +1101,7 @@ class SyncClient:
             tablesSkipped=tablesSkipped,
             disabled=disabled,
             elapsed=elapsed,
+            sweep=None if disabled else self.lastSweep,
         )
 
     def pushDriveCounter(self) -> PushResult:
@@ -827,8 +1188,8 @@ class SyncClient:
         batchId: str,
         rows: list[dict[str, Any]],
         lastSyncedId: int,
-    ) -> None:
-        """POST the batch; retry on transient failures; raise on final fail."""
+    ) -> int:
+        """POST one table's batch uncompressed; return the bytes sent."""
         payload = {
             "deviceId": self._deviceId,
             "batchId": batchId,
@@ -837,11 +1198,38 @@ class SyncClient:
             },
         }
         body = json.dumps(payload, default=str).encode("utf-8")
+        bytesOnWire, _ = self._postBodyWithRetry(tableName, body, COMPRESSION_NONE)
+        return bytesOnWire
+
+    def _postBodyWithRetry(
+        self,
+        label: str,
+        body: bytes,
+        compression: str,
+        contentType: str = JSON_CONTENT_TYPE,
+    ) -> tuple[int, str]:
+        """POST a sync body; retry on transient failures; raise on final fail.
+
+        Args:
+            label: Table name (or bulk table list) for log lines.
+            body: Uncompressed request body.
+            compression: ``'gzip'``, ``'zstd'`` or ``'none'``.
+            contentType: ``application/json`` or the columnar content type.
+
+        Returns:
+            ``(bytesOnWire, contentEncoding)`` of the acknowledged request.
+
+        Raises:
+            _PushFailure: Non-retryable rejection or retries exhausted.
+        """
+        wireBody, encoding = _compressBody(body, compression)
         url = f"{self.baseUrl}/api/v1/sync"
         headers = {
-            "Content-Type": "application/json",
+            "Content-Type": contentType,
             "X-API-Key": self._apiKey or "",
         }
+        if encoding != "identity":
+            headers["Content-Encoding"] = encoding
         timeout = self._readTimeoutSeconds()
         delays = self._readBackoffDelays()
 
@@ -854,37 +1242,38 @@ class SyncClient:
             if attempt > 0:
                 self._sleep(delays[attempt - 1])
 
-            req = urllib.request.Request(url, data=body, headers=headers, method="POST")
+            req = urllib.request.Request(
+                url, data=wireBody, headers=headers, method="POST",
+            )
             try:
                 with self._httpOpener(req, timeout=timeout) as response:
                     # Reading the body drains the socket cleanly; we don't
                     # care about the parsed content because 2xx is the
                     # success signal by itself.
                     _ = response.read()
-                return
+                return len(wireBody), encoding
             except urllib.error.HTTPError as exc:
                 code = getattr(exc, "code", 0) or 0
                 lastReason = f"HTTP {code} {exc.reason}"
                 if not _isRetryableHttpStatus(code):
                     logger.warning(
                         "sync push for %s -> %s rejected: %s (no retry)",
-                        tableName, url, lastReason,
+                        label, url, lastReason,
                     )
-                    raise _PushFailure(lastReason) from exc
+                    raise _PushFailure(lastReason, httpStatus=code) from exc
                 logger.warning(
                     "sync push for %s -> %s attempt %d/%d failed: %s",
-                    tableName, url, attempt + 1, totalAttempts, lastReason,
+                    label, url, attempt + 1, totalAttempts, lastReason,
                 )
             except _RETRYABLE_NETWORK_EXCEPTIONS as exc:
                 lastReason = f"{type(exc).__name__}: {exc}"
                 logger.warning(
                     "sync push for %s -> %s attempt %d/%d network error: %s",
-                    tableName, url, attempt + 1, totalAttempts, lastReason,
+                    label, url, attempt + 1, totalAttempts, lastReason,
                 )
 
         raise _PushFailure(lastReason)
 
-
     def _postDriveCounterWithRetry(
         self,
         batchId: str,
@@ -946,6 +1335,97 @@ class SyncClient:
         raise _PushFailure(lastReason)
 
 
+# ================================================================================
+# Bulk request assembly
+# ================================================================================
+
+# Room reserved for the request envelope (deviceId, batchId, table keys).
+_BULK_ENVELOPE_BYTES = 1024
+
+
+@dataclass(slots=True)
+class _BulkBatch:
+    """Pre-serialized rows for one bulk request, grouped by table.
+
+    ``size`` tracks the JSON bytes of the row list so far (rows are
+    ASCII-escaped by :func:`json.dumps`, so characters == bytes) plus the
+    columnar width of any rows held in ``columnar``.
+    """
+
+    rows: dict[str, list[str]] = field(default_factory=dict)
+    columnar: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
+    lastSyncedIds: dict[str, int] = field(default_factory=dict)
+    highWater: dict[str, int] = field(default_factory=dict)
+    modifiedAt: dict[str, str | None] = field(default_factory=dict)
+    drained: set[str] = field(default_factory=set)
+    size: int = 0
+    rowCount: int = 0
+
+    def add(self, tableName: str, lastSyncedId: int, pk: int, encoded: str) -> None:
+        self.rows.setdefault(tableName, []).append(encoded)
+        self.lastSyncedIds.setdefault(tableName, lastSyncedId)
+        self.highWater[tableName] = max(self.highWater.get(tableName, pk), pk)
+        self.size += len(encoded) + 1
+        self.rowCount += 1
+
+    def addColumnar(self, tableName: str, lastSyncedId: int, row: dict[str, Any]) -> None:
+        pk = int(row["id"])
+        self.columnar.setdefault(tableName, []).append(row)
+        self.lastSyncedIds.setdefault(tableName, lastSyncedId)
+        self.highWater[tableName] = max(self.highWater.get(tableName, pk), pk)
+        self.size += rowBytes(row)
+        self.rowCount += 1
+
+    @property
+    def tableNames(self) -> list[str]:
+        return [*self.rows, *self.columnar]
+
+    def tableRowCount(self, tableName: str) -> int:
+        return len(self.rows.get(tableName, ())) + len(self.columnar.get(tableName, ()))
+
+    def noteModifiedAt(
+        self,
+        tableName: str,
+        rowModifiedAt: str | None,
+        lastModifiedAt: str | None,
+    ) -> None:
+        """Track the modified_at cursor over pushed rows only (never rewinds)."""
+        current = self.modifiedAt.get(tableName, lastModifiedAt)
+        if rowModifiedAt is not None and (current is None or rowModifiedAt > current):
+            current = rowModifiedAt
+        self.modifiedAt[tableName] = current
+
+    def marks(self) -> dict[str, tuple[int, str | None]]:
+        return {
+            tableName: (self.highWater[tableName], self.modifiedAt.get(tableName))
+            for tableName in self.tableNames
+        }
+
+    def encode(self, deviceId: str, batchId: str) -> bytes:
+        """Assemble the sync request around the pre-serialized rows.
+
+        Plain JSON without columnar rows; otherwise the JSON becomes the
+        header of a columnar body.
+        """
+        tables = ",".join(
+            f'{json.dumps(tableName)}:{{"lastSyncedId":'
+            f'{self.lastSyncedIds[tableName]},"rows":[{",".join(rows)}]}}'
+            for tableName, rows in self.rows.items()
+        )
+        envelope = (
+            f'{{"deviceId":{json.dumps(deviceId)},"batchId":{json.dumps(batchId)},'
+            f'"tables":{{{tables}}}'
+        )
+        if not self.columnar:
+            return f"{envelope}}}".encode()
+        section, blocks = encodeColumnar({
+            tableName: (self.lastSyncedIds[tableName], rows)
+            for tableName, rows in self.columnar.items()
+        })
+        header = f'{envelope},"columnar":{json.dumps(section, separators=(",", ":"))}}}'
+        return packSyncBody(header.encode(), blocks)
+
+
 # ================================================================================
 # Internal failure marker
 # ================================================================================
@@ -955,5 +1435,10 @@ class _PushFailure(Exception):
     """Raised internally when all retries for a single table have been exhausted.
 
     Never propagates out of :meth:`SyncClient.pushDelta`; caught there and
-    converted into ``PushResult(status=FAILED)``.
+    converted into ``PushResult(status=FAILED)``.  ``httpStatus`` is the
+    rejecting HTTP status for a non-retryable rejection, else None.
     """
+
+    def __init__(self, reason: str, httpStatus: int | None = None):
+        super().__init__(reason)
+        self.httpStatus = httpStatus
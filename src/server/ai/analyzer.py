@@ -17,6 +17,10 @@
 #                                Falls back to OLLAMA_GENERATE_TIMEOUT when
 #                                the key is absent so deployments without
 #                                the new key keep their 120 s budget.
+# 2026-10-17    | Rex          | Optional LLM response cache in front of
+#                                _callOllama (server.ai.responseCache.*);
+#                                bypassCache on analyzePostDrive; cache stats
+#                                in getStatus.
 # ================================================================================
 ################################################################################
 
@@ -66,6 +70,12 @@ from .exceptions import (
     AiAnalyzerLimitExceededError,
     AiAnalyzerNotAvailableError,
 )
+from .response_cache import (
+    DEFAULT_MAX_ENTRIES,
+    DEFAULT_TTL_SECONDS,
+    buildCacheKey,
+    createResponseCache,
+)
 from .types import (
     DEFAULT_MAX_ANALYSES_PER_DRIVE,
     OLLAMA_DEFAULT_BASE_URL,
@@ -147,6 +157,16 @@ class AiAnalyzer:
             'generateTimeoutSeconds',
             OLLAMA_GENERATE_TIMEOUT,
         )
+        # Replays the reply to an identical prompt instead of regenerating;
+        # only when AI analysis and server.ai.responseCache.enabled are on.
+        cacheConfig = aiConfig.get('responseCache', {})
+        self._responseCache = None
+        if self._enabled and cacheConfig.get('enabled', False):
+            self._responseCache = createResponseCache(
+                cacheConfig.get('path', './data/llm_response_cache.db'),
+                ttlSeconds=cacheConfig.get('ttlHours', DEFAULT_TTL_SECONDS / 3600) * 3600,
+                maxEntries=cacheConfig.get('maxEntries', DEFAULT_MAX_ENTRIES),
+            )
 
         # State tracking
         self._state = AnalyzerState.IDLE if self._enabled else AnalyzerState.DISABLED
@@ -244,7 +264,8 @@ class AiAnalyzer:
         statisticsResult: Any,
         profileId: str | None = None,
         driveId: str | None = None,
-        rawData: dict[str, list[float]] | None = None
+        rawData: dict[str, list[float]] | None = None,
+        bypassCache: bool = False
     ) -> AnalysisResult:
         """
         Perform AI analysis on post-drive data.
@@ -257,6 +278,8 @@ class AiAnalyzer:
             profileId: Profile ID (uses statisticsResult.profileId if not provided)
             driveId: Optional drive identifier for tracking analysis count
             rawData: Optional raw parameter data for additional metrics
+            bypassCache: Regenerate even if the response cache holds a
+                reply to this exact prompt
 
         Returns:
             AnalysisResult with recommendation or error
@@ -326,7 +349,7 @@ class AiAnalyzer:
 
             # Call ollama for analysis
             self._state = AnalyzerState.ANALYZING
-            response = self._callOllama(prompt)
+            response = self._callOllama(prompt, bypassCache=bypassCache)
             result.responseRaw = response
 
             # Parse and save recommendation
@@ -395,7 +418,8 @@ class AiAnalyzer:
         statisticsResult: Any,
         profileId: str | None = None,
         driveId: str | None = None,
-        rawData: dict[str, list[float]] | None = None
+        rawData: dict[str, list[float]] | None = None,
+        bypassCache: bool = False
     ) -> None:
         """
         Perform AI analysis asynchronously in a background thread.
@@ -408,6 +432,8 @@ class AiAnalyzer:
             profileId: Profile ID
             driveId: Optional drive identifier
             rawData: Optional raw parameter data
+            bypassCache: Regenerate even if the response cache holds a
+                reply to this exact prompt
         """
         def runAnalysis():
             try:
@@ -415,7 +441,8 @@ class AiAnalyzer:
                     statisticsResult=statisticsResult,
                     profileId=profileId,
                     driveId=driveId,
-                    rawData=rawData
+                    rawData=rawData,
+                    bypassCache=bypassCache
                 )
             except Exception as e:
                 logger.error(f"Async AI analysis failed: {e}")
@@ -492,12 +519,16 @@ class AiAnalyzer:
     # Ollama Integration
     # =========================================================================
 
-    def _callOllama(self, prompt: str) -> str:
+    def _callOllama(self, prompt: str, bypassCache: bool = False) -> str:
         """
         Call ollama API to generate analysis.
 
+        Served from the response cache when one is configured and this
+        model already answered this prompt.
+
         Args:
             prompt: The prompt to send to the model
+            bypassCache: Skip the cache lookup (the fresh reply is stored)
 
         Returns:
             Generated response text
@@ -505,12 +536,23 @@ class AiAnalyzer:
         Raises:
             AiAnalyzerGenerationError: If generation fails
         """
-        return callOllama(
-            self._baseUrl,
+        def generate() -> str:
+            return callOllama(
+                self._baseUrl,
+                self._model,
+                prompt,
+                timeoutSeconds=self._generateTimeoutSeconds,
+            )
+
+        if self._responseCache is None:
+            return generate()
+        response, _hit = self._responseCache.getOrCompute(
+            buildCacheKey(self._model, '', prompt, {'endpoint': 'generate'}),
             self._model,
-            prompt,
-            timeoutSeconds=self._generateTimeoutSeconds,
+            generate,
+            bypass=bypassCache,
         )
+        return response
 
     # =========================================================================
     # Recommendation Storage
@@ -681,5 +723,9 @@ class AiAnalyzer:
                 self._ollamaManager.isReady()
                 if self._ollamaManager else False
             ),
-            'stats': self._stats.toDict()
+            'stats': self._stats.toDict(),
+            'responseCache': (
+                self._responseCache.stats()
+                if self._responseCache else None
+            ),
         }
@@ -0,0 +1,277 @@
+################################################################################
+# File Name: response_cache.py
+# Purpose/Description: Persistent content-addressed cache of Ollama responses,
+#                      keyed on a hash of (model, system message, prompt,
+#                      generation options).  TTL + entry-count eviction,
+#                      hit / miss counters.
+# Author: Rex
+# Creation Date: 2026-10-17
+# Copyright: (c) 2026 Eclipse OBD-II. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-17    | Rex          | Initial
+# ================================================================================
+################################################################################
+
+"""
+LLM response cache.
+
+A generation is a pure function of what is sent to Ollama, so the response
+to an identical request can be replayed instead of waiting out inference
+again -- a re-run ``/analyze`` after a Pi resync, or an analysis after
+``recompute_drive_analytics`` produced the same statistics, renders the same
+user message.  Entries are keyed on the SHA-256 of the canonical JSON of
+``(model, system message, user message / prompt, options)``
+(:func:`buildCacheKey`), so any change to the prompt, the persona or the
+model is a different entry.
+
+Storage is one SQLite file (stdlib ``sqlite3``) so both the async server
+path (called from an executor thread) and the synchronous
+:class:`src.server.ai.analyzer.AiAnalyzer` can share it, and it survives
+restarts.  Entries older than ``ttlSeconds`` are misses; past
+``maxEntries`` the least recently used entries are evicted.  A cache error
+is logged and treated as a miss -- the cache never fails an analysis.
+
+Usage:
+    cache = LlmResponseCache('./data/llm_response_cache.db')
+    key = buildCacheKey(model, systemMessage, userMessage)
+    response, hit = cache.getOrCompute(key, model, lambda: callOllamaChat(...))
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# ---- Constants ---------------------------------------------------------------
+
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 500
+
+_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS llm_response_cache ('
+    '    cache_key     TEXT PRIMARY KEY,'
+    '    model         TEXT NOT NULL,'
+    '    response      TEXT NOT NULL,'
+    '    created_at    REAL NOT NULL,'
+    '    last_used_at  REAL NOT NULL'
+    ');'
+    'CREATE INDEX IF NOT EXISTS idx_llm_response_cache_last_used'
+    '    ON llm_response_cache (last_used_at);'
+)
+
+
+def buildCacheKey(
+    model: str,
+    systemMessage: str,
+    userMessage: str,
+    options: dict[str, Any] | None = None,
+) -> str:
+    """SHA-256 hex digest identifying one generation request.
+
+    Args:
+        model: Ollama model name.
+        systemMessage: System role content ('' for ``/api/generate``).
+        userMessage: User role content, or the ``/api/generate`` prompt.
+        options: Anything else that changes the generation (endpoint,
+            sampling options); must be JSON-serializable.
+    """
+    canonical = json.dumps(
+        {
+            'model': model,
+            'system': systemMessage,
+            'user': userMessage,
+            'options': options or {},
+        },
+        sort_keys=True,
+        separators=(',', ':'),
+    )
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class LlmResponseCache:
+    """Thread-safe persistent response cache.
+
+    Args:
+        path: SQLite file (parent directories are created), or
+            ``':memory:'``.
+        ttlSeconds: Age after which an entry is a miss and is purged.
+        maxEntries: Entries kept; least recently used are evicted past it.
+        clock: Time source (tests).
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        ttlSeconds: float = DEFAULT_TTL_SECONDS,
+        maxEntries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if maxEntries < 1:
+            raise ValueError(f"maxEntries must be >= 1, got {maxEntries}")
+        if path != ':memory:':
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._path = path
+        self._ttlSeconds = ttlSeconds
+        self._maxEntries = maxEntries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._counts = {'hits': 0, 'misses': 0, 'bypassed': 0, 'evictions': 0}
+
+    # ---- Lookup / store -----------------------------------------------------
+
+    def get(self, key: str) -> str | None:
+        """Cached response for ``key``, or None (absent, expired, or error)."""
+        now = self._clock()
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    'SELECT response, created_at FROM llm_response_cache '
+                    'WHERE cache_key = ?',
+                    (key,),
+                ).fetchone()
+                if row is not None and now - row[1] > self._ttlSeconds:
+                    self._conn.execute(
+                        'DELETE FROM llm_response_cache WHERE cache_key = ?', (key,),
+                    )
+                    self._conn.commit()
+                    row = None
+                if row is None:
+                    self._counts['misses'] += 1
+                    return None
+                self._conn.execute(
+                    'UPDATE llm_response_cache SET last_used_at = ? '
+                    'WHERE cache_key = ?',
+                    (now, key),
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"LLM cache read failed; treating as miss | error={e}")
+                self._counts['misses'] += 1
+                return None
+            self._counts['hits'] += 1
+            return row[0]
+
+    def put(self, key: str, model: str, response: str) -> None:
+        """Store ``response``; purge expired and evict past ``maxEntries``."""
+        now = self._clock()
+        with self._lock:
+            try:
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO llm_response_cache '
+                    '(cache_key, model, response, created_at, last_used_at) '
+                    'VALUES (?, ?, ?, ?, ?)',
+                    (key, model, response, now, now),
+                )
+                self._conn.execute(
+                    'DELETE FROM llm_response_cache WHERE created_at < ?',
+                    (now - self._ttlSeconds,),
+                )
+                evicted = self._conn.execute(
+                    'DELETE FROM llm_response_cache WHERE cache_key IN ('
+                    '    SELECT cache_key FROM llm_response_cache'
+                    '    ORDER BY last_used_at DESC LIMIT -1 OFFSET ?'
+                    ')',
+                    (self._maxEntries,),
+                ).rowcount
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"LLM cache write failed; response not cached | error={e}")
+                return
+            self._counts['evictions'] += max(evicted, 0)
+
+    def getOrCompute(
+        self,
+        key: str,
+        model: str,
+        compute: Callable[[], str],
+        *,
+        bypass: bool = False,
+    ) -> tuple[str, bool]:
+        """Cached response for ``key``, else ``compute()`` stored under it.
+
+        ``bypass`` skips the lookup (the fresh response still replaces the
+        entry).  Exceptions from ``compute`` propagate and nothing is
+        stored.
+
+        Returns:
+            ``(response, hit)``.
+        """
+        if bypass:
+            with self._lock:
+                self._counts['bypassed'] += 1
+        else:
+            cached = self.get(key)
+            if cached is not None:
+                return cached, True
+        response = compute()
+        self.put(key, model, response)
+        return response, False
+
+    # ---- Observability / lifecycle ------------------------------------------
+
+    def stats(self) -> dict[str, Any]:
+        """Entry count and hit / miss / bypass / eviction counters."""
+        with self._lock:
+            try:
+                entries = self._conn.execute(
+                    'SELECT COUNT(*) FROM llm_response_cache',
+                ).fetchone()[0]
+            except sqlite3.Error:
+                entries = None
+            counts = dict(self._counts)
+        lookups = counts['hits'] + counts['misses']
+        return {
+            'entries': entries,
+            'maxEntries': self._maxEntries,
+            'ttlSeconds': self._ttlSeconds,
+            **counts,
+            'hitRate': round(counts['hits'] / lookups, 3) if lookups else None,
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute('DELETE FROM llm_response_cache')
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def createResponseCache(
+    path: str | None,
+    ttlSeconds: float = DEFAULT_TTL_SECONDS,
+    maxEntries: int = DEFAULT_MAX_ENTRIES,
+) -> LlmResponseCache | None:
+    """Cache at ``path``, or None when ``path`` is empty (caching disabled)
+    or the file cannot be opened (logged)."""
+    if not path:
+        return None
+    try:
+        return LlmResponseCache(path, ttlSeconds=ttlSeconds, maxEntries=maxEntries)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning(f"LLM response cache disabled | path={path} | error={e}")
+        return None
+
+
+__all__ = [
+    'DEFAULT_MAX_ENTRIES',
+    'DEFAULT_TTL_SECONDS',
+    'LlmResponseCache',
+    'buildCacheKey',
+    'createResponseCache',
+]
@@ -13,6 +13,8 @@
 #               |              | basic analytics functions and result types
 # 2026-04-16    | Ralph Agent  | Added advanced analytics re-exports for
 #               |              | US-159 (trends/correlations/anomalies)
+# 2026-10-16    | Rex          | Re-export basicStatsFromAggregates
+# 2026-10-16    | Rex          | Re-export computeBasicStatsByParameter
 # ================================================================================
 ################################################################################
 
@@ -59,8 +61,10 @@ from src.server.analytics.basic import (
     computeDriveStatistics,
 )
 from src.server.analytics.helpers import (
+    basicStatsFromAggregates,
     classifyDeviation,
     computeBasicStats,
+    computeBasicStatsByParameter,
 )
 
 __all__ = [
@@ -76,9 +80,11 @@ __all__ = [
     "TrendResult",
     "advanced",
     "basic",
+    "basicStatsFromAggregates",
     "classifyDeviation",
     "compareDriveToHistory",
     "computeBasicStats",
+    "computeBasicStatsByParameter",
     "computeCorrelations",
     "computeDriveStatistics",
     "computeTrends",
@@ -13,6 +13,9 @@
 # 2026-04-16    | Ralph Agent  | Initial implementation for US-159 — advanced
 #               |              | analytics (trends/correlations/anomaly) per
 #               |              | server spec §1.8
+# 2026-10-16    | Rex          | detectAnomalies reads the parameter_history
+#               |              | aggregate once per drive instead of re-scanning
+#               |              | drive_statistics per parameter
 # ================================================================================
 ################################################################################
 
@@ -41,7 +44,7 @@ from __future__ import annotations
 import statistics
 from collections.abc import Sequence
 
-from sqlalchemy import and_, delete, select
+from sqlalchemy import delete, select
 from sqlalchemy.orm import Session
 
 from src.server.analytics.analytics_types import (
@@ -58,6 +61,10 @@ from src.server.db.models import (
     DriveSummary,
     TrendSnapshot,
 )
+from src.server.db.parameter_history import (
+    HistoricalAvgStats,
+    loadHistoricalAvgStats,
+)
 
 # ---- Configuration constants ------------------------------------------------
 
@@ -324,9 +331,12 @@ def detectAnomalies(session: Session, driveId: int) -> list[AnomalyResult]:
         session.commit()
         return []
 
+    history = loadHistoricalAvgStats(session, currentStats)
     results: list[AnomalyResult] = []
     for current in currentStats:
-        anomaly = _evaluateAnomaly(session, driveId, current)
+        anomaly = _evaluateAnomaly(
+            driveId, current, history.get(current.parameter_name),
+        )
         if anomaly is None:
             continue
         results.append(anomaly)
@@ -346,7 +356,9 @@ def detectAnomalies(session: Session, driveId: int) -> list[AnomalyResult]:
 
 
 def _evaluateAnomaly(
-    session: Session, driveId: int, current: DriveStatistic,
+    driveId: int,
+    current: DriveStatistic,
+    historical: HistoricalAvgStats | None,
 ) -> AnomalyResult | None:
     """Return an :class:`AnomalyResult` if ``current`` breaches the envelope.
 
@@ -354,23 +366,11 @@ def _evaluateAnomaly(
     than two prior samples or zero variance) or when the deviation is within
     the NORMAL band.
     """
-    historicalAvgs = [
-        row.avg_value
-        for row in session.execute(
-            select(DriveStatistic).where(
-                and_(
-                    DriveStatistic.parameter_name == current.parameter_name,
-                    DriveStatistic.summary_id != driveId,
-                )
-            )
-        ).scalars().all()
-        if row.avg_value is not None
-    ]
-    if len(historicalAvgs) < 2:
+    if historical is None or historical.sample_count < 2:
         return None
 
-    histMean = float(statistics.fmean(historicalAvgs))
-    histStd = float(statistics.stdev(historicalAvgs))
+    histMean = historical.mean
+    histStd = historical.std_dev
     if histStd <= 0.0:
         return None
 
@@ -16,6 +16,13 @@
 #               |              | data_source='real' (or NULL for pre-US-195 BC)
 #               |              | so sim / replay / fixture rows never
 #               |              | contaminate baselines.
+# 2026-10-16    | Rex          | compareDriveToHistory reads the
+#               |              | parameter_history aggregate (one query) instead
+#               |              | of re-scanning drive_statistics per parameter
+# 2026-10-16    | Rex          | computeDriveStatistics computes every
+#               |              | parameter in one batched kernel call
+# 2026-10-17    | Rex          | collectReadingsForDrive bounds its read by the
+#               |              | drive's timestamp range (partition pruning).
 # ================================================================================
 ################################################################################
 
@@ -40,15 +47,22 @@ pure read and can be called any number of times.
 
 from __future__ import annotations
 
-import statistics
 from collections import defaultdict
 
 from sqlalchemy import and_, delete, or_, select
 from sqlalchemy.orm import Session
 
 from src.server.analytics.analytics_types import DriveStatistics, ParameterComparison
-from src.server.analytics.helpers import classifyDeviation, computeBasicStats
+from src.server.analytics.helpers import classifyDeviation, computeBasicStatsByParameter
 from src.server.db.models import DriveStatistic, DriveSummary, RealtimeData
+from src.server.db.parameter_history import (
+    loadHistoricalAvgStats,
+    retractSummaryStatistics,
+)
+from src.server.db.realtime_partitions import (
+    realtimeTimestampBounds,
+    withinTimestampBounds,
+)
 
 # ---- Per-drive statistics ----------------------------------------------------
 
@@ -83,16 +97,17 @@ def computeDriveStatistics(
 
     valuesByParam = _collectReadings(session, drive)
 
-    # Clear previous stats so re-running replaces rather than duplicates.
+    # Clear previous stats so re-running replaces rather than duplicates
+    # (bulk DELETE fires no mapper events; retract from parameter_history).
+    retractSummaryStatistics(session, [driveId])
     session.execute(
         delete(DriveStatistic).where(DriveStatistic.summary_id == driveId)
     )
 
+    statsByParam = computeBasicStatsByParameter(valuesByParam)
     results: list[DriveStatistics] = []
-    for paramName in sorted(valuesByParam.keys()):
-        stats = computeBasicStats(valuesByParam[paramName])
-        if stats is None:
-            continue
+    for paramName in sorted(statsByParam.keys()):
+        stats = statsByParam[paramName]
 
         row = DriveStatistic(
             summary_id=driveId,
@@ -154,9 +169,16 @@ def collectReadingsForDrive(
         Mapping of ``parameter_name`` -> list of float values, in
         database insertion order.
     """
-    filters = [
+    driveKey = (
         RealtimeData.source_device == deviceId,
         RealtimeData.drive_id == driveId,
+    )
+    bounds = realtimeTimestampBounds(session, *driveKey)
+    if bounds is None:
+        return {}
+    filters = [
+        *driveKey,
+        withinTimestampBounds(bounds),
         or_(
             RealtimeData.data_source == 'real',
             RealtimeData.data_source.is_(None),
@@ -212,10 +234,13 @@ def compareDriveToHistory(
     """
     Compare the current drive's per-parameter stats to historical aggregates.
 
-    Historical aggregates are computed from every ``drive_statistics`` row
-    whose ``drive_id`` is **not** ``driveId`` (the current drive is excluded
-    so its own values don't bias the baseline). For each parameter the
-    current drive has stats for, we compute:
+    Historical aggregates cover every ``drive_statistics`` row whose
+    ``drive_id`` is **not** ``driveId`` (the current drive is excluded so its
+    own values don't bias the baseline). They are read in one query from the
+    ``parameter_history`` running aggregate
+    (:func:`src.server.db.parameter_history.loadHistoricalAvgStats`) rather
+    than re-scanning ``drive_statistics``. For each parameter the current
+    drive has stats for, we compute:
 
     * ``historical_mean_avg`` — mean of ``avg_value`` across prior drives.
     * ``historical_std_avg`` — sample std dev of ``avg_value`` across prior
@@ -242,32 +267,17 @@ def compareDriveToHistory(
     if not currentStats:
         return []
 
+    history = loadHistoricalAvgStats(session, currentStats)
     comparisons: list[ParameterComparison] = []
     for current in currentStats:
-        historicalAvgs = [
-            row.avg_value
-            for row in session.execute(
-                select(DriveStatistic).where(
-                    and_(
-                        DriveStatistic.parameter_name == current.parameter_name,
-                        DriveStatistic.summary_id != driveId,
-                    )
-                )
-            ).scalars().all()
-            if row.avg_value is not None
-        ]
-
-        if not historicalAvgs:
+        historical = history.get(current.parameter_name)
+        if historical is None:
             # No prior drives for this parameter — skip rather than emit a
             # zero-filled comparison that could mislead a reader.
             continue
 
-        historicalMean = float(statistics.fmean(historicalAvgs))
-        historicalStd = (
-            float(statistics.stdev(historicalAvgs))
-            if len(historicalAvgs) >= 2
-            else 0.0
-        )
+        historicalMean = historical.mean
+        historicalStd = historical.std_dev
 
         currentAvg = float(current.avg_value or 0.0)
         sigma = (
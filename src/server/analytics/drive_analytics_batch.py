@@ -0,0 +1,389 @@
+################################################################################
+# File Name: drive_analytics_batch.py
+# Purpose/Description: Multi-drive analytics batch engine.  Streams raw
+#                      realtime_data once, ordered by (drive_id, timestamp),
+#                      over a server-side cursor and derives the drive_summary
+#                      analytics columns + drive_statistics rows for many
+#                      drives in one pass, then writes them in bulk.
+# Author: Rex
+# Creation Date: 2026-10-16
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-16    | Rex          | Initial
+# 2026-10-16    | Rex          | Per-parameter stats from one DB-side grouped
+#               |              | aggregate per pass (aggregateParameterStats);
+#               |              | the stream now carries only drive_id +
+#               |              | timestamp.
+# 2026-10-16    | Rex          | Keep parameter_history in step with the bulk
+#               |              | drive_statistics DELETE / INSERT.
+# 2026-10-17    | Rex          | Stream bounded by the pass's timestamp range
+#               |              | (partition pruning on realtime_data).
+# 2026-10-17    | Rex          | Typed the stream generator; accumulator is
+#               |              | seeded with its first row (no Optional
+#               |              | window); docstring states the CLI's
+#               |              | drive-by-drive retry.
+# ================================================================================
+################################################################################
+
+"""Single-pass drive analytics for many drives (backfill / nightly batch).
+
+:func:`compute_drive_summary` + :func:`compute_drive_statistics` cost about
+eight queries per drive (summary lookup twice, COUNT, MIN/MAX, an ordered
+timestamp walk, a full value pull, two overlap aggregations).
+:func:`computeDriveAnalyticsBatch` produces the same column values for a
+list of drives with:
+
+* one ``drive_summary`` lookup for the whole list;
+* one grouped aggregate query for every (drive, parameter) pair
+  (:func:`aggregateParameterStats` -- only aggregates cross the wire);
+* one streamed ``(drive_id, timestamp)`` scan ordered by both columns
+  (``stream_results`` + ``yield_per`` -- an unbuffered server-side cursor on
+  MariaDB), folding each row into the current drive's accumulator: row
+  count, MIN/MAX timestamp, the >5 min gap tripwire;
+* one overlap index (:class:`DriveWindowIndex`) for every drive;
+* bulk writes: summary UPDATEs flushed together, one ``DELETE`` + one
+  executemany ``INSERT`` for ``drive_statistics``.
+
+Memory is constant per drive -- the accumulator is finalized when the
+stream moves to the next ``drive_id``.  Per-parameter aggregation,
+classification and the Atlas Refinement A invariants are the per-drive
+module's own helpers, so a batch recompute and a single-drive recompute
+cannot drift apart.
+
+A drive that trips an invariant is reported ``failed`` and none of its
+rows are written; the other drives in the batch are unaffected.  Any
+other exception escapes and fails the whole call -- the CLI rolls the
+pass back and retries it drive by drive.  The caller commits.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, insert, or_, select
+from sqlalchemy.orm import Session
+
+from src.server.analytics.analytics_types import BasicStats
+from src.server.analytics.drive_statistics_compute import (
+    DATA_QUALITY_ANOMALY,
+    InvariantViolation,
+    _assertGenericInvariants,
+    _classifyDataQuality,
+    aggregateParameterStats,
+)
+from src.server.analytics.drive_summary_compute import (
+    GAP_DETECTION_THRESHOLD_SECONDS,
+    _deriveIsReal,
+)
+from src.server.analytics.overlap import DriveWindowIndex
+from src.server.db.models import (
+    DATA_QUALITY_ATTRIBUTION_ANOMALY,
+    DRIVE_SUMMARY_DATA_QUALITY_DEFAULT,
+    DriveStatistic,
+    DriveSummary,
+    RealtimeData,
+)
+from src.server.db.parameter_history import (
+    accumulateStatistics,
+    retractSummaryStatistics,
+)
+from src.server.db.realtime_partitions import (
+    realtimeTimestampBounds,
+    withinTimestampBounds,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# ---- Constants --------------------------------------------------------------
+
+OUTCOME_OK = "ok"
+OUTCOME_SKIPPED = "skipped"
+OUTCOME_FAILED = "failed"
+
+# Rows fetched per round trip from the server-side cursor.
+DEFAULT_STREAM_ROWS = 10_000
+
+# Drives per streamed pass (and per commit in the CLI).  Bounds the IN list
+# and the size of one transaction; memory is bounded by the largest single
+# drive regardless.
+DEFAULT_DRIVES_PER_PASS = 50
+
+_GAP_THRESHOLD = timedelta(seconds=GAP_DETECTION_THRESHOLD_SECONDS)
+
+
+@dataclass(slots=True)
+class DriveAnalyticsOutcome:
+    """Result of one drive in a batch recompute."""
+
+    driveId: int
+    status: str
+    summaryId: int | None = None
+    statisticsRows: int = 0
+    dataQuality: str | None = None
+    error: str | None = None
+
+
+@dataclass(slots=True)
+class _DriveAccumulator:
+    """Fold of one drive's ordered realtime_data timestamps.
+
+    Opened on the drive's first row, so the window is never empty.
+    """
+
+    driveId: int
+    startTime: datetime
+    endTime: datetime
+    rowCount: int = 1
+
+    def add(self, timestamp: datetime) -> None:
+        if timestamp - self.endTime > _GAP_THRESHOLD:
+            logger.warning(
+                "drive_analytics_batch | drive_id=%s | gap detected | "
+                "prev=%s | curr=%s | delta_s=%.1f (threshold=%ss)",
+                self.driveId, self.endTime, timestamp,
+                (timestamp - self.endTime).total_seconds(),
+                GAP_DETECTION_THRESHOLD_SECONDS,
+            )
+        self.endTime = timestamp
+        self.rowCount += 1
+
+
+# ---- Public compute API -----------------------------------------------------
+
+
+def computeDriveAnalyticsBatch(
+    session: Session,
+    driveIds: Sequence[int],
+    *,
+    streamRows: int = DEFAULT_STREAM_ROWS,
+) -> list[DriveAnalyticsOutcome]:
+    """Recompute ``drive_summary`` + ``drive_statistics`` for ``driveIds``.
+
+    Args:
+        session: Open sync SQLAlchemy session; the caller commits.
+        driveIds: Pi-local drive_ids (``realtime_data.drive_id``).
+        streamRows: Rows per fetch from the server-side cursor.
+
+    Returns:
+        One :class:`DriveAnalyticsOutcome` per distinct drive_id, in input
+        order.  ``skipped`` = no ``drive_summary`` row or no realtime_data
+        (the per-drive compute's WARN-and-return cases); ``failed`` = an
+        Atlas Refinement A invariant tripped.
+    """
+    orderedIds = list(dict.fromkeys(int(d) for d in driveIds))
+    if not orderedIds:
+        return []
+
+    summaries = _loadSummaries(session, orderedIds)
+    outcomes = {d: DriveAnalyticsOutcome(d, OUTCOME_SKIPPED) for d in orderedIds}
+    for driveId in orderedIds:
+        if driveId not in summaries:
+            logger.warning(
+                "drive_analytics_batch | drive_id=%s | no drive_summary row "
+                "-- skipping (Pi-sync may not have landed yet)",
+                driveId,
+            )
+
+    # Resolved before the stream opens: an unbuffered cursor holds the
+    # connection until it is drained.
+    overlaps = _OverlapLookup(session, list(summaries))
+    aggregates = aggregateParameterStats(session, list(summaries))
+    statisticsRows: list[dict] = []
+    computedSummaryIds: list[int] = []
+
+    for acc in _streamDrives(session, list(summaries), streamRows):
+        summary = summaries[acc.driveId]
+        outcome = outcomes[acc.driveId]
+        try:
+            paramStats = _checkedParameterStats(
+                acc.driveId, aggregates.get(acc.driveId, {}),
+            )
+        except InvariantViolation as exc:
+            outcome.status = OUTCOME_FAILED
+            outcome.error = str(exc)
+            continue
+
+        overlappingDriveIds = overlaps.overlapping(acc.driveId)
+        if overlappingDriveIds:
+            logger.warning(
+                "drive_analytics_batch | drive_id=%s | ATTRIBUTION ANOMALY -- "
+                "realtime_data window overlaps drive_id(s) %s; flagging "
+                "data_quality=%s",
+                acc.driveId, overlappingDriveIds,
+                DATA_QUALITY_ATTRIBUTION_ANOMALY,
+            )
+        _applySummary(summary, acc, bool(overlappingDriveIds))
+
+        for paramName, stats in paramStats:
+            statisticsRows.append({
+                "summary_id": summary.id,
+                "parameter_name": paramName,
+                "min_value": stats.min_value,
+                "max_value": stats.max_value,
+                "avg_value": stats.avg_value,
+                "std_dev": stats.std_dev,
+                "outlier_min": stats.outlier_min,
+                "outlier_max": stats.outlier_max,
+                "sample_count": stats.sample_count,
+                "data_quality": (
+                    DATA_QUALITY_ANOMALY if overlappingDriveIds
+                    else _classifyDataQuality(stats.sample_count)
+                ),
+            })
+        computedSummaryIds.append(summary.id)
+        outcome.status = OUTCOME_OK
+        outcome.summaryId = summary.id
+        outcome.statisticsRows = len(paramStats)
+        outcome.dataQuality = summary.data_quality
+
+    for driveId in orderedIds:
+        if driveId in summaries and outcomes[driveId].status == OUTCOME_SKIPPED:
+            logger.warning(
+                "drive_analytics_batch | drive_id=%s | zero realtime_data rows "
+                "-- skipping",
+                driveId,
+            )
+
+    session.flush()
+    if computedSummaryIds:
+        retractSummaryStatistics(session, computedSummaryIds)
+        session.execute(
+            delete(DriveStatistic)
+            .where(DriveStatistic.summary_id.in_(computedSummaryIds))
+        )
+    if statisticsRows:
+        session.execute(insert(DriveStatistic), statisticsRows)
+        accumulateStatistics(session, (
+            (row["summary_id"], row["parameter_name"], row["avg_value"])
+            for row in statisticsRows
+        ))
+
+    return [outcomes[d] for d in orderedIds]
+
+
+# ---- Helpers ----------------------------------------------------------------
+
+
+def _loadSummaries(
+    session: Session, driveIds: list[int],
+) -> dict[int, DriveSummary]:
+    """drive_id -> lowest-id drive_summary matched by source_id or drive_id."""
+    wanted = set(driveIds)
+    rows = session.execute(
+        select(DriveSummary)
+        .where(or_(
+            DriveSummary.source_id.in_(driveIds),
+            DriveSummary.drive_id.in_(driveIds),
+        ))
+        .order_by(DriveSummary.id.asc())
+    ).scalars()
+
+    summaries: dict[int, DriveSummary] = {}
+    for summary in rows:
+        for key in (summary.source_id, summary.drive_id):
+            if key in wanted:
+                summaries.setdefault(key, summary)
+    return summaries
+
+
+def _streamDrives(
+    session: Session, driveIds: list[int], streamRows: int,
+) -> Iterator[_DriveAccumulator]:
+    """Yield one finished :class:`_DriveAccumulator` per drive with rows."""
+    if not driveIds:
+        return
+    inDrives = RealtimeData.drive_id.in_(driveIds)
+    bounds = realtimeTimestampBounds(session, inDrives)
+    if bounds is None:
+        return
+    result = session.execute(
+        select(
+            RealtimeData.drive_id,
+            RealtimeData.timestamp,
+        )
+        .where(inDrives & withinTimestampBounds(bounds))
+        .order_by(RealtimeData.drive_id.asc(), RealtimeData.timestamp.asc()),
+        execution_options={"stream_results": True, "yield_per": streamRows},
+    )
+    acc: _DriveAccumulator | None = None
+    for driveId, timestamp in result:
+        if driveId is None:  # excluded by the IN filter; narrows the type
+            continue
+        if acc is not None and acc.driveId == driveId:
+            acc.add(timestamp)
+            continue
+        if acc is not None:
+            yield acc
+        acc = _DriveAccumulator(driveId, timestamp, timestamp)
+    if acc is not None:
+        yield acc
+
+
+def _checkedParameterStats(
+    driveId: int, statsByParam: dict[str, BasicStats],
+) -> list[tuple[str, BasicStats]]:
+    """One drive's aggregates, invariant-checked, sorted by parameter."""
+    paramStats = []
+    for paramName in sorted(statsByParam):
+        stats = statsByParam[paramName]
+        _assertGenericInvariants(driveId, paramName, stats)
+        paramStats.append((paramName, stats))
+    return paramStats
+
+
+def _applySummary(
+    summary: DriveSummary, acc: _DriveAccumulator, isAnomaly: bool,
+) -> None:
+    """Stamp the derived analytics columns (same rules as compute_drive_summary)."""
+    summary.start_time = acc.startTime
+    summary.end_time = acc.endTime
+    summary.duration_seconds = int((acc.endTime - acc.startTime).total_seconds())
+    summary.row_count = acc.rowCount
+    summary.is_real = _deriveIsReal(summary.data_source)
+    summary.data_quality = (
+        DATA_QUALITY_ATTRIBUTION_ANOMALY if isAnomaly
+        else DRIVE_SUMMARY_DATA_QUALITY_DEFAULT
+    )
+    if summary.drive_id is None:
+        summary.drive_id = acc.driveId
+    if summary.source_id is None:
+        summary.source_id = acc.driveId
+
+
+class _OverlapLookup:
+    """Overlap answers for a batch from at most two index loads.
+
+    ``drive_time_window`` first; if any drive of the batch is missing from
+    it, one grouped raw scan serves every miss -- the batch form of
+    :func:`detect_overlapping_drives`'s fallback.
+    """
+
+    def __init__(self, session: Session, driveIds: list[int]) -> None:
+        self._table = DriveWindowIndex.load(session)
+        self._raw: DriveWindowIndex | None = None
+        if any(driveId not in self._table for driveId in driveIds):
+            self._raw = DriveWindowIndex.fromRealtime(session)
+
+    def overlapping(self, driveId: int) -> list[int]:
+        if driveId in self._table or self._raw is None:
+            return self._table.overlapping(driveId)
+        return self._raw.overlapping(driveId)
+
+
+__all__ = [
+    "DEFAULT_DRIVES_PER_PASS",
+    "DEFAULT_STREAM_ROWS",
+    "OUTCOME_FAILED",
+    "OUTCOME_OK",
+    "OUTCOME_SKIPPED",
+    "DriveAnalyticsOutcome",
+    "computeDriveAnalyticsBatch",
+]
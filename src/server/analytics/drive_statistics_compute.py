@@ -30,6 +30,15 @@
 #               |              | sample_count>=1) RAISE if violated.  Atlas
 #               |              | Refinement B: data_quality classification
 #               |              | (<10 below_threshold, 10-99 sparse, >=100 full).
+# 2026-10-16    | Rex          | SQL-side aggregation (default): one GROUP BY
+#               |              | parameter_name query returns COUNT/MIN/MAX/AVG/
+#               |              | STDDEV_SAMP (MariaDB) or a two-pass equivalent
+#               |              | (SQLite) -- only aggregates cross the wire.
+#               |              | sqlAggregates=False keeps the value pull.
+# 2026-10-16    | Rex          | Retract the drive's rows from parameter_history
+#               |              | before the bulk pre-clear DELETE.
+# 2026-10-16    | Rex          | Python fallback path batches all parameters
+#               |              | through the shared statistics kernel.
 # ================================================================================
 ################################################################################
 
@@ -53,17 +62,33 @@ via ``onupdate=func.now()``), and never depends on a Pi-side drive-end
 marker.  Argus's RCA (DriveDetector drive-end signal does not fire on
 sequencer-driven termination) is structurally moot here -- the compute
 reads raw rows directly.
+
+Aggregation runs in the database by default (:func:`aggregateParameterStats`):
+``GROUP BY drive_id, parameter_name`` with ``COUNT/MIN/MAX/AVG`` and
+``STDDEV_SAMP`` on MariaDB, or on SQLite (no ``STDDEV_SAMP``) a two-pass
+form -- per-group ``AVG`` joined back for ``SUM((value - avg)^2)`` --
+rather than the cancellation-prone ``SUM(x^2) - n*avg^2``.  The results
+feed :func:`basicStatsFromAggregates`, so the 2-sigma bounds are still
+defined once.  ``compute_drive_statistics(..., sqlAggregates=False)``
+keeps the original pull-every-value :func:`computeBasicStats` path as the
+parity oracle.
 """
 
 from __future__ import annotations
 
 import logging
 import math
+from array import array
+from collections.abc import Sequence
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, func, select
 from sqlalchemy.orm import Session
 
-from src.server.analytics.helpers import computeBasicStats
+from src.server.analytics.analytics_types import BasicStats
+from src.server.analytics.helpers import (
+    basicStatsFromAggregates,
+    computeBasicStatsByParameter,
+)
 from src.server.analytics.overlap import detect_overlapping_drives
 from src.server.db.models import (
     DATA_QUALITY_ATTRIBUTION_ANOMALY,
@@ -72,6 +97,7 @@ from src.server.db.models import (
     DriveSummary,
     RealtimeData,
 )
+from src.server.db.parameter_history import retractSummaryStatistics
 
 logger = logging.getLogger(__name__)
 
@@ -126,7 +152,9 @@ class InvariantViolation(ValueError):
 # ---- Public compute API -----------------------------------------------------
 
 
-def compute_drive_statistics(session: Session, driveId: int) -> int:
+def compute_drive_statistics(
+    session: Session, driveId: int, *, sqlAggregates: bool = True,
+) -> int:
     """Compute per-parameter ``drive_statistics`` rows from raw realtime_data.
 
     Reads every ``realtime_data`` row for the Pi-local ``driveId``, groups
@@ -136,6 +164,11 @@ def compute_drive_statistics(session: Session, driveId: int) -> int:
     UPSERTs one row per parameter into ``drive_statistics`` keyed on the
     server-side ``drive_summary.id``.
 
+    With ``sqlAggregates`` (the default) the per-parameter aggregates come
+    from :func:`aggregateParameterStats` and no values are transferred;
+    ``False`` pulls every value and runs :func:`computeBasicStats` in
+    Python.  Both produce the same ``BasicStats`` (to float rounding).
+
     Idempotency: prior rows for the drive are DELETEd before the new ones
     are INSERTed; ``computed_at`` carries ``onupdate=func.now()`` so an
     observable timestamp advances on re-run while the data columns stay
@@ -145,6 +178,8 @@ def compute_drive_statistics(session: Session, driveId: int) -> int:
         session: Open sync SQLAlchemy session bound to the server DB.
         driveId: Pi-local drive_id (matches ``realtime_data.drive_id``
             and ``drive_summary.source_id`` / ``drive_summary.drive_id``).
+        sqlAggregates: Aggregate in the database (default) instead of in
+            Python over every value.
 
     Returns:
         Number of ``drive_statistics`` rows written.  Returns ``0`` when
@@ -177,11 +212,11 @@ def compute_drive_statistics(session: Session, driveId: int) -> int:
         return 0
     summaryId = summary.id
 
-    rows = session.execute(
-        select(RealtimeData.parameter_name, RealtimeData.value)
-        .where(RealtimeData.drive_id == driveId)
-    ).all()
-    if not rows:
+    if sqlAggregates:
+        statsByParam = aggregateParameterStats(session, [driveId]).get(driveId, {})
+    else:
+        statsByParam = _pythonParameterStats(session, driveId)
+    if not statsByParam:
         logger.warning(
             "compute_drive_statistics | drive_id=%s | summary_id=%s | "
             "zero realtime_data rows -- skipping",
@@ -206,24 +241,18 @@ def compute_drive_statistics(session: Session, driveId: int) -> int:
             DATA_QUALITY_ANOMALY,
         )
 
-    valuesByParam: dict[str, list[float]] = {}
-    for paramName, value in rows:
-        valuesByParam.setdefault(paramName, []).append(float(value))
-
     # Pre-clear in a single statement so re-runs converge cleanly without
     # leaving stale parameter_name rows from prior raw-data shapes (e.g.,
-    # a PID was dropped from the poll list).
+    # a PID was dropped from the poll list).  Bulk DELETE fires no mapper
+    # events, so parameter_history is retracted explicitly.
+    retractSummaryStatistics(session, [summaryId])
     session.execute(
         delete(DriveStatistic).where(DriveStatistic.summary_id == summaryId)
     )
 
     written = 0
-    for paramName in sorted(valuesByParam.keys()):
-        stats = computeBasicStats(valuesByParam[paramName])
-        if stats is None:
-            # Empty group is impossible by construction (the parameter_name
-            # would not appear in valuesByParam); defensive skip.
-            continue
+    for paramName in sorted(statsByParam.keys()):
+        stats = statsByParam[paramName]
         _assertGenericInvariants(driveId, paramName, stats)
         dataQuality = (
             DATA_QUALITY_ANOMALY if isAttributionAnomaly
@@ -250,14 +279,111 @@ def compute_drive_statistics(session: Session, driveId: int) -> int:
         "compute_drive_statistics | drive_id=%s | summary_id=%s | "
         "params=%d | total_samples=%d",
         driveId, summaryId, written,
-        sum(len(v) for v in valuesByParam.values()),
+        sum(stats.sample_count for stats in statsByParam.values()),
     )
     return written
 
 
+def aggregateParameterStats(
+    session: Session, driveIds: Sequence[int],
+) -> dict[int, dict[str, BasicStats]]:
+    """Per-(drive, parameter) :class:`BasicStats` aggregated in the database.
+
+    One grouped query over ``realtime_data`` for all of ``driveIds``; only
+    one row of aggregates per group is returned to Python.
+
+    Args:
+        session: Open sync SQLAlchemy session bound to the server DB.
+        driveIds: Pi-local drive_ids.
+
+    Returns:
+        ``{drive_id: {parameter_name: BasicStats}}``; drives without rows
+        are absent.
+    """
+    if not driveIds:
+        return {}
+    rt = RealtimeData
+    inDrives = rt.drive_id.in_(list(driveIds))
+    dialectName = session.get_bind().dialect.name
+
+    if dialectName in {"mysql", "mariadb"}:
+        stmt = (
+            select(
+                rt.drive_id, rt.parameter_name,
+                func.count(), func.min(rt.value), func.max(rt.value),
+                func.avg(rt.value), func.stddev_samp(rt.value),
+            )
+            .where(inDrives)
+            .group_by(rt.drive_id, rt.parameter_name)
+        )
+        rows = session.execute(stmt).all()
+    else:
+        # Two-pass sample variance: group means first, then squared
+        # deviations from them -- no STDDEV_SAMP on SQLite.
+        means = (
+            select(
+                rt.drive_id.label("drive_id"),
+                rt.parameter_name.label("parameter_name"),
+                func.avg(rt.value).label("mean"),
+            )
+            .where(inDrives)
+            .group_by(rt.drive_id, rt.parameter_name)
+            .subquery()
+        )
+        deviation = rt.value - means.c.mean
+        stmt = (
+            select(
+                rt.drive_id, rt.parameter_name,
+                func.count(), func.min(rt.value), func.max(rt.value),
+                means.c.mean, func.sum(deviation * deviation),
+            )
+            .join(means, (means.c.drive_id == rt.drive_id)
+                  & (means.c.parameter_name == rt.parameter_name))
+            .where(inDrives)
+            .group_by(rt.drive_id, rt.parameter_name, means.c.mean)
+        )
+        rows = [
+            (driveId, param, count, minV, maxV, avgV, _sampleStdDev(count, sumSq))
+            for driveId, param, count, minV, maxV, avgV, sumSq in session.execute(stmt)
+        ]
+
+    result: dict[int, dict[str, BasicStats]] = {}
+    for driveId, param, count, minV, maxV, avgV, stdV in rows:
+        # SQL AVG is a plain running sum: for a constant series it can land
+        # an ulp outside [min, max] where fmean's exact sum would not.
+        avgV = min(max(float(avgV), float(minV)), float(maxV))
+        stats = basicStatsFromAggregates(count, minV, maxV, avgV, stdV)
+        if stats is not None:
+            result.setdefault(int(driveId), {})[param] = stats
+    return result
+
+
 # ---- Helpers ----------------------------------------------------------------
 
 
+def _sampleStdDev(count: int, sumSquaredDeviations: float | None) -> float | None:
+    """sqrt(SS / (n - 1)); ``None`` below 2 samples, NaN if SQL lost the sum."""
+    if count < 2:
+        return None
+    if sumSquaredDeviations is None:
+        # SQLite stores a NaN sum (inf - inf) as NULL; keep it non-finite so
+        # the generic invariants still trip.
+        return math.nan
+    return math.sqrt(sumSquaredDeviations / (count - 1))
+
+
+def _pythonParameterStats(session: Session, driveId: int) -> dict[str, BasicStats]:
+    """Pull every value for the drive and run the batched :func:`computeBasicStats`."""
+    rows = session.execute(
+        select(RealtimeData.parameter_name, RealtimeData.value)
+        .where(RealtimeData.drive_id == driveId)
+    ).all()
+    valuesByParam: dict[str, array] = {}
+    for paramName, value in rows:
+        valuesByParam.setdefault(paramName, array('d')).append(value)
+    return computeBasicStatsByParameter(valuesByParam)
+
+
 def _classifyDataQuality(sampleCount: int) -> str:
     """Atlas Refinement B: classify per ``sample_count`` thresholds."""
     if sampleCount < DATA_QUALITY_SPARSE_MIN:
@@ -312,5 +438,6 @@ __all__ = [
     "DATA_QUALITY_SPARSE_MIN",
     "DATA_QUALITY_FULL_MIN",
     "InvariantViolation",
+    "aggregateParameterStats",
     "compute_drive_statistics",
 ]
@@ -25,6 +25,9 @@
 #               |              | data_source, drive_start_timestamp) are
 #               |              | preserved -- is_real is derived from the
 #               |              | Pi event-log data_source per Atlas Q2.
+# 2026-10-17    | Rex          | COUNT/MIN/MAX in one index-answered query; the
+#               |              | gap walk is bounded by the drive's timestamp
+#               |              | range so a partitioned realtime_data prunes.
 # ================================================================================
 ################################################################################
 
@@ -73,6 +76,7 @@ from src.server.db.models import (
     DriveSummary,
     RealtimeData,
 )
+from src.server.db.realtime_partitions import withinTimestampBounds
 
 logger = logging.getLogger(__name__)
 
@@ -141,9 +145,13 @@ def compute_drive_summary(session: Session, driveId: int) -> int | None:
         return None
 
     realtimeFilter = (RealtimeData.drive_id == driveId)
-    rowCount = int(session.execute(
-        select(func.count()).select_from(RealtimeData).where(realtimeFilter),
-    ).scalar_one())
+    rowCount, startTime, endTime = session.execute(
+        select(
+            func.count(),
+            func.min(RealtimeData.timestamp),
+            func.max(RealtimeData.timestamp),
+        ).where(realtimeFilter),
+    ).one()
 
     if rowCount == 0:
         logger.warning(
@@ -153,12 +161,6 @@ def compute_drive_summary(session: Session, driveId: int) -> int | None:
         )
         return None
 
-    startTime, endTime = session.execute(
-        select(
-            func.min(RealtimeData.timestamp),
-            func.max(RealtimeData.timestamp),
-        ).where(realtimeFilter),
-    ).one()
     durationSeconds: int | None
     if startTime is not None and endTime is not None:
         durationSeconds = int((endTime - startTime).total_seconds())
@@ -166,8 +168,13 @@ def compute_drive_summary(session: Session, driveId: int) -> int | None:
         durationSeconds = None
 
     # Gap-detection tripwire (acceptance criterion 6).  Defensive log only --
-    # never fails the compute.  Walks the ordered timestamp sequence once.
-    _logTimestampGaps(session, realtimeFilter, driveId)
+    # never fails the compute.  Walks the ordered timestamp sequence once,
+    # bounded to the drive's own partition(s).
+    _logTimestampGaps(
+        session,
+        realtimeFilter & withinTimestampBounds((startTime, endTime)),
+        driveId,
+    )
 
     # is_real derivation per Atlas Q2: read the Pi event-log data_source
     # already on the existing drive_summary row (server compute does NOT
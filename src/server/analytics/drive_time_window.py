@@ -0,0 +1,218 @@
+################################################################################
+# File Name: drive_time_window.py
+# Purpose/Description: Maintenance of the drive_time_window table -- the
+#                      per-(device, drive) MIN/MAX realtime_data timestamp
+#                      window the overlap detector reads.  Incremental update
+#                      from sync ingest + full rebuild from raw rows.
+# Author: Rex
+# Creation Date: 2026-10-16
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-16    | Rex          | Initial
+# ================================================================================
+################################################################################
+
+"""Materialized drive time windows over raw ``realtime_data``.
+
+``drive_time_window`` holds one row per ``(source_device, drive_id)``:
+``min_ts`` / ``max_ts`` / ``row_count`` of that drive's realtime rows -- the
+same aggregate :func:`src.server.analytics.overlap.detect_overlapping_drives`
+used to compute with a full ``GROUP BY drive_id`` scan.
+
+Writers:
+
+* :func:`applyIngestedRows` -- called by the sync ingest for every
+  ``realtime_data`` batch, inside the batch transaction.  A batch whose rows
+  were all new merges its per-drive aggregate into the stored window
+  (``LEAST`` / ``GREATEST`` / ``+``).  A batch with re-sent rows recomputes
+  the touched drives from ``realtime_data`` instead, so a re-send never
+  double-counts.
+* :func:`rebuildDriveTimeWindows` -- recompute from scratch (the
+  ``rebuild_drive_time_window`` CLI).  Needed after ``realtime_data`` is
+  edited outside the sync path (orphan backfills, cleanup / truncate
+  scripts, ``load_data.py``).
+
+Rows with NULL ``drive_id`` or an unparseable timestamp never contribute, as
+in the raw aggregate.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import case, delete, func, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from src.server.db.models import DriveTimeWindow, RealtimeData
+
+__all__ = [
+    "applyIngestedRows",
+    "rebuildDriveTimeWindows",
+    "recomputeDriveWindows",
+]
+
+_WindowAggregate = dict[int, list[Any]]  # drive_id -> [minTs, maxTs, count]
+
+
+def _naive(value: Any) -> datetime | None:
+    """Timestamp as the naive value the DateTime column stores, else None."""
+    if not isinstance(value, datetime):
+        return None
+    return value.replace(tzinfo=None) if value.tzinfo is not None else value
+
+
+def _aggregate(driveIds: Sequence[Any], timestamps: Sequence[Any]) -> _WindowAggregate:
+    windows: _WindowAggregate = {}
+    for driveId, rawTs in zip(driveIds, timestamps, strict=True):
+        ts = _naive(rawTs)
+        if driveId is None or ts is None:
+            continue
+        window = windows.get(driveId)
+        if window is None:
+            windows[driveId] = [ts, ts, 1]
+            continue
+        if ts < window[0]:
+            window[0] = ts
+        elif ts > window[1]:
+            window[1] = ts
+        window[2] += 1
+    return windows
+
+
+def applyIngestedRows(
+    session: Session,
+    deviceId: str,
+    driveIds: Sequence[Any],
+    timestamps: Sequence[Any],
+    inserted: int,
+) -> None:
+    """Fold one ingested ``realtime_data`` batch into ``drive_time_window``.
+
+    Args:
+        session: Session of the sync transaction (caller commits).
+        deviceId: ``source_device`` of the batch.
+        driveIds: ``drive_id`` column of the batch.
+        timestamps: ``timestamp`` column, already parsed to datetimes.
+        inserted: Rows of the batch that were new on the server.
+    """
+    windows = _aggregate(driveIds, timestamps)
+    if not windows:
+        return
+    if inserted != len(driveIds):
+        recomputeDriveWindows(session, deviceId, list(windows))
+        return
+
+    table = DriveTimeWindow.__table__
+    values = [
+        {
+            "source_device": deviceId,
+            "drive_id": driveId,
+            "min_ts": minTs,
+            "max_ts": maxTs,
+            "row_count": count,
+        }
+        for driveId, (minTs, maxTs, count) in windows.items()
+    ]
+    dialectName = session.bind.dialect.name  # type: ignore[union-attr]
+    if dialectName in {"mysql", "mariadb"}:
+        stmt = mysql_insert(table)
+        incoming = stmt.inserted
+        stmt = stmt.on_duplicate_key_update(
+            min_ts=func.least(table.c.min_ts, incoming.min_ts),
+            max_ts=func.greatest(table.c.max_ts, incoming.max_ts),
+            row_count=table.c.row_count + incoming.row_count,
+        )
+    elif dialectName == "sqlite":
+        stmt = sqlite_insert(table)
+        incoming = stmt.excluded
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["source_device", "drive_id"],
+            set_={
+                "min_ts": case(
+                    (incoming.min_ts < table.c.min_ts, incoming.min_ts),
+                    else_=table.c.min_ts,
+                ),
+                "max_ts": case(
+                    (incoming.max_ts > table.c.max_ts, incoming.max_ts),
+                    else_=table.c.max_ts,
+                ),
+                "row_count": table.c.row_count + incoming.row_count,
+            },
+        )
+    else:
+        raise ValueError(
+            f"Unsupported dialect for drive_time_window: {dialectName!r}. "
+            "Expected mysql, mariadb, or sqlite.",
+        )
+    session.execute(stmt, values)
+
+
+def recomputeDriveWindows(
+    session: Session,
+    deviceId: str,
+    driveIds: Sequence[int],
+) -> None:
+    """Replace the windows of ``driveIds`` on ``deviceId`` from raw rows."""
+    if not driveIds:
+        return
+    session.execute(
+        delete(DriveTimeWindow)
+        .where(DriveTimeWindow.source_device == deviceId)
+        .where(DriveTimeWindow.drive_id.in_(driveIds))
+    )
+    _insertFromRaw(
+        session,
+        (RealtimeData.source_device == deviceId)
+        & RealtimeData.drive_id.in_(driveIds),
+    )
+
+
+def rebuildDriveTimeWindows(session: Session, deviceId: str | None = None) -> int:
+    """Recompute every window (or one device's) from ``realtime_data``.
+
+    Args:
+        session: Session; caller commits.
+        deviceId: Limit the rebuild to one ``source_device``.
+
+    Returns:
+        Windows written.
+    """
+    deleteStmt = delete(DriveTimeWindow)
+    condition = RealtimeData.drive_id.isnot(None)
+    if deviceId is not None:
+        deleteStmt = deleteStmt.where(DriveTimeWindow.source_device == deviceId)
+        condition = condition & (RealtimeData.source_device == deviceId)
+    session.execute(deleteStmt)
+    return _insertFromRaw(session, condition)
+
+
+def _insertFromRaw(session: Session, condition: Any) -> int:
+    """``INSERT ... SELECT`` grouped windows for realtime rows matching ``condition``."""
+    grouped = (
+        select(
+            RealtimeData.source_device,
+            RealtimeData.drive_id,
+            func.min(RealtimeData.timestamp),
+            func.max(RealtimeData.timestamp),
+            func.count(),
+        )
+        .where(condition)
+        .where(RealtimeData.drive_id.isnot(None))
+        .group_by(RealtimeData.source_device, RealtimeData.drive_id)
+    )
+    table = DriveTimeWindow.__table__
+    result = session.execute(
+        table.insert().from_select(
+            ["source_device", "drive_id", "min_ts", "max_ts", "row_count"],
+            grouped,
+        )
+    )
+    return int(result.rowcount or 0)
@@ -12,6 +12,13 @@
 # ================================================================================
 # 2026-04-16    | Ralph Agent  | Initial implementation for US-158 — pure stats
 #               |              | helpers and deviation classifier
+# 2026-10-16    | Rex          | basicStatsFromAggregates -- build BasicStats
+#               |              | from DB-side COUNT/MIN/MAX/AVG/STDDEV_SAMP so
+#               |              | the 2-sigma bounds stay defined in one place.
+# 2026-10-16    | Rex          | computeBasicStats runs on the shared
+#               |              | src.common.analysis.kernel (NumPy when present).
+# 2026-10-17    | Rex          | computeBasicStatsByParameter drops empty
+#               |              | parameters instead of mapping them to None.
 # ================================================================================
 ################################################################################
 
@@ -24,15 +31,19 @@ reusable from any analytics layer (basic, advanced, reports).
 
 Functions:
     * :func:`computeBasicStats` — min, max, avg, sample std dev, outlier bounds.
+    * :func:`computeBasicStatsByParameter` — the same for many parameters in
+      one batched kernel call.
+    * :func:`basicStatsFromAggregates` — the same :class:`BasicStats` from
+      aggregates already computed elsewhere (e.g. a SQL ``GROUP BY``).
     * :func:`classifyDeviation` — map a sigma magnitude to a
       :class:`ComparisonStatus`.
 """
 
 from __future__ import annotations
 
-import statistics
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 
+from src.common.analysis.kernel import summarize, summarizeColumns
 from src.server.analytics.analytics_types import BasicStats, ComparisonStatus
 
 # ---- Constants ---------------------------------------------------------------
@@ -56,31 +67,94 @@ def computeBasicStats(values: Sequence[float]) -> BasicStats | None:
     """
     Compute min, max, avg, std dev, and 2σ outlier bounds for a sequence.
 
-    Uses the **sample** standard deviation (``statistics.stdev``) when 2+
-    values are present. For a single value, std_dev defaults to ``0.0`` and
-    outlier bounds collapse to the value itself.
+    Uses the **sample** standard deviation when 2+ values are present. For a
+    single value, std_dev defaults to ``0.0`` and outlier bounds collapse to
+    the value itself. The math runs on :mod:`src.common.analysis.kernel`
+    (``avg`` equals ``statistics.fmean``).
 
     Args:
-        values: Numeric readings. Empty sequence returns ``None``.
+        values: Numeric readings -- a sequence or float buffer such as
+            ``array('d')``. Empty sequence returns ``None``.
 
     Returns:
         A :class:`BasicStats` instance, or ``None`` if ``values`` is empty.
     """
-    if not values:
+    if not len(values):
         return None
 
-    minV = float(min(values))
-    maxV = float(max(values))
-    avg = float(statistics.fmean(values))
-    std = float(statistics.stdev(values)) if len(values) >= 2 else 0.0
+    stats = summarize(values, modePrecision=None)
+    return basicStatsFromAggregates(
+        sampleCount=stats.count,
+        minValue=stats.minimum,
+        maxValue=stats.maximum,
+        avgValue=stats.mean,
+        stdDev=stats.stdDev,
+    )
+
+
+def computeBasicStatsByParameter(
+    valuesByParam: Mapping[str, Sequence[float]],
+) -> dict[str, BasicStats]:
+    """
+    :func:`computeBasicStats` for every parameter in one batched kernel call.
+
+    Args:
+        valuesByParam: Parameter name -> readings (sequence or float buffer).
+
+    Returns:
+        Parameter name -> :class:`BasicStats`; parameters without readings
+        are left out.
+    """
+    return {
+        name: basic
+        for name, stats in summarizeColumns(valuesByParam, modePrecision=None).items()
+        if (basic := basicStatsFromAggregates(
+            sampleCount=stats.count,
+            minValue=stats.minimum,
+            maxValue=stats.maximum,
+            avgValue=stats.mean,
+            stdDev=stats.stdDev,
+        )) is not None
+    }
+
+
+def basicStatsFromAggregates(
+    sampleCount: int,
+    minValue: float,
+    maxValue: float,
+    avgValue: float,
+    stdDev: float | None,
+) -> BasicStats | None:
+    """
+    Build :class:`BasicStats` from precomputed aggregates.
+
+    ``stdDev`` is the **sample** standard deviation; ``None`` (what
+    ``STDDEV_SAMP`` yields for a single row) becomes ``0.0``, matching
+    :func:`computeBasicStats`.
+
+    Args:
+        sampleCount: Number of values aggregated. ``0`` returns ``None``.
+        minValue: Smallest value.
+        maxValue: Largest value.
+        avgValue: Arithmetic mean.
+        stdDev: Sample standard deviation, or ``None`` for fewer than 2 values.
+
+    Returns:
+        A :class:`BasicStats` instance, or ``None`` if ``sampleCount`` is 0.
+    """
+    if sampleCount < 1:
+        return None
+
+    avg = float(avgValue)
+    std = float(stdDev) if stdDev is not None and sampleCount >= 2 else 0.0
     return BasicStats(
-        min_value=minV,
-        max_value=maxV,
+        min_value=float(minValue),
+        max_value=float(maxValue),
         avg_value=avg,
         std_dev=std,
         outlier_min=avg - 2.0 * std,
         outlier_max=avg + 2.0 * std,
-        sample_count=len(values),
+        sample_count=int(sampleCount),
     )
 
 
@@ -113,6 +187,8 @@ def classifyDeviation(sigma: float) -> ComparisonStatus:
 __all__ = [
     "INVESTIGATE_THRESHOLD",
     "WATCH_THRESHOLD",
+    "basicStatsFromAggregates",
     "classifyDeviation",
     "computeBasicStats",
+    "computeBasicStatsByParameter",
 ]
@@ -17,6 +17,20 @@
 # 2026-05-28    | Rex (US-362) | Initial -- F-107 server-side overlap detector.
 #               |              | Pure query helper over raw realtime_data (B-104
 #               |              | Step 1 raw-signal authority); no DB writes.
+# 2026-10-16    | Rex          | Read windows from the maintained
+#               |              | drive_time_window table through an interval
+#               |              | tree (DriveWindowIndex) instead of grouping all
+#               |              | of realtime_data per call.  The raw scan stays
+#               |              | as the fallback for drives with no window row.
+# 2026-10-16    | Rex          | DriveWindowIndex.fromRealtime -- one grouped
+#               |              | raw scan for the multi-drive analytics batch.
+# 2026-10-17    | Rex          | detect_overlapping_drives answers one drive
+#               |              | with two indexed drive_time_window queries
+#               |              | instead of loading the whole table into a
+#               |              | DriveWindowIndex per call.
+# 2026-10-17    | Rex          | Indexed path also checks drives with raw rows
+#               |              | but no drive_time_window row (raw windows of
+#               |              | just those drives).
 # ================================================================================
 ################################################################################
 
@@ -33,16 +47,29 @@ Function:
     * :func:`detect_overlapping_drives` -- given a ``drive_id``, return the
       sorted list of other ``drive_id``s whose ``[min(timestamp),
       max(timestamp)]`` window intersects the target's window.
+
+The windows come from ``drive_time_window``, the per-drive MIN/MAX
+aggregate of raw ``realtime_data`` that the sync ingest maintains
+(:mod:`src.server.analytics.drive_time_window`).  A single check is two
+indexed queries: the target's window by ``drive_id``, then a range probe
+on ``(max_ts, min_ts)`` for the windows it intersects.  Callers checking
+many drives load the table once into a :class:`DriveWindowIndex` -- a
+centered interval tree answering each check in O(log n + k).  A drive with
+no window row (table not yet rebuilt, rows loaded outside the sync path)
+is read from ``realtime_data`` instead: as the target, through the
+original raw scan; as a candidate, through a raw aggregate over just the
+unindexed drives.
 """
 
 from __future__ import annotations
 
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 
 from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
-from src.server.db.models import RealtimeData
+from src.server.db.models import DriveTimeWindow, RealtimeData
 
 
 def detect_overlapping_drives(session: Session, drive_id: int) -> list[int]:
@@ -63,7 +90,11 @@ def detect_overlapping_drives(session: Session, drive_id: int) -> list[int]:
     is a separate Story (US-362 conditionalOutcome 3), not a parameter here.
 
     The helper is a pure query: it issues no ``INSERT``/``UPDATE``/``DELETE``
-    and is therefore idempotent and safe to call repeatedly.
+    and is therefore idempotent and safe to call repeatedly.  Windows are
+    read from ``drive_time_window`` (same MIN/MAX over raw
+    ``realtime_data``, maintained at ingest) with indexed range queries;
+    when the target drive has no row there the windows are aggregated from
+    ``realtime_data`` directly.
 
     Args:
         session: An active SQLAlchemy session bound to the server schema.
@@ -76,6 +107,13 @@ def detect_overlapping_drives(session: Session, drive_id: int) -> list[int]:
         has no ``realtime_data`` rows (no window) or when nothing overlaps.
         The target ``drive_id`` itself is never included.
     """
+    indexedWindow = _indexedTimeRange(session, drive_id)
+    if indexedWindow is not None:
+        return sorted(
+            set(_indexedOverlaps(session, drive_id, *indexedWindow))
+            | set(_unindexedOverlaps(session, drive_id, *indexedWindow))
+        )
+
     targetWindow = _driveTimeRange(session, drive_id)
     if targetWindow is None:
         return []
@@ -122,6 +160,89 @@ def _driveTimeRange(
     return start, end
 
 
+def _indexedTimeRange(
+    session: Session, drive_id: int,
+) -> tuple[datetime, datetime] | None:
+    """Return a drive's window from ``drive_time_window``, or ``None``.
+
+    Rows of several devices sharing the ``drive_id`` are merged, as in the
+    raw aggregate.
+    """
+    start, end = session.execute(
+        select(
+            func.min(DriveTimeWindow.min_ts),
+            func.max(DriveTimeWindow.max_ts),
+        ).where(DriveTimeWindow.drive_id == drive_id)
+    ).one()
+    if start is None or end is None:
+        return None
+    return start, end
+
+
+def _indexedOverlaps(
+    session: Session, drive_id: int, targetStart: datetime, targetEnd: datetime,
+) -> list[int]:
+    """Other drive_ids with a ``drive_time_window`` row sharing a second.
+
+    The per-second test of :func:`_rangesOverlapBySecond` as a range
+    predicate: a window ending at or after the target's first whole second
+    and starting before the second after its last one.  A drive_id reported
+    by several devices matches when one device's window does.
+    """
+    start = _floorToSecond(targetStart)
+    endExclusive = _floorToSecond(targetEnd) + timedelta(seconds=1)
+    others = session.execute(
+        select(DriveTimeWindow.drive_id)
+        .where(DriveTimeWindow.max_ts >= start)
+        .where(DriveTimeWindow.min_ts < endExclusive)
+        .where(DriveTimeWindow.drive_id != drive_id)
+        .distinct()
+    ).scalars()
+    return sorted(int(otherId) for otherId in others)
+
+
+def _unindexedOverlaps(
+    session: Session, drive_id: int, targetStart: datetime, targetEnd: datetime,
+) -> list[int]:
+    """Other drive_ids overlapping the target that have no window row.
+
+    ``DISTINCT drive_id`` walks the ``realtime_data`` drive_id index one
+    entry per drive, so when every drive is indexed -- the normal case --
+    no raw rows are aggregated.  Otherwise only the missing drives' windows
+    are computed from ``realtime_data``.
+    """
+    rawIds = {
+        driveId
+        for driveId in session.execute(
+            select(RealtimeData.drive_id)
+            .where(RealtimeData.drive_id.isnot(None))
+            .distinct()
+        ).scalars()
+        if driveId is not None
+    }
+    indexedIds = set(session.execute(
+        select(DriveTimeWindow.drive_id).distinct()
+    ).scalars())
+    missing = sorted(rawIds - indexedIds - {drive_id})
+    if not missing:
+        return []
+    windows = session.execute(
+        select(
+            RealtimeData.drive_id,
+            func.min(RealtimeData.timestamp),
+            func.max(RealtimeData.timestamp),
+        )
+        .where(RealtimeData.drive_id.in_(missing))
+        .group_by(RealtimeData.drive_id)
+    ).all()
+    return [
+        otherId
+        for otherId, otherStart, otherEnd in windows
+        if otherId is not None and otherStart is not None and otherEnd is not None
+        and _rangesOverlapBySecond(targetStart, targetEnd, otherStart, otherEnd)
+    ]
+
+
 def _rangesOverlapBySecond(
     aStart: datetime, aEnd: datetime, bStart: datetime, bEnd: datetime,
 ) -> bool:
@@ -140,4 +261,125 @@ def _floorToSecond(value: datetime) -> datetime:
     return value.replace(microsecond=0)
 
 
-__all__ = ["detect_overlapping_drives"]
+# =========================================================================
+# Interval index over drive_time_window
+# =========================================================================
+
+
+@dataclass(slots=True)
+class _TreeNode:
+    """Centered interval tree node: windows containing ``center``."""
+
+    center: datetime
+    byStart: list[tuple[datetime, datetime, int]]  # ascending start
+    byEnd: list[tuple[datetime, datetime, int]]  # descending end
+    left: _TreeNode | None
+    right: _TreeNode | None
+
+
+def _buildTree(windows: list[tuple[datetime, datetime, int]]) -> _TreeNode | None:
+    """Build a centered interval tree; ``windows`` is sorted by start."""
+    if not windows:
+        return None
+    center = windows[len(windows) // 2][0]
+    here = [w for w in windows if w[0] <= center <= w[1]]
+    return _TreeNode(
+        center=center,
+        byStart=here,
+        byEnd=sorted(here, key=lambda w: w[1], reverse=True),
+        left=_buildTree([w for w in windows if w[1] < center]),
+        right=_buildTree([w for w in windows if w[0] > center]),
+    )
+
+
+class DriveWindowIndex:
+    """Per-drive time windows with O(log n + k) overlap queries.
+
+    Windows are floored to whole seconds and merged across devices per
+    ``drive_id`` (the raw aggregate groups by ``drive_id`` alone).  Queries
+    use the same inclusive per-second test as :func:`_rangesOverlapBySecond`.
+    """
+
+    def __init__(self, windows: dict[int, tuple[datetime, datetime]]) -> None:
+        self._windows = {
+            driveId: (_floorToSecond(start), _floorToSecond(end))
+            for driveId, (start, end) in windows.items()
+        }
+        self._root = _buildTree(sorted(
+            (start, end, driveId) for driveId, (start, end) in self._windows.items()
+        ))
+
+    @classmethod
+    def load(cls, session: Session) -> DriveWindowIndex:
+        """Index every row of ``drive_time_window``."""
+        rows = session.execute(
+            select(
+                DriveTimeWindow.drive_id,
+                func.min(DriveTimeWindow.min_ts),
+                func.max(DriveTimeWindow.max_ts),
+            ).group_by(DriveTimeWindow.drive_id)
+        ).all()
+        return cls({int(driveId): (start, end) for driveId, start, end in rows})
+
+    @classmethod
+    def fromRealtime(cls, session: Session) -> DriveWindowIndex:
+        """Index windows aggregated straight from ``realtime_data``.
+
+        One grouped scan -- the raw-path equivalent of :meth:`load` for
+        callers checking many drives that may be missing from
+        ``drive_time_window``.
+        """
+        rows = session.execute(
+            select(
+                RealtimeData.drive_id,
+                func.min(RealtimeData.timestamp),
+                func.max(RealtimeData.timestamp),
+            )
+            .where(RealtimeData.drive_id.isnot(None))
+            .group_by(RealtimeData.drive_id)
+        ).all()
+        return cls({
+            int(driveId): (start, end)
+            for driveId, start, end in rows
+            if start is not None and end is not None
+        })
+
+    def __contains__(self, driveId: int) -> bool:
+        return driveId in self._windows
+
+    def __len__(self) -> int:
+        return len(self._windows)
+
+    def overlapping(self, driveId: int) -> list[int]:
+        """Sorted other drive_ids whose window shares a second with ``driveId``'s."""
+        window = self._windows.get(driveId)
+        if window is None:
+            return []
+        start, end = window
+        found: list[int] = []
+        node = self._root
+        pending: list[_TreeNode] = []
+        while node is not None or pending:
+            if node is None:
+                node = pending.pop()
+            if end < node.center:
+                for wStart, _wEnd, otherId in node.byStart:
+                    if wStart > end:
+                        break
+                    found.append(otherId)
+                node = node.left
+            elif start > node.center:
+                for _wStart, wEnd, otherId in node.byEnd:
+                    if wEnd < start:
+                        break
+                    found.append(otherId)
+                node = node.right
+            else:
+                found.extend(otherId for _s, _e, otherId in node.byStart)
+                if node.right is not None:
+                    pending.append(node.right)
+                node = node.left
+        return sorted(otherId for otherId in found if otherId != driveId)
+
+
+__all__ = ["DriveWindowIndex", "detect_overlapping_drives"]
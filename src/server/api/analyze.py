@@ -15,15 +15,33 @@
 # 2026-04-16    | Ralph Agent  | Initial implementation for US-147 — stub /analyze
 # 2026-04-16    | Ralph Agent  | US-CMP-005 — replace stub with real Ollama path.
 #               |              | Response shape preserved (Pi-side contract).
+# 2026-10-17    | Rex          | Queue analyses on AnalysisJobQueue: POST
+#               |              | returns 202 + job id (``?wait=true`` keeps the
+#               |              | US-147 envelope), GET /analyze/{job_id} polls.
+# 2026-10-17    | Rex          | Hand the LLM response cache to the analysis;
+#               |              | ``?bypass_cache=true`` forces a regeneration.
 # ================================================================================
 ################################################################################
 
 """
-Real AI analysis endpoint.
+Real AI analysis endpoints.
 
-``POST /api/v1/analyze`` returns Ollama-generated tuning recommendations for a
-drive. The response envelope shape is the contract locked by US-147 and must
-not change without a Pi-side migration::
+``POST /api/v1/analyze`` queues an Ollama analysis of a drive on the app's
+:class:`src.server.services.analysis_jobs.AnalysisJobQueue` and answers
+``202`` right away::
+
+    {
+        "job_id": "job-<uuid>",
+        "drive_id": 42,
+        "status": "queued | running | completed | failed",
+        "deduplicated": false
+    }
+
+``deduplicated`` is true when an identical request (same drive, same
+parameters) was already queued or running; its job is returned.
+
+``GET /api/v1/analyze/{job_id}`` reports the job; once ``completed`` its
+``result`` is the envelope locked by US-147::
 
     {
         "status": "ok",
@@ -34,9 +52,19 @@ not change without a Pi-side migration::
         "processingTimeMs": <int>
     }
 
+and once ``failed`` its ``error`` carries the HTTP status the failure maps
+to.  ``POST /api/v1/analyze?wait=true`` waits for the job and answers with
+that envelope (or error status) directly -- the pre-queue behaviour, minus
+the blocked event loop.
+
+When the app has an LLM response cache (``app.state.llmCache``) an analysis
+whose rendered prompt the model already answered replays that reply
+instead of waiting out another generation; ``?bypass_cache=true`` forces a
+fresh one (which then replaces the cached reply).
+
 All orchestration (analytics refresh, prompt rendering, Ollama call, DB
 persistence) lives in :mod:`src.server.services.analysis`. This module only
-translates HTTP → service call → HTTP response and maps service-layer
+translates HTTP → job queue → HTTP response and maps service-layer
 exceptions to the documented status codes.
 """
 
@@ -45,7 +73,7 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, Request, status
+from fastapi import APIRouter, HTTPException, Request, Response, status
 from pydantic import BaseModel, ConfigDict, Field
 
 from src.server.services.analysis import (
@@ -56,6 +84,14 @@ from src.server.services.analysis import (
     OllamaUnreachable,
     runAnalysis,
 )
+from src.server.services.analysis_jobs import (
+    DEFAULT_MAX_CONCURRENT,
+    DEFAULT_MAX_QUEUED,
+    DEFAULT_RETAIN_FINISHED,
+    AnalysisJob,
+    AnalysisJobQueue,
+    AnalysisQueueFull,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +101,9 @@ _DEFAULT_OLLAMA_BASE_URL = "http://localhost:11434"
 _DEFAULT_OLLAMA_MODEL = "llama3.1:8b"
 _DEFAULT_TIMEOUT_SECONDS = 120
 
+# Retry-After (seconds) sent with the queue-full 503.
+_QUEUE_FULL_RETRY_AFTER_SECONDS = 30
+
 
 # ==============================================================================
 # Request / Response models
@@ -96,6 +135,36 @@ class AnalyzeResponse(BaseModel):
     processingTimeMs: int
 
 
+class AnalyzeJobResponse(BaseModel):
+    """POST /analyze response when the job is queued (202)."""
+
+    job_id: str
+    drive_id: int
+    status: str
+    deduplicated: bool
+
+
+class AnalyzeJobError(BaseModel):
+    """HTTP status + detail a failed job maps to."""
+
+    status_code: int
+    detail: str
+
+
+class AnalyzeJobStatus(BaseModel):
+    """GET /analyze/{job_id} response."""
+
+    job_id: str
+    drive_id: int
+    status: str
+    submitted_at: float
+    started_at: float | None = None
+    finished_at: float | None = None
+    queue_wait_ms: int | None = None
+    result: AnalyzeResponse | None = None
+    error: AnalyzeJobError | None = None
+
+
 # ==============================================================================
 # Route
 # ==============================================================================
@@ -116,53 +185,50 @@ def _ollamaSettings(request: Request) -> tuple[str, str, int]:
     return baseUrl, model, timeout
 
 
-@router.post("/analyze", response_model=AnalyzeResponse)
-async def analyze(request: Request, body: AnalyzeRequest) -> AnalyzeResponse:
-    """Run a real AI analysis for ``body.drive_id``.
-
-    Error → HTTP mapping:
-
-    * Drive not found                          → 404
-    * Ollama connection/timeout failure        → 503 ``Ollama unavailable``
-    * Ollama non-2xx HTTP                      → 502
-    * Unexpected exception                     → 500
-    """
-    engine = getattr(request.app.state, "engine", None)
-    if engine is None:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Database engine not configured on app.state.engine",
+def _jobQueue(request: Request) -> AnalysisJobQueue:
+    """The app's analysis queue; created on first use when no lifespan did."""
+    queue = getattr(request.app.state, "analysisJobs", None)
+    if queue is None:
+        settings = getattr(request.app.state, "settings", None)
+        queue = AnalysisJobQueue(
+            runAnalysis,
+            maxConcurrent=getattr(
+                settings, "ANALYSIS_MAX_CONCURRENT", DEFAULT_MAX_CONCURRENT,
+            ),
+            maxQueued=getattr(settings, "ANALYSIS_MAX_QUEUED", DEFAULT_MAX_QUEUED),
+            retainFinished=getattr(
+                settings, "ANALYSIS_JOB_RETENTION", DEFAULT_RETAIN_FINISHED,
+            ),
         )
+        request.app.state.analysisJobs = queue
+    return queue
 
-    baseUrl, model, timeoutSeconds = _ollamaSettings(request)
 
-    try:
-        result: AnalysisResult = await runAnalysis(
-            engine=engine,
-            driveId=body.drive_id,
-            ollamaBaseUrl=baseUrl,
-            ollamaModel=model,
-            ollamaTimeoutSeconds=timeoutSeconds,
-            parameters=body.parameters,
-        )
-    except DriveNotFound as exc:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(exc),
-        ) from exc
-    except OllamaUnreachable as exc:
-        logger.warning("Ollama unreachable for drive_id=%s: %s", body.drive_id, exc)
-        raise HTTPException(
+def _errorFor(job: AnalysisJob) -> HTTPException:
+    """Map a failed job's exception to the documented HTTP status.
+
+    The queue already logged the failure; this runs on every poll.
+    """
+    exc = job.error
+    if isinstance(exc, DriveNotFound):
+        return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
+    if isinstance(exc, OllamaUnreachable):
+        return HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Ollama unavailable",
-        ) from exc
-    except OllamaHttpFailure as exc:
-        logger.error("Ollama HTTP error for drive_id=%s: %s", body.drive_id, exc)
-        raise HTTPException(
+        )
+    if isinstance(exc, OllamaHttpFailure):
+        return HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
             detail=f"Ollama error: {exc}",
-        ) from exc
+        )
+    return HTTPException(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        detail="Analysis failed",
+    )
+
 
+def _toResponse(result: AnalysisResult) -> AnalyzeResponse:
     return AnalyzeResponse(
         status=result.status,
         analysis_id=result.analysis_id,
@@ -181,12 +247,113 @@ async def analyze(request: Request, body: AnalyzeRequest) -> AnalyzeResponse:
     )
 
 
+@router.post(
+    "/analyze",
+    response_model=AnalyzeJobResponse | AnalyzeResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def analyze(
+    request: Request,
+    response: Response,
+    body: AnalyzeRequest,
+    wait: bool = False,
+    bypass_cache: bool = False,
+) -> AnalyzeJobResponse | AnalyzeResponse:
+    """Queue an AI analysis for ``body.drive_id``.
+
+    Answers 202 with the job id, or -- with ``?wait=true`` -- 200 with the
+    finished analysis.  ``?bypass_cache=true`` skips the LLM response cache.
+
+    Error → HTTP mapping:
+
+    * Queue full                               → 503 (``Retry-After``)
+    * ``wait=true`` only:
+        * Drive not found                      → 404
+        * Ollama connection/timeout failure    → 503 ``Ollama unavailable``
+        * Ollama non-2xx HTTP                  → 502
+        * Unexpected exception                 → 500
+    """
+    engine = getattr(request.app.state, "engine", None)
+    if engine is None:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Database engine not configured on app.state.engine",
+        )
+
+    baseUrl, model, timeoutSeconds = _ollamaSettings(request)
+
+    try:
+        job, deduplicated = _jobQueue(request).submit(
+            body.drive_id,
+            body.parameters,
+            engine=engine,
+            ollamaBaseUrl=baseUrl,
+            ollamaModel=model,
+            ollamaTimeoutSeconds=timeoutSeconds,
+            responseCache=getattr(request.app.state, "llmCache", None),
+            bypassCache=bypass_cache,
+        )
+    except AnalysisQueueFull as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Analysis queue full: {exc}",
+            headers={"Retry-After": str(_QUEUE_FULL_RETRY_AFTER_SECONDS)},
+        ) from exc
+
+    if not wait:
+        return AnalyzeJobResponse(
+            job_id=job.jobId,
+            drive_id=job.driveId,
+            status=job.status,
+            deduplicated=deduplicated,
+        )
+
+    await job.done.wait()
+    if job.result is None:
+        raise _errorFor(job) from job.error
+    response.status_code = status.HTTP_200_OK
+    return _toResponse(job.result)
+
+
+@router.get("/analyze/{job_id}", response_model=AnalyzeJobStatus)
+async def getAnalyzeJob(request: Request, job_id: str) -> AnalyzeJobStatus:
+    """Status of an analysis job; ``result`` / ``error`` once it finished.
+
+    Unknown (or expired) job ids → 404.
+    """
+    job = _jobQueue(request).get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No analysis job {job_id}",
+        )
+    error = None
+    if job.error is not None:
+        mapped = _errorFor(job)
+        error = AnalyzeJobError(status_code=mapped.status_code, detail=mapped.detail)
+    return AnalyzeJobStatus(
+        job_id=job.jobId,
+        drive_id=job.driveId,
+        status=job.status,
+        submitted_at=job.submittedAt,
+        started_at=job.startedAt,
+        finished_at=job.finishedAt,
+        queue_wait_ms=job.queueWaitMs,
+        result=_toResponse(job.result) if job.result is not None else None,
+        error=error,
+    )
+
+
 # ---- Public API --------------------------------------------------------------
 
 __all__ = [
     "ANALYSIS_ID_PREFIX",
+    "AnalyzeJobError",
+    "AnalyzeJobResponse",
+    "AnalyzeJobStatus",
     "AnalyzeRequest",
     "AnalyzeResponse",
     "analyze",
+    "getAnalyzeJob",
     "router",
 ]
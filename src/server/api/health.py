@@ -12,6 +12,10 @@
 # ================================================================================
 # 2026-04-16    | Ralph Agent  | Initial implementation for US-CMP-008 — router,
 #               |              | component checks, status logic, uptime format
+# 2026-10-17    | Rex          | analysisQueue block: AI job queue depth,
+#               |              | outcome counts, wait / run latency
+# 2026-10-17    | Rex          | llmCache block: response cache hit / miss
+#               |              | counters and entry count
 # ================================================================================
 ################################################################################
 
@@ -29,9 +33,19 @@ server spec §1.3::
         "lastSync": null,
         "lastAnalysis": null,
         "driveCount": 0,
-        "uptime": "2d 4h 30m"
+        "uptime": "2d 4h 30m",
+        "analysisQueue": { "queued": 0, "running": 0, ... },
+        "llmCache": { "entries": 0, "hits": 0, "misses": 0, ... }
     }
 
+``analysisQueue`` is
+:meth:`src.server.services.analysis_jobs.AnalysisJobQueue.metrics` (depth,
+outcome counts, p50 / p95 queue-wait and run latency over recent jobs), or
+``null`` before the first analysis on an app without a lifespan.
+``llmCache`` is
+:meth:`src.server.ai.response_cache.LlmResponseCache.stats`, or ``null``
+when the cache is disabled.
+
 Status logic:
     * ``mysql == "down"`` → ``unhealthy``
     * ``mysql == "up"`` and ``ollama == "up"`` → ``healthy``
@@ -233,6 +247,8 @@ async def getHealth(request: Request) -> dict[str, Any]:
     driveCount = await _getDriveCount(engine)
 
     uptimeSeconds = (time.time() - startTime) if startTime else 0.0
+    analysisJobs = getattr(state, "analysisJobs", None)
+    llmCache = getattr(state, "llmCache", None)
 
     return {
         "status": _computeStatus(mysql, ollama),
@@ -246,6 +262,8 @@ async def getHealth(request: Request) -> dict[str, Any]:
         "lastAnalysis": lastAnalysis,
         "driveCount": driveCount,
         "uptime": _formatUptime(uptimeSeconds),
+        "analysisQueue": analysisJobs.metrics() if analysisJobs is not None else None,
+        "llmCache": llmCache.stats() if llmCache is not None else None,
     }
 
 
@@ -74,6 +74,27 @@
 #               |              | autoAnalysisTriggered stays in SyncResponse for
 #               |              | Pi-side wire-format compatibility but is always
 #               |              | False (server compute runs out-of-band).
+# 2026-10-16    | Rex          | Accept gzip / zstd Content-Encoding on the
+#               |              | request body (Pi bulk push).  The payload cap
+#               |              | applies to both the wire and decoded sizes.
+# 2026-10-16    | Rex          | Columnar realtime_data bodies (negotiated by
+#               |              | Content-Type) upsert straight from column
+#               |              | arrays via _upsertColumns; JSON unchanged.
+# 2026-10-16    | Rex          | Append-only ingest for capture tables
+#               |              | (realtime_data, connection_log, alert_log):
+#               |              | cached compiled INSERT IGNORE / ON CONFLICT DO
+#               |              | NOTHING, memoized timestamp parsing, chunked
+#               |              | executemany; counts from affected rows instead
+#               |              | of a pre-SELECT.  Replaces _upsertColumns.
+# 2026-10-16    | Rex          | Keep drive_time_window current: every
+#               |              | realtime_data batch folds into it inside the
+#               |              | sync transaction.
+# 2026-10-17    | Rex          | Keep realtime_rollup current the same way.
+# 2026-10-17    | Rex          | MariaDB append uses ON DUPLICATE KEY UPDATE
+#               |              | id = id, not INSERT IGNORE, so only
+#               |              | duplicates are skipped; inserts counted by a
+#               |              | per-chunk key probe (FOUND_ROWS makes the
+#               |              | affected-row count useless there).
 # ================================================================================
 ################################################################################
 
@@ -97,11 +118,27 @@ Behaviour (server spec §2.2, sprint US-CMP-004):
   time in ``src/server/api/app.py``).
 * Payloads larger than ``MAX_SYNC_PAYLOAD_MB`` are rejected with 413 before
   any JSON parsing or DB work.
+* ``Content-Encoding: gzip`` (and ``zstd`` when the optional ``zstandard``
+  package is installed) request bodies are decoded transparently; the cap
+  applies to the decoded JSON too, so a small compressed body cannot expand
+  past it.  Unsupported encodings are rejected with 415.
+* ``Content-Type: application/vnd.eclipse-obd.sync-columnar`` bodies carry
+  ``realtime_data`` as typed columns (see
+  :mod:`src.common.contracts.realtime_columnar`); the envelope is validated
+  like JSON and the columns are upserted without building per-row dicts.
+  Any other content type is parsed as JSON.
 * Only the eight synced tables are accepted — any other key in ``tables``
   fails Pydantic validation with 422.
 * Rows are upserted with ``(source_device, source_id)`` as the natural key;
   the Pi-native ``id`` field maps to ``source_id``. Server sets ``synced_at``,
   ``source_device``, and ``sync_batch_id`` on every row.
+* Append-only capture tables (``APPEND_ONLY_TABLES``) skip the upsert: their
+  Pi rows never change after insert, so a re-sent row is ignored
+  (``ON DUPLICATE KEY UPDATE id = id`` / ``ON CONFLICT DO NOTHING``) and
+  reported as ``updated``.  Any other row error fails the batch.  Rows are bound column-wise and inserted in chunks of
+  ``APPEND_CHUNK_ROWS``.
+* Every ``realtime_data`` batch also updates ``drive_time_window`` (see
+  :mod:`src.server.analytics.drive_time_window`) in the same transaction.
 * All table upserts run inside a single SQLAlchemy transaction — any error
   rolls the entire batch back.
 * ``sync_history`` row is created (status=in_progress) in its own committed
@@ -116,17 +153,29 @@ from __future__ import annotations
 
 import json
 import logging
+import zlib
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
 
 from fastapi import APIRouter, HTTPException, Request, status
 from pydantic import BaseModel, ConfigDict, Field, field_validator
+from sqlalchemy import DateTime, or_, select, update
 from sqlalchemy import func as sa_func
-from sqlalchemy import or_, select, update
 from sqlalchemy.dialects.mysql import insert as mysql_insert
 from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
+from src.common.contracts.realtime_columnar import (
+    CONTENT_TYPE as COLUMNAR_CONTENT_TYPE,
+)
+from src.common.contracts.realtime_columnar import (
+    ColumnarDecodeError,
+    ColumnarTable,
+    decodeSyncBody,
+)
+from src.server.analytics import realtime_rollup
+from src.server.analytics.drive_time_window import applyIngestedRows
 from src.server.db.connection import getAsyncSession
 from src.server.db.models import (
     AiRecommendation,
@@ -151,6 +200,11 @@ from src.server.db.models import (
 # (overnight batch + on-demand CLI) that does NOT depend on a Pi-side drive-end
 # signal or any sync-receipt seam.
 
+try:  # Optional: zstd-encoded bodies are accepted only when installed.
+    import zstandard
+except ImportError:  # pragma: no cover - depends on the deployment
+    zstandard = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -197,6 +251,20 @@ ACCEPTED_TABLES: frozenset[str] = (
     frozenset(_TABLE_REGISTRY.keys()) | {DTC_FREEZE_FRAME_TABLE}
 )
 
+# Capture tables whose Pi rows are immutable once written (INSERT-only on
+# the Pi: not in sync_log.SYNC_UPDATE_TABLES_PK, not snapshots).  A row that
+# arrives twice (an unacknowledged batch re-sent) is already on the server
+# byte-for-byte, so these tables take the append path: no pre-SELECT, no
+# UPDATE clause.  Every table in realtime_columnar.COLUMNAR_TABLES must be
+# listed here.
+APPEND_ONLY_TABLES: frozenset[str] = frozenset({
+    "realtime_data", "connection_log", "alert_log",
+})
+
+# Rows per executemany on the append path.  Bounds the driver's multi-row
+# INSERT rewrite (PyMySQL / aiomysql) under max_allowed_packet.
+APPEND_CHUNK_ROWS: int = 5000
+
 # Columns never overwritten on upsert conflict.
 #
 # The first four are the server-owned sync bookkeeping columns.  The
@@ -339,13 +407,31 @@ def _parseDateTime(value: Any) -> Any:
 
 def _coerceRowColumns(model: type, row: dict[str, Any]) -> None:
     """In-place: parse DateTime column values into datetime objects."""
-    from sqlalchemy import DateTime
-
     for col in model.__table__.columns:  # type: ignore[attr-defined]
         if isinstance(col.type, DateTime) and col.name in row:
             row[col.name] = _parseDateTime(row[col.name])
 
 
+def _parseDateTimeColumn(values: list[Any]) -> list[Any]:
+    """Column-wise :func:`_parseDateTime`, parsing each distinct value once.
+
+    A realtime batch repeats every timestamp once per parameter polled in
+    that second, so the distinct set is several times smaller than the
+    column.
+    """
+    parsed: dict[Any, Any] = {}
+    out: list[Any] = []
+    for value in values:
+        if not isinstance(value, str):
+            out.append(value)
+            continue
+        converted = parsed.get(value)
+        if converted is None:
+            converted = parsed[value] = _parseDateTime(value)
+        out.append(converted)
+    return out
+
+
 # ==============================================================================
 # Sync core — sync function, called via AsyncSession.run_sync() in prod
 # ==============================================================================
@@ -357,6 +443,7 @@ def runSyncUpsert(
     batchId: str,
     tables: dict[str, Any],
     syncHistoryId: int,
+    appendFastPath: bool = True,
 ) -> dict[str, dict[str, int]]:
     """
     Upsert every accepted table's delta rows inside a single DB transaction.
@@ -372,6 +459,10 @@ def runSyncUpsert(
             ``rows`` list of Pi-native rows (each including an ``id`` field).
         syncHistoryId: PK of the sync_history row that triggered this call;
             stamped into ``sync_batch_id`` on rows that carry that column.
+        appendFastPath: Route :data:`APPEND_ONLY_TABLES` through
+            :func:`_appendCaptureRows`.  False forces the generic upsert for
+            JSON payloads (benchmark baseline); columnar payloads always
+            append.
 
     Returns:
         Mapping of table name → ``{"inserted": N, "updated": M, "errors": 0}``.
@@ -387,10 +478,20 @@ def runSyncUpsert(
         if tableName == DTC_FREEZE_FRAME_TABLE:
             continue
         model, renames = _TABLE_REGISTRY[tableName]
+        if isinstance(payload, ColumnarTable):
+            result[tableName] = _appendCaptureRows(
+                session, model, deviceId, payload.columns, syncHistoryId,
+            )
+            continue
         rows = payload["rows"] if isinstance(payload, dict) else payload.rows
         if not rows:
             result[tableName] = {"inserted": 0, "updated": 0, "errors": 0}
             continue
+        if appendFastPath and tableName in APPEND_ONLY_TABLES:
+            result[tableName] = _appendCaptureRows(
+                session, model, deviceId, _rowsToColumns(rows), syncHistoryId,
+            )
+            continue
 
         # Shape Pi-native rows into server schema dicts.
         prepared: list[dict[str, Any]] = []
@@ -450,6 +551,21 @@ def runSyncUpsert(
         updated = len(sourceIds) - inserted
 
         _upsertBatch(session, model, prepared)
+        if model is RealtimeData:
+            applyIngestedRows(
+                session, deviceId,
+                [row.get("drive_id") for row in prepared],
+                [row.get("timestamp") for row in prepared],
+                inserted,
+            )
+            realtime_rollup.applyIngestedRows(
+                session, deviceId,
+                [row.get("parameter_name") for row in prepared],
+                [row.get("timestamp") for row in prepared],
+                [row.get("value") for row in prepared],
+                [row.get("data_source") for row in prepared],
+                inserted,
+            )
         result[tableName] = {
             "inserted": inserted,
             "updated": updated,
@@ -488,32 +604,231 @@ def _upsertBatch(
         for k in allKeys:
             r.setdefault(k, None)
 
+    stmt = _buildUpsertStatement(table, dialectName, allKeys)
+    session.execute(stmt, rows)
+
+
+def _buildUpsertStatement(table: Any, dialectName: str, keys: set[str]) -> Any:
+    """Dialect-aware ``INSERT ... ON CONFLICT/DUPLICATE`` for ``keys``."""
     if dialectName in {"mysql", "mariadb"}:
         stmt = mysql_insert(table)
         updateCols = {
             c.name: stmt.inserted[c.name]
             for c in table.columns
-            if c.name in allKeys and c.name not in _PRESERVE_ON_UPDATE
+            if c.name in keys and c.name not in _PRESERVE_ON_UPDATE
         }
-        stmt = stmt.on_duplicate_key_update(**updateCols)
-    elif dialectName == "sqlite":
+        return stmt.on_duplicate_key_update(**updateCols)
+    if dialectName == "sqlite":
         stmt = sqlite_insert(table)
         updateCols = {
             c.name: getattr(stmt.excluded, c.name)
             for c in table.columns
-            if c.name in allKeys and c.name not in _PRESERVE_ON_UPDATE
+            if c.name in keys and c.name not in _PRESERVE_ON_UPDATE
         }
-        stmt = stmt.on_conflict_do_update(
+        return stmt.on_conflict_do_update(
             index_elements=["source_device", "source_id"],
             set_=updateCols,
         )
-    else:
+    raise ValueError(
+        f"Unsupported dialect for upsert: {dialectName!r}. "
+        "Expected mysql, mariadb, or sqlite.",
+    )
+
+
+def _rowsToColumns(rows: list[Any]) -> dict[str, list[Any]]:
+    """Transpose Pi row dicts into column lists (missing keys -> None)."""
+    names: dict[str, None] = {}
+    for row in rows:
+        if len(row) != len(names) or not names.keys() >= row.keys():
+            names.update(dict.fromkeys(row))
+    return {name: [row.get(name) for row in rows] for name in names}
+
+
+@dataclass(frozen=True, slots=True)
+class _AppendPlan:
+    """A compiled append statement plus its per-column bind processors."""
+
+    sql: str
+    columnOrder: tuple[str, ...]
+    processors: tuple[Any, ...]
+
+
+_APPEND_PLANS: dict[tuple[Any, Any, frozenset[str]], _AppendPlan] = {}
+
+
+def _appendStatement(table: Any, dialectName: str) -> Any:
+    """Dialect-aware INSERT that skips duplicate keys and nothing else.
+
+    MariaDB gets a no-op ``ON DUPLICATE KEY UPDATE id = id`` rather than
+    ``INSERT IGNORE``, which would also downgrade NOT NULL, truncation and
+    bad-value errors to warnings and drop those rows silently.
+    """
+    if dialectName in {"mysql", "mariadb"}:
+        stmt = mysql_insert(table)
+        return stmt.on_duplicate_key_update(id=table.c.id)
+    if dialectName == "sqlite":
+        return sqlite_insert(table).on_conflict_do_nothing(
+            index_elements=["source_device", "source_id"],
+        )
+    raise ValueError(
+        f"Unsupported dialect for append: {dialectName!r}. "
+        "Expected mysql, mariadb, or sqlite.",
+    )
+
+
+def _appendPlan(table: Any, dialect: Any, keys: frozenset[str]) -> _AppendPlan:
+    """Compile (once per table / dialect / column set) the positional INSERT."""
+    cacheKey = (table, dialect, keys)
+    plan = _APPEND_PLANS.get(cacheKey)
+    if plan is not None:
+        return plan
+    compiled = _appendStatement(table, dialect.name).compile(
+        dialect=dialect, column_keys=sorted(keys),
+    )
+    columnOrder = tuple(compiled.positiontup or ())
+    missing = set(columnOrder) - keys
+    if missing:
         raise ValueError(
-            f"Unsupported dialect for upsert: {dialectName!r}. "
-            "Expected mysql, mariadb, or sqlite.",
+            f"{table.name}: columns {sorted(missing)} have non-scalar "
+            "defaults, which the append path cannot bind",
         )
+    plan = _AppendPlan(
+        sql=compiled.string,
+        columnOrder=columnOrder,
+        processors=tuple(
+            table.c[name].type.dialect_impl(dialect).bind_processor(dialect)
+            for name in columnOrder
+        ),
+    )
+    _APPEND_PLANS[cacheKey] = plan
+    return plan
 
-    session.execute(stmt, rows)
+
+def _storedCount(session: Session, table: Any, deviceId: str, sourceIds: list[Any]) -> int:
+    """How many of ``sourceIds`` this device already has in ``table``."""
+    return int(session.execute(
+        select(sa_func.count()).select_from(table).where(
+            table.c.source_device == deviceId,
+            table.c.source_id.in_(sourceIds),
+        ),
+    ).scalar_one())
+
+
+def _appendCaptureRows(
+    session: Session,
+    model: type,
+    deviceId: str,
+    columns: dict[str, list[Any]],
+    syncHistoryId: int,
+) -> dict[str, int]:
+    """Insert append-only capture rows from column lists; ignore re-sends.
+
+    Same column mapping and stamping as the upsert path (Pi ``id`` ->
+    ``source_id``, ``data_source`` defaulted to ``'real'``, ``source_device``
+    / ``synced_at`` / ``sync_batch_id`` stamped), applied a column at a
+    time.  Only used for tables without renames.  Rows already present (a
+    re-sent batch) count as ``updated``, matching what the upsert path
+    reports for them.  On SQLite ``inserted`` is the affected-row total; on
+    MariaDB the driver's FOUND_ROWS flag counts a no-op duplicate as
+    affected, so each chunk's already-stored keys are counted first.
+    """
+    rowCount = len(columns.get("id", ()))
+    if rowCount == 0:
+        return {"inserted": 0, "updated": 0, "errors": 0}
+
+    table = model.__table__  # type: ignore[attr-defined]
+    mapped: dict[str, list[Any]] = {}
+    for name, values in columns.items():
+        if name == "id":
+            mapped["source_id"] = values
+        elif name in table.c:
+            column = table.c[name]
+            mapped[name] = (
+                _parseDateTimeColumn(values) if isinstance(column.type, DateTime)
+                else values
+            )
+        # Keys the server table lacks are dropped, as executemany does.
+    for column in table.c:
+        if (
+            column.name not in mapped
+            and column.default is not None
+            and column.default.is_scalar
+        ):
+            mapped[column.name] = [column.default.arg] * rowCount
+    if "data_source" in table.c:
+        mapped["data_source"] = [
+            "real" if value is None else value
+            for value in mapped.get("data_source", [None] * rowCount)
+        ]
+    constants: dict[str, Any] = {
+        "source_device": deviceId,
+        "synced_at": datetime.now(UTC).replace(tzinfo=None),
+    }
+    if "sync_batch_id" in table.c:
+        constants["sync_batch_id"] = syncHistoryId
+    for name, value in constants.items():
+        mapped[name] = [value] * rowCount
+
+    dialect = session.bind.dialect  # type: ignore[union-attr]
+    probeKeys = dialect.name != "sqlite"
+    sourceIds = mapped["source_id"]
+    inserted = 0
+    if not dialect.positional:
+        names = list(mapped)
+        stmt = _appendStatement(table, dialect.name)
+        for start in range(0, rowCount, APPEND_CHUNK_ROWS):
+            chunk = [
+                dict(zip(names, values, strict=True))
+                for values in zip(
+                    *(mapped[n][start:start + APPEND_CHUNK_ROWS] for n in names),
+                    strict=True,
+                )
+            ]
+            if probeKeys:
+                inserted += len(chunk) - _storedCount(
+                    session, table, deviceId, sourceIds[start:start + APPEND_CHUNK_ROWS],
+                )
+                session.execute(stmt, chunk)
+            else:
+                inserted += session.execute(stmt, chunk).rowcount
+    else:
+        plan = _appendPlan(table, dialect, frozenset(mapped))
+        ordered: list[list[Any]] = []
+        for name, processor in zip(plan.columnOrder, plan.processors, strict=True):
+            values = mapped[name]
+            if processor is not None:
+                values = [processor(value) for value in values]
+            ordered.append(values)
+        connection = session.connection()
+        for start in range(0, rowCount, APPEND_CHUNK_ROWS):
+            params = list(zip(
+                *(values[start:start + APPEND_CHUNK_ROWS] for values in ordered),
+                strict=True,
+            ))
+            if probeKeys:
+                inserted += len(params) - _storedCount(
+                    session, table, deviceId, sourceIds[start:start + APPEND_CHUNK_ROWS],
+                )
+                connection.exec_driver_sql(plan.sql, params)
+            else:
+                inserted += connection.exec_driver_sql(plan.sql, params).rowcount
+
+    if model is RealtimeData:
+        applyIngestedRows(
+            session, deviceId,
+            mapped.get("drive_id", [None] * rowCount),
+            mapped["timestamp"],
+            inserted,
+        )
+        realtime_rollup.applyIngestedRows(
+            session, deviceId,
+            mapped["parameter_name"],
+            mapped["timestamp"],
+            mapped["value"],
+            mapped["data_source"],
+            inserted,
+        )
+    return {"inserted": inserted, "updated": rowCount - inserted, "errors": 0}
 
 
 # ==============================================================================
@@ -844,6 +1159,54 @@ def _readMaxPayloadBytes(request: Request) -> int:
     return int(maxMb) * 1024 * 1024
 
 
+def _payloadTooLarge(maxBytes: int) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"Payload exceeds max size of {maxBytes // (1024 * 1024)} MB",
+    )
+
+
+def _decodeBody(rawBody: bytes, contentEncoding: str | None, maxBytes: int) -> bytes:
+    """Undo the request ``Content-Encoding``, enforcing ``maxBytes`` on the result.
+
+    Decompression is bounded (``max_length`` / ``max_output_size``) so a
+    compression bomb is rejected after ``maxBytes + 1`` output bytes
+    rather than being inflated into memory.
+
+    Raises:
+        HTTPException: 413 when the decoded body exceeds ``maxBytes``; 415
+            for an unsupported encoding; 422 for a corrupt compressed body.
+    """
+    encoding = (contentEncoding or "identity").strip().lower()
+    if encoding in ("", "identity"):
+        return rawBody
+    try:
+        if encoding in ("gzip", "x-gzip"):
+            decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            decoded = decompressor.decompress(rawBody, maxBytes + 1)
+            if len(decoded) <= maxBytes and not decompressor.eof:
+                raise zlib.error("truncated gzip stream")
+        elif encoding == "zstd" and zstandard is not None:
+            decoded = zstandard.ZstdDecompressor().decompress(
+                rawBody, max_output_size=maxBytes + 1,
+            )
+        else:
+            raise HTTPException(
+                status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                detail=f"Unsupported Content-Encoding: {encoding}",
+            )
+    except HTTPException:
+        raise
+    except Exception as exc:  # zlib.error / zstandard.ZstdError
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Invalid {encoding} body: {exc}",
+        ) from exc
+    if len(decoded) > maxBytes:
+        raise _payloadTooLarge(maxBytes)
+    return decoded
+
+
 @router.post("/sync", response_model=SyncResponse)
 async def postSync(request: Request) -> SyncResponse:
     """Accept a Pi delta sync payload and upsert it into the server database."""
@@ -866,17 +1229,26 @@ async def postSync(request: Request) -> SyncResponse:
     # 2) Parse + validate.
     rawBody = await request.body()
     if len(rawBody) > maxBytes:
-        raise HTTPException(
-            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail=f"Payload exceeds max size of {maxBytes // (1024 * 1024)} MB",
-        )
-    try:
-        bodyJson = json.loads(rawBody) if rawBody else {}
-    except json.JSONDecodeError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=f"Invalid JSON body: {exc.msg}",
-        ) from exc
+        raise _payloadTooLarge(maxBytes)
+    rawBody = _decodeBody(rawBody, request.headers.get("content-encoding"), maxBytes)
+    contentType = (request.headers.get("content-type") or "").split(";")[0].strip().lower()
+    columnarTables: dict[str, ColumnarTable] = {}
+    if contentType == COLUMNAR_CONTENT_TYPE:
+        try:
+            bodyJson, columnarTables = decodeSyncBody(rawBody)
+        except ColumnarDecodeError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Invalid columnar body: {exc}",
+            ) from exc
+    else:
+        try:
+            bodyJson = json.loads(rawBody) if rawBody else {}
+        except json.JSONDecodeError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Invalid JSON body: {exc.msg}",
+            ) from exc
 
     try:
         syncRequest = SyncRequest.model_validate(bodyJson)
@@ -886,6 +1258,13 @@ async def postSync(request: Request) -> SyncResponse:
             detail=str(exc),
         ) from exc
 
+    duplicated = set(columnarTables) & set(syncRequest.tables)
+    if duplicated:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Table(s) sent both as JSON and columnar: {sorted(duplicated)}",
+        )
+
     # 3) Resolve the engine.
     engine = getattr(request.app.state, "engine", None)
     if engine is None:
@@ -898,10 +1277,11 @@ async def postSync(request: Request) -> SyncResponse:
     historyId = await _createSyncHistoryRow(engine, syncRequest.deviceId)
 
     # 5) Upsert everything inside one transaction.
-    tablesForCore = {
+    tablesForCore: dict[str, Any] = {
         name: {"rows": td.rows, "lastSyncedId": td.lastSyncedId}
         for name, td in syncRequest.tables.items()
     }
+    tablesForCore.update(columnarTables)
     driveCounter = syncRequest.driveCounter
     try:
         factory = getAsyncSession(engine)
@@ -5,6 +5,14 @@ Modules:
         drive_statistics from raw realtime_data.  Invoked by the nightly
         systemd batch service AND directly by operators for backfill /
         single-drive recompute.
+    rebuild_drive_time_window -- recompute the drive_time_window overlap
+        index from raw realtime_data after out-of-band edits.
+    rebuild_parameter_history -- recompute the parameter_history aggregate
+        from drive_statistics after out-of-band edits or cascade deletes.
+    rebuild_realtime_rollup -- recompute the realtime_rollup downsampled
+        buckets from raw realtime_data after out-of-band edits.
+    manage_realtime_partitions -- list, pre-create, archive or drop the
+        monthly realtime_data partitions.
 """
 
 from __future__ import annotations
@@ -0,0 +1,162 @@
+################################################################################
+# File Name: manage_realtime_partitions.py
+# Purpose/Description: Maintenance CLI for the monthly realtime_data partitions
+#                      -- list them, pre-create future months, archive or drop
+#                      old months.
+# Author: Rex
+# Creation Date: 2026-10-17
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-17    | Rex          | Initial
+# ================================================================================
+################################################################################
+
+"""Manage the monthly ``realtime_data`` partitions (migration 0016).
+
+Usage::
+
+    python -m src.server.cli.manage_realtime_partitions --status
+    python -m src.server.cli.manage_realtime_partitions --ensure-ahead 3
+    python -m src.server.cli.manage_realtime_partitions --archive-before 2027-01
+    python -m src.server.cli.manage_realtime_partitions --drop-before 2027-01 --yes
+
+``--ensure-ahead`` is safe to run on a schedule (the nightly analytics
+batch runs it): it only splits ``p_future`` and is a no-op once the months
+exist.  ``--archive-before`` moves each whole month before the cutoff into
+its own ``realtime_data_archive_pYYYY_MM`` table (dump it to cold storage,
+then drop it).  ``--drop-before`` deletes those months and requires
+``--yes``.  Neither touches the current month.  ``--dry-run`` prints the
+plan without running DDL.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+from datetime import date
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from src.server.cli.recompute_drive_analytics import _resolveSyncDatabaseUrl
+from src.server.db.realtime_partitions import (
+    DEFAULT_MONTHS_AHEAD,
+    RealtimePartitionError,
+    archivePartitionsBefore,
+    dropPartitionsBefore,
+    ensureFuturePartitions,
+    listPartitions,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _parseMonth(value: str) -> date:
+    """``YYYY-MM`` -> first day of that month."""
+    try:
+        year, month = value.split("-")
+        return date(int(year), int(month), 1)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(
+            f"expected YYYY-MM, got {value!r}",
+        ) from exc
+
+
+def _buildArgParser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.server.cli.manage_realtime_partitions",
+        description="List, pre-create, archive or drop realtime_data partitions.",
+    )
+    action = parser.add_mutually_exclusive_group(required=True)
+    action.add_argument(
+        "--status", action="store_true",
+        help="List partitions with their estimated row counts.",
+    )
+    action.add_argument(
+        "--ensure-ahead", type=int, metavar="MONTHS", nargs="?",
+        const=DEFAULT_MONTHS_AHEAD,
+        help=f"Pre-create partitions through MONTHS past the current month "
+             f"(default {DEFAULT_MONTHS_AHEAD}).",
+    )
+    action.add_argument(
+        "--archive-before", type=_parseMonth, metavar="YYYY-MM",
+        help="Move every month before YYYY-MM into its own archive table.",
+    )
+    action.add_argument(
+        "--drop-before", type=_parseMonth, metavar="YYYY-MM",
+        help="Drop every month before YYYY-MM (requires --yes).",
+    )
+    parser.add_argument(
+        "--yes", action="store_true",
+        help="Confirm --drop-before.",
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true",
+        help="Print the partitions that would change; run no DDL.",
+    )
+    parser.add_argument(
+        "--verbose", "-v",
+        action="store_true",
+        help="Enable DEBUG-level logging.",
+    )
+    return parser
+
+
+def _run(session: Session, args: argparse.Namespace, today: date) -> list[str]:
+    if args.status:
+        for partition in listPartitions(session):
+            print(f"{partition.name}\t{partition.rows}")
+        return []
+    if args.ensure_ahead is not None:
+        return ensureFuturePartitions(
+            session, today=today, monthsAhead=args.ensure_ahead, dryRun=args.dry_run,
+        )
+    if args.archive_before is not None:
+        return archivePartitionsBefore(
+            session, args.archive_before, today=today, dryRun=args.dry_run,
+        )
+    return dropPartitionsBefore(
+        session, args.drop_before, today=today, dryRun=args.dry_run,
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point for ``python -m src.server.cli.manage_realtime_partitions``."""
+    parser = _buildArgParser()
+    args = parser.parse_args(argv)
+    if args.drop_before is not None and not (args.yes or args.dry_run):
+        parser.error("--drop-before deletes rows; pass --yes (or --dry-run)")
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s | %(message)s",
+    )
+
+    engine = create_engine(_resolveSyncDatabaseUrl(), future=True)
+    try:
+        with Session(engine) as session:
+            changed = _run(session, args, date.today())
+    except (RealtimePartitionError, ValueError) as exc:
+        logger.error("manage_realtime_partitions | %s", exc)
+        return 1
+    finally:
+        engine.dispose()
+
+    if not args.status:
+        logger.info(
+            "manage_realtime_partitions | %s%s | partitions=%s",
+            "dry-run | " if args.dry_run else "",
+            "ensure" if args.ensure_ahead is not None
+            else "archive" if args.archive_before is not None else "drop",
+            ",".join(changed) or "-",
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
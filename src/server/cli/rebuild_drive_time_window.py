@@ -0,0 +1,88 @@
+################################################################################
+# File Name: rebuild_drive_time_window.py
+# Purpose/Description: One-shot CLI that recomputes the drive_time_window table
+#                      from raw realtime_data (all devices or one).
+# Author: Rex
+# Creation Date: 2026-10-16
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-16    | Rex          | Initial
+# ================================================================================
+################################################################################
+
+"""Rebuild the materialized drive time windows.
+
+Usage::
+
+    python -m src.server.cli.rebuild_drive_time_window
+    python -m src.server.cli.rebuild_drive_time_window --device chi-eclipse-01
+
+The sync ingest keeps ``drive_time_window`` current; run this after
+``realtime_data`` is changed outside the sync path (orphan backfills,
+cleanup or truncate scripts, ``load_data.py``).  The rebuild is one
+transaction: readers see either the old windows or the new ones.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from src.server.analytics.drive_time_window import rebuildDriveTimeWindows
+from src.server.cli.recompute_drive_analytics import _resolveSyncDatabaseUrl
+
+logger = logging.getLogger(__name__)
+
+
+def _buildArgParser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.server.cli.rebuild_drive_time_window",
+        description="Recompute drive_time_window from raw realtime_data.",
+    )
+    parser.add_argument(
+        "--device",
+        metavar="DEVICE_ID",
+        help="Rebuild only this source_device (default: every device).",
+    )
+    parser.add_argument(
+        "--verbose", "-v",
+        action="store_true",
+        help="Enable DEBUG-level logging.",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point for ``python -m src.server.cli.rebuild_drive_time_window``."""
+    args = _buildArgParser().parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s | %(message)s",
+    )
+
+    engine = create_engine(_resolveSyncDatabaseUrl(), future=True)
+    try:
+        with Session(engine) as session:
+            written = rebuildDriveTimeWindows(session, deviceId=args.device)
+            session.commit()
+    finally:
+        engine.dispose()
+
+    logger.info(
+        "rebuild_drive_time_window | done | device=%s | windows=%d",
+        args.device or "*", written,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+################################################################################
+# File Name: rebuild_parameter_history.py
+# Purpose/Description: One-shot CLI that recomputes the parameter_history
+#                      aggregate from drive_statistics.
+# Author: Rex
+# Creation Date: 2026-10-16
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-16    | Rex          | Initial
+# ================================================================================
+################################################################################
+
+"""Rebuild the per-parameter historical aggregate.
+
+Usage::
+
+    python -m src.server.cli.rebuild_parameter_history
+
+Analytics writes keep ``parameter_history`` current; run this after
+``drive_statistics`` is changed outside them (``drive_summary`` deletes that
+cascade, manual SQL, restores).  The rebuild is one transaction: readers
+see either the old aggregate or the new one.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from src.server.cli.recompute_drive_analytics import _resolveSyncDatabaseUrl
+from src.server.db.parameter_history import rebuildParameterHistory
+
+logger = logging.getLogger(__name__)
+
+
+def _buildArgParser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.server.cli.rebuild_parameter_history",
+        description="Recompute parameter_history from drive_statistics.",
+    )
+    parser.add_argument(
+        "--verbose", "-v",
+        action="store_true",
+        help="Enable DEBUG-level logging.",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point for ``python -m src.server.cli.rebuild_parameter_history``."""
+    args = _buildArgParser().parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s | %(message)s",
+    )
+
+    engine = create_engine(_resolveSyncDatabaseUrl(), future=True)
+    try:
+        with Session(engine) as session:
+            written = rebuildParameterHistory(session)
+            session.commit()
+    finally:
+        engine.dispose()
+
+    logger.info("rebuild_parameter_history | done | rows=%d", written)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+################################################################################
+# File Name: rebuild_realtime_rollup.py
+# Purpose/Description: One-shot CLI that recomputes the realtime_rollup table
+#                      from raw realtime_data (all devices or one).
+# Author: Rex
+# Creation Date: 2026-10-17
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-17    | Rex          | Initial
+# ================================================================================
+################################################################################
+
+"""Rebuild the downsampled realtime_data rollups.
+
+Usage::
+
+    python -m src.server.cli.rebuild_realtime_rollup
+    python -m src.server.cli.rebuild_realtime_rollup --device chi-eclipse-01
+
+The sync ingest keeps ``realtime_rollup`` current; run this after
+``realtime_data`` is changed outside the sync path (orphan backfills,
+cleanup or truncate scripts, ``load_data.py``).  Buckets are rebuilt only
+for rows still in ``realtime_data``, so the rollups of months archived or
+dropped with ``manage_realtime_partitions`` are lost by a rebuild.  The
+rebuild is one transaction: readers see either the old buckets or the new
+ones.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from src.server.analytics.realtime_rollup import rebuildRealtimeRollups
+from src.server.cli.recompute_drive_analytics import _resolveSyncDatabaseUrl
+
+logger = logging.getLogger(__name__)
+
+
+def _buildArgParser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.server.cli.rebuild_realtime_rollup",
+        description="Recompute realtime_rollup from raw realtime_data.",
+    )
+    parser.add_argument(
+        "--device",
+        metavar="DEVICE_ID",
+        help="Rebuild only this source_device (default: every device).",
+    )
+    parser.add_argument(
+        "--verbose", "-v",
+        action="store_true",
+        help="Enable DEBUG-level logging.",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point for ``python -m src.server.cli.rebuild_realtime_rollup``."""
+    args = _buildArgParser().parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s | %(message)s",
+    )
+
+    engine = create_engine(_resolveSyncDatabaseUrl(), future=True)
+    try:
+        with Session(engine) as session:
+            written = rebuildRealtimeRollups(session, deviceId=args.device)
+            session.commit()
+    finally:
+        engine.dispose()
+
+    logger.info(
+        "rebuild_realtime_rollup | done | device=%s | buckets=%d",
+        args.device or "*", written,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
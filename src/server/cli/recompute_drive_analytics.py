@@ -28,6 +28,14 @@
 #               |              | attribution_anomaly) and a run-level anomaly
 #               |              | tally.  Anomaly rows are rendered, never
 #               |              | dropped (downstream graceful-degradation DoD).
+# 2026-10-16    | Rex          | Route recomputes through the single-pass
+#               |              | multi-drive batch engine (one streamed
+#               |              | realtime_data scan per pass of drives, bulk
+#               |              | writes, one commit per pass).  --workers N
+#               |              | shards the drive list across processes.
+# 2026-10-17    | Rex          | A pass that raises is retried drive by drive
+#               |              | so one bad drive no longer fails its whole
+#               |              | pass; DRY-RUN line names the batch engine.
 # ================================================================================
 ################################################################################
 
@@ -39,12 +47,19 @@ Usage::
     python -m server.cli.recompute_drive_analytics --drive-id-range 11-20
     python -m server.cli.recompute_drive_analytics --all-stale
     python -m server.cli.recompute_drive_analytics --drive-id-range 11-20 --dry-run
+    python -m server.cli.recompute_drive_analytics --drive-id-range 1-100 --workers 4
 
 The CLI is intentionally narrow: it pulls a list of Pi-local drive_ids
-from one of three flags, then loops invoking ``compute_drive_summary``.
+from one of three flags, then hands them to
+:func:`src.server.analytics.drive_analytics_batch.computeDriveAnalyticsBatch`
+in passes of :data:`DEFAULT_DRIVES_PER_PASS` drives -- one streamed
+``realtime_data`` scan and one commit per pass, instead of ~8 queries and a
+commit per drive.  ``--workers N`` splits the sorted drive list into N
+contiguous shards, each recomputed by its own process and DB connection.
 Errors on individual drives are logged but do not abort the run -- a
 backfill over 10 drives where one is genuinely empty must still process
-the other 9.
+the other 9.  An unexpected error rolls back its pass, which is then
+retried drive by drive so only the raising drive is reported failed.
 
 Idempotency comes from the compute path: re-running the CLI over a
 drive that already has analytics fields produces the same output (data
@@ -57,14 +72,18 @@ import argparse
 import logging
 import sys
 from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
 
 from sqlalchemy import create_engine, select
 from sqlalchemy.orm import Session
 
-from src.server.analytics.drive_statistics_compute import (
-    compute_drive_statistics,
+from src.server.analytics.drive_analytics_batch import (
+    DEFAULT_DRIVES_PER_PASS,
+    OUTCOME_FAILED,
+    OUTCOME_OK,
+    DriveAnalyticsOutcome,
+    computeDriveAnalyticsBatch,
 )
-from src.server.analytics.drive_summary_compute import compute_drive_summary
 from src.server.db.models import DATA_QUALITY_ATTRIBUTION_ANOMALY, DriveSummary
 
 logger = logging.getLogger(__name__)
@@ -149,6 +168,115 @@ def _findStaleDriveIds(session: Session) -> list[int]:
     return sorted(ids)
 
 
+def _recomputeDrives(
+    session: Session, driveIds: Sequence[int],
+) -> list[DriveAnalyticsOutcome]:
+    """Run the batch engine over ``driveIds`` one pass at a time.
+
+    Each pass commits on its own, so a crash mid-backfill keeps the
+    finished passes.  A pass that raises is rolled back and retried one
+    drive at a time, so only the drive that actually raises is reported
+    failed -- the same isolation as the old per-drive loop.
+    """
+    outcomes: list[DriveAnalyticsOutcome] = []
+    for offset in range(0, len(driveIds), DEFAULT_DRIVES_PER_PASS):
+        passIds = list(driveIds[offset:offset + DEFAULT_DRIVES_PER_PASS])
+        try:
+            outcomes.extend(computeDriveAnalyticsBatch(session, passIds))
+            session.commit()
+        except Exception as exc:  # noqa: BLE001 - CLI fault tolerance
+            session.rollback()
+            logger.warning(
+                "recompute_drive_analytics | drive_ids=%s-%s | pass FAILED "
+                "-- retrying drive by drive | %s",
+                passIds[0], passIds[-1], exc,
+            )
+            outcomes.extend(_recomputeEachDrive(session, passIds))
+    return outcomes
+
+
+def _recomputeEachDrive(
+    session: Session, driveIds: list[int],
+) -> list[DriveAnalyticsOutcome]:
+    """Single-drive passes with a commit each; a raise fails only its drive."""
+    outcomes: list[DriveAnalyticsOutcome] = []
+    for driveId in driveIds:
+        try:
+            outcomes.extend(computeDriveAnalyticsBatch(session, [driveId]))
+            session.commit()
+        except Exception as exc:  # noqa: BLE001 - CLI fault tolerance
+            session.rollback()
+            logger.error(
+                "recompute_drive_analytics | drive_id=%s | FAILED | %s",
+                driveId, exc, exc_info=True,
+            )
+            outcomes.append(
+                DriveAnalyticsOutcome(driveId, OUTCOME_FAILED, error=str(exc))
+            )
+    return outcomes
+
+
+def _runShard(
+    databaseUrl: str, driveIds: list[int], verbose: bool,
+) -> list[DriveAnalyticsOutcome]:
+    """Worker-process entry: own engine, own connection, one shard."""
+    logging.basicConfig(
+        level=logging.DEBUG if verbose else logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s | %(message)s",
+    )
+    engine = create_engine(databaseUrl, future=True)
+    try:
+        with Session(engine) as session:
+            return _recomputeDrives(session, driveIds)
+    finally:
+        engine.dispose()
+
+
+def _shardDriveIds(driveIds: Sequence[int], workers: int) -> list[list[int]]:
+    """Split sorted drive_ids into ``workers`` contiguous, near-equal ranges."""
+    ordered = sorted(set(driveIds))
+    shardCount = max(1, min(workers, len(ordered)))
+    size, extra = divmod(len(ordered), shardCount)
+    shards: list[list[int]] = []
+    start = 0
+    for index in range(shardCount):
+        end = start + size + (1 if index < extra else 0)
+        shards.append(ordered[start:end])
+        start = end
+    return shards
+
+
+def _logOutcome(outcome: DriveAnalyticsOutcome) -> None:
+    """Render one drive's result (the per-drive lines operators grep for)."""
+    if outcome.status == OUTCOME_FAILED:
+        logger.error(
+            "recompute_drive_analytics | drive_id=%s | FAILED | %s",
+            outcome.driveId, outcome.error,
+        )
+        return
+    if outcome.status != OUTCOME_OK:
+        return
+    # US-363: surface the data_quality tripwire flag visibly.  The row is
+    # written and fully readable -- the CLI never drops or refuses an
+    # anomaly row; it renders it with a marker so an operator sees the
+    # dual-attribution signal.
+    if outcome.dataQuality == DATA_QUALITY_ATTRIBUTION_ANOMALY:
+        logger.warning(
+            "recompute_drive_analytics | drive_id=%s | "
+            "[ATTRIBUTION_ANOMALY] | summary_id=%s | "
+            "data_quality=%s | row written + readable "
+            "(rendered, not dropped)",
+            outcome.driveId, outcome.summaryId, outcome.dataQuality,
+        )
+    logger.info(
+        "recompute_drive_analytics | drive_id=%s | OK | "
+        "summary_id=%s | drive_statistics_rows=%d | "
+        "data_quality=%s",
+        outcome.driveId, outcome.summaryId, outcome.statisticsRows,
+        outcome.dataQuality,
+    )
+
+
 def _buildArgParser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="python -m server.cli.recompute_drive_analytics",
@@ -183,6 +311,16 @@ def _buildArgParser() -> argparse.ArgumentParser:
         action="store_true",
         help="Print planned operations without writing.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        metavar="N",
+        help=(
+            "Shard the drive list across N processes, each with its own "
+            "DB connection (default: 1, in-process)."
+        ),
+    )
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -201,87 +339,71 @@ def main(argv: list[str] | None = None) -> int:
         format="%(asctime)s %(levelname)s %(name)s | %(message)s",
     )
 
+    if args.workers < 1:
+        parser.error("--workers must be >= 1")
+
     databaseUrl = _resolveSyncDatabaseUrl()
     engine = create_engine(databaseUrl, future=True)
     try:
         with Session(engine) as session:
             driveIds = _resolveDriveIds(args, session)
-            if not driveIds:
-                logger.info(
-                    "recompute_drive_analytics | no drive_ids to process",
-                )
-                return 0
+    finally:
+        engine.dispose()
 
-            logger.info(
-                "recompute_drive_analytics | begin | count=%d | dry_run=%s",
-                len(driveIds), args.dry_run,
-            )
+    if not driveIds:
+        logger.info(
+            "recompute_drive_analytics | no drive_ids to process",
+        )
+        return 0
 
-            successes = 0
-            failures = 0
-            skipped = 0
-            anomalies = 0
-            for driveId in driveIds:
-                if args.dry_run:
-                    logger.info(
-                        "DRY-RUN | drive_id=%s | would call "
-                        "compute_drive_summary + compute_drive_statistics",
-                        driveId,
-                    )
-                    successes += 1
-                    continue
-
-                try:
-                    summaryId = compute_drive_summary(session, driveId)
-                    if summaryId is None:
-                        # No drive_summary row OR no realtime_data: skip the
-                        # statistics compute too -- it would WARN+return 0 on
-                        # the same precondition.
-                        skipped += 1
-                        continue
-                    statsWritten = compute_drive_statistics(session, driveId)
-                    # US-363: surface the data_quality tripwire flag visibly.
-                    # The row is written and fully readable -- the CLI never
-                    # drops or refuses an anomaly row; it renders it with a
-                    # marker so an operator sees the dual-attribution signal.
-                    summaryRow = session.get(DriveSummary, summaryId)
-                    dataQuality = (
-                        summaryRow.data_quality if summaryRow is not None
-                        else "?"
-                    )
-                    session.commit()
-                    successes += 1
-                    if dataQuality == DATA_QUALITY_ATTRIBUTION_ANOMALY:
-                        anomalies += 1
-                        logger.warning(
-                            "recompute_drive_analytics | drive_id=%s | "
-                            "[ATTRIBUTION_ANOMALY] | summary_id=%s | "
-                            "data_quality=%s | row written + readable "
-                            "(rendered, not dropped)",
-                            driveId, summaryId, dataQuality,
-                        )
-                    logger.info(
-                        "recompute_drive_analytics | drive_id=%s | OK | "
-                        "summary_id=%s | drive_statistics_rows=%d | "
-                        "data_quality=%s",
-                        driveId, summaryId, statsWritten, dataQuality,
-                    )
-                except Exception as exc:  # noqa: BLE001 - CLI fault tolerance
-                    session.rollback()
-                    failures += 1
-                    logger.error(
-                        "recompute_drive_analytics | drive_id=%s | "
-                        "FAILED | %s", driveId, exc, exc_info=True,
-                    )
+    logger.info(
+        "recompute_drive_analytics | begin | count=%d | dry_run=%s | "
+        "workers=%d",
+        len(driveIds), args.dry_run, args.workers,
+    )
 
+    if args.dry_run:
+        for driveId in driveIds:
             logger.info(
-                "recompute_drive_analytics | done | success=%d | "
-                "skipped=%d | failed=%d | attribution_anomalies=%d",
-                successes, skipped, failures, anomalies,
+                "DRY-RUN | drive_id=%s | would recompute drive_summary + "
+                "drive_statistics (batch engine, %d drives per pass)",
+                driveId, DEFAULT_DRIVES_PER_PASS,
             )
-    finally:
-        engine.dispose()
-
+        logger.info(
+            "recompute_drive_analytics | done | success=%d | "
+            "skipped=0 | failed=0 | attribution_anomalies=0",
+            len(driveIds),
+        )
+        return 0
+
+    shards = _shardDriveIds(driveIds, args.workers)
+    if len(shards) == 1:
+        outcomes = _runShard(databaseUrl, shards[0], args.verbose)
+    else:
+        with ProcessPoolExecutor(max_workers=len(shards)) as pool:
+            futures = [
+                pool.submit(_runShard, databaseUrl, shard, args.verbose)
+                for shard in shards
+            ]
+            outcomes = [o for future in futures for o in future.result()]
+
+    successes = skipped = failures = anomalies = 0
+    for outcome in outcomes:
+        _logOutcome(outcome)
+        if outcome.status == OUTCOME_OK:
+            successes += 1
+            if outcome.dataQuality == DATA_QUALITY_ATTRIBUTION_ANOMALY:
+                anomalies += 1
+        elif outcome.status == OUTCOME_FAILED:
+            failures += 1
+        else:
+            skipped += 1
+
+    logger.info(
+        "recompute_drive_analytics | done | success=%d | "
+        "skipped=%d | failed=%d | attribution_anomalies=%d",
+        successes, skipped, failures, anomalies,
+    )
     return 0
 
 
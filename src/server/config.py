@@ -14,6 +14,10 @@
 #               |              | scaffold and server configuration
 # 2026-04-30    | Rex          | US-246 (B-047 US-B) — RELEASE_VERSION_PATH,
 #               |              | RELEASE_HISTORY_PATH, RELEASE_HISTORY_MAX
+# 2026-10-17    | Rex          | ANALYSIS_MAX_CONCURRENT, ANALYSIS_MAX_QUEUED,
+#               |              | ANALYSIS_JOB_RETENTION for the /analyze queue
+# 2026-10-17    | Rex          | LLM_CACHE_PATH, LLM_CACHE_TTL_HOURS,
+#               |              | LLM_CACHE_MAX_ENTRIES (Ollama response cache)
 # ================================================================================
 ################################################################################
 
@@ -106,6 +110,30 @@ class Settings(BaseSettings):
         default=120,
         description="Timeout for AI analysis requests in seconds",
     )
+    ANALYSIS_MAX_CONCURRENT: int = Field(
+        default=1,
+        description="AI analyses (Ollama generations) allowed to run at once",
+    )
+    ANALYSIS_MAX_QUEUED: int = Field(
+        default=16,
+        description="AI analysis jobs allowed to wait for a free worker",
+    )
+    ANALYSIS_JOB_RETENTION: int = Field(
+        default=100,
+        description="Finished AI analysis jobs kept readable via GET /analyze/{job_id}",
+    )
+    LLM_CACHE_PATH: str = Field(
+        default="./data/llm_response_cache.db",
+        description="SQLite file caching Ollama replies by prompt hash; empty disables",
+    )
+    LLM_CACHE_TTL_HOURS: float = Field(
+        default=168,
+        description="Age after which a cached Ollama reply is regenerated",
+    )
+    LLM_CACHE_MAX_ENTRIES: int = Field(
+        default=500,
+        description="Cached Ollama replies kept; least recently used evicted past it",
+    )
     TREND_WINDOW_DRIVES: int = Field(
         default=10,
         description="Number of recent drives used for trend analysis",
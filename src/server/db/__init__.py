@@ -10,6 +10,9 @@
 # Date          | Author       | Description
 # ================================================================================
 # 2026-04-16    | Ralph Agent  | US-CMP-003 — public API exports for db package
+# 2026-10-16    | Rex          | Export ParameterHistory; import
+#               |              | parameter_history so its DriveStatistic
+#               |              | listeners are always registered
 # ================================================================================
 ################################################################################
 
@@ -24,6 +27,9 @@ can write::
 
 from __future__ import annotations
 
+# Imported for its side effect: mapper events that keep parameter_history in
+# step with ORM writes to drive_statistics.
+from src.server.db import parameter_history  # noqa: F401
 from src.server.db.connection import createAsyncEngine, getAsyncSession
 from src.server.db.models import (
     AiRecommendation,
@@ -38,6 +44,7 @@ from src.server.db.models import (
     Device,
     DriveStatistic,
     DriveSummary,
+    ParameterHistory,
     Profile,
     RealtimeData,
     Statistic,
@@ -69,6 +76,7 @@ __all__ = [
     "TrendSnapshot",
     "AnomalyLog",
     "Baseline",
+    "ParameterHistory",
     # Connection
     "createAsyncEngine",
     "getAsyncSession",
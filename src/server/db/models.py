@@ -47,6 +47,25 @@
 #               |              | UNIQUE index enforcing exactly-one-active-ECU
 #               |              | (MariaDB lacks partial unique indexes).  Append-
 #               |              | only invariant; server-only (Pi schema unchanged).
+# 2026-10-16    | Rex          | DriveTimeWindow: per-(device, drive) realtime
+#               |              | window maintained by sync ingest; read by the
+#               |              | overlap detector instead of a realtime_data scan.
+# 2026-10-16    | Rex          | ParameterHistory: per-(device, parameter)
+#               |              | running count/sum/sum-of-squares of
+#               |              | drive_statistics.avg_value for the history
+#               |              | comparison + anomaly envelope.
+# 2026-10-17    | Rex          | RealtimeData: composite indexes for the
+#               |              | per-drive / per-device analytics access paths
+#               |              | (migration v0015).
+# 2026-10-17    | Rex          | RealtimeData: note the MariaDB partition
+#               |              | layout / widened keys of migration v0016.
+# 2026-10-17    | Rex          | RealtimeRollup: 1s / 10s / 1min per-parameter
+#               |              | min/max/sum/count buckets maintained by sync
+#               |              | ingest (migration v0017).
+# 2026-10-17    | Rex          | DriveTimeWindow: drive_id and (max_ts, min_ts)
+#               |              | indexes for single-drive overlap range queries
+#               |              | (migration v0018).
+# 2026-10-17    | Rex          | RealtimeRollup: 10s / 1min tiers only.
 # ================================================================================
 ################################################################################
 
@@ -140,11 +159,27 @@ DATA_SOURCE_LENGTH: int = 16
 
 
 class RealtimeData(Base):
-    """Real-time OBD-II sensor readings, mirrored from Pi."""
+    """Real-time OBD-II sensor readings, mirrored from Pi.
+
+    On MariaDB the table is RANGE-partitioned by month on ``timestamp``
+    (migration v0016, :mod:`src.server.db.realtime_partitions`), which puts
+    ``timestamp`` into every unique key there: the primary key is
+    ``(id, timestamp)`` and the natural key ``(source_device, source_id,
+    timestamp)``.
+    """
 
     __tablename__ = "realtime_data"
     __table_args__ = (
         UniqueConstraint("source_device", "source_id"),
+        # Analytics access paths (migration v0015).  drive_param covers the
+        # per-parameter aggregate without touching the row.
+        Index("idx_realtime_data_drive_ts", "drive_id", "timestamp"),
+        Index("idx_realtime_data_drive_param", "drive_id", "parameter_name", "value"),
+        Index(
+            "idx_realtime_data_device_drive_ts",
+            "source_device", "drive_id", "timestamp",
+        ),
+        Index("idx_realtime_data_device_ts", "source_device", "timestamp"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -1239,6 +1274,89 @@ class DriveCounter(Base):
     )
 
 
+class DriveTimeWindow(Base):
+    """Materialized ``[min, max]`` timestamp window per Pi drive.
+
+    One row per ``(source_device, drive_id)`` holding the MIN/MAX
+    ``realtime_data.timestamp`` and row count of that drive.  Kept current
+    by the sync ingest (:mod:`src.server.analytics.drive_time_window`) so the
+    overlap detector (US-362) reads a few hundred rows instead of grouping
+    the whole ``realtime_data`` table.  Derived data: rebuild it with
+    ``python -m src.server.cli.rebuild_drive_time_window`` after any
+    out-of-band ``realtime_data`` edit (backfill / cleanup scripts).
+    """
+
+    __tablename__ = "drive_time_window"
+    __table_args__ = (
+        # Single-drive overlap check (migration v0018): the target's window
+        # by drive_id, then a range probe on max_ts (drives ending after the
+        # target starts -- a handful for a freshly ingested drive).
+        Index("idx_drive_time_window_drive", "drive_id"),
+        Index("idx_drive_time_window_span", "max_ts", "min_ts"),
+    )
+
+    source_device: Mapped[str] = mapped_column(String(64), primary_key=True)
+    drive_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    min_ts: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    max_ts: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    row_count: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+
+class RealtimeRollup(Base):
+    """Downsampled ``realtime_data`` bucket per (device, resolution, parameter).
+
+    ``sample_count`` / ``min_value`` / ``max_value`` / ``value_sum`` of the
+    real (``data_source`` ``'real'`` or NULL) rows of one parameter inside
+    ``[bucket_start, bucket_start + resolution_seconds)``, at 10 s and 1 min
+    resolutions.  Kept current by the sync ingest
+    (:mod:`src.server.analytics.realtime_rollup`), which also serves ranged
+    reads at the coarsest resolution that fits a point budget.  Derived
+    data: rebuild it with ``python -m src.server.cli.rebuild_realtime_rollup``
+    after any out-of-band ``realtime_data`` edit.
+    """
+
+    __tablename__ = "realtime_rollup"
+    __table_args__ = (
+        # Recompute-from-raw deletes every resolution / parameter of a
+        # device's time range.
+        Index("idx_realtime_rollup_device_bucket", "source_device", "bucket_start"),
+    )
+
+    source_device: Mapped[str] = mapped_column(String(64), primary_key=True)
+    resolution_seconds: Mapped[int] = mapped_column(
+        Integer, primary_key=True, autoincrement=False,
+    )
+    parameter_name: Mapped[str] = mapped_column(String(128), primary_key=True)
+    bucket_start: Mapped[datetime] = mapped_column(DateTime, primary_key=True)
+    sample_count: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    min_value: Mapped[float] = mapped_column(Float, nullable=False)
+    max_value: Mapped[float] = mapped_column(Float, nullable=False)
+    value_sum: Mapped[float] = mapped_column(Float, nullable=False)
+
+
+class ParameterHistory(Base):
+    """Running aggregate of per-drive ``avg_value`` per (device, parameter).
+
+    ``drive_count`` / ``avg_sum`` / ``avg_sum_sq`` over every
+    ``drive_statistics`` row with a non-NULL ``avg_value``, keyed on the
+    owning drive's device (``source_device``, else ``device_id``).  Lets
+    :func:`src.server.analytics.basic.compareDriveToHistory` and
+    :func:`src.server.analytics.advanced.detectAnomalies` derive the
+    historical mean / sample std (leave-one-out for the current drive) from
+    one grouped read.  Maintained by :mod:`src.server.db.parameter_history`;
+    rebuild with ``python -m src.server.cli.rebuild_parameter_history``
+    after drive_statistics / drive_summary rows are removed out of band.
+    """
+
+    __tablename__ = "parameter_history"
+
+    source_device: Mapped[str] = mapped_column(String(64), primary_key=True)
+    parameter_name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    drive_count: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    avg_sum: Mapped[float] = mapped_column(Float, nullable=False)
+    avg_sum_sq: Mapped[float] = mapped_column(Float, nullable=False)
+
+
 class Baseline(Base):
     """CIO-approved per-parameter baseline values from real drives.
 
@@ -1307,4 +1425,7 @@ __all__ = [
     "AnomalyLog",
     "Baseline",
     "DriveCounter",
+    "DriveTimeWindow",
+    "RealtimeRollup",
+    "ParameterHistory",
 ]
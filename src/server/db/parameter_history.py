@@ -0,0 +1,406 @@
+################################################################################
+# File Name: parameter_history.py
+# Purpose/Description: Maintenance + read side of the parameter_history
+#                      running aggregate (count / sum / sum of squares of
+#                      drive_statistics.avg_value per device + parameter).
+# Author: Rex
+# Creation Date: 2026-10-16
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-16    | Rex          | Initial
+# 2026-10-17    | Rex          | Typed the table / upsert statements, the
+#               |              | device label and the mapper listeners.
+# ================================================================================
+################################################################################
+
+"""Running historical aggregate over ``drive_statistics.avg_value``.
+
+The history comparison and the anomaly envelope both want, per parameter,
+the mean and sample std of every *other* drive's ``avg_value``.  Instead of
+re-reading all those rows per parameter, ``parameter_history`` keeps
+``drive_count`` / ``avg_sum`` / ``avg_sum_sq`` per ``(device, parameter)``
+and :func:`loadHistoricalAvgStats` answers for all of a drive's parameters
+with one grouped query, subtracting the drive's own rows (leave-one-out).
+
+Keeping it current -- every ``drive_statistics`` write path is covered:
+
+* ORM unit-of-work writes (``session.add`` / ``session.delete`` / attribute
+  changes) queue their delta from mapper events registered here and the
+  flush applies it in one upsert.  The
+  package ``__init__`` imports this module, so any import of
+  :mod:`src.server.db.models` arms them.
+* Bulk statements fire no mapper events; their callers call
+  :func:`retractSummaryStatistics` before a bulk ``DELETE`` and
+  :func:`accumulateStatistics` after a bulk ``INSERT``.
+* ``ON DELETE CASCADE`` from ``drive_summary`` and manual SQL bypass both;
+  :func:`rebuildParameterHistory` (CLI
+  ``python -m src.server.cli.rebuild_parameter_history``) recomputes.
+
+Deltas are applied as atomic ``col = col + delta`` upserts, so concurrent
+writers never lose an update.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any, cast
+
+from sqlalchemy import (
+    ColumnElement,
+    Label,
+    Table,
+    case,
+    delete,
+    event,
+    func,
+    inspect,
+    literal,
+    select,
+)
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection, CursorResult
+from sqlalchemy.orm import Mapper, Session, object_session
+from sqlalchemy.sql import Executable
+from sqlalchemy.sql.base import ReadOnlyColumnCollection
+from sqlalchemy.sql.elements import KeyedColumnElement
+
+from src.server.db.models import DriveStatistic, DriveSummary, ParameterHistory
+
+__all__ = [
+    "HistoricalAvgStats",
+    "accumulateStatistics",
+    "loadHistoricalAvgStats",
+    "rebuildParameterHistory",
+    "retractSummaryStatistics",
+]
+
+# Sample variances below this fraction of mean^2 are floating-point residue
+# of sum-of-squares cancellation, not spread: report them as zero so a
+# constant history keeps the "no usable envelope" behaviour.
+RELATIVE_VARIANCE_FLOOR = 1e-10
+
+_Key = tuple[str, str]  # (device, parameter_name)
+
+
+@dataclass(frozen=True, slots=True)
+class HistoricalAvgStats:
+    """Historical distribution of one parameter's per-drive ``avg_value``."""
+
+    sample_count: int
+    mean: float
+    std_dev: float
+
+
+# ---- Read side --------------------------------------------------------------
+
+
+def loadHistoricalAvgStats(
+    session: Session, current: Sequence[DriveStatistic],
+) -> dict[str, HistoricalAvgStats]:
+    """History for each parameter of ``current``, excluding ``current`` itself.
+
+    Args:
+        session: Session bound to the server schema.
+        current: The drive's own ``drive_statistics`` rows.
+
+    Returns:
+        ``parameter_name -> HistoricalAvgStats`` for parameters with at least
+        one other drive.  ``std_dev`` is the sample std (0.0 below two
+        drives).
+    """
+    names = {row.parameter_name for row in current}
+    if not names:
+        return {}
+    totals = {
+        name: [int(count or 0), float(total or 0.0), float(totalSq or 0.0)]
+        for name, count, total, totalSq in session.execute(
+            select(
+                ParameterHistory.parameter_name,
+                func.sum(ParameterHistory.drive_count),
+                func.sum(ParameterHistory.avg_sum),
+                func.sum(ParameterHistory.avg_sum_sq),
+            )
+            .where(ParameterHistory.parameter_name.in_(names))
+            .group_by(ParameterHistory.parameter_name)
+        )
+    }
+
+    # Leave-one-out: the current drive's rows are part of the aggregate.
+    for row in current:
+        if row.avg_value is None or row.parameter_name not in totals:
+            continue
+        bucket = totals[row.parameter_name]
+        value = float(row.avg_value)
+        bucket[0] -= 1
+        bucket[1] -= value
+        bucket[2] -= value * value
+
+    history: dict[str, HistoricalAvgStats] = {}
+    for name, (count, total, totalSq) in totals.items():
+        if count < 1:
+            continue
+        mean = total / count
+        std = 0.0
+        if count >= 2:
+            variance = (totalSq - total * total / count) / (count - 1)
+            if variance > RELATIVE_VARIANCE_FLOOR * max(1.0, mean * mean):
+                std = math.sqrt(variance)
+        history[name] = HistoricalAvgStats(int(count), mean, std)
+    return history
+
+
+# ---- Bulk write hooks -------------------------------------------------------
+
+
+def retractSummaryStatistics(session: Session, summaryIds: Iterable[int]) -> None:
+    """Remove the rows of ``summaryIds`` from the aggregate (before bulk DELETE)."""
+    ids = list(summaryIds)
+    if not ids:
+        return
+    rows = session.execute(
+        select(_deviceExpr(), DriveStatistic.parameter_name, DriveStatistic.avg_value)
+        .select_from(DriveStatistic)
+        .outerjoin(DriveSummary, DriveSummary.id == DriveStatistic.summary_id)
+        .where(DriveStatistic.summary_id.in_(ids))
+        .where(DriveStatistic.avg_value.isnot(None))
+    ).all()
+    _applyDeltas(session.connection(), _deltas(rows, sign=-1))
+
+
+def accumulateStatistics(
+    session: Session, rows: Iterable[tuple[int, str, float | None]],
+) -> None:
+    """Add ``(summary_id, parameter_name, avg_value)`` rows (after bulk INSERT)."""
+    kept = [(sid, name, avg) for sid, name, avg in rows if avg is not None]
+    if not kept:
+        return
+    devices = _devicesFor(session.connection(), {sid for sid, _, _ in kept})
+    _applyDeltas(
+        session.connection(),
+        _deltas(((devices.get(sid, ""), name, avg) for sid, name, avg in kept), sign=1),
+    )
+
+
+def rebuildParameterHistory(session: Session) -> int:
+    """Recompute the whole aggregate from ``drive_statistics``; caller commits.
+
+    Returns:
+        ``(device, parameter)`` rows written.
+    """
+    session.execute(delete(ParameterHistory))
+    device = _deviceExpr()
+    grouped = (
+        select(
+            device,
+            DriveStatistic.parameter_name,
+            func.count(),
+            func.sum(DriveStatistic.avg_value),
+            func.sum(DriveStatistic.avg_value * DriveStatistic.avg_value),
+        )
+        .select_from(DriveStatistic)
+        .outerjoin(DriveSummary, DriveSummary.id == DriveStatistic.summary_id)
+        .where(DriveStatistic.avg_value.isnot(None))
+        .group_by(device, DriveStatistic.parameter_name)
+    )
+    result = cast(CursorResult[Any], session.execute(
+        _historyTable().insert().from_select(
+            ["source_device", "parameter_name", "drive_count", "avg_sum", "avg_sum_sq"],
+            grouped,
+        )
+    ))
+    return int(result.rowcount or 0)
+
+
+# ---- Internals --------------------------------------------------------------
+
+
+def _historyTable() -> Table:
+    return cast(Table, ParameterHistory.__table__)
+
+
+def _deviceExpr() -> Label[Any]:
+    """The history key's device: ``source_device``, else ``device_id``, else ''."""
+    return func.coalesce(
+        DriveSummary.source_device, DriveSummary.device_id, literal(""),
+    ).label("device")
+
+
+def _devicesFor(connection: Connection, summaryIds: set[int]) -> dict[int, str]:
+    rows = connection.execute(
+        select(DriveSummary.id, _deviceExpr()).where(DriveSummary.id.in_(summaryIds))
+    ).all()
+    return {int(summaryId): device for summaryId, device in rows}
+
+
+def _deltas(
+    rows: Iterable[tuple[str, str, float]], sign: int,
+) -> dict[_Key, list[float]]:
+    deltas: dict[_Key, list[float]] = {}
+    for device, name, avg in rows:
+        value = float(avg)
+        bucket = deltas.setdefault((device or "", name), [0, 0.0, 0.0])
+        bucket[0] += sign
+        bucket[1] += sign * value
+        bucket[2] += sign * value * value
+    return deltas
+
+
+def _applyDeltas(connection: Connection, deltas: dict[_Key, list[float]]) -> None:
+    """Atomic ``+=`` upsert of each ``(count, sum, sum_sq)`` delta.
+
+    Sums reset to exactly 0 when the count returns to 0, so residue from
+    add/remove cycles does not outlive the rows it came from.
+    """
+    if not deltas:
+        return
+    table = _historyTable()
+    values = [
+        {
+            "source_device": device,
+            "parameter_name": name,
+            "drive_count": int(count),
+            "avg_sum": total,
+            "avg_sum_sq": totalSq,
+        }
+        for (device, name), (count, total, totalSq) in deltas.items()
+    ]
+    dialectName = connection.dialect.name
+    stmt: Executable
+    if dialectName in {"mysql", "mariadb"}:
+        mysqlStmt = mysql_insert(table)
+        stmt = mysqlStmt.on_duplicate_key_update(
+            _deltaAssignments(table, mysqlStmt.inserted),
+        )
+    elif dialectName == "sqlite":
+        sqliteStmt = sqlite_insert(table)
+        stmt = sqliteStmt.on_conflict_do_update(
+            index_elements=["source_device", "parameter_name"],
+            set_=dict(_deltaAssignments(table, sqliteStmt.excluded)),
+        )
+    else:
+        raise ValueError(
+            f"Unsupported dialect for parameter_history: {dialectName!r}. "
+            "Expected mysql, mariadb, or sqlite.",
+        )
+    connection.execute(stmt, values)
+
+
+def _deltaAssignments(
+    table: Table,
+    incoming: ReadOnlyColumnCollection[str, KeyedColumnElement[Any]],
+) -> list[tuple[str, ColumnElement[Any]]]:
+    """``col += incoming.col`` assignments (``inserted`` / ``excluded`` row)."""
+    emptied = table.c.drive_count + incoming.drive_count <= 0
+    # Order matters on MySQL (assignments see earlier ones): the sums read
+    # the old drive_count, so it is assigned last.
+    return [
+        ("avg_sum", case((emptied, 0.0), else_=table.c.avg_sum + incoming.avg_sum)),
+        ("avg_sum_sq", case(
+            (emptied, 0.0), else_=table.c.avg_sum_sq + incoming.avg_sum_sq,
+        )),
+        ("drive_count", table.c.drive_count + incoming.drive_count),
+    ]
+
+
+# ---- ORM unit-of-work hooks -------------------------------------------------
+#
+# The unit of work does not order drive_statistics after drive_summary (no
+# relationship links them), so a row's summary may be inserted later in the
+# same flush.  Mapper events therefore only queue (summary_id, device,
+# parameter, avg, sign); the device of added rows is resolved, and the whole
+# flush applied as one upsert, in ``after_flush``.  Retracted rows resolve
+# their device up front (deletes in ``before_flush``, updates in
+# ``before_update``) while their summary is certainly still present.
+
+_PENDING_KEY = "parameter_history_pending"
+
+_Pending = tuple[int, "str | None", str, float, int]
+
+
+def _queue(
+    target: DriveStatistic, summaryId: Any, name: str, avg: Any, sign: int,
+    connection: Connection | None = None,
+) -> None:
+    session = object_session(target)
+    if session is None or avg is None or summaryId is None:
+        return
+    device = None
+    if connection is not None:
+        device = _devicesFor(connection, {summaryId}).get(summaryId, "")
+    session.info.setdefault(_PENDING_KEY, []).append(
+        (summaryId, device, name, float(avg), sign),
+    )
+
+
+@event.listens_for(DriveStatistic, "after_insert")
+def _afterInsert(
+    _mapper: Mapper[Any], _connection: Connection, target: DriveStatistic,
+) -> None:
+    _queue(target, target.summary_id, target.parameter_name, target.avg_value, 1)
+
+
+@event.listens_for(Session, "before_flush")
+def _beforeFlush(session: Session, _context: Any, _instances: Any) -> None:
+    # Deletes are queued before the flush: drive_summary may be deleted
+    # ahead of drive_statistics within it.
+    for target in session.deleted:
+        if isinstance(target, DriveStatistic):
+            _queue(
+                target, target.summary_id, target.parameter_name,
+                target.avg_value, -1, session.connection(),
+            )
+
+
+@event.listens_for(DriveStatistic, "before_update")
+def _beforeUpdate(
+    _mapper: Mapper[Any], connection: Connection, target: DriveStatistic,
+) -> None:
+    # Read the stored row: attribute history has no old value when the
+    # attribute was expired (e.g. after commit) before being assigned.
+    state = inspect(target)
+    if not any(
+        state.attrs[attr].history.has_changes()
+        for attr in ("summary_id", "parameter_name", "avg_value")
+    ):
+        return
+    if state.identity is None:  # before_update only fires for persistent rows
+        return
+    oldSummaryId, oldName = state.identity
+    oldAvg = connection.execute(
+        select(DriveStatistic.avg_value)
+        .where(DriveStatistic.summary_id == oldSummaryId)
+        .where(DriveStatistic.parameter_name == oldName)
+    ).scalar_one_or_none()
+    _queue(target, oldSummaryId, oldName, oldAvg, -1, connection)
+    _queue(target, target.summary_id, target.parameter_name, target.avg_value, 1)
+
+
+@event.listens_for(Session, "after_flush")
+def _afterFlush(session: Session, _context: Any) -> None:
+    pending: list[_Pending] = session.info.pop(_PENDING_KEY, [])
+    if not pending:
+        return
+    connection = session.connection()
+    unresolved = {sid for sid, device, *_ in pending if device is None}
+    devices = _devicesFor(connection, unresolved) if unresolved else {}
+    deltas: dict[_Key, list[float]] = {}
+    for summaryId, device, name, avg, sign in pending:
+        if device is None:
+            device = devices.get(summaryId, "")
+        for key, delta in _deltas([(device, name, avg)], sign).items():
+            bucket = deltas.setdefault(key, [0, 0.0, 0.0])
+            for i in range(3):
+                bucket[i] += delta[i]
+    _applyDeltas(connection, deltas)
+
+
+@event.listens_for(Session, "after_rollback")
+def _afterRollback(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,380 @@
+################################################################################
+# File Name: realtime_partitions.py
+# Purpose/Description: Monthly RANGE partition layout of the server
+#                      realtime_data table -- partition naming, DDL builders,
+#                      maintenance planning (pre-create future months, archive
+#                      or drop old ones) and the timestamp-bound helpers the
+#                      analytics queries use so MariaDB can prune partitions.
+# Author: Rex
+# Creation Date: 2026-10-17
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-17    | Rex          | Initial
+# ================================================================================
+################################################################################
+
+"""
+Monthly partitions of ``realtime_data`` (MariaDB).
+
+Layout (migration 0016, per specs/arch/phase2-data-architecture.md)::
+
+    PARTITION BY RANGE (TO_DAYS(timestamp)) (
+        PARTITION p2026_05 VALUES LESS THAN (TO_DAYS('2026-06-01')),
+        ...
+        PARTITION p_future VALUES LESS THAN MAXVALUE
+    )
+
+MariaDB requires the partition column in every unique key, so on the live
+table the primary key is ``(id, timestamp)`` and the sync natural key is
+``(source_device, source_id, timestamp)``.  A re-sent Pi row carries its
+original timestamp, so ``INSERT IGNORE`` still drops it.  The ORM keeps
+``id`` / ``(source_device, source_id)``, which SQLite enforces for tests.
+
+Maintenance (``python -m src.server.cli.manage_realtime_partitions``):
+
+* :func:`ensureFuturePartitions` splits ``p_future`` so the next
+  ``monthsAhead`` months each have their own partition before data lands.
+* :func:`archivePartitionsBefore` moves whole old months out with
+  ``EXCHANGE PARTITION`` into standalone ``realtime_data_archive_pYYYY_MM``
+  tables (metadata-only; no row copy), then drops the emptied partition.
+* :func:`dropPartitionsBefore` drops old months outright.
+
+Pruning: a query prunes only when its WHERE clause bounds ``timestamp``.
+Per-drive analytics filter on ``drive_id``; :func:`realtimeTimestampBounds`
+reads the drive's exact MIN/MAX timestamp from the ``(drive_id, timestamp)``
+family of indexes (one index dive per partition) and
+:func:`withinTimestampBounds` adds that range to the heavy follow-up
+queries, which then touch only the drive's own month(s).  The bounds are
+exact, so the added predicate never changes a result.
+
+Reads answered entirely from a covering index -- the per-parameter
+aggregate on ``(drive_id, parameter_name, value)`` -- stay unbounded: there
+an unpruned partition costs one empty index dive, and a timestamp range
+would steer the optimizer onto the non-covering ``(drive_id, timestamp)``
+index.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any
+
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import ColumnElement
+
+from src.server.db.models import RealtimeData
+
+__all__ = [
+    "ARCHIVE_TABLE_PREFIX",
+    "DEFAULT_MONTHS_AHEAD",
+    "EARLIEST_PARTITION_MONTH",
+    "FUTURE_PARTITION",
+    "PARTITION_EXPRESSION",
+    "PartitionInfo",
+    "RealtimePartitionError",
+    "TABLE_NAME",
+    "addMonths",
+    "archivePartitionsBefore",
+    "archiveTableName",
+    "buildArchiveStatements",
+    "buildDropDdl",
+    "buildPartitionByClause",
+    "buildSplitFutureDdl",
+    "dropPartitionsBefore",
+    "ensureFuturePartitions",
+    "expiredPartitions",
+    "listPartitions",
+    "missingFutureMonths",
+    "monthStart",
+    "partitionMonth",
+    "partitionName",
+    "realtimeTimestampBounds",
+    "withinTimestampBounds",
+]
+
+# ================================================================================
+# Constants
+# ================================================================================
+
+TABLE_NAME: str = "realtime_data"
+
+#: Catch-all partition for rows past the last monthly bound.
+FUTURE_PARTITION: str = "p_future"
+
+PARTITION_EXPRESSION: str = "TO_DAYS(timestamp)"
+
+#: First monthly partition the initial layout creates.  Older rows (Pi
+#: clock-reset timestamps) fall into it -- RANGE partitions have no lower
+#: bound -- instead of minting a partition per empty month since 1970.
+EARLIEST_PARTITION_MONTH: date = date(2026, 1, 1)
+
+#: Months of empty partitions kept ready past the current month.
+DEFAULT_MONTHS_AHEAD: int = 3
+
+ARCHIVE_TABLE_PREFIX: str = f"{TABLE_NAME}_archive_"
+
+_PARTITION_NAME = re.compile(r"^p(\d{4})_(\d{2})$")
+
+
+class RealtimePartitionError(RuntimeError):
+    """The live table is not in the expected partition layout."""
+
+
+@dataclass(frozen=True, slots=True)
+class PartitionInfo:
+    """One partition of the live table."""
+
+    name: str
+    month: date | None
+    """First day of the month it holds; ``None`` for ``p_future``."""
+    rows: int
+    """InnoDB row estimate (``information_schema.PARTITIONS.TABLE_ROWS``)."""
+
+
+# ================================================================================
+# Naming + month math
+# ================================================================================
+
+
+def monthStart(value: date | datetime) -> date:
+    """First day of ``value``'s month."""
+    return date(value.year, value.month, 1)
+
+
+def addMonths(month: date, count: int) -> date:
+    """``month`` (a first-of-month) shifted by ``count`` months."""
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partitionName(month: date) -> str:
+    """``p2026_05`` for May 2026."""
+    return f"p{month.year:04d}_{month.month:02d}"
+
+
+def partitionMonth(name: str) -> date | None:
+    """Inverse of :func:`partitionName`; ``None`` for any other name."""
+    match = _PARTITION_NAME.match(name)
+    if match is None:
+        return None
+    return date(int(match.group(1)), int(match.group(2)), 1)
+
+
+def archiveTableName(partition: str) -> str:
+    return f"{ARCHIVE_TABLE_PREFIX}{partition}"
+
+
+# ================================================================================
+# DDL builders
+# ================================================================================
+
+
+def _monthDefinition(month: date) -> str:
+    bound = addMonths(month, 1).isoformat()
+    return (
+        f"PARTITION {partitionName(month)} "
+        f"VALUES LESS THAN (TO_DAYS('{bound}'))"
+    )
+
+
+def _futureDefinition() -> str:
+    return f"PARTITION {FUTURE_PARTITION} VALUES LESS THAN MAXVALUE"
+
+
+def _monthRange(first: date, last: date) -> list[date]:
+    months = []
+    month = monthStart(first)
+    while month <= last:
+        months.append(month)
+        month = addMonths(month, 1)
+    return months
+
+
+def buildPartitionByClause(firstMonth: date, lastMonth: date) -> str:
+    """``PARTITION BY RANGE`` clause: one partition per month + ``p_future``."""
+    definitions = [_monthDefinition(m) for m in _monthRange(firstMonth, lastMonth)]
+    definitions.append(_futureDefinition())
+    return (
+        f"PARTITION BY RANGE ({PARTITION_EXPRESSION}) "
+        f"({', '.join(definitions)})"
+    )
+
+
+def buildSplitFutureDdl(months: list[date]) -> str:
+    """Carve ``months`` out of ``p_future`` (rows already there move with them)."""
+    definitions = [_monthDefinition(m) for m in months] + [_futureDefinition()]
+    return (
+        f"ALTER TABLE {TABLE_NAME} REORGANIZE PARTITION {FUTURE_PARTITION} "
+        f"INTO ({', '.join(definitions)});"
+    )
+
+
+def buildArchiveStatements(partition: str) -> list[str]:
+    """Move one partition's rows into its own table, then drop the partition.
+
+    ``CREATE TABLE ... LIKE`` copies the partitioning, which ``EXCHANGE
+    PARTITION`` does not accept on the target; it is removed while the
+    table is still empty.  A leftover archive table from an earlier run
+    fails the CREATE rather than being swapped back into the live table.
+    """
+    archive = archiveTableName(partition)
+    return [
+        f"CREATE TABLE {archive} LIKE {TABLE_NAME};",
+        f"ALTER TABLE {archive} REMOVE PARTITIONING;",
+        f"ALTER TABLE {TABLE_NAME} EXCHANGE PARTITION {partition} "
+        f"WITH TABLE {archive};",
+        f"ALTER TABLE {TABLE_NAME} DROP PARTITION {partition};",
+    ]
+
+
+def buildDropDdl(partitions: list[str]) -> str:
+    return f"ALTER TABLE {TABLE_NAME} DROP PARTITION {', '.join(partitions)};"
+
+
+# ================================================================================
+# Maintenance planning (pure)
+# ================================================================================
+
+
+def missingFutureMonths(
+    partitions: list[PartitionInfo], today: date, monthsAhead: int,
+) -> list[date]:
+    """Months after the last monthly partition up to ``today + monthsAhead``.
+
+    Starts at ``today``'s month when only ``p_future`` is left.
+
+    Raises:
+        RealtimePartitionError: If the table is not partitioned.
+    """
+    if not partitions:
+        raise RealtimePartitionError(
+            f"{TABLE_NAME} is not partitioned; apply migration 0016",
+        )
+    months = [p.month for p in partitions if p.month is not None]
+    first = addMonths(max(months), 1) if months else monthStart(today)
+    return _monthRange(first, addMonths(monthStart(today), monthsAhead))
+
+
+def expiredPartitions(
+    partitions: list[PartitionInfo], cutoff: date, today: date,
+) -> list[PartitionInfo]:
+    """Monthly partitions wholly before ``cutoff``'s month.
+
+    Raises:
+        ValueError: If ``cutoff`` is after the previous month -- the current
+            month is still being written.
+    """
+    cutoffMonth = monthStart(cutoff)
+    if cutoffMonth > addMonths(monthStart(today), -1):
+        raise ValueError(
+            f"cutoff {cutoffMonth.isoformat()} would remove the current month "
+            f"({monthStart(today).isoformat()}) or later",
+        )
+    return [p for p in partitions if p.month is not None and p.month < cutoffMonth]
+
+
+# ================================================================================
+# Live maintenance (MariaDB)
+# ================================================================================
+
+
+def _requireMariaDb(session: Session) -> None:
+    dialect = session.get_bind().dialect.name
+    if dialect not in {"mysql", "mariadb"}:
+        raise RealtimePartitionError(
+            f"{TABLE_NAME} partitioning is MariaDB-only (dialect {dialect!r})",
+        )
+
+
+def listPartitions(session: Session) -> list[PartitionInfo]:
+    """Partitions of the live table in bound order; ``[]`` if unpartitioned."""
+    _requireMariaDb(session)
+    rows = session.execute(text(
+        "SELECT PARTITION_NAME, TABLE_ROWS FROM information_schema.PARTITIONS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table "
+        "AND PARTITION_NAME IS NOT NULL ORDER BY PARTITION_ORDINAL_POSITION"
+    ), {"table": TABLE_NAME}).all()
+    return [
+        PartitionInfo(name=name, month=partitionMonth(name), rows=int(count or 0))
+        for name, count in rows
+    ]
+
+
+def ensureFuturePartitions(
+    session: Session, *, today: date, monthsAhead: int = DEFAULT_MONTHS_AHEAD,
+    dryRun: bool = False,
+) -> list[str]:
+    """Pre-create monthly partitions through ``today + monthsAhead``.
+
+    Returns:
+        Names of the partitions added (or that would be, with ``dryRun``).
+    """
+    months = missingFutureMonths(listPartitions(session), today, monthsAhead)
+    if months and not dryRun:
+        session.execute(text(buildSplitFutureDdl(months)))
+    return [partitionName(m) for m in months]
+
+
+def archivePartitionsBefore(
+    session: Session, cutoff: date, *, today: date, dryRun: bool = False,
+) -> list[str]:
+    """Move every month before ``cutoff`` into its archive table.
+
+    Returns:
+        Names of the archived partitions.
+    """
+    expired = expiredPartitions(listPartitions(session), cutoff, today)
+    if not dryRun:
+        for partition in expired:
+            for statement in buildArchiveStatements(partition.name):
+                session.execute(text(statement))
+    return [p.name for p in expired]
+
+
+def dropPartitionsBefore(
+    session: Session, cutoff: date, *, today: date, dryRun: bool = False,
+) -> list[str]:
+    """Drop every month before ``cutoff`` (its rows are deleted).
+
+    Returns:
+        Names of the dropped partitions.
+    """
+    names = [p.name for p in expiredPartitions(listPartitions(session), cutoff, today)]
+    if names and not dryRun:
+        session.execute(text(buildDropDdl(names)))
+    return names
+
+
+# ================================================================================
+# Query pruning
+# ================================================================================
+
+
+def realtimeTimestampBounds(
+    session: Session, *conditions: Any,
+) -> tuple[datetime, datetime] | None:
+    """Exact ``(MIN, MAX)`` timestamp of the rows matching ``conditions``.
+
+    Pass only indexed key conditions (``drive_id``, ``source_device``) so the
+    probe is answered from the ``(..., timestamp)`` indexes.  ``None`` when
+    nothing matches.
+    """
+    start, end = session.execute(
+        select(func.min(RealtimeData.timestamp), func.max(RealtimeData.timestamp))
+        .where(*conditions)
+    ).one()
+    if start is None or end is None:
+        return None
+    return start, end
+
+
+def withinTimestampBounds(bounds: tuple[datetime, datetime]) -> ColumnElement[bool]:
+    """``timestamp BETWEEN`` the bounds -- lets MariaDB prune partitions."""
+    return RealtimeData.timestamp.between(*bounds)
@@ -12,6 +12,9 @@
 # ================================================================================
 # 2026-04-16    | Ralph Agent  | Initial implementation for US-CMP-001 — lifespan
 #               |              | handler, logging setup, uvicorn entry point
+# 2026-10-17    | Rex          | Own the AI analysis job queue (create at
+#               |              | startup, cancel + release workers at shutdown)
+# 2026-10-17    | Rex          | Own the LLM response cache (app.state.llmCache)
 # ================================================================================
 ################################################################################
 
@@ -37,9 +40,12 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
+from src.server.ai.response_cache import createResponseCache
 from src.server.api.app import createApp
 from src.server.config import Settings
 from src.server.db.connection import createAsyncEngine
+from src.server.services.analysis import runAnalysis
+from src.server.services.analysis_jobs import AnalysisJobQueue
 
 logger = logging.getLogger(__name__)
 
@@ -56,9 +62,13 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         - Loads server settings from environment / .env
         - Stores settings on ``app.state`` for dependency injection
         - Configures logging
+        - Creates the AI analysis job queue (``app.state.analysisJobs``)
+        - Opens the LLM response cache (``app.state.llmCache``; None when
+          ``LLM_CACHE_PATH`` is empty)
 
     Shutdown:
-        - Logs shutdown message (DB/resource cleanup added in later stories)
+        - Cancels outstanding analysis jobs, closes the LLM response cache
+          and disposes the DB engine
     """
     settings = Settings()
     app.state.settings = settings
@@ -75,12 +85,28 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         logger.warning("Failed to create DB engine at startup: %s", exc)
         app.state.engine = None
 
+    app.state.analysisJobs = AnalysisJobQueue(
+        runAnalysis,
+        maxConcurrent=settings.ANALYSIS_MAX_CONCURRENT,
+        maxQueued=settings.ANALYSIS_MAX_QUEUED,
+        retainFinished=settings.ANALYSIS_JOB_RETENTION,
+    )
+    app.state.llmCache = createResponseCache(
+        settings.LLM_CACHE_PATH,
+        ttlSeconds=settings.LLM_CACHE_TTL_HOURS * 3600,
+        maxEntries=settings.LLM_CACHE_MAX_ENTRIES,
+    )
+
     logger.info("Server starting on port %d", settings.PORT)
     logger.info("Database: %s", settings.DATABASE_URL.split("@")[-1] if "@" in settings.DATABASE_URL else "(configured)")
     logger.info("Ollama: %s (model: %s)", settings.OLLAMA_BASE_URL, settings.OLLAMA_MODEL)
 
     yield
 
+    await app.state.analysisJobs.shutdown()
+    if app.state.llmCache is not None:
+        app.state.llmCache.close()
+
     engine = getattr(app.state, "engine", None)
     if engine is not None:
         await engine.dispose()
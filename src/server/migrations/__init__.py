@@ -45,6 +45,18 @@
 #               |              | (drive_summary + drive_statistics data_quality
 #               |              | VARCHAR(16)->VARCHAR(20); drill-revealed
 #               |              | DataError 1406 on 'attribution_anomaly').
+# 2026-10-16    | Rex          | Registered v0013 (drive_time_window table +
+#               |              | backfill for indexed overlap detection).
+# 2026-10-16    | Rex          | Registered v0014 (parameter_history table +
+#               |              | backfill for the historical comparison).
+# 2026-10-17    | Rex          | Registered v0015 (realtime_data composite
+#               |              | indexes for the analytics access paths).
+# 2026-10-17    | Rex          | Registered v0016 (realtime_data monthly RANGE
+#               |              | partitions on timestamp).
+# 2026-10-17    | Rex          | Registered v0017 (realtime_rollup table +
+#               |              | backfill for downsampled series reads).
+# 2026-10-17    | Rex          | Registered v0018 (drive_time_window range
+#               |              | indexes for single-drive overlap checks).
 # ================================================================================
 ################################################################################
 
@@ -110,6 +122,24 @@ from src.server.migrations.versions.v0011_us376_ecu_identity import (
 from src.server.migrations.versions.v0012_us377_data_quality_widen import (
     MIGRATION as _V0012,
 )
+from src.server.migrations.versions.v0013_drive_time_window import (
+    MIGRATION as _V0013,
+)
+from src.server.migrations.versions.v0014_parameter_history import (
+    MIGRATION as _V0014,
+)
+from src.server.migrations.versions.v0015_realtime_data_composite_indexes import (
+    MIGRATION as _V0015,
+)
+from src.server.migrations.versions.v0016_realtime_data_partitioning import (
+    MIGRATION as _V0016,
+)
+from src.server.migrations.versions.v0017_realtime_rollup import (
+    MIGRATION as _V0017,
+)
+from src.server.migrations.versions.v0018_drive_time_window_indexes import (
+    MIGRATION as _V0018,
+)
 
 # ================================================================================
 # Registry -- append new migrations to the end, in ascending version order
@@ -128,6 +158,12 @@ ALL_MIGRATIONS: tuple[Migration, ...] = (
     _V0010,
     _V0011,
     _V0012,
+    _V0013,
+    _V0014,
+    _V0015,
+    _V0016,
+    _V0017,
+    _V0018,
 )
 
 
@@ -0,0 +1,147 @@
+################################################################################
+# File Name: v0013_drive_time_window.py
+# Purpose/Description: Create the live MariaDB ``drive_time_window`` table (the
+#                      materialized per-drive MIN/MAX realtime_data window the
+#                      overlap detector reads) and backfill it from the
+#                      existing realtime_data rows in one INSERT ... SELECT.
+#                      Follows the v0008 CREATE-TABLE-IF-NOT-EXISTS pattern
+#                      with a post-condition probe.
+#
+# Author: Rex
+# Creation Date: 2026-10-16
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-16    | Rex          | Initial
+# ================================================================================
+################################################################################
+
+"""Migration 0013: drive_time_window table + backfill.
+
+Context
+-------
+:func:`src.server.analytics.overlap.detect_overlapping_drives` used to
+aggregate ``MIN/MAX(timestamp)`` over every ``realtime_data`` row on each
+call.  The sync ingest now maintains the per-``(source_device, drive_id)``
+window in :class:`src.server.db.models.DriveTimeWindow`; the detector
+reads it through an interval index.
+
+Backfill
+--------
+The table must cover historical drives before the detector trusts it: a
+new drive whose window is indexed while an older drive's is not would miss
+the overlap.  The backfill runs right after the CREATE in the same
+``apply()`` and uses ``INSERT IGNORE`` so rows the ingest wrote in between
+win.  ``python -m src.server.cli.rebuild_drive_time_window`` repeats it on
+demand.
+
+Idempotency contract
+--------------------
+1. ``serverTableExists('drive_time_window')`` short-circuits on a DB where
+   the table already exists (``create_all()`` fresh DB or a re-run).
+2. ``CREATE TABLE IF NOT EXISTS`` is belt-and-suspenders with the probe.
+3. The runner records this version after first success.
+
+Post-condition probe
+--------------------
+* ``serverTableExists('drive_time_window')`` MUST be True after the
+  CREATE; failure raises :class:`SchemaProbeError`.
+"""
+
+from __future__ import annotations
+
+from scripts.apply_server_migrations import (
+    MigrationError,
+    SchemaProbeError,
+    _runServerSql,
+    serverTableExists,
+)
+from src.server.migrations.runner import Migration, RunnerContext
+
+__all__ = [
+    'BACKFILL_DRIVE_TIME_WINDOW_SQL',
+    'CREATE_DRIVE_TIME_WINDOW_DDL',
+    'DESCRIPTION',
+    'MIGRATION',
+    'TABLE_NAME',
+    'VERSION',
+    'apply',
+]
+
+
+VERSION: str = '0013'
+DESCRIPTION: str = (
+    'drive_time_window -- create the materialized per-drive realtime_data '
+    'window table read by overlap detection and backfill it from raw rows'
+)
+
+TABLE_NAME: str = 'drive_time_window'
+
+
+# Mirrors the DriveTimeWindow ORM model; composite PK is the ingest upsert
+# key.
+CREATE_DRIVE_TIME_WINDOW_DDL: str = (
+    f'CREATE TABLE IF NOT EXISTS {TABLE_NAME} ('
+    '    source_device  VARCHAR(64) NOT NULL,'
+    '    drive_id       INT NOT NULL,'
+    '    min_ts         DATETIME NOT NULL,'
+    '    max_ts         DATETIME NOT NULL,'
+    '    row_count      BIGINT NOT NULL,'
+    '    PRIMARY KEY (source_device, drive_id)'
+    ') ENGINE=InnoDB DEFAULT CHARSET=utf8mb4'
+    '  COLLATE=utf8mb4_unicode_ci;'
+)
+
+BACKFILL_DRIVE_TIME_WINDOW_SQL: str = (
+    f'INSERT IGNORE INTO {TABLE_NAME} '
+    '(source_device, drive_id, min_ts, max_ts, row_count) '
+    'SELECT source_device, drive_id, MIN(timestamp), MAX(timestamp), COUNT(*) '
+    'FROM realtime_data '
+    'WHERE drive_id IS NOT NULL '
+    'GROUP BY source_device, drive_id;'
+)
+
+
+def apply(ctx: RunnerContext) -> None:
+    """Create ``drive_time_window`` and backfill it from ``realtime_data``.
+
+    Short-circuits when the table already exists.  The post-condition probe
+    raises :class:`SchemaProbeError` if the table is still missing after
+    the CREATE.
+    """
+    if serverTableExists(ctx.addrs, ctx.creds, TABLE_NAME, ctx.runner):
+        return
+
+    res = _runServerSql(
+        ctx.addrs, ctx.creds, CREATE_DRIVE_TIME_WINDOW_DDL, ctx.runner,
+    )
+    if res.returncode != 0:
+        raise MigrationError(
+            f'create {TABLE_NAME} failed: '
+            f'{res.stderr.strip() or res.stdout.strip()}',
+        )
+
+    if not serverTableExists(ctx.addrs, ctx.creds, TABLE_NAME, ctx.runner):
+        raise SchemaProbeError(
+            f'{TABLE_NAME} missing after CREATE TABLE ran; '
+            'investigate the MariaDB session context',
+        )
+
+    res = _runServerSql(
+        ctx.addrs, ctx.creds, BACKFILL_DRIVE_TIME_WINDOW_SQL, ctx.runner,
+    )
+    if res.returncode != 0:
+        raise MigrationError(
+            f'backfill {TABLE_NAME} failed: '
+            f'{res.stderr.strip() or res.stdout.strip()}',
+        )
+
+
+MIGRATION: Migration = Migration(
+    version=VERSION,
+    description=DESCRIPTION,
+    applyFn=apply,
+)
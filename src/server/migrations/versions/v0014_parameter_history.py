@@ -0,0 +1,146 @@
+################################################################################
+# File Name: v0014_parameter_history.py
+# Purpose/Description: Create the live MariaDB ``parameter_history`` table (the
+#                      per-device + parameter running count / sum / sum of
+#                      squares of drive_statistics.avg_value) and backfill it
+#                      from the existing drive_statistics rows in one
+#                      INSERT ... SELECT.  Follows the v0013 pattern.
+#
+# Author: Rex
+# Creation Date: 2026-10-16
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-16    | Rex          | Initial
+# ================================================================================
+################################################################################
+
+"""Migration 0014: parameter_history table + backfill.
+
+Context
+-------
+:func:`src.server.analytics.basic.compareDriveToHistory` and
+:func:`src.server.analytics.advanced.detectAnomalies` used to re-read every
+other drive's ``drive_statistics`` row once per parameter.  They now read
+the running aggregate in :class:`src.server.db.models.ParameterHistory`,
+kept current by :mod:`src.server.db.parameter_history`.
+
+Backfill
+--------
+The aggregate is only correct if it covers every existing row, so the
+backfill runs right after the CREATE in the same ``apply()``.  ``INSERT
+IGNORE`` leaves rows an analytics run wrote in between alone;
+``python -m src.server.cli.rebuild_parameter_history`` recomputes exactly.
+
+Idempotency contract
+--------------------
+1. ``serverTableExists('parameter_history')`` short-circuits on a DB where
+   the table already exists (``create_all()`` fresh DB or a re-run).
+2. ``CREATE TABLE IF NOT EXISTS`` is belt-and-suspenders with the probe.
+3. The runner records this version after first success.
+
+Post-condition probe
+--------------------
+* ``serverTableExists('parameter_history')`` MUST be True after the
+  CREATE; failure raises :class:`SchemaProbeError`.
+"""
+
+from __future__ import annotations
+
+from scripts.apply_server_migrations import (
+    MigrationError,
+    SchemaProbeError,
+    _runServerSql,
+    serverTableExists,
+)
+from src.server.migrations.runner import Migration, RunnerContext
+
+__all__ = [
+    'BACKFILL_PARAMETER_HISTORY_SQL',
+    'CREATE_PARAMETER_HISTORY_DDL',
+    'DESCRIPTION',
+    'MIGRATION',
+    'TABLE_NAME',
+    'VERSION',
+    'apply',
+]
+
+
+VERSION: str = '0014'
+DESCRIPTION: str = (
+    'parameter_history -- create the running per-parameter drive_statistics '
+    'avg_value aggregate read by the historical comparison and backfill it'
+)
+
+TABLE_NAME: str = 'parameter_history'
+
+
+# Mirrors the ParameterHistory ORM model; composite PK is the upsert key.
+CREATE_PARAMETER_HISTORY_DDL: str = (
+    f'CREATE TABLE IF NOT EXISTS {TABLE_NAME} ('
+    '    source_device   VARCHAR(64) NOT NULL,'
+    '    parameter_name  VARCHAR(64) NOT NULL,'
+    '    drive_count     BIGINT NOT NULL,'
+    '    avg_sum         DOUBLE NOT NULL,'
+    '    avg_sum_sq      DOUBLE NOT NULL,'
+    '    PRIMARY KEY (source_device, parameter_name)'
+    ') ENGINE=InnoDB DEFAULT CHARSET=utf8mb4'
+    '  COLLATE=utf8mb4_unicode_ci;'
+)
+
+# Device key matches parameter_history._deviceExpr().
+BACKFILL_PARAMETER_HISTORY_SQL: str = (
+    f'INSERT IGNORE INTO {TABLE_NAME} '
+    '(source_device, parameter_name, drive_count, avg_sum, avg_sum_sq) '
+    "SELECT COALESCE(ds.source_device, ds.device_id, ''), st.parameter_name, "
+    'COUNT(*), SUM(st.avg_value), SUM(st.avg_value * st.avg_value) '
+    'FROM drive_statistics st '
+    'LEFT JOIN drive_summary ds ON ds.id = st.summary_id '
+    'WHERE st.avg_value IS NOT NULL '
+    "GROUP BY COALESCE(ds.source_device, ds.device_id, ''), st.parameter_name;"
+)
+
+
+def apply(ctx: RunnerContext) -> None:
+    """Create ``parameter_history`` and backfill it from ``drive_statistics``.
+
+    Short-circuits when the table already exists.  The post-condition probe
+    raises :class:`SchemaProbeError` if the table is still missing after
+    the CREATE.
+    """
+    if serverTableExists(ctx.addrs, ctx.creds, TABLE_NAME, ctx.runner):
+        return
+
+    res = _runServerSql(
+        ctx.addrs, ctx.creds, CREATE_PARAMETER_HISTORY_DDL, ctx.runner,
+    )
+    if res.returncode != 0:
+        raise MigrationError(
+            f'create {TABLE_NAME} failed: '
+            f'{res.stderr.strip() or res.stdout.strip()}',
+        )
+
+    if not serverTableExists(ctx.addrs, ctx.creds, TABLE_NAME, ctx.runner):
+        raise SchemaProbeError(
+            f'{TABLE_NAME} missing after CREATE TABLE ran; '
+            'investigate the MariaDB session context',
+        )
+
+    res = _runServerSql(
+        ctx.addrs, ctx.creds, BACKFILL_PARAMETER_HISTORY_SQL, ctx.runner,
+    )
+    if res.returncode != 0:
+        raise MigrationError(
+            f'backfill {TABLE_NAME} failed: '
+            f'{res.stderr.strip() or res.stdout.strip()}',
+        )
+
+
+MIGRATION: Migration = Migration(
+    version=VERSION,
+    description=DESCRIPTION,
+    applyFn=apply,
+)
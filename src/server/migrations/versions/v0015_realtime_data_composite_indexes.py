@@ -0,0 +1,140 @@
+################################################################################
+# File Name: v0015_realtime_data_composite_indexes.py
+# Purpose/Description: Add the composite realtime_data indexes behind the
+#                      per-drive and per-device analytics queries to the live
+#                      MariaDB.  Missing indexes are added in ONE online ALTER
+#                      so the table is rebuilt at most once.  Follows the
+#                      v0010 INFORMATION_SCHEMA-probe pattern.
+#
+# Author: Rex
+# Creation Date: 2026-10-17
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-17    | Rex          | Initial
+# ================================================================================
+################################################################################
+
+"""Migration 0015: composite indexes on realtime_data.
+
+Context
+-------
+``realtime_data`` only carried the ``(source_device, source_id)`` unique key
+and the single-column ``IX_realtime_data_drive_id``.  The analytics read it
+by drive and by device:
+
+* ``idx_realtime_data_drive_ts`` ``(drive_id, timestamp)`` -- per-drive
+  MIN/MAX(timestamp) (drive_summary, overlap), the ordered timestamp walk in
+  ``_logTimestampGaps`` and the batch engine's ``drive_id IN (...) ORDER BY
+  drive_id, timestamp`` stream.
+* ``idx_realtime_data_drive_param`` ``(drive_id, parameter_name, value)`` --
+  covers the per-drive per-parameter aggregate in drive_statistics_compute
+  without a row lookup.
+* ``idx_realtime_data_device_drive_ts`` ``(source_device, drive_id,
+  timestamp)`` -- ``_computeDriveAnalytics`` and ``_collectReadings`` filter
+  on ``(source_device, drive_id)``; also the drive_time_window backfill
+  grouping.
+* ``idx_realtime_data_device_ts`` ``(source_device, timestamp)`` -- the
+  legacy pre-US-200 ``(source_device, timestamp range)`` fallback.
+
+``IX_realtime_data_drive_id`` stays: the legacy planner in
+``scripts/apply_server_migrations.py`` re-adds it when absent.
+
+Idempotency contract
+--------------------
+1. ``indexExists`` is probed per index; only the missing ones go into the
+   ALTER, and no ALTER runs when all four exist (``create_all()`` fresh DB
+   or a re-run).
+2. ``ALGORITHM=INPLACE, LOCK=NONE`` keeps ingest writing while the
+   indexes build.
+3. The runner records this version after first success.
+
+Post-condition probe
+--------------------
+* Every index in :data:`INDEXES` MUST exist after the ALTER; a missing one
+  raises :class:`SchemaProbeError`.
+"""
+
+from __future__ import annotations
+
+from scripts.apply_server_migrations import (
+    MigrationError,
+    SchemaProbeError,
+    _runServerSql,
+    indexExists,
+)
+from src.server.migrations.runner import Migration, RunnerContext
+
+__all__ = [
+    'DESCRIPTION',
+    'INDEXES',
+    'MIGRATION',
+    'TABLE_NAME',
+    'VERSION',
+    'apply',
+    'buildAddIndexesDdl',
+]
+
+
+VERSION: str = '0015'
+DESCRIPTION: str = (
+    'realtime_data -- add composite (drive_id, timestamp), (drive_id, '
+    'parameter_name, value), (source_device, drive_id, timestamp) and '
+    '(source_device, timestamp) indexes for the analytics access paths'
+)
+
+TABLE_NAME: str = 'realtime_data'
+
+# Index name -> column list.  Mirrors RealtimeData.__table_args__.
+INDEXES: dict[str, tuple[str, ...]] = {
+    'idx_realtime_data_drive_ts': ('drive_id', 'timestamp'),
+    'idx_realtime_data_drive_param': ('drive_id', 'parameter_name', 'value'),
+    'idx_realtime_data_device_drive_ts': ('source_device', 'drive_id', 'timestamp'),
+    'idx_realtime_data_device_ts': ('source_device', 'timestamp'),
+}
+
+
+def buildAddIndexesDdl(indexNames: list[str]) -> str:
+    """One online ``ALTER TABLE`` adding every index in ``indexNames``."""
+    clauses = ', '.join(
+        f'ADD INDEX {name} ({", ".join(INDEXES[name])})' for name in indexNames
+    )
+    return f'ALTER TABLE {TABLE_NAME} {clauses}, ALGORITHM=INPLACE, LOCK=NONE;'
+
+
+def apply(ctx: RunnerContext) -> None:
+    """Add the missing composite indexes to ``realtime_data``.
+
+    No-op when every index already exists.  The post-condition probe raises
+    :class:`SchemaProbeError` if an index is still missing after the ALTER.
+    """
+    missing = [
+        name for name in INDEXES
+        if not indexExists(ctx.addrs, ctx.creds, TABLE_NAME, name, ctx.runner)
+    ]
+    if not missing:
+        return
+
+    res = _runServerSql(ctx.addrs, ctx.creds, buildAddIndexesDdl(missing), ctx.runner)
+    if res.returncode != 0:
+        raise MigrationError(
+            f'add {TABLE_NAME} indexes {", ".join(missing)} failed: '
+            f'{res.stderr.strip() or res.stdout.strip()}',
+        )
+
+    for name in missing:
+        if not indexExists(ctx.addrs, ctx.creds, TABLE_NAME, name, ctx.runner):
+            raise SchemaProbeError(
+                f'{TABLE_NAME}.{name} missing after ALTER TABLE ran; '
+                'investigate the MariaDB session context',
+            )
+
+
+MIGRATION: Migration = Migration(
+    version=VERSION,
+    description=DESCRIPTION,
+    applyFn=apply,
+)
@@ -0,0 +1,190 @@
+################################################################################
+# File Name: v0016_realtime_data_partitioning.py
+# Purpose/Description: Convert the live MariaDB realtime_data table to monthly
+#                      RANGE partitions on TO_DAYS(timestamp).  Widens the
+#                      primary key to (id, timestamp) and the sync natural key
+#                      to (source_device, source_id, timestamp) -- MariaDB
+#                      requires the partition column in every unique key --
+#                      in the same ALTER, so the table is rebuilt once.
+#
+# Author: Rex
+# Creation Date: 2026-10-17
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-17    | Rex          | Initial
+# ================================================================================
+################################################################################
+
+"""Migration 0016: monthly RANGE partitions on realtime_data.
+
+Context
+-------
+``realtime_data`` is one ever-growing table that every analytics, overlap
+and report query reads.  Monthly partitions keep the recent months a drive
+query touches small (the analytics bound per-drive reads by timestamp so
+MariaDB prunes -- see :mod:`src.server.db.realtime_partitions`) and let
+old months be archived or dropped as a unit with
+``python -m src.server.cli.manage_realtime_partitions``.
+
+Layout
+------
+One partition per month from the month of ``MIN(timestamp)`` (not earlier
+than :data:`EARLIEST_PARTITION_MONTH`) through the current month plus
+:data:`DEFAULT_MONTHS_AHEAD`, then ``p_future VALUES LESS THAN MAXVALUE``.
+
+Keys
+----
+* ``PRIMARY KEY (id)`` -> ``(id, timestamp)``; ``id`` stays AUTO_INCREMENT.
+* Every existing non-primary UNIQUE key (the unnamed
+  ``(source_device, source_id)`` natural key) is replaced by
+  ``uq_realtime_data_source_ts (source_device, source_id, timestamp)``.
+  A re-sent Pi row has its original timestamp, so the sync ``INSERT
+  IGNORE`` still drops it.
+
+The ALTER copies the table and blocks writes while it runs; schedule the
+deploy outside a sync window on a large table.
+
+Idempotency contract
+--------------------
+1. A partition probe on ``information_schema.PARTITIONS`` short-circuits
+   once the table is partitioned (a re-run, or a DB already converted).
+2. The runner records this version after first success.
+
+Post-condition probe
+--------------------
+* ``realtime_data`` MUST report partitions after the ALTER; otherwise
+  :class:`SchemaProbeError`.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+
+from scripts.apply_server_migrations import (
+    MigrationError,
+    SchemaProbeError,
+    _runServerSql,
+)
+from src.server.db.realtime_partitions import (
+    DEFAULT_MONTHS_AHEAD,
+    EARLIEST_PARTITION_MONTH,
+    TABLE_NAME,
+    addMonths,
+    buildPartitionByClause,
+    monthStart,
+)
+from src.server.migrations.runner import Migration, RunnerContext
+
+__all__ = [
+    'DESCRIPTION',
+    'MIGRATION',
+    'NATURAL_KEY_NAME',
+    'TABLE_NAME',
+    'VERSION',
+    'apply',
+    'buildPartitionDdl',
+]
+
+
+VERSION: str = '0016'
+DESCRIPTION: str = (
+    'realtime_data -- monthly RANGE partitions on TO_DAYS(timestamp); '
+    'primary key (id, timestamp), natural key (source_device, source_id, '
+    'timestamp)'
+)
+
+NATURAL_KEY_NAME: str = 'uq_realtime_data_source_ts'
+
+
+def buildPartitionDdl(
+    uniqueKeys: list[str], firstMonth: date, lastMonth: date,
+) -> str:
+    """The single ALTER: re-key, then partition ``firstMonth..lastMonth``."""
+    clauses = ['DROP PRIMARY KEY', 'ADD PRIMARY KEY (id, timestamp)']
+    clauses += [f'DROP INDEX `{name}`' for name in uniqueKeys]
+    clauses.append(
+        f'ADD UNIQUE KEY {NATURAL_KEY_NAME} '
+        '(source_device, source_id, timestamp)',
+    )
+    return (
+        f'ALTER TABLE {TABLE_NAME} {", ".join(clauses)} '
+        f'{buildPartitionByClause(firstMonth, lastMonth)};'
+    )
+
+
+def _query(ctx: RunnerContext, sql: str, what: str) -> list[str]:
+    res = _runServerSql(ctx.addrs, ctx.creds, sql, ctx.runner)
+    if res.returncode != 0:
+        raise SchemaProbeError(
+            f'{what} probe failed: {res.stderr.strip() or res.stdout.strip()}',
+        )
+    return [line.strip() for line in res.stdout.splitlines() if line.strip()]
+
+
+def _isPartitioned(ctx: RunnerContext) -> bool:
+    lines = _query(ctx, (
+        'SELECT COUNT(*) FROM information_schema.PARTITIONS '
+        f"WHERE TABLE_SCHEMA='{ctx.creds.dbName}' "
+        f"AND TABLE_NAME='{TABLE_NAME}' AND PARTITION_NAME IS NOT NULL;"
+    ), f'{TABLE_NAME} partition')
+    try:
+        return int(lines[0]) > 0
+    except (ValueError, IndexError):
+        return False
+
+
+def _uniqueKeys(ctx: RunnerContext) -> list[str]:
+    return _query(ctx, (
+        'SELECT DISTINCT INDEX_NAME FROM information_schema.STATISTICS '
+        f"WHERE TABLE_SCHEMA='{ctx.creds.dbName}' "
+        f"AND TABLE_NAME='{TABLE_NAME}' "
+        "AND NON_UNIQUE=0 AND INDEX_NAME<>'PRIMARY';"
+    ), f'{TABLE_NAME} unique key')
+
+
+def _firstMonth(ctx: RunnerContext) -> date:
+    lines = _query(
+        ctx, f'SELECT MIN(timestamp) FROM {TABLE_NAME};', f'{TABLE_NAME} MIN(timestamp)',
+    )
+    if not lines or lines[0] == 'NULL':
+        return EARLIEST_PARTITION_MONTH
+    oldest = monthStart(datetime.fromisoformat(lines[0]))
+    return max(oldest, EARLIEST_PARTITION_MONTH)
+
+
+def apply(ctx: RunnerContext, *, today: date | None = None) -> None:
+    """Partition ``realtime_data`` by month.
+
+    Short-circuits when the table is already partitioned.  The
+    post-condition probe raises :class:`SchemaProbeError` if it is still
+    unpartitioned after the ALTER.
+    """
+    if _isPartitioned(ctx):
+        return
+
+    today = today or date.today()
+    lastMonth = addMonths(monthStart(today), DEFAULT_MONTHS_AHEAD)
+    ddl = buildPartitionDdl(_uniqueKeys(ctx), _firstMonth(ctx), lastMonth)
+    res = _runServerSql(ctx.addrs, ctx.creds, ddl, ctx.runner)
+    if res.returncode != 0:
+        raise MigrationError(
+            f'partition {TABLE_NAME} failed: '
+            f'{res.stderr.strip() or res.stdout.strip()}',
+        )
+
+    if not _isPartitioned(ctx):
+        raise SchemaProbeError(
+            f'{TABLE_NAME} still unpartitioned after ALTER TABLE ran; '
+            'investigate the MariaDB session context',
+        )
+
+
+MIGRATION: Migration = Migration(
+    version=VERSION,
+    description=DESCRIPTION,
+    applyFn=apply,
+)
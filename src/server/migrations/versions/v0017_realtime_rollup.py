@@ -0,0 +1,160 @@
+################################################################################
+# File Name: v0017_realtime_rollup.py
+# Purpose/Description: Create the live MariaDB ``realtime_rollup`` table (10s /
+#                      1min per-parameter min/max/sum/count buckets of
+#                      real realtime_data rows) and backfill every resolution
+#                      from the existing rows with INSERT ... SELECT.  Follows
+#                      the v0013 CREATE-TABLE-IF-NOT-EXISTS + backfill pattern.
+#
+# Author: Rex
+# Creation Date: 2026-10-17
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-17    | Rex          | Initial
+# 2026-10-17    | Rex          | Backfills the 10s / 1min tiers only.
+# ================================================================================
+################################################################################
+
+"""Migration 0017: realtime_rollup table + backfill.
+
+Context
+-------
+Long-range series reads (reports, AI context) only need coarse
+resolution, yet the only source was full-resolution ``realtime_data``.
+The sync ingest now maintains downsampled buckets in
+:class:`src.server.db.models.RealtimeRollup`;
+:func:`src.server.analytics.realtime_rollup.loadRollupSeries` reads them.
+
+Backfill
+--------
+One ``INSERT IGNORE ... SELECT`` per resolution, right after the CREATE,
+so history is covered before the first read.  ``INSERT IGNORE`` lets
+buckets the ingest wrote in between win.  Each statement is one grouped
+pass over ``realtime_data``; on a large table run the deploy outside a sync
+window.  ``python -m src.server.cli.rebuild_realtime_rollup`` repeats it on
+demand.
+
+Idempotency contract
+--------------------
+1. ``serverTableExists('realtime_rollup')`` short-circuits on a DB where
+   the table already exists (``create_all()`` fresh DB or a re-run).
+2. ``CREATE TABLE IF NOT EXISTS`` is belt-and-suspenders with the probe.
+3. The runner records this version after first success.
+
+Post-condition probe
+--------------------
+* ``serverTableExists('realtime_rollup')`` MUST be True after the CREATE;
+  failure raises :class:`SchemaProbeError`.
+"""
+
+from __future__ import annotations
+
+from scripts.apply_server_migrations import (
+    MigrationError,
+    SchemaProbeError,
+    _runServerSql,
+    serverTableExists,
+)
+from src.server.analytics.realtime_rollup import ROLLUP_RESOLUTIONS
+from src.server.migrations.runner import Migration, RunnerContext
+
+__all__ = [
+    'CREATE_REALTIME_ROLLUP_DDL',
+    'DESCRIPTION',
+    'MIGRATION',
+    'TABLE_NAME',
+    'VERSION',
+    'apply',
+    'buildBackfillSql',
+]
+
+
+VERSION: str = '0017'
+DESCRIPTION: str = (
+    'realtime_rollup -- create the 10s / 1min per-parameter rollup '
+    'table maintained by sync ingest and backfill it from realtime_data'
+)
+
+TABLE_NAME: str = 'realtime_rollup'
+
+
+# Mirrors the RealtimeRollup ORM model; composite PK is the ingest upsert
+# key.
+CREATE_REALTIME_ROLLUP_DDL: str = (
+    f'CREATE TABLE IF NOT EXISTS {TABLE_NAME} ('
+    '    source_device       VARCHAR(64) NOT NULL,'
+    '    resolution_seconds  INT NOT NULL,'
+    '    parameter_name      VARCHAR(128) NOT NULL,'
+    '    bucket_start        DATETIME NOT NULL,'
+    '    sample_count        BIGINT NOT NULL,'
+    '    min_value           DOUBLE NOT NULL,'
+    '    max_value           DOUBLE NOT NULL,'
+    '    value_sum           DOUBLE NOT NULL,'
+    '    PRIMARY KEY (source_device, resolution_seconds, parameter_name,'
+    '                 bucket_start),'
+    '    INDEX idx_realtime_rollup_device_bucket (source_device, bucket_start)'
+    ') ENGINE=InnoDB DEFAULT CHARSET=utf8mb4'
+    '  COLLATE=utf8mb4_unicode_ci;'
+)
+
+
+def buildBackfillSql(resolution: int) -> str:
+    """Grouped backfill of one resolution (wall-clock aligned; divides 60)."""
+    bucket = f'timestamp - INTERVAL (SECOND(timestamp) MOD {resolution}) SECOND'
+    return (
+        f'INSERT IGNORE INTO {TABLE_NAME} '
+        '(source_device, resolution_seconds, parameter_name, bucket_start, '
+        'sample_count, min_value, max_value, value_sum) '
+        f'SELECT source_device, {resolution}, parameter_name, {bucket}, '
+        'COUNT(*), MIN(value), MAX(value), SUM(value) '
+        'FROM realtime_data '
+        "WHERE data_source = 'real' OR data_source IS NULL "
+        f'GROUP BY source_device, parameter_name, {bucket};'
+    )
+
+
+def apply(ctx: RunnerContext) -> None:
+    """Create ``realtime_rollup`` and backfill it from ``realtime_data``.
+
+    Short-circuits when the table already exists.  The post-condition probe
+    raises :class:`SchemaProbeError` if the table is still missing after
+    the CREATE.
+    """
+    if serverTableExists(ctx.addrs, ctx.creds, TABLE_NAME, ctx.runner):
+        return
+
+    res = _runServerSql(
+        ctx.addrs, ctx.creds, CREATE_REALTIME_ROLLUP_DDL, ctx.runner,
+    )
+    if res.returncode != 0:
+        raise MigrationError(
+            f'create {TABLE_NAME} failed: '
+            f'{res.stderr.strip() or res.stdout.strip()}',
+        )
+
+    if not serverTableExists(ctx.addrs, ctx.creds, TABLE_NAME, ctx.runner):
+        raise SchemaProbeError(
+            f'{TABLE_NAME} missing after CREATE TABLE ran; '
+            'investigate the MariaDB session context',
+        )
+
+    for resolution in ROLLUP_RESOLUTIONS:
+        res = _runServerSql(
+            ctx.addrs, ctx.creds, buildBackfillSql(resolution), ctx.runner,
+        )
+        if res.returncode != 0:
+            raise MigrationError(
+                f'backfill {TABLE_NAME} ({resolution}s) failed: '
+                f'{res.stderr.strip() or res.stdout.strip()}',
+            )
+
+
+MIGRATION: Migration = Migration(
+    version=VERSION,
+    description=DESCRIPTION,
+    applyFn=apply,
+)
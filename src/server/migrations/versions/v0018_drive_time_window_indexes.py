@@ -0,0 +1,128 @@
+################################################################################
+# File Name: v0018_drive_time_window_indexes.py
+# Purpose/Description: Add the drive_id and (max_ts, min_ts) indexes to the
+#                      live MariaDB drive_time_window table so a single-drive
+#                      overlap check is an index range probe.  Follows the
+#                      v0015 INFORMATION_SCHEMA-probe pattern.
+#
+# Author: Rex
+# Creation Date: 2026-10-17
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-17    | Rex          | Initial
+# ================================================================================
+################################################################################
+
+"""Migration 0018: drive_time_window range indexes.
+
+Context
+-------
+v0013 created ``drive_time_window`` with only its ``(source_device,
+drive_id)`` primary key, so
+:func:`src.server.analytics.overlap.detect_overlapping_drives` loaded the
+whole table into an interval tree on every call.  It now answers a single
+drive with two indexed queries:
+
+* ``idx_drive_time_window_drive`` ``(drive_id)`` -- the target drive's
+  window (the primary key leads with ``source_device``).
+* ``idx_drive_time_window_span`` ``(max_ts, min_ts)`` -- the candidates,
+  ``max_ts >= :start AND min_ts < :end``.  ``max_ts`` leads because checks
+  run for freshly ingested drives, and only a handful of drives end after
+  one of those starts; ``min_ts`` is then filtered from the index.
+
+Idempotency contract
+--------------------
+1. ``indexExists`` is probed per index; only the missing ones go into the
+   ALTER, and no ALTER runs when both exist (``create_all()`` fresh DB or a
+   re-run).
+2. ``ALGORITHM=INPLACE, LOCK=NONE`` keeps ingest writing while the
+   indexes build.
+3. The runner records this version after first success.
+
+Post-condition probe
+--------------------
+* Every index in :data:`INDEXES` MUST exist after the ALTER; a missing one
+  raises :class:`SchemaProbeError`.
+"""
+
+from __future__ import annotations
+
+from scripts.apply_server_migrations import (
+    MigrationError,
+    SchemaProbeError,
+    _runServerSql,
+    indexExists,
+)
+from src.server.migrations.runner import Migration, RunnerContext
+
+__all__ = [
+    'DESCRIPTION',
+    'INDEXES',
+    'MIGRATION',
+    'TABLE_NAME',
+    'VERSION',
+    'apply',
+    'buildAddIndexesDdl',
+]
+
+
+VERSION: str = '0018'
+DESCRIPTION: str = (
+    'drive_time_window -- add (drive_id) and (max_ts, min_ts) indexes for '
+    'single-drive overlap range queries'
+)
+
+TABLE_NAME: str = 'drive_time_window'
+
+# Index name -> column list.  Mirrors DriveTimeWindow.__table_args__.
+INDEXES: dict[str, tuple[str, ...]] = {
+    'idx_drive_time_window_drive': ('drive_id',),
+    'idx_drive_time_window_span': ('max_ts', 'min_ts'),
+}
+
+
+def buildAddIndexesDdl(indexNames: list[str]) -> str:
+    """One online ``ALTER TABLE`` adding every index in ``indexNames``."""
+    clauses = ', '.join(
+        f'ADD INDEX {name} ({", ".join(INDEXES[name])})' for name in indexNames
+    )
+    return f'ALTER TABLE {TABLE_NAME} {clauses}, ALGORITHM=INPLACE, LOCK=NONE;'
+
+
+def apply(ctx: RunnerContext) -> None:
+    """Add the missing range indexes to ``drive_time_window``.
+
+    No-op when every index already exists.  The post-condition probe raises
+    :class:`SchemaProbeError` if an index is still missing after the ALTER.
+    """
+    missing = [
+        name for name in INDEXES
+        if not indexExists(ctx.addrs, ctx.creds, TABLE_NAME, name, ctx.runner)
+    ]
+    if not missing:
+        return
+
+    res = _runServerSql(ctx.addrs, ctx.creds, buildAddIndexesDdl(missing), ctx.runner)
+    if res.returncode != 0:
+        raise MigrationError(
+            f'add {TABLE_NAME} indexes {", ".join(missing)} failed: '
+            f'{res.stderr.strip() or res.stdout.strip()}',
+        )
+
+    for name in missing:
+        if not indexExists(ctx.addrs, ctx.creds, TABLE_NAME, name, ctx.runner):
+            raise SchemaProbeError(
+                f'{TABLE_NAME}.{name} missing after ALTER TABLE ran; '
+                'investigate the MariaDB session context',
+            )
+
+
+MIGRATION: Migration = Migration(
+    version=VERSION,
+    description=DESCRIPTION,
+    applyFn=apply,
+)
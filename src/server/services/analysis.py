@@ -73,6 +73,15 @@
 #               |              | Step 1b) retires the parallel drive_statistics
 #               |              | trigger + writer + Pi table; B-076 (V0.28+ schema
 #               |              | normalization) cleans up residual helpers.
+# 2026-10-17    | Rex          | _computeDriveAnalytics: COUNT/MIN/MAX in one
+#               |              | query; follow-up reads bounded by that range
+#               |              | (realtime_data partition pruning).
+# 2026-10-17    | Rex          | runAnalysis: the blocking Ollama call runs on
+#               |              | an executor thread (the analysis job queue's
+#               |              | pool) instead of the event loop.
+# 2026-10-17    | Rex          | runAnalysis: optional LLM response cache in
+#               |              | front of _invokeOllama (responseCache /
+#               |              | bypassCache); outcome in result_summary.
 # ================================================================================
 ################################################################################
 
@@ -102,6 +111,11 @@ High-level flow (server spec §3.1 + sprint US-CMP-005 acceptance):
    rendered user message archived in ``result_summary`` (for Spool's review
    ritual — see prompts/DESIGN_NOTE.md §"Suggested review ritual").
 
+When a :class:`src.server.ai.response_cache.LlmResponseCache` is passed, step
+6 is served from it if the same model already answered the same system +
+user message; ``result_summary.llm_cache`` records ``hit`` / ``miss`` /
+``bypass``.
+
 Failure modes:
 
 * Ollama connection/timeout → raises :class:`OllamaUnreachable` (API → 503);
@@ -115,6 +129,7 @@ Failure modes:
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import logging
 import re
@@ -122,6 +137,7 @@ import time
 import urllib.error
 import urllib.request
 import uuid
+from concurrent.futures import Executor
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
@@ -138,6 +154,7 @@ from src.server.ai.analyzer_ollama import (
     callOllamaChat,
 )
 from src.server.ai.exceptions import AiAnalyzerGenerationError
+from src.server.ai.response_cache import LlmResponseCache, buildCacheKey
 from src.server.analytics.advanced import (
     computeCorrelations,
     computeTrends,
@@ -152,6 +169,7 @@ from src.server.db.models import (
     DriveSummary,
     RealtimeData,
 )
+from src.server.db.realtime_partitions import withinTimestampBounds
 
 logger = logging.getLogger(__name__)
 
@@ -522,6 +540,9 @@ async def runAnalysis(
     ollamaModel: str,
     ollamaTimeoutSeconds: int = 120,
     parameters: dict[str, Any] | None = None,
+    executor: Executor | None = None,
+    responseCache: LlmResponseCache | None = None,
+    bypassCache: bool = False,
 ) -> AnalysisResult:
     """
     Orchestrate a real AI analysis for ``driveId``.
@@ -534,6 +555,13 @@ async def runAnalysis(
         ollamaTimeoutSeconds: HTTP timeout for the chat call.
         parameters: Request-level parameters (focus areas, free-form) — stored
             with the history row for audit. Optional.
+        executor: Where the blocking Ollama HTTP call runs (the analysis
+            job queue's worker pool); ``None`` uses the loop's default
+            executor.  Never the event loop itself.
+        responseCache: Replays the stored reply when this model already
+            answered the identical rendered prompt.  Optional.
+        bypassCache: Skip the cache lookup and regenerate (the fresh reply
+            still replaces the cached one).
 
     Returns:
         An :class:`AnalysisResult` envelope. Empty ``recommendations`` is a
@@ -590,14 +618,35 @@ async def runAnalysis(
     systemMessage = _loadSystemMessage()
     userMessage = _renderUserMessage(analyticsContext)
 
+    generate = functools.partial(
+        _invokeOllama,
+        baseUrl=ollamaBaseUrl,
+        model=ollamaModel,
+        systemMessage=systemMessage,
+        userMessage=userMessage,
+        timeoutSeconds=ollamaTimeoutSeconds,
+    )
+    cacheOutcome: str | None = None
     try:
-        rawResponse = _invokeOllama(
-            baseUrl=ollamaBaseUrl,
-            model=ollamaModel,
-            systemMessage=systemMessage,
-            userMessage=userMessage,
-            timeoutSeconds=ollamaTimeoutSeconds,
-        )
+        if responseCache is None:
+            rawResponse = await asyncio.get_running_loop().run_in_executor(
+                executor, generate,
+            )
+        else:
+            cacheKey = buildCacheKey(
+                ollamaModel, systemMessage, userMessage, {"endpoint": "chat"},
+            )
+            rawResponse, hit = await asyncio.get_running_loop().run_in_executor(
+                executor,
+                functools.partial(
+                    responseCache.getOrCompute,
+                    cacheKey,
+                    ollamaModel,
+                    generate,
+                    bypass=bypassCache,
+                ),
+            )
+            cacheOutcome = "hit" if hit else ("bypass" if bypassCache else "miss")
     except (OllamaUnreachable, OllamaHttpFailure) as exc:
         await _markHistoryFailed(
             factory, historyId, str(exc), datetime.now(UTC).replace(tzinfo=None),
@@ -626,6 +675,7 @@ async def runAnalysis(
                 renderedUserMessage=userMessage,
                 analysisIdLabel=analysisIdLabel,
                 processingMs=processingMs,
+                llmCache=cacheOutcome,
             )
         )
         await session.commit()
@@ -683,20 +733,19 @@ def _finalizeAnalysis(
     renderedUserMessage: str,
     analysisIdLabel: str,
     processingMs: int,
+    llmCache: str | None = None,
 ) -> None:
     _persistRecommendations(session, historyId, recommendations)
-    _completeHistory(
-        session,
-        historyId,
-        completedAt,
-        {
-            "analysis_id": analysisIdLabel,
-            "processing_time_ms": processingMs,
-            "recommendation_count": len(recommendations),
-            "raw_response": rawResponse,
-            "rendered_user_message": renderedUserMessage,
-        },
-    )
+    summary: dict[str, Any] = {
+        "analysis_id": analysisIdLabel,
+        "processing_time_ms": processingMs,
+        "recommendation_count": len(recommendations),
+        "raw_response": rawResponse,
+        "rendered_user_message": renderedUserMessage,
+    }
+    if llmCache is not None:
+        summary["llm_cache"] = llmCache
+    _completeHistory(session, historyId, completedAt, summary)
 
 
 async def _markHistoryFailed(
@@ -910,9 +959,13 @@ def _computeDriveAnalytics(
         realtimeFilter.append(RealtimeData.timestamp >= fallbackStartTime)
         realtimeFilter.append(RealtimeData.timestamp <= fallbackEndTime)
 
-    rowCount = int(session.execute(
-        select(func.count()).select_from(RealtimeData).where(*realtimeFilter),
-    ).scalar_one())
+    rowCount, startTime, endTime = session.execute(
+        select(
+            func.count(),
+            func.min(RealtimeData.timestamp),
+            func.max(RealtimeData.timestamp),
+        ).where(*realtimeFilter),
+    ).one()
 
     if rowCount == 0:
         return _DriveAnalytics(
@@ -925,12 +978,8 @@ def _computeDriveAnalytics(
             profileId=None,
         )
 
-    startTime, endTime = session.execute(
-        select(
-            func.min(RealtimeData.timestamp),
-            func.max(RealtimeData.timestamp),
-        ).where(*realtimeFilter),
-    ).one()
+    # The remaining reads touch only the drive's partition(s).
+    realtimeFilter.append(withinTimestampBounds((startTime, endTime)))
     durationSeconds = (
         int((endTime - startTime).total_seconds())
         if startTime is not None and endTime is not None
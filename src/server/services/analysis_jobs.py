@@ -0,0 +1,299 @@
+################################################################################
+# File Name: analysis_jobs.py
+# Purpose/Description: In-process job queue for AI analysis -- POST /analyze
+#                      enqueues, a bounded worker pool runs the Ollama calls
+#                      off the event loop, GET /analyze/{job_id} reads the
+#                      outcome, /health reports depth and latency.
+# Author: Rex
+# Creation Date: 2026-10-17
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-17    | Rex          | Initial
+# ================================================================================
+################################################################################
+
+"""
+AI analysis job queue.
+
+One :class:`AnalysisJobQueue` lives on ``app.state.analysisJobs``.  Each
+submitted job is an asyncio task that waits on a semaphore of
+``maxConcurrent`` slots and then awaits the analysis coroutine
+(:func:`src.server.services.analysis.runAnalysis`), handing it the queue's
+thread pool so the blocking Ollama HTTP call runs on a worker thread
+instead of the uvicorn event loop.  ``/sync`` and ``/health`` keep serving
+while a 120-second generation is in flight.
+
+* **Back-pressure** -- at most ``maxQueued`` jobs wait for a slot;
+  :meth:`AnalysisJobQueue.submit` raises :class:`AnalysisQueueFull` past
+  that (API layer -> 503).
+* **De-duplication** -- a request for the same drive with the same
+  parameters as a queued or running job returns that job instead of
+  starting another generation.
+* **Retention** -- finished jobs stay readable until ``retainFinished``
+  newer ones have finished.  Jobs are process-local: a restart forgets
+  them (the ``analysis_history`` row is the durable record).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import statistics
+import time
+import uuid
+from collections import OrderedDict, deque
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.server.services.analysis import AnalysisResult
+
+logger = logging.getLogger(__name__)
+
+# ---- Constants ---------------------------------------------------------------
+
+JOB_ID_PREFIX = "job-"
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+
+DEFAULT_MAX_CONCURRENT = 1
+DEFAULT_MAX_QUEUED = 16
+DEFAULT_RETAIN_FINISHED = 100
+
+# Latency samples kept for the /health percentiles.
+_LATENCY_WINDOW = 100
+
+# runAnalysis-compatible coroutine: (driveId=, parameters=, executor=, **kw)
+RunAnalysisFn = Callable[..., Awaitable[AnalysisResult]]
+
+
+class AnalysisQueueFull(Exception):
+    """Raised when ``maxQueued`` jobs are already waiting for a worker."""
+
+
+# ---- Job record --------------------------------------------------------------
+
+
+@dataclass
+class AnalysisJob:
+    """One queued / running / finished analysis request."""
+
+    jobId: str
+    driveId: int
+    parameters: dict[str, Any]
+    dedupKey: str
+    submittedAt: float
+    status: str = JOB_QUEUED
+    startedAt: float | None = None
+    finishedAt: float | None = None
+    result: AnalysisResult | None = None
+    error: Exception | None = None
+    done: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (JOB_COMPLETED, JOB_FAILED)
+
+    @property
+    def queueWaitMs(self) -> int | None:
+        if self.startedAt is None:
+            return None
+        return int((self.startedAt - self.submittedAt) * 1000)
+
+    @property
+    def runMs(self) -> int | None:
+        if self.startedAt is None or self.finishedAt is None:
+            return None
+        return int((self.finishedAt - self.startedAt) * 1000)
+
+
+def _dedupKey(driveId: int, parameters: dict[str, Any]) -> str:
+    return f"{driveId}:{json.dumps(parameters, sort_keys=True, default=str)}"
+
+
+def _percentile(samples: deque[int], pct: float) -> int | None:
+    if not samples:
+        return None
+    if len(samples) == 1:
+        return samples[0]
+    return int(statistics.quantiles(samples, n=100, method="inclusive")[int(pct) - 1])
+
+
+# ---- Queue -------------------------------------------------------------------
+
+
+class AnalysisJobQueue:
+    """Bounded, de-duplicating runner for analysis coroutines.
+
+    Args:
+        runFn: Analysis coroutine, called as ``runFn(driveId=...,
+            parameters=..., executor=..., **runKwargs)``.
+        maxConcurrent: Analyses (Ollama generations) running at once; also
+            the worker-thread count.
+        maxQueued: Jobs allowed to wait for a free slot.
+        retainFinished: Finished jobs kept for ``GET /analyze/{job_id}``.
+    """
+
+    def __init__(
+        self,
+        runFn: RunAnalysisFn,
+        *,
+        maxConcurrent: int = DEFAULT_MAX_CONCURRENT,
+        maxQueued: int = DEFAULT_MAX_QUEUED,
+        retainFinished: int = DEFAULT_RETAIN_FINISHED,
+    ) -> None:
+        if maxConcurrent < 1:
+            raise ValueError(f"maxConcurrent must be >= 1, got {maxConcurrent}")
+        self._runFn = runFn
+        self.maxConcurrent = maxConcurrent
+        self.maxQueued = maxQueued
+        self.retainFinished = retainFinished
+        self._executor: Executor = ThreadPoolExecutor(
+            max_workers=maxConcurrent, thread_name_prefix="analysis",
+        )
+        self._slots = asyncio.Semaphore(maxConcurrent)
+        self._jobs: OrderedDict[str, AnalysisJob] = OrderedDict()
+        self._inFlight: dict[str, AnalysisJob] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._finishedOrder: deque[str] = deque()
+        self._waitMs: deque[int] = deque(maxlen=_LATENCY_WINDOW)
+        self._runMs: deque[int] = deque(maxlen=_LATENCY_WINDOW)
+        self._counts = {"completed": 0, "failed": 0, "deduplicated": 0, "rejected": 0}
+
+    # ---- Submission / lookup ------------------------------------------------
+
+    def submit(
+        self, driveId: int, parameters: dict[str, Any], **runKwargs: Any,
+    ) -> tuple[AnalysisJob, bool]:
+        """Queue an analysis, or join the identical one already in flight.
+
+        Returns:
+            ``(job, deduplicated)``.
+
+        Raises:
+            AnalysisQueueFull: ``maxQueued`` jobs are already waiting.
+        """
+        key = _dedupKey(driveId, parameters)
+        existing = self._inFlight.get(key)
+        if existing is not None:
+            self._counts["deduplicated"] += 1
+            return existing, True
+        if self.queuedCount >= self.maxQueued:
+            self._counts["rejected"] += 1
+            raise AnalysisQueueFull(
+                f"{self.queuedCount} analyses already queued (max {self.maxQueued})",
+            )
+
+        job = AnalysisJob(
+            jobId=f"{JOB_ID_PREFIX}{uuid.uuid4()}",
+            driveId=driveId,
+            parameters=parameters,
+            dedupKey=key,
+            submittedAt=time.time(),
+        )
+        self._jobs[job.jobId] = job
+        self._inFlight[key] = job
+        task = asyncio.create_task(self._run(job, runKwargs))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return job, False
+
+    def get(self, jobId: str) -> AnalysisJob | None:
+        return self._jobs.get(jobId)
+
+    @property
+    def queuedCount(self) -> int:
+        return sum(1 for job in self._inFlight.values() if job.status == JOB_QUEUED)
+
+    @property
+    def runningCount(self) -> int:
+        return sum(1 for job in self._inFlight.values() if job.status == JOB_RUNNING)
+
+    # ---- Worker -------------------------------------------------------------
+
+    async def _run(self, job: AnalysisJob, runKwargs: dict[str, Any]) -> None:
+        try:
+            async with self._slots:
+                job.status = JOB_RUNNING
+                job.startedAt = time.time()
+                try:
+                    job.result = await self._runFn(
+                        driveId=job.driveId,
+                        parameters=job.parameters,
+                        executor=self._executor,
+                        **runKwargs,
+                    )
+                    job.status = JOB_COMPLETED
+                except Exception as exc:  # noqa: BLE001 -- stored on the job
+                    job.error = exc
+                    job.status = JOB_FAILED
+                    logger.warning(
+                        "Analysis job %s (drive_id=%s) failed: %s",
+                        job.jobId, job.driveId, exc,
+                    )
+        finally:
+            job.finishedAt = time.time()
+            if not job.finished:  # cancelled by shutdown()
+                job.status = JOB_FAILED
+                job.error = RuntimeError("analysis cancelled at server shutdown")
+            self._finish(job)
+
+    def _finish(self, job: AnalysisJob) -> None:
+        self._inFlight.pop(job.dedupKey, None)
+        self._counts[job.status] += 1
+        if job.queueWaitMs is not None:
+            self._waitMs.append(job.queueWaitMs)
+        if job.runMs is not None:
+            self._runMs.append(job.runMs)
+        self._finishedOrder.append(job.jobId)
+        while len(self._finishedOrder) > self.retainFinished:
+            self._jobs.pop(self._finishedOrder.popleft(), None)
+        job.done.set()
+
+    # ---- Observability / lifecycle ------------------------------------------
+
+    def metrics(self) -> dict[str, Any]:
+        """Depth, outcome counts and recent latency for ``/health``."""
+        return {
+            "queued": self.queuedCount,
+            "running": self.runningCount,
+            "maxConcurrent": self.maxConcurrent,
+            "maxQueued": self.maxQueued,
+            **self._counts,
+            "queueWaitMsP50": _percentile(self._waitMs, 50),
+            "queueWaitMsP95": _percentile(self._waitMs, 95),
+            "runMsP50": _percentile(self._runMs, 50),
+            "runMsP95": _percentile(self._runMs, 95),
+        }
+
+    async def shutdown(self) -> None:
+        """Cancel outstanding jobs and release the worker threads."""
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+__all__ = [
+    "DEFAULT_MAX_CONCURRENT",
+    "DEFAULT_MAX_QUEUED",
+    "DEFAULT_RETAIN_FINISHED",
+    "JOB_COMPLETED",
+    "JOB_FAILED",
+    "JOB_ID_PREFIX",
+    "JOB_QUEUED",
+    "JOB_RUNNING",
+    "AnalysisJob",
+    "AnalysisJobQueue",
+    "AnalysisQueueFull",
+]
@@ -21,6 +21,7 @@ prior tune-state showed.  The real-data tests assert ~1.0 and explicitly NOT 0.5
 
 from __future__ import annotations
 
+import math
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
@@ -29,6 +30,7 @@ import pytest
 from src.calibration.fit_reader import readFit
 from src.calibration.speed_aligner import (
     estimateCalibration,
+    estimateDriveCalibrations,
     gpsSpeedSeries,
     integrateDistanceKm,
     loadObdSpeedCsv,
@@ -71,6 +73,26 @@ def test_estimateCalibration_obdReadsDouble_scaleIsHalf() -> None:
     assert est.speedRatioScale == pytest.approx(0.5, abs=0.02)
 
 
+def test_estimateCalibration_subSecondClockOffset_recovered() -> None:
+    """
+    Given: OBD stamped 1.5 s late against GPS truth on a 1 Hz grid
+    When:  estimateCalibration runs
+    Then:  the lag is resolved below one second and the factor stays ~1.0
+    """
+    t0 = datetime(2026, 1, 1, tzinfo=UTC)
+
+    def trueKmh(s: float) -> float:
+        return 50.0 + 25.0 * math.sin(s / 20.0) + 6.0 * math.sin(s / 3.1)
+
+    gps = [(t0 + timedelta(seconds=s), trueKmh(s) / 3.6) for s in range(900)]
+    obd = [(t0 + timedelta(seconds=s), trueKmh(s - 1.5)) for s in range(900)]
+
+    est = estimateCalibration(obd, gps, 10_000.0)
+
+    assert est.lagSeconds == pytest.approx(1.5, abs=0.15)
+    assert est.speedRatioScale == pytest.approx(1.0, abs=0.005)
+
+
 # ---- real fixtures: drive-27 OBD <-> strava-27c GPS ----
 
 @pytest.fixture(scope="module")
@@ -106,3 +128,20 @@ def test_estimateCalibration_realDrive27_clockLagSmall(realEstimate) -> None:
 def test_estimateCalibration_realDrive27_scalarIsConstant(realEstimate) -> None:
     """Ratio is ~flat across the speed range -> single-scalar model is valid."""
     assert realEstimate.scalarIsConstant is True
+
+
+def test_estimateDriveCalibrations_splitDrive_eachHalfNearOne() -> None:
+    """Two drives inside one track each align and read ~true; no overlap -> None."""
+    obd = loadObdSpeedCsv(OBD_CSV)
+    track = readFit(GPS_FIT)
+    outside = [(ts + timedelta(days=1), v) for ts, v in obd]
+
+    first, second, missing = estimateDriveCalibrations(
+        [obd[:150], obd[150:], outside], track,
+    )
+
+    assert missing is None
+    for est in (first, second):
+        assert 0.9 <= est.distanceRatioScale <= 1.1
+        assert abs(est.distanceRatioScale - est.speedRatioScale) < 0.15
+        assert abs(est.lagSeconds) <= 60
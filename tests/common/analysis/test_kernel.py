@@ -0,0 +1,264 @@
+################################################################################
+# File Name: test_kernel.py
+# Purpose/Description: Parity tests for the shared statistics kernel -- NumPy vs
+#                      pure-Python backends bit for bit, and both against the
+#                      stdlib reference results the callers used to compute.
+# Author: Rex
+# Creation Date: 2026-10-16
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-16    | Rex          | Initial
+# 2026-10-17    | Rex          | Typed std-dev / per-parameter helpers.
+# ================================================================================
+################################################################################
+
+"""Tests for :mod:`src.common.analysis.kernel`.
+
+Invariants verified:
+
+1. **Backend parity** -- the NumPy and pure-Python backends return
+   bit-identical results (skipped when NumPy is not installed).
+2. **Reference parity** -- mean is bit-identical to ``statistics.fmean``,
+   min / max / mode to the builtin + ``Counter`` results, the std dev
+   matches ``statistics.stdev`` / ``pstdev`` to rounding, percentiles match
+   ``statistics.quantiles(method='inclusive')``.
+3. **Callers** -- computeBasicStats and calculateParameterStatistics
+   report the kernel's values.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import statistics
+from array import array
+from collections import Counter
+from datetime import UTC, datetime
+
+import pytest
+
+from src.common.analysis import kernel
+from src.common.analysis.calculations import (
+    calculateParameterStatistics,
+    calculateStandardDeviation,
+)
+from src.common.analysis.exceptions import InsufficientDataError
+from src.common.analysis.kernel import (
+    BACKEND_NUMPY,
+    BACKEND_PYTHON,
+    NUMPY_AVAILABLE,
+    summarize,
+    summarizeColumns,
+)
+from src.server.analytics.helpers import computeBasicStats, computeBasicStatsByParameter
+
+_PERCENTILES = (0.0, 5.0, 25.0, 50.0, 75.0, 95.0, 100.0)
+
+requiresNumpy = pytest.mark.skipif(not NUMPY_AVAILABLE, reason="numpy not installed")
+
+
+def _columns(seed: int = 15) -> dict[str, list[float]]:
+    rng = random.Random(seed)
+    columns = {
+        f"P{i}": [round(rng.gauss(100.0 * i + 7.0, 3.0 + i), 3)
+                  for _ in range(rng.randint(1, 4000))]
+        for i in range(24)
+    }
+    # Values whose x*100 sits on or next to a .5 boundary.
+    columns["TIES"] = [2.675, 2.665, 1.005, 0.125, 0.135, 1.115, -2.675] * 5
+    columns["SIGNED_ZERO"] = [-0.0, 0.0, 0.0, -0.0, 1.0]
+    columns["CONSTANT"] = [90.1] * 50
+    columns["SINGLE"] = [42.0]
+    return columns
+
+
+def _bits(stats) -> tuple:
+    """Exact representation of every float field (distinguishes -0.0)."""
+    def hexed(value):
+        return value.hex() if isinstance(value, float) else value
+
+    return (
+        stats.count, hexed(stats.minimum), hexed(stats.maximum), hexed(stats.mean),
+        hexed(stats.stdDev), hexed(stats.mode),
+        tuple((q, hexed(v)) for q, v in stats.percentiles.items()),
+    )
+
+
+# ================================================================================
+# Backend parity
+# ================================================================================
+
+
+@requiresNumpy
+class TestBackendParity:
+
+    @pytest.mark.parametrize("ddof", [0, 1])
+    def test_batch_bitIdentical(self, ddof):
+        columns = _columns()
+
+        python = summarizeColumns(columns, ddof=ddof, percentiles=_PERCENTILES,
+                                  backend=BACKEND_PYTHON)
+        vectorized = summarizeColumns(
+            {name: array('d', values) for name, values in columns.items()},
+            ddof=ddof, percentiles=_PERCENTILES, backend=BACKEND_NUMPY,
+        )
+
+        assert list(vectorized) == list(python)
+        for name in columns:
+            assert _bits(vectorized[name]) == _bits(python[name]), name
+
+    @pytest.mark.parametrize("precision", [-1, 0, 1, 2, 3])
+    def test_modeRounding_matchesPythonRound(self, precision):
+        rng = random.Random(precision)
+        values = [rng.randint(-500_000, 500_000) / 1000.0 for _ in range(20_000)]
+
+        python = summarize(values, modePrecision=precision, backend=BACKEND_PYTHON)
+        vectorized = summarize(values, modePrecision=precision, backend=BACKEND_NUMPY)
+
+        assert vectorized.mode.hex() == python.mode.hex()
+
+    def test_acceptsNdarrayAndMemoryview(self):
+        import numpy as np
+
+        values = _columns()["P3"]
+        expected = _bits(summarize(values, backend=BACKEND_PYTHON))
+
+        assert _bits(summarize(np.asarray(values))) == expected
+        assert _bits(summarize(memoryview(array('d', values)))) == expected
+
+
+# ================================================================================
+# Reference parity (pure-Python backend; also the only tier on the Pi)
+# ================================================================================
+
+
+class TestReferenceParity:
+
+    @pytest.fixture(params=sorted(_columns()))
+    def values(self, request) -> list[float]:
+        return _columns()[request.param]
+
+    def test_exactFields_matchStdlib(self, values):
+        stats = summarize(values, backend=BACKEND_PYTHON)
+
+        assert stats.count == len(values)
+        assert stats.minimum.hex() == min(values).hex()
+        assert stats.maximum.hex() == max(values).hex()
+        assert stats.mean.hex() == statistics.fmean(values).hex()
+        expectedMode = Counter(round(v, 2) for v in values).most_common(1)[0][0]
+        assert stats.mode.hex() == expectedMode.hex()
+
+    def test_stdDev_matchesStdlibToRounding(self, values):
+        sample = summarize(values, backend=BACKEND_PYTHON)
+        population = summarize(values, ddof=0, backend=BACKEND_PYTHON)
+
+        assert population.stdDev == pytest.approx(statistics.pstdev(values), rel=1e-14)
+        if len(values) < 2:
+            assert sample.stdDev is None
+        else:
+            assert sample.stdDev == pytest.approx(statistics.stdev(values), rel=1e-14)
+
+    def test_percentiles_matchInclusiveQuantiles(self, values):
+        if len(values) < 2:
+            pytest.skip("quantiles needs two points")
+        stats = summarize(values, percentiles=(25, 50, 75), backend=BACKEND_PYTHON)
+
+        expected = statistics.quantiles(values, n=4, method='inclusive')
+
+        assert [stats.percentiles[q] for q in (25, 50, 75)] == pytest.approx(
+            expected, rel=1e-15,
+        )
+
+
+# ================================================================================
+# API edges
+# ================================================================================
+
+
+class TestApi:
+
+    def test_empty_raises(self):
+        with pytest.raises(InsufficientDataError):
+            summarize([])
+
+    def test_emptyColumn_leftOut(self):
+        assert list(summarizeColumns({"A": [], "B": [1.0]})) == ["B"]
+
+    def test_modeSkipped_whenPrecisionNone(self):
+        assert summarize([1.0, 2.0], modePrecision=None).mode is None
+
+    def test_outlierBounds(self):
+        stats = summarize([1.0, 3.0])
+
+        assert stats.outlierBounds() == (2.0 - 2 * math.sqrt(2), 2.0 + 2 * math.sqrt(2))
+        assert summarize([1.0]).outlierBounds() is None
+
+    def test_badPercentile_raises(self):
+        with pytest.raises(ValueError, match="0-100"):
+            summarize([1.0], percentiles=(101,))
+
+    def test_unknownBackend_raises(self):
+        with pytest.raises(ValueError, match="Unknown backend"):
+            summarize([1.0], backend="fortran")
+
+    def test_numpyRequestedWithoutNumpy_raises(self, monkeypatch):
+        monkeypatch.setattr(kernel, "NUMPY_AVAILABLE", False)
+
+        with pytest.raises(ValueError, match="not installed"):
+            summarize([1.0], backend=BACKEND_NUMPY)
+        assert summarize([1.0, 2.0]).mean == 1.5
+
+
+# ================================================================================
+# Callers
+# ================================================================================
+
+
+class TestCallers:
+
+    def test_computeBasicStats_usesKernel(self):
+        values = _columns()["P5"]
+        stats = summarize(values, modePrecision=None)
+
+        basic = computeBasicStats(values)
+
+        assert basic.avg_value.hex() == statistics.fmean(values).hex()
+        assert basic.std_dev == stats.stdDev
+        assert basic.outlier_max == stats.outlierBounds()[1]
+
+    def test_computeBasicStatsByParameter_matchesPerParameter(self):
+        columns = _columns()
+
+        batched = computeBasicStatsByParameter(columns)
+
+        assert batched == {name: computeBasicStats(v) for name, v in columns.items()}
+
+    def test_computeBasicStatsByParameter_dropsEmptyParameters(self):
+        batched = computeBasicStatsByParameter({"RPM": [800.0, 900.0], "MAF": []})
+
+        assert list(batched) == ["RPM"]
+
+    def test_calculateStandardDeviation_returnsKernelStdDev(self):
+        values = _columns()["P5"]
+
+        stdDev = calculateStandardDeviation(values)
+
+        assert isinstance(stdDev, float)
+        assert stdDev == summarize(values, modePrecision=None).stdDev
+
+    def test_calculateParameterStatistics_usesKernel(self):
+        values = _columns()["P7"]
+        stats = summarize(values)
+
+        result = calculateParameterStatistics(
+            values, 'RPM', 'daily', datetime(2026, 10, 16, tzinfo=UTC),
+        )
+
+        assert (result.avgValue, result.std1, result.modeValue) == (
+            stats.mean, stats.stdDev, stats.mode,
+        )
+        assert (result.outlierMin, result.outlierMax) == stats.outlierBounds()
@@ -0,0 +1,137 @@
+################################################################################
+# File Name: test_streaming.py
+# Purpose/Description: Tests for the online statistics accumulator.
+# Author: Rex
+# Creation Date: 2026-10-16
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-16    | Rex          | Initial
+# ================================================================================
+################################################################################
+
+"""Tests for :class:`OnlineStatistics`.
+
+Invariants verified:
+
+1. **Parity** -- a single pass gives the same ParameterStatistics as
+   :func:`calculateParameterStatistics` over the full list.
+2. **Mergeable** -- merging split accumulators (and a toState/fromState
+   round trip) equals one pass over the concatenation.
+3. **Bounded** -- the mode histogram never exceeds maxBuckets.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from datetime import UTC, datetime
+
+import pytest
+
+from src.common.analysis.calculations import calculateParameterStatistics
+from src.common.analysis.exceptions import InsufficientDataError
+from src.common.analysis.streaming import OnlineStatistics
+
+_DATE = datetime(2026, 10, 16, tzinfo=UTC)
+
+
+def _values(count: int = 500, seed: int = 7) -> list[float]:
+    rng = random.Random(seed)
+    return [round(rng.gauss(2500.0, 400.0) / 25.0) * 25.0 for _ in range(count)]
+
+
+def _accumulate(values: list[float], **kwargs) -> OnlineStatistics:
+    acc = OnlineStatistics(**kwargs)
+    for value in values:
+        acc.add(value)
+    return acc
+
+
+def _assertSameStats(actual, expected) -> None:
+    assert actual.sampleCount == expected.sampleCount
+    assert actual.minValue == expected.minValue
+    assert actual.maxValue == expected.maxValue
+    assert actual.modeValue == expected.modeValue
+    assert actual.avgValue == pytest.approx(expected.avgValue)
+    for field in ('std1', 'std2', 'outlierMin', 'outlierMax'):
+        assert getattr(actual, field) == pytest.approx(getattr(expected, field))
+
+
+class TestParity:
+
+    def test_singlePass_matchesBatchCalculation(self):
+        values = _values()
+
+        actual = _accumulate(values).toParameterStatistics('RPM', 'daily', _DATE)
+        expected = calculateParameterStatistics(values, 'RPM', 'daily', _DATE)
+
+        _assertSameStats(actual, expected)
+
+    def test_modeTie_firstSeenWins(self):
+        acc = _accumulate([3.0, 1.0, 1.0, 3.0, 2.0])
+
+        assert acc.modeValue == 3.0
+
+    def test_singleSample_noDeviation(self):
+        stats = _accumulate([42.0]).toParameterStatistics('RPM', 'daily', _DATE)
+
+        assert stats.avgValue == 42.0
+        assert stats.std1 is None and stats.outlierMin is None
+
+    def test_empty_raisesInsufficientData(self):
+        with pytest.raises(InsufficientDataError):
+            OnlineStatistics().toParameterStatistics('RPM', 'daily', _DATE)
+
+
+class TestMerge:
+
+    def test_mergedSplits_equalSinglePass(self):
+        values = _values()
+        merged = OnlineStatistics()
+        for start in range(0, len(values), 137):
+            merged.merge(_accumulate(values[start:start + 137]))
+
+        _assertSameStats(
+            merged.toParameterStatistics('RPM', 'daily', _DATE),
+            _accumulate(values).toParameterStatistics('RPM', 'daily', _DATE),
+        )
+
+    def test_stateRoundTrip_throughJson(self):
+        values = _values()
+        acc = _accumulate(values[:300])
+
+        restored = OnlineStatistics.fromState(json.loads(json.dumps(acc.toState())))
+        restored.merge(_accumulate(values[300:]))
+
+        _assertSameStats(
+            restored.toParameterStatistics('RPM', 'daily', _DATE),
+            calculateParameterStatistics(values, 'RPM', 'daily', _DATE),
+        )
+
+
+class TestBoundedHistogram:
+
+    def test_manyDistinctValues_coarsensPrecision(self):
+        values = [i * 0.013 for i in range(5000)]
+
+        acc = _accumulate(values, maxBuckets=64)
+
+        assert len(acc.toState()['histogram']) <= 64
+        assert acc.precision < 2
+        assert acc.count == 5000
+        assert acc.mean == pytest.approx(sum(values) / len(values))
+
+    def test_mergeAlignsPrecision(self):
+        coarse = _accumulate([i * 0.5 for i in range(200)], maxBuckets=50)
+        fine = _accumulate([1.234, 1.234])
+
+        coarse.merge(fine)
+
+        assert all(
+            key == round(key, coarse.precision)
+            for key, _count in coarse.toState()['histogram']
+        )
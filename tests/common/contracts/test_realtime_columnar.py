@@ -0,0 +1,120 @@
+################################################################################
+# File Name: test_realtime_columnar.py
+# Purpose/Description: Round-trip and malformed-input tests for the columnar
+#                      realtime_data sync encoding.
+# Author: Rex
+# Creation Date: 2026-10-16
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-16    | Rex          | Initial
+# ================================================================================
+################################################################################
+
+"""Tests for src.common.contracts.realtime_columnar."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import pytest
+
+from src.common.contracts.realtime_columnar import (
+    ROW_BYTES,
+    ColumnarDecodeError,
+    decodeSyncBody,
+    encodeSyncBody,
+    isColumnarRow,
+    rowBytes,
+)
+
+_ENVELOPE = {"deviceId": "chi-eclipse-01", "batchId": "b-1", "tables": {}}
+
+
+def _rows(count: int = 5, timestamp: str | None = None) -> list[dict]:
+    return [
+        {
+            "id": 100 + i * 3,
+            "timestamp": timestamp or f"2026-10-16T12:00:{i:02d}Z",
+            "parameter_name": "RPM" if i % 2 else "COOLANT_TEMP",
+            "value": 800.5 + i,
+            "unit": "rpm" if i % 2 else None,
+            "profile_id": "daily",
+            "data_source": "real",
+            "drive_id": 7 if i else None,
+        }
+        for i in range(count)
+    ]
+
+
+class TestRoundTrip:
+
+    def test_epochMode_decodesEveryColumn(self):
+        rows = _rows()
+
+        envelope, tables = decodeSyncBody(
+            encodeSyncBody(_ENVELOPE, {"realtime_data": (99, rows)}),
+        )
+
+        assert envelope == _ENVELOPE
+        table = tables["realtime_data"]
+        assert table.lastSyncedId == 99
+        assert table.rowCount == 5
+        assert table.columns["id"] == [r["id"] for r in rows]
+        assert table.columns["value"] == [r["value"] for r in rows]
+        assert table.columns["unit"] == [r["unit"] for r in rows]
+        assert table.columns["drive_id"] == [r["drive_id"] for r in rows]
+        assert table.columns["timestamp"][3] == datetime(2026, 10, 16, 12, 0, 3, tzinfo=UTC)
+
+    def test_nonCanonicalTimestamps_travelAsStrings(self):
+        rows = _rows(3, timestamp="2026-10-16 12:00:00.250")
+
+        _, tables = decodeSyncBody(encodeSyncBody(_ENVELOPE, {"realtime_data": (0, rows)}))
+
+        assert tables["realtime_data"].columns["timestamp"] == [r["timestamp"] for r in rows]
+        assert rowBytes(rows[0]) > ROW_BYTES
+
+    def test_jsonTablesStayInEnvelope(self):
+        envelope = {
+            **_ENVELOPE,
+            "tables": {"connection_log": {"lastSyncedId": 0, "rows": [{"id": 1}]}},
+        }
+
+        decoded, _ = decodeSyncBody(encodeSyncBody(envelope, {"realtime_data": (0, _rows(1))}))
+
+        assert decoded["tables"] == envelope["tables"]
+
+
+class TestIsColumnarRow:
+
+    def test_unknownColumn_rejected(self):
+        assert not isColumnarRow({**_rows(1)[0], "extra": 1})
+
+    def test_nonNumericValue_rejected(self):
+        assert not isColumnarRow({**_rows(1)[0], "value": "800"})
+
+
+class TestMalformedBodies:
+
+    def _body(self) -> bytes:
+        return encodeSyncBody(_ENVELOPE, {"realtime_data": (0, _rows())})
+
+    def test_badMagic(self):
+        with pytest.raises(ColumnarDecodeError, match="not a columnar"):
+            decodeSyncBody(b"JSON" + self._body()[4:])
+
+    def test_truncatedBlocks(self):
+        with pytest.raises(ColumnarDecodeError):
+            decodeSyncBody(self._body()[:-4])
+
+    def test_trailingBytes(self):
+        with pytest.raises(ColumnarDecodeError, match="trailing"):
+            decodeSyncBody(self._body() + b"\x00")
+
+    def test_unknownColumnarTable(self):
+        body = self._body().replace(b'"realtime_data"', b'"connection_lg"')
+        with pytest.raises(ColumnarDecodeError, match="no columnar encoding"):
+            decodeSyncBody(body)
@@ -46,6 +46,7 @@ the live-server counterpart the CIO runs against the real Chi-Srv-01.
 
 from __future__ import annotations
 
+import gzip
 import json
 import socket
 import sqlite3
@@ -99,8 +100,11 @@ class _MockSyncHandler(BaseHTTPRequestHandler):
         contentLength = int(self.headers.get("Content-Length", "0"))
         rawBody = self.rfile.read(contentLength) if contentLength else b""
         try:
+            # Mirrors the real route: bulk pushes arrive gzip-encoded.
+            if self.headers.get("Content-Encoding") == "gzip":
+                rawBody = gzip.decompress(rawBody)
             payload = json.loads(rawBody.decode("utf-8"))
-        except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError) as exc:
             self._sendJson(
                 HTTPStatus.BAD_REQUEST,
                 {"error": f"bad json: {exc}"},
@@ -37,6 +37,7 @@ This is CI-friendly: stdlib HTTP server only, no external deps.
 
 from __future__ import annotations
 
+import gzip
 import json
 import socket
 import sqlite3
@@ -77,8 +78,11 @@ class _MockSyncHandler(BaseHTTPRequestHandler):
         contentLength = int(self.headers.get("Content-Length", "0"))
         rawBody = self.rfile.read(contentLength) if contentLength else b""
         try:
+            # Mirrors the real route: bulk pushes arrive gzip-encoded.
+            if self.headers.get("Content-Encoding") == "gzip":
+                rawBody = gzip.decompress(rawBody)
             payload = json.loads(rawBody.decode("utf-8"))
-        except (UnicodeDecodeError, json.JSONDecodeError):
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError):
             self._sendJson(HTTPStatus.BAD_REQUEST, {"error": "bad json"})
             return
         store.recordBatch(payload=payload)
@@ -287,10 +291,11 @@ class TestSyncRecovery:
 
         assert fired1 is True
         assert fired2 is False
-        # Exactly one full set of batches (one per non-empty in-scope table).
-        # Empirically 2 batches: realtime_data + connection_log (the only
-        # seeded tables); every other in-scope table is EMPTY so no HTTP.
-        assert len(store.batches) == 2
+        # Exactly one sweep.  Bulk push (the config default) packs both
+        # seeded tables -- realtime_data + connection_log -- into a single
+        # request; every other in-scope table is EMPTY so it is absent.
+        assert len(store.batches) == 1
+        assert set(store.batches[0]["tables"]) == {"realtime_data", "connection_log"}
 
     def test_driveEndTrigger_pushesImmediately(
         self, piDb, mockServer, monkeypatch
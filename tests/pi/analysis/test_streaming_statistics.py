@@ -0,0 +1,281 @@
+################################################################################
+# File Name: test_streaming_statistics.py
+# Purpose/Description: Tests for streaming post-drive statistics (live
+#                      accumulators + persisted statistics_accumulators).
+# Author: Rex
+# Creation Date: 2026-10-16
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-16    | Rex          | Initial
+# 2026-10-17    | Rex          | Engine rebuild / reset / stop
+# ================================================================================
+################################################################################
+
+"""Tests for :mod:`src.pi.analysis.streaming` and its engine / detector wiring.
+
+Invariants verified:
+
+1. **Parity** -- streaming analysis stores the same statistics a full
+   rescan would, across a bootstrap drive and a later incremental drive.
+2. **No rescan** -- once a baseline exists, analysis never reads raw rows.
+3. **Rebuild** -- the rebuild script recomputes the baseline from raw rows;
+   ``--reset`` drops it so the next analysis bootstraps.
+4. **Detector feed** -- ``DriveDetector.processValue`` feeds the engine.
+5. **Engine maintenance** -- ``rebuildStreamingStatistics`` does not count
+   live samples twice, ``resetStreamingStatistics`` makes the next analysis
+   rescan, and ``stop`` persists the live samples of an unfinished drive.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import random
+import sys
+from datetime import timedelta
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.pi.analysis.engine import StatisticsEngine
+from src.pi.obdii.database import ObdDatabase
+from src.pi.obdii.drive.detector import DriveDetector
+
+_PROJECT_ROOT = Path(__file__).resolve().parents[3]
+_SCRIPT_PATH = _PROJECT_ROOT / 'scripts' / 'rebuild_streaming_statistics.py'
+
+_STREAMING_CONFIG = {'pi': {'analysis': {'streamingStatistics': True}}}
+
+
+def _loadScript():  # noqa: ANN202 -- test helper
+    spec = importlib.util.spec_from_file_location(
+        'rebuild_streaming_statistics', _SCRIPT_PATH,
+    )
+    assert spec is not None and spec.loader is not None
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules['rebuild_streaming_statistics'] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+@pytest.fixture
+def db(tmp_path: Path) -> ObdDatabase:
+    database = ObdDatabase(str(tmp_path / "streaming.db"), walMode=False)
+    database.initialize()
+    with database.connect() as conn:
+        conn.execute("INSERT OR IGNORE INTO profiles (id, name) VALUES ('daily', 'Daily')")
+    return database
+
+
+def _drive(seed: int, seconds: int = 120) -> list[tuple[str, str, float]]:
+    rng = random.Random(seed)
+    rows = []
+    for second in range(seconds):
+        timestamp = f'2026-10-{10 + seed:02d}T12:{second // 60:02d}:{second % 60:02d}Z'
+        rows.append((timestamp, 'RPM', float(rng.randrange(800, 6000, 50))))
+        rows.append((timestamp, 'COOLANT_TEMP', round(rng.uniform(70.0, 95.0), 1)))
+    return rows
+
+
+def _logDrive(db: ObdDatabase, engine: StatisticsEngine, rows) -> None:
+    """Persist the rows and feed them live, as the collector would."""
+    with db.connect() as conn:
+        conn.executemany(
+            "INSERT INTO realtime_data "
+            "(timestamp, parameter_name, value, profile_id, data_source) "
+            "VALUES (?, ?, ?, 'daily', 'real')",
+            rows,
+        )
+    for _timestamp, name, value in rows:
+        engine.recordSample('daily', name, value)
+
+
+def _assertMatchesRescan(db: ObdDatabase, result) -> None:
+    expected = StatisticsEngine(db, {}).calculateStatistics('daily', storeResults=False)
+    assert set(result.parameterStats) == set(expected.parameterStats)
+    for name, stats in expected.parameterStats.items():
+        actual = result.parameterStats[name]
+        assert actual.sampleCount == stats.sampleCount
+        assert actual.minValue == stats.minValue
+        assert actual.maxValue == stats.maxValue
+        assert actual.modeValue == stats.modeValue
+        assert actual.avgValue == pytest.approx(stats.avgValue)
+        assert actual.std1 == pytest.approx(stats.std1)
+        assert actual.outlierMax == pytest.approx(stats.outlierMax)
+
+
+# ================================================================================
+# Engine
+# ================================================================================
+
+
+class TestStreamingEngine:
+
+    def test_bootstrapThenIncremental_matchesRescan(self, db):
+        engine = StatisticsEngine(db, _STREAMING_CONFIG)
+
+        _logDrive(db, engine, _drive(1))
+        _assertMatchesRescan(db, engine.calculateStatistics('daily'))
+        _logDrive(db, engine, _drive(2))
+        _assertMatchesRescan(db, engine.calculateStatistics('daily'))
+
+        with db.connect() as conn:
+            counts = dict(conn.execute(
+                "SELECT parameter_name, sample_count FROM statistics_accumulators"
+            ).fetchall())
+        assert counts == {'RPM': 240, 'COOLANT_TEMP': 240}
+
+    def test_withBaseline_doesNotReadRawRows(self, db, monkeypatch):
+        engine = StatisticsEngine(db, _STREAMING_CONFIG)
+        _logDrive(db, engine, _drive(1))
+        engine.calculateStatistics('daily')
+        _logDrive(db, engine, _drive(2))
+
+        fetch = MagicMock(side_effect=AssertionError("rescanned raw rows"))
+        monkeypatch.setattr(engine, '_fetchParameterData', fetch)
+        monkeypatch.setattr('src.pi.analysis.streaming.rebuildAccumulators', fetch)
+        result = engine.calculateStatistics('daily')
+
+        assert result.parameterStats['RPM'].sampleCount == 240
+
+    def test_analysisWindow_stillRescans(self, db, monkeypatch):
+        engine = StatisticsEngine(db, _STREAMING_CONFIG)
+        fetch = MagicMock(return_value={})
+        monkeypatch.setattr(engine, '_fetchParameterData', fetch)
+
+        engine.calculateStatistics('daily', analysisWindow=timedelta(hours=1))
+
+        fetch.assert_called_once()
+
+    def test_disabled_recordSampleIsNoOp(self, db):
+        engine = StatisticsEngine(db, {})
+        engine.recordSample('daily', 'RPM', 900.0)
+
+        assert not engine.isStreaming
+
+
+class TestEngineMaintenance:
+
+    def test_rebuildStreamingStatistics_doesNotDoubleCountLiveSamples(self, db):
+        engine = StatisticsEngine(db, _STREAMING_CONFIG)
+        _logDrive(db, engine, _drive(1))
+        engine.calculateStatistics('daily')
+        _logDrive(db, engine, _drive(2))  # rows stored and still live
+
+        assert engine.rebuildStreamingStatistics('daily') == 2
+        result = engine.calculateStatistics('daily')
+
+        assert result.parameterStats['RPM'].sampleCount == 240
+        _assertMatchesRescan(db, result)
+
+    def test_resetStreamingStatistics_nextAnalysisRescansKeptRows(self, db):
+        engine = StatisticsEngine(db, _STREAMING_CONFIG)
+        _logDrive(db, engine, _drive(1))
+        _logDrive(db, engine, _drive(2))
+        engine.calculateStatistics('daily')
+        with db.connect() as conn:
+            conn.execute("DELETE FROM realtime_data WHERE timestamp < '2026-10-12'")
+
+        assert engine.resetStreamingStatistics('daily') == 2
+        result = engine.calculateStatistics('daily')
+
+        assert result.parameterStats['RPM'].sampleCount == 120
+        _assertMatchesRescan(db, result)
+
+    def test_stop_persistsLiveSamplesOfUnfinishedDrive(self, db):
+        engine = StatisticsEngine(db, _STREAMING_CONFIG)
+        _logDrive(db, engine, _drive(1))
+        engine.calculateStatistics('daily')
+        _logDrive(db, engine, _drive(2))
+
+        engine.stop()
+        restarted = StatisticsEngine(db, _STREAMING_CONFIG)
+        result = restarted.calculateStatistics('daily')
+
+        assert result.parameterStats['RPM'].sampleCount == 240
+        _assertMatchesRescan(db, result)
+
+
+# ================================================================================
+# Rebuild script
+# ================================================================================
+
+
+class TestRebuildScript:
+
+    def test_rebuild_recomputesDriftedBaseline(self, db):
+        script = _loadScript()
+        engine = StatisticsEngine(db, _STREAMING_CONFIG)
+        _logDrive(db, engine, _drive(1))
+        engine.calculateStatistics('daily')
+        # Rows that never reached the live path (e.g. collector crash).
+        with db.connect() as conn:
+            conn.executemany(
+                "INSERT INTO realtime_data "
+                "(timestamp, parameter_name, value, profile_id, data_source) "
+                "VALUES (?, ?, ?, 'daily', 'real')",
+                _drive(3),
+            )
+
+        assert script.main(['--db', db.dbPath, '--profile', 'daily']) == 0
+
+        _assertMatchesRescan(db, engine.calculateStatistics('daily'))
+
+    def test_reset_nextAnalysisBootstraps(self, db):
+        script = _loadScript()
+        engine = StatisticsEngine(db, _STREAMING_CONFIG)
+        _logDrive(db, engine, _drive(1))
+        engine.calculateStatistics('daily')
+
+        assert script.main(['--db', db.dbPath, '--reset']) == 0
+        with db.connect() as conn:
+            assert conn.execute(
+                "SELECT COUNT(*) FROM statistics_accumulators"
+            ).fetchone()[0] == 0
+        _logDrive(db, engine, _drive(2))
+
+        _assertMatchesRescan(db, engine.calculateStatistics('daily'))
+
+    def test_missingDb_exitCode2(self, tmp_path):
+        script = _loadScript()
+
+        assert script.main(['--db', str(tmp_path / 'missing.db')]) == 2
+
+
+# ================================================================================
+# Detector feed
+# ================================================================================
+
+
+class TestDetectorFeed:
+
+    def test_processValue_feedsStatisticsEngine(self, db):
+        engine = MagicMock()
+        detector = DriveDetector(
+            {'pi': {'analysis': {'triggerAfterDrive': False},
+                    'profiles': {'activeProfile': 'daily'}}},
+            statisticsEngine=engine, database=db,
+        )
+        detector.start()
+
+        detector.processValue('COOLANT_TEMP', 88.5)
+
+        engine.recordSample.assert_called_once_with('daily', 'COOLANT_TEMP', 88.5)
+
+    def test_processValue_engineErrorDoesNotBreakDetection(self, db):
+        engine = MagicMock()
+        engine.recordSample.side_effect = RuntimeError("boom")
+        detector = DriveDetector(
+            {'pi': {'analysis': {'triggerAfterDrive': False},
+                    'profiles': {'activeProfile': 'daily'}}},
+            statisticsEngine=engine, database=db,
+        )
+        detector.start()
+
+        detector.processValue('RPM', 900.0)
+
+        assert detector.getStats().valuesProcessed == 1
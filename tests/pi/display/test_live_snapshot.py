@@ -0,0 +1,200 @@
+################################################################################
+# File Name: test_live_snapshot.py
+# Purpose/Description: Shared-memory live snapshot -- writer / reader round
+#                      trip, seqlock retry, file reuse and replacement,
+#                      staleness and alias mapping for display reads.
+# Author: Rex
+# Creation Date: 2026-10-17
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-17    | Rex          | Initial
+# ================================================================================
+################################################################################
+"""
+Live snapshot tests.
+
+The collector writes the latest value / timestamp / severity per parameter
+into a fixed-layout mmap file; display processes copy it out with no SQL.
+These tests run the writer and reader against a file under ``tmp_path``
+(the production path is ``/dev/shm``), including from a separate process.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import struct
+from pathlib import Path
+
+import pytest
+
+from pi.alert.tiered_thresholds import AlertSeverity
+from pi.display.live_readings import buildReadingsFromSnapshot
+from pi.display.live_snapshot import (
+    LiveSnapshotReader,
+    LiveSnapshotWriter,
+    LiveValue,
+    snapshotSize,
+)
+from pi.display.screens.primary_screen import BASIC_TIER_DISPLAY_ORDER
+
+NOW = 1_800_000_000.0
+
+
+@pytest.fixture
+def snapPath(tmp_path: Path) -> Path:
+    return tmp_path / "shm" / "live.snap"
+
+
+def _publishFromChild(path: str) -> None:
+    writer = LiveSnapshotWriter(path, capacity=8)
+    writer.publish("RPM", 3100.0, timestamp=NOW)
+    writer.close()
+
+
+# ================================================================================
+# Writer / reader
+# ================================================================================
+
+
+class TestRoundTrip:
+
+    def test_publishedValuesReadBackWithTimestampAndSeverity(self, snapPath):
+        writer = LiveSnapshotWriter(snapPath, capacity=8, clock=lambda: NOW)
+        writer.publish("RPM", 2450.0, severity=AlertSeverity.NORMAL)
+        writer.publish("COOLANT_TEMP", 221.0, timestamp=NOW - 1, severity=AlertSeverity.DANGER)
+        writer.publish("SPEED", 35.0)
+
+        values = LiveSnapshotReader(snapPath).read()
+
+        assert values == {
+            "RPM": LiveValue(2450.0, NOW, "normal"),
+            "COOLANT_TEMP": LiveValue(221.0, NOW - 1, "danger"),
+            "SPEED": LiveValue(35.0, NOW, None),
+        }
+        assert snapPath.stat().st_size == snapshotSize(8)
+
+    def test_republishOverwritesSlotInPlace(self, snapPath):
+        writer = LiveSnapshotWriter(snapPath, capacity=2, clock=lambda: NOW)
+        reader = LiveSnapshotReader(snapPath)
+        writer.publish("RPM", 800.0)
+        assert reader.read()["RPM"].value == 800.0
+
+        writer.publish("RPM", 6100.0)
+
+        assert reader.read() == {"RPM": LiveValue(6100.0, NOW, None)}
+
+    def test_fullSnapshotRejectsNewParameters(self, snapPath):
+        writer = LiveSnapshotWriter(snapPath, capacity=1, clock=lambda: NOW)
+
+        assert writer.publish("RPM", 1.0)
+        assert not writer.publish("SPEED", 2.0)
+        assert not writer.publish("X" * 40, 3.0)
+        assert set(LiveSnapshotReader(snapPath).read()) == {"RPM"}
+
+    def test_valuesVisibleAcrossProcesses(self, snapPath):
+        reader = LiveSnapshotReader(snapPath)
+        assert reader.read() == {}  # collector not started yet
+
+        child = multiprocessing.get_context("spawn").Process(
+            target=_publishFromChild, args=(str(snapPath),),
+        )
+        child.start()
+        child.join(timeout=30)
+
+        assert child.exitcode == 0
+        assert reader.read() == {"RPM": LiveValue(3100.0, NOW, None)}
+
+
+class TestSeqlockAndLifecycle:
+
+    def test_writeInProgressReturnsLastConsistentCopy(self, snapPath):
+        writer = LiveSnapshotWriter(snapPath, capacity=4, clock=lambda: NOW)
+        writer.publish("RPM", 900.0)
+        reader = LiveSnapshotReader(snapPath)
+        assert reader.read()["RPM"].value == 900.0
+
+        # Freeze the writer mid-update: odd sequence, new slot contents.
+        writer.publish("RPM", 5000.0)
+        oddSeq = struct.unpack_from("<Q", writer._mmap, 16)[0] + 1
+        struct.pack_into("<Q", writer._mmap, 16, oddSeq)
+
+        assert reader.read()["RPM"].value == 900.0
+
+        struct.pack_into("<Q", writer._mmap, 16, oddSeq + 1)
+        assert reader.read()["RPM"].value == 5000.0
+
+    def test_restartedWriterReusesFileAndSlots(self, snapPath):
+        first = LiveSnapshotWriter(snapPath, capacity=4, clock=lambda: NOW)
+        first.publish("RPM", 1000.0)
+        first.publish("SPEED", 20.0)
+        reader = LiveSnapshotReader(snapPath)
+        reader.read()
+        inode = snapPath.stat().st_ino
+        first.close()
+
+        second = LiveSnapshotWriter(snapPath, capacity=4, clock=lambda: NOW + 1)
+        second.publish("SPEED", 30.0)
+        second.publish("AFR", 14.7)
+
+        assert snapPath.stat().st_ino == inode
+        assert reader.read() == {
+            "RPM": LiveValue(1000.0, NOW, None),
+            "SPEED": LiveValue(30.0, NOW + 1, None),
+            "AFR": LiveValue(14.7, NOW + 1, None),
+        }
+
+    def test_readerRemapsWhenLayoutChanges(self, snapPath):
+        LiveSnapshotWriter(snapPath, capacity=4, clock=lambda: NOW).publish("RPM", 1.0)
+        reader = LiveSnapshotReader(snapPath)
+        assert set(reader.read()) == {"RPM"}
+
+        LiveSnapshotWriter(snapPath, capacity=16, clock=lambda: NOW).publish("SPEED", 2.0)
+
+        assert reader.read() == {"SPEED": LiveValue(2.0, NOW, None)}
+
+    def test_foreignFileReadsEmpty(self, snapPath):
+        snapPath.parent.mkdir(parents=True)
+        snapPath.write_bytes(b"not a snapshot" * 10)
+
+        assert LiveSnapshotReader(snapPath).read() == {}
+
+
+# ================================================================================
+# Display mapping
+# ================================================================================
+
+
+class TestBuildReadingsFromSnapshot:
+
+    def test_staleValuesDropped(self, snapPath):
+        writer = LiveSnapshotWriter(snapPath, capacity=8)
+        writer.publish("RPM", 2500.0, timestamp=NOW - 1)
+        writer.publish("COOLANT_TEMP", 190.0, timestamp=NOW - 30)
+
+        readings = buildReadingsFromSnapshot(
+            LiveSnapshotReader(snapPath), BASIC_TIER_DISPLAY_ORDER,
+            maxAgeSeconds=5.0, now=NOW,
+        )
+
+        assert readings == {"RPM": 2500.0}
+
+    def test_aliasFamilyNewestTimestampWins(self, snapPath):
+        writer = LiveSnapshotWriter(snapPath, capacity=8)
+        writer.publish("BATTERY_VOLTAGE", 12.1, timestamp=NOW - 2)
+        writer.publish("BATTERY_V", 14.2, timestamp=NOW - 1)
+        writer.publish("MAF", 9.0, timestamp=NOW)
+
+        readings = buildReadingsFromSnapshot(
+            LiveSnapshotReader(snapPath), BASIC_TIER_DISPLAY_ORDER, now=NOW,
+        )
+
+        assert readings == {"BATTERY_VOLTAGE": 14.2}
+
+    def test_missingSnapshotReturnsEmpty(self, snapPath):
+        assert buildReadingsFromSnapshot(
+            LiveSnapshotReader(snapPath), BASIC_TIER_DISPLAY_ORDER,
+        ) == {}
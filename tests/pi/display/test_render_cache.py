@@ -0,0 +1,198 @@
+################################################################################
+# File Name: test_render_cache.py
+# Purpose/Description: Retained-mode render helpers -- text surface LRU, dirty
+#                      rect merging, frame timer, and the dirty-region
+#                      PrimaryScreenRenderer against full repaints.
+# Author: Rex
+# Creation Date: 2026-10-17
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-17    | Rex          | Initial
+# ================================================================================
+################################################################################
+"""
+Retained-mode render tests.
+
+The helper tests use a counting stand-in font; the renderer tests run real
+pygame on the dummy SDL driver and compare a dirty-region frame with a
+full repaint of the same state rendered in the same process (not a golden
+image).
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from pi.display.render_cache import (
+    FrameTimer,
+    TextSurfaceCache,
+    mergeRects,
+)
+
+pygame = pytest.importorskip("pygame")
+
+from pi.display.screens.primary_renderer import (  # noqa: E402
+    PrimaryScreenRenderer,
+    renderPrimaryScreen,
+)
+from pi.display.screens.primary_screen import buildBasicTierScreenState  # noqa: E402
+
+_THRESHOLDS = {
+    "coolantTemp": {"normalMin": 180.0, "cautionMin": 210.0, "dangerMin": 220.0},
+    "rpm": {"normalMin": 600.0, "cautionMin": 6500.0, "dangerMin": 7000.0},
+}
+
+
+class _CountingFont:
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.renders: list[str] = []
+
+    def render(self, text, antialias, color):
+        self.renders.append(text)
+        return (text, self.size, color)
+
+
+def _state(**readings: float):
+    return buildBasicTierScreenState(readings=readings, thresholdConfigs=_THRESHOLDS)
+
+
+@pytest.fixture
+def _headlessPygame(monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.font.init()
+    yield
+    pygame.display.quit()
+
+
+# ================================================================================
+# TextSurfaceCache
+# ================================================================================
+
+
+class TestTextSurfaceCache:
+
+    def test_sameTextSizeColorRenderedOnce(self):
+        fonts: dict[int, _CountingFont] = {}
+        cache = TextSurfaceCache(lambda size: fonts.setdefault(size, _CountingFont(size)))
+
+        first = cache.render("2500", 42, (255, 255, 255))
+        again = cache.render("2500", 42, (255, 255, 255))
+        cache.render("2500", 42, (220, 30, 30))
+        cache.render("2500", 28, (255, 255, 255))
+
+        assert first is again
+        assert fonts[42].renders == ["2500", "2500"]
+        assert fonts[28].renders == ["2500"]
+        assert (cache.hits, cache.misses) == (1, 3)
+
+    def test_leastRecentlyUsedEvicted(self):
+        font = _CountingFont(16)
+        cache = TextSurfaceCache(lambda size: font, maxEntries=2)
+        cache.render("a", 16, (0, 0, 0))
+        cache.render("b", 16, (0, 0, 0))
+        cache.render("a", 16, (0, 0, 0))  # b is now least recent
+        cache.render("c", 16, (0, 0, 0))
+
+        cache.render("a", 16, (0, 0, 0))
+        cache.render("b", 16, (0, 0, 0))
+
+        assert font.renders == ["a", "b", "c", "b"]
+        assert cache.evictions == 2
+        assert len(cache) == 2
+
+    def test_clearDropsFonts(self):
+        loads: list[int] = []
+        cache = TextSurfaceCache(lambda size: loads.append(size) or _CountingFont(size))
+        cache.render("x", 16, (0, 0, 0))
+        cache.clear()
+        cache.render("x", 16, (0, 0, 0))
+
+        assert loads == [16, 16]
+
+
+# ================================================================================
+# mergeRects / FrameTimer
+# ================================================================================
+
+
+def test_mergeRects_unionsOverlapsAndDropsEmpty():
+    merged = mergeRects([
+        (0, 0, 10, 10), (5, 5, 10, 10), (100, 100, 5, 5), (50, 50, 0, 4),
+    ])
+
+    assert sorted(merged) == [(0, 0, 15, 15), (100, 100, 5, 5)]
+
+
+def test_frameTimer_reportsWallAndCpuPerFrame():
+    ticks = iter([0.0, 0.010, 1.0, 1.030])
+    cpu = iter([5.0, 5.004, 6.0, 6.002])
+    timer = FrameTimer(wallClock=lambda: next(ticks), cpuClock=lambda: next(cpu))
+
+    timer.begin()
+    timer.end([(0, 0, 100, 100)], (100, 100), full=True)
+    timer.begin()
+    timer.end([], (100, 100))
+    stats = timer.getStats()
+
+    assert stats.frameCount == 2
+    assert (stats.fullFrames, stats.skippedFrames) == (1, 1)
+    assert stats.lastFrameMs == pytest.approx(30.0)
+    assert stats.maxFrameMs == pytest.approx(30.0)
+    assert stats.averageCpuMs == pytest.approx(3.0)
+    assert stats.lastDirtyFraction == 0.0
+
+
+# ================================================================================
+# PrimaryScreenRenderer
+# ================================================================================
+
+
+@pytest.mark.usefixtures("_headlessPygame")
+class TestPrimaryScreenRenderer:
+
+    def test_dirtyRegionFramesMatchFullRepaint(self):
+        renderer = PrimaryScreenRenderer()
+        screen = pygame.Surface((480, 320))
+        states = [
+            _state(RPM=800.0, COOLANT_TEMP=185.0, SPEED=0.0),
+            _state(RPM=2500.0, COOLANT_TEMP=185.0, SPEED=0.0),
+            _state(RPM=6800.0, COOLANT_TEMP=215.0, SPEED=42.0),
+            _state(),
+        ]
+
+        for state in states:
+            renderer.render(state, screen)
+            reference = pygame.Surface((480, 320))
+            renderPrimaryScreen(state, reference)
+            assert pygame.image.tobytes(screen, "RGB") == pygame.image.tobytes(
+                reference, "RGB",
+            )
+
+    def test_onlyChangedElementsAreDirty(self):
+        renderer = PrimaryScreenRenderer()
+        screen = pygame.Surface((480, 320))
+
+        assert renderer.render(_state(RPM=800.0), screen) == [(0, 0, 480, 320)]
+        assert renderer.render(_state(RPM=800.0), screen) == []
+        dirty = renderer.render(_state(RPM=3100.0), screen)
+
+        assert dirty
+        assert sum(w * h for _x, _y, w, h in dirty) < 480 * 320 // 4
+        stats = renderer.getStats()
+        assert (stats.frameCount, stats.fullFrames, stats.skippedFrames) == (3, 1, 1)
+        assert stats.textCacheHits > 0
+
+    def test_newSurfaceOrInvalidateRepaintsEverything(self):
+        renderer = PrimaryScreenRenderer()
+        state = _state(RPM=800.0)
+        renderer.render(state, pygame.Surface((480, 320)))
+
+        assert renderer.render(state, pygame.Surface((800, 480))) == [(0, 0, 800, 480)]
+        renderer.invalidate()
+        assert renderer.render(state, pygame.Surface((480, 320))) == [(0, 0, 480, 320)]
@@ -32,6 +32,8 @@
 #                              | tests; added the unconditional-wiring
 #                              | assertion against
 #                              | HardwareManager._initializeShutdownHandler.
+# 2026-10-17    | Rex          | Boot-progress milestones go to tmp_path;
+#                              | the default writer no longer dirties data/.
 # ================================================================================
 ################################################################################
 
@@ -46,13 +48,27 @@ contract and (b) that HardwareManager actually wires it that way.
 
 from __future__ import annotations
 
+import functools
 from unittest.mock import MagicMock, patch
 
+import pytest
+
+from src.pi.diagnostics.boot_progress import markMilestone
+from src.pi.hardware import shutdown_handler
 from src.pi.hardware.hardware_manager import HardwareManager
 from src.pi.hardware.shutdown_handler import ShutdownHandler
 from src.pi.hardware.ups_monitor import PowerSource
 
 
+@pytest.fixture(autouse=True)
+def _bootProgressInTmp(tmp_path, monkeypatch):
+    """Point the default boot-progress writer at tmp_path, not data/."""
+    monkeypatch.setattr(
+        shutdown_handler, '_bpMarkMilestone',
+        functools.partial(markMilestone, filePath=str(tmp_path / 'boot_progress')),
+    )
+
+
 class TestSuppressLegacyTriggersEnabled:
     """suppressLegacyTriggers=True -> both legacy paths are inert."""
 
@@ -19,6 +19,8 @@
 # Date          | Author       | Description
 # ================================================================================
 # 2026-05-15    | Ralph (US-341/US-342) | Initial -- V0.27.11 regression gate.
+# 2026-10-17    | Rex          | Boot-progress milestones go to tmp_path;
+#               |              | the default writer no longer dirties data/.
 # ================================================================================
 ################################################################################
 
@@ -39,11 +41,14 @@ subprocess.run returncode==0; canary probe re-points at this marker
 
 from __future__ import annotations
 
+import functools
 import logging
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.pi.diagnostics.boot_progress import markMilestone
+from src.pi.hardware import shutdown_handler
 from src.pi.hardware.shutdown_handler import (
     SHUTDOWN_SUCCESS_MARKER,
     ShutdownHandler,
@@ -51,6 +56,15 @@ from src.pi.hardware.shutdown_handler import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _bootProgressInTmp(tmp_path, monkeypatch):
+    """Point the default boot-progress writer at tmp_path, not data/."""
+    monkeypatch.setattr(
+        shutdown_handler, '_bpMarkMilestone',
+        functools.partial(markMilestone, filePath=str(tmp_path / 'boot_progress')),
+    )
+
+
 class TestExecuteShutdownSuccessPath:
     """returncode==0 -> emit the canary substring; do NOT raise."""
 
@@ -18,6 +18,9 @@
 #               |              | renders without raising at each size, exposes
 #               |              | the computed DashboardLayout, and routes
 #               |              | updateShutdownStage through to the data lock.
+# 2026-10-17    | Rex          | Dirty-region render: unchanged quadrants are
+#               |              | not repainted; display.update gets only the
+#               |              | changed rects; text surfaces are cached.
 # ================================================================================
 ################################################################################
 
@@ -64,6 +67,7 @@ def fakePygame():
         "envAtInit": None,
         "setModeCalls": [],
         "flipCalls": 0,
+        "updateCalls": [],
         "initCalled": False,
     }
 
@@ -84,6 +88,9 @@ def fakePygame():
     def fakeFlip():
         recorder["flipCalls"] += 1
 
+    def fakeUpdate(rects=None):
+        recorder["updateCalls"].append(list(rects or []))
+
     fake.NOFRAME = 0x80
     fake.QUIT = 256
     fake.init = fakeInit
@@ -102,6 +109,7 @@ def fakePygame():
     displayModule.set_mode = fakeSetMode
     displayModule.set_caption = lambda s: None
     displayModule.flip = fakeFlip
+    displayModule.update = fakeUpdate
     fake.display = displayModule
 
     eventModule = ModuleType("pygame.event")
@@ -533,3 +541,70 @@ class TestShutdownStageUpdate:
         display.updateShutdownStage(ShutdownStage.TRIGGER)
         display.updateShutdownStage("not-a-stage")
         assert display.shutdownStage is ShutdownStage.NORMAL
+
+
+# ================================================================================
+# Dirty-region rendering
+# ================================================================================
+
+
+def _areaOf(rect) -> tuple[int, int, int, int]:
+    return (rect.x, rect.y, rect.width, rect.height)
+
+
+class TestDirtyRegionRender:
+    """After the first full frame only changed quadrants reach the display."""
+
+    def _startedDisplay(self) -> StatusDisplay:
+        display = StatusDisplay(width=1280, height=720)
+        display._isAvailable = True
+        assert display._initializePygame() is True
+        display.updateObdStatus("connected")
+        return display
+
+    def test_firstFrameFlipsWholeScreen(self, pygameInModuleRegistry):
+        _, recorder = pygameInModuleRegistry
+        display = self._startedDisplay()
+
+        display._render()
+
+        assert recorder["flipCalls"] == 1
+        assert recorder["updateCalls"] == []
+        assert display.renderStats.fullFrames == 1
+
+    def test_changedQuadrantOnlyIsUpdated(self, pygameInModuleRegistry):
+        _, recorder = pygameInModuleRegistry
+        display = self._startedDisplay()
+        display._render()
+
+        display.updateObdStatus("reconnecting")
+        display._render()
+
+        assert recorder["flipCalls"] == 1
+        updated = recorder["updateCalls"][-1]
+        assert _areaOf(display.layout.drive) in updated
+        for unchanged in (display.layout.engine, display.layout.power, display.layout.alerts):
+            assert _areaOf(unchanged) not in updated
+
+    def test_unchangedTextIsNotRerendered(self, pygameInModuleRegistry):
+        display = self._startedDisplay()
+        titleFont = display._fonts["title"]
+        display._render()
+        rendersAfterFirstFrame = titleFont.render.call_count
+
+        display.updateShutdownStage("warning")  # power repaints; "Car"/"Unknown" text cached
+        display._render()
+
+        assert titleFont.render.call_count == rendersAfterFirstFrame
+        assert display.renderStats.textCacheHits > 0
+
+    def test_shutdownForcesFullRepaintOnRestart(self, pygameInModuleRegistry):
+        _, recorder = pygameInModuleRegistry
+        display = self._startedDisplay()
+        display._render()
+        display._shutdownPygame()
+
+        assert display._initializePygame() is True
+        display._render()
+
+        assert recorder["flipCalls"] == 2
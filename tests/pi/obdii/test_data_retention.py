@@ -0,0 +1,264 @@
+################################################################################
+# File Name: test_data_retention.py
+# Purpose/Description: Tests for chunked, sync-aware realtime_data retention.
+# Author: Rex
+# Creation Date: 2026-10-16
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-16    | Rex          | Initial
+# 2026-10-17    | Rex          | Streaming statistics baseline reset
+# 2026-10-17    | Rex          | Rate-limited baseline reset
+# ================================================================================
+################################################################################
+
+"""Tests for :class:`DataRetentionManager` cleanup.
+
+Invariants verified:
+
+1. **Sync gate** -- only expired rows at or below the realtime_data
+   sync_log high-water mark are deleted; the rest are reported as awaiting
+   sync.  Cycle frames follow the same rule by their last sample id.
+2. **Batches** -- deletion commits in ``deleteBatchRows``-sized
+   transactions and reports the longest lock hold.
+3. **Reclaim** -- a fresh database is created with incremental
+   auto_vacuum, so cleanup hands pages back and reports the bytes.
+4. **Statistics baseline** -- a cleanup that deletes rows drops the
+   streaming baseline, so the next analysis matches the kept rows -- at
+   most once per ``baselineResetIntervalDays``; a deferred reset is owed
+   and settled by a later cleanup once the interval passes.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from src.pi.analysis.engine import StatisticsEngine
+from src.pi.data import sync_log
+from src.pi.obdii.data.batch_writer import RealtimeFrameWriter
+from src.pi.obdii.data_retention import DataRetentionManager
+from src.pi.obdii.database import ObdDatabase
+
+# ================================================================================
+# Helpers
+# ================================================================================
+
+
+@pytest.fixture
+def db(tmp_path: Path) -> ObdDatabase:
+    database = ObdDatabase(str(tmp_path / "retention.db"))
+    database.initialize()
+    return database
+
+
+def _stamp(daysAgo: float, offsetSeconds: int = 0) -> str:
+    moment = datetime.now(UTC) - timedelta(days=daysAgo) + timedelta(seconds=offsetSeconds)
+    return moment.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def _insertRows(db: ObdDatabase, count: int, daysAgo: float) -> None:
+    with db.connect() as conn:
+        conn.executemany(
+            "INSERT INTO realtime_data (timestamp, parameter_name, value, data_source) "
+            "VALUES (?, 'RPM', ?, 'real')",
+            [(_stamp(daysAgo, i), float(i)) for i in range(count)],
+        )
+
+
+def _markSynced(db: ObdDatabase, throughId: int) -> None:
+    with db.connect() as conn:
+        sync_log.initDb(conn)
+        sync_log.updateHighWaterMark(conn, 'realtime_data', throughId, 'batch-1')
+
+
+def _manager(db: ObdDatabase, **overrides) -> DataRetentionManager:
+    retention = {'realtimeDataDays': 30, 'batchPauseMs': 0, **overrides}
+    return DataRetentionManager(db, {'pi': {'dataRetention': retention}})
+
+
+def _remainingIds(db: ObdDatabase) -> list[int]:
+    with db.connect() as conn:
+        return [r[0] for r in conn.execute("SELECT id FROM realtime_data ORDER BY id")]
+
+
+# ================================================================================
+# Tests
+# ================================================================================
+
+
+class TestSyncGate:
+
+    def test_onlySyncedExpiredRowsDeleted(self, db):
+        _insertRows(db, 100, daysAgo=60)
+        _insertRows(db, 10, daysAgo=1)
+        _markSynced(db, 70)
+
+        result = _manager(db).runCleanup()
+
+        assert result.rowsDeleted == 70
+        assert result.syncedThroughId == 70
+        assert result.rowsAwaitingSync == 30
+        assert _remainingIds(db) == list(range(71, 111))
+
+    def test_neverSynced_deletesNothing(self, db):
+        _insertRows(db, 20, daysAgo=60)
+
+        result = _manager(db).runCleanup()
+
+        assert result.rowsDeleted == 0
+        assert result.rowsAwaitingSync == 20
+
+    def test_requireSyncedOff_deletesAllExpired(self, db):
+        _insertRows(db, 20, daysAgo=60)
+        _insertRows(db, 5, daysAgo=1)
+
+        result = _manager(db, requireSynced=False).runCleanup()
+
+        assert result.rowsDeleted == 20
+        assert result.syncedThroughId is None
+        assert len(_remainingIds(db)) == 5
+
+    def test_frames_deletedOnlyWhenLastSampleSynced(self, db):
+        writer = RealtimeFrameWriter(db, maxBatchRows=10_000)
+        for second in range(3):
+            for name in ('RPM', 'SPEED'):
+                writer.enqueue((_stamp(60, second), name, 1.0, None, None, None, 'real'))
+        writer.stop()
+        with db.connect() as conn:
+            firstIds = [r[0] for r in conn.execute(
+                "SELECT first_sample_id FROM realtime_frames ORDER BY id"
+            )]
+        # Second frame is half-synced: it must survive.
+        _markSynced(db, firstIds[1])
+
+        result = _manager(db).runCleanup()
+
+        assert result.rowsDeleted == 2
+        assert result.rowsAwaitingSync == 4
+        with db.connect() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM realtime_frames").fetchone()[0] == 2
+
+
+class TestBatchedDeletion:
+
+    def test_deletesInBoundedBatches(self, db):
+        _insertRows(db, 1050, daysAgo=60)
+        _markSynced(db, 10_000)
+
+        result = _manager(db, deleteBatchRows=100).runCleanup()
+
+        assert result.rowsDeleted == 1050
+        assert result.batchCount == 11
+        assert result.maxLockHoldMs > 0.0
+        assert _remainingIds(db) == []
+
+    def test_recentRowsInterleavedWithOldOnesSurvive(self, db):
+        _insertRows(db, 10, daysAgo=60)
+        _insertRows(db, 10, daysAgo=1)
+        _insertRows(db, 10, daysAgo=60)
+        _markSynced(db, 30)
+
+        result = _manager(db, deleteBatchRows=4).runCleanup()
+
+        assert result.rowsDeleted == 20
+        assert _remainingIds(db) == list(range(11, 21))
+
+
+class TestReclaim:
+
+    def test_incrementalVacuum_reclaimsBytes(self, db):
+        _insertRows(db, 20_000, daysAgo=60)
+        _markSynced(db, 20_000)
+        with db.connect() as conn:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+        result = _manager(db).runCleanup()
+
+        assert result.reclaimMethod == 'incremental_vacuum'
+        assert result.vacuumPerformed
+        assert result.spaceReclaimedBytes > 0
+
+
+class TestStatisticsBaseline:
+
+    def _analyze(self, db: ObdDatabase) -> int:
+        engine = StatisticsEngine(db, {'pi': {'analysis': {'streamingStatistics': True}}})
+        return engine.calculateStatistics('daily').parameterStats['RPM'].sampleCount
+
+    def _insertProfileRows(self, db: ObdDatabase, count: int, daysAgo: float) -> None:
+        with db.connect() as conn:
+            conn.execute("INSERT OR IGNORE INTO profiles (id, name) VALUES ('daily', 'Daily')")
+            conn.executemany(
+                "INSERT INTO realtime_data "
+                "(timestamp, parameter_name, value, profile_id, data_source) "
+                "VALUES (?, 'RPM', ?, 'daily', 'real')",
+                [(_stamp(daysAgo, i), float(i)) for i in range(count)],
+            )
+
+    def test_deletingCleanup_resetsBaselineToKeptRows(self, db):
+        self._insertProfileRows(db, 50, daysAgo=60)
+        self._insertProfileRows(db, 20, daysAgo=1)
+        assert self._analyze(db) == 70
+
+        result = _manager(db, requireSynced=False).runCleanup()
+
+        assert (result.rowsDeleted, result.baselinesReset) == (50, 1)
+        assert self._analyze(db) == 20
+
+    def test_nothingDeleted_keepsBaseline(self, db):
+        self._insertProfileRows(db, 20, daysAgo=1)
+        self._analyze(db)
+
+        result = _manager(db, requireSynced=False).runCleanup()
+
+        assert result.baselinesReset == 0
+        with db.connect() as conn:
+            assert conn.execute(
+                "SELECT COUNT(*) FROM statistics_accumulators"
+            ).fetchone()[0] == 1
+
+    def test_resetWithinInterval_deferredAndOwed(self, db):
+        self._insertProfileRows(db, 50, daysAgo=60)
+        self._insertProfileRows(db, 20, daysAgo=1)
+        self._analyze(db)
+        assert _manager(db, requireSynced=False).runCleanup().baselinesReset == 1
+        self._insertProfileRows(db, 10, daysAgo=45)
+        assert self._analyze(db) == 30
+
+        result = _manager(db, requireSynced=False).runCleanup()
+
+        assert (result.rowsDeleted, result.baselinesReset) == (10, 0)
+        assert result.baselineResetDeferred
+        assert self._analyze(db) == 30
+
+    def test_owedReset_settledOnceIntervalPasses(self, db):
+        self._insertProfileRows(db, 20, daysAgo=1)
+        self._analyze(db)
+        with db.connect() as conn:
+            conn.executemany(
+                "INSERT INTO connection_log (timestamp, event_type, success) "
+                "VALUES (?, ?, 1)",
+                [
+                    (_stamp(10), 'statistics_baseline_reset'),
+                    (_stamp(9), 'statistics_baseline_reset_owed'),
+                ],
+            )
+
+        result = _manager(db, requireSynced=False).runCleanup()
+
+        assert (result.rowsDeleted, result.baselinesReset) == (0, 1)
+        assert not result.baselineResetDeferred
+
+    def test_zeroInterval_resetsEveryDeletingCleanup(self, db):
+        self._insertProfileRows(db, 20, daysAgo=1)
+        manager = _manager(db, requireSynced=False, baselineResetIntervalDays=0)
+        for _ in range(2):
+            self._insertProfileRows(db, 5, daysAgo=60)
+            self._analyze(db)
+            assert manager.runCleanup().baselinesReset == 1
@@ -0,0 +1,194 @@
+################################################################################
+# File Name: test_event_log_writer.py
+# Purpose/Description: Tests for the shared auxiliary event log writer and the
+#                      alert / power / connection writers routed through it.
+# Author: Rex
+# Creation Date: 2026-10-17
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-17    | Rex          | Initial
+# ================================================================================
+################################################################################
+
+"""Tests for :mod:`src.pi.obdii.data.event_log_writer`.
+
+Invariants verified:
+
+1. **Mixed tables, one transaction** -- rows for several tables queue on
+   one writer and land in order.
+2. **Direct fallback** -- without a running writer each row is written
+   immediately, as before.
+3. **Shutdown stage is synchronous** -- ``logShutdownStage`` flushes the
+   queued rows first and writes its own row without queueing it.
+4. **Producers route through the writer** -- AlertManager, power_db and the
+   connection_log helper queue instead of committing per row.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from src.pi.alert.manager import AlertManager
+from src.pi.data.connection_logger import logConnectionEvent, resetDedupStateForTests
+from src.pi.obdii.data.event_log_writer import (
+    EventLogWriter,
+    createEventLogWriterFromConfig,
+    flushEventLog,
+    writeEventRow,
+)
+from src.pi.obdii.database import ObdDatabase
+from src.pi.power.power_db import logPowerTransition, logShutdownStage
+from src.pi.power.types import PowerSource
+
+_CONNECTION_SQL = "INSERT INTO connection_log (timestamp, event_type) VALUES (?, ?)"
+
+
+@pytest.fixture
+def db(tmp_path: Path) -> ObdDatabase:
+    database = ObdDatabase(str(tmp_path / "event_log.db"), walMode=False)
+    database.initialize()
+    return database
+
+
+@pytest.fixture
+def writer(db: ObdDatabase):
+    # Long age window: nothing flushes in the background during a test.
+    eventWriter = EventLogWriter(db, maxBatchRows=1000, maxBatchAgeMs=600_000)
+    db.eventLogWriter = eventWriter
+    eventWriter.start()
+    yield eventWriter
+    eventWriter.stop()
+    db.eventLogWriter = None
+
+
+@pytest.fixture(autouse=True)
+def _resetConnectionDedup():
+    resetDedupStateForTests()
+    yield
+    resetDedupStateForTests()
+
+
+def _count(database: ObdDatabase, table: str) -> int:
+    with database.connect() as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+# ================================================================================
+# Writer
+# ================================================================================
+
+
+class TestEventLogWriter:
+
+    def test_mixedTablesLandInOneFlushInOrder(self, db, writer):
+        for i in range(3):
+            writeEventRow(db, _CONNECTION_SQL, (f'2026-10-17T00:00:0{i}Z', f'evt_{i}'))
+        logPowerTransition(db, 'transition_to_battery', None, PowerSource.BATTERY)
+        writeEventRow(db, _CONNECTION_SQL, ('2026-10-17T00:00:09Z', 'evt_3'))
+
+        assert _count(db, 'connection_log') == 0
+        assert writer.flush('forced') == 5
+
+        with db.connect() as conn:
+            events = [r[0] for r in conn.execute(
+                "SELECT event_type FROM connection_log ORDER BY id"
+            )]
+        assert events == ['evt_0', 'evt_1', 'evt_2', 'evt_3']
+        assert _count(db, 'power_log') == 1
+        assert writer.getStats().flushCount == 1
+
+    def test_rejectedRowIsDroppedWithoutBlockingTheBatch(self, db, writer):
+        badAlert = (
+            "INSERT INTO alert_log (timestamp, alert_type, parameter_name, value, "
+            "threshold, profile_id) VALUES (?, ?, ?, ?, ?, ?)"
+        )
+        writeEventRow(db, _CONNECTION_SQL, ('2026-10-17T00:00:00Z', 'before'))
+        writeEventRow(db, badAlert, ('2026-10-17T00:00:01Z', 'rpm_redline', 'RPM',
+                                     7200.0, 7000.0, 'no_such_profile'))
+        writeEventRow(db, _CONNECTION_SQL, ('2026-10-17T00:00:02Z', 'after'))
+
+        writer.flush('forced')
+
+        assert writer.queueDepth == 0
+        assert (_count(db, 'connection_log'), _count(db, 'alert_log')) == (2, 0)
+        assert writer.getStats().rowsDropped == 1
+
+    def test_noRunningWriterWritesImmediately(self, db):
+        stopped = EventLogWriter(db)
+        db.eventLogWriter = stopped  # attached but never started
+
+        writeEventRow(db, _CONNECTION_SQL, ('2026-10-17T00:00:00Z', 'direct'))
+
+        assert _count(db, 'connection_log') == 1
+        assert stopped.queueDepth == 0
+        assert flushEventLog(db) == 0
+
+    def test_factoryHonoursEnabledFlag(self, db):
+        config = {'pi': {'database': {'eventLog': {'enabled': True, 'maxBatchRows': 7}}}}
+
+        created = createEventLogWriterFromConfig(config, db)
+
+        assert isinstance(created, EventLogWriter)
+        assert created.maxBatchRows == 7
+        assert createEventLogWriterFromConfig({}, db) is None
+        assert createEventLogWriterFromConfig(config, None) is None
+
+
+# ================================================================================
+# Shutdown stage
+# ================================================================================
+
+
+class TestShutdownStage:
+
+    def test_stageRowFlushesQueueThenWritesDirectly(self, db, writer):
+        logPowerTransition(db, 'transition_to_battery', None, PowerSource.BATTERY)
+        writeEventRow(db, _CONNECTION_SQL, ('2026-10-17T00:00:00Z', 'bt_disconnect'))
+
+        logShutdownStage(db, 'stage_warning', 3.55)
+
+        assert writer.queueDepth == 0
+        assert writer.getStats().flushesByReason == {'shutdown_stage': 1}
+        with db.connect() as conn:
+            rows = conn.execute(
+                "SELECT event_type, vcell FROM power_log ORDER BY id"
+            ).fetchall()
+        assert [tuple(r) for r in rows] == [
+            ('transition_to_battery', None),
+            ('stage_warning', 3.55),
+        ]
+        assert _count(db, 'connection_log') == 1
+
+
+# ================================================================================
+# Producers
+# ================================================================================
+
+
+class TestProducersQueue:
+
+    def test_alertAndConnectionRowsQueueUntilFlush(self, db, writer):
+        with db.connect() as conn:
+            conn.execute("INSERT INTO profiles (id, name) VALUES ('daily', 'Daily')")
+        manager = AlertManager(database=db, cooldownSeconds=30)
+        manager.setThresholdsFromConfig({
+            'pi': {
+                'tieredThresholds': {'rpm': {'dangerMin': 7000}},
+                'profiles': {'availableProfiles': [{'id': 'daily'}]},
+            },
+        })
+        manager.setActiveProfile('daily')
+        manager.start()
+
+        assert manager.checkValue('RPM', 7200.0) is not None
+        logConnectionEvent(db, 'bt_disconnect', macAddress='00:11:22:33:44:55')
+
+        assert (_count(db, 'alert_log'), _count(db, 'connection_log')) == (0, 0)
+        writer.stop()
+        assert (_count(db, 'alert_log'), _count(db, 'connection_log')) == (1, 1)
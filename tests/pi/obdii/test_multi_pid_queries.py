@@ -0,0 +1,268 @@
+################################################################################
+# File Name: test_multi_pid_queries.py
+# Purpose/Description: Tests for multi-PID Mode 01 batched queries --
+#                      decoders framing helpers, ObdConnection.queryBatch,
+#                      SimulatedObdConnection emulation, realtime fallback.
+# Author: Rex
+# Creation Date: 2026-10-16
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-16    | Rex          | Initial
+# 2026-10-17    | Rex          | Batched readings: pid debug record and
+#               |              | parse-time timestamps.
+# ================================================================================
+################################################################################
+
+"""Tests for multi-PID Mode 01 batching.
+
+Invariants verified:
+
+1. **Framing** -- PIDs pack six per request; a reply splits back into
+   per-PID data, stopping cleanly at an unknown or truncated PID.
+2. **Demultiplexed responses decode like single queries** -- each PID
+   runs through its own python-obd decoder.
+3. **ECU rejection** -- repeated empty replies disable batching for the
+   connection; the caller falls back to single-PID queries.
+4. **Realtime fallback** -- parameters the batch did not serve are still
+   read one at a time in the same cycle.
+5. **Batched reading records** -- each batched reading is stamped when its
+   response was parsed and keeps the v2 ``pid`` in its debug record.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
+
+import obd as obdlib
+from obd.protocols.protocol import Message
+
+from src.pi.obdii.data.logger import ObdDataLogger
+from src.pi.obdii.data.realtime import RealtimeDataLogger
+from src.pi.obdii.data.types import LoggedReading
+from src.pi.obdii.decoders import (
+    demultiplexMode01Response,
+    formatMode01Request,
+    packMode01Requests,
+)
+from src.pi.obdii.obd_connection import MULTI_PID_REJECT_LIMIT, ObdConnection
+from src.pi.obdii.simulator.simulated_connection import SimulatedObdConnection
+
+# ================================================================================
+# Helpers
+# ================================================================================
+
+
+class _FakeElmObd:
+    """python-obd OBD stand-in answering multi-PID requests from a byte map."""
+
+    def __init__(self, pidData: dict[int, bytes], reject: bool = False) -> None:
+        self.pidData = pidData
+        self.reject = reject
+        self.sent: list[bytes] = []
+
+    def is_connected(self) -> bool:
+        return True
+
+    def supports(self, cmd: Any) -> bool:
+        return True
+
+    def query(self, cmd: Any, force: bool = False) -> Any:
+        self.sent.append(cmd.command)
+        if self.reject:
+            return SimpleNamespace(messages=[])
+        payload = bytearray([0x41])
+        hexPids = cmd.command[2:].decode()
+        for i in range(0, len(hexPids), 2):
+            pid = int(hexPids[i:i + 2], 16)
+            if pid in self.pidData:
+                payload += bytes([pid]) + self.pidData[pid]
+        message = Message([])
+        message.ecu = obdlib.ECU.ENGINE
+        message.data = payload
+        return SimpleNamespace(messages=[message])
+
+
+def _buildConnection(obd: _FakeElmObd) -> ObdConnection:
+    conn = ObdConnection(config={})
+    conn.obd = obd
+    return conn
+
+
+# ================================================================================
+# Framing helpers
+# ================================================================================
+
+
+class TestFraming:
+
+    def test_packMode01Requests_sevenPids_splitsSixPlusOneAndDedupes(self):
+        chunks = packMode01Requests([0x0C, 0x0D, 0x05, 0x01, 0x01, 0x04, 0x0E, 0x0F])
+        assert chunks == [[0x0C, 0x0D, 0x05, 0x01, 0x04, 0x0E], [0x0F]]
+
+    def test_formatMode01Request_buildsHexString(self):
+        assert formatMode01Request([0x0C, 0x0D, 0x05]) == b"010C0D05"
+
+    def test_demultiplex_threePids_splitsData(self):
+        data = bytes([0x41, 0x0C, 0x1A, 0xF8, 0x0D, 0x32, 0x05, 0x7B])
+        parts = demultiplexMode01Response(data, {0x0C: 2, 0x0D: 1, 0x05: 1})
+        assert parts == {0x0C: b"\x1a\xf8", 0x0D: b"\x32", 0x05: b"\x7b"}
+
+    def test_demultiplex_truncatedTail_keepsParsedPrefix(self):
+        data = bytes([0x41, 0x0D, 0x32, 0x0C, 0x1A])
+        parts = demultiplexMode01Response(data, {0x0C: 2, 0x0D: 1})
+        assert parts == {0x0D: b"\x32"}
+
+    def test_demultiplex_negativeResponse_returnsEmpty(self):
+        assert demultiplexMode01Response(bytes([0x7F, 0x01, 0x12]), {0x0C: 2}) == {}
+
+
+# ================================================================================
+# ObdConnection.queryBatch
+# ================================================================================
+
+
+class TestObdConnectionQueryBatch:
+
+    def test_queryBatch_decodesEachPidLikeASingleQuery(self):
+        fake = _FakeElmObd({0x0C: b"\x1a\xf8", 0x0D: b"\x32", 0x05: b"\x7b"})
+        conn = _buildConnection(fake)
+        commands = [obdlib.commands.RPM, obdlib.commands.SPEED, obdlib.commands.COOLANT_TEMP]
+
+        responses = conn.queryBatch(commands)
+
+        assert fake.sent == [b"010C0D05"]
+        assert responses['RPM'].value.magnitude == 0x1AF8 / 4
+        assert responses['SPEED'].value.magnitude == 0x32
+        assert responses['COOLANT_TEMP'].value.magnitude == 0x7B - 40
+
+    def test_queryBatch_pidMissingFromReply_isOmitted(self):
+        fake = _FakeElmObd({0x0C: b"\x0b\xb8"})
+        conn = _buildConnection(fake)
+
+        responses = conn.queryBatch([obdlib.commands.RPM, obdlib.commands.SPEED])
+
+        assert set(responses) == {'RPM'}
+
+    def test_queryBatch_repeatedRejections_disablesBatching(self):
+        fake = _FakeElmObd({}, reject=True)
+        conn = _buildConnection(fake)
+        commands = [obdlib.commands.RPM, obdlib.commands.SPEED]
+
+        for _ in range(MULTI_PID_REJECT_LIMIT):
+            assert conn.queryBatch(commands) == {}
+        assert conn.multiPidSupported is False
+
+        fake.sent.clear()
+        assert conn.queryBatch(commands) == {}
+        assert fake.sent == []
+
+    def test_queryBatch_adapterCommand_isNotBatched(self):
+        fake = _FakeElmObd({0x0C: b"\x0b\xb8"})
+        conn = _buildConnection(fake)
+
+        responses = conn.queryBatch([obdlib.commands.RPM, obdlib.commands.ELM_VOLTAGE])
+
+        assert responses == {}
+        assert fake.sent == []
+
+
+# ================================================================================
+# Simulator + realtime fallback
+# ================================================================================
+
+
+class TestSimulatedBatching:
+
+    def test_queryParameterBatch_simulated_servesSixPerRoundTrip(self):
+        conn = SimulatedObdConnection(connectionDelaySeconds=0.0)
+        conn.connect()
+        dataLogger = ObdDataLogger(conn, MagicMock())
+        names = ['RPM', 'SPEED', 'COOLANT_TEMP', 'ENGINE_LOAD',
+                 'THROTTLE_POS', 'INTAKE_TEMP', 'TIMING_ADVANCE']
+
+        readings = dataLogger.queryParameterBatch(names)
+
+        assert set(readings) == set(names)
+        assert conn.batchRequestCount == 2
+
+    def test_pollCycle_ecuRejectsBatch_readsEveryParameterSingly(self):
+        conn = SimulatedObdConnection(connectionDelaySeconds=0.0, multiPidSupported=False)
+        conn.connect()
+        config = {'pi': {'realtimeData': {
+            'multiPidQueries': True,
+            'parameters': [
+                {'name': 'RPM', 'logData': True},
+                {'name': 'SPEED', 'logData': True},
+            ],
+        }}}
+        rt = RealtimeDataLogger(config, conn, MagicMock(), batchWriter=None)
+        rt._logReadingSafe = lambda reading: True  # type: ignore[method-assign]
+
+        rt._pollCycle()
+
+        assert rt.getStats().parametersLogged == {'RPM': 1, 'SPEED': 1}
+        assert conn.batchRequestCount == 0
+
+
+# ================================================================================
+# Batched reading records
+# ================================================================================
+
+
+class TestBatchedReadingRecords:
+
+    def test_queryParameterBatch_stampsParseTimeAndLogsPid(self, caplog):
+        fake = _FakeElmObd({0x0C: b"\x0b\xb8", 0x0D: b"\x32", 0x33: b"\x65"})
+        conn = _buildConnection(fake)
+        served: dict[str, Any] = {}
+        realQueryBatch = conn.queryBatch
+
+        def _capture(commands: list[Any]) -> dict[str, Any]:
+            served.update(realQueryBatch(commands))
+            return served
+
+        conn.queryBatch = _capture  # type: ignore[method-assign]
+        dataLogger = ObdDataLogger(conn, MagicMock())
+
+        with caplog.at_level(logging.DEBUG, logger='src.pi.obdii.data.logger'):
+            readings = dataLogger.queryParameterBatch(['RPM', 'SPEED', 'BAROMETRIC_KPA'])
+
+        assert readings['RPM'].timestamp == datetime.fromtimestamp(served['RPM'].time)
+        assert readings['BAROMETRIC_KPA'].timestamp == datetime.fromtimestamp(
+            served['BAROMETRIC_PRESSURE'].time,
+        )
+        assert "Read v2 parameter | name=BAROMETRIC_KPA | pid=0x33" in caplog.text
+
+    def test_pollCycle_keepsBatchedTimestamp_stampsSingleReads(self):
+        config = {'pi': {'realtimeData': {
+            'multiPidQueries': True,
+            'parameters': [
+                {'name': 'RPM', 'logData': True},
+                {'name': 'SPEED', 'logData': True},
+            ],
+        }}}
+        rt = RealtimeDataLogger(config, MagicMock(), MagicMock(), batchWriter=None)
+        parsedAt = datetime(2026, 10, 17, 8, 0, 0, 250000)
+        staleAt = datetime(2020, 1, 1)
+        logged: list[LoggedReading] = []
+        rt._prefetchBatch = lambda names: {  # type: ignore[method-assign]
+            'RPM': LoggedReading(parameterName='RPM', value=800.0, timestamp=parsedAt),
+        }
+        rt._queryParameterSafe = lambda name: LoggedReading(  # type: ignore[method-assign]
+            parameterName=name, value=40.0, timestamp=staleAt,
+        )
+        rt._logReadingSafe = logged.append  # type: ignore[method-assign, assignment]
+
+        rt._pollCycle()
+
+        stamps = {reading.parameterName: reading.timestamp for reading in logged}
+        assert stamps['RPM'] == parsedAt
+        assert stamps['SPEED'] > staleAt
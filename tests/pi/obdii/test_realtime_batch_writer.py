@@ -0,0 +1,220 @@
+################################################################################
+# File Name: test_realtime_batch_writer.py
+# Purpose/Description: Tests for the write-behind realtime_data batch writer
+#                      and its ObdDataLogger / RealtimeDataLogger wiring.
+# Author: Rex
+# Creation Date: 2026-10-16
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-16    | Rex          | Initial -- size/age/stop flush, overflow drop,
+#               |              | failed-flush requeue, enqueue-time drive_id
+#               |              | stamping, stop() drain.
+# ================================================================================
+################################################################################
+
+"""Tests for :mod:`src.pi.obdii.data.batch_writer`.
+
+Invariants verified:
+
+1. **Size trigger** -- ``maxBatchRows`` queued rows land in one flush.
+2. **Age trigger** -- a partial batch lands once the oldest row ages out.
+3. **Overflow** -- rows beyond ``maxQueueRows`` are dropped and counted,
+   never blocking the producer.
+4. **Failure requeue** -- a failed flush puts the batch back in order.
+5. **drive_id is stamped at enqueue** -- a flush after the drive closed
+   still attributes rows to the drive they were captured in.
+6. **stop() drains** -- RealtimeDataLogger.stop() leaves no queued rows.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.pi.obdii.data.batch_writer import (
+    RealtimeBatchWriter,
+    createBatchWriterFromConfig,
+)
+from src.pi.obdii.data.logger import ObdDataLogger
+from src.pi.obdii.data.realtime import RealtimeDataLogger
+from src.pi.obdii.data.types import LoggedReading
+from src.pi.obdii.database import ObdDatabase
+from src.pi.obdii.drive_id import setCurrentDriveId
+
+# ================================================================================
+# Helpers
+# ================================================================================
+
+
+@pytest.fixture
+def db(tmp_path: Path) -> ObdDatabase:
+    database = ObdDatabase(str(tmp_path / "batch_writer.db"), walMode=False)
+    database.initialize()
+    return database
+
+
+@pytest.fixture(autouse=True)
+def _resetDriveId():
+    setCurrentDriveId(None)
+    yield
+    setCurrentDriveId(None)
+
+
+def _row(name: str = 'RPM', value: float = 850.0, driveId: int | None = None) -> tuple:
+    return ('2026-10-16T12:00:00Z', name, value, 'rpm', None, driveId, 'real')
+
+
+def _countRows(database: ObdDatabase) -> int:
+    with database.connect() as conn:
+        return conn.execute("SELECT COUNT(*) FROM realtime_data").fetchone()[0]
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+# ================================================================================
+# Flush triggers
+# ================================================================================
+
+
+class TestFlushTriggers:
+
+    def test_flush_sizeTrigger_writesWholeBatchInOneTransaction(self, db):
+        writer = RealtimeBatchWriter(db, maxBatchRows=5, maxBatchAgeMs=60_000)
+        writer.start()
+        try:
+            for i in range(5):
+                assert writer.enqueue(_row(value=float(i)))
+            deadline = time.monotonic() + 5.0
+            while writer.getStats().rowsFlushed < 5 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            writer.stop()
+
+        stats = writer.getStats()
+        assert _countRows(db) == 5
+        assert stats.flushesByReason.get('size') == 1
+
+    def test_dueReason_oldestRowPastMaxAge_returnsAge(self, db):
+        clock = _FakeClock()
+        writer = RealtimeBatchWriter(
+            db, maxBatchRows=100, maxBatchAgeMs=2000, monotonicFn=clock,
+        )
+        writer.enqueue(_row())
+        clock.now += 1.5
+        assert writer._dueReason() is None
+        clock.now += 0.6
+        assert writer._dueReason() == 'age'
+
+    def test_stop_partialBatch_flushesRemainingRows(self, db):
+        writer = RealtimeBatchWriter(db, maxBatchRows=100, maxBatchAgeMs=60_000)
+        writer.start()
+        for _ in range(3):
+            writer.enqueue(_row())
+
+        assert writer.stop() is True
+        assert _countRows(db) == 3
+        assert writer.getStats().flushesByReason.get('stop') == 1
+
+    def test_flush_emptyQueue_returnsZeroWithoutOpeningConnection(self):
+        database = MagicMock()
+        writer = RealtimeBatchWriter(database)
+        assert writer.flush('forced') == 0
+        database.openPersistentConnection.assert_not_called()
+
+
+# ================================================================================
+# Overflow + failure handling
+# ================================================================================
+
+
+class TestOverflowAndFailure:
+
+    def test_enqueue_queueFull_dropsAndCounts(self, db):
+        writer = RealtimeBatchWriter(db, maxBatchRows=2, maxQueueRows=3)
+        results = [writer.enqueue(_row()) for _ in range(5)]
+
+        assert results == [True, True, True, False, False]
+        stats = writer.getStats()
+        assert stats.rowsDropped == 2
+        assert stats.queueDepth == 3
+        assert stats.peakQueueDepth == 3
+
+    def test_flush_databaseError_requeuesBatchInOrder(self):
+        failing = MagicMock()
+        failing.executemany.side_effect = sqlite3.OperationalError("disk I/O error")
+        failing.__enter__ = MagicMock(return_value=failing)
+        failing.__exit__ = MagicMock(return_value=False)
+        database = MagicMock()
+        database.openPersistentConnection.return_value = failing
+
+        writer = RealtimeBatchWriter(database, maxBatchRows=10)
+        writer.enqueue(_row(value=1.0))
+        writer.enqueue(_row(value=2.0))
+
+        assert writer.flush('forced') == 0
+        stats = writer.getStats()
+        assert stats.flushErrors == 1
+        assert stats.queueDepth == 2
+        assert [r[2] for r in writer._queue] == [1.0, 2.0]
+        failing.close.assert_called_once()
+
+    def test_init_nonPositiveBound_raises(self, db):
+        with pytest.raises(ValueError):
+            RealtimeBatchWriter(db, maxBatchRows=0)
+
+
+# ================================================================================
+# Logger wiring
+# ================================================================================
+
+
+class TestLoggerWiring:
+
+    def test_logReading_batched_stampsDriveIdAtEnqueue(self, db):
+        writer = RealtimeBatchWriter(db, maxBatchRows=100)
+        dataLogger = ObdDataLogger(MagicMock(), db, dataSource='real', batchWriter=writer)
+
+        setCurrentDriveId(7)
+        assert dataLogger.logReading(
+            LoggedReading(parameterName='RPM', value=900.0, timestamp=datetime.now(), unit='rpm')
+        )
+        setCurrentDriveId(None)
+        assert _countRows(db) == 0
+
+        writer.flush('drive_end')
+        with db.connect() as conn:
+            driveId = conn.execute("SELECT drive_id FROM realtime_data").fetchone()[0]
+        assert driveId == 7
+
+    def test_createBatchWriterFromConfig_disabled_returnsNone(self, db):
+        config = {'pi': {'realtimeData': {'batchWriter': {'enabled': False}}}}
+        assert createBatchWriterFromConfig(config, db) is None
+        assert createBatchWriterFromConfig({}, db) is None
+
+    def test_realtimeLoggerStop_drainsQueuedRows(self, db):
+        writer = RealtimeBatchWriter(db, maxBatchRows=100, maxBatchAgeMs=60_000)
+        config = {'pi': {'realtimeData': {'parameters': []}}}
+        realtime = RealtimeDataLogger(config, MagicMock(), db, batchWriter=writer)
+        writer.start()
+        writer.enqueue(_row())
+        writer.enqueue(_row())
+
+        realtime.stop()
+
+        assert _countRows(db) == 2
+        assert realtime.getWriterStats().queueDepth == 0
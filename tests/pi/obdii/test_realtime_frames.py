@@ -0,0 +1,285 @@
+################################################################################
+# File Name: test_realtime_frames.py
+# Purpose/Description: Tests for cycle-frame realtime storage and the
+#                      realtime_samples compatibility view.
+# Author: Rex
+# Creation Date: 2026-10-16
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-16    | Rex          | Initial
+# ================================================================================
+################################################################################
+
+"""Tests for :mod:`src.pi.obdii.realtime_frames`.
+
+Invariants verified:
+
+1. **Round trip** -- rows written as frames read back from
+   ``realtime_samples`` in the legacy ``realtime_data`` shape.
+2. **Grouping** -- one frame per (timestamp, profile, drive, source) cycle;
+   a repeated parameter in the same second opens a new frame.
+3. **One id space** -- frame sample ids sit above legacy row ids and the
+   sync cursor, and row-at-a-time writes after frames get higher ids still.
+4. **Readers** -- sync delta paging, StatisticsEngine fetch and the live
+   readings poll all see frame samples.
+5. **Compact** -- a frame-stored drive takes several times fewer bytes.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from src.pi.analysis.engine import StatisticsEngine
+from src.pi.data import sync_log
+from src.pi.display.live_readings import buildReadingsFromDb
+from src.pi.obdii.data.batch_writer import (
+    RealtimeBatchWriter,
+    RealtimeFrameWriter,
+    createBatchWriterFromConfig,
+)
+from src.pi.obdii.database import ObdDatabase
+from src.pi.obdii.realtime_frames import (
+    FRAME_SAMPLE_ID_BASE,
+    getMaxSampleId,
+    getSamplesAfter,
+)
+
+# ================================================================================
+# Helpers
+# ================================================================================
+
+_PARAMS = (('RPM', 'rpm'), ('SPEED', 'km/h'), ('COOLANT_TEMP', 'C'), ('TIMING_ADVANCE', ''))
+
+
+@pytest.fixture
+def db(tmp_path: Path) -> ObdDatabase:
+    database = ObdDatabase(str(tmp_path / "frames.db"), walMode=False)
+    database.initialize()
+    return database
+
+
+def _cycleRows(second: int, driveId: int | None = 7, base: float = 0.0) -> list[tuple]:
+    timestamp = f'2026-10-16T12:{second // 60:02d}:{second % 60:02d}Z'
+    return [
+        (timestamp, name, base + index + second / 10.0, unit or None, None, driveId, 'real')
+        for index, (name, unit) in enumerate(_PARAMS)
+    ]
+
+
+def _writeFrames(database: ObdDatabase, rows: list[tuple]) -> None:
+    writer = RealtimeFrameWriter(database, maxBatchRows=10_000)
+    for row in rows:
+        writer.enqueue(row)
+    assert writer.flush('test') == len(rows)
+    writer.stop()
+
+
+def _samples(database: ObdDatabase) -> list[tuple]:
+    with database.connect() as conn:
+        return [
+            tuple(r) for r in conn.execute(
+                "SELECT id, timestamp, parameter_name, value, unit, profile_id, "
+                "data_source, drive_id FROM realtime_samples ORDER BY id"
+            )
+        ]
+
+
+# ================================================================================
+# Storage
+# ================================================================================
+
+
+class TestFrameStorage:
+
+    def test_roundTrip_viewReturnsLegacyShape(self, db):
+        rows = _cycleRows(1) + _cycleRows(2)
+        _writeFrames(db, rows)
+
+        samples = _samples(db)
+
+        assert [s[1:] for s in samples] == [
+            (ts, name, value, unit, profile, source, drive)
+            for ts, name, value, unit, profile, drive, source in rows
+        ]
+        assert [s[0] for s in samples] == list(
+            range(FRAME_SAMPLE_ID_BASE, FRAME_SAMPLE_ID_BASE + len(rows))
+        )
+
+    def test_grouping_oneFramePerCycleAndSharedLayout(self, db):
+        repeated = _cycleRows(3)
+        repeated.append(repeated[0])  # same PID again inside the same second
+        _writeFrames(db, _cycleRows(1) + _cycleRows(2) + repeated)
+
+        with db.connect() as conn:
+            frames = conn.execute("SELECT COUNT(*) FROM realtime_frames").fetchone()[0]
+            layouts = conn.execute(
+                "SELECT COUNT(*) FROM realtime_frame_layouts"
+            ).fetchone()[0]
+            pids = conn.execute("SELECT COUNT(*) FROM realtime_pid_dict").fetchone()[0]
+        assert frames == 4
+        assert layouts == 2  # full cycle + the single-PID spill frame
+        assert pids == len(_PARAMS)
+
+    def test_driveChange_splitsFrames(self, db):
+        _writeFrames(db, _cycleRows(1, driveId=7) + _cycleRows(1, driveId=8))
+
+        with db.connect() as conn:
+            drives = [r[0] for r in conn.execute(
+                "SELECT drive_id FROM realtime_frames ORDER BY id"
+            )]
+        assert drives == [7, 8]
+
+    def test_legacyRowsAfterFrames_getHigherIds(self, db):
+        _writeFrames(db, _cycleRows(1))
+        writer = RealtimeBatchWriter(db)
+        writer.enqueue(_cycleRows(2)[0])
+        writer.stop()
+
+        with db.connect() as conn:
+            legacyId = conn.execute("SELECT MAX(id) FROM realtime_data").fetchone()[0]
+        assert legacyId > FRAME_SAMPLE_ID_BASE + len(_PARAMS) - 1
+        _writeFrames(db, _cycleRows(3))
+        assert _samples(db)[-1][0] == legacyId + len(_PARAMS)
+
+    def test_frameIds_startAboveSyncCursor(self, db):
+        with db.connect() as conn:
+            sync_log.initDb(conn)
+            sync_log.updateHighWaterMark(
+                conn, 'realtime_data', FRAME_SAMPLE_ID_BASE + 500, 'batch-1'
+            )
+        _writeFrames(db, _cycleRows(1))
+
+        assert _samples(db)[0][0] == FRAME_SAMPLE_ID_BASE + 501
+
+    def test_framesAreSeveralTimesSmallerThanRows(self, tmp_path):
+        rowsDb = ObdDatabase(str(tmp_path / "rows.db"), walMode=False)
+        framesDb = ObdDatabase(str(tmp_path / "frames_size.db"), walMode=False)
+        rowsDb.initialize()
+        framesDb.initialize()
+        rows = [row for second in range(1500) for row in _cycleRows(second)]
+
+        writer = RealtimeBatchWriter(rowsDb, maxBatchRows=10_000)
+        for row in rows:
+            writer.enqueue(row)
+        writer.stop()
+        _writeFrames(framesDb, rows)
+
+        emptyDb = ObdDatabase(str(tmp_path / "empty.db"), walMode=False)
+        emptyDb.initialize()
+        for database in (rowsDb, framesDb, emptyDb):
+            database.vacuum()
+        emptySize = os.path.getsize(emptyDb.dbPath)
+        rowsBytes = os.path.getsize(rowsDb.dbPath) - emptySize
+        framesBytes = os.path.getsize(framesDb.dbPath) - emptySize
+        assert framesBytes * 3 < rowsBytes
+
+
+# ================================================================================
+# Readers
+# ================================================================================
+
+
+class TestReaders:
+
+    def test_syncDelta_mergesRowsAndFramesById(self, db):
+        writer = RealtimeBatchWriter(db)
+        for row in _cycleRows(1):
+            writer.enqueue(row)
+        writer.stop()
+        _writeFrames(db, _cycleRows(2) + _cycleRows(3))
+
+        with db.connect() as conn:
+            firstPage = sync_log.getDeltaRows(conn, 'realtime_data', 0, 6)
+            secondPage = sync_log.getDeltaRows(
+                conn, 'realtime_data', firstPage[-1]['id'], 100
+            )
+
+        ids = [r['id'] for r in firstPage + secondPage]
+        assert len(ids) == 3 * len(_PARAMS)
+        assert ids == sorted(ids)
+        assert set(firstPage[0]) >= {
+            'id', 'timestamp', 'parameter_name', 'value', 'unit',
+            'profile_id', 'data_source', 'drive_id',
+        }
+        assert secondPage[-1]['parameter_name'] == 'TIMING_ADVANCE'
+        assert secondPage[-1]['unit'] is None
+
+    def test_getSamplesAfter_startsMidFrame(self, db):
+        _writeFrames(db, _cycleRows(1) + _cycleRows(2))
+
+        with db.connect() as conn:
+            samples = getSamplesAfter(conn, FRAME_SAMPLE_ID_BASE + 1, 3)
+            assert getMaxSampleId(conn) == FRAME_SAMPLE_ID_BASE + 2 * len(_PARAMS) - 1
+
+        assert [s['id'] for s in samples] == [
+            FRAME_SAMPLE_ID_BASE + 2, FRAME_SAMPLE_ID_BASE + 3, FRAME_SAMPLE_ID_BASE + 4,
+        ]
+
+    def test_statisticsEngine_readsFrameSamples(self, db):
+        with db.connect() as conn:
+            conn.execute("INSERT OR IGNORE INTO profiles (id, name) VALUES ('daily', 'Daily')")
+        rows = [
+            row[:4] + ('daily',) + row[5:]
+            for second in range(5) for row in _cycleRows(second)
+        ]
+        _writeFrames(db, rows)
+
+        data = StatisticsEngine(db, {})._fetchParameterData('daily')
+
+        assert data['RPM'] == pytest.approx([s / 10.0 for s in range(5)])
+        assert len(data['SPEED']) == 5
+
+    def test_liveReadings_newestSampleWinsAcrossFormats(self, db):
+        writer = RealtimeBatchWriter(db)
+        for row in _cycleRows(1, base=100.0):
+            writer.enqueue(row)
+        writer.stop()
+        _writeFrames(db, _cycleRows(2, base=200.0))
+
+        readings = buildReadingsFromDb(Path(db.dbPath), ['RPM', 'SPEED'])
+
+        assert readings == {'RPM': pytest.approx(200.2), 'SPEED': pytest.approx(201.2)}
+
+
+# ================================================================================
+# Config
+# ================================================================================
+
+
+class TestConfig:
+
+    def test_storageFormatFrames_selectsFrameWriterEvenWhenBatchingOff(self, db):
+        config = {'pi': {'realtimeData': {
+            'storageFormat': 'frames', 'batchWriter': {'enabled': False},
+        }}}
+        assert isinstance(createBatchWriterFromConfig(config, db), RealtimeFrameWriter)
+
+    def test_storageFormatRows_keepsLegacyWriter(self, db):
+        config = {'pi': {'realtimeData': {
+            'storageFormat': 'rows', 'batchWriter': {'enabled': True},
+        }}}
+        writer = createBatchWriterFromConfig(config, db)
+        assert type(writer) is RealtimeBatchWriter
+
+    def test_failedFlush_requeuesAndResetsPackerCache(self, db, monkeypatch):
+        writer = RealtimeFrameWriter(db)
+        for row in _cycleRows(1):
+            writer.enqueue(row)
+
+        def boom(*_args):
+            raise sqlite3.OperationalError("disk I/O error")
+
+        monkeypatch.setattr(writer._packer, '_nextSampleId', boom)
+        assert writer.flush('test') == 0
+        assert writer.queueDepth == len(_PARAMS)
+        monkeypatch.undo()
+        writer.stop()
+        assert len(_samples(db)) == len(_PARAMS)
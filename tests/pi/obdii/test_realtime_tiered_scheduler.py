@@ -0,0 +1,169 @@
+################################################################################
+# File Name: test_realtime_tiered_scheduler.py
+# Purpose/Description: Tests for RealtimeDataLogger's tiered scheduler mode
+#                      (pi.realtimeData.schedulerMode='tiered').
+# Author: Rex
+# Creation Date: 2026-10-16
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-16    | Rex          | Initial -- per-cycle PID set, flat fallback,
+#               |              | achieved vs target sample rates.
+# 2026-10-17    | Rex          | Shipped config polls flat by default.
+# ================================================================================
+################################################################################
+
+"""Tests for the tiered scheduler in :mod:`src.pi.obdii.data.realtime`.
+
+Invariants verified:
+
+1. **Per-cycle set** -- tier 1 PIDs are read every cycle, slower tiers
+   only on their Nth cycle; the first cycle sweeps every tier.
+2. **Flat fallback** -- a missing pollingTiers section (or flat mode)
+   keeps the legacy every-PID-every-cycle loop.
+3. **Sample rates** -- achieved Hz is successful readings over elapsed
+   time; target Hz comes from the tier interval.
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+from src.common.config.validator import DEFAULTS
+from src.pi.obdii.data.realtime import RealtimeDataLogger
+from src.pi.obdii.data.types import LoggedReading
+
+# ================================================================================
+# Helpers
+# ================================================================================
+
+
+def _makeConfig(schedulerMode: str = 'tiered', withTiers: bool = True) -> dict[str, Any]:
+    config: dict[str, Any] = {
+        'pi': {
+            'realtimeData': {
+                'pollingIntervalMs': 1000,
+                'schedulerMode': schedulerMode,
+                'parameters': [
+                    {'name': 'RPM', 'logData': True},
+                    {'name': 'COOLANT_TEMP', 'logData': True},
+                    {'name': 'SPEED', 'logData': True},
+                    {'name': 'INTAKE_TEMP', 'logData': True},
+                ],
+            },
+        },
+    }
+    if withTiers:
+        config['pi']['pollingTiers'] = {
+            'tier1': {'cycleInterval': 1, 'parameters': [
+                {'name': 'RPM', 'pid': '0x0C'},
+                {'name': 'COOLANT_TEMP', 'pid': '0x05'},
+            ]},
+            'tier2': {'cycleInterval': 3, 'parameters': [
+                {'name': 'SPEED', 'pid': '0x0D'},
+            ]},
+            'tier3': {'cycleInterval': 10, 'parameters': [
+                {'name': 'INTAKE_TEMP', 'pid': '0x0F'},
+            ]},
+        }
+    return config
+
+
+def _buildLogger(config: dict[str, Any]) -> tuple[RealtimeDataLogger, list[list[str]]]:
+    """Logger whose queries are recorded per cycle instead of hitting OBD."""
+    rt = RealtimeDataLogger(config, MagicMock(), MagicMock(), batchWriter=None)
+    cycles: list[list[str]] = []
+
+    def _fakeQuery(name: str) -> LoggedReading:
+        cycles[-1].append(name)
+        return LoggedReading(parameterName=name, value=1.0, timestamp=datetime.now())
+
+    rt._queryParameterSafe = _fakeQuery  # type: ignore[method-assign]
+    rt._logReadingSafe = lambda reading: True  # type: ignore[method-assign]
+    return rt, cycles
+
+
+def _runCycles(rt: RealtimeDataLogger, cycles: list[list[str]], count: int) -> None:
+    for _ in range(count):
+        cycles.append([])
+        rt._pollCycle()
+
+
+# ================================================================================
+# Per-cycle parameter set
+# ================================================================================
+
+
+class TestTieredPollCycle:
+
+    def test_pollCycle_tiered_readsOnlyDueParameters(self):
+        rt, cycles = _buildLogger(_makeConfig())
+        _runCycles(rt, cycles, 10)
+
+        assert rt.schedulerMode == 'tiered'
+        assert cycles[0] == ['RPM', 'COOLANT_TEMP', 'SPEED', 'INTAKE_TEMP']
+        assert cycles[1] == ['RPM', 'COOLANT_TEMP']
+        assert cycles[3] == ['RPM', 'COOLANT_TEMP', 'SPEED']
+        assert sum(c.count('RPM') for c in cycles) == 10
+        assert sum(c.count('INTAKE_TEMP') for c in cycles) == 1
+
+    def test_init_tieredWithoutPollingTiers_fallsBackToFlat(self):
+        rt, cycles = _buildLogger(_makeConfig(withTiers=False))
+        _runCycles(rt, cycles, 2)
+
+        assert rt.schedulerMode == 'flat'
+        assert cycles[1] == ['RPM', 'COOLANT_TEMP', 'SPEED', 'INTAKE_TEMP']
+
+    def test_init_flatMode_ignoresPollingTiers(self):
+        rt, cycles = _buildLogger(_makeConfig(schedulerMode='flat'))
+        _runCycles(rt, cycles, 2)
+
+        assert rt.schedulerMode == 'flat'
+        assert len(cycles[1]) == 4
+
+    def test_shippedConfig_pollsFlat(self):
+        configPath = Path(__file__).resolve().parents[3] / 'config.json'
+        config = json.loads(configPath.read_text())
+
+        assert DEFAULTS['pi.realtimeData.schedulerMode'] == 'flat'
+        rt, cycles = _buildLogger(config)
+        _runCycles(rt, cycles, 2)
+
+        assert rt.schedulerMode == 'flat'
+        assert cycles[1] == rt._parameters
+
+
+# ================================================================================
+# Sample rates
+# ================================================================================
+
+
+class TestSampleRates:
+
+    def test_getSampleRates_reportsAchievedAgainstTarget(self):
+        rt, _ = _buildLogger(_makeConfig())
+        clock = [100.0]
+        rt._monotonicFn = lambda: clock[0]
+        rt._rateWindowStart = clock[0]
+        rt._stats.parametersLogged = {'RPM': 20, 'SPEED': 3}
+        clock[0] += 10.0
+
+        rates = {r.parameterName: r for r in rt.getSampleRates()}
+
+        assert rates['RPM'].tier == 1
+        assert rates['RPM'].targetHz == 1.0
+        assert rates['RPM'].achievedHz == 2.0
+        assert rates['SPEED'].targetHz == 1000.0 / 3000.0
+        assert rates['SPEED'].achievedHz == 0.3
+        assert rates['INTAKE_TEMP'].samples == 0
+
+    def test_getSampleRates_beforeStart_isEmpty(self):
+        rt, _ = _buildLogger(_makeConfig())
+        assert rt.getSampleRates() == []
@@ -0,0 +1,73 @@
+################################################################################
+# File Name: test_simulator_integration_alerts.py
+# Purpose/Description: Tests that SimulatorIntegration checks each simulated
+#                      update against the AlertManager as one frame.
+# Author: Rex
+# Creation Date: 2026-10-17
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-17    | Rex          | Initial
+# ================================================================================
+################################################################################
+
+"""Tests for the alert path of :meth:`SimulatorIntegration._feedToComponents`."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from pi.alert.manager import AlertManager
+from pi.obdii.simulator_integration import SimulatorIntegration
+
+
+def _runningAlertManager() -> AlertManager:
+    manager = AlertManager(cooldownSeconds=30)
+    manager.setThresholdsFromConfig({
+        'pi': {
+            'tieredThresholds': {
+                'rpm': {'dangerMin': 7000},
+                'coolantTemp': {'dangerMin': 220},
+            },
+            'profiles': {'availableProfiles': [{'id': 'daily'}]},
+        },
+    })
+    manager.setActiveProfile('daily')
+    manager.start()
+    return manager
+
+
+class TestFeedToComponentsAlerts:
+
+    def test_updateCheckedAsOneFrame(self) -> None:
+        manager = _runningAlertManager()
+        integration = SimulatorIntegration({})
+        integration.setAlertManager(manager)
+        values = {'RPM': 3000.0, 'COOLANT_TEMP': 190.0, 'SPEED': 40.0}
+
+        with (
+            patch.object(manager, 'checkFrame', wraps=manager.checkFrame) as checkFrame,
+            patch.object(manager, 'checkValue') as checkValue,
+        ):
+            integration._feedToComponents(values)
+
+        checkFrame.assert_called_once_with(values)
+        checkValue.assert_not_called()
+        assert integration._stats.readingsGenerated == 3
+
+    def test_triggeredAlertsCountedAndReported(self) -> None:
+        integration = SimulatorIntegration({})
+        integration.setAlertManager(_runningAlertManager())
+        triggered: list[tuple[str, float]] = []
+        integration.registerCallbacks(
+            onAlertTriggered=lambda name, value: triggered.append((name, value)),
+        )
+
+        integration._feedToComponents({'RPM': 7200.0, 'COOLANT_TEMP': 225.0, 'SPEED': 40.0})
+        integration._feedToComponents({'RPM': 7300.0})  # RPM redline in cooldown
+
+        assert integration._stats.alertsTriggered == 2
+        assert sorted(triggered) == [('COOLANT_TEMP', 225.0), ('RPM', 7200.0)]
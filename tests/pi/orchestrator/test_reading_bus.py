@@ -0,0 +1,360 @@
+################################################################################
+# File Name: test_reading_bus.py
+# Purpose/Description: Tests for the reading fan-out bus and its wiring into
+#                      EventRouterMixin._handleReading.
+# Author: Rex
+# Creation Date: 2026-10-16
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-16    | Rex          | Initial
+# 2026-10-17    | Rex          | Live snapshot subscriber wiring
+# 2026-10-17    | Rex          | Deferred tasks drained by the cycle tick
+# 2026-10-17    | Rex          | Direct subscribers / publishTo; alerts get
+#               |              | one frame per cycle
+# ================================================================================
+################################################################################
+
+"""Tests for :class:`ReadingBus`.
+
+Invariants verified:
+
+1. **Latest-value-wins** -- a slow display subscriber only ever sees the
+   newest value per parameter; superseded values count as dropped.
+2. **Lossless** -- drive detector / alert subscribers get every reading in
+   publish order; a full buffer drops (and counts) only after the publish
+   timeout.
+3. **Isolation** -- a handler exception or a slow handler never reaches
+   the publisher.
+4. **Router wiring** -- with the bus running, ``_handleReading`` publishes
+   instead of calling consumers inline, and drive-event DTC queries are
+   deferred to the polling thread -- run by the next reading or, when no
+   reading follows (engine off), by the next polling-cycle tick.
+5. **Live snapshot** -- with ``pi.display.liveSnapshot`` enabled readings
+   (and their basic-tier severity) land in the shared-memory snapshot,
+   through a latest-value subscriber or inline.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from pi.obdii.orchestrator.event_router import EventRouterMixin
+from pi.obdii.orchestrator.health_monitor import HealthMonitorMixin
+from pi.obdii.orchestrator.reading_bus import ReadingBus
+from pi.obdii.orchestrator.types import DeliveryPolicy, HealthCheckStats
+
+# ================================================================================
+# Helpers
+# ================================================================================
+
+
+def _reading(name: str, value: float) -> Any:
+    return SimpleNamespace(parameterName=name, value=value, unit='x')
+
+
+def _waitFor(predicate: Any, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return predicate()
+
+
+class _Host(EventRouterMixin):
+    """Bare EventRouterMixin host with mocked consumers."""
+
+    def __init__(self, busEnabled: bool, snapshotPath: Any = None) -> None:
+        self._config = {'pi': {
+            'obdii': {'orchestrator': {'readingBus': {'enabled': busEnabled}}},
+            'display': {'liveSnapshot': {
+                'enabled': snapshotPath is not None, 'path': str(snapshotPath),
+            }},
+            'tieredThresholds': {
+                'rpm': {'normalMin': 600.0, 'cautionMin': 6500.0, 'dangerMin': 7000.0},
+            },
+        }}
+        self._healthCheckStats = HealthCheckStats()
+        self._displayManager = MagicMock()
+        self._driveDetector = MagicMock()
+        self._driveDetector.isDriving.return_value = False
+        self._alertManager = MagicMock()
+        self._dashboardParameters = {'RPM'}
+        self._alertsPausedForReconnect = False
+        self._statisticsEngine = None
+        self._dataLogger = None
+        self._profileSwitcher = None
+        self._hardwareManager = None
+        self._profileManager = None
+        self._connection = MagicMock()
+        self._dtcLogger = MagicMock()
+        self._milEdgeDetector = None
+        self._freezeFrameCapture = None
+        self._onDriveStart = None
+        self._onDriveEnd = None
+        self._onAlert = None
+        self._onAnalysisComplete = None
+        self._onConnectionLost = None
+        self._onConnectionRestored = None
+        self._readingBus = None
+        self._pollingThreadTasks = deque()
+
+
+class _HealthHost(_Host, HealthMonitorMixin):
+    """Host that also carries the health-monitor stats collection."""
+
+
+# ================================================================================
+# ReadingBus
+# ================================================================================
+
+
+class TestReadingBusPolicies:
+
+    def test_latest_slowSubscriber_seesNewestValuePerParameter(self):
+        release = threading.Event()
+        seen: list[tuple[str, float]] = []
+
+        def handler(reading: Any) -> None:
+            release.wait(timeout=2.0)
+            seen.append((reading.parameterName, reading.value))
+
+        bus = ReadingBus()
+        bus.subscribe('display', handler, DeliveryPolicy.LATEST, capacity=8)
+        bus.start()
+        bus.publish(_reading('RPM', 1.0))
+        assert _waitFor(lambda: bus.getStats()[0].queueDepth == 0)  # first one in flight
+        for value in (2.0, 3.0, 4.0):
+            bus.publish(_reading('RPM', value))
+        bus.publish(_reading('SPEED', 10.0))
+        release.set()
+        bus.stop()
+
+        assert seen == [('RPM', 1.0), ('RPM', 4.0), ('SPEED', 10.0)]
+        stats = bus.getStats()[0]
+        assert stats.dropped == 2
+        assert stats.delivered == 3
+
+    def test_lossless_deliversEveryReadingInOrder(self):
+        seen: list[float] = []
+        bus = ReadingBus()
+        bus.subscribe('alerts', lambda r: seen.append(r.value), DeliveryPolicy.LOSSLESS)
+        bus.start()
+        for i in range(200):
+            bus.publish(_reading('RPM', float(i)))
+        bus.stop()
+
+        assert seen == [float(i) for i in range(200)]
+        assert bus.getStats()[0].dropped == 0
+
+    def test_lossless_fullBuffer_dropsAfterTimeoutAndCounts(self):
+        release = threading.Event()
+        bus = ReadingBus(publishTimeoutMs=0)
+        bus.subscribe(
+            'driveDetector', lambda r: release.wait(timeout=2.0),
+            DeliveryPolicy.LOSSLESS, capacity=2,
+        )
+        bus.start()
+        bus.publish(_reading('RPM', 0.0))
+        assert _waitFor(lambda: bus.getStats()[0].queueDepth == 0)
+        for i in range(1, 5):
+            bus.publish(_reading('RPM', float(i)))
+
+        assert bus.getStats()[0].dropped == 2
+        release.set()
+        bus.stop()
+        assert bus.getStats()[0].delivered == 3
+
+    def test_handlerError_countedAndDispatchContinues(self):
+        seen: list[float] = []
+
+        def handler(reading: Any) -> None:
+            if reading.value == 1.0:
+                raise RuntimeError("boom")
+            seen.append(reading.value)
+
+        bus = ReadingBus()
+        bus.subscribe('alerts', handler, DeliveryPolicy.LOSSLESS)
+        bus.start()
+        for value in (1.0, 2.0):
+            bus.publish(_reading('RPM', value))
+        bus.stop()
+
+        assert seen == [2.0]
+        assert bus.getStats()[0].handlerErrors == 1
+
+    def test_notRunning_deliversInline(self):
+        seen: list[float] = []
+        bus = ReadingBus()
+        bus.subscribe('alerts', lambda r: seen.append(r.value))
+
+        bus.publish(_reading('RPM', 5.0))
+
+        assert seen == [5.0]
+
+    def test_directSubscriber_onlyReceivesPublishTo(self):
+        readings: list[Any] = []
+        frames: list[Any] = []
+        bus = ReadingBus()
+        bus.subscribe('display', readings.append, DeliveryPolicy.LATEST)
+        bus.subscribe('alerts', frames.append, broadcast=False)
+        bus.start()
+
+        bus.publish(_reading('RPM', 5.0))
+        assert bus.publishTo('alerts', {'RPM': 5.0})
+        bus.stop()
+
+        assert [r.value for r in readings] == [5.0]
+        assert frames == [{'RPM': 5.0}]
+
+    def test_publishTo_unknownSubscriberRaises(self):
+        with pytest.raises(ValueError):
+            ReadingBus().publishTo('alerts', {})
+
+
+# ================================================================================
+# Router wiring
+# ================================================================================
+
+
+class TestRouterWiring:
+
+    def test_busDisabled_handleReadingCallsConsumersInline(self):
+        host = _Host(busEnabled=False)
+        host._startReadingBus()
+
+        host._handleReading(_reading('RPM', 850.0))
+        host._handleReading(_reading('SPEED', 40.0))
+        host._alertManager.checkFrame.assert_not_called()
+        host._handleCycleComplete(1)
+
+        assert host._readingBus is None
+        host._displayManager.updateValue.assert_called_once_with('RPM', 850.0, 'x')
+        host._driveDetector.processValue.assert_any_call('RPM', 850.0)
+        host._alertManager.checkFrame.assert_called_once_with({'RPM': 850.0, 'SPEED': 40.0})
+        host._alertManager.checkValue.assert_not_called()
+
+    def test_busEnabled_consumersRunOffThePollingThread(self):
+        host = _Host(busEnabled=True)
+        threads: dict[str, str] = {}
+        host._driveDetector.processValue.side_effect = (
+            lambda *a: threads.setdefault('drive', threading.current_thread().name)
+        )
+        host._alertManager.checkFrame.side_effect = (
+            lambda *a: threads.setdefault('alerts', threading.current_thread().name)
+        )
+        host._startReadingBus()
+
+        host._handleReading(_reading('RPM', 850.0))
+        host._handleCycleComplete(1)
+        host._stopReadingBus()
+
+        assert threads == {
+            'drive': 'ReadingBus-driveDetector',
+            'alerts': 'ReadingBus-alerts',
+        }
+        host._displayManager.updateValue.assert_called_once_with('RPM', 850.0, 'x')
+        host._alertManager.checkFrame.assert_called_once_with({'RPM': 850.0})
+
+    def test_alertsPausedForReconnect_frameDropped(self):
+        host = _Host(busEnabled=True)
+        host._startReadingBus()
+        host._alertsPausedForReconnect = True
+
+        host._handleReading(_reading('RPM', 7500.0))
+        host._handleCycleComplete(1)
+        host._stopReadingBus()
+
+        host._alertManager.checkFrame.assert_not_called()
+        assert host._cycleFrame == {}
+
+    def test_busEnabled_driveStartDtcQueryDeferredToPollingThread(self):
+        host = _Host(busEnabled=True)
+        host._startReadingBus()
+
+        host._handleDriveStart(SimpleNamespace(id=1))
+        host._dtcLogger.logSessionStartDtcs.assert_not_called()
+
+        host._handleReading(_reading('RPM', 850.0))
+        host._dtcLogger.logSessionStartDtcs.assert_called_once()
+        host._stopReadingBus()
+
+    def test_busEnabled_driveEndDtcQueryRunsOnCycleTickWithoutReadings(self):
+        host = _Host(busEnabled=True)
+        host._startReadingBus()
+
+        host._handleDriveEnd(SimpleNamespace(duration=12.0))
+        host._dtcLogger.logDriveEndDtcs.assert_not_called()
+
+        host._handleCycleComplete(1)  # engine off: the cycle read nothing
+        host._dtcLogger.logDriveEndDtcs.assert_called_once()
+        assert not host._pollingThreadTasks
+        host._stopReadingBus()
+
+    def test_dataLoggerWiring_registersCycleCompleteHook(self):
+        host = _Host(busEnabled=False)
+        host._dataLogger = MagicMock()
+
+        host._setupComponentCallbacks()
+
+        kwargs = host._dataLogger.registerCallbacks.call_args.kwargs
+        assert kwargs['onCycleComplete'] == host._handleCycleComplete
+
+    def test_collectComponentStats_exposesPerSubscriberLagAndDrops(self):
+        host = _HealthHost(busEnabled=True)
+        host._startReadingBus()
+        host._handleReading(_reading('RPM', 850.0))
+        host._handleCycleComplete(1)
+        assert _waitFor(
+            lambda: all(s.delivered == 1 for s in host._readingBus.getStats())
+        )
+
+        host._collectComponentStats()
+        host._stopReadingBus()
+
+        busStats = host._healthCheckStats.readingBus
+        assert set(busStats) == {'display', 'driveDetector', 'alerts'}
+        assert busStats['display']['policy'] == 'latest'
+        assert busStats['alerts']['policy'] == 'lossless'
+        assert busStats['alerts']['dropped'] == 0
+        assert busStats['alerts']['lastLagMs'] >= 0.0
+
+    def test_liveSnapshot_busEnabled_publishedByLatestSubscriber(self, tmp_path):
+        from pi.display.live_snapshot import LiveSnapshotReader
+
+        host = _Host(busEnabled=True, snapshotPath=tmp_path / 'live.snap')
+        host._startLiveSnapshot()
+        host._startReadingBus()
+
+        host._handleReading(_reading('RPM', 6800.0))
+        policies = {s.name: s.policy for s in host._readingBus.getStats()}
+        host._stopReadingBus()
+        host._closeLiveSnapshot()
+
+        assert policies['liveSnapshot'] == 'latest'
+        live = LiveSnapshotReader(tmp_path / 'live.snap').read()['RPM']
+        assert (live.value, live.severity) == (6800.0, 'caution')
+        assert host._liveSnapshot is None
+
+    def test_liveSnapshot_busDisabled_publishedInline(self, tmp_path):
+        from pi.display.live_snapshot import LiveSnapshotReader
+
+        host = _Host(busEnabled=False, snapshotPath=tmp_path / 'live.snap')
+        host._startLiveSnapshot()
+        host._startReadingBus()
+
+        host._handleReading(_reading('SPEED', 42.0))
+
+        live = LiveSnapshotReader(tmp_path / 'live.snap').read()['SPEED']
+        assert (live.value, live.severity) == (42.0, None)
@@ -0,0 +1,409 @@
+################################################################################
+# File Name: test_sync_bulk_push.py
+# Purpose/Description: Tests for SyncClient bulk push -- multi-table,
+#                      compressed sync requests with atomic cursor advance.
+# Author: Rex
+# Creation Date: 2026-10-16
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-16    | Rex          | Initial
+# 2026-10-16    | Rex          | Columnar wire format + 415 fallback
+# ================================================================================
+################################################################################
+
+"""Tests for ``pi.companionService.bulkPush`` in :class:`SyncClient`.
+
+Invariants verified:
+
+1. **Packing** -- one request carries every table with pending rows, gzip
+   encoded, in the unchanged ``/api/v1/sync`` payload shape.
+2. **Budget** -- ``maxBatchBytes`` splits a backlog into several requests
+   that together deliver every row exactly once, in PK order.
+3. **Atomic advance** -- marks move only after a 2xx, all together; a failed
+   request leaves every mark where it was.
+4. **Reporting** -- ``lastSweep`` / ``PushSummary.sweep`` carry bytes-on-wire
+   and rows/sec.
+5. **Server** -- the compressed body decodes through the route's decoder.
+6. **Columnar** -- ``wireFormat: columnar`` sends realtime_data as columns
+   under the columnar content type and falls back to JSON on HTTP 415.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import sqlite3
+import urllib.error
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.common.config.validator import ConfigValidationError, ConfigValidator
+from src.common.contracts.realtime_columnar import CONTENT_TYPE, decodeSyncBody
+from src.pi.data import sync_log
+from src.pi.obdii.database import ObdDatabase
+from src.pi.sync import PushStatus, SyncClient
+
+# ================================================================================
+# Helpers
+# ================================================================================
+
+
+@pytest.fixture(autouse=True)
+def stubApiKey(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("COMPANION_API_KEY", "test-key")
+
+
+@pytest.fixture
+def dbPath(tmp_path: Path) -> str:
+    database = ObdDatabase(str(tmp_path / "bulk.db"), walMode=False)
+    database.initialize()
+    return database.dbPath
+
+
+def _config(dbPath: str, **bulk: Any) -> dict[str, Any]:
+    bulkPush = {"enabled": True, "compression": "gzip"}
+    bulkPush.update(bulk)
+    return {
+        "deviceId": "chi-eclipse-01",
+        "pi": {
+            "database": {"path": dbPath},
+            "companionService": {
+                "enabled": True,
+                "baseUrl": "http://10.27.27.10:8000",
+                "apiKeyEnv": "COMPANION_API_KEY",
+                "batchSize": 50,
+                "retryMaxAttempts": 0,
+                "retryBackoffSeconds": [],
+                "bulkPush": bulkPush,
+            },
+        },
+    }
+
+
+def _seed(dbPath: str, realtimeRows: int = 120, connectionRows: int = 3) -> None:
+    with sqlite3.connect(dbPath) as conn:
+        conn.executemany(
+            "INSERT INTO realtime_data (timestamp, parameter_name, value) "
+            "VALUES (?, 'RPM', ?)",
+            [(f"2026-10-16T12:00:{i % 60:02d}Z", 800.0 + i) for i in range(realtimeRows)],
+        )
+        conn.executemany(
+            "INSERT INTO connection_log (timestamp, event_type, success) "
+            "VALUES (?, 'connect_success', 1)",
+            [(f"2026-10-16T12:00:{i:02d}Z",) for i in range(connectionRows)],
+        )
+
+
+def _recordingOpener(
+    fail: bool = False,
+    rejectColumnar: bool = False,
+) -> Callable[..., Any]:
+    """Opener that decodes and records each request body.
+
+    Columnar bodies are recorded with their decoded tables under
+    ``columnar``; ``rejectColumnar`` answers them with 415.
+    """
+    requests: list[dict[str, Any]] = []
+
+    class _Response:
+        def __enter__(self) -> _Response:
+            return self
+
+        def __exit__(self, *_exc: Any) -> None:
+            return None
+
+        def read(self) -> bytes:
+            return b'{"status":"ok"}'
+
+    def _opener(req: Any, timeout: float = 30) -> _Response:  # noqa: ARG001
+        encoding = req.get_header("Content-encoding")
+        raw = gzip.decompress(req.data) if encoding == "gzip" else req.data
+        contentType = req.get_header("Content-type")
+        columnar: dict[str, Any] = {}
+        if contentType == CONTENT_TYPE:
+            if rejectColumnar:
+                raise urllib.error.HTTPError(
+                    req.full_url, 415, "Unsupported Media Type", {}, None,
+                )
+            payload, columnar = decodeSyncBody(raw)
+        else:
+            payload = json.loads(raw)
+        requests.append({
+            "encoding": encoding,
+            "contentType": contentType,
+            "wireBytes": len(req.data),
+            "payload": payload,
+            "columnar": columnar,
+        })
+        if fail:
+            raise urllib.error.HTTPError(req.full_url, 503, "Unavailable", {}, None)
+        return _Response()
+
+    _opener.requests = requests  # type: ignore[attr-defined]
+    return _opener
+
+
+def _marks(dbPath: str) -> dict[str, tuple[int, str]]:
+    with sqlite3.connect(dbPath) as conn:
+        return {
+            row[0]: (row[1], row[2])
+            for row in conn.execute(
+                "SELECT table_name, last_synced_id, status FROM sync_log"
+            )
+        }
+
+
+# ================================================================================
+# Bulk push
+# ================================================================================
+
+
+class TestBulkPush:
+
+    def test_packsSeveralTablesIntoOneGzipRequest(self, dbPath):
+        _seed(dbPath)
+        opener = _recordingOpener()
+        client = SyncClient(_config(dbPath), httpOpener=opener)
+
+        results = {r.tableName: r for r in client.pushAllDeltas()}
+
+        assert len(opener.requests) == 1
+        request = opener.requests[0]
+        assert request["encoding"] == "gzip"
+        tables = request["payload"]["tables"]
+        assert set(tables) == {"connection_log", "realtime_data"}
+        assert [r["id"] for r in tables["realtime_data"]["rows"]] == list(range(1, 121))
+        assert tables["realtime_data"]["lastSyncedId"] == 0
+        assert results["realtime_data"].status == PushStatus.OK
+        assert results["realtime_data"].rowsPushed == 120
+        assert results["connection_log"].rowsPushed == 3
+        assert results["alert_log"].status == PushStatus.EMPTY
+        assert results["profiles"].status == PushStatus.SKIPPED
+        assert _marks(dbPath)["realtime_data"] == (120, "ok")
+        assert _marks(dbPath)["connection_log"] == (3, "ok")
+
+    def test_byteBudget_splitsRequests_deliversEveryRowOnce(self, dbPath):
+        _seed(dbPath, realtimeRows=400)
+        opener = _recordingOpener()
+        client = SyncClient(_config(dbPath, maxBatchBytes=6000), httpOpener=opener)
+
+        client.pushAllDeltas()
+
+        assert len(opener.requests) > 1
+        sentIds = [
+            row["id"]
+            for request in opener.requests
+            for row in request["payload"]["tables"].get("realtime_data", {}).get("rows", [])
+        ]
+        assert sentIds == list(range(1, 401))
+        for request in opener.requests:
+            raw = json.dumps(request["payload"], separators=(",", ":"))
+            assert len(raw) <= 6000
+        assert _marks(dbPath)["realtime_data"] == (400, "ok")
+
+    def test_requestCap_leavesRemainderForNextSweep(self, dbPath):
+        _seed(dbPath, realtimeRows=400)
+        opener = _recordingOpener()
+        client = SyncClient(
+            _config(dbPath, maxBatchBytes=6000, maxRequestsPerSweep=2),
+            httpOpener=opener,
+        )
+
+        client.pushAllDeltas()
+        firstMark = _marks(dbPath)["realtime_data"][0]
+        client.pushAllDeltas()
+
+        assert 0 < firstMark < 400
+        assert _marks(dbPath)["realtime_data"][0] > firstMark
+
+    def test_failedRequest_advancesNoCursor(self, dbPath):
+        _seed(dbPath)
+        client = SyncClient(_config(dbPath), httpOpener=_recordingOpener(fail=True))
+
+        results = {r.tableName: r for r in client.pushAllDeltas()}
+
+        assert results["realtime_data"].status == PushStatus.FAILED
+        assert results["connection_log"].status == PushStatus.FAILED
+        assert "503" in results["realtime_data"].reason
+        assert _marks(dbPath) == {
+            "connection_log": (0, "failed"),
+            "realtime_data": (0, "failed"),
+        }
+        assert client.lastSweep.requests == 0
+
+    def test_sweepStats_reportBytesOnWireAndRate(self, dbPath):
+        _seed(dbPath, realtimeRows=300)
+        client = SyncClient(_config(dbPath), httpOpener=_recordingOpener())
+
+        summary = client.forcePush()
+
+        sweep = summary.sweep
+        assert sweep.mode == "bulk"
+        assert sweep.encoding == "gzip"
+        assert sweep.rowsPushed == 303
+        assert 0 < sweep.bytesOnWire < sweep.bytesRaw
+        assert sweep.rowsPerSecond > 0
+
+    def test_compressionNone_sendsPlainJson(self, dbPath):
+        _seed(dbPath)
+        opener = _recordingOpener()
+        client = SyncClient(_config(dbPath, compression="none"), httpOpener=opener)
+
+        client.pushAllDeltas()
+
+        assert opener.requests[0]["encoding"] is None
+
+    def test_bulkDisabled_keepsPerTableRequests(self, dbPath):
+        _seed(dbPath)
+        opener = _recordingOpener()
+        client = SyncClient(_config(dbPath, enabled=False), httpOpener=opener)
+
+        client.pushAllDeltas()
+
+        assert len(opener.requests) == 2  # one page per table per sweep
+        assert client.lastSweep.mode == "per-table"
+        assert all(len(r["payload"]["tables"]) == 1 for r in opener.requests)
+
+    def test_serverDecoder_acceptsBulkBody(self, dbPath):
+        pytest.importorskip("fastapi")
+        from src.server.api.sync import SyncRequest, _decodeBody
+
+        _seed(dbPath)
+        captured: list[Any] = []
+        opener = _recordingOpener()
+
+        def _capture(req: Any, timeout: float = 30) -> Any:
+            captured.append(req)
+            return opener(req, timeout)
+
+        SyncClient(_config(dbPath), httpOpener=_capture).pushAllDeltas()
+
+        req = captured[0]
+        decoded = _decodeBody(req.data, req.get_header("Content-encoding"), 10 * 1024 * 1024)
+        model = SyncRequest.model_validate(json.loads(decoded))
+        assert len(model.tables["realtime_data"].rows) == 120
+
+
+class TestColumnarWireFormat:
+
+    def test_realtimeRowsTravelAsColumns(self, dbPath):
+        _seed(dbPath)
+        opener = _recordingOpener()
+        client = SyncClient(_config(dbPath, wireFormat="columnar"), httpOpener=opener)
+
+        results = {r.tableName: r for r in client.pushAllDeltas()}
+
+        assert len(opener.requests) == 1
+        request = opener.requests[0]
+        assert request["contentType"] == CONTENT_TYPE
+        assert set(request["payload"]["tables"]) == {"connection_log"}
+        table = request["columnar"]["realtime_data"]
+        assert table.columns["id"] == list(range(1, 121))
+        assert table.columns["value"][0] == 800.0
+        assert results["realtime_data"].rowsPushed == 120
+        assert client.lastSweep.wireFormat == "columnar"
+        assert _marks(dbPath)["realtime_data"] == (120, "ok")
+
+    def test_columnarBody_isSmallerThanJson(self, dbPath):
+        _seed(dbPath, realtimeRows=500)
+        columnarOpener = _recordingOpener()
+        SyncClient(
+            _config(dbPath, wireFormat="columnar", compression="none"),
+            httpOpener=columnarOpener,
+        ).pushAllDeltas()
+        with sqlite3.connect(dbPath) as conn:
+            conn.execute("DELETE FROM sync_log")
+        jsonOpener = _recordingOpener()
+        SyncClient(
+            _config(dbPath, compression="none"), httpOpener=jsonOpener,
+        ).pushAllDeltas()
+
+        assert columnarOpener.requests[0]["wireBytes"] < jsonOpener.requests[0]["wireBytes"] / 2
+
+    def test_byteBudget_splitsColumnarRequests(self, dbPath):
+        _seed(dbPath, realtimeRows=400, connectionRows=0)
+        opener = _recordingOpener()
+        client = SyncClient(
+            _config(dbPath, wireFormat="columnar", maxBatchBytes=6000),
+            httpOpener=opener,
+        )
+
+        client.pushAllDeltas()
+
+        assert len(opener.requests) > 1
+        sentIds = [
+            pk for request in opener.requests
+            for pk in request["columnar"]["realtime_data"].columns["id"]
+        ]
+        assert sentIds == list(range(1, 401))
+
+    def test_serverWithoutColumnar_fallsBackToJson(self, dbPath):
+        _seed(dbPath)
+        opener = _recordingOpener(rejectColumnar=True)
+        client = SyncClient(_config(dbPath, wireFormat="columnar"), httpOpener=opener)
+
+        results = {r.tableName: r for r in client.pushAllDeltas()}
+
+        assert len(opener.requests) == 1
+        assert opener.requests[0]["contentType"] == "application/json"
+        assert len(opener.requests[0]["payload"]["tables"]["realtime_data"]["rows"]) == 120
+        assert results["realtime_data"].status == PushStatus.OK
+        assert not client.isColumnar
+        assert _marks(dbPath)["realtime_data"] == (120, "ok")
+
+
+# ================================================================================
+# sync_log + config
+# ================================================================================
+
+
+class TestAdvanceHighWaterMarks:
+
+    def test_invalidTable_writesNothing(self, dbPath):
+        with sqlite3.connect(dbPath) as conn:
+            sync_log.initDb(conn)
+            with pytest.raises(ValueError):
+                sync_log.advanceHighWaterMarks(
+                    conn,
+                    {"realtime_data": (10, None), "not_a_table": (1, None)},
+                    "batch-1",
+                )
+            assert sync_log.getHighWaterMark(conn, "realtime_data")[0] == 0
+
+
+class TestBulkPushConfig:
+
+    def _raw(self, bulkPush: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "protocolVersion": "1.0.0",
+            "schemaVersion": "1.0.0",
+            "deviceId": "chi-eclipse-01",
+            "pi": {
+                "database": {"path": "data/obd.db"},
+                "companionService": {"enabled": False, "bulkPush": bulkPush},
+            },
+            "server": {},
+        }
+
+    def test_defaultsApplied(self):
+        config = ConfigValidator().validate(self._raw({}))
+
+        bulkPush = config["pi"]["companionService"]["bulkPush"]
+        assert bulkPush["enabled"] is True
+        assert bulkPush["compression"] == "gzip"
+        assert bulkPush["maxBatchBytes"] == 4194304
+
+    def test_unknownWireFormat_rejected(self):
+        with pytest.raises(ConfigValidationError, match="bulkPush.wireFormat"):
+            ConfigValidator().validate(self._raw({"wireFormat": "msgpack"}))
+
+    def test_unknownCompression_rejected(self):
+        with pytest.raises(ConfigValidationError, match="bulkPush.compression"):
+            ConfigValidator().validate(self._raw({"compression": "brotli"}))
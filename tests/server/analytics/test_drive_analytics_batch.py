@@ -0,0 +1,211 @@
+################################################################################
+# File Name: test_drive_analytics_batch.py
+# Purpose/Description: Tests for src/server/analytics/drive_analytics_batch.py
+#                      -- the single-pass multi-drive analytics engine must
+#                      write exactly what the per-drive compute functions
+#                      write, with the same skip / failure semantics.
+# Author: Rex
+# Creation Date: 2026-10-16
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-16    | Rex          | Initial
+# ================================================================================
+################################################################################
+
+"""Tests for :func:`computeDriveAnalyticsBatch`.
+
+Real temp-file SQLite + real ORM + real INSERTs; the per-drive compute
+functions are the parity oracle.
+"""
+
+from __future__ import annotations
+
+import logging
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from sqlalchemy import create_engine, select  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from src.server.analytics.drive_analytics_batch import (  # noqa: E402
+    OUTCOME_FAILED,
+    OUTCOME_OK,
+    OUTCOME_SKIPPED,
+    computeDriveAnalyticsBatch,
+)
+from src.server.analytics.drive_statistics_compute import (  # noqa: E402
+    compute_drive_statistics,
+)
+from src.server.analytics.drive_summary_compute import (  # noqa: E402
+    compute_drive_summary,
+)
+from src.server.db.models import (  # noqa: E402
+    Base,
+    DriveStatistic,
+    DriveSummary,
+    RealtimeData,
+)
+
+START = datetime(2026, 9, 1, 7, 0, 0)
+PARAMS = ("COOLANT_TEMP", "RPM", "SPEED")
+
+
+def _newEngine(tmpDir: Path, name: str):
+    eng = create_engine(f"sqlite:///{tmpDir / name}")
+    Base.metadata.create_all(eng)
+    return eng
+
+
+@pytest.fixture
+def tmpDir():
+    with tempfile.TemporaryDirectory() as tmp:
+        yield Path(tmp)
+
+
+def _seed(eng, *, withGap: bool = False) -> None:
+    """Drives 1-4: 1+2 overlap, 3 clean (optionally with a gap), 4 no rows;
+    drive 5 has rows but no drive_summary."""
+    with Session(eng) as session:
+        for driveId, source in ((1, "real"), (2, "simulator"), (3, "real"), (4, "real")):
+            session.add(DriveSummary(
+                source_device="chi-eclipse-01", source_id=driveId,
+                drive_id=driveId, data_source=source,
+            ))
+        sourceId = 0
+        for driveId, start, seconds in (
+            (1, START, 150),
+            (2, START + timedelta(seconds=100), 40),
+            (3, START + timedelta(hours=3), 200),
+            (5, START + timedelta(hours=6), 5),
+        ):
+            for i in range(seconds):
+                offset = i + (600 if withGap and driveId == 3 and i >= 100 else 0)
+                for paramIndex, param in enumerate(PARAMS):
+                    if driveId == 2 and param == "SPEED" and i % 2:
+                        continue
+                    sourceId += 1
+                    session.add(RealtimeData(
+                        source_id=sourceId, source_device="chi-eclipse-01",
+                        timestamp=start + timedelta(seconds=offset),
+                        parameter_name=param,
+                        value=float((i * 7 + paramIndex * 13) % 97),
+                        drive_id=driveId,
+                    ))
+        session.commit()
+
+
+_SUMMARY_COLUMNS = (
+    "start_time", "end_time", "duration_seconds", "row_count", "is_real",
+    "data_quality", "drive_id", "source_id",
+)
+_STATISTIC_COLUMNS = (
+    "parameter_name", "min_value", "max_value", "avg_value", "std_dev",
+    "outlier_min", "outlier_max", "sample_count", "data_quality",
+)
+
+
+def _snapshot(eng) -> tuple[list[tuple], list[tuple]]:
+    with Session(eng) as session:
+        summaries = [
+            tuple(getattr(s, c) for c in ("id", *_SUMMARY_COLUMNS))
+            for s in session.scalars(select(DriveSummary).order_by(DriveSummary.id))
+        ]
+        statistics = [
+            tuple(getattr(s, c) for c in ("summary_id", *_STATISTIC_COLUMNS))
+            for s in session.scalars(
+                select(DriveStatistic).order_by(
+                    DriveStatistic.summary_id, DriveStatistic.parameter_name,
+                )
+            )
+        ]
+    return summaries, statistics
+
+
+class TestParityWithPerDriveCompute:
+    def test_batchWritesSameColumnsAsPerDriveCompute(self, tmpDir) -> None:
+        perDrive = _newEngine(tmpDir, "per_drive.db")
+        batch = _newEngine(tmpDir, "batch.db")
+        _seed(perDrive)
+        _seed(batch)
+        driveIds = [1, 2, 3, 4, 5]
+
+        with Session(perDrive) as session:
+            for driveId in driveIds:
+                if compute_drive_summary(session, driveId) is not None:
+                    compute_drive_statistics(session, driveId)
+            session.commit()
+        with Session(batch) as session:
+            computeDriveAnalyticsBatch(session, driveIds, streamRows=7)
+            session.commit()
+
+        assert _snapshot(batch) == _snapshot(perDrive)
+
+    def test_rerunConverges(self, tmpDir) -> None:
+        eng = _newEngine(tmpDir, "batch.db")
+        _seed(eng)
+        with Session(eng) as session:
+            computeDriveAnalyticsBatch(session, [1, 2, 3])
+            session.commit()
+        first = _snapshot(eng)
+        with Session(eng) as session:
+            computeDriveAnalyticsBatch(session, [3, 2, 1])
+            session.commit()
+
+        assert _snapshot(eng) == first
+
+
+class TestOutcomes:
+    def test_statusPerDrive(self, tmpDir) -> None:
+        eng = _newEngine(tmpDir, "batch.db")
+        _seed(eng)
+        with Session(eng) as session:
+            outcomes = computeDriveAnalyticsBatch(session, [3, 1, 2, 4, 5, 3])
+
+        assert [o.driveId for o in outcomes] == [3, 1, 2, 4, 5]
+        byId = {o.driveId: o for o in outcomes}
+        assert byId[1].status == OUTCOME_OK
+        assert byId[1].dataQuality == "attribution_anomaly"
+        assert byId[3].dataQuality == "full"
+        assert byId[3].statisticsRows == len(PARAMS)
+        assert byId[4].status == OUTCOME_SKIPPED  # summary, no rows
+        assert byId[5].status == OUTCOME_SKIPPED  # rows, no summary
+
+    def test_invariantViolationFailsOnlyThatDrive(self, tmpDir) -> None:
+        eng = _newEngine(tmpDir, "batch.db")
+        _seed(eng)
+        with Session(eng) as session:
+            session.add(RealtimeData(
+                source_id=999_999, source_device="chi-eclipse-01",
+                timestamp=START + timedelta(seconds=5), parameter_name="RPM",
+                value=float("inf"), drive_id=1,
+            ))
+            session.commit()
+            outcomes = {
+                o.driveId: o for o in computeDriveAnalyticsBatch(session, [1, 3])
+            }
+            session.commit()
+            drive1 = session.scalars(
+                select(DriveSummary).where(DriveSummary.source_id == 1)
+            ).one()
+
+            assert outcomes[1].status == OUTCOME_FAILED
+            assert outcomes[1].error
+            assert drive1.start_time is None
+            assert outcomes[3].status == OUTCOME_OK
+
+    def test_gapWarningLogged(self, tmpDir, caplog) -> None:
+        eng = _newEngine(tmpDir, "batch.db")
+        _seed(eng, withGap=True)
+        with Session(eng) as session, caplog.at_level(logging.WARNING):
+            computeDriveAnalyticsBatch(session, [3])
+
+        assert "drive_id=3 | gap detected" in caplog.text
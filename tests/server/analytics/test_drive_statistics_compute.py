@@ -29,6 +29,8 @@
 #               |              | Spool FLAG-1 honored: compute path reuses
 #               |              | src/server/analytics/helpers.computeBasicStats
 #               |              | (2-sigma) instead of re-deriving stats.
+# 2026-10-16    | Rex          | SQL-side aggregation parity vs
+#               |              | computeBasicStats.
 # ================================================================================
 ################################################################################
 
@@ -73,8 +75,10 @@ from src.server.analytics.drive_statistics_compute import (  # noqa: E402
     DATA_QUALITY_BELOW_THRESHOLD,
     DATA_QUALITY_FULL,
     DATA_QUALITY_SPARSE,
+    aggregateParameterStats,
     compute_drive_statistics,
 )
+from src.server.analytics.helpers import computeBasicStats  # noqa: E402
 from src.server.db.models import (  # noqa: E402
     Base,
     DriveStatistic,
@@ -650,3 +654,98 @@ class TestComputeDriveStatisticsAttributionAnomaly:
                 )
             ).scalars().all()
             assert first == second == ["attribution_anomaly"]
+
+
+# =========================================================================
+# SQL-side aggregation parity
+# =========================================================================
+
+
+def _assertStatsMatch(actual, expected) -> None:
+    assert actual.sample_count == expected.sample_count
+    assert actual.min_value == expected.min_value
+    assert actual.max_value == expected.max_value
+    for field in ("avg_value", "std_dev", "outlier_min", "outlier_max"):
+        assert getattr(actual, field) == pytest.approx(
+            getattr(expected, field), rel=1e-12, abs=1e-9,
+        ), field
+
+
+class TestSqlAggregateParity:
+    """Only aggregates cross the wire; the result must be computeBasicStats'."""
+
+    SERIES = {
+        "SINGLE": [42.5],
+        "CONSTANT": [0.1] * 37,
+        "LARGE_OFFSET": [1_000_000.0 + (i % 7) * 0.01 for i in range(500)],
+        "MIXED_SIGN": [(-1) ** i * (i * 1.37 % 19.0) for i in range(211)],
+        "RPM": [800.0 + (i * 53) % 5400 for i in range(1000)],
+    }
+
+    def test_aggregateParameterStats_matchesComputeBasicStats(self, engine):
+        with Session(engine) as session:
+            _seedRealtimeRows(
+                session, driveId=30, startTime=datetime(2026, 6, 1, 9, 0, 0),
+                paramSeries=self.SERIES,
+            )
+            _seedRealtimeRows(
+                session, driveId=31, startTime=datetime(2026, 6, 2, 9, 0, 0),
+                paramSeries={"RPM": [1.0, 2.0]},
+            )
+            aggregates = aggregateParameterStats(session, [30, 31, 99])
+
+        assert set(aggregates) == {30, 31}
+        assert set(aggregates[30]) == set(self.SERIES)
+        for param, values in self.SERIES.items():
+            _assertStatsMatch(aggregates[30][param], computeBasicStats(values))
+        _assertStatsMatch(aggregates[31]["RPM"], computeBasicStats([1.0, 2.0]))
+
+    def test_constantSeries_avgStaysInsideMinMax(self, engine):
+        with Session(engine) as session:
+            _seedRealtimeRows(
+                session, driveId=32, startTime=datetime(2026, 6, 3, 9, 0, 0),
+                paramSeries={"CONSTANT": [0.1] * 3},
+            )
+            stats = aggregateParameterStats(session, [32])[32]["CONSTANT"]
+
+        assert stats.min_value <= stats.avg_value <= stats.max_value
+
+    def test_compute_sqlAndPythonModesWriteSameRows(self, engine):
+        driveId = 33
+        with Session(engine) as session:
+            summaryId = _seedPiSyncedDriveSummary(session, driveId=driveId)
+            _seedRealtimeRows(
+                session, driveId=driveId,
+                startTime=datetime(2026, 6, 4, 9, 0, 0),
+                paramSeries=self.SERIES,
+            )
+
+            def rows():
+                return {
+                    row.parameter_name: row
+                    for row in session.execute(
+                        select(DriveStatistic)
+                        .where(DriveStatistic.summary_id == summaryId)
+                    ).scalars()
+                }
+
+            assert compute_drive_statistics(
+                session, driveId, sqlAggregates=False,
+            ) == len(self.SERIES)
+            session.commit()
+            python = {
+                param: (row.sample_count, row.min_value, row.max_value,
+                        row.avg_value, row.std_dev, row.data_quality)
+                for param, row in rows().items()
+            }
+            assert compute_drive_statistics(session, driveId) == len(self.SERIES)
+            session.commit()
+            sql = rows()
+
+        assert set(sql) == set(python)
+        for param, row in sql.items():
+            count, minV, maxV, avgV, stdV, quality = python[param]
+            assert (row.sample_count, row.min_value, row.max_value,
+                    row.data_quality) == (count, minV, maxV, quality)
+            assert row.avg_value == pytest.approx(avgV, rel=1e-12, abs=1e-9)
+            assert row.std_dev == pytest.approx(stdV, rel=1e-12, abs=1e-9)
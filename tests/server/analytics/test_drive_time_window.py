@@ -0,0 +1,278 @@
+################################################################################
+# File Name: test_drive_time_window.py
+# Purpose/Description: Tests for the drive_time_window materialized index --
+#                      ingest maintenance, rebuild parity, and the interval
+#                      tree behind detect_overlapping_drives.
+# Author: Rex
+# Creation Date: 2026-10-16
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-16    | Rex          | Initial
+# 2026-10-17    | Rex          | Indexed range-query parity with the interval
+#               |              | tree and the per-second boundary.
+# 2026-10-17    | Rex          | Indexed target still finds an overlapping
+#               |              | drive that has no window row.
+# ================================================================================
+################################################################################
+
+"""Tests for :mod:`src.server.analytics.drive_time_window` and
+:class:`src.server.analytics.overlap.DriveWindowIndex`.
+
+Real temp-file SQLite + real ORM + the real sync ingest; no mocks.
+"""
+
+from __future__ import annotations
+
+import random
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from sqlalchemy import create_engine, select  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from src.server.analytics.drive_time_window import (  # noqa: E402
+    rebuildDriveTimeWindows,
+)
+from src.server.analytics.overlap import (  # noqa: E402
+    DriveWindowIndex,
+    _rangesOverlapBySecond,
+    detect_overlapping_drives,
+)
+from src.server.api.sync import runSyncUpsert  # noqa: E402
+from src.server.db.models import Base, DriveTimeWindow, RealtimeData  # noqa: E402
+
+DEVICE = "chi-eclipse-01"
+BASE = datetime(2026, 10, 1, 8, 0, 0)
+
+
+@pytest.fixture
+def engine():
+    """Temp-file SQLite engine carrying the full server schema."""
+    tmp = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+    tmp.close()
+    eng = create_engine(f"sqlite:///{tmp.name}")
+    Base.metadata.create_all(eng)
+    yield eng
+    eng.dispose()
+    Path(tmp.name).unlink(missing_ok=True)
+
+
+def _rows(firstId: int, driveId: int, start: datetime, count: int) -> list[dict]:
+    return [
+        {
+            "id": firstId + i,
+            "timestamp": (start + timedelta(seconds=i)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "parameter_name": "RPM",
+            "value": 800.0 + i,
+            "unit": "rpm",
+            "drive_id": driveId,
+        }
+        for i in range(count)
+    ]
+
+
+def _ingest(engine, rows: list[dict], *, batchId: str, appendFastPath: bool = True) -> None:
+    with Session(engine) as session:
+        runSyncUpsert(
+            session=session,
+            deviceId=DEVICE,
+            batchId=batchId,
+            tables={"realtime_data": {"lastSyncedId": 0, "rows": rows}},
+            syncHistoryId=1,
+            appendFastPath=appendFastPath,
+        )
+        session.commit()
+
+
+def _windows(engine) -> dict[int, tuple[datetime, datetime, int]]:
+    with Session(engine) as session:
+        return {
+            row.drive_id: (row.min_ts, row.max_ts, row.row_count)
+            for row in session.scalars(select(DriveTimeWindow))
+        }
+
+
+class TestIngestMaintenance:
+    @pytest.mark.parametrize("appendFastPath", [True, False])
+    def test_batchesMergeIntoWindow(self, engine, appendFastPath: bool) -> None:
+        _ingest(engine, _rows(1, 7, BASE, 10), batchId="b1", appendFastPath=appendFastPath)
+        _ingest(
+            engine, _rows(11, 7, BASE + timedelta(seconds=10), 5),
+            batchId="b2", appendFastPath=appendFastPath,
+        )
+
+        assert _windows(engine) == {
+            7: (BASE, BASE + timedelta(seconds=14), 15),
+        }
+
+    def test_resentBatchDoesNotDoubleCount(self, engine) -> None:
+        rows = _rows(1, 7, BASE, 10)
+        _ingest(engine, rows, batchId="b1")
+        _ingest(engine, rows, batchId="b1")
+
+        assert _windows(engine)[7][2] == 10
+
+    def test_partialResendRecomputesFromRaw(self, engine) -> None:
+        _ingest(engine, _rows(1, 7, BASE, 10), batchId="b1")
+        _ingest(engine, _rows(6, 7, BASE + timedelta(seconds=5), 10), batchId="b2")
+
+        assert _windows(engine)[7] == (BASE, BASE + timedelta(seconds=14), 15)
+
+    def test_nullDriveIdRowsIgnored(self, engine) -> None:
+        rows = _rows(1, 7, BASE, 3)
+        for row in rows:
+            row["drive_id"] = None
+        _ingest(engine, rows, batchId="b1")
+
+        assert _windows(engine) == {}
+
+    def test_rebuildMatchesIncrementalState(self, engine) -> None:
+        _ingest(engine, _rows(1, 7, BASE, 10), batchId="b1")
+        _ingest(engine, _rows(11, 8, BASE + timedelta(hours=1), 4), batchId="b2")
+        incremental = _windows(engine)
+
+        with Session(engine) as session:
+            written = rebuildDriveTimeWindows(session)
+            session.commit()
+
+        assert written == 2
+        assert _windows(engine) == incremental
+
+    def test_rebuildPicksUpOutOfBandRows(self, engine) -> None:
+        with Session(engine) as session:
+            session.add(RealtimeData(
+                source_id=1, source_device=DEVICE, timestamp=BASE,
+                parameter_name="RPM", value=1.0, drive_id=9,
+            ))
+            session.commit()
+            assert rebuildDriveTimeWindows(session, deviceId=DEVICE) == 1
+            session.commit()
+
+        assert _windows(engine) == {9: (BASE, BASE, 1)}
+
+
+class TestDriveWindowIndex:
+    def test_matchesBruteForce(self) -> None:
+        rng = random.Random(11)
+        windows = {}
+        for driveId in range(1, 300):
+            start = BASE + timedelta(seconds=rng.randrange(0, 50_000))
+            windows[driveId] = (start, start + timedelta(seconds=rng.randrange(0, 2_000)))
+        index = DriveWindowIndex(windows)
+
+        for driveId, (start, end) in windows.items():
+            expected = sorted(
+                other for other, (oStart, oEnd) in windows.items()
+                if other != driveId and _rangesOverlapBySecond(start, end, oStart, oEnd)
+            )
+            assert index.overlapping(driveId) == expected
+
+    def test_subSecondWindowsFlooredLikeRawPath(self) -> None:
+        index = DriveWindowIndex({
+            1: (BASE, BASE + timedelta(seconds=5, microseconds=400_000)),
+            2: (BASE + timedelta(seconds=5, microseconds=900_000), BASE + timedelta(seconds=9)),
+        })
+
+        assert index.overlapping(1) == [2]
+
+    def test_unknownDriveReturnsEmpty(self) -> None:
+        assert DriveWindowIndex({}).overlapping(3) == []
+
+
+class TestDetectReadsIndex:
+    def test_overlapFoundFromMaintainedTable(self, engine) -> None:
+        _ingest(engine, _rows(1, 23, BASE, 60), batchId="b1")
+        _ingest(engine, _rows(61, 24, BASE + timedelta(seconds=30), 60), batchId="b2")
+        _ingest(engine, _rows(121, 25, BASE + timedelta(hours=2), 60), batchId="b3")
+
+        with Session(engine) as session:
+            assert detect_overlapping_drives(session, 23) == [24]
+            assert detect_overlapping_drives(session, 25) == []
+
+    def test_indexTakesPrecedenceOverRawScan(self, engine) -> None:
+        # A window row with no raw rows behind it proves the table is read.
+        with Session(engine) as session:
+            session.add_all([
+                DriveTimeWindow(
+                    source_device=DEVICE, drive_id=1, min_ts=BASE,
+                    max_ts=BASE + timedelta(minutes=5), row_count=1,
+                ),
+                DriveTimeWindow(
+                    source_device=DEVICE, drive_id=2, min_ts=BASE + timedelta(minutes=1),
+                    max_ts=BASE + timedelta(minutes=2), row_count=1,
+                ),
+            ])
+            session.commit()
+
+            assert detect_overlapping_drives(session, 1) == [2]
+
+    def test_unindexedCandidateReadFromRawRows(self, engine) -> None:
+        _ingest(engine, _rows(1, 23, BASE, 60), batchId="b1")
+        with Session(engine) as session:
+            # Loaded outside the sync path: raw rows, no window row.
+            session.add_all([
+                RealtimeData(
+                    source_id=1000 + 100 * driveId + i, source_device=DEVICE,
+                    timestamp=start + timedelta(seconds=i),
+                    parameter_name="RPM", value=900.0, drive_id=driveId,
+                )
+                for driveId, start in ((24, BASE + timedelta(seconds=59)),
+                                       (25, BASE + timedelta(minutes=5)))
+                for i in range(10)
+            ])
+            session.commit()
+
+            assert set(_windows(engine)) == {23}
+            assert detect_overlapping_drives(session, 23) == [24]
+
+    def test_rangeQueryMatchesIntervalTree(self, engine) -> None:
+        rng = random.Random(17)
+        windows = {}
+        for driveId in range(1, 120):
+            start = BASE + timedelta(seconds=rng.randrange(0, 20_000),
+                                     microseconds=rng.randrange(0, 1_000_000))
+            windows[driveId] = (start, start + timedelta(seconds=rng.randrange(0, 900)))
+        with Session(engine) as session:
+            session.add_all([
+                DriveTimeWindow(
+                    source_device=DEVICE, drive_id=driveId, min_ts=start,
+                    max_ts=end, row_count=1,
+                )
+                for driveId, (start, end) in windows.items()
+            ])
+            session.commit()
+
+            index = DriveWindowIndex(windows)
+            for driveId in windows:
+                assert detect_overlapping_drives(session, driveId) == index.overlapping(driveId)
+
+    def test_rangeQueryFloorsSubSecondBoundary(self, engine) -> None:
+        with Session(engine) as session:
+            session.add_all([
+                DriveTimeWindow(
+                    source_device=DEVICE, drive_id=1, min_ts=BASE,
+                    max_ts=BASE + timedelta(seconds=5, microseconds=400_000), row_count=1,
+                ),
+                DriveTimeWindow(
+                    source_device=DEVICE, drive_id=2,
+                    min_ts=BASE + timedelta(seconds=5, microseconds=900_000),
+                    max_ts=BASE + timedelta(seconds=9), row_count=1,
+                ),
+                DriveTimeWindow(
+                    source_device=DEVICE, drive_id=3, min_ts=BASE + timedelta(seconds=6),
+                    max_ts=BASE + timedelta(seconds=7), row_count=1,
+                ),
+            ])
+            session.commit()
+
+            assert detect_overlapping_drives(session, 1) == [2]
+            assert detect_overlapping_drives(session, 3) == [2]
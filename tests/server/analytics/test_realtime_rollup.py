@@ -0,0 +1,245 @@
+################################################################################
+# File Name: test_realtime_rollup.py
+# Purpose/Description: Tests for the realtime_rollup downsampled buckets --
+#                      ingest maintenance, re-send handling, rebuild parity,
+#                      the resolution picker and the point-budgeted reader.
+# Author: Rex
+# Creation Date: 2026-10-17
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-17    | Rex          | Initial
+# 2026-10-17    | Rex          | No 1s tier.
+# ================================================================================
+################################################################################
+
+"""Tests for :mod:`src.server.analytics.realtime_rollup`.
+
+Real temp-file SQLite + real ORM + the real sync ingest; no mocks.
+"""
+
+from __future__ import annotations
+
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from sqlalchemy import create_engine, select  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from src.server.analytics.realtime_rollup import (  # noqa: E402
+    chooseResolution,
+    loadRollupSeries,
+    rebuildRealtimeRollups,
+)
+from src.server.api.sync import runSyncUpsert  # noqa: E402
+from src.server.db.models import Base, RealtimeData, RealtimeRollup  # noqa: E402
+
+DEVICE = "chi-eclipse-01"
+BASE = datetime(2026, 10, 1, 8, 0, 0)
+
+
+@pytest.fixture
+def engine():
+    """Temp-file SQLite engine carrying the full server schema."""
+    tmp = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+    tmp.close()
+    eng = create_engine(f"sqlite:///{tmp.name}")
+    Base.metadata.create_all(eng)
+    yield eng
+    eng.dispose()
+    Path(tmp.name).unlink(missing_ok=True)
+
+
+def _rows(
+    firstId: int, start: datetime, count: int, *, stepSeconds: float = 0.5,
+    name: str = "RPM",
+) -> list[dict]:
+    return [
+        {
+            "id": firstId + i,
+            "timestamp": (start + timedelta(seconds=stepSeconds * i)).strftime(
+                "%Y-%m-%dT%H:%M:%S.%fZ",
+            ),
+            "parameter_name": name,
+            "value": float(800 + i),
+            "unit": "rpm",
+            "drive_id": 7,
+        }
+        for i in range(count)
+    ]
+
+
+def _ingest(engine, rows: list[dict], *, batchId: str, appendFastPath: bool = True) -> None:
+    with Session(engine) as session:
+        runSyncUpsert(
+            session=session,
+            deviceId=DEVICE,
+            batchId=batchId,
+            tables={"realtime_data": {"lastSyncedId": 0, "rows": rows}},
+            syncHistoryId=1,
+            appendFastPath=appendFastPath,
+        )
+        session.commit()
+
+
+def _buckets(engine) -> dict[tuple, tuple]:
+    with Session(engine) as session:
+        return {
+            (r.resolution_seconds, r.parameter_name, r.bucket_start): (
+                r.sample_count, r.min_value, r.max_value, r.value_sum,
+            )
+            for r in session.scalars(select(RealtimeRollup))
+        }
+
+
+def _rounded(buckets: dict[tuple, tuple]) -> dict[tuple, tuple]:
+    """Sums rounded: incremental and rebuilt paths add in different orders."""
+    return {key: (*stats[:3], round(stats[3], 6)) for key, stats in buckets.items()}
+
+
+class TestIngestMaintenance:
+    @pytest.mark.parametrize("appendFastPath", [True, False])
+    def test_batchesMergeIntoBuckets(self, engine, appendFastPath: bool) -> None:
+        # 0.5 s apart: 08:00:00.0 .. 08:00:09.5, then 08:00:10.0 .. 08:00:14.5
+        _ingest(engine, _rows(1, BASE, 20), batchId="b1", appendFastPath=appendFastPath)
+        _ingest(
+            engine, _rows(21, BASE + timedelta(seconds=10), 10),
+            batchId="b2", appendFastPath=appendFastPath,
+        )
+
+        buckets = _buckets(engine)
+        assert buckets[(10, "RPM", BASE)] == (
+            20, 800.0, 819.0, float(sum(range(800, 820))),
+        )
+        assert buckets[(10, "RPM", BASE + timedelta(seconds=10))][0] == 10
+        assert buckets[(60, "RPM", BASE)] == (
+            30, 800.0, 819.0, float(sum(range(800, 820)) + sum(range(800, 810))),
+        )
+        assert {k[0] for k in buckets} == {10, 60}
+        assert len(buckets) == 3
+
+    def test_resentBatchDoesNotDoubleCount(self, engine) -> None:
+        rows = _rows(1, BASE, 20)
+        _ingest(engine, rows, batchId="b1")
+        first = _buckets(engine)
+        _ingest(engine, rows, batchId="b1")
+
+        assert _buckets(engine) == first
+
+    @pytest.mark.parametrize("appendFastPath", [True, False])
+    def test_partialResendRecomputesFromRaw(self, engine, appendFastPath: bool) -> None:
+        _ingest(engine, _rows(1, BASE, 20), batchId="b1", appendFastPath=appendFastPath)
+        _ingest(
+            engine, _rows(11, BASE + timedelta(seconds=5), 20),
+            batchId="b2", appendFastPath=appendFastPath,
+        )
+
+        incremental = _buckets(engine)
+        assert incremental[(60, "RPM", BASE)][0] == 30
+
+        with Session(engine) as session:
+            rebuildRealtimeRollups(session)
+            session.commit()
+        assert _rounded(_buckets(engine)) == _rounded(incremental)
+
+    def test_simulatedRowsExcluded(self, engine) -> None:
+        rows = _rows(1, BASE, 4)
+        for row in rows:
+            row["data_source"] = "physics_sim"
+        _ingest(engine, rows, batchId="b1")
+
+        assert _buckets(engine) == {}
+
+    def test_rebuildMatchesIncrementalState(self, engine) -> None:
+        _ingest(engine, _rows(1, BASE, 300, stepSeconds=1.3), batchId="b1")
+        _ingest(
+            engine, _rows(301, BASE + timedelta(days=3), 50, name="SPEED"),
+            batchId="b2",
+        )
+        incremental = _buckets(engine)
+
+        with Session(engine) as session:
+            written = rebuildRealtimeRollups(session, deviceId=DEVICE)
+            session.commit()
+
+        assert written == len(incremental)
+        assert _rounded(_buckets(engine)) == _rounded(incremental)
+
+    def test_rebuildPicksUpOutOfBandRows(self, engine) -> None:
+        with Session(engine) as session:
+            session.add(RealtimeData(
+                source_id=1, source_device=DEVICE, timestamp=BASE + timedelta(seconds=17),
+                parameter_name="RPM", value=5.0, drive_id=9,
+            ))
+            session.commit()
+            assert rebuildRealtimeRollups(session) == 2
+            session.commit()
+
+        assert _buckets(engine)[(10, "RPM", BASE + timedelta(seconds=10))] == (
+            1, 5.0, 5.0, 5.0,
+        )
+
+
+class TestChooseResolution:
+    @pytest.mark.parametrize(("span", "maxPoints", "expected"), [
+        (timedelta(minutes=5), 30, 10),
+        (timedelta(minutes=5), 29, 60),
+        (timedelta(hours=1), 360, 10),
+        (timedelta(hours=1), 359, 60),
+        (timedelta(days=30), 100, 60),
+    ])
+    def test_finestThatFits(self, span, maxPoints, expected) -> None:
+        assert chooseResolution(BASE, BASE + span, maxPoints) == expected
+
+    def test_unalignedStartCountsItsWholeBucket(self) -> None:
+        start = BASE + timedelta(seconds=5)
+        assert chooseResolution(start, start + timedelta(seconds=60), 6) == 60
+
+    def test_invalidArgumentsRaise(self) -> None:
+        with pytest.raises(ValueError):
+            chooseResolution(BASE, BASE, 10)
+        with pytest.raises(ValueError):
+            chooseResolution(BASE, BASE + timedelta(hours=1), 0)
+
+
+class TestLoadRollupSeries:
+    def test_readsChosenResolution(self, engine) -> None:
+        _ingest(engine, _rows(1, BASE, 240), batchId="b1")  # two minutes
+
+        with Session(engine) as session:
+            series = loadRollupSeries(
+                session, DEVICE, ["RPM", "SPEED"], BASE, BASE + timedelta(minutes=2), 12,
+            )
+
+        assert series.bucketSeconds == 10
+        assert series.points["SPEED"] == []
+        points = series.points["RPM"]
+        assert len(points) == 12
+        assert points[0].sampleCount == 20
+        assert points[0].avgValue == pytest.approx(809.5)
+
+    def test_mergesMinutesPastBudget(self, engine) -> None:
+        _ingest(engine, _rows(1, BASE, 600, stepSeconds=1.0), batchId="b1")  # ten minutes
+
+        with Session(engine) as session:
+            series = loadRollupSeries(
+                session, DEVICE, ["RPM"], BASE, BASE + timedelta(minutes=10), 4,
+            )
+
+        assert series.bucketSeconds == 180
+        points = series.points["RPM"]
+        assert [p.bucketStart for p in points] == [
+            BASE + timedelta(minutes=m) for m in (0, 3, 6, 9)
+        ]
+        assert sum(p.sampleCount for p in points) == 600
+        assert points[0].minValue == 800.0
+        assert points[0].maxValue == 979.0
+        assert points[-1].sampleCount == 60
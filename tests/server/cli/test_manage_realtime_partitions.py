@@ -0,0 +1,67 @@
+################################################################################
+# File Name: test_manage_realtime_partitions.py
+# Purpose/Description: Tests for the manage_realtime_partitions server CLI --
+#                      argument validation and the refusal to run against a
+#                      non-MariaDB database.
+# Author: Rex
+# Creation Date: 2026-10-17
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-17    | Rex          | Initial
+# ================================================================================
+################################################################################
+
+"""Tests for :mod:`src.server.cli.manage_realtime_partitions`."""
+
+from __future__ import annotations
+
+import logging
+from datetime import date
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from src.server.cli import manage_realtime_partitions as cli  # noqa: E402
+
+
+def _runCli(monkeypatch, argv: list[str]) -> int:
+    monkeypatch.setattr(cli, "_resolveSyncDatabaseUrl", lambda: "sqlite://")
+    return cli.main(argv)
+
+
+class TestArguments:
+    def test_monthParsed(self) -> None:
+        args = cli._buildArgParser().parse_args(["--archive-before", "2027-01"])
+
+        assert args.archive_before == date(2027, 1, 1)
+
+    def test_ensureAheadDefaultsWhenBare(self) -> None:
+        args = cli._buildArgParser().parse_args(["--ensure-ahead"])
+
+        assert args.ensure_ahead == cli.DEFAULT_MONTHS_AHEAD
+
+    @pytest.mark.parametrize("argv", [
+        [],
+        ["--status", "--ensure-ahead", "2"],
+        ["--archive-before", "January"],
+        ["--drop-before", "2027-01"],
+    ], ids=["noAction", "twoActions", "badMonth", "dropWithoutYes"])
+    def test_rejected(self, monkeypatch, argv) -> None:
+        with pytest.raises(SystemExit) as exc:
+            _runCli(monkeypatch, argv)
+
+        assert exc.value.code == 2
+
+
+class TestDatabase:
+    def test_nonMariaDbFailsCleanly(self, monkeypatch, caplog) -> None:
+        with caplog.at_level(logging.ERROR):
+            code = _runCli(monkeypatch, ["--ensure-ahead", "2"])
+
+        assert code == 1
+        assert "MariaDB-only" in caplog.text
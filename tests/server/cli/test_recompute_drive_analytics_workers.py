@@ -0,0 +1,163 @@
+################################################################################
+# File Name: test_recompute_drive_analytics_workers.py
+# Purpose/Description: recompute_drive_analytics CLI on the batch engine --
+#                      --workers sharding, multi-process parity with the
+#                      in-process run, and the deploy-parsed summary line.
+# Author: Rex
+# Creation Date: 2026-10-16
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-16    | Rex          | Initial
+# 2026-10-17    | Rex          | A raising drive fails only itself, not its
+#               |              | pass; DRY-RUN line names the batch engine.
+# ================================================================================
+################################################################################
+
+"""CLI tests for ``--workers`` on recompute_drive_analytics."""
+
+from __future__ import annotations
+
+import logging
+import shutil
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from sqlalchemy import create_engine, select  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from src.server.cli import recompute_drive_analytics as cli  # noqa: E402
+from src.server.db.models import (  # noqa: E402
+    Base,
+    DriveStatistic,
+    DriveSummary,
+    RealtimeData,
+)
+
+
+@pytest.fixture
+def tmpDir():
+    with tempfile.TemporaryDirectory() as tmp:
+        yield Path(tmp)
+
+
+def _seededDb(path: Path) -> str:
+    """Drives 1-6, one hour apart, 30 s of RPM + SPEED each."""
+    eng = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(eng)
+    start = datetime(2026, 9, 2, 8, 0, 0)
+    with Session(eng) as session:
+        sourceId = 0
+        for driveId in range(1, 7):
+            session.add(DriveSummary(
+                source_device="chi-eclipse-01", source_id=driveId,
+                drive_id=driveId, data_source="real",
+            ))
+            for i in range(30):
+                for param in ("RPM", "SPEED"):
+                    sourceId += 1
+                    session.add(RealtimeData(
+                        source_id=sourceId, source_device="chi-eclipse-01",
+                        timestamp=start + timedelta(hours=driveId, seconds=i),
+                        parameter_name=param, value=float(driveId * 10 + i),
+                        drive_id=driveId,
+                    ))
+        session.commit()
+    eng.dispose()
+    return f"sqlite:///{path}"
+
+
+def _rows(url: str) -> tuple[list[tuple], list[tuple]]:
+    eng = create_engine(url)
+    with Session(eng) as session:
+        summaries = session.execute(
+            select(
+                DriveSummary.source_id, DriveSummary.start_time,
+                DriveSummary.row_count, DriveSummary.data_quality,
+            ).order_by(DriveSummary.source_id)
+        ).all()
+        statistics = session.execute(
+            select(
+                DriveStatistic.summary_id, DriveStatistic.parameter_name,
+                DriveStatistic.avg_value, DriveStatistic.sample_count,
+            ).order_by(DriveStatistic.summary_id, DriveStatistic.parameter_name)
+        ).all()
+    eng.dispose()
+    return summaries, statistics
+
+
+def _runCli(monkeypatch, url: str, argv: list[str]) -> int:
+    monkeypatch.setattr(cli, "_resolveSyncDatabaseUrl", lambda: url)
+    return cli.main(argv)
+
+
+def test_shardDriveIds_contiguousNearEqualRanges():
+    assert cli._shardDriveIds([7, 1, 2, 3, 4, 5, 6, 1], 3) == [
+        [1, 2, 3], [4, 5], [6, 7],
+    ]
+    assert cli._shardDriveIds([1, 2], 8) == [[1], [2]]
+
+
+def test_workers_matchInProcessRun(monkeypatch, tmpDir, caplog):
+    singleUrl = _seededDb(tmpDir / "single.db")
+    shutil.copy(tmpDir / "single.db", tmpDir / "sharded.db")
+    shardedUrl = f"sqlite:///{tmpDir / 'sharded.db'}"
+
+    assert _runCli(monkeypatch, singleUrl, ["--drive-id-range", "1-7"]) == 0
+    with caplog.at_level(logging.INFO):
+        rc = _runCli(
+            monkeypatch, shardedUrl, ["--drive-id-range", "1-7", "--workers", "3"],
+        )
+
+    assert rc == 0
+    assert _rows(shardedUrl) == _rows(singleUrl)
+    summaries, statistics = _rows(shardedUrl)
+    assert all(row.row_count == 60 for row in summaries)
+    assert len(statistics) == 12
+    # Deploy Step 4.9 parses this exact shape.
+    assert "done | success=6 | skipped=1 | failed=0" in caplog.text
+    assert "drive_id=4 | OK" in caplog.text
+
+
+def test_workersBelowOne_rejected(monkeypatch, tmpDir):
+    url = _seededDb(tmpDir / "db.db")
+    with pytest.raises(SystemExit):
+        _runCli(monkeypatch, url, ["--drive-id", "1", "--workers", "0"])
+
+
+def test_raisingDrive_failsOnlyItself(monkeypatch, tmpDir, caplog):
+    url = _seededDb(tmpDir / "db.db")
+    realBatch = cli.computeDriveAnalyticsBatch
+
+    def flakyBatch(session, driveIds, **kwargs):
+        if 3 in driveIds:
+            raise RuntimeError("drive 3 is broken")
+        return realBatch(session, driveIds, **kwargs)
+
+    monkeypatch.setattr(cli, "computeDriveAnalyticsBatch", flakyBatch)
+    with caplog.at_level(logging.INFO):
+        rc = _runCli(monkeypatch, url, ["--drive-id-range", "1-6"])
+
+    assert rc == 0
+    assert "done | success=5 | skipped=0 | failed=1" in caplog.text
+    assert "drive_id=3 | FAILED | drive 3 is broken" in caplog.text
+    summaries, _ = _rows(url)
+    assert [row.row_count for row in summaries] == [60, 60, 0, 60, 60, 60]
+
+
+def test_dryRun_namesBatchEngine(monkeypatch, tmpDir, caplog):
+    url = _seededDb(tmpDir / "db.db")
+    with caplog.at_level(logging.INFO):
+        rc = _runCli(monkeypatch, url, ["--drive-id", "1", "--dry-run"])
+
+    assert rc == 0
+    assert "DRY-RUN | drive_id=1 | would recompute drive_summary" in caplog.text
+    assert "compute_drive_summary + compute_drive_statistics" not in caplog.text
@@ -0,0 +1,349 @@
+################################################################################
+# File Name: test_analysis_jobs.py
+# Purpose/Description: Tests for the AI analysis job queue -- concurrency cap,
+#                      de-duplication, back-pressure, retention, metrics, and
+#                      the POST /analyze (202) / GET /analyze/{job_id} routes.
+# Author: Rex
+# Creation Date: 2026-10-17
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-17    | Rex          | Initial
+# ================================================================================
+################################################################################
+
+"""Tests for :mod:`src.server.services.analysis_jobs` and its routes.
+
+The queue is driven by a scripted analysis coroutine (a stand-in for
+``runAnalysis`` that needs no database); the full runAnalysis path through
+the queue is covered in ``test_analyze_real.py``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Executor
+from typing import Any
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+pytest.importorskip("pytest_asyncio")
+
+from src.server.services.analysis import (  # noqa: E402
+    AnalysisResult,
+    DriveNotFound,
+    OllamaUnreachable,
+)
+from src.server.services.analysis_jobs import (  # noqa: E402
+    JOB_COMPLETED,
+    JOB_FAILED,
+    JOB_QUEUED,
+    JOB_RUNNING,
+    AnalysisJobQueue,
+    AnalysisQueueFull,
+)
+
+
+class ScriptedAnalysis:
+    """runAnalysis stand-in: each drive blocks until released, then returns."""
+
+    def __init__(self) -> None:
+        self.gates: dict[int, asyncio.Event] = {}
+        self.failures: dict[int, Exception] = {}
+        self.calls: list[dict[str, Any]] = []
+
+    def release(self, driveId: int) -> None:
+        self.gates.setdefault(driveId, asyncio.Event()).set()
+
+    async def __call__(
+        self, *, driveId: int, parameters: dict, executor: Executor, **kwargs: Any,
+    ) -> AnalysisResult:
+        self.calls.append({"driveId": driveId, "executor": executor, **kwargs})
+        await self.gates.setdefault(driveId, asyncio.Event()).wait()
+        if driveId in self.failures:
+            raise self.failures[driveId]
+        return AnalysisResult(
+            status="ok",
+            analysis_id=f"analysis-{driveId}",
+            message="done",
+            recommendations=[],
+            model="test-model",
+            processingTimeMs=1,
+        )
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+# ==============================================================================
+# Queue
+# ==============================================================================
+
+
+class TestQueue:
+    @pytest.mark.asyncio
+    async def test_concurrencyCapHoldsExtraJobsQueued(self) -> None:
+        analysis = ScriptedAnalysis()
+        queue = AnalysisJobQueue(analysis, maxConcurrent=2)
+
+        jobs = [queue.submit(driveId, {})[0] for driveId in (1, 2, 3)]
+        await _settle()
+
+        assert [j.status for j in jobs] == [JOB_RUNNING, JOB_RUNNING, JOB_QUEUED]
+        analysis.release(1)
+        await jobs[0].done.wait()
+        await _settle()
+        assert jobs[2].status == JOB_RUNNING
+        analysis.release(2)
+        analysis.release(3)
+        await asyncio.gather(*(j.done.wait() for j in jobs))
+        assert all(j.status == JOB_COMPLETED for j in jobs)
+        await queue.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_identicalInFlightRequestJoinsExistingJob(self) -> None:
+        analysis = ScriptedAnalysis()
+        queue = AnalysisJobQueue(analysis)
+
+        first, dedupFirst = queue.submit(7, {"focus": ["RPM"], "x": 1})
+        again, dedupAgain = queue.submit(7, {"x": 1, "focus": ["RPM"]})
+        other, dedupOther = queue.submit(7, {"focus": ["MAF"]})
+
+        assert (dedupFirst, dedupAgain, dedupOther) == (False, True, False)
+        assert again is first
+        assert other is not first
+        analysis.release(7)
+        await asyncio.gather(first.done.wait(), other.done.wait())
+        assert len(analysis.calls) == 2
+
+        resubmitted, dedup = queue.submit(7, {"focus": ["RPM"], "x": 1})
+        assert not dedup and resubmitted is not first
+        await resubmitted.done.wait()
+        await queue.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_fullQueueRejects(self) -> None:
+        analysis = ScriptedAnalysis()
+        queue = AnalysisJobQueue(analysis, maxConcurrent=1, maxQueued=1)
+
+        queue.submit(1, {})
+        await _settle()
+        queue.submit(2, {})
+
+        with pytest.raises(AnalysisQueueFull):
+            queue.submit(3, {})
+        assert queue.metrics()["rejected"] == 1
+        await queue.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_failureStoredOnJob(self) -> None:
+        analysis = ScriptedAnalysis()
+        analysis.failures[5] = OllamaUnreachable("down")
+        queue = AnalysisJobQueue(analysis)
+
+        job, _ = queue.submit(5, {})
+        analysis.release(5)
+        await job.done.wait()
+
+        assert job.status == JOB_FAILED
+        assert isinstance(job.error, OllamaUnreachable)
+        assert job.result is None
+        await queue.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_workerPoolHandedToAnalysis(self) -> None:
+        analysis = ScriptedAnalysis()
+        queue = AnalysisJobQueue(analysis, maxConcurrent=3)
+
+        job, _ = queue.submit(1, {}, ollamaModel="m")
+        analysis.release(1)
+        await job.done.wait()
+
+        call = analysis.calls[0]
+        assert call["ollamaModel"] == "m"
+        assert call["executor"]._max_workers == 3
+        await queue.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_finishedJobsPrunedPastRetention(self) -> None:
+        analysis = ScriptedAnalysis()
+        queue = AnalysisJobQueue(analysis, retainFinished=2)
+
+        jobs = []
+        for driveId in (1, 2, 3):
+            analysis.release(driveId)
+            job, _ = queue.submit(driveId, {})
+            await job.done.wait()
+            jobs.append(job)
+
+        assert queue.get(jobs[0].jobId) is None
+        assert queue.get(jobs[2].jobId) is jobs[2]
+        await queue.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_metricsReportDepthOutcomesAndLatency(self) -> None:
+        analysis = ScriptedAnalysis()
+        analysis.failures[2] = DriveNotFound("nope")
+        queue = AnalysisJobQueue(analysis, maxConcurrent=1)
+
+        first, _ = queue.submit(1, {})
+        second, _ = queue.submit(2, {})
+        await _settle()
+        metrics = queue.metrics()
+        assert (metrics["running"], metrics["queued"]) == (1, 1)
+        assert metrics["runMsP50"] is None
+
+        analysis.release(1)
+        analysis.release(2)
+        await asyncio.gather(first.done.wait(), second.done.wait())
+        metrics = queue.metrics()
+
+        assert (metrics["running"], metrics["queued"]) == (0, 0)
+        assert (metrics["completed"], metrics["failed"]) == (1, 1)
+        assert metrics["queueWaitMsP95"] >= metrics["queueWaitMsP50"] >= 0
+        assert metrics["runMsP50"] >= 0
+        await queue.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_shutdownFailsOutstandingJobs(self) -> None:
+        analysis = ScriptedAnalysis()
+        queue = AnalysisJobQueue(analysis, maxConcurrent=1)
+        running, _ = queue.submit(1, {})
+        waiting, _ = queue.submit(2, {})
+        await _settle()
+
+        await queue.shutdown()
+
+        assert running.status == waiting.status == JOB_FAILED
+        assert running.done.is_set() and waiting.done.is_set()
+
+
+# ==============================================================================
+# Routes
+# ==============================================================================
+
+
+@pytest.fixture
+def appAndAnalysis():
+    from src.server.api.app import createApp
+    from src.server.config import Settings
+
+    app = createApp(settings=Settings(
+        DATABASE_URL="sqlite+aiosqlite:///:memory:", API_KEY="valid-key",
+    ))
+    app.state.engine = object()  # never touched by the scripted analysis
+    analysis = ScriptedAnalysis()
+    app.state.analysisJobs = AnalysisJobQueue(analysis, maxConcurrent=1, maxQueued=1)
+    return app, analysis
+
+
+def _client(app):
+    import httpx
+
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://test",
+        headers={"X-API-Key": "valid-key"},
+    )
+
+
+_BODY = {"drive_id": 42, "parameters": {"focus": ["RPM"]}}
+
+
+class TestRoutes:
+    @pytest.mark.asyncio
+    async def test_postQueuesAndGetReportsResult(self, appAndAnalysis) -> None:
+        app, analysis = appAndAnalysis
+        async with _client(app) as client:
+            posted = await client.post("/api/v1/analyze", json=_BODY)
+            assert posted.status_code == 202
+            body = posted.json()
+            assert body["drive_id"] == 42
+            assert body["deduplicated"] is False
+
+            duplicate = (await client.post("/api/v1/analyze", json=_BODY)).json()
+            assert duplicate["job_id"] == body["job_id"]
+            assert duplicate["deduplicated"] is True
+
+            analysis.release(42)
+            await app.state.analysisJobs.get(body["job_id"]).done.wait()
+            job = (await client.get(f"/api/v1/analyze/{body['job_id']}")).json()
+
+        assert job["status"] == "completed"
+        assert job["error"] is None
+        assert job["queue_wait_ms"] >= 0
+        assert job["result"]["analysis_id"] == "analysis-42"
+        assert set(job["result"]) == {
+            "status", "analysis_id", "message", "recommendations", "model",
+            "processingTimeMs",
+        }
+
+    @pytest.mark.asyncio
+    async def test_waitReturnsLegacyEnvelope(self, appAndAnalysis) -> None:
+        app, analysis = appAndAnalysis
+        analysis.release(42)
+        async with _client(app) as client:
+            response = await client.post("/api/v1/analyze?wait=true", json=_BODY)
+
+        assert response.status_code == 200
+        assert response.json()["analysis_id"] == "analysis-42"
+
+    @pytest.mark.asyncio
+    async def test_failedJobMapsToDocumentedStatus(self, appAndAnalysis) -> None:
+        app, analysis = appAndAnalysis
+        analysis.failures[42] = DriveNotFound("No drive_summary row for drive_id=42")
+        analysis.release(42)
+        async with _client(app) as client:
+            waited = await client.post("/api/v1/analyze?wait=true", json=_BODY)
+            jobId = next(iter(app.state.analysisJobs._jobs))
+            polled = (await client.get(f"/api/v1/analyze/{jobId}")).json()
+
+        assert waited.status_code == 404
+        assert polled["status"] == "failed"
+        assert polled["result"] is None
+        assert polled["error"]["status_code"] == 404
+
+    @pytest.mark.asyncio
+    async def test_fullQueueReturns503WithRetryAfter(self, appAndAnalysis) -> None:
+        app, _analysis = appAndAnalysis
+        async with _client(app) as client:
+            for driveId in (1, 2):
+                response = await client.post(
+                    "/api/v1/analyze", json={"drive_id": driveId, "parameters": {}},
+                )
+                assert response.status_code == 202
+                await _settle()
+            rejected = await client.post(
+                "/api/v1/analyze", json={"drive_id": 3, "parameters": {}},
+            )
+
+        assert rejected.status_code == 503
+        assert "Retry-After" in rejected.headers
+        await app.state.analysisJobs.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_unknownJobReturns404(self, appAndAnalysis) -> None:
+        app, _analysis = appAndAnalysis
+        async with _client(app) as client:
+            response = await client.get("/api/v1/analyze/job-missing")
+
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_healthReportsQueue(self, appAndAnalysis) -> None:
+        app, _analysis = appAndAnalysis
+        async with _client(app) as client:
+            await client.post("/api/v1/analyze", json=_BODY)
+            await _settle()
+            health = (await client.get("/api/v1/health")).json()
+
+        assert health["analysisQueue"]["running"] == 1
+        assert health["analysisQueue"]["maxConcurrent"] == 1
+        await app.state.analysisJobs.shutdown()
@@ -12,6 +12,11 @@
 # Date          | Author       | Description
 # ================================================================================
 # 2026-04-16    | Ralph Agent  | Initial TDD tests for US-CMP-005 — real AI path
+# 2026-10-17    | Rex          | Route tests post ``?wait=true`` (the queued
+#               |              | default answers 202); event loop stays free
+#               |              | while the Ollama call runs
+# 2026-10-17    | Rex          | Identical re-analysis answered from the LLM
+#               |              | response cache; ?bypass_cache=true regenerates
 # ================================================================================
 ################################################################################
 
@@ -336,7 +341,7 @@ class TestAnalyzeRealHappyPath:
             base_url="http://test",
         ) as client:
             response = await client.post(
-                "/api/v1/analyze",
+                "/api/v1/analyze?wait=true",
                 json={"drive_id": 101, "parameters": {"focus": ["RPM"]}},
                 headers={"X-API-Key": "valid-key"},
             )
@@ -383,7 +388,7 @@ class TestAnalyzeRealHappyPath:
             base_url="http://test",
         ) as client:
             await client.post(
-                "/api/v1/analyze",
+                "/api/v1/analyze?wait=true",
                 json={"drive_id": 202, "parameters": {}},
                 headers={"X-API-Key": "valid-key"},
             )
@@ -432,7 +437,7 @@ class TestAnalyzeRealHappyPath:
             base_url="http://test",
         ) as client:
             response = await client.post(
-                "/api/v1/analyze",
+                "/api/v1/analyze?wait=true",
                 json={"drive_id": 303, "parameters": {}},
                 headers={"X-API-Key": "valid-key"},
             )
@@ -456,7 +461,7 @@ class TestAnalyzeRealErrorMapping:
             base_url="http://test",
         ) as client:
             response = await client.post(
-                "/api/v1/analyze",
+                "/api/v1/analyze?wait=true",
                 json={"drive_id": 9999, "parameters": {}},
                 headers={"X-API-Key": "valid-key"},
             )
@@ -491,7 +496,7 @@ class TestAnalyzeRealErrorMapping:
             base_url="http://test",
         ) as client:
             response = await client.post(
-                "/api/v1/analyze",
+                "/api/v1/analyze?wait=true",
                 json={"drive_id": 77, "parameters": {}},
                 headers={"X-API-Key": "valid-key"},
             )
@@ -523,7 +528,7 @@ class TestAnalyzeRealErrorMapping:
             base_url="http://test",
         ) as client:
             response = await client.post(
-                "/api/v1/analyze",
+                "/api/v1/analyze?wait=true",
                 json={"drive_id": 404, "parameters": {}},
                 headers={"X-API-Key": "valid-key"},
             )
@@ -561,7 +566,7 @@ class TestAnalyzeRealErrorMapping:
             base_url="http://test",
         ) as client:
             response = await client.post(
-                "/api/v1/analyze",
+                "/api/v1/analyze?wait=true",
                 json={"drive_id": 502, "parameters": {}},
                 headers={"X-API-Key": "valid-key"},
             )
@@ -576,6 +581,112 @@ class TestAnalyzeRealErrorMapping:
         assert histories[0].status == "failed"
 
 
+@_skipNoAsyncDb
+class TestAnalyzeQueuedDoesNotBlockLoop:
+    """The Ollama call runs on a worker thread, not the event loop."""
+
+    @pytest.mark.asyncio
+    async def test_healthAnswersWhileOllamaCallInFlight(
+        self, asyncAppAndEngine, monkeypatch
+    ):
+        import asyncio
+        import threading
+
+        import httpx
+
+        from src.server.services import analysis as analysisModule
+
+        app, engine = asyncAppAndEngine
+        await _seedDrive(engine, driveId=303)
+
+        entered = threading.Event()
+        release = threading.Event()
+
+        def slowInvoke(**_kw):
+            entered.set()
+            release.wait(timeout=10)
+            return "[]"
+
+        monkeypatch.setattr(analysisModule, "_invokeOllama", slowInvoke)
+
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://test",
+        ) as client:
+            queued = await client.post(
+                "/api/v1/analyze",
+                json={"drive_id": 303, "parameters": {}},
+                headers={"X-API-Key": "valid-key"},
+            )
+            assert queued.status_code == 202
+            jobId = queued.json()["job_id"]
+
+            await asyncio.to_thread(entered.wait, 10)
+            health = await client.get("/api/v1/health")
+            assert health.json()["analysisQueue"]["running"] == 1
+            release.set()
+
+            for _ in range(200):
+                job = (await client.get(
+                    f"/api/v1/analyze/{jobId}", headers={"X-API-Key": "valid-key"},
+                )).json()
+                if job["status"] == "completed":
+                    break
+                await asyncio.sleep(0.01)
+
+        assert job["status"] == "completed"
+        assert job["result"]["status"] == "ok"
+
+
+@_skipNoAsyncDb
+class TestAnalyzeResponseCache:
+    """A re-analysis with an identical rendered prompt skips the Ollama call."""
+
+    @pytest.mark.asyncio
+    async def test_repeatServedFromCacheUnlessBypassed(
+        self, asyncAppAndEngine, monkeypatch
+    ):
+        import httpx
+        from sqlalchemy.ext.asyncio import AsyncSession
+
+        from src.server.ai.response_cache import LlmResponseCache
+        from src.server.services import analysis as analysisModule
+
+        app, engine = asyncAppAndEngine
+        app.state.llmCache = LlmResponseCache(":memory:")
+        await _seedDrive(engine, driveId=404)
+
+        calls = []
+
+        def countingInvoke(**kwargs):
+            calls.append(kwargs["userMessage"])
+            return "[]"
+
+        monkeypatch.setattr(analysisModule, "_invokeOllama", countingInvoke)
+
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://test",
+            headers={"X-API-Key": "valid-key"},
+        ) as client:
+            for query in ("wait=true", "wait=true", "wait=true&bypass_cache=true"):
+                response = await client.post(
+                    f"/api/v1/analyze?{query}",
+                    json={"drive_id": 404, "parameters": {}},
+                )
+                assert response.status_code == 200
+            health = (await client.get("/api/v1/health")).json()
+
+        assert len(calls) == 2
+        async with AsyncSession(engine) as session:
+            histories = (
+                await session.execute(select(AnalysisHistory).order_by(AnalysisHistory.id))
+            ).scalars().all()
+        outcomes = [json.loads(h.result_summary)["llm_cache"] for h in histories]
+        assert outcomes == ["miss", "hit", "bypass"]
+        assert health["llmCache"]["hits"] == 1
+
+
 # ==============================================================================
 # Transport-level Ollama adapter coverage
 # ==============================================================================
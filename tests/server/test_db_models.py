@@ -436,17 +436,18 @@ class TestTableCount:
         """
         Given: the models module
         When: counting all model classes with __tablename__
-        Then: there are exactly 23 tables (base 15 + baselines from US-162
+        Then: there are exactly 26 tables (base 15 + baselines from US-162
               + analysis_recommendations from US-CMP-005 + dtc_log from US-204
               + battery_health_log from US-217 + drive_counter from US-314
               + dtc_freeze_frame from US-368 + speed_pid_calibration from US-370
-              + ecu from US-376)
+              + ecu from US-376 + drive_time_window + parameter_history
+              + realtime_rollup)
         """
         from src.server.db.models import Base
 
         tableNames = list(Base.metadata.tables.keys())
-        assert len(tableNames) == 23, (
-            f"Expected 23 tables, got {len(tableNames)}: {tableNames}"
+        assert len(tableNames) == 26, (
+            f"Expected 26 tables, got {len(tableNames)}: {tableNames}"
         )
 
 
@@ -0,0 +1,219 @@
+################################################################################
+# File Name: test_llm_response_cache.py
+# Purpose/Description: Tests for the content-addressed LLM response cache --
+#                      key sensitivity, hit / miss / bypass, TTL expiry, LRU
+#                      eviction, persistence, and the AiAnalyzer wiring.
+# Author: Rex
+# Creation Date: 2026-10-17
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-17    | Rex          | Initial
+# ================================================================================
+################################################################################
+
+"""Tests for :mod:`src.server.ai.response_cache`.
+
+The server ``runAnalysis`` / ``/analyze`` path through the cache is covered
+in ``test_analyze_real.py`` (needs aiosqlite).
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from src.server.ai.response_cache import (
+    LlmResponseCache,
+    buildCacheKey,
+    createResponseCache,
+)
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Generator:
+    """Counts calls; returns a distinct reply each time."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self) -> str:
+        self.calls += 1
+        return f"reply-{self.calls}"
+
+
+# ==============================================================================
+# Key
+# ==============================================================================
+
+
+class TestBuildCacheKey:
+    def test_identicalRequestsShareKey(self) -> None:
+        assert buildCacheKey("m", "sys", "user", {"a": 1, "b": 2}) == buildCacheKey(
+            "m", "sys", "user", {"b": 2, "a": 1},
+        )
+
+    @pytest.mark.parametrize(
+        "changed",
+        [
+            ("m2", "sys", "user", None),
+            ("m", "sys2", "user", None),
+            ("m", "sys", "user2", None),
+            ("m", "sys", "user", {"endpoint": "generate"}),
+        ],
+    )
+    def test_anyComponentChangesKey(self, changed: tuple[Any, ...]) -> None:
+        assert buildCacheKey(*changed) != buildCacheKey("m", "sys", "user", None)
+
+
+# ==============================================================================
+# Cache
+# ==============================================================================
+
+
+class TestLlmResponseCache:
+    def test_secondIdenticalRequestIsHit(self) -> None:
+        cache = LlmResponseCache(":memory:")
+        generate = Generator()
+
+        first = cache.getOrCompute("k", "m", generate)
+        second = cache.getOrCompute("k", "m", generate)
+
+        assert first == ("reply-1", False)
+        assert second == ("reply-1", True)
+        assert generate.calls == 1
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+        assert stats["hitRate"] == 0.5
+
+    def test_bypassRegeneratesAndReplacesEntry(self) -> None:
+        cache = LlmResponseCache(":memory:")
+        generate = Generator()
+        cache.getOrCompute("k", "m", generate)
+
+        assert cache.getOrCompute("k", "m", generate, bypass=True) == ("reply-2", False)
+        assert cache.getOrCompute("k", "m", generate) == ("reply-2", True)
+        assert cache.stats()["bypassed"] == 1
+
+    def test_failedGenerationIsNotCached(self) -> None:
+        cache = LlmResponseCache(":memory:")
+
+        def boom() -> str:
+            raise RuntimeError("ollama down")
+
+        with pytest.raises(RuntimeError):
+            cache.getOrCompute("k", "m", boom)
+        assert cache.stats()["entries"] == 0
+
+    def test_entryExpiresAfterTtl(self) -> None:
+        clock = FakeClock()
+        cache = LlmResponseCache(":memory:", ttlSeconds=60, clock=clock)
+        cache.put("k", "m", "old")
+
+        clock.now += 59
+        assert cache.get("k") == "old"
+        clock.now += 2
+        assert cache.get("k") is None
+        assert cache.stats()["entries"] == 0
+
+    def test_leastRecentlyUsedEvictedPastMaxEntries(self) -> None:
+        clock = FakeClock()
+        cache = LlmResponseCache(":memory:", maxEntries=2, clock=clock)
+        cache.put("a", "m", "A")
+        clock.now += 1
+        cache.put("b", "m", "B")
+        clock.now += 1
+        cache.get("a")  # a is now more recently used than b
+        clock.now += 1
+        cache.put("c", "m", "C")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "A"
+        assert cache.get("c") == "C"
+        assert cache.stats()["evictions"] == 1
+
+    def test_entriesSurviveReopen(self, tmp_path) -> None:
+        path = str(tmp_path / "nested" / "cache.db")
+        cache = LlmResponseCache(path)
+        cache.put("k", "m", "persisted")
+        cache.close()
+
+        assert LlmResponseCache(path).get("k") == "persisted"
+
+    def test_createResponseCacheEmptyPathDisables(self) -> None:
+        assert createResponseCache("") is None
+        assert createResponseCache(None) is None
+
+
+# ==============================================================================
+# AiAnalyzer wiring
+# ==============================================================================
+
+
+def _analyzer(tmp_path, enabled: bool = True):
+    from src.server.ai.analyzer import AiAnalyzer
+
+    return AiAnalyzer(config={
+        "server": {
+            "ai": {
+                "enabled": True,
+                "model": "gemma2:2b",
+                "responseCache": {
+                    "enabled": enabled,
+                    "path": str(tmp_path / "llm_response_cache.db"),
+                    "ttlHours": 1,
+                    "maxEntries": 10,
+                },
+            },
+        },
+    })
+
+
+class TestAiAnalyzerResponseCache:
+    def test_repeatedPromptServedFromCache(self, tmp_path, monkeypatch) -> None:
+        from src.server.ai import analyzer as analyzerModule
+
+        calls: list[str] = []
+
+        def fakeCallOllama(baseUrl, model, prompt, timeoutSeconds=None):
+            calls.append(prompt)
+            return f"reply to {prompt}"
+
+        monkeypatch.setattr(analyzerModule, "callOllama", fakeCallOllama)
+        analyzer = _analyzer(tmp_path)
+
+        assert analyzer._callOllama("p1") == "reply to p1"
+        assert analyzer._callOllama("p1") == "reply to p1"
+        assert analyzer._callOllama("p2") == "reply to p2"
+        analyzer._callOllama("p1", bypassCache=True)
+
+        assert calls == ["p1", "p2", "p1"]
+        status = analyzer.getStatus()["responseCache"]
+        assert (status["hits"], status["misses"], status["bypassed"]) == (1, 2, 1)
+
+    def test_disabledCacheAlwaysGenerates(self, tmp_path, monkeypatch) -> None:
+        from src.server.ai import analyzer as analyzerModule
+
+        calls: list[str] = []
+        monkeypatch.setattr(
+            analyzerModule, "callOllama",
+            lambda baseUrl, model, prompt, timeoutSeconds=None: calls.append(prompt) or "r",
+        )
+        analyzer = _analyzer(tmp_path, enabled=False)
+
+        analyzer._callOllama("p")
+        analyzer._callOllama("p")
+
+        assert calls == ["p", "p"]
+        assert analyzer.getStatus()["responseCache"] is None
@@ -0,0 +1,171 @@
+################################################################################
+# File Name: test_migration_0013_drive_time_window.py
+# Purpose/Description: Migration unit tests for v0013 -- drive_time_window
+#                      CREATE + backfill, short-circuit when present, failure
+#                      propagation, and the post-condition probe.  FakeRunner
+#                      replaces SSH + MariaDB (mirrors the v0008 test).
+# Author: Rex
+# Creation Date: 2026-10-16
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-16    | Rex          | Initial
+# 2026-10-16    | Rex          | v0014 now follows in the registry
+# ================================================================================
+################################################################################
+
+"""Tests for the v0013 drive_time_window migration."""
+
+from __future__ import annotations
+
+import subprocess
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+
+import pytest
+
+from scripts import apply_server_migrations as asm
+from src.server.migrations import ALL_MIGRATIONS
+from src.server.migrations.runner import RunnerContext
+from src.server.migrations.versions import v0013_drive_time_window as m0013
+
+# ================================================================================
+# FakeRunner
+# ================================================================================
+
+
+@dataclass
+class FakeRunner:
+    """Scripted runner keyed by SQL substring; unmatched calls return OK."""
+
+    handlers: list[tuple[str, Callable[[str], subprocess.CompletedProcess[str]]]] = (
+        field(default_factory=list)
+    )
+    calls: list[dict] = field(default_factory=list)
+
+    def __call__(
+        self,
+        argv: Sequence[str],
+        *,
+        input: str | None = None,  # noqa: A002 -- subprocess API parity
+        timeout: float | None = None,
+    ) -> subprocess.CompletedProcess[str]:
+        sql = input or ''
+        self.calls.append({'argv': list(argv), 'input': sql, 'timeout': timeout})
+        for needle, handler in self.handlers:
+            if needle in sql:
+                return handler(sql)
+        return subprocess.CompletedProcess(
+            args=list(argv), returncode=0, stdout='', stderr='',
+        )
+
+    @property
+    def emittedSqls(self) -> list[str]:
+        return [c['input'] for c in self.calls if c['input']]
+
+
+def _ok(stdout: str = '') -> subprocess.CompletedProcess[str]:
+    return subprocess.CompletedProcess(args=[], returncode=0, stdout=stdout, stderr='')
+
+
+def _fail(stderr: str = 'boom') -> subprocess.CompletedProcess[str]:
+    return subprocess.CompletedProcess(args=[], returncode=1, stdout='', stderr=stderr)
+
+
+def _ctx(runner: FakeRunner) -> RunnerContext:
+    return RunnerContext(
+        addrs=asm.HostAddresses(serverHost='<server>', serverUser='obd'),
+        creds=asm.ServerCreds(dbUser='obd2', dbPassword='secret', dbName='obd2db'),
+        runner=runner,
+    )
+
+
+def _scriptTableProbes(runner: FakeRunner, *answers: str) -> None:
+    """Table probes answer ``answers`` in order, then repeat the last."""
+    queue = list(answers)
+
+    def probe(_sql: str) -> subprocess.CompletedProcess[str]:
+        return _ok(stdout=f'{queue.pop(0) if len(queue) > 1 else queue[0]}\n')
+
+    runner.handlers.append(('information_schema.TABLES', probe))
+
+
+# ================================================================================
+# Module shape
+# ================================================================================
+
+class TestModuleExports:
+    def test_versionIs0013(self) -> None:
+        assert m0013.VERSION == '0013'
+        assert m0013.MIGRATION.version == '0013'
+
+    def test_registeredAtTail(self) -> None:
+        versions = [m.version for m in ALL_MIGRATIONS]
+        assert versions == sorted(versions)
+        assert versions[versions.index('0013') + 1] == '0014'
+
+    def test_ddlContainsEveryOrmColumn(self) -> None:
+        from src.server.db.models import DriveTimeWindow
+
+        assert m0013.TABLE_NAME == DriveTimeWindow.__tablename__
+        for col in DriveTimeWindow.__table__.columns:
+            assert col.name in m0013.CREATE_DRIVE_TIME_WINDOW_DDL
+
+    def test_backfillGroupsPerDeviceAndDrive(self) -> None:
+        sql = m0013.BACKFILL_DRIVE_TIME_WINDOW_SQL
+        assert sql.startswith('INSERT IGNORE')
+        assert 'GROUP BY source_device, drive_id' in sql
+        assert 'drive_id IS NOT NULL' in sql
+
+
+# ================================================================================
+# apply()
+# ================================================================================
+
+class TestApply:
+    def test_missingTableCreatesThenBackfills(self) -> None:
+        runner = FakeRunner()
+        _scriptTableProbes(runner, '0', '1')
+
+        m0013.apply(_ctx(runner))
+
+        sqls = runner.emittedSqls
+        createIdx = next(i for i, s in enumerate(sqls) if 'CREATE TABLE' in s)
+        backfillIdx = next(i for i, s in enumerate(sqls) if 'INSERT IGNORE' in s)
+        assert createIdx < backfillIdx
+
+    def test_presentTableShortCircuits(self) -> None:
+        runner = FakeRunner()
+        _scriptTableProbes(runner, '1')
+
+        m0013.apply(_ctx(runner))
+
+        assert not any('CREATE TABLE' in s for s in runner.emittedSqls)
+        assert not any('INSERT IGNORE' in s for s in runner.emittedSqls)
+
+    def test_createFailureRaises(self) -> None:
+        runner = FakeRunner()
+        _scriptTableProbes(runner, '0')
+        runner.handlers.append(('CREATE TABLE', lambda _sql: _fail('denied')))
+
+        with pytest.raises(asm.MigrationError, match='denied'):
+            m0013.apply(_ctx(runner))
+
+    def test_silentNoOpCreateRaisesProbeError(self) -> None:
+        runner = FakeRunner()
+        _scriptTableProbes(runner, '0')
+
+        with pytest.raises(asm.SchemaProbeError):
+            m0013.apply(_ctx(runner))
+        assert not any('INSERT IGNORE' in s for s in runner.emittedSqls)
+
+    def test_backfillFailureRaises(self) -> None:
+        runner = FakeRunner()
+        _scriptTableProbes(runner, '0', '1')
+        runner.handlers.append(('INSERT IGNORE', lambda _sql: _fail('lock wait')))
+
+        with pytest.raises(asm.MigrationError, match='backfill'):
+            m0013.apply(_ctx(runner))
@@ -0,0 +1,170 @@
+################################################################################
+# File Name: test_migration_0014_parameter_history.py
+# Purpose/Description: Migration unit tests for v0014 -- parameter_history
+#                      CREATE + backfill, short-circuit when present, failure
+#                      propagation, and the post-condition probe.  FakeRunner
+#                      replaces SSH + MariaDB (mirrors the v0008 test).
+# Author: Rex
+# Creation Date: 2026-10-16
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-16    | Rex          | Initial
+# ================================================================================
+################################################################################
+
+"""Tests for the v0014 parameter_history migration."""
+
+from __future__ import annotations
+
+import subprocess
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+
+import pytest
+
+from scripts import apply_server_migrations as asm
+from src.server.migrations import ALL_MIGRATIONS
+from src.server.migrations.runner import RunnerContext
+from src.server.migrations.versions import v0014_parameter_history as m0014
+
+# ================================================================================
+# FakeRunner
+# ================================================================================
+
+
+@dataclass
+class FakeRunner:
+    """Scripted runner keyed by SQL substring; unmatched calls return OK."""
+
+    handlers: list[tuple[str, Callable[[str], subprocess.CompletedProcess[str]]]] = (
+        field(default_factory=list)
+    )
+    calls: list[dict] = field(default_factory=list)
+
+    def __call__(
+        self,
+        argv: Sequence[str],
+        *,
+        input: str | None = None,  # noqa: A002 -- subprocess API parity
+        timeout: float | None = None,
+    ) -> subprocess.CompletedProcess[str]:
+        sql = input or ''
+        self.calls.append({'argv': list(argv), 'input': sql, 'timeout': timeout})
+        for needle, handler in self.handlers:
+            if needle in sql:
+                return handler(sql)
+        return subprocess.CompletedProcess(
+            args=list(argv), returncode=0, stdout='', stderr='',
+        )
+
+    @property
+    def emittedSqls(self) -> list[str]:
+        return [c['input'] for c in self.calls if c['input']]
+
+
+def _ok(stdout: str = '') -> subprocess.CompletedProcess[str]:
+    return subprocess.CompletedProcess(args=[], returncode=0, stdout=stdout, stderr='')
+
+
+def _fail(stderr: str = 'boom') -> subprocess.CompletedProcess[str]:
+    return subprocess.CompletedProcess(args=[], returncode=1, stdout='', stderr=stderr)
+
+
+def _ctx(runner: FakeRunner) -> RunnerContext:
+    return RunnerContext(
+        addrs=asm.HostAddresses(serverHost='<server>', serverUser='obd'),
+        creds=asm.ServerCreds(dbUser='obd2', dbPassword='secret', dbName='obd2db'),
+        runner=runner,
+    )
+
+
+def _scriptTableProbes(runner: FakeRunner, *answers: str) -> None:
+    """Table probes answer ``answers`` in order, then repeat the last."""
+    queue = list(answers)
+
+    def probe(_sql: str) -> subprocess.CompletedProcess[str]:
+        return _ok(stdout=f'{queue.pop(0) if len(queue) > 1 else queue[0]}\n')
+
+    runner.handlers.append(('information_schema.TABLES', probe))
+
+
+# ================================================================================
+# Module shape
+# ================================================================================
+
+class TestModuleExports:
+    def test_versionIs0014(self) -> None:
+        assert m0014.VERSION == '0014'
+        assert m0014.MIGRATION.version == '0014'
+
+    def test_registeredAtTail(self) -> None:
+        versions = [m.version for m in ALL_MIGRATIONS]
+        assert versions == sorted(versions)
+        assert versions[versions.index('0014') + 1] == '0015'
+
+    def test_ddlContainsEveryOrmColumn(self) -> None:
+        from src.server.db.models import ParameterHistory
+
+        assert m0014.TABLE_NAME == ParameterHistory.__tablename__
+        for col in ParameterHistory.__table__.columns:
+            assert col.name in m0014.CREATE_PARAMETER_HISTORY_DDL
+
+    def test_backfillGroupsPerDeviceAndParameter(self) -> None:
+        sql = m0014.BACKFILL_PARAMETER_HISTORY_SQL
+        assert sql.startswith('INSERT IGNORE')
+        assert "GROUP BY COALESCE(ds.source_device, ds.device_id, '')" in sql
+        assert 'st.avg_value IS NOT NULL' in sql
+
+
+# ================================================================================
+# apply()
+# ================================================================================
+
+class TestApply:
+    def test_missingTableCreatesThenBackfills(self) -> None:
+        runner = FakeRunner()
+        _scriptTableProbes(runner, '0', '1')
+
+        m0014.apply(_ctx(runner))
+
+        sqls = runner.emittedSqls
+        createIdx = next(i for i, s in enumerate(sqls) if 'CREATE TABLE' in s)
+        backfillIdx = next(i for i, s in enumerate(sqls) if 'INSERT IGNORE' in s)
+        assert createIdx < backfillIdx
+
+    def test_presentTableShortCircuits(self) -> None:
+        runner = FakeRunner()
+        _scriptTableProbes(runner, '1')
+
+        m0014.apply(_ctx(runner))
+
+        assert not any('CREATE TABLE' in s for s in runner.emittedSqls)
+        assert not any('INSERT IGNORE' in s for s in runner.emittedSqls)
+
+    def test_createFailureRaises(self) -> None:
+        runner = FakeRunner()
+        _scriptTableProbes(runner, '0')
+        runner.handlers.append(('CREATE TABLE', lambda _sql: _fail('denied')))
+
+        with pytest.raises(asm.MigrationError, match='denied'):
+            m0014.apply(_ctx(runner))
+
+    def test_silentNoOpCreateRaisesProbeError(self) -> None:
+        runner = FakeRunner()
+        _scriptTableProbes(runner, '0')
+
+        with pytest.raises(asm.SchemaProbeError):
+            m0014.apply(_ctx(runner))
+        assert not any('INSERT IGNORE' in s for s in runner.emittedSqls)
+
+    def test_backfillFailureRaises(self) -> None:
+        runner = FakeRunner()
+        _scriptTableProbes(runner, '0', '1')
+        runner.handlers.append(('INSERT IGNORE', lambda _sql: _fail('lock wait')))
+
+        with pytest.raises(asm.MigrationError, match='backfill'):
+            m0014.apply(_ctx(runner))
@@ -0,0 +1,203 @@
+################################################################################
+# File Name: test_migration_0016_realtime_data_partitioning.py
+# Purpose/Description: Migration unit tests for v0016 -- realtime_data
+#                      monthly RANGE partitions: one ALTER re-keys and
+#                      partitions, layout from MIN(timestamp), short-circuit
+#                      when partitioned, failure propagation and the
+#                      post-condition probe.  FakeRunner replaces SSH +
+#                      MariaDB (mirrors the v0015 test).
+# Author: Rex
+# Creation Date: 2026-10-17
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-17    | Rex          | Initial
+# 2026-10-17    | Rex          | v0017 now follows in the registry
+# ================================================================================
+################################################################################
+
+"""Tests for the v0016 realtime_data partitioning migration."""
+
+from __future__ import annotations
+
+import subprocess
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from datetime import date
+
+import pytest
+
+from scripts import apply_server_migrations as asm
+from src.server.migrations import ALL_MIGRATIONS
+from src.server.migrations.runner import RunnerContext
+from src.server.migrations.versions import v0016_realtime_data_partitioning as m0016
+
+# ================================================================================
+# FakeRunner
+# ================================================================================
+
+
+@dataclass
+class FakeRunner:
+    """Scripted runner keyed by SQL substring; unmatched calls return OK."""
+
+    handlers: list[tuple[str, Callable[[str], subprocess.CompletedProcess[str]]]] = (
+        field(default_factory=list)
+    )
+    calls: list[dict] = field(default_factory=list)
+
+    def __call__(
+        self,
+        argv: Sequence[str],
+        *,
+        input: str | None = None,  # noqa: A002 -- subprocess API parity
+        timeout: float | None = None,
+    ) -> subprocess.CompletedProcess[str]:
+        sql = input or ''
+        self.calls.append({'argv': list(argv), 'input': sql, 'timeout': timeout})
+        for needle, handler in self.handlers:
+            if needle in sql:
+                return handler(sql)
+        return subprocess.CompletedProcess(
+            args=list(argv), returncode=0, stdout='', stderr='',
+        )
+
+    @property
+    def emittedSqls(self) -> list[str]:
+        return [c['input'] for c in self.calls if c['input']]
+
+
+def _ok(stdout: str = '') -> subprocess.CompletedProcess[str]:
+    return subprocess.CompletedProcess(args=[], returncode=0, stdout=stdout, stderr='')
+
+
+def _fail(stderr: str = 'boom') -> subprocess.CompletedProcess[str]:
+    return subprocess.CompletedProcess(args=[], returncode=1, stdout='', stderr=stderr)
+
+
+def _ctx(runner: FakeRunner) -> RunnerContext:
+    return RunnerContext(
+        addrs=asm.HostAddresses(serverHost='<server>', serverUser='obd'),
+        creds=asm.ServerCreds(dbUser='obd2', dbPassword='secret', dbName='obd2db'),
+        runner=runner,
+    )
+
+
+TODAY = date(2026, 10, 17)
+
+
+def _scriptLive(runner: FakeRunner, *, partitioned: bool = False,
+                minTimestamp: str = '2026-05-03 08:00:00',
+                uniqueKeys: tuple[str, ...] = ('source_device',),
+                alterPartitions: bool = True) -> None:
+    """Answer the partition / unique-key / MIN(timestamp) probes."""
+    state = {'partitioned': partitioned}
+
+    def alter(_sql: str) -> subprocess.CompletedProcess[str]:
+        state['partitioned'] = alterPartitions
+        return _ok()
+
+    runner.handlers += [
+        ('information_schema.PARTITIONS',
+         lambda _sql: _ok(stdout=f"{8 if state['partitioned'] else 0}\n")),
+        ('information_schema.STATISTICS',
+         lambda _sql: _ok(stdout=''.join(f'{k}\n' for k in uniqueKeys))),
+        ('MIN(timestamp)', lambda _sql: _ok(stdout=f'{minTimestamp}\n')),
+        ('ALTER TABLE', alter),
+    ]
+
+
+def _alters(runner: FakeRunner) -> list[str]:
+    return [s for s in runner.emittedSqls if 'ALTER TABLE' in s]
+
+
+# ================================================================================
+# Module shape
+# ================================================================================
+
+class TestModuleExports:
+    def test_versionIs0016(self) -> None:
+        assert m0016.VERSION == '0016'
+        assert m0016.MIGRATION.version == '0016'
+
+    def test_registeredAtTail(self) -> None:
+        versions = [m.version for m in ALL_MIGRATIONS]
+        assert versions == sorted(versions)
+        assert versions[versions.index('0016') + 1] == '0017'
+
+    def test_ddlRekeysAndPartitionsInOneAlter(self) -> None:
+        ddl = m0016.buildPartitionDdl(
+            ['source_device'], date(2026, 5, 1), date(2026, 6, 1),
+        )
+
+        assert ddl.count('ALTER TABLE') == 1
+        assert 'DROP PRIMARY KEY, ADD PRIMARY KEY (id, timestamp)' in ddl
+        assert 'DROP INDEX `source_device`' in ddl
+        assert ('ADD UNIQUE KEY uq_realtime_data_source_ts '
+                '(source_device, source_id, timestamp)') in ddl
+        assert ' PARTITION BY RANGE (TO_DAYS(timestamp)) (' in ddl
+        assert ddl.endswith('PARTITION p_future VALUES LESS THAN MAXVALUE);')
+
+
+# ================================================================================
+# apply()
+# ================================================================================
+
+class TestApply:
+    def test_layoutSpansOldestMonthThroughHorizon(self) -> None:
+        runner = FakeRunner()
+        _scriptLive(runner)
+
+        m0016.apply(_ctx(runner), today=TODAY)
+
+        (alter,) = _alters(runner)
+        assert 'PARTITION p2026_05 ' in alter
+        assert 'PARTITION p2027_01 ' in alter  # October + 3 months
+        assert 'PARTITION p2027_02 ' not in alter
+        assert 'PARTITION p2026_04 ' not in alter
+
+    def test_clockResetRowsClampToEarliestMonth(self) -> None:
+        runner = FakeRunner()
+        _scriptLive(runner, minTimestamp='1970-01-01 00:00:05')
+
+        m0016.apply(_ctx(runner), today=TODAY)
+
+        (alter,) = _alters(runner)
+        assert 'PARTITION p2026_01 ' in alter
+        assert 'p1970' not in alter and 'p2025' not in alter
+
+    def test_emptyTablePartitionsFromEarliestMonth(self) -> None:
+        runner = FakeRunner()
+        _scriptLive(runner, minTimestamp='NULL', uniqueKeys=())
+
+        m0016.apply(_ctx(runner), today=TODAY)
+
+        (alter,) = _alters(runner)
+        assert 'PARTITION p2026_01 ' in alter
+        assert 'DROP INDEX' not in alter
+
+    def test_partitionedTableShortCircuits(self) -> None:
+        runner = FakeRunner()
+        _scriptLive(runner, partitioned=True)
+
+        m0016.apply(_ctx(runner), today=TODAY)
+
+        assert _alters(runner) == []
+
+    def test_alterFailureRaises(self) -> None:
+        runner = FakeRunner()
+        runner.handlers.append(('ALTER TABLE', lambda _sql: _fail('lock wait')))
+        _scriptLive(runner)
+
+        with pytest.raises(asm.MigrationError, match='lock wait'):
+            m0016.apply(_ctx(runner), today=TODAY)
+
+    def test_silentNoOpAlterRaisesProbeError(self) -> None:
+        runner = FakeRunner()
+        _scriptLive(runner, alterPartitions=False)
+
+        with pytest.raises(asm.SchemaProbeError, match='unpartitioned'):
+            m0016.apply(_ctx(runner), today=TODAY)
@@ -0,0 +1,177 @@
+################################################################################
+# File Name: test_migration_0017_realtime_rollup.py
+# Purpose/Description: Migration unit tests for v0017 -- realtime_rollup
+#                      CREATE + per-resolution backfill, short-circuit when
+#                      present, failure propagation, and the post-condition
+#                      probe.  FakeRunner replaces SSH + MariaDB (mirrors the
+#                      v0013 test).
+# Author: Rex
+# Creation Date: 2026-10-17
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-17    | Rex          | Initial
+# 2026-10-17    | Rex          | v0018 now follows in the registry
+# 2026-10-17    | Rex          | Two backfills (10s / 1min tiers)
+# ================================================================================
+################################################################################
+
+"""Tests for the v0017 realtime_rollup migration."""
+
+from __future__ import annotations
+
+import subprocess
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+
+import pytest
+
+from scripts import apply_server_migrations as asm
+from src.server.migrations import ALL_MIGRATIONS
+from src.server.migrations.runner import RunnerContext
+from src.server.migrations.versions import v0017_realtime_rollup as m0017
+
+# ================================================================================
+# FakeRunner
+# ================================================================================
+
+
+@dataclass
+class FakeRunner:
+    """Scripted runner keyed by SQL substring; unmatched calls return OK."""
+
+    handlers: list[tuple[str, Callable[[str], subprocess.CompletedProcess[str]]]] = (
+        field(default_factory=list)
+    )
+    calls: list[dict] = field(default_factory=list)
+
+    def __call__(
+        self,
+        argv: Sequence[str],
+        *,
+        input: str | None = None,  # noqa: A002 -- subprocess API parity
+        timeout: float | None = None,
+    ) -> subprocess.CompletedProcess[str]:
+        sql = input or ''
+        self.calls.append({'argv': list(argv), 'input': sql, 'timeout': timeout})
+        for needle, handler in self.handlers:
+            if needle in sql:
+                return handler(sql)
+        return subprocess.CompletedProcess(
+            args=list(argv), returncode=0, stdout='', stderr='',
+        )
+
+    @property
+    def emittedSqls(self) -> list[str]:
+        return [c['input'] for c in self.calls if c['input']]
+
+
+def _ok(stdout: str = '') -> subprocess.CompletedProcess[str]:
+    return subprocess.CompletedProcess(args=[], returncode=0, stdout=stdout, stderr='')
+
+
+def _fail(stderr: str = 'boom') -> subprocess.CompletedProcess[str]:
+    return subprocess.CompletedProcess(args=[], returncode=1, stdout='', stderr=stderr)
+
+
+def _ctx(runner: FakeRunner) -> RunnerContext:
+    return RunnerContext(
+        addrs=asm.HostAddresses(serverHost='<server>', serverUser='obd'),
+        creds=asm.ServerCreds(dbUser='obd2', dbPassword='secret', dbName='obd2db'),
+        runner=runner,
+    )
+
+
+def _scriptTableProbes(runner: FakeRunner, *answers: str) -> None:
+    """Table probes answer ``answers`` in order, then repeat the last."""
+    queue = list(answers)
+
+    def probe(_sql: str) -> subprocess.CompletedProcess[str]:
+        return _ok(stdout=f'{queue.pop(0) if len(queue) > 1 else queue[0]}\n')
+
+    runner.handlers.append(('information_schema.TABLES', probe))
+
+
+# ================================================================================
+# Module shape
+# ================================================================================
+
+class TestModuleExports:
+    def test_versionIs0017(self) -> None:
+        assert m0017.VERSION == '0017'
+        assert m0017.MIGRATION.version == '0017'
+
+    def test_registeredAtTail(self) -> None:
+        versions = [m.version for m in ALL_MIGRATIONS]
+        assert versions == sorted(versions)
+        assert versions[versions.index('0017') + 1] == '0018'
+
+    def test_ddlContainsEveryOrmColumnAndIndex(self) -> None:
+        from src.server.db.models import RealtimeRollup
+
+        assert m0017.TABLE_NAME == RealtimeRollup.__tablename__
+        for col in RealtimeRollup.__table__.columns:
+            assert col.name in m0017.CREATE_REALTIME_ROLLUP_DDL
+        for index in RealtimeRollup.__table__.indexes:
+            assert index.name in m0017.CREATE_REALTIME_ROLLUP_DDL
+
+    def test_backfillAlignsBucketsAndSkipsSimulatedRows(self) -> None:
+        sql = m0017.buildBackfillSql(10)
+        assert sql.startswith('INSERT IGNORE')
+        assert 'SECOND(timestamp) MOD 10' in sql
+        assert "data_source = 'real' OR data_source IS NULL" in sql
+        assert 'GROUP BY source_device, parameter_name' in sql
+
+
+# ================================================================================
+# apply()
+# ================================================================================
+
+class TestApply:
+    def test_missingTableCreatesThenBackfillsEveryResolution(self) -> None:
+        runner = FakeRunner()
+        _scriptTableProbes(runner, '0', '1')
+
+        m0017.apply(_ctx(runner))
+
+        sqls = runner.emittedSqls
+        createIdx = next(i for i, s in enumerate(sqls) if 'CREATE TABLE' in s)
+        backfills = [i for i, s in enumerate(sqls) if 'INSERT IGNORE' in s]
+        assert len(backfills) == 2
+        assert createIdx < backfills[0]
+
+    def test_presentTableShortCircuits(self) -> None:
+        runner = FakeRunner()
+        _scriptTableProbes(runner, '1')
+
+        m0017.apply(_ctx(runner))
+
+        assert not any('CREATE TABLE' in s for s in runner.emittedSqls)
+        assert not any('INSERT IGNORE' in s for s in runner.emittedSqls)
+
+    def test_createFailureRaises(self) -> None:
+        runner = FakeRunner()
+        _scriptTableProbes(runner, '0')
+        runner.handlers.append(('CREATE TABLE', lambda _sql: _fail('denied')))
+
+        with pytest.raises(asm.MigrationError, match='denied'):
+            m0017.apply(_ctx(runner))
+
+    def test_silentNoOpCreateRaisesProbeError(self) -> None:
+        runner = FakeRunner()
+        _scriptTableProbes(runner, '0')
+
+        with pytest.raises(asm.SchemaProbeError):
+            m0017.apply(_ctx(runner))
+        assert not any('INSERT IGNORE' in s for s in runner.emittedSqls)
+
+    def test_backfillFailureRaises(self) -> None:
+        runner = FakeRunner()
+        _scriptTableProbes(runner, '0', '1')
+        runner.handlers.append(('MOD 10)', lambda _sql: _fail('lock wait')))
+
+        with pytest.raises(asm.MigrationError, match=r'backfill realtime_rollup \(10s\)'):
+            m0017.apply(_ctx(runner))
@@ -0,0 +1,175 @@
+################################################################################
+# File Name: test_migration_0018_drive_time_window_indexes.py
+# Purpose/Description: Migration unit tests for v0018 -- drive_time_window
+#                      range indexes: only missing indexes are added, in one
+#                      online ALTER; failure propagation and the
+#                      post-condition probe.  FakeRunner replaces SSH +
+#                      MariaDB (mirrors the v0015 test).
+# Author: Rex
+# Creation Date: 2026-10-17
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-17    | Rex          | Initial
+# ================================================================================
+################################################################################
+
+"""Tests for the v0018 drive_time_window index migration."""
+
+from __future__ import annotations
+
+import subprocess
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+
+import pytest
+
+from scripts import apply_server_migrations as asm
+from src.server.migrations import ALL_MIGRATIONS
+from src.server.migrations.runner import RunnerContext
+from src.server.migrations.versions import v0018_drive_time_window_indexes as m0018
+
+# ================================================================================
+# FakeRunner
+# ================================================================================
+
+
+@dataclass
+class FakeRunner:
+    """Scripted runner keyed by SQL substring; unmatched calls return OK."""
+
+    handlers: list[tuple[str, Callable[[str], subprocess.CompletedProcess[str]]]] = (
+        field(default_factory=list)
+    )
+    calls: list[dict] = field(default_factory=list)
+
+    def __call__(
+        self,
+        argv: Sequence[str],
+        *,
+        input: str | None = None,  # noqa: A002 -- subprocess API parity
+        timeout: float | None = None,
+    ) -> subprocess.CompletedProcess[str]:
+        sql = input or ''
+        self.calls.append({'argv': list(argv), 'input': sql, 'timeout': timeout})
+        for needle, handler in self.handlers:
+            if needle in sql:
+                return handler(sql)
+        return subprocess.CompletedProcess(
+            args=list(argv), returncode=0, stdout='', stderr='',
+        )
+
+    @property
+    def emittedSqls(self) -> list[str]:
+        return [c['input'] for c in self.calls if c['input']]
+
+
+def _ok(stdout: str = '') -> subprocess.CompletedProcess[str]:
+    return subprocess.CompletedProcess(args=[], returncode=0, stdout=stdout, stderr='')
+
+
+def _fail(stderr: str = 'boom') -> subprocess.CompletedProcess[str]:
+    return subprocess.CompletedProcess(args=[], returncode=1, stdout='', stderr=stderr)
+
+
+def _ctx(runner: FakeRunner) -> RunnerContext:
+    return RunnerContext(
+        addrs=asm.HostAddresses(serverHost='<server>', serverUser='obd'),
+        creds=asm.ServerCreds(dbUser='obd2', dbPassword='secret', dbName='obd2db'),
+        runner=runner,
+    )
+
+
+def _scriptIndexProbes(runner: FakeRunner, present: set[str], *,
+                       created: set[str] | None = None) -> None:
+    """Index probes answer from ``present``; a successful ALTER adds ``created``."""
+    state = set(present)
+
+    def probe(sql: str) -> subprocess.CompletedProcess[str]:
+        name = sql.split("INDEX_NAME='")[1].split("'")[0]
+        return _ok(stdout=f'{int(name in state)}\n')
+
+    def alter(_sql: str) -> subprocess.CompletedProcess[str]:
+        state.update(m0018.INDEXES if created is None else created)
+        return _ok()
+
+    runner.handlers.append(('information_schema.STATISTICS', probe))
+    runner.handlers.append(('ALTER TABLE', alter))
+
+
+def _alters(runner: FakeRunner) -> list[str]:
+    return [s for s in runner.emittedSqls if 'ALTER TABLE' in s]
+
+
+# ================================================================================
+# Module shape
+# ================================================================================
+
+class TestModuleExports:
+    def test_versionIs0018(self) -> None:
+        assert m0018.VERSION == '0018'
+        assert m0018.MIGRATION.version == '0018'
+
+    def test_registeredAtTail(self) -> None:
+        versions = [m.version for m in ALL_MIGRATIONS]
+        assert versions == sorted(versions)
+        assert versions[-1] == '0018'
+
+    def test_indexesMirrorOrmModel(self) -> None:
+        from src.server.db.models import DriveTimeWindow
+
+        ormIndexes = {
+            index.name: tuple(col.name for col in index.columns)
+            for index in DriveTimeWindow.__table__.indexes
+        }
+        assert m0018.TABLE_NAME == DriveTimeWindow.__tablename__
+        assert ormIndexes == m0018.INDEXES
+
+    def test_ddlIsOneOnlineAlter(self) -> None:
+        ddl = m0018.buildAddIndexesDdl(list(m0018.INDEXES))
+
+        assert ddl.count('ALTER TABLE') == 1
+        assert 'ADD INDEX idx_drive_time_window_span (max_ts, min_ts)' in ddl
+        assert ddl.endswith('ALGORITHM=INPLACE, LOCK=NONE;')
+
+
+# ================================================================================
+# apply()
+# ================================================================================
+
+class TestApply:
+    def test_onlyMissingIndexesAdded(self) -> None:
+        runner = FakeRunner()
+        _scriptIndexProbes(runner, {'idx_drive_time_window_drive'})
+
+        m0018.apply(_ctx(runner))
+
+        (alter,) = _alters(runner)
+        assert 'idx_drive_time_window_span' in alter
+        assert 'idx_drive_time_window_drive' not in alter
+
+    def test_allPresentShortCircuits(self) -> None:
+        runner = FakeRunner()
+        _scriptIndexProbes(runner, set(m0018.INDEXES))
+
+        m0018.apply(_ctx(runner))
+
+        assert _alters(runner) == []
+
+    def test_alterFailureRaises(self) -> None:
+        runner = FakeRunner()
+        runner.handlers.append(('ALTER TABLE', lambda _sql: _fail('lock wait')))
+        _scriptIndexProbes(runner, set())
+
+        with pytest.raises(asm.MigrationError, match='lock wait'):
+            m0018.apply(_ctx(runner))
+
+    def test_silentNoOpAlterRaisesProbeError(self) -> None:
+        runner = FakeRunner()
+        _scriptIndexProbes(runner, set(), created={'idx_drive_time_window_drive'})
+
+        with pytest.raises(asm.SchemaProbeError, match='idx_drive_time_window_span'):
+            m0018.apply(_ctx(runner))
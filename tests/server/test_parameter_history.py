@@ -0,0 +1,251 @@
+################################################################################
+# File Name: test_parameter_history.py
+# Purpose/Description: Tests for the parameter_history running aggregate --
+#                      maintenance on every drive_statistics write path,
+#                      leave-one-out parity with the raw per-parameter scan,
+#                      and rebuild parity.
+# Author: Rex
+# Creation Date: 2026-10-16
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-16    | Rex          | Initial
+# ================================================================================
+################################################################################
+
+"""Tests for :mod:`src.server.db.parameter_history`.
+
+Real temp-file SQLite + real ORM; no mocks.
+"""
+
+from __future__ import annotations
+
+import random
+import statistics
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from sqlalchemy import create_engine, delete, select  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from src.server.analytics.basic import compareDriveToHistory  # noqa: E402
+from src.server.analytics.drive_analytics_batch import (  # noqa: E402
+    computeDriveAnalyticsBatch,
+)
+from src.server.analytics.drive_statistics_compute import (  # noqa: E402
+    compute_drive_statistics,
+)
+from src.server.db.models import (  # noqa: E402
+    Base,
+    DriveStatistic,
+    DriveSummary,
+    ParameterHistory,
+    RealtimeData,
+)
+from src.server.db.parameter_history import (  # noqa: E402
+    loadHistoricalAvgStats,
+    rebuildParameterHistory,
+)
+
+DEVICE = "chi-eclipse-01"
+BASE = datetime(2026, 10, 1, 8, 0, 0)
+
+
+@pytest.fixture
+def engine():
+    """Temp-file SQLite engine carrying the full server schema."""
+    tmp = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+    tmp.close()
+    eng = create_engine(f"sqlite:///{tmp.name}")
+    Base.metadata.create_all(eng)
+    yield eng
+    eng.dispose()
+    Path(tmp.name).unlink(missing_ok=True)
+
+
+def _history(session: Session) -> dict[tuple[str, str], tuple[int, float, float]]:
+    return {
+        (row.source_device, row.parameter_name): (
+            row.drive_count, row.avg_sum, row.avg_sum_sq,
+        )
+        for row in session.execute(select(ParameterHistory)).scalars()
+    }
+
+
+def _seedStats(session: Session, avgsByDrive: dict[int, dict[str, float | None]],
+               device: str = DEVICE) -> None:
+    for driveId, avgs in avgsByDrive.items():
+        session.add(DriveSummary(id=driveId, device_id=device,
+                                 start_time=BASE + timedelta(hours=driveId)))
+        for name, avg in avgs.items():
+            session.add(DriveStatistic(summary_id=driveId, parameter_name=name,
+                                       avg_value=avg, sample_count=1))
+    session.commit()
+
+
+def _rawHistory(session: Session, driveId: int, name: str) -> list[float]:
+    return [
+        row.avg_value
+        for row in session.execute(
+            select(DriveStatistic)
+            .where(DriveStatistic.parameter_name == name)
+            .where(DriveStatistic.summary_id != driveId)
+        ).scalars()
+        if row.avg_value is not None
+    ]
+
+
+# ================================================================================
+# Maintenance
+# ================================================================================
+
+
+class TestOrmMaintenance:
+    def test_addAccumulatesPerDeviceAndParameter(self, engine) -> None:
+        with Session(engine) as session:
+            _seedStats(session, {1: {"RPM": 800.0, "SPEED": None}, 2: {"RPM": 900.0}})
+            assert _history(session) == {
+                (DEVICE, "RPM"): (2, 1700.0, 800.0**2 + 900.0**2),
+            }
+
+    def test_updateMovesTheRowsContribution(self, engine) -> None:
+        with Session(engine) as session:
+            _seedStats(session, {1: {"RPM": 800.0}, 2: {"RPM": 900.0}})
+            row = session.execute(
+                select(DriveStatistic).where(DriveStatistic.summary_id == 2)
+            ).scalar_one()
+            row.avg_value = 1000.0
+            session.commit()
+            assert _history(session)[(DEVICE, "RPM")] == (
+                2, 1800.0, 800.0**2 + 1000.0**2,
+            )
+
+            row.avg_value = None
+            session.commit()
+            assert _history(session)[(DEVICE, "RPM")] == (1, 800.0, 800.0**2)
+
+    def test_deleteRetractsAndEmptiesToExactZero(self, engine) -> None:
+        with Session(engine) as session:
+            _seedStats(session, {1: {"RPM": 0.1}, 2: {"RPM": 0.2}})
+            for model in (DriveStatistic, DriveSummary):
+                for row in session.execute(select(model)).scalars().all():
+                    session.delete(row)
+            session.commit()
+            assert _history(session) == {(DEVICE, "RPM"): (0, 0.0, 0.0)}
+
+
+class TestBulkPathMaintenance:
+    def _seedRaw(self, session: Session, driveId: int, offset: int, rpms) -> None:
+        start = BASE + timedelta(hours=offset)
+        session.add(DriveSummary(source_device=DEVICE, source_id=driveId,
+                                 drive_id=driveId, start_time=start))
+        for i, rpm in enumerate(rpms):
+            session.add(RealtimeData(
+                source_id=driveId * 1000 + i, source_device=DEVICE,
+                drive_id=driveId, timestamp=start + timedelta(seconds=i),
+                parameter_name="RPM", value=float(rpm),
+            ))
+        session.commit()
+
+    def test_recomputeReplacesRatherThanDoubleCounts(self, engine) -> None:
+        with Session(engine) as session:
+            self._seedRaw(session, 1, 0, [800, 900, 1000])
+            self._seedRaw(session, 2, 2, [1500, 1500])
+
+            for _ in range(2):
+                compute_drive_statistics(session, 1)
+                computeDriveAnalyticsBatch(session, [1, 2])
+                session.commit()
+
+            assert _history(session) == {
+                (DEVICE, "RPM"): (2, 2400.0, 900.0**2 + 1500.0**2),
+            }
+
+    def test_rebuildMatchesIncrementalState(self, engine) -> None:
+        rng = random.Random(14)
+        with Session(engine) as session:
+            _seedStats(session, {
+                d: {"RPM": rng.uniform(700, 3000), "MAF": rng.uniform(2, 40)}
+                for d in range(1, 30)
+            })
+            session.execute(delete(DriveStatistic).where(DriveStatistic.summary_id == 5))
+            incremental = _history(session)
+
+            rebuildParameterHistory(session)
+            session.commit()
+            rebuilt = _history(session)
+
+        assert rebuilt.keys() == incremental.keys()
+        for key, (count, total, totalSq) in rebuilt.items():
+            assert incremental[key][0] == count + 1  # bulk DELETE bypassed it
+        assert rebuilt[(DEVICE, "RPM")][0] == 28
+
+
+# ================================================================================
+# Read side
+# ================================================================================
+
+
+class TestLeaveOneOut:
+    def test_matchesRawScanAcrossDevices(self, engine) -> None:
+        rng = random.Random(7)
+        with Session(engine) as session:
+            _seedStats(session, {d: {"RPM": rng.gauss(900, 40)} for d in range(1, 12)})
+            _seedStats(session, {d: {"RPM": rng.gauss(950, 60)} for d in range(12, 20)},
+                       device="chi-eclipse-02")
+            current = session.execute(
+                select(DriveStatistic).where(DriveStatistic.summary_id == 3)
+            ).scalars().all()
+
+            history = loadHistoricalAvgStats(session, current)["RPM"]
+            raw = _rawHistory(session, 3, "RPM")
+
+        assert history.sample_count == len(raw) == 18
+        assert history.mean == pytest.approx(statistics.fmean(raw), rel=1e-12)
+        assert history.std_dev == pytest.approx(statistics.stdev(raw), rel=1e-9)
+
+    def test_parameterOnlyOnCurrentDriveHasNoHistory(self, engine) -> None:
+        with Session(engine) as session:
+            _seedStats(session, {1: {"RPM": 800.0, "BOOST": 5.0}, 2: {"RPM": 900.0}})
+            current = session.execute(
+                select(DriveStatistic).where(DriveStatistic.summary_id == 1)
+            ).scalars().all()
+            history = loadHistoricalAvgStats(session, current)
+
+        assert set(history) == {"RPM"}
+        assert history["RPM"].std_dev == 0.0
+
+    def test_constantHistoryReportsZeroStd(self, engine) -> None:
+        with Session(engine) as session:
+            _seedStats(session, {d: {"COOLANT_TEMP": 90.1} for d in range(1, 8)})
+            current = session.execute(
+                select(DriveStatistic).where(DriveStatistic.summary_id == 1)
+            ).scalars().all()
+            history = loadHistoricalAvgStats(session, current)["COOLANT_TEMP"]
+
+        assert history.sample_count == 6
+        assert history.std_dev == 0.0
+
+    def test_compareDriveToHistoryUsesOneHistoryQuery(self, engine) -> None:
+        from sqlalchemy import event
+
+        with Session(engine) as session:
+            _seedStats(session, {
+                d: {f"P{i}": float(d * i) for i in range(12)} for d in range(1, 6)
+            })
+            statements: list[str] = []
+            event.listen(engine, "before_cursor_execute",
+                         lambda *args: statements.append(args[2]))
+            comparisons = compareDriveToHistory(session, 5)
+
+        assert len(comparisons) == 12
+        assert sum("drive_statistics" in s for s in statements) == 1
+        assert sum("parameter_history" in s for s in statements) == 1
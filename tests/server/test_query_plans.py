@@ -0,0 +1,331 @@
+################################################################################
+# File Name: test_query_plans.py
+# Purpose/Description: Query-plan regression suite for the hot realtime_data
+#                      analytics queries.  Runs each analytics entry point
+#                      against the create_all() schema, captures every SQL
+#                      statement it sends that reads realtime_data, and fails
+#                      when EXPLAIN QUERY PLAN shows a full table scan.
+# Author: Rex
+# Creation Date: 2026-10-17
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-17    | Rex          | Initial
+# 2026-10-17    | Rex          | realtime_rollup recompute / rebuild reads
+# 2026-10-17    | Rex          | Indexed overlap check's unindexed-drive probe
+# ================================================================================
+################################################################################
+
+"""Query-plan regression tests for ``realtime_data`` reads.
+
+Every test drives a real analytics entry point (not a hand-copied query), so
+a code change that drops a filter, or a model change that drops an index,
+shows up here.  Plans come from SQLite's ``EXPLAIN QUERY PLAN`` over the
+ORM schema -- the same index set migration v0015 puts on MariaDB.  No
+``ANALYZE`` is run: without statistics the planner assumes large tables,
+which is the production shape; the seed data only has to be non-empty so
+every code branch executes.
+
+A plan step ``SCAN realtime_data`` -- plain, or ``USING INDEX`` (every
+entry of a non-covering index plus a row lookup each) -- is a full table
+scan and fails the test.  ``SCAN realtime_data USING COVERING INDEX``, an
+index-only pass used by the all-drives GROUP BYs, is allowed.
+"""
+
+from __future__ import annotations
+
+import re
+import tempfile
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from sqlalchemy import create_engine, event  # noqa: E402
+from sqlalchemy.engine import Engine  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from src.server.analytics.basic import (  # noqa: E402
+    collectReadingsForDrive,
+    computeDriveStatistics,
+)
+from src.server.analytics.drive_analytics_batch import (  # noqa: E402
+    computeDriveAnalyticsBatch,
+)
+from src.server.analytics.drive_statistics_compute import (  # noqa: E402
+    compute_drive_statistics,
+)
+from src.server.analytics.drive_summary_compute import (  # noqa: E402
+    compute_drive_summary,
+)
+from src.server.analytics.drive_time_window import (  # noqa: E402
+    rebuildDriveTimeWindows,
+    recomputeDriveWindows,
+)
+from src.server.analytics.overlap import detect_overlapping_drives  # noqa: E402
+from src.server.analytics.realtime_rollup import (  # noqa: E402
+    rebuildRealtimeRollups,
+    recomputeRollupRange,
+)
+from src.server.db.models import Base, DriveSummary, RealtimeData  # noqa: E402
+from src.server.services.analysis import _computeDriveAnalytics  # noqa: E402
+
+DEVICE = "chi-eclipse-01"
+BASE = datetime(2026, 10, 1, 8, 0, 0)
+PARAMETERS = ("RPM", "SPEED", "COOLANT_TEMP")
+
+# Plan detail of a full pass over the table's rows: a plain scan, or a
+# non-covering index scan (a row lookup per entry).
+_TABLE_SCAN = re.compile(r"^SCAN realtime_data(?! USING COVERING INDEX)")
+
+
+# ================================================================================
+# Plan capture
+# ================================================================================
+
+
+@dataclass
+class CapturedPlan:
+    """One realtime_data statement and its EXPLAIN QUERY PLAN details."""
+
+    statement: str
+    details: list[str] = field(default_factory=list)
+
+    @property
+    def tableScans(self) -> list[str]:
+        return [d for d in self.details if _TABLE_SCAN.match(d)]
+
+    def render(self) -> str:
+        return self.statement + "\n" + "\n".join(f"  {d}" for d in self.details)
+
+
+@dataclass
+class PlanRecorder:
+    """Collects realtime_data reads sent on an engine, then explains them."""
+
+    engine: Engine
+    pending: list[tuple[str, tuple]] = field(default_factory=list)
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        if executemany or "FROM realtime_data" not in statement:
+            return
+        if statement.lstrip().upper().startswith("EXPLAIN"):
+            return
+        self.pending.append((statement, tuple(parameters or ())))
+
+    def plans(self) -> list[CapturedPlan]:
+        captured = []
+        with self.engine.connect() as conn:
+            for statement, parameters in self.pending:
+                rows = conn.exec_driver_sql(
+                    f"EXPLAIN QUERY PLAN {statement}", parameters,
+                ).all()
+                captured.append(CapturedPlan(statement, [row[3] for row in rows]))
+        return captured
+
+
+@pytest.fixture
+def engine() -> Iterator[Engine]:
+    """Temp-file SQLite engine with the full server schema and seed rows."""
+    tmp = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+    tmp.close()
+    eng = create_engine(f"sqlite:///{tmp.name}")
+    Base.metadata.create_all(eng)
+    with Session(eng) as session:
+        _seed(session)
+    yield eng
+    eng.dispose()
+    Path(tmp.name).unlink(missing_ok=True)
+
+
+def _seed(session: Session) -> None:
+    """Three drives on one device, the middle one overlapping the first."""
+    sourceId = 0
+    for driveId, offsetMinutes in ((1, 0), (2, 10), (3, 120)):
+        start = BASE + timedelta(minutes=offsetMinutes)
+        session.add(DriveSummary(
+            source_device=DEVICE, source_id=driveId, drive_id=driveId,
+            device_id=DEVICE, start_time=start,
+            end_time=start + timedelta(minutes=20),
+        ))
+        for second in range(0, 1200, 60):
+            for i, name in enumerate(PARAMETERS):
+                sourceId += 1
+                session.add(RealtimeData(
+                    source_id=sourceId, source_device=DEVICE, drive_id=driveId,
+                    timestamp=start + timedelta(seconds=second),
+                    parameter_name=name, value=float(100 * (i + 1) + second % 7),
+                    data_source="real",
+                ))
+    session.commit()
+
+
+def _explain(engine: Engine, run: Callable[[Session], object]) -> list[CapturedPlan]:
+    recorder = PlanRecorder(engine)
+    event.listen(engine, "before_cursor_execute", recorder)
+    try:
+        with Session(engine) as session:
+            run(session)
+            session.rollback()
+    finally:
+        event.remove(engine, "before_cursor_execute", recorder)
+    return recorder.plans()
+
+
+def _assertNoTableScan(plans: list[CapturedPlan]) -> None:
+    assert plans, "entry point issued no realtime_data reads; test is stale"
+    scans = [p.render() for p in plans if p.tableScans]
+    assert not scans, "full realtime_data scan:\n\n" + "\n\n".join(scans)
+
+
+def _usedIndexes(plans: list[CapturedPlan]) -> set[str]:
+    return {
+        match.group(1)
+        for plan in plans
+        for detail in plan.details
+        if (match := re.search(r"INDEX (\w+)", detail))
+    }
+
+
+# ================================================================================
+# Per-drive analytics
+# ================================================================================
+
+
+class TestPerDriveQueries:
+    def test_computeDriveSummary_incTimestampGapWalk(self, engine) -> None:
+        plans = _explain(engine, lambda s: compute_drive_summary(s, 1))
+
+        _assertNoTableScan(plans)
+        gapWalk = [p for p in plans if "ORDER BY realtime_data.timestamp" in p.statement]
+        assert gapWalk
+        assert not any("TEMP B-TREE" in d for p in gapWalk for d in p.details)
+
+    @pytest.mark.parametrize("sqlAggregates", [True, False])
+    def test_computeDriveStatistics(self, engine, sqlAggregates) -> None:
+        plans = _explain(
+            engine,
+            lambda s: compute_drive_statistics(s, 1, sqlAggregates=sqlAggregates),
+        )
+
+        _assertNoTableScan(plans)
+        assert "idx_realtime_data_drive_param" in _usedIndexes(plans)
+
+    def test_batchEngineStream(self, engine) -> None:
+        plans = _explain(engine, lambda s: computeDriveAnalyticsBatch(s, [1, 2, 3]))
+
+        _assertNoTableScan(plans)
+
+    def test_collectReadingsForDrive(self, engine) -> None:
+        plans = _explain(
+            engine, lambda s: collectReadingsForDrive(s, driveId=2, deviceId=DEVICE),
+        )
+
+        _assertNoTableScan(plans)
+
+
+# ================================================================================
+# Device-scoped analytics
+# ================================================================================
+
+
+class TestDeviceQueries:
+    @pytest.mark.parametrize("driveId", [1, None], ids=["byDrive", "byTimeRange"])
+    def test_computeDriveAnalytics(self, engine, driveId) -> None:
+        plans = _explain(engine, lambda s: _computeDriveAnalytics(
+            s, DEVICE, driveId=driveId,
+            fallbackStartTime=BASE, fallbackEndTime=BASE + timedelta(minutes=30),
+        ))
+
+        _assertNoTableScan(plans)
+
+    def test_timeWindowStatistics(self, engine) -> None:
+        def run(session: Session) -> None:
+            summary = session.query(DriveSummary).filter_by(source_id=1).one()
+            computeDriveStatistics(session, summary.id)
+
+        _assertNoTableScan(_explain(engine, run))
+
+
+# ================================================================================
+# Cross-drive windows
+# ================================================================================
+
+
+class TestWindowQueries:
+    def test_overlapFallback(self, engine) -> None:
+        plans = _explain(engine, lambda s: detect_overlapping_drives(s, 1))
+
+        _assertNoTableScan(plans)
+        assert len(plans) == 2  # target range + grouped windows
+
+    def test_overlapIndexed(self, engine) -> None:
+        with Session(engine) as session:
+            rebuildDriveTimeWindows(session)
+            session.commit()
+
+        plans = _explain(engine, lambda s: detect_overlapping_drives(s, 1))
+
+        _assertNoTableScan(plans)
+        assert len(plans) == 1  # DISTINCT drive_id probe; nothing unindexed
+
+    def test_recomputeDriveWindows(self, engine) -> None:
+        plans = _explain(engine, lambda s: recomputeDriveWindows(s, DEVICE, [1, 2]))
+
+        _assertNoTableScan(plans)
+
+    @pytest.mark.parametrize("deviceId", [DEVICE, None], ids=["oneDevice", "all"])
+    def test_rebuildDriveTimeWindows(self, engine, deviceId) -> None:
+        plans = _explain(engine, lambda s: rebuildDriveTimeWindows(s, deviceId))
+
+        _assertNoTableScan(plans)
+
+    def test_recomputeRollupRange(self, engine) -> None:
+        plans = _explain(engine, lambda s: recomputeRollupRange(
+            s, DEVICE, BASE, BASE + timedelta(minutes=5),
+        ))
+
+        _assertNoTableScan(plans)
+        assert "idx_realtime_data_device_ts" in _usedIndexes(plans)
+
+    @pytest.mark.parametrize("deviceId", [DEVICE, None], ids=["oneDevice", "all"])
+    def test_rebuildRealtimeRollups(self, engine, deviceId) -> None:
+        plans = _explain(engine, lambda s: rebuildRealtimeRollups(s, deviceId))
+
+        _assertNoTableScan(plans)
+
+
+# ================================================================================
+# The detector itself
+# ================================================================================
+
+
+class TestDetector:
+    def test_flagsPlainScanOnly(self) -> None:
+        assert CapturedPlan("q", ["SCAN realtime_data"]).tableScans
+        assert CapturedPlan(
+            "q", ["SCAN realtime_data USING INDEX ix_realtime_data_drive_id"],
+        ).tableScans
+        assert not CapturedPlan(
+            "q", ["SCAN realtime_data USING COVERING INDEX idx_realtime_data_drive_ts"],
+        ).tableScans
+        assert not CapturedPlan(
+            "q", ["SEARCH realtime_data USING INDEX idx_realtime_data_drive_ts (drive_id=?)"],
+        ).tableScans
+
+    def test_unindexedFilterIsCaught(self, engine) -> None:
+        from sqlalchemy import select
+
+        plans = _explain(engine, lambda s: s.execute(
+            select(RealtimeData.value).where(RealtimeData.unit == "rpm")
+        ).all())
+
+        with pytest.raises(AssertionError, match="full realtime_data scan"):
+            _assertNoTableScan(plans)
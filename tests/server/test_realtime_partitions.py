@@ -0,0 +1,227 @@
+################################################################################
+# File Name: test_realtime_partitions.py
+# Purpose/Description: Tests for the monthly realtime_data partition layout --
+#                      naming and month math, DDL builders, maintenance
+#                      planning, and the timestamp bounds the analytics add
+#                      for partition pruning.
+# Author: Rex
+# Creation Date: 2026-10-17
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-17    | Rex          | Initial
+# ================================================================================
+################################################################################
+
+"""Tests for :mod:`src.server.db.realtime_partitions`.
+
+DDL is checked as text (MariaDB is not available here); the pruning bounds
+run against real temp-file SQLite + the real analytics entry points.
+"""
+
+from __future__ import annotations
+
+import tempfile
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from sqlalchemy import create_engine, event  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from src.server.analytics.basic import collectReadingsForDrive  # noqa: E402
+from src.server.analytics.drive_analytics_batch import (  # noqa: E402
+    computeDriveAnalyticsBatch,
+)
+from src.server.analytics.drive_summary_compute import (  # noqa: E402
+    compute_drive_summary,
+)
+from src.server.db.models import Base, DriveSummary, RealtimeData  # noqa: E402
+from src.server.db.realtime_partitions import (  # noqa: E402
+    PartitionInfo,
+    RealtimePartitionError,
+    addMonths,
+    buildArchiveStatements,
+    buildDropDdl,
+    buildPartitionByClause,
+    buildSplitFutureDdl,
+    expiredPartitions,
+    listPartitions,
+    missingFutureMonths,
+    partitionMonth,
+    partitionName,
+    realtimeTimestampBounds,
+)
+
+DEVICE = "chi-eclipse-01"
+BASE = datetime(2026, 10, 1, 8, 0, 0)
+TODAY = date(2026, 10, 17)
+
+
+def _layout(*months: str) -> list[PartitionInfo]:
+    infos = [PartitionInfo(f"p{m.replace('-', '_')}", date.fromisoformat(f"{m}-01"), 0)
+             for m in months]
+    return infos + [PartitionInfo("p_future", None, 0)]
+
+
+# ================================================================================
+# Naming + DDL
+# ================================================================================
+
+
+class TestNamingAndDdl:
+    def test_addMonths_crossesYears(self) -> None:
+        assert addMonths(date(2026, 11, 1), 3) == date(2027, 2, 1)
+        assert addMonths(date(2026, 1, 1), -1) == date(2025, 12, 1)
+
+    def test_partitionName_roundTrips(self) -> None:
+        assert partitionName(date(2026, 5, 1)) == "p2026_05"
+        assert partitionMonth("p2026_05") == date(2026, 5, 1)
+        assert partitionMonth("p_future") is None
+
+    def test_partitionByClause_monthlyPlusFuture(self) -> None:
+        clause = buildPartitionByClause(date(2026, 11, 1), date(2027, 1, 1))
+
+        assert clause.startswith("PARTITION BY RANGE (TO_DAYS(timestamp)) (")
+        assert "PARTITION p2026_12 VALUES LESS THAN (TO_DAYS('2027-01-01'))" in clause
+        assert clause.count("PARTITION p20") == 3
+        assert clause.endswith("PARTITION p_future VALUES LESS THAN MAXVALUE)")
+
+    def test_splitFuture_reorganizesOnlyFuture(self) -> None:
+        ddl = buildSplitFutureDdl([date(2027, 2, 1)])
+
+        assert ddl == (
+            "ALTER TABLE realtime_data REORGANIZE PARTITION p_future INTO ("
+            "PARTITION p2027_02 VALUES LESS THAN (TO_DAYS('2027-03-01')), "
+            "PARTITION p_future VALUES LESS THAN MAXVALUE);"
+        )
+
+    def test_archive_exchangesIntoUnpartitionedTable(self) -> None:
+        create, unpartition, exchange, drop = buildArchiveStatements("p2026_05")
+
+        assert create == "CREATE TABLE realtime_data_archive_p2026_05 LIKE realtime_data;"
+        assert "REMOVE PARTITIONING" in unpartition
+        assert "EXCHANGE PARTITION p2026_05 WITH TABLE realtime_data_archive_p2026_05" in exchange
+        assert drop == buildDropDdl(["p2026_05"])
+
+
+# ================================================================================
+# Maintenance planning
+# ================================================================================
+
+
+class TestPlanning:
+    def test_missingFutureMonths_fillsThroughHorizon(self) -> None:
+        months = missingFutureMonths(_layout("2026-09", "2026-10", "2026-11"), TODAY, 3)
+
+        assert months == [date(2026, 12, 1), date(2027, 1, 1)]
+
+    def test_missingFutureMonths_noopWhenCovered(self) -> None:
+        assert missingFutureMonths(_layout("2026-10", "2027-01"), TODAY, 3) == []
+
+    def test_missingFutureMonths_onlyFutureLeft_startsThisMonth(self) -> None:
+        months = missingFutureMonths(_layout(), TODAY, 1)
+
+        assert months == [date(2026, 10, 1), date(2026, 11, 1)]
+
+    def test_missingFutureMonths_unpartitionedRaises(self) -> None:
+        with pytest.raises(RealtimePartitionError, match="migration 0016"):
+            missingFutureMonths([], TODAY, 3)
+
+    def test_expiredPartitions_beforeCutoffOnly(self) -> None:
+        layout = _layout("2026-07", "2026-08", "2026-09", "2026-10")
+
+        expired = expiredPartitions(layout, date(2026, 9, 15), TODAY)
+
+        assert [p.name for p in expired] == ["p2026_07", "p2026_08"]
+
+    def test_expiredPartitions_refusesCurrentMonth(self) -> None:
+        with pytest.raises(ValueError, match="current month"):
+            expiredPartitions(_layout("2026-09", "2026-10"), date(2026, 11, 1), TODAY)
+
+    def test_liveMaintenance_isMariaDbOnly(self) -> None:
+        with Session(create_engine("sqlite://")) as session, \
+                pytest.raises(RealtimePartitionError, match="MariaDB-only"):
+            listPartitions(session)
+
+
+# ================================================================================
+# Pruning bounds
+# ================================================================================
+
+
+@pytest.fixture
+def engine():
+    """Temp-file SQLite engine; drive 1 in September, drive 2 in October."""
+    tmp = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+    tmp.close()
+    eng = create_engine(f"sqlite:///{tmp.name}")
+    Base.metadata.create_all(eng)
+    with Session(eng) as session:
+        for driveId, start in ((1, BASE - timedelta(days=20)), (2, BASE)):
+            session.add(DriveSummary(source_device=DEVICE, source_id=driveId,
+                                     drive_id=driveId, start_time=start))
+            for i in range(30):
+                session.add(RealtimeData(
+                    source_id=driveId * 100 + i, source_device=DEVICE,
+                    drive_id=driveId, timestamp=start + timedelta(seconds=10 * i),
+                    parameter_name="RPM", value=800.0 + i, data_source="real",
+                ))
+        session.commit()
+    yield eng
+    eng.dispose()
+    Path(tmp.name).unlink(missing_ok=True)
+
+
+def _realtimeReads(engine, run) -> list[str]:
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, *args) -> None:
+        if "FROM realtime_data" in statement:
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        with Session(engine) as session:
+            run(session)
+            session.rollback()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return statements
+
+
+class TestPruningBounds:
+    def test_boundsAreExactMinMax(self, engine) -> None:
+        with Session(engine) as session:
+            bounds = realtimeTimestampBounds(session, RealtimeData.drive_id == 2)
+            missing = realtimeTimestampBounds(session, RealtimeData.drive_id == 9)
+
+        assert bounds == (BASE, BASE + timedelta(seconds=290))
+        assert missing is None
+
+    @pytest.mark.parametrize("run", [
+        lambda s: compute_drive_summary(s, 2),
+        lambda s: computeDriveAnalyticsBatch(s, [1, 2]),
+        lambda s: collectReadingsForDrive(s, driveId=2, deviceId=DEVICE),
+    ], ids=["summaryGapWalk", "batchStream", "collectReadings"])
+    def test_rowReadsCarryTimestampRange(self, engine, run) -> None:
+        reads = _realtimeReads(engine, run)
+
+        rowReads = [s for s in reads if "min(" not in s and "count(" not in s
+                    and "GROUP BY" not in s]
+        assert rowReads
+        assert all("realtime_data.timestamp BETWEEN" in s for s in rowReads)
+
+    def test_boundsDoNotChangeResults(self, engine) -> None:
+        with Session(engine) as session:
+            readings = collectReadingsForDrive(session, driveId=2, deviceId=DEVICE)
+            absent = collectReadingsForDrive(session, driveId=9, deviceId=DEVICE)
+
+        assert readings == {"RPM": [800.0 + i for i in range(30)]}
+        assert absent == {}
@@ -13,6 +13,11 @@
 # Date          | Author       | Description
 # ================================================================================
 # 2026-04-16    | Ralph Agent  | Initial TDD tests for US-CMP-004 — delta sync
+# 2026-10-16    | Rex          | Content-Encoding (gzip) request bodies
+# 2026-10-16    | Rex          | Columnar realtime_data bodies
+# 2026-10-16    | Rex          | Append-only ingest path for capture tables
+# 2026-10-17    | Rex          | Append path skips duplicates only; other row
+#               |              | errors fail the batch.
 # ================================================================================
 ################################################################################
 
@@ -35,6 +40,7 @@ uses for aiomysql).
 
 from __future__ import annotations
 
+import gzip
 import json
 import tempfile
 from pathlib import Path
@@ -417,6 +423,118 @@ class TestSyncCore:
         assert result == {}
 
 
+class TestSyncAppendPath:
+    """Append-only capture tables: INSERT-or-ignore, counts from rowcount."""
+
+    def _realtimeRows(self, count: int) -> list[dict]:
+        return [
+            {
+                "id": i,
+                "timestamp": f"2026-04-16T08:00:{i % 60:02d}Z",
+                "parameter_name": "RPM",
+                "value": 800.0 + i,
+                "unit": "rpm",
+            }
+            for i in range(1, count + 1)
+        ]
+
+    def _push(self, session, rows, syncHistoryId=1, **kwargs):
+        from src.server.api.sync import runSyncUpsert
+
+        return runSyncUpsert(
+            session=session, deviceId="pi", batchId="b",
+            tables={"realtime_data": {"lastSyncedId": 0, "rows": rows}},
+            syncHistoryId=syncHistoryId, **kwargs,
+        )["realtime_data"]
+
+    def test_resentRows_ignoredAndCountedAsUpdated(self, syncEngine):
+        with Session(syncEngine) as session:
+            first = self._push(session, self._realtimeRows(3))
+            second = self._push(session, self._realtimeRows(5), syncHistoryId=2)
+            session.commit()
+            stored = session.execute(
+                select(RealtimeData).order_by(RealtimeData.source_id)
+            ).scalars().all()
+
+        assert first == {"inserted": 3, "updated": 0, "errors": 0}
+        assert second == {"inserted": 2, "updated": 3, "errors": 0}
+        assert [r.sync_batch_id for r in stored] == [1, 1, 1, 2, 2]
+        assert stored[0].data_source == "real"
+
+    def test_noPreSelect(self, syncEngine):
+        from sqlalchemy import event
+
+        statements: list[str] = []
+        event.listen(
+            syncEngine, "before_cursor_execute",
+            lambda _c, _cur, sql, *_a: statements.append(sql),
+        )
+        with Session(syncEngine) as session:
+            self._push(session, self._realtimeRows(10))
+
+        assert not any(sql.lstrip().upper().startswith("SELECT") for sql in statements)
+
+    def test_constraintViolation_failsBatchInsteadOfCountingUpdated(self, syncEngine):
+        from sqlalchemy.exc import IntegrityError
+
+        rows = self._realtimeRows(3)
+        rows[1]["value"] = None  # NOT NULL
+        with Session(syncEngine) as session:
+            with pytest.raises(IntegrityError):
+                self._push(session, rows)
+            session.rollback()
+            stored = session.execute(select(RealtimeData)).scalars().all()
+
+        assert stored == []
+
+    def test_mariadbStatement_skipsDuplicateKeysOnly(self):
+        from sqlalchemy.dialects import mysql
+
+        from src.server.api.sync import _appendStatement
+
+        sql = str(_appendStatement(RealtimeData.__table__, "mariadb").compile(
+            dialect=mysql.dialect(),
+        ))
+
+        assert "IGNORE" not in sql
+        assert sql.rstrip().endswith("ON DUPLICATE KEY UPDATE id = realtime_data.id")
+
+    def test_chunkedInsert_countsEveryChunk(self, syncEngine):
+        with patch("src.server.api.sync.APPEND_CHUNK_ROWS", 4), Session(syncEngine) as session:
+            counts = self._push(session, self._realtimeRows(10))
+
+        assert counts["inserted"] == 10
+
+    def test_matchesUpsertPath(self, syncEngine):
+        from src.server.api.sync import runSyncUpsert
+
+        tables = _buildValidRequest()["tables"]
+        for row in tables["connection_log"]["rows"]:
+            del row["success"]  # server default applies on both paths
+        with Session(syncEngine) as session:
+            fast = runSyncUpsert(
+                session=session, deviceId="pi-a", batchId="b",
+                tables=json.loads(json.dumps(tables)), syncHistoryId=1,
+            )
+            slow = runSyncUpsert(
+                session=session, deviceId="pi-b", batchId="b",
+                tables=json.loads(json.dumps(tables)), syncHistoryId=1,
+                appendFastPath=False,
+            )
+            session.commit()
+            logs = session.execute(
+                select(ConnectionLog).order_by(ConnectionLog.source_device, ConnectionLog.source_id)
+            ).scalars().all()
+
+        assert fast == slow
+        columns = ("source_id", "timestamp", "event_type", "success", "retry_count")
+        byDevice = {
+            device: [tuple(getattr(r, c) for c in columns) for r in logs if r.source_device == device]
+            for device in ("pi-a", "pi-b")
+        }
+        assert byDevice["pi-a"] == byDevice["pi-b"]
+
+
 # ==============================================================================
 # 4) Route behaviour — auth, payload size, response envelope
 # ==============================================================================
@@ -521,6 +639,164 @@ class TestSyncInvalidBody:
         assert response.status_code == 422
 
 
+class TestSyncContentEncoding:
+    """Compressed bodies decode before validation; the cap applies decoded."""
+
+    def _post(self, body: bytes, encoding: str, maxMb: int = 10):
+        from fastapi.testclient import TestClient
+
+        app = _buildAppForRouteTests(maxMb=maxMb)
+        with TestClient(app) as client:
+            return client.post(
+                "/api/v1/sync",
+                content=body,
+                headers={
+                    "X-API-Key": "valid-key",
+                    "Content-Type": "application/json",
+                    "Content-Encoding": encoding,
+                },
+            )
+
+    def test_gzipBody_decodedAndValidated(self):
+        payload = _buildValidRequest()
+        del payload["deviceId"]
+
+        response = self._post(gzip.compress(json.dumps(payload).encode()), "gzip")
+
+        assert response.status_code == 422
+        assert "deviceId" in response.text
+
+    def test_gzipValidBody_reachesDatabaseStage(self):
+        body = gzip.compress(json.dumps(_buildValidRequest()).encode())
+
+        response = self._post(body, "gzip")
+
+        # No engine on the route-test app: 500 proves decode + validation passed.
+        assert response.status_code == 500
+        assert "engine" in response.text
+
+    def test_gzipExpandingPastCap_returns413(self):
+        bomb = gzip.compress(b" " * (2 * 1024 * 1024))
+        assert len(bomb) < 1024 * 1024
+
+        response = self._post(bomb, "gzip", maxMb=1)
+
+        assert response.status_code == 413
+
+    def test_corruptGzip_returns422(self):
+        response = self._post(b"not gzip at all", "gzip")
+
+        assert response.status_code == 422
+
+    def test_unsupportedEncoding_returns415(self):
+        response = self._post(json.dumps(_buildValidRequest()).encode(), "br")
+
+        assert response.status_code == 415
+
+
+class TestSyncColumnarBody:
+    """Columnar bodies negotiate by Content-Type and upsert like JSON ones."""
+
+    def _columnarBody(self, payload: dict) -> bytes:
+        from src.common.contracts.realtime_columnar import encodeSyncBody
+
+        realtime = payload["tables"].pop("realtime_data")
+        rows = [
+            {**row, "timestamp": row["timestamp"] + "Z"} for row in realtime["rows"]
+        ]
+        return encodeSyncBody(payload, {"realtime_data": (realtime["lastSyncedId"], rows)})
+
+    def _post(self, body: bytes):
+        from fastapi.testclient import TestClient
+
+        from src.common.contracts.realtime_columnar import CONTENT_TYPE
+
+        app = _buildAppForRouteTests()
+        with TestClient(app) as client:
+            return client.post(
+                "/api/v1/sync",
+                content=body,
+                headers={"X-API-Key": "valid-key", "Content-Type": CONTENT_TYPE},
+            )
+
+    def test_columnarBody_reachesDatabaseStage(self):
+        response = self._post(self._columnarBody(_buildValidRequest()))
+
+        # No engine on the route-test app: 500 proves decode + validation passed.
+        assert response.status_code == 500
+        assert "engine" in response.text
+
+    def test_corruptColumnarBody_returns422(self):
+        body = self._columnarBody(_buildValidRequest())
+
+        response = self._post(body[:-3])
+
+        assert response.status_code == 422
+        assert "columnar" in response.text
+
+    def test_tableSentTwice_returns422(self):
+        from src.common.contracts.realtime_columnar import encodeSyncBody
+
+        payload = _buildValidRequest()
+        rows = [
+            {**payload["tables"]["realtime_data"]["rows"][0], "timestamp": "2026-04-16T08:00:00Z"},
+        ]
+
+        response = self._post(encodeSyncBody(payload, {"realtime_data": (0, rows)}))
+
+        assert response.status_code == 422
+        assert "both as JSON and columnar" in response.text
+
+    def test_runSyncUpsert_columnarMatchesJson(self, syncEngine):
+        from src.common.contracts.realtime_columnar import decodeSyncBody
+        from src.server.api.sync import runSyncUpsert
+
+        payload = _buildValidRequest()
+        payload["tables"]["realtime_data"]["rows"].append({
+            "id": 2,
+            "timestamp": "2026-04-16T08:00:01",
+            "parameter_name": "COOLANT_TEMP",
+            "value": 88.5,
+            "profile_id": "daily",
+        })
+        _, columnar = decodeSyncBody(self._columnarBody(json.loads(json.dumps(payload))))
+
+        with Session(syncEngine) as session:
+            jsonResult = runSyncUpsert(
+                session=session, deviceId="pi-a", batchId="b-json",
+                tables={"realtime_data": payload["tables"]["realtime_data"]},
+                syncHistoryId=1,
+            )
+            session.commit()
+            columnarResult = runSyncUpsert(
+                session=session, deviceId="pi-b", batchId="b-col",
+                tables=columnar, syncHistoryId=2,
+            )
+            session.commit()
+            rerun = runSyncUpsert(
+                session=session, deviceId="pi-b", batchId="b-col",
+                tables=columnar, syncHistoryId=3,
+            )
+            session.commit()
+
+        assert jsonResult["realtime_data"]["inserted"] == 2
+        assert columnarResult["realtime_data"]["inserted"] == 2
+        assert rerun["realtime_data"]["inserted"] == 0
+        assert rerun["realtime_data"]["updated"] == 2
+        with Session(syncEngine) as session:
+            rows = session.execute(
+                select(RealtimeData).order_by(RealtimeData.source_device, RealtimeData.source_id)
+            ).scalars().all()
+        columns = ("source_id", "timestamp", "parameter_name", "value", "unit", "profile_id")
+        byDevice = {
+            device: [
+                tuple(getattr(r, c) for c in columns) for r in rows if r.source_device == device
+            ]
+            for device in ("pi-a", "pi-b")
+        }
+        assert byDevice["pi-a"] == byDevice["pi-b"]
+
+
 # ==============================================================================
 # 5) Full route + DB integration — requires aiosqlite
 # ==============================================================================
@@ -0,0 +1,247 @@
+################################################################################
+# File Name: test_alert_rule_engine.py
+# Purpose/Description: Tests for the compiled alert rule set and the
+#                      AlertManager frame path built on it.
+# Author: Rex
+# Creation Date: 2026-10-17
+# Copyright: (c) 2026 Eclipse OBD-II Project. All rights reserved.
+#
+# Modification History:
+# ================================================================================
+# Date          | Author       | Description
+# ================================================================================
+# 2026-10-17    | Rex          | Initial
+# 2026-10-17    | Rex          | Shared cooldowns across rule sets and profile
+#               |              | switches.
+# ================================================================================
+################################################################################
+
+"""
+Unit tests for :mod:`pi.alert.rule_engine`.
+
+Covers the dispatch table (per-frame work independent of unrelated rules),
+first-exceeded-wins ordering, hysteresis, multi-parameter conditions,
+per-alert-type cooldown, and ``AlertManager.checkFrame``.
+
+Usage:
+    pytest tests/test_alert_rule_engine.py -v
+"""
+
+import pytest
+
+from pi.alert.exceptions import AlertConfigurationError
+from pi.alert.manager import AlertManager
+from pi.alert.rule_engine import CompiledRuleSet
+from pi.alert.types import (
+    ALERT_TYPE_COOLANT_TEMP_CRITICAL,
+    ALERT_TYPE_RPM_REDLINE,
+    AlertCondition,
+    AlertDirection,
+    AlertThreshold,
+)
+
+ABOVE = AlertDirection.ABOVE
+BELOW = AlertDirection.BELOW
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _rpm(threshold: float = 7000.0, **kwargs) -> AlertThreshold:
+    return AlertThreshold('RPM', ALERT_TYPE_RPM_REDLINE, threshold, ABOVE, **kwargs)
+
+
+def _alertTypes(hits) -> list[str]:
+    return [hit.threshold.alertType for hit in hits]
+
+
+# ================================================================================
+# Dispatch
+# ================================================================================
+
+
+class TestDispatch:
+
+    def test_frameOnlyEvaluatesRulesForItsParameters(self):
+        frame = {'RPM': 3000.0, 'COOLANT_TEMP': 190.0, 'SPEED': 40.0}
+        counts = []
+        for extra in (0, 10, 1000):
+            rules = [
+                _rpm(),
+                AlertThreshold('COOLANT_TEMP', ALERT_TYPE_COOLANT_TEMP_CRITICAL, 220.0, ABOVE),
+            ] + [
+                AlertThreshold(f'EXTRA_{i}', f'extra_{i}', 1.0, ABOVE) for i in range(extra)
+            ]
+            ruleSet = CompiledRuleSet(rules)
+            ruleSet.evaluateFrame(frame, 30.0)
+            counts.append(ruleSet.ruleEvaluations)
+
+        assert counts == [2, 2, 2]
+
+    def test_firstExceededRuleForParameterWins(self):
+        ruleSet = CompiledRuleSet([
+            AlertThreshold('RPM', 'rpm_caution', 6500.0, ABOVE),
+            AlertThreshold('RPM', ALERT_TYPE_RPM_REDLINE, 7000.0, ABOVE),
+        ])
+
+        hits = ruleSet.evaluateFrame({'RPM': 7200.0}, 30.0)
+
+        assert _alertTypes(hits) == ['rpm_caution']
+
+    def test_belowDirectionAndUnknownParametersIgnored(self):
+        ruleSet = CompiledRuleSet([
+            AlertThreshold('OIL_PRESSURE', 'oil_pressure_low', 10.0, BELOW),
+        ])
+
+        assert ruleSet.evaluateFrame({'OIL_PRESSURE': 12.0, 'MAF': 3.0}, 30.0) == []
+        assert _alertTypes(ruleSet.evaluateFrame({'OIL_PRESSURE': 8.0}, 30.0)) == [
+            'oil_pressure_low',
+        ]
+
+
+# ================================================================================
+# Hysteresis / conditions / cooldown
+# ================================================================================
+
+
+class TestHysteresis:
+
+    def test_staysExceededUntilClearPoint(self):
+        clock = FakeClock()
+        ruleSet = CompiledRuleSet([_rpm(clearThreshold=6500.0)], clock=clock)
+
+        assert ruleSet.evaluateFrame({'RPM': 7100.0}, 0.0)
+        clock.now += 1
+        assert ruleSet.evaluateFrame({'RPM': 6800.0}, 0.0)  # still latched
+        assert ruleSet.evaluateFrame({'RPM': 6400.0}, 0.0) == []
+        assert ruleSet.evaluateFrame({'RPM': 6800.0}, 0.0) == []  # needs 7000 again
+
+    def test_clearThresholdOnWrongSideRejected(self):
+        with pytest.raises(AlertConfigurationError):
+            CompiledRuleSet([_rpm(clearThreshold=7500.0)])
+
+
+class TestConditions:
+
+    def _loadGatedRule(self) -> AlertThreshold:
+        return AlertThreshold(
+            'TIMING_ADVANCE', 'timing_under_load', 1.0, BELOW,
+            conditions=(AlertCondition('ENGINE_LOAD', 60.0, ABOVE),),
+        )
+
+    def test_conditionReadsValueFromSameFrame(self):
+        ruleSet = CompiledRuleSet([self._loadGatedRule()])
+
+        assert ruleSet.evaluateFrame({'TIMING_ADVANCE': 0.0, 'ENGINE_LOAD': 40.0}, 30.0) == []
+        hits = ruleSet.evaluateFrame({'TIMING_ADVANCE': 0.0, 'ENGINE_LOAD': 75.0}, 30.0)
+
+        assert _alertTypes(hits) == ['timing_under_load']
+
+    def test_conditionUsesLatestValueAndNeverSeenFails(self):
+        ruleSet = CompiledRuleSet([self._loadGatedRule()])
+
+        assert ruleSet.evaluateFrame({'TIMING_ADVANCE': 0.0}, 30.0) == []
+        assert ruleSet.evaluateFrame({'ENGINE_LOAD': 80.0}, 30.0) == []  # not the primary
+        assert _alertTypes(ruleSet.evaluateFrame({'TIMING_ADVANCE': 0.0}, 30.0)) == [
+            'timing_under_load',
+        ]
+
+
+class TestCooldown:
+
+    def test_sameAlertTypeSuppressedUntilCooldownElapses(self):
+        clock = FakeClock()
+        ruleSet = CompiledRuleSet([_rpm()], clock=clock)
+
+        assert not ruleSet.evaluateFrame({'RPM': 7100.0}, 30.0)[0].suppressed
+        clock.now += 10
+        suppressed = ruleSet.evaluateFrame({'RPM': 7100.0}, 30.0)[0]
+        assert suppressed.suppressed and suppressed.cooldownElapsed == 10.0
+        clock.now += 25
+        assert not ruleSet.evaluateFrame({'RPM': 7100.0}, 30.0)[0].suppressed
+
+    def test_clearCooldownsAllowsImmediateRefire(self):
+        ruleSet = CompiledRuleSet([_rpm()], clock=FakeClock())
+        ruleSet.evaluateFrame({'RPM': 7100.0}, 30.0)
+        ruleSet.clearCooldowns()
+
+        assert not ruleSet.evaluateFrame({'RPM': 7100.0}, 30.0)[0].suppressed
+
+    def test_sharedCooldownsSpanRuleSets(self):
+        clock = FakeClock()
+        cooldowns: dict[str, float] = {}
+        first = CompiledRuleSet([_rpm()], clock=clock, cooldowns=cooldowns)
+        second = CompiledRuleSet([_rpm(6500.0)], clock=clock, cooldowns=cooldowns)
+
+        assert not first.evaluateFrame({'RPM': 7100.0}, 30.0)[0].suppressed
+        clock.now += 5
+        assert second.evaluateFrame({'RPM': 7100.0}, 30.0)[0].suppressed
+        second.clearCooldowns()
+        assert not first.evaluateFrame({'RPM': 7100.0}, 30.0)[0].suppressed
+
+
+# ================================================================================
+# AlertManager frame path
+# ================================================================================
+
+
+def _runningManager() -> AlertManager:
+    manager = AlertManager(cooldownSeconds=30)
+    manager.setThresholdsFromConfig({
+        'pi': {
+            'tieredThresholds': {
+                'rpm': {'dangerMin': 7000},
+                'coolantTemp': {'dangerMin': 220},
+            },
+            'profiles': {'availableProfiles': [{'id': 'daily'}, {'id': 'track'}]},
+        },
+    })
+    manager.setActiveProfile('daily')
+    manager.start()
+    return manager
+
+
+class TestAlertManagerCheckFrame:
+
+    def test_frameReturnsOneEventPerExceededParameter(self):
+        manager = _runningManager()
+
+        events = manager.checkFrame({'RPM': 7200.0, 'COOLANT_TEMP': 225.0, 'SPEED': 50.0})
+
+        assert sorted(e.alertType for e in events) == [
+            ALERT_TYPE_COOLANT_TEMP_CRITICAL, ALERT_TYPE_RPM_REDLINE,
+        ]
+        stats = manager.getStats()
+        assert (stats.totalChecks, stats.alertsTriggered) == (3, 2)
+
+    def test_cooldownAcrossCheckValueCalls(self):
+        manager = _runningManager()
+
+        assert manager.checkValue('RPM', 7200.0) is not None
+        assert manager.checkValue('RPM', 7300.0) is None
+        assert manager.getStats().alertsSuppressed == 1
+        manager.clearCooldowns()
+        assert manager.checkValue('RPM', 7300.0) is not None
+
+    def test_cooldownSurvivesProfileSwitch(self):
+        manager = _runningManager()
+
+        assert manager.checkFrame({'RPM': 7200.0}) != []
+        manager.setActiveProfile('track')
+
+        assert manager.checkFrame({'RPM': 7300.0}) == []
+        assert manager.getStats().alertsSuppressed == 1
+
+    def test_callbacksRunOutsideLock(self):
+        manager = _runningManager()
+        seen = []
+        manager.onAlert(lambda event: seen.append(manager.getStats().alertsTriggered))
+
+        manager.checkFrame({'RPM': 7200.0})
+
+        assert seen == [1]
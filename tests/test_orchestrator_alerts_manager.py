@@ -11,6 +11,8 @@
 # ================================================================================
 # 2026-04-11    | Ralph Agent  | Initial implementation for US-OSC-008
 # 2026-04-13    | Ralph Agent  | Sweep 2a task 5 — add tieredThresholds to test config; RPM 7000 from tiered
+# 2026-10-17    | Rex          | Readings reach the manager as one checkFrame
+#                               per polling cycle (_handleCycleComplete).
 # ================================================================================
 ################################################################################
 
@@ -348,13 +350,13 @@ class TestAlertManagerCreatedFromConfig:
 class TestAlertManagerReceivesValues:
     """Tests that AlertManager receives all realtime values from the logger."""
 
-    def test_handleReading_callsCheckValue_withParameterAndValue(
+    def test_handleReading_callsCheckFrame_withParameterAndValue(
         self, alertConfig: dict[str, Any]
     ):
         """
         Given: Orchestrator with alert manager wired
-        When: _handleReading() is called with a reading
-        Then: alertManager.checkValue() receives parameterName and value
+        When: _handleReading() is called with a reading and the cycle ends
+        Then: alertManager.checkFrame() receives parameterName and value
         """
         # Arrange
         from pi.obdii.orchestrator import ApplicationOrchestrator
@@ -372,17 +374,52 @@ class TestAlertManagerReceivesValues:
 
         # Act
         orchestrator._handleReading(mockReading)
+        orchestrator._handleCycleComplete(1)
 
         # Assert
-        mockAlertManager.checkValue.assert_called_once_with('RPM', 5500.0)
+        mockAlertManager.checkFrame.assert_called_once_with({'RPM': 5500.0})
+        mockAlertManager.checkValue.assert_not_called()
+
+    def test_cycleComplete_checksWholeCycleAsOneFrame(
+        self, alertConfig: dict[str, Any]
+    ):
+        """
+        Given: Orchestrator with alert manager wired
+        When: Two readings arrive in one cycle, then an empty cycle ends
+        Then: checkFrame() runs once with both values, not for the empty cycle
+        """
+        # Arrange
+        from pi.obdii.orchestrator import ApplicationOrchestrator
+
+        orchestrator = ApplicationOrchestrator(
+            config=alertConfig,
+            simulate=True
+        )
+        mockAlertManager = MagicMock()
+        orchestrator._alertManager = mockAlertManager
+
+        rpmReading = MagicMock(parameterName='RPM', value=7200.0)
+        coolantReading = MagicMock(parameterName='COOLANT_TEMP', value=98.0)
+
+        # Act
+        orchestrator._handleReading(rpmReading)
+        orchestrator._handleReading(coolantReading)
+        mockAlertManager.checkFrame.assert_not_called()
+        orchestrator._handleCycleComplete(1)
+        orchestrator._handleCycleComplete(2)
+
+        # Assert
+        mockAlertManager.checkFrame.assert_called_once_with(
+            {'RPM': 7200.0, 'COOLANT_TEMP': 98.0}
+        )
 
-    def test_handleReading_callsCheckValue_forCoolantTemp(
+    def test_handleReading_callsCheckFrame_forCoolantTemp(
         self, alertConfig: dict[str, Any]
     ):
         """
         Given: Orchestrator with alert manager wired
-        When: _handleReading() receives COOLANT_TEMP reading
-        Then: alertManager.checkValue() is called with COOLANT_TEMP
+        When: _handleReading() receives COOLANT_TEMP reading and the cycle ends
+        Then: alertManager.checkFrame() is called with COOLANT_TEMP
         """
         # Arrange
         from pi.obdii.orchestrator import ApplicationOrchestrator
@@ -400,13 +437,14 @@ class TestAlertManagerReceivesValues:
 
         # Act
         orchestrator._handleReading(mockReading)
+        orchestrator._handleCycleComplete(1)
 
         # Assert
-        mockAlertManager.checkValue.assert_called_once_with(
-            'COOLANT_TEMP', 98.0
+        mockAlertManager.checkFrame.assert_called_once_with(
+            {'COOLANT_TEMP': 98.0}
         )
 
-    def test_handleReading_skipsCheckValue_whenAlertManagerIsNone(
+    def test_handleReading_skipsCheckFrame_whenAlertManagerIsNone(
         self, alertConfig: dict[str, Any]
     ):
         """
@@ -429,14 +467,15 @@ class TestAlertManagerReceivesValues:
 
         # Act (should not raise)
         orchestrator._handleReading(mockReading)
+        orchestrator._handleCycleComplete(1)
 
-    def test_handleReading_skipsCheckValue_whenValueIsNone(
+    def test_handleReading_skipsCheckFrame_whenValueIsNone(
         self, alertConfig: dict[str, Any]
     ):
         """
         Given: Orchestrator with alert manager
-        When: _handleReading() receives None value
-        Then: checkValue is NOT called
+        When: _handleReading() receives None value and the cycle ends
+        Then: checkFrame is NOT called
         """
         # Arrange
         from pi.obdii.orchestrator import ApplicationOrchestrator
@@ -454,16 +493,17 @@ class TestAlertManagerReceivesValues:
 
         # Act
         orchestrator._handleReading(mockReading)
+        orchestrator._handleCycleComplete(1)
 
         # Assert
-        mockAlertManager.checkValue.assert_not_called()
+        mockAlertManager.checkFrame.assert_not_called()
 
-    def test_handleReading_continuesOnCheckValueError(
+    def test_handleReading_continuesOnCheckFrameError(
         self, alertConfig: dict[str, Any]
     ):
         """
-        Given: alertManager.checkValue() raises an exception
-        When: _handleReading() is called
+        Given: alertManager.checkFrame() raises an exception
+        When: _handleReading() is called and the cycle ends
         Then: No exception propagates (error is caught and logged)
         """
         # Arrange
@@ -474,7 +514,7 @@ class TestAlertManagerReceivesValues:
             simulate=True
         )
         mockAlertManager = MagicMock()
-        mockAlertManager.checkValue.side_effect = RuntimeError("check failed")
+        mockAlertManager.checkFrame.side_effect = RuntimeError("check failed")
         orchestrator._alertManager = mockAlertManager
 
         mockReading = MagicMock()
@@ -483,3 +523,4 @@ class TestAlertManagerReceivesValues:
 
         # Act (should not raise)
         orchestrator._handleReading(mockReading)
+        orchestrator._handleCycleComplete(1)
@@ -11,6 +11,8 @@
 # ================================================================================
 # 2026-04-11    | Ralph Agent  | Initial implementation for US-OSC-012
 # 2026-04-13    | Ralph Agent  | Sweep 2a task 5 — add tieredThresholds to test config; RPM 7000 from tiered
+# 2026-10-17    | Rex          | Alert pause asserted on the per-cycle
+#               |              | checkFrame path.
 # ================================================================================
 ################################################################################
 
@@ -274,8 +276,8 @@ class TestDuringReconnection:
     ):
         """
         Given: Orchestrator in reconnecting state with alerts paused
-        When: A reading comes in via _handleReading
-        Then: alertManager.checkValue is NOT called
+        When: A reading comes in via _handleReading and the cycle ends
+        Then: alertManager.checkFrame is NOT called
         """
         # Arrange
         orchestrator = createOrchestrator(recoveryConfig)
@@ -291,17 +293,18 @@ class TestDuringReconnection:
 
         # Act
         orchestrator._handleReading(mockReading)
+        orchestrator._handleCycleComplete(1)
 
         # Assert - alert manager should NOT be called
-        mockAlertManager.checkValue.assert_not_called()
+        mockAlertManager.checkFrame.assert_not_called()
 
     def test_alertsChecked_whenNotReconnecting(
         self, recoveryConfig: dict[str, Any]
     ):
         """
         Given: Orchestrator NOT in reconnecting state
-        When: A reading comes in via _handleReading
-        Then: alertManager.checkValue IS called
+        When: A reading comes in via _handleReading and the cycle ends
+        Then: alertManager.checkFrame IS called
         """
         # Arrange
         orchestrator = createOrchestrator(recoveryConfig)
@@ -316,9 +319,10 @@ class TestDuringReconnection:
 
         # Act
         orchestrator._handleReading(mockReading)
+        orchestrator._handleCycleComplete(1)
 
         # Assert - alert manager SHOULD be called
-        mockAlertManager.checkValue.assert_called_once_with('RPM', 3000)
+        mockAlertManager.checkFrame.assert_called_once_with({'RPM': 3000})
 
     def test_noDoubleReconnection_ifAlreadyReconnecting(
         self, recoveryConfig: dict[str, Any], caplog: pytest.LogCaptureFixture
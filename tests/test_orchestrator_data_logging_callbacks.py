@@ -11,6 +11,8 @@
 # ================================================================================
 # 2026-04-11    | Ralph Agent  | Initial implementation for US-OSC-006
 # 2026-04-13    | Ralph Agent  | Sweep 2a task 5 — add tieredThresholds to test config; RPM 7000 from tiered
+# 2026-10-17    | Rex          | Alert manager receives the cycle frame on
+#               |              | _handleCycleComplete.
 # ================================================================================
 ################################################################################
 
@@ -290,8 +292,8 @@ class TestOnReadingCallbackWiring:
     ):
         """
         Given: Orchestrator with alert manager
-        When: _handleReading is called
-        Then: alertManager.checkValue receives the value
+        When: _handleReading is called and the polling cycle ends
+        Then: alertManager.checkFrame receives the value
         """
         # Arrange
         from pi.obdii.orchestrator import ApplicationOrchestrator
@@ -302,7 +304,7 @@ class TestOnReadingCallbackWiring:
         )
 
         mockAlerts = MagicMock()
-        mockAlerts.checkValue = MagicMock()
+        mockAlerts.checkFrame = MagicMock()
         orchestrator._alertManager = mockAlerts
 
         class MockReading:
@@ -312,9 +314,10 @@ class TestOnReadingCallbackWiring:
 
         # Act
         orchestrator._handleReading(MockReading())
+        orchestrator._handleCycleComplete(1)
 
         # Assert
-        mockAlerts.checkValue.assert_called_once_with('COOLANT_TEMP', 95.0)
+        mockAlerts.checkFrame.assert_called_once_with({'COOLANT_TEMP': 95.0})
 
 
 # ================================================================================
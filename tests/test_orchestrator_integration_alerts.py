@@ -13,6 +13,8 @@
 # 2026-04-11    | Ralph Agent  | US-OSC-015: Add connection recovery tests (AC8)
 #               |              | and profile switch tests (AC9) — 9 new tests
 # 2026-04-13    | Ralph Agent  | Sweep 2a task 5 — add tieredThresholds to test config; RPM 7000 from tiered
+# 2026-10-17    | Rex          | Alert routing asserted as one checkFrame per
+#               |              | polling cycle.
 # ================================================================================
 ################################################################################
 
@@ -218,8 +220,8 @@ class TestAlertTriggersOnThresholdViolation:
     ):
         """
         Given: Running orchestrator with alert manager
-        When: Sensor value is received
-        Then: Value is passed to alert manager for checking
+        When: Sensor value is received and the polling cycle ends
+        Then: Value is passed to alert manager for checking in the cycle frame
         """
         # Arrange
         from pi.obdii.orchestrator import ApplicationOrchestrator
@@ -232,9 +234,9 @@ class TestAlertTriggersOnThresholdViolation:
         try:
             orchestrator.start()
 
-            # Mock alert manager's checkValue
+            # Mock alert manager's checkFrame
             if orchestrator.alertManager is not None:
-                orchestrator.alertManager.checkValue = MagicMock()
+                orchestrator.alertManager.checkFrame = MagicMock()
 
                 # Act
                 class MockReading:
@@ -243,10 +245,11 @@ class TestAlertTriggersOnThresholdViolation:
                     unit = 'rpm'
 
                 orchestrator._handleReading(MockReading())
+                orchestrator._handleCycleComplete(1)
 
                 # Assert
-                orchestrator.alertManager.checkValue.assert_called_once_with(
-                    'RPM', 7000.0
+                orchestrator.alertManager.checkFrame.assert_called_once_with(
+                    {'RPM': 7000.0}
                 )
 
         finally:
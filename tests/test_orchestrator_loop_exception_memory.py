@@ -322,12 +322,16 @@ class TestMemoryEfficiency:
         # Should have exactly these fields, no more.  US-302 added
         # dataLoggerLastRowSecondsAgo (Spool BUG-2 post-mortem signal --
         # bounded scalar that defaults to None until the first row,
-        # then a single float).
+        # then a single float).  The realtime batch writer added three
+        # more bounded scalars (queue depth, dropped rows, last flush ms);
+        # the reading bus adds one dict bounded by its subscriber count.
         expectedKeys = {
             'connectionConnected', 'connectionStatus', 'dataRatePerMinute',
             'totalReadings', 'totalErrors', 'drivesDetected',
             'alertsTriggered', 'lastHealthCheck', 'uptimeSeconds',
             'dataLoggerLastRowSecondsAgo',
+            'batchWriterQueueDepth', 'batchWriterRowsDropped',
+            'batchWriterLastFlushMs', 'readingBus',
         }
         assert set(result.keys()) == expectedKeys
 
@@ -10,6 +10,7 @@
 # Date          | Author       | Description
 # ================================================================================
 # 2026-04-12    | Ralph Agent  | Initial implementation for US-136
+# 2026-10-16    | Rex          | buildTierSchedule / TierSchedule tests
 # ================================================================================
 ################################################################################
 
@@ -37,6 +38,7 @@ import pytest
 
 from pi.obdii.data.polling_tiers import (
     PollingTierConfig,
+    buildTierSchedule,
     getParametersForCycle,
     getParameterTier,
     loadPollingTiers,
@@ -1031,3 +1033,80 @@ class TestOBDConfigIntegration:
         """
         paramNames = [p["name"] for p in obdConfig["pi"]["realtimeData"]["parameters"]]
         assert "CONTROL_MODULE_VOLTAGE" in paramNames
+
+
+# ================================================================================
+# buildTierSchedule Tests -- precomputed cycle table
+# ================================================================================
+
+
+class TestBuildTierSchedule:
+    """Tests for the precomputed TierSchedule."""
+
+    def test_parametersForCycle_matchesLinearLookupOverTwoPeriods(
+        self, loadedTiers: PollingTierConfig
+    ) -> None:
+        """
+        Given: Loaded config
+        When: Comparing the table against getParametersForCycle
+        Then: Same parameter set on every cycle
+        """
+        schedule = buildTierSchedule(loadedTiers)
+        assert schedule.period == 30
+        for cycle in range(1, 61):
+            assert set(schedule.parametersForCycle(cycle)) == set(
+                getParametersForCycle(loadedTiers, cycle)
+            )
+
+    def test_parametersForCycle_cycleZero_pollsEveryParameter(
+        self, loadedTiers: PollingTierConfig
+    ) -> None:
+        """
+        Given: Loaded config
+        When: Cycle 0 (first realtime loop cycle)
+        Then: Every tier is due, tier 1 first
+        """
+        schedule = buildTierSchedule(loadedTiers)
+        params = schedule.parametersForCycle(0)
+        assert len(params) == 12
+        assert params[0] == "COOLANT_TEMP"
+
+    def test_build_loggedParameters_filtersAndSchedulesUntiered(
+        self, loadedTiers: PollingTierConfig
+    ) -> None:
+        """
+        Given: A logged list without SPEED and with an untiered MAF
+        When: Building the schedule
+        Then: SPEED is dropped, MAF polls at the slowest tier interval
+        """
+        logged = ["RPM", "COOLANT_TEMP", "MAF"]
+        schedule = buildTierSchedule(loadedTiers, loggedParameters=logged)
+
+        assert schedule.tierOf("SPEED") is None
+        assert schedule.tierOf("RPM") == 1
+        assert schedule.parameterIntervals["MAF"] == 30
+        assert "MAF" not in schedule.parametersForCycle(1)
+        assert "MAF" in schedule.parametersForCycle(30)
+
+    def test_targetRateHz_tier2AtOneSecond_isOneThirdHz(
+        self, loadedTiers: PollingTierConfig
+    ) -> None:
+        """
+        Given: Tier 2 (every 3 cycles) at a 1000ms base interval
+        When: Computing the target rate
+        Then: 1/3 Hz
+        """
+        schedule = buildTierSchedule(loadedTiers)
+        assert schedule.targetRateHz("SPEED", 1000) == pytest.approx(1 / 3)
+        assert schedule.targetRateHz("UNKNOWN_PARAM", 1000) == 0.0
+
+    def test_build_noParameters_raisesValueError(
+        self, loadedTiers: PollingTierConfig
+    ) -> None:
+        """
+        Given: A logged list with nothing in it
+        When: Building the schedule
+        Then: ValueError
+        """
+        with pytest.raises(ValueError):
+            buildTierSchedule(loadedTiers, loggedParameters=[])